@@ -4,25 +4,45 @@
 Usage:
     python3 xlsx_to_json.py
     python3 xlsx_to_json.py --verbose
+    python3 xlsx_to_json.py --sedation-unit-fee 15.00
+    python3 xlsx_to_json.py --no-cache
+
+Library use (no files; e.g. an upload service):
+    codes = list(iter_billing_codes(workbook_bytes))
+    codes = await read_diagnostic_codes_async(workbook_bytes, executor)
 
 Reads:  data/billing_codes.xlsx    -> data/billing_codes.json
         data/diagnostic_codes.xlsx -> data/diagnostic_codes.json
+Writes: data/suggestion_index.json  (diagnostic <-> billing suggestions)
+        data/diagnostic_tree.json   (category browse tree, code prefix ranges)
+        data/*.changes.json         (change report vs the previous JSON)
 
 Comma-separated values in array columns are split into arrays.
 Empty cells become empty arrays (for arrays) or appropriate defaults.
+
+Each billing code also gets a precomputed "fee_table" (ortho reductions,
+related modifier amounts, sedation base units) in integer cents, computed
+with Decimal so the client only looks amounts up.
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import io
 import json
 import logging
+import struct
 import sys
 from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import Executor
 from contextlib import closing
+from decimal import ROUND_HALF_UP, Decimal
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Callable
 
+import openpyxl
 from openpyxl import load_workbook
 from openpyxl.workbook import Workbook
 
@@ -30,6 +50,25 @@ logger = logging.getLogger(__name__)
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 
+# Shared build helpers (artifact and per-sheet caches, change reports) live
+# in tools/; they need only the standard library.
+sys.path.insert(0, str(SCRIPT_DIR.parent.parent / "tools"))
+import build_cache  # noqa: E402
+import change_report  # noqa: E402
+import json_codec  # noqa: E402
+import sheet_cache  # noqa: E402
+
+# Modules whose code shapes a cached conversion (see _convert_cached).
+_CACHE_SOURCES: list[Path] = [
+    Path(__file__), Path(json_codec.__file__), Path(sheet_cache.__file__),
+    Path(change_report.__file__),
+]
+
+# Cached sheet rows are invalidated when this script or openpyxl changes.
+_SHEET_CACHE_SALT = (
+    sheet_cache.source_hash(Path(__file__)) + "|openpyxl " + openpyxl.__version__
+)
+
 
 # -- Column maps --------------------------------------------------------------
 # Column indices (A-O, 0-indexed) for each xlsx file.
@@ -63,6 +102,18 @@ DIAG_COL: dict[str, int] = {
 }
 
 
+# Ortho referral breakdown multipliers, in the row order the context panel
+# shows them (labels live in js/billing/calculations.js).
+ORTHO_FACTORS: tuple[Decimal, ...] = (
+    Decimal("1"),                           # Base Fee
+    Decimal("0.75"),                        # Referred to Ortho
+    Decimal("0.75"),                        # Multiple -- first code
+    Decimal("0.75") * Decimal("0.85"),      # Multiple -- subsequent codes
+    Decimal("0.75") * Decimal("0.85"),      # Repeat reduction -- initial
+    Decimal("0.75"),                        # Repeat reduction -- final
+)
+
+
 # -- Cell parsers --------------------------------------------------------------
 
 def _is_blank(value: Any) -> bool:
@@ -180,15 +231,314 @@ def _parse_diagnostic_row(row: tuple) -> dict[str, Any] | None:
     }
 
 
+def _billing_sheet_codes(ws: Any) -> list[dict[str, Any]]:
+    """Parse one billing group sheet (the sheet title is the group)."""
+    return [
+        entry for row in ws.iter_rows(min_row=2, values_only=True)
+        if (entry := _parse_billing_row(row, ws.title))
+    ]
+
+
+def _diagnostic_sheet_codes(ws: Any) -> list[dict[str, Any]]:
+    """Parse the diagnostic sheet."""
+    # Row 1 = headers, Row 2 = description row, Row 3+ = data
+    return [
+        entry for row in ws.iter_rows(min_row=3, values_only=True)
+        if (entry := _parse_diagnostic_row(row))
+    ]
+
+
+# -- Fee tables ----------------------------------------------------------------
+
+def to_cents(amount: Decimal) -> int:
+    """Round a dollar amount half-up to a whole number of cents."""
+    return int((amount * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+
+def _fee_decimal(fee: float) -> Decimal:
+    """Exact Decimal for a parsed fee (already rounded to 2 places)."""
+    return Decimal(repr(fee))
+
+
+def build_fee_table(
+    entry: dict[str, Any],
+    code_index: dict[str, dict[str, Any]],
+    sedation_unit_fee: Decimal | None = None,
+) -> dict[str, Any]:
+    """Resolve a billing code's derived amounts, all in integer cents.
+
+    Mirrors what the context panel displays: the ortho breakdown for ortho
+    codes with a fee, and for each related modifier either its percentage
+    of this code's fee or its own flat fee. Modifiers that are unknown or
+    carry neither are omitted. Sedation amounts need a unit fee, which is
+    not in the spreadsheet, so only base units are emitted without one.
+    """
+    fee = _fee_decimal(entry["fee"])
+    table: dict[str, Any] = {}
+
+    if entry["is_ortho_code"] and fee > 0:
+        table["ortho_cents"] = [to_cents(fee * factor) for factor in ORTHO_FACTORS]
+
+    modifiers: dict[str, dict[str, Any]] = {}
+    for mod_code in entry["related_modifiers"]:
+        modifier = code_index.get(mod_code)
+        if modifier is None:
+            continue
+        pct = modifier.get("modifier_percentage")
+        if pct is not None:
+            modifiers[mod_code] = {
+                "percentage": pct,
+                "amount_cents": to_cents(fee * Decimal(pct) / 100),
+            }
+        elif modifier["fee"] > 0:
+            modifiers[mod_code] = {
+                "percentage": None,
+                "amount_cents": to_cents(_fee_decimal(modifier["fee"])),
+            }
+    if modifiers:
+        table["modifiers"] = modifiers
+
+    units = entry["sedation_base_units"]
+    if units is not None:
+        sedation: dict[str, Any] = {"base_units": units}
+        if sedation_unit_fee is not None:
+            sedation["unit_fee_cents"] = to_cents(sedation_unit_fee)
+            sedation["base_amount_cents"] = to_cents(sedation_unit_fee * units)
+        table["sedation"] = sedation
+
+    return table
+
+
+def add_fee_tables(
+    codes: list[dict[str, Any]], sedation_unit_fee: Decimal | None = None,
+) -> None:
+    """Attach a fee_table to every billing code (in place).
+
+    Modifiers resolve by code with the last entry winning, matching the
+    client's codeIndex.
+    """
+    code_index = {c["code"]: c for c in sorted(codes, key=lambda c: c["code"])}
+    for entry in codes:
+        entry["fee_table"] = build_fee_table(entry, code_index, sedation_unit_fee)
+
+
+# -- Suggestion index ----------------------------------------------------------
+
+SUGGESTION_INDEX_VERSION = 1
+
+
+def build_suggestion_index(
+    diagnostic_codes: list[dict[str, Any]], billing_codes: list[dict[str, Any]],
+) -> tuple[dict[str, Any], list[str]]:
+    """Build the two-way diagnostic <-> billing suggestion index.
+
+    Diagnostics are referred to by their index in diagnostic_codes (as
+    written, sorted by code); suggested billing codes by their index in the
+    "billing" list. Both directions are lists indexed by id:
+
+      diagnostic_to_billing[d]  billing ids, most widely suggested first
+                                (then in spreadsheet order)
+      billing_to_diagnostic[b]  diagnostic indices, those listing b earliest
+                                first (then by diagnostic index)
+
+    "counts"[b] is the number of diagnoses suggesting billing id b.
+    Suggested codes missing from billing_codes are dropped and returned as
+    "diagnostic: code" strings.
+    """
+    known = {c["code"] for c in billing_codes}
+    dangling: list[str] = []
+    suggestions: list[list[str]] = []
+    counts: Counter[str] = Counter()
+    for diag in diagnostic_codes:
+        codes: list[str] = []
+        for code in diag.get("suggested_billing_codes", []):
+            if code not in known:
+                dangling.append(f"{diag['code']}: {code}")
+            elif code not in codes:
+                codes.append(code)
+        suggestions.append(codes)
+        counts.update(codes)
+
+    billing = sorted(counts, key=lambda code: (-counts[code], code))
+    ids = {code: i for i, code in enumerate(billing)}
+
+    diagnostic_to_billing = [
+        [ids[code] for _, _, code in sorted((-counts[code], pos, code) for pos, code in enumerate(codes))]
+        for codes in suggestions
+    ]
+    ranked: list[list[tuple[int, int]]] = [[] for _ in billing]
+    for d, codes in enumerate(suggestions):
+        for position, code in enumerate(codes):
+            ranked[ids[code]].append((position, d))
+
+    index = {
+        "version": SUGGESTION_INDEX_VERSION,
+        "diagnostic_count": len(diagnostic_codes),
+        "billing": billing,
+        "counts": [counts[code] for code in billing],
+        "diagnostic_to_billing": diagnostic_to_billing,
+        "billing_to_diagnostic": [[d for _, d in sorted(pairs)] for pairs in ranked],
+    }
+    return index, dangling
+
+
+def write_suggestion_index() -> bool:
+    """Write suggestion_index.json from the converted JSON files.
+
+    Returns True on success, False on failure.
+    """
+    json_path = SCRIPT_DIR / "suggestion_index.json"
+    try:
+        billing_codes = json.loads((SCRIPT_DIR / "billing_codes.json").read_text(encoding="utf-8"))
+        diagnostic_codes = json.loads((SCRIPT_DIR / "diagnostic_codes.json").read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        logger.error("Cannot build %s: %s", json_path.name, e)
+        return False
+
+    index, dangling = build_suggestion_index(diagnostic_codes, billing_codes)
+    json_path.write_text(json_codec.dumps(index, compact=True) + "\n", encoding="utf-8")
+
+    for reference in dangling:
+        logger.warning("  Unknown suggested billing code %s", reference)
+    linked = sum(1 for codes in index["diagnostic_to_billing"] if codes)
+    logger.info("Suggestions: %d diagnoses -> %d billing codes -> %s",
+                linked, len(index["billing"]), json_path.name)
+    if dangling:
+        logger.info("  dangling suggested codes: %d", len(dangling))
+    return True
+
+
+# -- Diagnostic tree -----------------------------------------------------------
+
+DIAGNOSTIC_TREE_VERSION = 2
+
+# Fields the tree groups codes by; "digest" hashes them (see
+# diagnostic_tree_digest) with 32-bit FNV-1a over UTF-16 code units, as
+# diagnosticTreeDigest in js/billing/navigation.js does.
+_TREE_DIGEST_FIELDS: tuple[str, ...] = ("code", "category", "subcategory")
+_FNV_OFFSET = 0x811C9DC5
+_FNV_PRIME = 0x01000193
+
+
+def _extend_ranges(ranges: list[list[int]], index: int) -> None:
+    """Add index to the last [start, end) range, or open a new range."""
+    if ranges and ranges[-1][1] == index:
+        ranges[-1][1] = index + 1
+    else:
+        ranges.append([index, index + 1])
+
+
+def diagnostic_tree_digest(diagnostic_codes: list[dict[str, Any]]) -> int:
+    """Hash every code's tree fields, each followed by a zero code unit.
+
+    The client only uses a prebuilt tree whose digest matches the codes it
+    loaded: a tree built from other codes would slice the wrong ranges,
+    even when the counts agree.
+    """
+    digest = _FNV_OFFSET
+    for diag in diagnostic_codes:
+        for field in _TREE_DIGEST_FIELDS:
+            data = str(diag.get(field) or "").encode("utf-16-le")
+            for unit in (*struct.unpack(f"<{len(data) // 2}H", data), 0):
+                digest = ((digest ^ unit) * _FNV_PRIME) & 0xFFFFFFFF
+    return digest
+
+
+def build_diagnostic_tree(diagnostic_codes: list[dict[str, Any]]) -> dict[str, Any]:
+    """Build the category -> subcategory browse tree over diagnostic codes.
+
+    diagnostic_codes must be sorted by code, as written. Every group has a
+    count and the [start, end) index ranges of its codes in that array, so
+    opening a folder is a few slices; a category spans several ranges when
+    its codes are not contiguous (e.g. symptom codes 780-788). Categories
+    and subcategories are in code order; codes without a subcategory form
+    the subcategory "".
+
+    "prefixes" maps every prefix of a code (the code included) to its one
+    range, so the codes starting with "78" are diagnostic_codes[start:end].
+    "digest" identifies the codes the ranges index (diagnostic_tree_digest).
+    """
+    categories: dict[str, dict[str, Any]] = {}
+    prefixes: dict[str, list[int]] = {}
+    for i, diag in enumerate(diagnostic_codes):
+        category = categories.setdefault(diag["category"], {
+            "name": diag["category"], "count": 0, "ranges": [], "subcategories": {},
+        })
+        subcategory = category["subcategories"].setdefault(diag["subcategory"], {
+            "name": diag["subcategory"], "count": 0, "ranges": [],
+        })
+        for group in (category, subcategory):
+            group["count"] += 1
+            _extend_ranges(group["ranges"], i)
+
+        code = diag["code"]
+        for length in range(1, len(code) + 1):
+            prefixes.setdefault(code[:length], [i, i])[1] = i + 1
+
+    return {
+        "version": DIAGNOSTIC_TREE_VERSION,
+        "count": len(diagnostic_codes),
+        "digest": diagnostic_tree_digest(diagnostic_codes),
+        "categories": [
+            {**category, "subcategories": list(category["subcategories"].values())}
+            for category in categories.values()
+        ],
+        "prefixes": prefixes,
+    }
+
+
+def _write_diagnostic_tree(diagnostic_codes: list[dict[str, Any]]) -> None:
+    """Write diagnostic_tree.json for codes as written to diagnostic_codes.json."""
+    json_path = SCRIPT_DIR / "diagnostic_tree.json"
+    tree = build_diagnostic_tree(diagnostic_codes)
+    json_path.write_text(json_codec.dumps(tree, compact=True) + "\n", encoding="utf-8")
+    logger.info("Diagnostic tree: %d categories, %d prefixes -> %s",
+                len(tree["categories"]), len(tree["prefixes"]), json_path.name)
+
+
+# -- Change reports -----------------------------------------------------------
+# Each conversion compares its codes with the JSON it replaces and writes
+# <name>.changes.json with tools/change_report.py's report, keyed by
+# code (repeats numbered " #2", ... in code order); billing also lists fee
+# changes.
+
+CODE_KEY_FIELDS: tuple[str, ...] = ("code",)
+
+
+def build_change_report(
+    old_codes: list[dict[str, Any]] | None,
+    new_codes: list[dict[str, Any]],
+    flag_fees: bool = False,
+) -> dict[str, Any]:
+    """Compare two conversions code by code (old_codes None = no previous file)."""
+    def by_code(codes: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return sorted(codes, key=lambda c: c["code"])
+
+    return change_report.build_report(
+        None if old_codes is None else by_code(old_codes),
+        by_code(new_codes),
+        CODE_KEY_FIELDS,
+        fee_field="fee" if flag_fees else None,
+    )
+
+
+def _load_previous(path: Path) -> list[dict[str, Any]] | None:
+    """Codes from the JSON about to be replaced, or None if unavailable."""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except json.JSONDecodeError as e:
+        logger.warning("Previous %s unreadable (%s) - reporting all as added", path.name, e)
+        return None
+
+
 # -- Core conversion ----------------------------------------------------------
 
-def _write_json(data: list[dict[str, Any]], path: Path) -> None:
-    """Sort by code and write JSON (does not mutate input)."""
+def _render_json(data: list[dict[str, Any]]) -> str:
+    """Sort by code and serialize (does not mutate input)."""
     sorted_data = sorted(data, key=lambda c: c["code"])
-    path.write_text(
-        json.dumps(sorted_data, indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
-    )
+    return json_codec.dumps(sorted_data, ensure_ascii=False) + "\n"
 
 
 def _load_workbook(path: Path) -> Workbook | None:
@@ -219,55 +569,219 @@ def _log_diagnostic_summary(codes: list[dict[str, Any]], path: Path) -> None:
     logger.info("  suggested_billing_codes filled: %d/%d", filled_billing, len(codes))
 
 
-# -- Public converters ---------------------------------------------------------
+def _convert_cached(
+    namespace: str,
+    xlsx_path: Path,
+    parse: Callable[[], list[dict[str, Any]] | None],
+    options: dict[str, Any],
+    use_cache: bool,
+) -> str | None:
+    """Return the JSON text for xlsx_path, reusing the shared build cache.
+
+    The artifact key covers the workbook bytes, the sources in
+    _CACHE_SOURCES, the options and the openpyxl version (see tools/build_cache.py). On a miss,
+    parse() converts the workbook; None means it failed.
+    """
+    artifacts = build_cache.open_cache() if use_cache else None
+    key = None
+    if artifacts is not None and xlsx_path.exists():
+        key = artifacts.key(
+            namespace, [xlsx_path], _CACHE_SOURCES,
+            {**options, "openpyxl": openpyxl.__version__},
+        )
+        cached = artifacts.get(key)
+        if cached is not None:
+            logger.info("Reusing cached conversion of %s (build cache)", xlsx_path.name)
+            return cached.decode("utf-8")
+
+    codes = parse()
+    if codes is None:
+        return None
+    content = _render_json(codes)
+    if key is not None:
+        artifacts.put(key, content.encode("utf-8"))
+    return content
 
-def convert_billing() -> bool:
-    """Convert billing_codes.xlsx to billing_codes.json. Returns True on success."""
-    xlsx_path = SCRIPT_DIR / "billing_codes.xlsx"
-    json_path = SCRIPT_DIR / "billing_codes.json"
 
+def _parse_billing(
+    xlsx_path: Path, sedation_unit_fee: Decimal | None, use_cache: bool,
+) -> list[dict[str, Any]] | None:
+    """Parse every group sheet of billing_codes.xlsx and add fee tables."""
     wb = _load_workbook(xlsx_path)
     if wb is None:
-        return False
+        return None
 
+    # Group sheets whose content is unchanged reuse their parsed rows.
+    cache = sheet_cache.SheetCache.open(xlsx_path, _SHEET_CACHE_SALT, enabled=use_cache)
     with closing(wb):
         codes: list[dict[str, Any]] = []
         for ws in wb.worksheets:
             group = ws.title
-            for row in ws.iter_rows(min_row=2, values_only=True):
-                entry = _parse_billing_row(row, group)
-                if entry:
-                    codes.append(entry)
-
-    _write_json(codes, json_path)
-    _log_billing_summary(codes, json_path)
-    return True
+            entries = cache.get(group)
+            if entries is None:
+                entries = _billing_sheet_codes(ws)
+                cache.put(group, entries)
+            codes.extend(entries)
+    cache.save()
+    logger.debug("Billing sheet cache: %d reused, %d parsed", cache.hits, cache.misses)
 
+    add_fee_tables(codes, sedation_unit_fee)
+    return codes
 
-def convert_diagnostic() -> bool:
-    """Convert diagnostic_codes.xlsx to diagnostic_codes.json. Returns True on success."""
-    xlsx_path = SCRIPT_DIR / "diagnostic_codes.xlsx"
-    json_path = SCRIPT_DIR / "diagnostic_codes.json"
 
+def _parse_diagnostic(xlsx_path: Path, use_cache: bool) -> list[dict[str, Any]] | None:
+    """Parse the active sheet of diagnostic_codes.xlsx."""
     wb = _load_workbook(xlsx_path)
     if wb is None:
-        return False
+        return None
 
     with closing(wb):
         ws = wb.active
         if ws is None:
             logger.error("No active sheet in %s", xlsx_path)
-            return False
-        codes: list[dict[str, Any]] = []
-        # Row 1 = headers, Row 2 = description row, Row 3+ = data
-        for row in ws.iter_rows(min_row=3, values_only=True):
-            entry = _parse_diagnostic_row(row)
-            if entry:
-                codes.append(entry)
+            return None
+        cache = sheet_cache.SheetCache.open(xlsx_path, _SHEET_CACHE_SALT, enabled=use_cache)
+        codes: list[dict[str, Any]] | None = cache.get(ws.title)
+        if codes is None:
+            codes = _diagnostic_sheet_codes(ws)
+            cache.put(ws.title, codes)
+            cache.save()
+    return codes
+
+
+# -- Public converters ---------------------------------------------------------
+
+def convert_billing(sedation_unit_fee: Decimal | None = None, use_cache: bool = True) -> bool:
+    """Convert billing_codes.xlsx to billing_codes.json. Returns True on success."""
+    xlsx_path = SCRIPT_DIR / "billing_codes.xlsx"
+    json_path = SCRIPT_DIR / "billing_codes.json"
+
+    content = _convert_cached(
+        "billing_codes", xlsx_path,
+        lambda: _parse_billing(xlsx_path, sedation_unit_fee, use_cache),
+        {"sedation_unit_fee": None if sedation_unit_fee is None else str(sedation_unit_fee)},
+        use_cache,
+    )
+    if content is None:
+        return False
+
+    previous = _load_previous(json_path)
+    json_path.write_text(content, encoding="utf-8")
+    codes = json.loads(content)
+    _log_billing_summary(codes, json_path)
+    return change_report.write_report(
+        change_report.report_path(json_path),
+        build_change_report(previous, codes, flag_fees=True),
+    )
+
+
+def convert_diagnostic(use_cache: bool = True) -> bool:
+    """Convert diagnostic_codes.xlsx to diagnostic_codes.json. Returns True on success."""
+    xlsx_path = SCRIPT_DIR / "diagnostic_codes.xlsx"
+    json_path = SCRIPT_DIR / "diagnostic_codes.json"
+
+    content = _convert_cached(
+        "diagnostic_codes", xlsx_path,
+        lambda: _parse_diagnostic(xlsx_path, use_cache), {}, use_cache,
+    )
+    if content is None:
+        return False
 
-    _write_json(codes, json_path)
+    previous = _load_previous(json_path)
+    json_path.write_text(content, encoding="utf-8")
+    codes = json.loads(content)
     _log_diagnostic_summary(codes, json_path)
-    return True
+    _write_diagnostic_tree(codes)
+    return change_report.write_report(
+        change_report.report_path(json_path), build_change_report(previous, codes)
+    )
+
+
+# -- In-memory conversion ------------------------------------------------------
+#
+# Same records as the JSON files (in sheet/row order rather than sorted by
+# code), from workbook bytes or a binary file-like object. Nothing is read
+# from or written to disk and the caches are not used.
+
+WorkbookSource = bytes | bytearray | memoryview | BinaryIO
+
+
+def _open_workbook(source: WorkbookSource) -> Workbook:
+    """Load an in-memory workbook. Raises ValueError if it is unreadable."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    elif not source.seekable():
+        source = io.BytesIO(source.read())
+    try:
+        return load_workbook(source, read_only=True)
+    except Exception as e:
+        raise ValueError(f"Unreadable workbook: {e}") from e
+
+
+def iter_billing_codes(
+    source: WorkbookSource, sedation_unit_fee: Decimal | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield the billing codes of an in-memory billing_codes.xlsx.
+
+    Fee tables resolve modifiers across every sheet, so the whole workbook
+    is parsed before this returns. Raises ValueError for unreadable input.
+    """
+    wb = _open_workbook(source)
+    with closing(wb):
+        codes = [entry for ws in wb.worksheets for entry in _billing_sheet_codes(ws)]
+    add_fee_tables(codes, sedation_unit_fee)
+    return iter(codes)
+
+
+def iter_diagnostic_codes(source: WorkbookSource) -> Iterator[dict[str, Any]]:
+    """Yield the diagnostic codes of an in-memory diagnostic_codes.xlsx, row by row.
+
+    Raises ValueError for unreadable input or a workbook without an active sheet.
+    """
+    wb = _open_workbook(source)
+    if wb.active is None:
+        wb.close()
+        raise ValueError("Unreadable workbook: no active sheet")
+
+    def generate() -> Iterator[dict[str, Any]]:
+        with closing(wb):
+            yield from _diagnostic_sheet_codes(wb.active)
+
+    return generate()
+
+
+def _read_billing_codes(
+    source: WorkbookSource, sedation_unit_fee: Decimal | None,
+) -> list[dict[str, Any]]:
+    """Module-level (picklable) executor target."""
+    return list(iter_billing_codes(source, sedation_unit_fee))
+
+
+def _read_diagnostic_codes(source: WorkbookSource) -> list[dict[str, Any]]:
+    """Module-level (picklable) executor target."""
+    return list(iter_diagnostic_codes(source))
+
+
+async def read_billing_codes_async(
+    source: WorkbookSource,
+    sedation_unit_fee: Decimal | None = None,
+    executor: Executor | None = None,
+) -> list[dict[str, Any]]:
+    """Run iter_billing_codes in an executor and return the codes.
+
+    Parsing is CPU-bound; pass a ProcessPoolExecutor (with bytes, which
+    pickle) to convert several workbooks in parallel.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, _read_billing_codes, source, sedation_unit_fee)
+
+
+async def read_diagnostic_codes_async(
+    source: WorkbookSource, executor: Executor | None = None,
+) -> list[dict[str, Any]]:
+    """Run iter_diagnostic_codes in an executor and return the codes."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, _read_diagnostic_codes, source)
 
 
 # -- CLI -----------------------------------------------------------------------
@@ -282,6 +796,20 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Enable verbose debug logging",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Convert from scratch instead of reusing the build cache "
+             "and unchanged sheets",
+    )
+    parser.add_argument(
+        "--sedation-unit-fee",
+        type=Decimal,
+        default=None,
+        metavar="DOLLARS",
+        help="Dollar value of one sedation unit; adds sedation base amounts "
+             "to each fee_table",
+    )
     return parser.parse_args()
 
 
@@ -298,8 +826,10 @@ def main() -> int:
     logger.info("xlsx_to_json")
     logger.info("=" * 40)
 
-    success = convert_billing()
-    if not convert_diagnostic():
+    success = convert_billing(args.sedation_unit_fee, use_cache=not args.no_cache)
+    if not convert_diagnostic(use_cache=not args.no_cache):
+        success = False
+    if success and not write_suggestion_index():
         success = False
 
     if success:
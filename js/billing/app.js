@@ -30,8 +30,84 @@
     codeIndex: {}, // code string -> code object
     folderTree: {}, // built by navigation.js
     anatomySections: {}, // anatomy_sections.json (Ortho & MSK)
+    billingViews: null, // billing_views.json (pre-joined anatomy/on-call)
+    suggestions: null, // suggestion_index.json (diagnostic <-> billing)
   };
 
+  // ─── Search Engine ──────────────────────────────────────────────
+  App.searchClient = null; // SearchClient when the search worker is running
+  App.searchReady = Promise.resolve(); // settles once a search engine is ready
+  var searchTicket = 0; // bumped per doSearch; older results are dropped
+
+  /**
+   * Start the search worker on the prebuilt index. Without workers, or
+   * when the index was not built from the loaded codes (a stale index
+   * would map result ids to the wrong codes), search.js runs on the
+   * main thread over the JSON files instead.
+   */
+  function startSearch() {
+    return SearchClient.start(
+      "js/billing/search-worker.js", "data/billing/search-index.bin", "data/fuzzy-index.json",
+      onSearchWorkerFailed
+    )
+      .then(function (client) {
+        var codeLists = [App.data.billingCodes, App.data.diagnosticCodes];
+        if (client.counts.billing !== codeLists[0].length ||
+            client.counts.diagnostic !== codeLists[1].length ||
+            client.digest !== searchIndexDigest(codeLists)) { // global from search.js
+          client.terminate();
+          throw new Error("search index does not match the code lists");
+        }
+        App.searchClient = client;
+      })
+      .catch(function (err) {
+        console.warn("Search worker unavailable, searching on the main thread:", err);
+        return startMainThreadSearch();
+      });
+  }
+
+  /** Load search.js's data so search() runs on the main thread */
+  function startMainThreadSearch() {
+    // Optional typo correction; search works without it
+    FuzzyIndex.load("data/fuzzy-index.json")
+      .then(setFuzzyIndex)
+      .catch(function (err) { console.warn("Fuzzy index unavailable:", err); });
+    return loadSearchData("data/billing/").catch(function (err) {
+      console.error("Failed to load search data:", err);
+    });
+  }
+
+  /** The worker died after starting: search on the main thread from now on */
+  function onSearchWorkerFailed(err) {
+    console.warn("Search worker failed, searching on the main thread:", err);
+    App.searchClient = null;
+    App.searchReady = startMainThreadSearch();
+  }
+
+  /** Resolve with search results for query, mapped back to code objects */
+  function runSearch(query) {
+    return App.searchReady.then(function () {
+      if (!App.searchClient) return search(query); // global from search.js
+
+      return App.searchClient.query(query).then(function (reply) {
+        if (!reply) return null;
+        function toResult(codes) {
+          return function (id) { return { code: codes[id] }; };
+        }
+        return {
+          billing: Array.prototype.map.call(reply.billing, toResult(App.data.billingCodes)),
+          diagnostic: Array.prototype.map.call(reply.diagnostic, toResult(App.data.diagnosticCodes)),
+          billingTotal: reply.billingTotal,
+          diagnosticTotal: reply.diagnosticTotal,
+          corrected: reply.corrected || undefined,
+        };
+      }, function () {
+        // The worker died (onSearchWorkerFailed): rerun on the main thread
+        return runSearch(query);
+      });
+    });
+  }
+
   // ─── Column Resizing (Desktop Only) ─────────────────────────────
   function initColumnResizers() {
     var dashboard = document.getElementById("billing-dashboard");
@@ -106,9 +182,6 @@
   // ─── Initialization (called by Shell) ──────────────────────────
   async function init() {
     try {
-      // Load billing + diagnostic codes into search engine
-      await loadSearchData("data/billing/");
-
       // Load all data files in parallel
       var results = await Promise.all([
         fetch("data/billing/billing_codes.json").then(function (r) { return r.json(); }),
@@ -116,6 +189,22 @@
         fetch("data/billing/general_tips.json").then(function (r) { return r.json(); }),
         fetch("data/billing/oncall_tables.json").then(function (r) { return r.json(); }),
         fetch("data/billing/anatomy_sections.json").then(function (r) { return r.json(); }),
+        // Optional; time periods fall back to computed rules without it
+        fetch("data/billing/billing_calendar.json")
+          .then(function (r) { return r.ok ? r.json() : null; })
+          .catch(function () { return null; }),
+        // Optional; anatomy sections and on-call tables resolve codes without it
+        fetch("data/billing/billing_views.json")
+          .then(function (r) { return r.ok ? r.json() : null; })
+          .catch(function () { return null; }),
+        // Optional; only the "Suggested For" section needs it
+        fetch("data/billing/suggestion_index.json")
+          .then(function (r) { return r.ok ? r.json() : null; })
+          .catch(function () { return null; }),
+        // Optional; the diagnostic browse tree is grouped client-side without it
+        fetch("data/billing/diagnostic_tree.json")
+          .then(function (r) { return r.ok ? r.json() : null; })
+          .catch(function () { return null; }),
       ]);
 
       App.data.billingCodes = results[0];
@@ -123,16 +212,22 @@
       App.data.generalTips = results[2].tips || [];
       App.data.oncallTables = results[3].tables || {};
       App.data.anatomySections = results[4] || {};
+      App.data.billingViews = results[6];
+      App.data.suggestions = buildSuggestionLookup(results[7], results[1]);
+
+      // Searches issued before the engine is ready wait for it
+      App.searchReady = startSearch();
 
       // Build code index for O(1) lookup
       buildCodeIndex();
 
       // Detect current billing time period
+      App.setBillingCalendar(results[5]);
       App.detectTimePeriod();
 
       // Build folder trees
       App.buildFolderTree();
-      App.buildDiagnosticTree();
+      App.buildDiagnosticTree(results[8]);
 
       // Check user identity
       App.checkUser();
@@ -164,6 +259,33 @@
   // Expose init for Shell to call
   App.init = init;
 
+  /**
+   * Wrap suggestion_index.json for O(1) lookups in both directions:
+   * billingFor(diagCode) → [billing code], diagnosesFor(billingCode) → [diagnostic entry].
+   * Returns null if the index is missing or was built from other diagnostic data.
+   */
+  function buildSuggestionLookup(index, diagnosticCodes) {
+    if (!index || index.diagnostic_count !== diagnosticCodes.length) return null;
+
+    var billingIds = {};
+    index.billing.forEach(function (code, i) { billingIds[code] = i; });
+    var diagIds = {};
+    diagnosticCodes.forEach(function (d, i) { diagIds[d.code] = i; });
+
+    return {
+      billingFor: function (diagCode) {
+        var d = diagIds[diagCode];
+        if (d === undefined) return [];
+        return index.diagnostic_to_billing[d].map(function (b) { return index.billing[b]; });
+      },
+      diagnosesFor: function (billingCode) {
+        var b = billingIds[billingCode];
+        if (b === undefined) return [];
+        return index.billing_to_diagnostic[b].map(function (d) { return diagnosticCodes[d]; });
+      },
+    };
+  }
+
   function buildCodeIndex() {
     App.data.codeIndex = {};
     App.data.billingCodes.forEach(function (code) {
@@ -179,8 +301,15 @@
   }
 
   // ─── Public search API (called by Shell) ──────────────────────
+  /**
+   * Search billing and diagnostic codes and render the results. Returns a
+   * promise of the results, or of null when a newer search superseded
+   * this one before it finished.
+   */
   App.doSearch = function (query) {
+    var ticket = ++searchTicket;
     if (query.trim().length === 0) {
+      if (App.searchClient) App.searchClient.cancel();
       App.state.view = "browse";
       App.state.searchResults = null;
       App.state.searchQuery = "";
@@ -193,7 +322,7 @@
       // Mobile: restore diagnostic folder browse
       App.state.diagView = "browse";
       App.renderDiagnosticBrowse();
-      return { billing: [], diagnostic: [], billingTotal: 0, diagnosticTotal: 0 };
+      return Promise.resolve({ billing: [], diagnostic: [], billingTotal: 0, diagnosticTotal: 0 });
     }
 
     App.state.view = "search";
@@ -203,17 +332,20 @@
     var contextHeader = document.getElementById("context-header");
     if (contextHeader) contextHeader.textContent = "Details";
     App.renderContextPanel(null);
-    var results = search(query); // global from search.js
-    App.state.searchResults = results;
 
-    App.updateColumnHeaders(results.billingTotal, results.diagnosticTotal);
-    App.renderBillingSearchResults(results.billing);
-    // Switch mobile diagnostic to search mode
-    App.state.diagView = "search";
-    App.updateDiagnosticMobileHeader(results.diagnosticTotal);
-    App.renderDiagnosticColumn(results.diagnostic);
+    return runSearch(query).then(function (results) {
+      if (!results || ticket !== searchTicket) return null;
+      App.state.searchResults = results;
 
-    return results;
+      App.updateColumnHeaders(results.billingTotal, results.diagnosticTotal);
+      App.renderBillingSearchResults(results.billing);
+      // Switch mobile diagnostic to search mode
+      App.state.diagView = "search";
+      App.updateDiagnosticMobileHeader(results.diagnosticTotal);
+      App.renderDiagnosticColumn(results.diagnostic);
+
+      return results;
+    });
   };
 
   // ─── Arrow-key highlight helper ─────────────────────────────────
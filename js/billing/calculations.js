@@ -2,49 +2,60 @@
   "use strict";
   window.App = window.App || {};
 
+  /** Ortho breakdown rows; amounts come from fee_table.ortho_cents */
+  var ORTHO_ROWS = [
+    { label: "Base Fee", formula: "100%", factor: 1 },
+    { label: "Referred to Ortho", formula: "75%", factor: 0.75 },
+    { label: "Multiple \u2014 first code", formula: "75%", factor: 0.75 },
+    { label: "Multiple \u2014 subsequent codes", formula: "85% of 75%", factor: 0.75 * 0.85 },
+    { label: "Repeat reduction \u2014 initial", formula: "85% of 75%", factor: 0.75 * 0.85 },
+    { label: "Repeat reduction \u2014 final", formula: "75%", factor: 0.75 },
+  ];
+
   App.calculations = {
     /**
-     * Ortho fee breakdown — 6 rows from base fee.
+     * Ortho fee breakdown — 6 rows for a code.
+     * Uses the cent amounts precomputed by xlsx_to_json.py; multiplies
+     * the fee only for data built before fee tables existed.
      * Returns array of { label, formula, amount }
      */
-    orthoBreakdown: function (baseFee) {
-      return [
-        { label: "Base Fee", formula: "100%", amount: baseFee },
-        {
-          label: "Referred to Ortho",
-          formula: "75%",
-          amount: baseFee * 0.75,
-        },
-        {
-          label: "Multiple \u2014 first code",
-          formula: "75%",
-          amount: baseFee * 0.75,
-        },
-        {
-          label: "Multiple \u2014 subsequent codes",
-          formula: "85% of 75%",
-          amount: baseFee * 0.75 * 0.85,
-        },
-        {
-          label: "Repeat reduction \u2014 initial",
-          formula: "85% of 75%",
-          amount: baseFee * 0.75 * 0.85,
-        },
-        {
-          label: "Repeat reduction \u2014 final",
-          formula: "75%",
-          amount: baseFee * 0.75,
-        },
-      ];
+    orthoBreakdown: function (code) {
+      var cents = code.fee_table && code.fee_table.ortho_cents;
+      return ORTHO_ROWS.map(function (row, i) {
+        return {
+          label: row.label,
+          formula: row.formula,
+          amount: cents ? cents[i] / 100 : code.fee * row.factor,
+        };
+      });
     },
 
     /**
-     * Modifier display data.
+     * Modifier display data, from the parent's precomputed fee_table
+     * when present.
      * @param {Object} parentCode — the code being viewed (need its fee)
      * @param {Object} modifierCode — the modifier code object from codeIndex
      * @returns {{ isPercentage, percentage, calculatedAmount, displayText }}
      */
     modifierDisplay: function (parentCode, modifierCode) {
+      var table = parentCode.fee_table;
+      if (table) {
+        var resolved = table.modifiers && table.modifiers[modifierCode.code];
+        if (!resolved) {
+          return { isPercentage: false, percentage: null, calculatedAmount: null, displayText: "" };
+        }
+        var resolvedAmount = resolved.amount_cents / 100;
+        var isPct = resolved.percentage != null;
+        return {
+          isPercentage: isPct,
+          percentage: resolved.percentage,
+          calculatedAmount: resolvedAmount,
+          displayText: isPct
+            ? "+" + resolved.percentage + "% (" + App.utils.formatFee(resolvedAmount) + ")"
+            : App.utils.formatFee(resolvedAmount),
+        };
+      }
+
       if (modifierCode.modifier_percentage != null) {
         var pct = modifierCode.modifier_percentage;
         var amount = parentCode.fee * (pct / 100);
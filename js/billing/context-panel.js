@@ -42,12 +42,18 @@
       );
     }
 
-    // Section 6: Notes
+    // Section 6: Diagnoses that suggest this code
+    var diagnoses = suggestedDiagnoses(code);
+    if (diagnoses.length > 0) {
+      container.appendChild(buildDiagnosesSection(diagnoses));
+    }
+
+    // Section 7: Notes
     if (code.notes && code.notes.trim()) {
       container.appendChild(buildNotesSection(code.notes));
     }
 
-    // Section 7: Hidden notes (Alvin only)
+    // Section 8: Hidden notes (Alvin only)
     if (App.state.isAlvin && code.hidden_notes && code.hidden_notes.trim()) {
       container.appendChild(buildHiddenNotesSection(code.hidden_notes));
     }
@@ -76,6 +82,10 @@
         buildRelatedCodesSection("Conflicts With", "section--conflicts", code.conflicts_with)
       );
     }
+    var diagnoses = suggestedDiagnoses(code);
+    if (diagnoses.length > 0) {
+      container.appendChild(buildDiagnosesSection(diagnoses));
+    }
     if (code.notes && code.notes.trim()) {
       container.appendChild(buildNotesSection(code.notes));
     }
@@ -99,7 +109,7 @@
     var title = App.utils.el("h3", "section__title", "Ortho Referral Fee Breakdown");
     section.appendChild(title);
 
-    var rows = App.calculations.orthoBreakdown(code.fee);
+    var rows = App.calculations.orthoBreakdown(code);
     var table = App.utils.el("table", "ortho-table");
 
     rows.forEach(function (row) {
@@ -200,6 +210,26 @@
     return section;
   }
 
+  function suggestedDiagnoses(code) {
+    return App.data.suggestions ? App.data.suggestions.diagnosesFor(code.code) : [];
+  }
+
+  function buildDiagnosesSection(diagnoses) {
+    var section = App.utils.el("div", "context-section section--diagnoses");
+    var title = App.utils.el("h3", "section__title", "Suggested For");
+    section.appendChild(title);
+
+    diagnoses.forEach(function (diag) {
+      var item = App.utils.el("div", "diagnostic-item");
+      item.dataset.code = diag.code;
+      item.appendChild(App.utils.el("span", "diagnostic-item__code", diag.code));
+      item.appendChild(App.utils.el("span", "diagnostic-item__name", diag.name));
+      section.appendChild(item);
+    });
+
+    return section;
+  }
+
   function buildNotesSection(notes) {
     var section = App.utils.el("div", "context-section section--notes");
     var title = App.utils.el("h3", "section__title", "Notes");
@@ -96,6 +96,23 @@
       "</select></div>" +
       '<div id="oncall-results" class="oncall-results"></div>';
 
+    // Preselect the scenario for the current time
+    document.getElementById("oncall-time").value = App.detectOnCallScenario();
+
+    /** Role rows for a scenario: pre-joined by the build, else from the table */
+    function scenarioRows(tableKey, timeKey) {
+      var views = App.data.billingViews;
+      var view = views && views.oncall[tableKey];
+      if (view) return view.scenarios[timeKey] || null;
+
+      var table = tables[tableKey];
+      if (!table || typeof table === "string" || !table.scenarios || !table.scenarios[timeKey]) {
+        return null;
+      }
+      var scenario = table.scenarios[timeKey];
+      return Object.keys(scenario).map(function (role) { return scenario[role]; });
+    }
+
     function updateResults() {
       var timeKey = document.getElementById("oncall-time").value;
       var tableKey = document.getElementById("oncall-table").value;
@@ -106,17 +123,15 @@
         return;
       }
 
-      var table = tables[tableKey];
-      if (!table || typeof table === "string" || !table.scenarios || !table.scenarios[timeKey]) {
+      var rows = scenarioRows(tableKey, timeKey);
+      if (!rows) {
         resultsDiv.innerHTML =
           '<p class="empty-state">No data available for this combination.</p>';
         return;
       }
 
-      var scenario = table.scenarios[timeKey];
       var html = "";
-      Object.keys(scenario).forEach(function (role) {
-        var data = scenario[role];
+      rows.forEach(function (data) {
         var code = data.code || "\u2014";
         var name = data.name || "";
         var fee = data.fee != null ? App.utils.formatFee(data.fee) : "TBD";
@@ -140,6 +155,13 @@
     App.openModal();
   };
 
+  /** " ($X.XX)" when the build included a sedation unit fee */
+  function sedationBaseAmount(code) {
+    var sedation = code.fee_table && code.fee_table.sedation;
+    if (!sedation || sedation.base_amount_cents == null) return "";
+    return " (" + App.utils.formatFee(sedation.base_amount_cents / 100) + ")";
+  }
+
   /** Open Sedation Calculator placeholder modal */
   App.openSedationModal = function (code) {
     var content = document.getElementById("modal-content");
@@ -152,6 +174,7 @@
       "</strong></p>" +
       '<p class="modal__text">Base units: ' +
       (code.sedation_base_units || "N/A") +
+      sedationBaseAmount(code) +
       "</p>" +
       '<p class="modal__text" style="color: var(--color-text-muted); margin-top: var(--space-lg);">' +
       "This calculator will be functional in V2. It will calculate total sedation units based on procedure time, base units, and applicable premiums." +
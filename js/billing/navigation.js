@@ -499,17 +499,11 @@
         });
       } else if (anatomySections) {
         // Data-driven anatomy sections (Ortho & MSK subgroups)
-        // Use ALL billing codes for lookup (shared codes like E584 may be in other subgroups)
-        var allCodesMap = {};
-        App.data.billingCodes.forEach(function (c) { allCodesMap[c.code] = c; });
-
-        anatomySections.forEach(function (section) {
+        resolveAnatomySections(sub, anatomySections).forEach(function (section) {
           if (section.divider) {
             container.appendChild(App.utils.el("div", "section-divider", section.divider));
           } else {
-            var sectionCodes = section.codes
-              .map(function (c) { return allCodesMap[c]; })
-              .filter(Boolean);
+            var sectionCodes = section.codes;
             var prefixInfo = extractCommonPrefix(sectionCodes);
 
             var headerText = prefixInfo ? prefixInfo.headerText : section.header;
@@ -561,6 +555,46 @@
     }
   };
 
+  /**
+   * Anatomy sections with code strings resolved to billing code objects:
+   * [{ divider }] or [{ header, codes: [codeObj] }].
+   * Reads the integer indices pre-joined by the build (billing_views.json);
+   * falls back to a code lookup over ALL billing codes (shared codes like
+   * E584 may be in other subgroups) when the views are missing or stale.
+   */
+  function resolveAnatomySections(subgroupKey, anatomySections) {
+    var views = App.data.billingViews;
+    var billingCodes = App.data.billingCodes;
+    var view = views && views.billing_count === billingCodes.length && views.anatomy[subgroupKey];
+    if (view) {
+      var fresh = true;
+      var resolved = view.map(function (section) {
+        if (section.divider) return section;
+        return {
+          header: section.header,
+          codes: section.rows.map(function (row) {
+            var code = billingCodes[row.i];
+            if (!code || code.code !== row.code) fresh = false;
+            return code;
+          }),
+        };
+      });
+      if (fresh) return resolved;
+    }
+
+    var allCodesMap = {};
+    billingCodes.forEach(function (c) { allCodesMap[c.code] = c; });
+    return anatomySections.map(function (section) {
+      if (section.divider) return section;
+      return {
+        header: section.header,
+        codes: section.codes
+          .map(function (c) { return allCodesMap[c]; })
+          .filter(Boolean),
+      };
+    });
+  }
+
   /** Extract common prefix for a group of codes sharing a dash naming convention.
    *  Tries en-dash " – " first (anatomy codes), then hyphen " - " (assessment codes).
    *  Returns { headerText, getSuffix(name) } or null if no common prefix found. */
@@ -760,46 +794,109 @@
 
   // ─── Diagnostic Folder Tree (Mobile Browse) ────────────────────
 
+  // 32-bit FNV-1a, as diagnostic_tree_digest in xlsx_to_json.py
+  var FNV_OFFSET = 0x811c9dc5;
+  var FNV_PRIME = 0x01000193;
+
   /**
-   * Build diagnostic folder tree from diagnostic codes.
-   * tree[category] = { subcategories: { subName: [codes] }, flatCodes: [codes], totalCount }
+   * Hash the fields the tree groups codes by (code, category,
+   * subcategory), as xlsx_to_json.py does for diagnostic_tree.json's
+   * "digest", so a tree built from other codes is not used.
    */
-  App.buildDiagnosticTree = function () {
-    var tree = {};
+  function diagnosticTreeDigest(codes) {
+    var hash = FNV_OFFSET;
+    codes.forEach(function (code) {
+      [code.code, code.category, code.subcategory].forEach(function (field) {
+        var text = field ? String(field) : "";
+        for (var i = 0; i < text.length; i++) {
+          hash = Math.imul(hash ^ text.charCodeAt(i), FNV_PRIME);
+        }
+        hash = Math.imul(hash, FNV_PRIME); // zero code unit between fields
+      });
+    });
+    return hash >>> 0;
+  }
 
-    App.data.diagnosticCodes.forEach(function (code) {
-      var cat = code.category || "Other";
-      if (!tree[cat]) {
-        tree[cat] = { subcategories: {}, flatCodes: [], totalCount: 0 };
+  /**
+   * Group code-sorted diagnostic codes into categories and subcategories
+   * with [start, end) index ranges (same shape as diagnostic_tree.json,
+   * built by xlsx_to_json.py). Only used when that file is unavailable.
+   */
+  function diagnosticCategories(codes) {
+    var categories = [];
+    var byName = {};
+
+    function extend(group, index) {
+      var last = group.ranges[group.ranges.length - 1];
+      if (last && last[1] === index) {
+        last[1] = index + 1;
+      } else {
+        group.ranges.push([index, index + 1]);
       }
-      tree[cat].totalCount++;
+      group.count++;
+    }
 
-      var sub = code.subcategory;
-      if (!sub || sub.trim() === "") {
-        tree[cat].flatCodes.push(code);
-      } else {
-        if (!tree[cat].subcategories[sub]) {
-          tree[cat].subcategories[sub] = [];
-        }
-        tree[cat].subcategories[sub].push(code);
+    codes.forEach(function (code, i) {
+      var cat = byName[code.category];
+      if (!cat) {
+        cat = byName[code.category] = { name: code.category, count: 0, ranges: [], subcategories: [], subs: {} };
+        categories.push(cat);
+      }
+      var sub = cat.subs[code.subcategory];
+      if (!sub) {
+        sub = cat.subs[code.subcategory] = { name: code.subcategory, count: 0, ranges: [] };
+        cat.subcategories.push(sub);
       }
+      extend(cat, i);
+      extend(sub, i);
     });
+    return categories;
+  }
 
-    // Sort codes within each group alphabetically by name
-    Object.keys(tree).forEach(function (cat) {
-      tree[cat].flatCodes.sort(function (a, b) {
-        return a.name.localeCompare(b.name);
-      });
-      Object.keys(tree[cat].subcategories).forEach(function (sub) {
-        tree[cat].subcategories[sub].sort(function (a, b) {
-          return a.name.localeCompare(b.name);
-        });
+  /**
+   * Build the diagnostic folder tree. Groups hold index ranges into the
+   * code-sorted App.data.diagnosticCodes; codes are sliced out when a
+   * folder opens (see diagnosticGroupCodes), so no list is filtered.
+   * tree[category] = { subcategories: { subName: group }, flat: group, totalCount }
+   * group = { count, ranges: [[start, end], ...] }
+   * prebuilt (diagnostic_tree.json) is used only if it was built from
+   * these codes; otherwise the groups are computed here.
+   */
+  App.buildDiagnosticTree = function (prebuilt) {
+    var codes = App.data.diagnosticCodes;
+    var current = prebuilt && prebuilt.count === codes.length &&
+      prebuilt.digest === diagnosticTreeDigest(codes);
+    var categories = current
+      ? prebuilt.categories
+      : diagnosticCategories(codes);
+    var tree = {};
+
+    categories.forEach(function (category) {
+      var node = { subcategories: {}, flat: { count: 0, ranges: [] }, totalCount: category.count };
+      category.subcategories.forEach(function (sub) {
+        if (!sub.name || sub.name.trim() === "") {
+          node.flat = sub;
+        } else {
+          node.subcategories[sub.name] = sub;
+        }
       });
+      tree[category.name || "Other"] = node;
     });
 
     App.data.diagnosticTree = tree;
   };
 
+  /** Codes of a diagnostic tree group, sorted alphabetically by name */
+  function diagnosticGroupCodes(group) {
+    var codes = [];
+    group.ranges.forEach(function (range) {
+      Array.prototype.push.apply(codes, App.data.diagnosticCodes.slice(range[0], range[1]));
+    });
+    return codes.sort(function (a, b) {
+      return a.name.localeCompare(b.name);
+    });
+  }
+
   /** Build a diagnostic item element */
   function buildDiagnosticItem(code) {
     var item = App.utils.el("div", "diagnostic-item");
@@ -850,12 +947,12 @@
       if (subNames.length > 0) {
         // Show subcategory folders
         subNames.forEach(function (sub) {
-          var codes = catData.subcategories[sub];
+          var group = catData.subcategories[sub];
           var item = App.utils.el("div", "folder-item folder-item--subgroup");
           item.dataset.diagSubcategory = sub;
 
           var name = App.utils.el("span", "folder-item__name", sub);
-          var count = App.utils.el("span", "folder-item__count", String(codes.length));
+          var count = App.utils.el("span", "folder-item__count", String(group.count));
           var arrow = App.utils.el("span", "folder-item__arrow", "\u203A");
 
           item.appendChild(name);
@@ -866,18 +963,16 @@
       }
 
       // Show flat codes (codes with no subcategory)
-      if (catData.flatCodes.length > 0) {
-        catData.flatCodes.forEach(function (code) {
-          container.appendChild(buildDiagnosticItem(code));
-        });
-      }
+      diagnosticGroupCodes(catData.flat).forEach(function (code) {
+        container.appendChild(buildDiagnosticItem(code));
+      });
     } else if (navPath.length === 2) {
       var cat2 = navPath[0];
       var sub2 = navPath[1];
       var catData2 = App.data.diagnosticTree[cat2];
       if (!catData2 || !catData2.subcategories[sub2]) return;
 
-      catData2.subcategories[sub2].forEach(function (code) {
+      diagnosticGroupCodes(catData2.subcategories[sub2]).forEach(function (code) {
         container.appendChild(buildDiagnosticItem(code));
       });
     }
@@ -1201,15 +1296,11 @@
         });
       } else if (anatomySections) {
         // Data-driven anatomy sections preview
-        var allCodesMap = {};
-        App.data.billingCodes.forEach(function (c) { allCodesMap[c.code] = c; });
-        anatomySections.forEach(function (section) {
+        resolveAnatomySections(subgroupKey, anatomySections).forEach(function (section) {
           if (section.divider) {
             container.appendChild(App.utils.el("div", "section-divider", section.divider));
           } else {
-            var sectionCodes = section.codes
-              .map(function (c) { return allCodesMap[c]; })
-              .filter(Boolean);
+            var sectionCodes = section.codes;
             var prefixInfo = extractCommonPrefix(sectionCodes);
 
             var headerText = prefixInfo ? prefixInfo.headerText : section.header;
@@ -0,0 +1,131 @@
+/**
+ * OHIP ED Billing Reference — Search Worker Client
+ *
+ * Starts js/billing/search-worker.js, hands it the prebuilt search index
+ * as a transferred ArrayBuffer (no copy is kept on the main thread) and
+ * turns its replies back into promises.
+ *
+ * query() resolves with the worker's reply for the newest query only:
+ * starting another query or calling cancel() resolves the outstanding
+ * one with null, and the worker stops scoring it. If the worker fails
+ * after starting, the client is dead: onFail is called once, and the
+ * outstanding query and any later ones reject so callers can search
+ * elsewhere.
+ */
+var SearchClient = (function () {
+  "use strict";
+
+  function absoluteUrl(url) {
+    return new URL(url, location.href).href;
+  }
+
+  /** Wrap a worker whose index is loaded */
+  function connect(worker, counts, digest, onFail) {
+    var seq = 0;
+    var waiting = null; // { resolve, reject } of the outstanding query
+    var failure = null; // set once the worker has failed
+
+    function supersede() {
+      if (waiting) {
+        waiting.resolve(null);
+        waiting = null;
+      }
+    }
+
+    worker.onmessage = function (event) {
+      var reply = event.data;
+      if (reply.type !== "results" || reply.seq !== seq || !waiting) return;
+      var pending = waiting;
+      waiting = null;
+      pending.resolve(reply);
+    };
+    worker.onerror = function (event) {
+      if (failure) return;
+      failure = new Error(event.message || "Search worker failed");
+      console.error("Search worker error:", failure.message);
+      worker.terminate();
+      if (onFail) onFail(failure);
+      if (waiting) {
+        waiting.reject(failure);
+        waiting = null;
+      }
+    };
+
+    return {
+      counts: counts,
+      digest: digest,
+      query: function (query) {
+        if (failure) return Promise.reject(failure);
+        supersede();
+        seq++;
+        worker.postMessage({ type: "search", seq: seq, query: query });
+        return new Promise(function (resolve, reject) {
+          waiting = { resolve: resolve, reject: reject };
+        });
+      },
+      cancel: function () {
+        if (failure) return;
+        supersede();
+        seq++;
+        worker.postMessage({ type: "cancel", seq: seq });
+      },
+      terminate: function () {
+        supersede();
+        worker.terminate();
+      },
+    };
+  }
+
+  /**
+   * Start the worker on the index at indexUrl; fuzzyUrl (optional) adds
+   * typo correction once it loads. Resolves with a client whose counts
+   * are the index's { billing, diagnostic } code counts and whose digest
+   * is the index's source digest (see searchIndexDigest in search.js).
+   * onFail (optional) is called if the worker fails after that.
+   */
+  function start(workerUrl, indexUrl, fuzzyUrl, onFail) {
+    if (typeof Worker === "undefined") {
+      return Promise.reject(new Error("Web Workers are not supported"));
+    }
+    var worker = new Worker(workerUrl);
+
+    return fetch(indexUrl)
+      .then(function (res) {
+        if (!res.ok) throw new Error("Failed to load " + indexUrl + ": " + res.status);
+        return res.arrayBuffer();
+      })
+      .then(function (buffer) {
+        return new Promise(function (resolve, reject) {
+          worker.onmessage = function (event) {
+            var reply = event.data;
+            if (reply.type === "ready") resolve(reply);
+            else if (reply.type === "error") reject(new Error(reply.message));
+          };
+          worker.onerror = function (event) {
+            reject(new Error(event.message || "Search worker failed to start"));
+          };
+          worker.postMessage({ type: "index", buffer: buffer }, [buffer]);
+        });
+      })
+      .then(function (ready) {
+        if (fuzzyUrl) {
+          worker.postMessage({ type: "fuzzy", url: absoluteUrl(fuzzyUrl) });
+        }
+        return connect(
+          worker, { billing: ready.billing, diagnostic: ready.diagnostic }, ready.digest, onFail
+        );
+      })
+      .catch(function (err) {
+        worker.terminate();
+        throw err;
+      });
+  }
+
+  return {
+    start: start,
+  };
+})();
+
+if (typeof module !== "undefined" && module.exports) {
+  module.exports = SearchClient;
+}
@@ -0,0 +1,119 @@
+/**
+ * OHIP ED Billing Reference — Search Worker
+ *
+ * Runs the search engine (search.js) off the main thread. The page
+ * (search-client.js) transfers data/billing/search-index.bin to the
+ * worker as an ArrayBuffer, then posts one message per keystroke.
+ *
+ * Messages in:
+ *  - { type: "index", buffer }   decode the index, reply "ready"
+ *  - { type: "fuzzy", url }      load a FuzzyIndex for typo correction
+ *  - { type: "search", seq, query }
+ *  - { type: "cancel", seq }     drop any query older than seq
+ *
+ * Messages out:
+ *  - { type: "ready", billing, diagnostic, digest }
+ *                                 code counts and digest of the index
+ *  - { type: "error", message }
+ *  - { type: "results", seq, billing, diagnostic, billingTotal,
+ *      diagnosticTotal, corrected }           ranked ids (Int32Array)
+ *
+ * Only the newest query is answered: queries that arrive while one is
+ * scoring replace each other, and the running one stops at its next
+ * slice (searchSliced) once it is no longer the newest.
+ */
+var SearchWorker = (function () {
+  "use strict";
+
+  /** Result indices as a transferable typed array */
+  function ids(results) {
+    var out = new Int32Array(results.length);
+    for (var i = 0; i < results.length; i++) {
+      out[i] = results[i]._dataIndex;
+    }
+    return out;
+  }
+
+  /**
+   * Return a message handler that drives engine (the search.js API) and
+   * replies through post(message, transfer).
+   */
+  function create(engine, post, fuzzyIndex) {
+    var latestSeq = 0;
+    var pending = null; // newest search not yet started
+    var running = false;
+
+    async function drain() {
+      running = true;
+      while (pending) {
+        var job = pending;
+        pending = null;
+        var results = await engine.searchSliced(job.query, function () {
+          return job.seq !== latestSeq;
+        });
+        if (!results || job.seq !== latestSeq) continue;
+
+        var billing = ids(results.billing);
+        var diagnostic = ids(results.diagnostic);
+        post({
+          type: "results",
+          seq: job.seq,
+          billing: billing,
+          diagnostic: diagnostic,
+          billingTotal: results.billingTotal,
+          diagnosticTotal: results.diagnosticTotal,
+          corrected: results.corrected || null,
+        }, [billing.buffer, diagnostic.buffer]);
+      }
+      running = false;
+    }
+
+    return function onMessage(message) {
+      switch (message.type) {
+        case "index":
+          try {
+            var counts = engine.setSearchIndex(message.buffer);
+            post({
+              type: "ready", billing: counts.billing, diagnostic: counts.diagnostic, digest: counts.digest,
+            });
+          } catch (err) {
+            post({ type: "error", message: String(err && err.message || err) });
+          }
+          break;
+        case "fuzzy":
+          fuzzyIndex.load(message.url)
+            .then(engine.setFuzzyIndex)
+            .catch(function (err) { console.warn("Fuzzy index unavailable:", err); });
+          break;
+        case "search":
+          latestSeq = message.seq;
+          pending = message;
+          if (!running) drain();
+          break;
+        case "cancel":
+          latestSeq = message.seq;
+          pending = null;
+          break;
+      }
+    };
+  }
+
+  return {
+    create: create,
+  };
+})();
+
+if (typeof module !== "undefined" && module.exports) {
+  module.exports = SearchWorker;
+} else if (typeof importScripts === "function") {
+  // Worker global scope: search.js declares its API as globals
+  importScripts("search.js", "../fuzzy-index.js");
+  var onSearchMessage = SearchWorker.create(
+    { setSearchIndex: setSearchIndex, setFuzzyIndex: setFuzzyIndex, searchSliced: searchSliced },
+    function (message, transfer) { self.postMessage(message, transfer || []); },
+    FuzzyIndex
+  );
+  self.onmessage = function (event) {
+    onSearchMessage(event.data);
+  };
+}
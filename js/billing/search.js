@@ -8,6 +8,12 @@
  *  4. AND logic (all tokens must match)
  *  5. Multi-token bonus (1.5×)
  *  6. Group by name prefix, sort groups by best score, cap, return
+ *  7. No results: retry once with misspelled tokens replaced by their
+ *     closest vocabulary term (needs setFuzzyIndex)
+ *
+ * In the app this runs inside js/billing/search-worker.js over the
+ * prebuilt data/billing/search-index.bin (setSearchIndex), scoring in
+ * slices via searchSliced so a newer query cancels a stale one.
  */
 
 // ─── Scoring weights ────────────────────────────────────────────────
@@ -25,9 +31,24 @@ const MAX_RESULTS = 50;
 const MIN_PREFIX_LENGTH = 2;
 const MIN_SUBSTRING_LENGTH = 3;
 
+// Codes scored between checks for a newer query (searchSliced)
+const SLICE_SIZE = 2000;
+
+// Binary index layout, see tools/search_index.py
+const INDEX_MAGIC = "EMSI";
+const INDEX_VERSION = 2;
+const INDEX_FIELD_COUNT = 4; // lower code, lower full name, lower terms, name
+const INDEX_TERM_SEPARATOR = "\n";
+const INDEX_HEADER_SIZE = 12; // magic, version, list count, digest
+
+// 32-bit FNV-1a, for searchIndexDigest
+const FNV_OFFSET = 0x811c9dc5;
+const FNV_PRIME = 0x01000193;
+
 // ─── State — populated by loadSearchData() ──────────────────────────
 let billingCodes = [];
 let diagnosticCodes = [];
+let fuzzyIndex = null; // optional, from FuzzyIndex.load()
 
 // ─── Data loading ───────────────────────────────────────────────────
 
@@ -60,6 +81,119 @@ async function loadSearchData(basePath = "data/billing/") {
   }
 }
 
+/**
+ * Decode data/billing/search-index.bin (built by tools/search_index.py)
+ * into [billing records, diagnostic records], each carrying the same
+ * precomputed fields loadSearchData adds to a code.
+ */
+function decodeSearchIndex(buffer) {
+  var view = new DataView(buffer);
+  var magic = String.fromCharCode(
+    view.getUint8(0), view.getUint8(1), view.getUint8(2), view.getUint8(3)
+  );
+  if (magic !== INDEX_MAGIC || view.getUint16(4, true) !== INDEX_VERSION) {
+    throw new Error("Unsupported search index");
+  }
+
+  var listCount = view.getUint16(6, true);
+  var position = INDEX_HEADER_SIZE;
+  var counts = [];
+  var total = 0;
+  for (var i = 0; i < listCount; i++) {
+    counts.push(view.getUint32(position, true));
+    total += counts[i];
+    position += 4;
+  }
+
+  var offsets = new Array(INDEX_FIELD_COUNT * total + 1);
+  for (var j = 0; j < offsets.length; j++) {
+    offsets[j] = view.getUint32(position, true);
+    position += 4;
+  }
+
+  // Offsets count UTF-16 code units, so they index the decoded string
+  var pool = new TextDecoder().decode(new Uint8Array(buffer, position));
+  function field(record, n) {
+    var k = record * INDEX_FIELD_COUNT + n;
+    return pool.substring(offsets[k], offsets[k + 1]);
+  }
+
+  var lists = [];
+  var record = 0;
+  counts.forEach(function (count) {
+    var records = [];
+    for (var r = 0; r < count; r++, record++) {
+      var lowerName = field(record, 1);
+      var terms = field(record, 2);
+      records.push({
+        name: field(record, 3),
+        _lowerCode: field(record, 0),
+        _lowerName: lowerName,
+        _lowerNameWords: lowerName.split(/\s+/),
+        _lowerSearchTerms: terms ? terms.split(INDEX_TERM_SEPARATOR) : [],
+      });
+    }
+    lists.push(records);
+  });
+  return lists;
+}
+
+/** A code's index fields, as record_fields in tools/search_index.py */
+function searchIndexFields(code) {
+  var name = code.name || "";
+  var fullName = code.subcategory ? code.subcategory + " " + name : name;
+  var terms = (code.search_terms || []).map(function (t) {
+    return String(t).toLowerCase().replace(/\n/g, " ");
+  });
+  return [
+    String(code.code || "").toLowerCase(),
+    fullName.toLowerCase(),
+    terms.join(INDEX_TERM_SEPARATOR),
+    name,
+  ];
+}
+
+/**
+ * Hash the index fields of code lists, as source_digest in
+ * tools/search_index.py does when it writes the index header.
+ */
+function searchIndexDigest(codeLists) {
+  var hash = FNV_OFFSET;
+  codeLists.forEach(function (codes) {
+    codes.forEach(function (code) {
+      searchIndexFields(code).forEach(function (text) {
+        for (var i = 0; i < text.length; i++) {
+          hash = Math.imul(hash ^ text.charCodeAt(i), FNV_PRIME);
+        }
+        hash = Math.imul(hash, FNV_PRIME); // zero code unit between fields
+      });
+    });
+  });
+  return hash >>> 0;
+}
+
+/**
+ * Search the codes of a prebuilt index (an ArrayBuffer) instead of
+ * loadSearchData's JSON. Returns the list sizes and the header's digest,
+ * so callers can check the index was built from the code lists they
+ * render (searchIndexDigest).
+ */
+function setSearchIndex(buffer) {
+  var lists = decodeSearchIndex(buffer);
+  billingCodes = lists[0];
+  diagnosticCodes = lists[1];
+  return {
+    billing: billingCodes.length,
+    diagnostic: diagnosticCodes.length,
+    digest: new DataView(buffer).getUint32(8, true),
+  };
+}
+
+/** Enable typo correction with a FuzzyIndex (js/fuzzy-index.js). */
+function setFuzzyIndex(index) {
+  fuzzyIndex = index;
+}
+
 // ─── Pipeline steps ─────────────────────────────────────────────────
 
 /** Step 1: Normalize input */
@@ -194,43 +328,27 @@ function groupedSort(results) {
   return sorted;
 }
 
-// ─── Main search function ───────────────────────────────────────────
-
-function search(query) {
-  if (!query || query.trim().length === 0) {
-    return { billing: [], diagnostic: [], billingTotal: 0, diagnosticTotal: 0 };
-  }
-
-  // Step 1: Normalize
-  var normalized = normalize(query);
-  if (normalized.length === 0) {
-    return { billing: [], diagnostic: [], billingTotal: 0, diagnosticTotal: 0 };
-  }
-
-  // Step 2: Tokenize
-  var tokens = tokenize(normalized);
-  if (tokens.length === 0) {
-    return { billing: [], diagnostic: [], billingTotal: 0, diagnosticTotal: 0 };
-  }
+/** Step 7: Replace unknown tokens with their closest vocabulary term. */
+function correctTokens(tokens) {
+  return tokens.map(function (token) {
+    if (fuzzyIndex.has(token)) return token;
+    var matches = fuzzyIndex.lookup(token);
+    return matches.length > 0 ? matches[0].term : token;
+  });
+}
 
-  // Step 3-5: Score all codes
-  var billingResults = [];
-  for (var i = 0; i < billingCodes.length; i++) {
-    var score = scoreCode(billingCodes[i], tokens);
+/** Step 3 over codes[start, end), appending matches to results. */
+function scoreRange(codes, tokens, start, end, results) {
+  for (var i = start; i < end; i++) {
+    var score = scoreCode(codes[i], tokens);
     if (score > 0) {
-      billingResults.push({ code: billingCodes[i], score: score, _dataIndex: i });
-    }
-  }
-
-  var diagnosticResults = [];
-  for (var j = 0; j < diagnosticCodes.length; j++) {
-    var score2 = scoreCode(diagnosticCodes[j], tokens);
-    if (score2 > 0) {
-      diagnosticResults.push({ code: diagnosticCodes[j], score: score2, _dataIndex: j });
+      results.push({ code: codes[i], score: score, _dataIndex: i });
     }
   }
+}
 
-  // Step 6: Group by name prefix, sort groups by best score, then flatten
+/** Step 6: Group by name prefix, sort groups by best score, flatten and cap */
+function rankResults(billingResults, diagnosticResults) {
   billingResults = groupedSort(billingResults);
   diagnosticResults = groupedSort(diagnosticResults);
 
@@ -242,16 +360,117 @@ function search(query) {
   };
 }
 
+/** Steps 3-6 over both code lists. */
+function scoreAll(tokens) {
+  var billingResults = [];
+  var diagnosticResults = [];
+  scoreRange(billingCodes, tokens, 0, billingCodes.length, billingResults);
+  scoreRange(diagnosticCodes, tokens, 0, diagnosticCodes.length, diagnosticResults);
+  return rankResults(billingResults, diagnosticResults);
+}
+
+/** Let queued messages (e.g. a newer query) run before the next slice */
+function pause() {
+  return new Promise(function (resolve) {
+    setTimeout(resolve, 0);
+  });
+}
+
+/** scoreAll in SLICE_SIZE slices; resolves null once isStale() is true */
+async function scoreAllSliced(tokens, isStale) {
+  var lists = [billingCodes, diagnosticCodes];
+  var results = [[], []];
+  for (var l = 0; l < lists.length; l++) {
+    for (var start = 0; start < lists[l].length; start += SLICE_SIZE) {
+      scoreRange(lists[l], tokens, start, Math.min(start + SLICE_SIZE, lists[l].length), results[l]);
+      await pause();
+      if (isStale()) return null;
+    }
+  }
+  return rankResults(results[0], results[1]);
+}
+
+// ─── Main search function ───────────────────────────────────────────
+
+function emptyResults() {
+  return { billing: [], diagnostic: [], billingTotal: 0, diagnosticTotal: 0 };
+}
+
+/** Steps 1-2; returns null for a query with nothing to search */
+function queryTokens(query) {
+  if (!query || query.trim().length === 0) return null;
+
+  // Step 1: Normalize
+  var normalized = normalize(query);
+  if (normalized.length === 0) return null;
+
+  // Step 2: Tokenize
+  var tokens = tokenize(normalized);
+  return tokens.length > 0 ? tokens : null;
+}
+
+/** Step 7 tokens when nothing matched as typed, or null for no retry */
+function typoRetryTokens(results, tokens) {
+  if (!fuzzyIndex || results.billingTotal + results.diagnosticTotal > 0) return null;
+  var corrected = correctTokens(tokens);
+  return corrected.join(" ") !== tokens.join(" ") ? corrected : null;
+}
+
+function search(query) {
+  var tokens = queryTokens(query);
+  if (!tokens) return emptyResults();
+
+  // Steps 3-6: Score, group and cap
+  var results = scoreAll(tokens);
+
+  // Step 7: Typo fallback — only when nothing matched as typed
+  var corrected = typoRetryTokens(results, tokens);
+  if (corrected) {
+    results = scoreAll(corrected);
+    results.corrected = corrected.join(" ");
+  }
+
+  return results;
+}
+
+/**
+ * search() that yields between slices of codes, so a caller handling
+ * messages (the search worker) sees newer queries while this one runs.
+ * Resolves null as soon as isStale() returns true.
+ */
+async function searchSliced(query, isStale) {
+  var tokens = queryTokens(query);
+  if (!tokens) return emptyResults();
+
+  var results = await scoreAllSliced(tokens, isStale);
+  if (!results) return null;
+
+  var corrected = typoRetryTokens(results, tokens);
+  if (corrected) {
+    results = await scoreAllSliced(corrected, isStale);
+    if (!results) return null;
+    results.corrected = corrected.join(" ");
+  }
+
+  return results;
+}
+
 // ─── Exports ────────────────────────────────────────────────────────
 // Support both ES modules and script tag usage
 if (typeof module !== "undefined" && module.exports) {
   module.exports = {
     loadSearchData,
+    decodeSearchIndex,
+    setSearchIndex,
+    searchIndexDigest,
+    setFuzzyIndex,
     search,
+    searchSliced,
     normalize,
     tokenize,
     scoreCode,
     bestTierScore,
     groupedSort,
+    correctTokens,
   };
 }
@@ -11,6 +11,10 @@
  *   weekend_holiday 08:00-24:00  (weekend or statutory holiday)
  *
  * Holiday computation follows the OHIP SOB H-code holiday definition.
+ * When data/billing/billing_calendar.json (built by
+ * tools/billing_calendar.py) is loaded, the period is found by binary
+ * search over its precomputed interval starts; outside the calendar's
+ * years the rules below are evaluated directly.
  */
 (function () {
   "use strict";
@@ -147,9 +151,53 @@
     return holidayCache[year].has(fmtDate(date));
   }
 
+  // ─── Precomputed calendar ────────────────────────────────────────
+
+  var calendarSchemes = null; // scheme name → { periods, starts, ids, end }
+
+  /** Wall-clock minutes since 1970-01-01, ignoring time zone and DST */
+  function wallMinutes(date) {
+    return Date.UTC(
+      date.getFullYear(), date.getMonth(), date.getDate(),
+      date.getHours(), date.getMinutes()
+    ) / 60000;
+  }
+
+  /** Decode a scheme's delta-encoded interval starts */
+  function decodeScheme(scheme) {
+    var starts = new Array(scheme.deltas.length);
+    var total = scheme.base;
+    for (var i = 0; i < scheme.deltas.length; i++) {
+      total += scheme.deltas[i];
+      starts[i] = total;
+    }
+    return { periods: scheme.periods, starts: starts, ids: scheme.period_ids, end: scheme.end };
+  }
+
+  /** Period at a date from the calendar, or null when not covered */
+  function lookupPeriod(name, date) {
+    var scheme = calendarSchemes && calendarSchemes[name];
+    if (!scheme) return null;
+    var t = wallMinutes(date);
+    var starts = scheme.starts;
+    if (t < starts[0] || t >= scheme.end) return null;
+    // Last start <= t
+    var lo = 0;
+    var hi = starts.length - 1;
+    while (lo < hi) {
+      var mid = (lo + hi + 1) >> 1;
+      if (starts[mid] <= t) lo = mid;
+      else hi = mid - 1;
+    }
+    return scheme.periods[scheme.ids[lo]];
+  }
+
   // ─── Time period detection ───────────────────────────────────────
 
   function detectTimePeriod(date) {
+    var period = lookupPeriod("assessment", date);
+    if (period) return period;
+
     var hour = date.getHours();
 
     // Night: 00:00-07:59, any day
@@ -164,11 +212,34 @@
     return "weekday_evening";
   }
 
+  /** On-call scenario (oncall_tables.json key); night ends at 07:00 */
+  function detectOnCallScenario(date) {
+    var period = lookupPeriod("oncall", date);
+    if (period) return period;
+
+    var hour = date.getHours();
+    if (hour < 7) return "night";
+    var day = date.getDay();
+    if (day === 0 || day === 6 || isHoliday(date)) return "weekend_holiday";
+    if (hour < 17) return "weekday_daytime";
+    return "weekday_evening";
+  }
+
   // ─── Public API ──────────────────────────────────────────────────
 
   App.timePeriod = null;         // { id, label }
   App.timeHighlightCodes = null; // Set of code strings
 
+  /** Install the precomputed calendar artifact (null clears it) */
+  App.setBillingCalendar = function (artifact) {
+    calendarSchemes = null;
+    if (!artifact || !artifact.schemes) return;
+    calendarSchemes = {};
+    Object.keys(artifact.schemes).forEach(function (name) {
+      calendarSchemes[name] = decodeScheme(artifact.schemes[name]);
+    });
+  };
+
   /** Detect current time period and build the active code set */
   App.detectTimePeriod = function (dateOverride) {
     var now = dateOverride || new Date();
@@ -177,6 +248,11 @@
     App.timeHighlightCodes = new Set(TIME_PERIOD_CODES[id] || []);
   };
 
+  /** Current on-call calculator scenario key */
+  App.detectOnCallScenario = function (dateOverride) {
+    return detectOnCallScenario(dateOverride || new Date());
+  };
+
   /** Check if a code should be highlighted for the current time period */
   App.isTimeHighlighted = function (codeStr) {
     return App.timeHighlightCodes != null && App.timeHighlightCodes.has(codeStr);
@@ -0,0 +1,123 @@
+/**
+ * EM Hub — Typo-tolerant term lookup
+ *
+ * Loads data/fuzzy-index.json (built by tools/fuzzy_index.py): the sorted
+ * vocabulary of every word the search engines match against, plus a
+ * padded-trigram → term-id posting list. lookup(word) returns the known
+ * words within the edit budget without scanning the vocabulary:
+ *
+ *  1. Count shared trigrams per candidate term via the posting lists
+ *  2. Drop candidates failing the length and q-gram count bounds
+ *  3. Verify survivors with Levenshtein distance
+ *
+ * Edit budget mirrors SearchManager.fuzzyMatches: none under 5 chars,
+ * 1 edit for 5–6 chars, 2 for longer words.
+ */
+var FuzzyIndex = (function () {
+  "use strict";
+
+  var PAD_START = "  ";
+  var PAD_END = " ";
+
+  function trigrams(word) {
+    var padded = PAD_START + word + PAD_END;
+    var grams = new Set();
+    for (var i = 0; i + 3 <= padded.length; i++) {
+      grams.add(padded.substring(i, i + 3));
+    }
+    return grams;
+  }
+
+  function allowedDistance(word, minLength) {
+    if (word.length < minLength) return 0;
+    return word.length <= 6 ? 1 : 2;
+  }
+
+  /** Levenshtein distance with early exit once every cell exceeds max. */
+  function levenshtein(a, b, max) {
+    var previous = [];
+    for (var j = 0; j <= b.length; j++) previous.push(j);
+    for (var i = 1; i <= a.length; i++) {
+      var current = [i];
+      var rowMin = i;
+      for (var k = 1; k <= b.length; k++) {
+        var cost = a.charCodeAt(i - 1) === b.charCodeAt(k - 1) ? 0 : 1;
+        var value = Math.min(previous[k] + 1, current[k - 1] + 1, previous[k - 1] + cost);
+        current.push(value);
+        if (value < rowMin) rowMin = value;
+      }
+      if (rowMin > max) return max + 1;
+      previous = current;
+    }
+    return previous[b.length];
+  }
+
+  /**
+   * Wrap a parsed artifact. The returned index exposes:
+   *  - has(word): true if word is in the vocabulary
+   *  - lookup(word, maxDistance?): [{ term, distance }], closest first
+   */
+  function create(artifact) {
+    var terms = artifact.terms;
+    var postings = artifact.trigrams;
+    var minLength = artifact.min_length;
+    var termSet = new Set(terms);
+    var gramCounts = new Array(terms.length); // lazily filled |G(term)|
+
+    function lookup(word, maxDistance) {
+      word = word.toLowerCase();
+      var budget = maxDistance == null ? allowedDistance(word, minLength) : maxDistance;
+      if (budget <= 0) return [];
+
+      var grams = trigrams(word);
+      var shared = new Map();
+      grams.forEach(function (gram) {
+        var ids = postings[gram];
+        if (!ids) return;
+        for (var i = 0; i < ids.length; i++) {
+          shared.set(ids[i], (shared.get(ids[i]) || 0) + 1);
+        }
+      });
+
+      var matches = [];
+      shared.forEach(function (count, id) {
+        var term = terms[id];
+        if (Math.abs(term.length - word.length) > budget) return;
+        if (gramCounts[id] === undefined) gramCounts[id] = trigrams(term).size;
+        // Each edit destroys at most three trigrams
+        if (count < Math.max(grams.size, gramCounts[id]) - 3 * budget) return;
+        var distance = levenshtein(word, term, budget);
+        if (distance <= budget) matches.push({ term: term, distance: distance });
+      });
+
+      matches.sort(function (a, b) {
+        return a.distance - b.distance || (a.term < b.term ? -1 : a.term > b.term ? 1 : 0);
+      });
+      return matches;
+    }
+
+    return {
+      size: terms.length,
+      has: function (word) { return termSet.has(word); },
+      lookup: lookup,
+    };
+  }
+
+  function load(url) {
+    return fetch(url).then(function (res) {
+      if (!res.ok) throw new Error("Failed to load " + url + ": " + res.status);
+      return res.json();
+    }).then(create);
+  }
+
+  return {
+    create: create,
+    load: load,
+    trigrams: trigrams,
+    levenshtein: levenshtein,
+  };
+})();
+
+if (typeof module !== "undefined" && module.exports) {
+  module.exports = FuzzyIndex;
+}
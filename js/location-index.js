@@ -0,0 +1,121 @@
+/**
+ * EM Hub — Offline nearest-hospital lookup
+ *
+ * Loads data/location-index.json (built by tools/location_index.py): the
+ * hospitals from Locations.json that could be placed by postal code,
+ * stored as an implicit k-d tree of unit vectors, plus the centroid of
+ * every forward sortation area (FSA, e.g. "K1H").
+ *
+ * Tree layout: the node for a range [lo, hi) sits at mid = (lo + hi) >> 1
+ * and splits on axis depth % 3; subtrees are [lo, mid) and [mid + 1, hi).
+ * Chord distance on the unit sphere orders sites like great-circle
+ * distance, so nearest-k search prunes exactly with no projection.
+ */
+var LocationIndex = (function () {
+  "use strict";
+
+  var EARTH_RADIUS_KM = 6371;
+
+  function unitVector(lat, lon) {
+    var phi = lat * Math.PI / 180;
+    var lam = lon * Math.PI / 180;
+    return [Math.cos(phi) * Math.cos(lam), Math.cos(phi) * Math.sin(lam), Math.sin(phi)];
+  }
+
+  function chordToKm(chord) {
+    return 2 * EARTH_RADIUS_KM * Math.asin(Math.min(1, chord / 2));
+  }
+
+  /** "k1h 8l6", "K1H8L6" or "k1h" → "K1H"; null if not a postal code */
+  function parseFsa(text) {
+    var match = /^\s*([a-z]\d[a-z])\s?(\d[a-z]\d)?\s*$/i.exec(text || "");
+    return match ? match[1].toUpperCase() : null;
+  }
+
+  /**
+   * Wrap a parsed artifact. The returned index exposes:
+   *  - locate(fsa): [lat, lon] centroid or null
+   *  - nearest(lat, lon, k, maxKm?): [{ name, fsa, km }], closest first
+   *  - nearestToFsa(fsa, k, maxKm?): nearest() from an FSA centroid
+   */
+  function create(artifact) {
+    var locations = artifact.locations;
+    var coords = artifact.coords;
+    var fsas = artifact.fsas;
+
+    function nearest(lat, lon, k, maxKm) {
+      var target = unitVector(lat, lon);
+      var limit = maxKm == null ? Infinity : 2 * Math.sin(maxKm / (2 * EARTH_RADIUS_KM));
+      var best = []; // { d2, pos } sorted ascending, at most k
+
+      function bound() {
+        return best.length < k ? limit * limit : best[best.length - 1].d2;
+      }
+
+      function offer(d2, pos) {
+        var i = best.length;
+        while (i > 0 && best[i - 1].d2 > d2) i--;
+        best.splice(i, 0, { d2: d2, pos: pos });
+        if (best.length > k) best.pop();
+      }
+
+      function visit(lo, hi, depth) {
+        if (lo >= hi) return;
+        var mid = (lo + hi) >> 1;
+        var base = 3 * mid;
+        var dx = coords[base] - target[0];
+        var dy = coords[base + 1] - target[1];
+        var dz = coords[base + 2] - target[2];
+        var d2 = dx * dx + dy * dy + dz * dz;
+        if (d2 <= bound()) offer(d2, mid);
+
+        var axis = depth % 3;
+        var diff = target[axis] - coords[base + axis];
+        if (diff < 0) {
+          visit(lo, mid, depth + 1);
+          if (diff * diff <= bound()) visit(mid + 1, hi, depth + 1);
+        } else {
+          visit(mid + 1, hi, depth + 1);
+          if (diff * diff <= bound()) visit(lo, mid, depth + 1);
+        }
+      }
+
+      if (k > 0) visit(0, locations.length, 0);
+      return best.map(function (entry) {
+        var loc = locations[entry.pos];
+        return { name: loc.name, fsa: loc.fsa, km: chordToKm(Math.sqrt(entry.d2)) };
+      });
+    }
+
+    function locate(fsa) {
+      return Object.prototype.hasOwnProperty.call(fsas, fsa) ? fsas[fsa] : null;
+    }
+
+    return {
+      size: locations.length,
+      locate: locate,
+      nearest: nearest,
+      nearestToFsa: function (fsa, k, maxKm) {
+        var centroid = locate(fsa);
+        return centroid ? nearest(centroid[0], centroid[1], k, maxKm) : [];
+      },
+    };
+  }
+
+  function load(url) {
+    return fetch(url).then(function (res) {
+      if (!res.ok) throw new Error("Failed to load " + url + ": " + res.status);
+      return res.json();
+    }).then(create);
+  }
+
+  return {
+    create: create,
+    load: load,
+    parseFsa: parseFsa,
+  };
+})();
+
+if (typeof module !== "undefined" && module.exports) {
+  module.exports = LocationIndex;
+}
@@ -12,7 +12,8 @@ const CONFIG = {
   storage: {
     locations: "rx_custom_locations",
     currentLocation: "rx_current_location",
-    provider: "edprescriptions_provider"
+    provider: "edprescriptions_provider",
+    site: "rx_site"
   }
 };
 
@@ -22,6 +23,9 @@ const FALLBACK_LOCATION = { name: "Michael Garron Hospital (MGH)", address: "825
 // Will be populated from Locations.json
 let BASE_LOCATIONS = [FALLBACK_LOCATION];
 
+// Sites listed when the location search is a postal code or FSA
+const NEAREST_LOCATION_COUNT = 10;
+
 const NESTED_SPECIALTIES = ["ENT", "Substance Use"];
 
 // Population items for Column 1
@@ -284,7 +288,22 @@ const ConfirmModal = {
 // UTILITY FUNCTIONS
 // ============================================================================
 
+// Short route/frequency abbreviations that need word boundary matching
+// to prevent false positives (e.g., "im" matching within "time")
+const HIGHLIGHT_WORD_BOUNDARY_TERMS = new Set([
+  // Routes (2-3 char abbreviations)
+  'po', 'im', 'iv', 'sc', 'sq', 'sl', 'pr', 'pv', 'td', 'in', 'id', 'io', 'it', 'ia',
+  'top', 'neb', 'inh', 'ng', 'gt', 'ad', 'as', 'au', 'od', 'os', 'ou',
+  // Frequencies (short abbreviations)
+  'bid', 'tid', 'qid', 'qd', 'prn', 'qhs', 'qam'
+]);
+
+// Highlighted texts remembered per term list (see Utils.getHighlighter).
+const HIGHLIGHT_RESULT_CACHE_SIZE = 2000;
+
 const Utils = {
+  highlighter: null, // last compiled term list, see getHighlighter()
+
   isMobile() {
     return window.matchMedia('(max-width: 768px)').matches;
   },
@@ -370,71 +389,80 @@ const Utils = {
       return Utils.escapeHtml(cleanText);
     }
 
-    // Short route/frequency abbreviations that need word boundary matching
-    // to prevent false positives (e.g., "im" matching within "time")
-    const wordBoundaryTerms = new Set([
-      // Routes (2-3 char abbreviations)
-      'po', 'im', 'iv', 'sc', 'sq', 'sl', 'pr', 'pv', 'td', 'in', 'id', 'io', 'it', 'ia',
-      'top', 'neb', 'inh', 'ng', 'gt', 'ad', 'as', 'au', 'od', 'os', 'ou',
-      // Frequencies (short abbreviations)
-      'bid', 'tid', 'qid', 'qd', 'prn', 'qhs', 'qam'
-    ]);
-
-    // Extract numeric values from terms for range matching
-    const numericTerms = terms
-      .map(t => parseFloat(t))
-      .filter(n => !isNaN(n));
-
-    // Sort terms by length descending to match longer terms first
-    const sortedTerms = [...terms].sort((a, b) => b.length - a.length);
-
-    // Build pattern for range matching (e.g., "7-10" or "7 to 10")
-    const rangePattern = /(\d+\.?\d*)\s*[-to]+\s*(\d+\.?\d*)/gi;
-
-    // First pass: find all ranges that contain any of our numeric search values
-    const rangesToHighlight = new Set();
-    let rangeMatch;
-    while ((rangeMatch = rangePattern.exec(cleanText)) !== null) {
-      const rangeMin = parseFloat(rangeMatch[1]);
-      const rangeMax = parseFloat(rangeMatch[2]);
-      // Check if any numeric term falls within this range
-      for (const numVal of numericTerms) {
-        if (numVal >= rangeMin && numVal <= rangeMax) {
-          rangesToHighlight.add(rangeMatch[0]);
-          break;
-        }
+    const highlighter = Utils.getHighlighter(terms);
+    let html = highlighter.results.get(cleanText);
+    if (html === undefined) {
+      html = Utils.applyHighlighter(highlighter, cleanText);
+      if (highlighter.results.size >= HIGHLIGHT_RESULT_CACHE_SIZE) {
+        highlighter.results.clear();
       }
+      highlighter.results.set(cleanText, html);
     }
+    return html;
+  },
 
-    // Combine direct terms with ranges to highlight
-    const allHighlightPatterns = [...sortedTerms];
-    for (const range of rangesToHighlight) {
-      allHighlightPatterns.push(range);
-    }
-
-    if (allHighlightPatterns.length === 0) {
-      return Utils.escapeHtml(cleanText);
+  /**
+   * Compiled highlighter for a term list. A result list highlights several
+   * fields of every result with the same terms, so the sorted terms and the
+   * combined regex are built once per term list (not per field), and the
+   * HTML for a given text is remembered while the terms stay the same.
+   */
+  getHighlighter(terms) {
+    const key = terms.join('\u0000');
+    if (!Utils.highlighter || Utils.highlighter.key !== key) {
+      // Sort terms by length descending to match longer terms first
+      const sortedTerms = [...terms].sort((a, b) => b.length - a.length);
+      Utils.highlighter = {
+        key,
+        sortedTerms,
+        // Numeric values from terms, for range matching
+        numericTerms: terms.map(t => parseFloat(t)).filter(n => !isNaN(n)),
+        pattern: Utils.buildHighlightPattern(sortedTerms),
+        lowerTerms: new Set(sortedTerms.map(t => t.toLowerCase())),
+        results: new Map() // text -> highlighted HTML
+      };
     }
+    return Utils.highlighter;
+  },
 
-    // Sort again by length to match longer patterns first
-    allHighlightPatterns.sort((a, b) => b.length - a.length);
-
-    // Build pattern - use word boundaries for short route/frequency terms
-    const patternParts = allHighlightPatterns.map(term => {
+  // Build pattern - use word boundaries for short route/frequency terms
+  buildHighlightPattern(patterns) {
+    const patternParts = patterns.map(term => {
       const escaped = Utils.escapeRegex(term);
-      if (wordBoundaryTerms.has(term.toLowerCase())) {
+      if (HIGHLIGHT_WORD_BOUNDARY_TERMS.has(term.toLowerCase())) {
         return `\\b${escaped}\\b`;
       }
       return escaped;
     });
+    return new RegExp(`(${patternParts.join('|')})`, 'gi');
+  },
 
-    const finalPattern = new RegExp(`(${patternParts.join('|')})`, 'gi');
-    const parts = cleanText.split(finalPattern);
-
-    const allHighlightLower = new Set(allHighlightPatterns.map(p => p.toLowerCase()));
+  applyHighlighter(highlighter, cleanText) {
+    let { pattern, lowerTerms } = highlighter;
+
+    // Ranges in this text (e.g. "7-10" or "7 to 10") that contain any of
+    // the numeric search values are highlighted whole
+    if (highlighter.numericTerms.length > 0) {
+      const rangePattern = /(\d+\.?\d*)\s*[-to]+\s*(\d+\.?\d*)/gi;
+      const rangesToHighlight = new Set();
+      let rangeMatch;
+      while ((rangeMatch = rangePattern.exec(cleanText)) !== null) {
+        const rangeMin = parseFloat(rangeMatch[1]);
+        const rangeMax = parseFloat(rangeMatch[2]);
+        if (highlighter.numericTerms.some(numVal => numVal >= rangeMin && numVal <= rangeMax)) {
+          rangesToHighlight.add(rangeMatch[0]);
+        }
+      }
+      if (rangesToHighlight.size > 0) {
+        const allHighlightPatterns = [...highlighter.sortedTerms, ...rangesToHighlight]
+          .sort((a, b) => b.length - a.length);
+        pattern = Utils.buildHighlightPattern(allHighlightPatterns);
+        lowerTerms = new Set(allHighlightPatterns.map(p => p.toLowerCase()));
+      }
+    }
 
-    return parts.map(part => {
-      if (allHighlightLower.has(part.toLowerCase())) {
+    return cleanText.split(pattern).map(part => {
+      if (lowerTerms.has(part.toLowerCase())) {
         return `<span class="highlight">${Utils.escapeHtml(part)}</span>`;
       }
       return Utils.escapeHtml(part);
@@ -589,17 +617,31 @@ const MedicationUtils = {
 const ADULT_ONLY_SPECIALTIES = new Set(["Cardiac & Heme", "OBGYN", "Psych", "STI", "Substance Use"]);
 
 const NavigationDataHelper = {
+  // Prebuilt population -> specialty -> subcategory counts from the catalog.
+  // When set, folder structure and counts are answered without scanning meds,
+  // so folders render before the medication chunks have loaded.
+  counts: null,
+
+  setCatalog(catalog) {
+    this.counts = catalog ? catalog.counts : null;
+  },
+
   /**
    * Get ordered specialties for a population, filtered to those with ≥1 med.
    * Pediatric mode hides adult-only specialties entirely.
    */
   getSpecialtiesForPopulation(medications, population) {
     const validSpecialties = new Set();
-    for (const med of medications) {
-      const pop = (med.population || "").trim();
-      const spec = Utils.normalize(med.specialty);
-      if (pop === population && spec) {
-        validSpecialties.add(spec);
+    if (this.counts) {
+      const specs = this.counts[population]?.specialties || {};
+      for (const spec of Object.keys(specs)) validSpecialties.add(spec);
+    } else {
+      for (const med of medications) {
+        const pop = (med.population || "").trim();
+        const spec = Utils.normalize(med.specialty);
+        if (pop === population && spec) {
+          validSpecialties.add(spec);
+        }
       }
     }
     let ordered = SPECIALTY_ORDER.filter(s => validSpecialties.has(s));
@@ -630,6 +672,11 @@ const NavigationDataHelper = {
    */
   getSubcategories(medications, population, specialty) {
     const subs = new Set();
+    if (this.counts) {
+      const subCounts = this.counts[population]?.specialties?.[specialty]?.subcategories || {};
+      const order = SORT_ORDER.subcategory;
+      return Object.keys(subCounts).sort((a, b) => (order[a] || 99) - (order[b] || 99));
+    }
     for (const med of medications) {
       if ((med.population || "").trim() !== population) continue;
       if (Utils.normalize(med.specialty) !== specialty) continue;
@@ -655,6 +702,14 @@ const NavigationDataHelper = {
    * Count meds for a population (total), a specialty, or a subcategory.
    */
   countMeds(medications, population, specialty, subcategory) {
+    if (this.counts) {
+      const popNode = this.counts[population];
+      if (!popNode) return 0;
+      if (!specialty) return popNode.total;
+      const specNode = popNode.specialties[specialty];
+      if (!specNode) return 0;
+      return subcategory ? (specNode.subcategories[subcategory] || 0) : specNode.total;
+    }
     if (population === "Non-Med") {
       return this.getNonMedMedications(medications).length;
     }
@@ -843,6 +898,13 @@ class LocationManager {
   constructor(state) {
     this.state = state;
     this.locationsLoaded = false;
+    this.locationIndex = null;
+    this.locationIndexUrl = null; // set by build.py only when the index was built
+  }
+
+  /** Optional spatial index (js/location-index.js) for postal code search */
+  setLocationIndex(index) {
+    this.locationIndex = index;
   }
 
   async load() {
@@ -858,6 +920,7 @@ class LocationManager {
       if (data && Array.isArray(data.locations) && data.locations.length > 0) {
         BASE_LOCATIONS = data.locations;
         this.locationsLoaded = true;
+        this.locationIndexUrl = data.index_url || null;
       } else {
         console.warn("Location data is empty or missing, using fallback");
         BASE_LOCATIONS = [FALLBACK_LOCATION];
@@ -951,6 +1014,10 @@ class LocationManager {
       return all;
     }
 
+    // Postal code or FSA: nearest sites first
+    const nearby = this.searchNearby(query, all);
+    if (nearby) return nearby;
+
     // Normalize search term: lowercase, trim, remove periods, strip accents, normalize delimiters
     const searchTerm = this.normalizeLocationText(query);
 
@@ -963,6 +1030,18 @@ class LocationManager {
     return matches;
   }
 
+  searchNearby(query, all) {
+    if (!this.locationIndex) return null;
+    const fsa = LocationIndex.parseFsa(query);
+    if (!fsa || !this.locationIndex.locate(fsa)) return null;
+
+    const byName = new Map(all.map(loc => [loc.name, loc]));
+    return this.locationIndex
+      .nearestToFsa(fsa, NEAREST_LOCATION_COUNT)
+      .map(hit => byName.get(hit.name))
+      .filter(Boolean);
+  }
+
   getCurrentLocation() {
     const all = this.getAllLocations();
     return all.find(loc => loc.name === this.state.currentLocationName) || FALLBACK_LOCATION;
@@ -1229,15 +1308,116 @@ class ProviderManager {
 // DATA LOADER
 // ============================================================================
 
+/**
+ * Loads the prescription catalog (counts + chunk list, set synchronously by
+ * prescription-catalog.js) and fetches full medication records per specialty
+ * on demand. Chunk requests are memoized, so each chunk is fetched once.
+ * With a site selected, its overlay (see js/site-overlay.js) is applied to
+ * each chunk as it loads and its merged counts replace the catalog's.
+ */
 class DataLoader {
+  constructor() {
+    this.catalog = null;
+    this.overlay = null;
+    this.chunkRequests = new Map(); // specialty -> Promise<meds[]>
+    this.failedSpecialties = []; // chunks the last loadMedications() could not load
+  }
+
+  loadCatalog() {
+    const data = typeof PRESCRIPTION_CATALOG !== "undefined" ? PRESCRIPTION_CATALOG : null;
+    if (data && Array.isArray(data.chunks) && data.counts) {
+      this.catalog = data;
+      return data;
+    }
+    console.error("Prescription catalog is missing or invalid");
+    return null;
+  }
+
+  /**
+   * The catalog site to apply: ?site=<id> selects and remembers a site,
+   * ?site= forgets it; otherwise the remembered site, if still listed.
+   */
+  selectedSite() {
+    const sites = this.catalog?.sites || [];
+    if (sites.length === 0) return null;
+    let id = null;
+    try {
+      const param = new URLSearchParams(window.location.search).get("site");
+      if (param === null) {
+        id = localStorage.getItem(CONFIG.storage.site);
+      } else if (param) {
+        localStorage.setItem(CONFIG.storage.site, param);
+        id = param;
+      } else {
+        localStorage.removeItem(CONFIG.storage.site);
+      }
+    } catch (e) {
+      console.warn("Could not read the selected site:", e);
+    }
+    return sites.find(s => s.id === id) || null;
+  }
+
+  /** Fetch the selected site's overlay before any chunk loads. */
+  async loadSiteOverlay() {
+    const site = this.selectedSite();
+    if (!site) return null;
+    try {
+      this.overlay = await SiteOverlay.load(`${site.url}?v=${site.revision}`);
+      this.catalog = { ...this.catalog, counts: this.overlay.counts };
+    } catch (error) {
+      console.warn(`Overlay for ${site.site} unavailable - using the shared formulary:`, error);
+      this.overlay = null;
+    }
+    return this.overlay;
+  }
+
+  loadSpecialty(specialty) {
+    if (!this.chunkRequests.has(specialty)) {
+      const chunk = (this.catalog?.chunks || []).find(c => c.specialty === specialty);
+      const request = (!chunk
+        ? Promise.resolve([])
+        : fetch(`${chunk.url}?v=${chunk.revision}`)
+            .then(res => {
+              if (!res.ok) throw new Error(`Failed to load ${chunk.url}: ${res.status}`);
+              return res.json();
+            })
+            .then(data => (Array.isArray(data.meds) ? data.meds : [])))
+        .then(meds => (this.overlay ? SiteOverlay.apply(meds, this.overlay.ops[specialty]) : meds))
+        .catch(error => {
+          this.chunkRequests.delete(specialty); // allow a retry
+          throw error;
+        });
+      this.chunkRequests.set(specialty, request);
+    }
+    return this.chunkRequests.get(specialty);
+  }
+
+  /**
+   * Load every chunk; resolves to all meds in original catalog order.
+   * A failed chunk is retried once; specialties that still fail are left
+   * out and listed in failedSpecialties, so the rest stay usable.
+   */
   async loadMedications() {
+    this.failedSpecialties = [];
     try {
-      const data = typeof PRESCRIPTION_DATA !== "undefined" ? PRESCRIPTION_DATA : null;
-      if (data && Array.isArray(data.meds)) {
-        return data.meds;
+      const catalog = this.catalog || this.loadCatalog();
+      if (!catalog) return [];
+      // Specialties only a site adds come after the shared ones
+      const specialties = catalog.chunks.map(c => c.specialty);
+      for (const specialty of Object.keys(this.overlay?.ops || {})) {
+        if (!specialties.includes(specialty)) specialties.push(specialty);
       }
-      console.error("Prescription data is missing or invalid");
-      return [];
+      // loadSpecialty forgets a failed request, so the retry refetches
+      const results = await Promise.allSettled(
+        specialties.map(s => this.loadSpecialty(s).catch(() => this.loadSpecialty(s)))
+      );
+      const parts = results.map((result, i) => {
+        if (result.status === "fulfilled") return result.value;
+        console.error(`Failed to load ${specialties[i]} medications:`, result.reason);
+        this.failedSpecialties.push(specialties[i]);
+        return [];
+      });
+      return parts.flat();
     } catch (error) {
       console.error("Failed to load medications:", error);
       return [];
@@ -1254,7 +1434,8 @@ class DataLoader {
  * - Weighted scoring (med name, brand, indication, route, frequency, numeric, notes)
  * - Strict route/frequency filtering
  * - Numeric parsing with range matching and g<->mg conversion
- * - Typo tolerance (Levenshtein) for medication names and indications
+ * - Typo tolerance (Levenshtein) for medication names and indications,
+ *   accelerated by the prebuilt FuzzyIndex when it has loaded
  * - Delimiter parity (space/hyphen/slash treated identically)
  * - Plural stripping for units and timeframes only
  * - Dynamic route-to-keyword pivot for live typing
@@ -1264,9 +1445,36 @@ class DataLoader {
 class SearchManager {
   constructor(medications) {
     this.medications = medications;
+    this.fuzzyIndex = null; // optional FuzzyIndex, see setFuzzyIndex()
+    this.fuzzyCache = new Map(); // query word -> Set of terms within budget
+    this.fieldsCache = new WeakMap(); // med -> normalized searchable fields
+    // Whether indications are searched; null follows providerManager.isOwner()
+    // (the search worker has no providerManager and is told per query)
+    this.searchIndications = null;
     this.initializeMaps();
   }
 
+  /**
+   * Use a prebuilt FuzzyIndex for typo matching. Target words in its
+   * vocabulary are checked against one trigram lookup per query word
+   * instead of a Levenshtein DP per medication; other words still use
+   * the DP, so results are unchanged.
+   */
+  setFuzzyIndex(index) {
+    this.fuzzyIndex = index;
+    this.fuzzyCache.clear();
+  }
+
+  /** Vocabulary terms within qWord's edit budget (memoized per search). */
+  fuzzyTermsFor(qWord) {
+    let terms = this.fuzzyCache.get(qWord);
+    if (!terms) {
+      terms = new Set(this.fuzzyIndex.lookup(qWord).map(match => match.term));
+      this.fuzzyCache.set(qWord, terms);
+    }
+    return terms;
+  }
+
   // ============================================================================
   // CONFIGURATION MAPS
   // ============================================================================
@@ -1761,6 +1969,23 @@ class SearchManager {
     return numerics;
   }
 
+  /**
+   * Dose numerics for a medication. Uses the dose_range parsed at build
+   * time when present, so scoring skips the regex pass per query; falls
+   * back to extracting from dose_text.
+   */
+  getDoseNumerics(med) {
+    const range = med.dose_range;
+    if (!range) return this.extractNumericsFromText(med.dose_text, 'dose');
+    const unit = this.normalizeUnit(range.unit.split(' ')[0]);
+    const isDuration = ['day', 'week', 'hour', 'month', 'year'].includes(unit);
+    if (range.min !== range.max) {
+      return [{ value: null, unit: unit, isRange: true, rangeMin: range.min, rangeMax: range.max,
+                fieldType: 'dose', isDuration: isDuration }];
+    }
+    return [{ value: range.min, unit: unit, isRange: false, fieldType: 'dose', isDuration: isDuration }];
+  }
+
   /**
    * Check if a query numeric matches a field numeric
    * Handles exact match, range containment, g<->mg conversion, and day<->week conversion
@@ -2060,6 +2285,13 @@ class SearchManager {
         // Words 5-6 chars: distance 1
         // Words 7+ chars: distance 2
         if (qWord.length >= 5) {
+          if (maxDistance === null && this.fuzzyIndex && this.fuzzyIndex.has(tWord)) {
+            if (this.fuzzyTermsFor(qWord).has(tWord)) {
+              foundMatch = true;
+              break;
+            }
+            continue;
+          }
           const allowedDist = maxDistance !== null ? maxDistance : (qWord.length <= 6 ? 1 : 2);
           const dist = this.levenshteinDistance(qWord, tWord);
           if (dist <= allowedDist) {
@@ -2102,6 +2334,20 @@ class SearchManager {
     };
   }
 
+  /**
+   * Searchable fields for a catalog medication, normalized once. Catalog
+   * records are never mutated (the cart works on clones), so the fields
+   * stay valid and each keystroke skips re-normalizing every record.
+   */
+  getSearchableFields(med) {
+    let fields = this.fieldsCache.get(med);
+    if (!fields) {
+      fields = this.buildSearchableFields(med);
+      this.fieldsCache.set(med, fields);
+    }
+    return fields;
+  }
+
   // ============================================================================
   // SCORING
   // ============================================================================
@@ -2111,8 +2357,8 @@ class SearchManager {
    * Returns { score, matched, failed }
    */
   scoreMedication(med, tokens) {
-    const fields = this.buildSearchableFields(med);
-    const searchIndications = window.providerManager?.isOwner();
+    const fields = this.getSearchableFields(med);
+    const searchIndications = this.searchIndications ?? window.providerManager?.isOwner();
     let score = 0;
     const matchedTokens = new Set();
     let routeFilterFailed = false;
@@ -2127,7 +2373,7 @@ class SearchManager {
 
     // Extract numerics from medication fields SEPARATELY
     // Tag each with its source field for proper matching
-    const doseNumerics = this.extractNumericsFromText(med.dose_text, 'dose');
+    const doseNumerics = this.getDoseNumerics(med);
     const durationNumerics = this.extractNumericsFromText(med.duration, 'duration');
 
     // Population synonym lists for filtering by adult/pediatric
@@ -2400,6 +2646,7 @@ class SearchManager {
 
     // Parse query into tokens
     const tokens = this.tokenizeQuery(query);
+    this.fuzzyCache.clear();
 
     if (tokens.length === 0) {
       return { adult: [], pediatric: [], other: [] };
@@ -2644,6 +2891,102 @@ class SearchManager {
   }
 }
 
+// ============================================================================
+// SEARCH WORKER CLIENT
+// ============================================================================
+
+/**
+ * Runs SearchManager in js/prescriptions/search-worker.js. The worker
+ * gets its own copy of the searchable medications (setMedications) and
+ * answers with ids into that copy, which are mapped back to the page's
+ * records here.
+ *
+ * query() resolves with { adult, pediatric, other } for the newest query
+ * only: a newer query or setMedications() resolves the outstanding one
+ * with null. If the worker fails, onFail is called once and the
+ * outstanding query and any later ones reject.
+ */
+class SearchWorkerClient {
+  /** Start the worker, or return null where workers are unavailable */
+  static start(url, onFail) {
+    if (typeof Worker === "undefined") return null;
+    try {
+      return new SearchWorkerClient(new Worker(url), onFail);
+    } catch (error) {
+      console.warn("Search worker unavailable:", error);
+      return null;
+    }
+  }
+
+  constructor(worker, onFail) {
+    this.worker = worker;
+    this.onFail = onFail;
+    this.meds = [];
+    this.revision = 0;
+    this.seq = 0;
+    this.waiting = null; // { resolve, reject } of the outstanding query
+    this.failure = null; // set once the worker has failed
+
+    worker.onmessage = event => this.onReply(event.data);
+    worker.onerror = event => this.fail(new Error(event.message || "Search worker failed"));
+  }
+
+  setMedications(meds) {
+    if (this.failure) return;
+    this.supersede();
+    this.meds = meds.slice();
+    this.revision++;
+    this.worker.postMessage({ type: "meds", revision: this.revision, meds: this.meds });
+  }
+
+  loadFuzzyIndex(url) {
+    if (this.failure) return;
+    this.worker.postMessage({ type: "fuzzy", url: new URL(url, location.href).href });
+  }
+
+  query(query, searchIndications) {
+    if (this.failure) return Promise.reject(this.failure);
+    this.supersede();
+    this.seq++;
+    this.worker.postMessage({ type: "search", seq: this.seq, query, searchIndications });
+    return new Promise((resolve, reject) => {
+      this.waiting = { resolve, reject };
+    });
+  }
+
+  onReply(reply) {
+    if (reply.type !== "results" || reply.seq !== this.seq || !this.waiting) return;
+    if (reply.revision !== this.revision) return;
+    const toMeds = ids => Array.from(ids, id => this.meds[id]);
+    const pending = this.waiting;
+    this.waiting = null;
+    pending.resolve({
+      adult: toMeds(reply.adult),
+      pediatric: toMeds(reply.pediatric),
+      other: toMeds(reply.other)
+    });
+  }
+
+  supersede() {
+    if (this.waiting) {
+      this.waiting.resolve(null);
+      this.waiting = null;
+    }
+  }
+
+  fail(error) {
+    if (this.failure) return;
+    this.failure = error;
+    console.error("Search worker error:", error.message);
+    this.worker.terminate();
+    if (this.onFail) this.onFail(error);
+    if (this.waiting) {
+      this.waiting.reject(error);
+      this.waiting = null;
+    }
+  }
+}
+
 // ============================================================================
 // FLY-TO-CART ANIMATION
 // ============================================================================
@@ -998,33 +998,54 @@ class SearchResultsRenderer {
     this.state = state;
     this.medRenderer = medRenderer;
     this.searchManager = searchManager;
+    this.searchClient = null; // SearchWorkerClient when search runs in a worker
+    this.searchTicket = 0; // bumped per render; older results are dropped
   }
 
   setSearchManager(searchManager) {
     this.searchManager = searchManager;
   }
 
+  setSearchClient(searchClient) {
+    this.searchClient = searchClient;
+  }
+
+  /**
+   * Search and render the results. Returns a promise of the groups, or of
+   * null for an empty query or when a newer render superseded this one.
+   */
   render(query, onMedClick) {
     this.state.activeSearchIndex = -1;
-    
-    const dashboardView = document.getElementById("dashboardView");
-    const searchView = document.getElementById("searchView");
-    const resultsContainer = document.getElementById("searchResults");
+    const ticket = ++this.searchTicket;
 
     if (!query || query.trim() === "") {
-      searchView.classList.add("hidden");
-      dashboardView.classList.remove("hidden");
-      return;
+      document.getElementById("searchView").classList.add("hidden");
+      document.getElementById("dashboardView").classList.remove("hidden");
+      return Promise.resolve(null);
     }
 
-    dashboardView.classList.add("hidden");
-    searchView.classList.remove("hidden");
-    resultsContainer.innerHTML = "";
-
     // Use provided searchManager or create new one as fallback
     const searchManager = this.searchManager || new SearchManager(this.state.medications);
-    const terms = searchManager.normalizeSearchTerms(query);
-    const groups = searchManager.search(query);
+    return this.findGroups(query, searchManager).then(groups => {
+      if (!groups || ticket !== this.searchTicket) return null;
+      this.renderResults(groups, searchManager.normalizeSearchTerms(query), onMedClick);
+      return groups;
+    });
+  }
+
+  /** Search in the worker if there is one, else on the main thread */
+  findGroups(query, searchManager) {
+    if (!this.searchClient) return Promise.resolve(searchManager.search(query));
+    return this.searchClient.query(query, Boolean(window.providerManager?.isOwner()))
+      // The worker died (its onFail clears searchClient): search here instead
+      .catch(() => searchManager.search(query));
+  }
+
+  renderResults(groups, terms, onMedClick) {
+    const resultsContainer = document.getElementById("searchResults");
+    document.getElementById("dashboardView").classList.add("hidden");
+    document.getElementById("searchView").classList.remove("hidden");
+    resultsContainer.innerHTML = "";
 
     const totalResults = groups.adult.length + groups.pediatric.length + groups.other.length;
 
@@ -186,6 +186,7 @@ class SearchController {
     this.cartRenderer = cartRenderer;
   }
 
+  /** Search and render; resolves with the groups (see SearchResultsRenderer.render) */
   search(query) {
     // Reset active index when search changes to prevent out-of-bounds issues
     this.state.activeSearchIndex = -1;
@@ -196,16 +197,17 @@ class SearchController {
       enterHint.classList.remove("visible");
     }
 
-    this.searchRenderer.render(
+    const rendered = this.searchRenderer.render(
       query,
       (med, element) => this.cartController.toggle(med, element)
-    );
-
-    // Sync cart state to newly rendered search results
-    // This ensures in-cart items show the Remove button and in-cart styling
-    if (this.cartRenderer) {
-      this.cartRenderer.updateSelectedIndicators();
-    }
+    ).then(groups => {
+      // Sync cart state to newly rendered search results
+      // This ensures in-cart items show the Remove button and in-cart styling
+      if ((groups || !query.trim()) && this.cartRenderer) {
+        this.cartRenderer.updateSelectedIndicators();
+      }
+      return groups;
+    });
 
     const clearBtn = Utils.getElement("clearSearchBtn");
     if (clearBtn) {
@@ -215,6 +217,7 @@ class SearchController {
         clearBtn.classList.remove("visible");
       }
     }
+    return rendered;
   }
 
   clear() {
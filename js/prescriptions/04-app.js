@@ -8,6 +8,7 @@ class Application {
     this.controllers = {};
     this.renderers = {};
     this.managers = {};
+    this.searchClient = null; // SearchWorkerClient, see loadData()
   }
 
   async initialize() {
@@ -57,6 +58,14 @@ class Application {
     
     // Load locations (now async to load from JSON)
     await this.managers.location.load();
+
+    // Optional: postal code search needs an FSA centroid table at build time
+    const locationIndexUrl = this.managers.location.locationIndexUrl;
+    if (locationIndexUrl) {
+      LocationIndex.load(locationIndexUrl)
+        .then(index => this.managers.location.setLocationIndex(index))
+        .catch(error => console.warn("Location index unavailable:", error));
+    }
     
     // Load provider from localStorage and authorized providers list
     this.managers.provider.load();
@@ -1165,18 +1174,83 @@ class Application {
   }
 
   async loadData() {
-    this.state.medications = await this.managers.data.loadMedications();
-    
-    if (this.state.medications.length === 0) {
-      console.error("No medications loaded - medication data file may be missing or invalid");
-      throw new Error("Failed to load medication data. Please check that Prescriptions.json exists and is valid.");
+    const catalog = this.managers.data.loadCatalog();
+
+    if (!catalog || catalog.chunks.length === 0) {
+      console.error("No medications loaded - prescription catalog may be missing or invalid");
+      throw new Error("Failed to load medication data. Please check that prescription-catalog.js exists and is valid.");
     }
-    
-    // Create SearchManager now that medications are loaded
+
+    // A site's overlay changes counts, so it loads before the first render
+    await this.managers.data.loadSiteOverlay();
+
+    // Folder structure and counts come from the catalog; full records
+    // stream in per specialty after first paint (see loadMedicationChunks).
+    NavigationDataHelper.setCatalog(this.managers.data.catalog);
+
+    // SearchManager keeps a reference to this array, which is filled in place
     this.managers.search = new SearchManager(this.state.medications);
     
     // Update the search renderer with the SearchManager
     this.renderers.search.setSearchManager(this.managers.search);
+
+    // Scoring runs in a worker where possible; the SearchManager above
+    // still supplies highlight terms and is the fallback
+    this.searchClient = SearchWorkerClient.start(
+      "js/prescriptions/search-worker.js", () => this.onSearchWorkerFailed()
+    );
+    this.renderers.search.setSearchClient(this.searchClient);
+
+    // Optional: search falls back to per-word Levenshtein without it
+    if (this.searchClient) {
+      this.searchClient.loadFuzzyIndex("data/fuzzy-index.json");
+    } else {
+      this.loadFuzzyIndex();
+    }
+
+    this.medicationsReady = this.loadMedicationChunks();
+  }
+
+  loadFuzzyIndex() {
+    FuzzyIndex.load("data/fuzzy-index.json")
+      .then(index => this.managers.search.setFuzzyIndex(index))
+      .catch(error => console.warn("Fuzzy index unavailable:", error));
+  }
+
+  /** The search worker died: search on the main thread from now on */
+  onSearchWorkerFailed() {
+    console.warn("Search worker failed, searching on the main thread");
+    this.searchClient = null;
+    this.renderers.search.setSearchClient(null);
+    this.loadFuzzyIndex();
+  }
+
+  async loadMedicationChunks() {
+    const meds = await this.managers.data.loadMedications();
+    const failed = this.managers.data.failedSpecialties;
+    if (failed.length > 0) {
+      ToastManager.show(`Could not load ${failed.join(", ")} - please refresh`, 5000);
+    }
+    if (meds.length === 0) {
+      console.error("No medications loaded - medication chunks may be missing or invalid");
+      return;
+    }
+    this.state.medications.splice(0, this.state.medications.length, ...meds);
+    if (this.searchClient) this.searchClient.setMedications(this.state.medications);
+
+    // Re-render views that were drawn from catalog counts alone
+    if (!this.controllers.cart) return; // initialize() will render
+    if (Utils.isMobile()) {
+      this.renderers.mobileFolder.renderCurrentLevel();
+    } else {
+      this.renderers.folder.render();
+    }
+    this.renderers.cart.updateSelectedIndicators();
+
+    const shellSearch = document.getElementById("shell-search-input");
+    if (shellSearch && shellSearch.value.trim()) {
+      this.controllers.search.search(shellSearch.value);
+    }
   }
 
   render() {
@@ -1,2 +1,2 @@
 // Auto-generated by build.py - do not edit
-const LOCATION_DATA=JSON.parse(atob("eyJsb2NhdGlvbnMiOlt7Im5hbWUiOiJBbGV4YW5kcmEgSG9zcGl0YWwgSW5nZXJzb2xsIiwiYWRkcmVzcyI6IjI5IE5veG9uIFN0LCBJbmdlcnNvbGwsIE41QyAxQjgifSx7Im5hbWUiOiJBbG1vbnRlIEdlbmVyYWwgSG9zcGl0YWwiLCJhZGRyZXNzIjoiNzUgU3ByaW5nIFN0LCBBbG1vbnRlLCBLMEEgMUEwIn0seyJuYW1lIjoiQXJucHJpb3IgUmVnaW9uYWwgSGVhbHRoIiwiYWRkcmVzcyI6IjM1MCBKb2huIFN0IE4sIEFybnByaW9yLCBLN1MgMlA2In0seyJuYW1lIjoiQXRpa29rYW4gR2VuZXJhbCBIb3NwaXRhbCIsImFkZHJlc3MiOiIxMjAgRG9yb3RoeSBTdCwgQXRpa29rYW4sIFAwVCAxQzAifSx7Im5hbWUiOiJBdHRhd2FwaXNrYXQgSG9zcGl0YWwiLCJhZGRyZXNzIjoiMSBIZWFsdGggQ2FyZSBMYW5lLCBBdHRhd2FwaXNrYXQsIFAwTCAxQTAifSx7Im5hbWUiOiJCYW5jcm9mdCAtIFF1aW50ZSBIZWFsdGggTm9ydGggSGFzdGluZ3MgSG9zcGl0YWwiLCJhZGRyZXNzIjoiMUggTWFub3IgTGFuZSwgQmFuY3JvZnQsIEswTCAxQzAifSx7Im5hbWUiOiJCYXJyeSdzIEJheSAtIFN0LiBGcmFuY2lzIE1lbW9yaWFsIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjcgU3QuIEZyYW5jaXMgTWVtb3JpYWwgRHIsIEJhcnJ5J3MgQmF5LCBLMEogMUIwIn0seyJuYW1lIjoiQmF5Y3Jlc3QgSG9zcGl0YWwiLCJhZGRyZXNzIjoiMzU2MCBCYXRodXJzdCBTdCwgVG9yb250bywgTTZBIDJFMSJ9LHsibmFtZSI6IkJpbmdoYW0gTWVtb3JpYWwgSG9zcGl0YWwiLCJhZGRyZXNzIjoiNTA3IDh0aCBBdmUsIE1hdGhlc29uLCBQMEsgMU4wIn0seyJuYW1lIjoiQmxhbmNoZSBSaXZlciBIZWFsdGggLSBFbmdsZWhhcnQgU2l0ZSIsImFkZHJlc3MiOiI2MSA1dGggQXZlLCBFbmdsZWhhcnQsIFAwSiAxSDAifSx7Im5hbWUiOiJCbHVld2F0ZXIgSGVhbHRoIC0gQ2hhcmxvdHRlIEVsZWFub3IgRW5nbGVoYXJ0IFNpdGUiLCJhZGRyZXNzIjoiNDUwIEJsYW5jaGUgU3QsIFBldHJvbGlhLCBOME4gMVIwIn0seyJuYW1lIjoiQmx1ZXdhdGVyIEhlYWx0aCAtIFNhcm5pYSBTaXRlIiwiYWRkcmVzcyI6Ijg5IE5vcm1hbiBTdCwgU2FybmlhLCBON1QgNlMzIn0seyJuYW1lIjoiQnJhY2VicmlkZ2UgLSBTb3V0aCBNdXNrb2thIE1lbW9yaWFsIEhvc3BpdGFsIiwiYWRkcmVzcyI6Ijc1IEFubiBTdCwgQnJhY2VicmlkZ2UsIFAxTCAyRTQifSx7Im5hbWUiOiJCcmFudGZvcmQgR2VuZXJhbCBIb3NwaXRhbCIsImFkZHJlc3MiOiIyMDAgVGVycmFjZSBIaWxsIFN0LCBCcmFudGZvcmQsIE4zUiAxRzkifSx7Im5hbWUiOiJCcmlnaHRzaG9yZXMgSGVhbHRoIFN5c3RlbSAtIExpb24ncyBIZWFkIiwiYWRkcmVzcyI6IjIyIE1vb3JlIFN0LCBMaW9uJ3MgSGVhZCwgTjBIIDFXMCJ9LHsibmFtZSI6IkJyaWdodHNob3JlcyBIZWFsdGggU3lzdGVtIC0gTWFya2RhbGUiLCJhZGRyZXNzIjoiMjIwIFRvcm9udG8gU3QgUywgTWFya2RhbGUsIE4wQyAxSDAifSx7Im5hbWUiOiJCcmlnaHRzaG9yZXMgSGVhbHRoIFN5c3RlbSAtIE1lYWZvcmQiLCJhZGRyZXNzIjoiMjI5IE5lbHNvbiBTdCBXLCBNZWFmb3JkLCBONEwgMUEzIn0seyJuYW1lIjoiQnJpZ2h0c2hvcmVzIEhlYWx0aCBTeXN0ZW0gLSBPd2VuIFNvdW5kIiwiYWRkcmVzcyI6IjE4MDAgOHRoIFN0IEUsIE93ZW4gU291bmQsIE40SyA2TTkifSx7Im5hbWUiOiJCcmlnaHRzaG9yZXMgSGVhbHRoIFN5c3RlbSAtIFNvdXRoYW1wdG9uIiwiYWRkcmVzcyI6IjM0MCBIaWdoIFN0LCBTb3V0aGFtcHRvbiwgTjBIIDJMMCJ9LHsibmFtZSI6IkJyaWdodHNob3JlcyBIZWFsdGggU3lzdGVtIC0gV2lhcnRvbiIsImFkZHJlc3MiOiIzNjkgTWFyeSBTdCwgV2lhcnRvbiwgTjBIIDJUMCJ9LHsibmFtZSI6IkJyb2NrdmlsbGUgR2VuZXJhbCBIb3NwaXRhbCAtIENoYXJsZXMgU3QgU2l0ZSIsImFkZHJlc3MiOiI3NSBDaGFybGVzIFN0LCBCcm9ja3ZpbGxlLCBLNlYgMVM4In0seyJuYW1lIjoiQnJ1eVx1MDBlOHJlIEhlYWx0aCAtIFNhaW50LVZpbmNlbnQgSG9zcGl0YWwiLCJhZGRyZXNzIjoiNjAgQ2FtYnJpZGdlIFN0IE4sIE90dGF3YSwgSzFSIDdBNSJ9LHsibmFtZSI6IkJydXlcdTAwZThyZSBIZWFsdGggLSBcdTAwYzlsaXNhYmV0aCBCcnV5XHUwMGU4cmUgSG9zcGl0YWwiLCJhZGRyZXNzIjoiNDMgQnJ1eVx1MDBlOHJlIFN0LCBPdHRhd2EsIEsxTiA1QzgifSx7Im5hbWUiOiJDZW50cmUgZm9yIEFkZGljdGlvbiBhbmQgTWVudGFsIEhlYWx0aCAoQ0FNSCkgLSBDb2xsZWdlIFN0IFNpdGUiLCJhZGRyZXNzIjoiMjUwIENvbGxlZ2UgU3QsIFRvcm9udG8sIE01VCAxUjgifSx7Im5hbWUiOiJDZW50cmUgZm9yIEFkZGljdGlvbiBhbmQgTWVudGFsIEhlYWx0aCAoQ0FNSCkgLSBRdWVlbiBTdCBTaXRlIiwiYWRkcmVzcyI6IjEwMDEgUXVlZW4gU3QgVywgVG9yb250bywgTTZKIDFINCJ9LHsibmFtZSI6IkNoaWxkcmVuJ3MgSG9zcGl0YWwgb2YgRWFzdGVybiBPbnRhcmlvIChDSEVPKSIsImFkZHJlc3MiOiI0MDEgU215dGggUmQsIE90dGF3YSwgSzFIIDhMMSJ9LHsibmFtZSI6IkNhbWJyaWRnZSBNZW1vcmlhbCBIb3NwaXRhbCIsImFkZHJlc3MiOiI3MDAgQ29yb25hdGlvbiBCbHZkLCBDYW1icmlkZ2UsIE4xUiAzRzIifSx7Im5hbWUiOiJDYW1wYmVsbGZvcmQgTWVtb3JpYWwgSG9zcGl0YWwiLCJhZGRyZXNzIjoiMTQ2IE9saXZlciBSZCwgQ2FtcGJlbGxmb3JkLCBLMEwgMUwwIn0seyJuYW1lIjoiQ2FybGV0b24gUGxhY2UgJiBEaXN0cmljdCBNZW1vcmlhbCBIb3NwaXRhbCIsImFkZHJlc3MiOiIyMTEgTGFrZSBBdmUgRSwgQ2FybGV0b24gUGxhY2UsIEs3QyAxSjQifSx7Im5hbWUiOiJDYXNleSBIb3VzZSBIb3NwaXRhbCIsImFkZHJlc3MiOiIxMTkgSXNhYmVsbGEgU3QsIFRvcm9udG8sIE00WSAxUDIifSx7Im5hbWUiOiJDaGFwbGVhdSBIZWFsdGggU2VydmljZXMiLCJhZGRyZXNzIjoiNiBCcm9vbWhlYWQgUmQsIENoYXBsZWF1LCBQME0gMUswIn0seyJuYW1lIjoiQ2hhdGhhbS1LZW50IEhlYWx0aCBBbGxpYW5jZSAtIENoYXRoYW0gU2l0ZSIsImFkZHJlc3MiOiI4MCBHcmFuZCBBdmUgVywgQ2hhdGhhbSwgTjdMIDFCNyJ9LHsibmFtZSI6IkNoYXRoYW0tS2VudCBIZWFsdGggQWxsaWFuY2UgLSBXYWxsYWNlYnVyZyBTaXRlIiwiYWRkcmVzcyI6IjMyNSBNYXJnYXJldCBBdmUsIFdhbGxhY2VidXJnLCBOOEEgMkE3In0seyJuYW1lIjoiQ2xpbnRvbiBQdWJsaWMgSG9zcGl0YWwiLCJhZGRyZXNzIjoiOTggU2hpcGxleSBTdCwgQ2xpbnRvbiwgTjBNIDFMMCJ9LHsibmFtZSI6IkNvbGxpbmd3b29kIEdlbmVyYWwgYW5kIE1hcmluZSBIb3NwaXRhbCIsImFkZHJlc3MiOiI0NTkgSHVtZSBTdCwgQ29sbGluZ3dvb2QsIEw5WSAxVzkifSx7Im5hbWUiOiJDb3Jud2FsbCBDb21tdW5pdHkgSG9zcGl0YWwgLSBNY0Nvbm5lbGwgU2l0ZSIsImFkZHJlc3MiOiI4NDAgTWNDb25uZWxsIEF2ZSwgQ29ybndhbGwsIEs2SCA1UzUifSx7Im5hbWUiOiJEZWVwIFJpdmVyIGFuZCBEaXN0cmljdCBIZWFsdGgiLCJhZGRyZXNzIjoiMTE3IEJhbnRpbmcgRHIsIERlZXAgUml2ZXIsIEswSiAxUDAifSx7Im5hbWUiOiJEcnlkZW4gUmVnaW9uYWwgSGVhbHRoIENlbnRyZSIsImFkZHJlc3MiOiI1OCBHb29kYWxsIFN0LCBEcnlkZW4sIFA4TiAyWjYifSx7Im5hbWUiOiJEdW5udmlsbGUgLSBIYWxkaW1hbmQgV2FyIE1lbW9yaWFsIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjQwMCBCcm9hZCBTdCBXLCBEdW5udmlsbGUsIE4xQSAyUDcifSx7Im5hbWUiOiJFbGxpb3QgTGFrZSAtIFN0LiBKb3NlcGgncyBHZW5lcmFsIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjcwIFNwaW5lIFJkLCBFbGxpb3QgTGFrZSwgUDVBIDFYMiJ9LHsibmFtZSI6IkVyaWUgU2hvcmVzIEhlYWx0aENhcmUiLCJhZGRyZXNzIjoiMTk0IFRhbGJvdCBTdCBXLCBMZWFtaW5ndG9uLCBOOEggMU45In0seyJuYW1lIjoiRXNwYW5vbGEgR2VuZXJhbCBIb3NwaXRhbCIsImFkZHJlc3MiOiI4MjIgQ2VudHJlIFN0LCBFc3Bhbm9sYSwgUDVFIDFKMyJ9LHsibmFtZSI6IkV4ZXRlciAtIFNvdXRoIEh1cm9uIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjI0IEh1cm9uIFN0IFcsIEV4ZXRlciwgTjBNIDFTMiJ9LHsibmFtZSI6IkZvcnQgQWxiYW55IEhvc3BpdGFsIiwiYWRkcmVzcyI6IjEgSG9zcGl0YWwgUmQsIEZvcnQgQWxiYW55LCBQMEwgMUgwIn0seyJuYW1lIjoiRm9ydCBGcmFuY2VzIExhIFZlcmVuZHJ5ZSBIb3NwaXRhbCIsImFkZHJlc3MiOiIxMTAgVmljdG9yaWEgQXZlLCBGb3J0IEZyYW5jZXMsIFA5QSAyQjcifSx7Im5hbWUiOiJHZW9yZ2lhbiBCYXkgR2VuZXJhbCBIb3NwaXRhbCIsImFkZHJlc3MiOiIxMTEyIFN0LiBBbmRyZXcncyBEciwgTWlkbGFuZCwgTDRSIDRQNCJ9LHsibmFtZSI6IkdlcmFsZHRvbiBEaXN0cmljdCBIb3NwaXRhbCIsImFkZHJlc3MiOiI1MDAgSG9nYXJ0aCBBdmUgVywgR2VyYWxkdG9uLCBQMFQgMU0wIn0seyJuYW1lIjoiR29kZXJpY2ggLSBBbGV4YW5kcmEgTWFyaW5lIGFuZCBHZW5lcmFsIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjEyMCBOYXBpZXIgU3QsIEdvZGVyaWNoLCBON0EgMVc1In0seyJuYW1lIjoiR3JhbmQgUml2ZXIgSG9zcGl0YWwgKEdSSCkgLSBGcmVlcG9ydCBDYW1wdXMiLCJhZGRyZXNzIjoiMzU3MCBLaW5nIFN0IEUsIEtpdGNoZW5lciwgTjJBIDJXMSJ9LHsibmFtZSI6IkdyYW5kIFJpdmVyIEhvc3BpdGFsIChHUkgpIC0gS1cgQ2FtcHVzIiwiYWRkcmVzcyI6IjgzNSBLaW5nIFN0IFcsIEtpdGNoZW5lciwgTjJHIDFHMyJ9LHsibmFtZSI6IkdyaW1zYnkgLSBXZXN0IExpbmNvbG4gTWVtb3JpYWwgSG9zcGl0YWwiLCJhZGRyZXNzIjoiMTY5IE1haW4gU3QgRSwgR3JpbXNieSwgTDNNIDFQMyJ9LHsibmFtZSI6Ikdyb3ZlcyBNZW1vcmlhbCBDb21tdW5pdHkgSG9zcGl0YWwiLCJhZGRyZXNzIjoiMTMxIEZyZWRlcmljayBDYW1wYmVsbCBTdCwgRmVyZ3VzLCBOMU0gMEgzIn0seyJuYW1lIjoiR3VlbHBoIEdlbmVyYWwgSG9zcGl0YWwiLCJhZGRyZXNzIjoiMTE1IERlbGhpIFN0LCBHdWVscGgsIE4xRSA0SjQifSx7Im5hbWUiOiJIYWdlcnN2aWxsZSAtIFdlc3QgSGFsZGltYW5kIEdlbmVyYWwgSG9zcGl0YWwiLCJhZGRyZXNzIjoiNzUgUGFya3ZpZXcgUmQsIEhhZ2Vyc3ZpbGxlLCBOMEEgMUgwIn0seyJuYW1lIjoiSGFsaWJ1cnRvbiBIaWdobGFuZHMgSGVhbHRoIFNlcnZpY2VzIiwiYWRkcmVzcyI6IjcxOTkgR2VsZXJ0IFJkLCBIYWxpYnVydG9uLCBLME0gMVMwIn0seyJuYW1lIjoiSGFsdG9uIEhlYWx0aGNhcmUgLSBHZW9yZ2V0b3duIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjEgUHJpbmNlc3MgQW5uZSBEciwgR2VvcmdldG93biwgTDdHIDJCOCJ9LHsibmFtZSI6IkhhbHRvbiBIZWFsdGhjYXJlIC0gTWlsdG9uIERpc3RyaWN0IEhvc3BpdGFsIiwiYWRkcmVzcyI6IjcwMzAgRGVycnkgUmQsIE1pbHRvbiwgTDlUIDdINiJ9LHsibmFtZSI6IkhhbHRvbiBIZWFsdGhjYXJlIC0gT2FrdmlsbGUgVHJhZmFsZ2FyIE1lbW9yaWFsIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjMwMDEgSG9zcGl0YWwgR2F0ZSwgT2FrdmlsbGUsIEw2TSAwTDgifSx7Im5hbWUiOiJIYW1pbHRvbiBIZWFsdGggU2NpZW5jZXMgKEhIUykgLSBIYW1pbHRvbiBHZW5lcmFsIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjIzNyBCYXJ0b24gU3QgRSwgSGFtaWx0b24sIEw4TCAyWDIifSx7Im5hbWUiOiJIYW1pbHRvbiBIZWFsdGggU2NpZW5jZXMgKEhIUykgLSBKdXJhdmluc2tpIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjcxMSBDb25jZXNzaW9uIFN0LCBIYW1pbHRvbiwgTDhWIDFDMyJ9LHsibmFtZSI6IkhhbWlsdG9uIEhlYWx0aCBTY2llbmNlcyAoSEhTKSAtIE1haW4gU3QgV2VzdCBVcmdlbnQgQ2FyZSIsImFkZHJlc3MiOiI2OTAgTWFpbiBTdCBXLCBIYW1pbHRvbiwgTDhTIDFBNCJ9LHsibmFtZSI6IkhhbWlsdG9uIEhlYWx0aCBTY2llbmNlcyAoSEhTKSAtIE1jTWFzdGVyIFVuaXZlcnNpdHkgTWVkaWNhbCBDZW50cmUgKE1VTUMpIiwiYWRkcmVzcyI6IjEyMDAgTWFpbiBTdCBXLCBIYW1pbHRvbiwgTDhOIDNaNSJ9LHsibmFtZSI6IkhhbWlsdG9uIEhlYWx0aCBTY2llbmNlcyAoSEhTKSAtIFN0LiBQZXRlcidzIEhvc3BpdGFsIiwiYWRkcmVzcyI6Ijg4IE1hcGxld29vZCBBdmUsIEhhbWlsdG9uLCBMOE0gMVc5In0seyJuYW1lIjoiSGFub3ZlciBhbmQgRGlzdHJpY3QgSG9zcGl0YWwiLCJhZGRyZXNzIjoiOTAgN3RoIEF2ZSwgSGFub3ZlciwgTjROIDFOMSJ9LHsibmFtZSI6Ikhhd2tlc2J1cnkgYW5kIERpc3RyaWN0IEdlbmVyYWwgSG9zcGl0YWwiLCJhZGRyZXNzIjoiMTExMSBHaGlzbGFpbiBTdCwgSGF3a2VzYnVyeSwgSzZBIDNHNSJ9LHsibmFtZSI6IkhlYWR3YXRlcnMgSGVhbHRoIENhcmUgQ2VudHJlIiwiYWRkcmVzcyI6IjEwMCBSb2xsaW5nIEhpbGxzIERyLCBPcmFuZ2V2aWxsZSwgTDlXIDRYOSJ9LHsibmFtZSI6IkhlYWx0aCBTY2llbmNlcyBOb3J0aCAtIFJhbXNleSBMYWtlIEhlYWx0aCBDZW50cmUiLCJhZGRyZXNzIjoiNDEgUmFtc2V5IExha2UgUmQsIFN1ZGJ1cnksIFAzRSA1SjEifSx7Im5hbWUiOiJIZWFsdGggU2NpZW5jZXMgTm9ydGggLSBTdWRidXJ5IE91dHBhdGllbnQgQ2VudHJlIiwiYWRkcmVzcyI6Ijg2NSBSZWdlbnQgU3QsIFN1ZGJ1cnksIFAzRSAzWTkifSx7Im5hbWUiOiJIZWFyc3QgLSBOb3RyZS1EYW1lIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjE0MDUgRWR3YXJkIFN0LCBIZWFyc3QsIFAwTCAxTjAifSx7Im5hbWUiOiJIb2xsYW5kIEJsb29ydmlldyBLaWRzIFJlaGFiaWxpdGF0aW9uIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjE1MCBLaWxnb3VyIFJkLCBUb3JvbnRvLCBNNEcgMVI4In0seyJuYW1lIjoiSG9tZXdvb2QgSGVhbHRoIENlbnRyZSIsImFkZHJlc3MiOiIxNTAgRGVsaGkgU3QsIEd1ZWxwaCwgTjFFIDZLOSJ9LHsibmFtZSI6Ikhvcm5lcGF5bmUgQ29tbXVuaXR5IEhvc3BpdGFsIiwiYWRkcmVzcyI6IjI3OCBGcm9udCBTdCwgSG9ybmVwYXluZSwgUDBNIDFaMCJ9LHsibmFtZSI6IkhvdGVsIERpZXUgU2hhdmVyIEhlYWx0aCBhbmQgUmVoYWJpbGl0YXRpb24gQ2VudHJlIiwiYWRkcmVzcyI6IjU0MSBHbGVucmlkZ2UgQXZlLCBTdC4gQ2F0aGFyaW5lcywgTDJUIDRDMiJ9LHsibmFtZSI6Ikh1bWJlciBSaXZlciBIZWFsdGggKEhSSCkiLCJhZGRyZXNzIjoiMTIzNSBXaWxzb24gQXZlLCBOb3J0aCBZb3JrLCBNM00gMEIyIn0seyJuYW1lIjoiSHVyb24gUGVydGggSGVhbHRoY2FyZSBBbGxpYW5jZSAtIFN0LiBNYXJ5cyBNZW1vcmlhbCBIb3NwaXRhbCIsImFkZHJlc3MiOiIyNjcgUXVlZW4gU3QgVywgU3QuIE1hcnlzLCBONFggMUI2In0seyJuYW1lIjoiSHVyb24gUGVydGggSGVhbHRoY2FyZSBBbGxpYW5jZSAtIFN0cmF0Zm9yZCBHZW5lcmFsIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjQ2IEdlbmVyYWwgSG9zcGl0YWwgRHIsIFN0cmF0Zm9yZCwgTjVBIDJZNiJ9LHsibmFtZSI6IkhcdTAwZjRwaXRhbCBHbGVuZ2FycnkgTWVtb3JpYWwgSG9zcGl0YWwiLCJhZGRyZXNzIjoiMjAyNjAgQ291bnR5IFJkIDQzLCBBbGV4YW5kcmlhLCBLMEMgMUEwIn0seyJuYW1lIjoiSFx1MDBmNHBpdGFsIE1vbnRmb3J0IiwiYWRkcmVzcyI6IjcxMyBNb250cmVhbCBSZCwgT3R0YXdhLCBLMUsgMFQyIn0seyJuYW1lIjoiSFx1MDBmNHRlbC1EaWV1IEdyYWNlIEhlYWx0aGNhcmUiLCJhZGRyZXNzIjoiMTQ1MyBQcmluY2UgUmQsIFdpbmRzb3IsIE45QyAzWjQifSx7Im5hbWUiOiJJcm9xdW9pcyBGYWxscyAtIEFuc29uIEdlbmVyYWwgSG9zcGl0YWwiLCJhZGRyZXNzIjoiNTggQW5zb24gRHIsIElyb3F1b2lzIEZhbGxzLCBQMEsgMUUwIn0seyJuYW1lIjoiSm9zZXBoIEJyYW50IEhvc3BpdGFsIiwiYWRkcmVzcyI6IjEyNDUgTGFrZXNob3JlIFJkLCBCdXJsaW5ndG9uLCBMN1MgMEEyIn0seyJuYW1lIjoiS2FwdXNrYXNpbmcgLSBTZW5zZW5icmVubmVyIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjEwMSBQcm9ncmVzcyBDcmVzLCBLYXB1c2thc2luZywgUDVOIDNINSJ9LHsibmFtZSI6IktlbXB0dmlsbGUgRGlzdHJpY3QgSG9zcGl0YWwiLCJhZGRyZXNzIjoiMjY3NSBDb25jZXNzaW9uIFJkLCBLZW1wdHZpbGxlLCBLMEcgMUowIn0seyJuYW1lIjoiS2Vub3JhIC0gTGFrZSBvZiBUaGUgV29vZHMgRGlzdHJpY3QgSG9zcGl0YWwiLCJhZGRyZXNzIjoiMjEgU3lsdmFuIFN0IFcsIEtlbm9yYSwgUDlOIDNXNyJ9LHsibmFtZSI6IktpbmNhcmRpbmUgU2l0ZTsgU291dGggQnJ1Y2UgR3JleSBIZWFsdGggQ2VudHJlIiwiYWRkcmVzcyI6IjExOTkgUXVlZW4gU3QsIEtpbmNhcmRpbmUsIE4yWiAxRzYifSx7Im5hbWUiOiJLaW5nc3RvbiBIZWFsdGggU2NpZW5jZXMgQ2VudHJlIC0gSG90ZWwgRGlldSBIb3NwaXRhbCIsImFkZHJlc3MiOiIxNjYgQnJvY2sgU3QsIEtpbmdzdG9uLCBLN0wgNUcyIn0seyJuYW1lIjoiS2luZ3N0b24gSGVhbHRoIFNjaWVuY2VzIENlbnRyZSAtIEtpbmdzdG9uIEdlbmVyYWwgSG9zcGl0YWwiLCJhZGRyZXNzIjoiNzYgU3R1YXJ0IFN0LCBLaW5nc3RvbiwgSzdMIDJWNyJ9LHsibmFtZSI6IktpcmtsYW5kIExha2UgLSBCbGFuY2hlIFJpdmVyIEhlYWx0aCIsImFkZHJlc3MiOiIxNDUgR292ZXJubWVudCBSZCBFLCBLaXJrbGFuZCBMYWtlLCBQMk4gM1A0In0seyJuYW1lIjoiTGFkeSBEdW5uIEhlYWx0aCBDZW50cmUiLCJhZGRyZXNzIjoiMTcgR292ZXJubWVudCBSZCwgV2F3YSwgUDBTIDFLMCJ9LHsibmFtZSI6IkxhZHkgTWludG8gSG9zcGl0YWwgLSBDb2NocmFuZSIsImFkZHJlc3MiOiIyNDEgRWlnaHRoIFN0LCBDb2NocmFuZSwgUDBMIDFDMCJ9LHsibmFtZSI6Ikxha2VyaWRnZSBIZWFsdGggLSBBamF4IFBpY2tlcmluZyBIb3NwaXRhbCIsImFkZHJlc3MiOiI1ODAgSGFyd29vZCBBdmUgUywgQWpheCwgTDFTIDJKNCJ9LHsibmFtZSI6Ikxha2VyaWRnZSBIZWFsdGggLSBCb3dtYW52aWxsZSBIb3NwaXRhbCIsImFkZHJlc3MiOiI0NyBMaWJlcnR5IFN0IFMsIEJvd21hbnZpbGxlLCBMMUMgMk40In0seyJuYW1lIjoiTGFrZXJpZGdlIEhlYWx0aCAtIE9zaGF3YSBIb3NwaXRhbCIsImFkZHJlc3MiOiIxIEhvc3BpdGFsIEN0LCBPc2hhd2EsIEwxRyAyQjkifSx7Im5hbWUiOiJMYWtlcmlkZ2UgSGVhbHRoIC0gUG9ydCBQZXJyeSBIb3NwaXRhbCIsImFkZHJlc3MiOiI0NTEgUGF4dG9uIFN0LCBQb3J0IFBlcnJ5LCBMOUwgMUw5In0seyJuYW1lIjoiTGFrZXJpZGdlIEhlYWx0aCAtIFdoaXRieSBIb3NwaXRhbCIsImFkZHJlc3MiOiIzMDAgR29yZG9uIFN0LCBXaGl0YnksIEwxTiA1VDIifSx7Im5hbWUiOiJMZW5ub3ggYW5kIEFkZGluZ3RvbiBDb3VudHkgR2VuZXJhbCBIb3NwaXRhbCIsImFkZHJlc3MiOiI4IFJpY2htb25kIFBhcmsgRHIsIE5hcGFuZWUsIEs3UiAyWjQifSx7Im5hbWUiOiJMaXN0b3dlbCBNZW1vcmlhbCBIb3NwaXRhbCIsImFkZHJlc3MiOiIyNTUgRWxpemFiZXRoIFN0IEUsIExpc3Rvd2VsLCBONFcgMlA1In0seyJuYW1lIjoiTG9uZG9uIEhlYWx0aCBTY2llbmNlcyBDZW50cmUgLSBVbml2ZXJzaXR5IEhvc3BpdGFsIiwiYWRkcmVzcyI6IjMzOSBXaW5kZXJtZXJlIFJkLCBMb25kb24sIE42QSA1QTUifSx7Im5hbWUiOiJMb25kb24gSGVhbHRoIFNjaWVuY2VzIENlbnRyZSAtIFZpY3RvcmlhIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjgwMCBDb21taXNzaW9uZXJzIFJkIEUsIExvbmRvbiwgTjZBIDVXOSJ9LHsibmFtZSI6Ik1hY2tlbnppZSBIZWFsdGggLSBDb3J0ZWxsdWNjaSBWYXVnaGFuIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjMyMDAgTWFqb3IgTWFja2VuemllIERyIFcsIFZhdWdoYW4sIEw2QSA0WjMifSx7Im5hbWUiOiJNYWNrZW56aWUgSGVhbHRoIC0gUmljaG1vbmQgSGlsbCBIb3NwaXRhbCIsImFkZHJlc3MiOiIxMCBUcmVuY2ggU3QsIFJpY2htb25kIEhpbGwsIEw0QyA0WjMifSx7Im5hbWUiOiJNYW5pdG91bGluIEhlYWx0aCBDZW50cmUgLSBMaXR0bGUgQ3VycmVudCBTaXRlIiwiYWRkcmVzcyI6IjExIE1lcmVkaXRoIFN0LCBMaXR0bGUgQ3VycmVudCwgUDBQIDFLMCJ9LHsibmFtZSI6Ik1hbml0b3VsaW4gSGVhbHRoIENlbnRyZSAtIE1pbmRlbW95YSBTaXRlIiwiYWRkcmVzcyI6IjIxMjAgSHd5IDU1MSwgTWluZGVtb3lhLCBQMFAgMVMwIn0seyJuYW1lIjoiTWFuaXRvdXdhZGdlIEdlbmVyYWwgSG9zcGl0YWwiLCJhZGRyZXNzIjoiMSBIZWFsdGggQ2FyZSBDcmVzLCBNYW5pdG91d2FkZ2UsIFAwVCAyQzAifSx7Im5hbWUiOiJNYXR0YXdhIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjIxNyBUdXJjb3R0ZSBQYXJrIFJkLCBNYXR0YXdhLCBQMEggMVYwIn0seyJuYW1lIjoiTWljaGFlbCBHYXJyb24gSG9zcGl0YWwgKE1HSCkiLCJhZGRyZXNzIjoiODI1IENveHdlbGwgQXZlLCBFYXN0IFlvcmssIE00QyAzRTcifSx7Im5hbWUiOiJNb29zZSBGYWN0b3J5IC0gV2VlbmVlYmF5a28gQXJlYSBIZWFsdGggQXV0aG9yaXR5IiwiYWRkcmVzcyI6IjE5IEhvc3BpdGFsIERyLCBNb29zZSBGYWN0b3J5LCBQMEwgMVcwIn0seyJuYW1lIjoiTXVza29rYSBBbGdvbnF1aW4gSGVhbHRoY2FyZSAtIEh1bnRzdmlsbGUgRGlzdHJpY3QgTWVtb3JpYWwgSG9zcGl0YWwiLCJhZGRyZXNzIjoiMTAwIEZyYW5rIE1pbGxlciBEciwgSHVudHN2aWxsZSwgUDFIIDFINyJ9LHsibmFtZSI6Ik5ldyBMaXNrZWFyZCAtIFRlbWlza2FtaW5nIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjQyMSBTaGVwaGVyZHNvbiBSZCwgTmV3IExpc2tlYXJkLCBQMEogMVAwIn0seyJuYW1lIjoiTmV3YnVyeSAtIEZvdXIgQ291bnRpZXMgSGVhbHRoIFNlcnZpY2VzIiwiYWRkcmVzcyI6IjE4MjQgQ29uY2Vzc2lvbiBEciwgTmV3YnVyeSwgTjBMIDFaMCJ9LHsibmFtZSI6Ik5pYWdhcmEgSGVhbHRoIC0gRm9ydCBFcmllIFVyZ2VudCBDYXJlIENlbnRyZSIsImFkZHJlc3MiOiIyMzAgQmVydGllIFN0LCBGb3J0IEVyaWUsIEwyQSAxWjIifSx7Im5hbWUiOiJOaWFnYXJhIEhlYWx0aCAtIEdyZWF0ZXIgTmlhZ2FyYSBHZW5lcmFsIFNpdGUiLCJhZGRyZXNzIjoiNTU0NiBQb3J0YWdlIFJkLCBOaWFnYXJhIEZhbGxzLCBMMkUgNlgyIn0seyJuYW1lIjoiTmlhZ2FyYSBIZWFsdGggLSBQb3J0IENvbGJvcm5lIFVyZ2VudCBDYXJlIENlbnRyZSIsImFkZHJlc3MiOiIyNjAgU3VnYXJsb2FmIFN0LCBQb3J0IENvbGJvcm5lLCBMM0sgMk43In0seyJuYW1lIjoiTmlhZ2FyYSBIZWFsdGggLSBTdC4gQ2F0aGFyaW5lcyBTaXRlIiwiYWRkcmVzcyI6IjEyMDAgRm91cnRoIEF2ZSwgU3QuIENhdGhhcmluZXMsIEwyUyAwQTkifSx7Im5hbWUiOiJOaWFnYXJhIEhlYWx0aCAtIFdlbGxhbmQgQ291bnR5IEdlbmVyYWwgU2l0ZSIsImFkZHJlc3MiOiI2NSBUaGlyZCBTdCwgV2VsbGFuZCwgTDNCIDRXNiJ9LHsibmFtZSI6Ik5vcnRoIEJheSBSZWdpb25hbCBIZWFsdGggQ2VudHJlIiwiYWRkcmVzcyI6IjUwIENvbGxlZ2UgRHIsIE5vcnRoIEJheSwgUDFCIDVBNCJ9LHsibmFtZSI6Ik5vcnRoIFNob3JlIEhlYWx0aCBOZXR3b3JrIC0gQmxpbmQgUml2ZXIgU2l0ZSIsImFkZHJlc3MiOiI1MjUgQ2F1c2xleSBTdCwgQmxpbmQgUml2ZXIsIFAwUiAxQjAifSx7Im5hbWUiOiJOb3J0aCBTaG9yZSBIZWFsdGggTmV0d29yayAtIFJpY2hhcmRzIExhbmRpbmcgU2l0ZSIsImFkZHJlc3MiOiIxMTgwIFJpY2hhcmRzIFN0LCBSaWNoYXJkcyBMYW5kaW5nLCBQMFIgMUowIn0seyJuYW1lIjoiTm9ydGggU2hvcmUgSGVhbHRoIE5ldHdvcmsgLSBUaGVzc2Fsb24gU2l0ZSIsImFkZHJlc3MiOiIyMjEgQWxnb21hIFN0LCBUaGVzc2Fsb24sIFAwUiAxTDAifSx7Im5hbWUiOiJOb3J0aCBXZWxsaW5ndG9uIEhlYWx0aCBDYXJlIC0gTG91aXNlIE1hcnNoYWxsIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjYzMCBEdWJsaW4gU3QsIE1vdW50IEZvcmVzdCwgTjBHIDJMMyJ9LHsibmFtZSI6Ik5vcnRoIFdlbGxpbmd0b24gSGVhbHRoIENhcmUgLSBQYWxtZXJzdG9uIGFuZCBEaXN0cmljdCBIb3NwaXRhbCIsImFkZHJlc3MiOiI1MDAgV2hpdGVzIFJkLCBQYWxtZXJzdG9uLCBOMEcgMlAwIn0seyJuYW1lIjoiTm9ydGggWW9yayBHZW5lcmFsIEhvc3BpdGFsIChOWUdIKSAtIEJyYW5zb24gQW1idWxhdG9yeSBDYXJlIENlbnRyZSIsImFkZHJlc3MiOiI1NTUgRmluY2ggQXZlIFcsIE5vcnRoIFlvcmssIE0yUiAxTjUifSx7Im5hbWUiOiJOb3J0aCBZb3JrIEdlbmVyYWwgSG9zcGl0YWwgKE5ZR0gpIC0gR2VuZXJhbCBTaXRlIiwiYWRkcmVzcyI6IjQwMDEgTGVzbGllIFN0LCBOb3J0aCBZb3JrLCBNMksgMUUxIn0seyJuYW1lIjoiTm9ydGggb2YgU3VwZXJpb3IgLSBNY0NhdXNsYW5kIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjIwQiBDYXJ0aWVyIFJkLCBUZXJyYWNlIEJheSwgUDBUIDJXMCJ9LHsibmFtZSI6Ik5vcnRoIG9mIFN1cGVyaW9yIC0gV2lsc29uIE1lbW9yaWFsIEdlbmVyYWwgSG9zcGl0YWwiLCJhZGRyZXNzIjoiMjYgUGVuaW5zdWxhIFJkLCBNYXJhdGhvbiwgUDBUIDJFMCJ9LHsibmFtZSI6Ik5vcnRodW1iZXJsYW5kIEhpbGxzIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjEwMDAgRGVQYWxtYSBEciwgQ29ib3VyZywgSzlBIDVXNiJ9LHsibmFtZSI6Ik9hayBWYWxsZXkgSGVhbHRoIC0gTWFya2hhbSBTdG91ZmZ2aWxsZSBIb3NwaXRhbCIsImFkZHJlc3MiOiIzODEgQ2h1cmNoIFN0LCBNYXJraGFtLCBMM1AgN1AzIn0seyJuYW1lIjoiT2FrIFZhbGxleSBIZWFsdGggLSBVeGJyaWRnZSBIb3NwaXRhbCIsImFkZHJlc3MiOiI0IENhbXBiZWxsIERyLCBVeGJyaWRnZSwgTDlQIDFTNCJ9LHsibmFtZSI6Ik9udGFyaW8gU2hvcmVzIENlbnRyZSBmb3IgTWVudGFsIEhlYWx0aCBTY2llbmNlcyIsImFkZHJlc3MiOiI3MDAgVmljdG9yaWEgU3QgVywgV2hpdGJ5LCBMMU4gMks1In0seyJuYW1lIjoiT3JpbGxpYSBTb2xkaWVycycgTWVtb3JpYWwgSG9zcGl0YWwiLCJhZGRyZXNzIjoiMTcwIENvbGJvcm5lIFN0IFcsIE9yaWxsaWEsIEwzViAyWjMifSx7Im5hbWUiOiJQZW1icm9rZSBSZWdpb25hbCBIb3NwaXRhbCIsImFkZHJlc3MiOiI3MDUgTWFja2F5IFN0LCBQZW1icm9rZSwgSzhBIDFHOCJ9LHsibmFtZSI6IlBlcnRoIGFuZCBTbWl0aHMgRmFsbHMgRGlzdHJpY3QgSG9zcGl0YWwgLSBQZXJ0aCBTaXRlIiwiYWRkcmVzcyI6IjMzIERydW1tb25kIFN0IFcsIFBlcnRoLCBLN0ggMksxIn0seyJuYW1lIjoiUGVydGggYW5kIFNtaXRocyBGYWxscyBEaXN0cmljdCBIb3NwaXRhbCAtIFNtaXRocyBGYWxscyBTaXRlIiwiYWRkcmVzcyI6IjYwIENvcm5lbGlhIFN0IFcsIFNtaXRocyBGYWxscywgSzdBIDJIOSJ9LHsibmFtZSI6IlBldGVyYm9yb3VnaCBSZWdpb25hbCBIZWFsdGggQ2VudHJlIiwiYWRkcmVzcyI6IjEgSG9zcGl0YWwgRHIsIFBldGVyYm9yb3VnaCwgSzlKIDdDNiJ9LHsibmFtZSI6IlByb3ZpZGVuY2UgQ2FyZSBIb3NwaXRhbCIsImFkZHJlc3MiOiI3NTIgS2luZyBTdCBXLCBLaW5nc3RvbiwgSzdMIDRYMyJ9LHsibmFtZSI6IlF1ZWVuc3dheSBDYXJsZXRvbiBIb3NwaXRhbCIsImFkZHJlc3MiOiIzMDQ1IEJhc2VsaW5lIFJkLCBPdHRhd2EsIEsySCA4UDQifSx7Im5hbWUiOiJRdWludGUgSGVhbHRoIC0gQmVsbGV2aWxsZSBHZW5lcmFsIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjI2NSBEdW5kYXMgU3QgRSwgQmVsbGV2aWxsZSwgSzhOIDVBOSJ9LHsibmFtZSI6IlF1aW50ZSBIZWFsdGggLSBQcmluY2UgRWR3YXJkIENvdW50eSBNZW1vcmlhbCIsImFkZHJlc3MiOiI0MDMgTWFpbiBTdCBFLCBQaWN0b24sIEswSyAyVDAifSx7Im5hbWUiOiJRdWludGUgSGVhbHRoIC0gVHJlbnRvbiBNZW1vcmlhbCBIb3NwaXRhbCIsImFkZHJlc3MiOiIyNDIgS2luZyBTdCwgVHJlbnRvbiwgSzhWIDVTNiJ9LHsibmFtZSI6IlJlZCBMYWtlIE1hcmdhcmV0IENvY2hlbm91ciBNZW1vcmlhbCBIb3NwaXRhbCIsImFkZHJlc3MiOiI1MSBId3kgMTA1LCBSZWQgTGFrZSwgUDBWIDJNMCJ9LHsibmFtZSI6IlJlbmZyZXcgVmljdG9yaWEgSG9zcGl0YWwiLCJhZGRyZXNzIjoiNDk5IFJhZ2xhbiBTdCBOLCBSZW5mcmV3LCBLN1YgMVA2In0seyJuYW1lIjoiUml2ZXJzaWRlIEhlYWx0aCBDYXJlIC0gRW1vIEhlYWx0aCBDZW50cmUiLCJhZGRyZXNzIjoiMTcwIEZyb250IFN0LCBFbW8sIFAwVyAxRTAifSx7Im5hbWUiOiJSaXZlcnNpZGUgSGVhbHRoIENhcmUgLSBSYWlueSBSaXZlciBIZWFsdGggQ2VudHJlIiwiYWRkcmVzcyI6IjExNSA0dGggU3QsIFJhaW55IFJpdmVyLCBQMFcgMUwwIn0seyJuYW1lIjoiUm9zcyBNZW1vcmlhbCBIb3NwaXRhbCIsImFkZHJlc3MiOiIxMCBBbmdlbGluZSBTdCBOLCBMaW5kc2F5LCBLOVYgNE04In0seyJuYW1lIjoiUm95YWwgT3R0YXdhIE1lbnRhbCBIZWFsdGggQ2VudHJlIiwiYWRkcmVzcyI6IjExNDUgQ2FybGluZyBBdmUsIE90dGF3YSwgSzFaIDdLNCJ9LHsibmFtZSI6IlJveWFsIFZpY3RvcmlhIFJlZ2lvbmFsIEhlYWx0aCBDZW50cmUiLCJhZGRyZXNzIjoiMjAxIEdlb3JnaWFuIERyLCBCYXJyaWUsIEw0TSA2TTIifSx7Im5hbWUiOiJSdW5ueW1lZGUgSGVhbHRoY2FyZSBDZW50cmUiLCJhZGRyZXNzIjoiNjI1IFJ1bm55bWVkZSBSZCwgVG9yb250bywgTTZTIDNBMyJ9LHsibmFtZSI6IlNhdWx0IEFyZWEgSG9zcGl0YWwiLCJhZGRyZXNzIjoiNzUwIEdyZWF0IE5vcnRoZXJuIFJkLCBTYXVsdCBTdGUuIE1hcmllLCBQNkIgMEEzIn0seyJuYW1lIjoiU2NhcmJvcm91Z2ggSGVhbHRoIE5ldHdvcmsgKFNITiktIEJpcmNobW91bnQgSG9zcGl0YWwiLCJhZGRyZXNzIjoiMzAzMCBCaXJjaG1vdW50IFJkLCBTY2FyYm9yb3VnaCwgTTFXIDNXMyJ9LHsibmFtZSI6IlNjYXJib3JvdWdoIEhlYWx0aCBOZXR3b3JrIChTSE4pIC0gQ2VudGVuYXJ5IEhvc3BpdGFsIiwiYWRkcmVzcyI6IjI4NjcgRWxsZXNtZXJlIFJkLCBTY2FyYm9yb3VnaCwgTTFFIDRCOSJ9LHsibmFtZSI6IlNjYXJib3JvdWdoIEhlYWx0aCBOZXR3b3JrIChTSE4pIC0gR2VuZXJhbCBIb3NwaXRhbCIsImFkZHJlc3MiOiIzMDUwIExhd3JlbmNlIEF2ZSBFLCBTY2FyYm9yb3VnaCwgTTFQIDJWNSJ9LHsibmFtZSI6IlNlYWZvcnRoIENvbW11bml0eSBIb3NwaXRhbCIsImFkZHJlc3MiOiIyNCBDZW50ZW5uaWFsIERyLCBTZWFmb3J0aCwgTjBLIDFXMCJ9LHsibmFtZSI6IlNpbWNvZSAtIE5vcmZvbGsgR2VuZXJhbCBIb3NwaXRhbCIsImFkZHJlc3MiOiIzNjUgV2VzdCBTdCwgU2ltY29lLCBOM1kgMVQ3In0seyJuYW1lIjoiU2luYWkgSGVhbHRoIC0gSGVubmljayBCcmlkZ2Vwb2ludCBIb3NwaXRhbCIsImFkZHJlc3MiOiIxIEJyaWRnZXBvaW50IERyLCBUb3JvbnRvLCBNNE0gMkI1In0seyJuYW1lIjoiU2luYWkgSGVhbHRoIC0gTW91bnQgU2luYWkgSG9zcGl0YWwiLCJhZGRyZXNzIjoiNjAwIFVuaXZlcnNpdHkgQXZlLCBUb3JvbnRvLCBNNUcgMVg1In0seyJuYW1lIjoiU2lvdXggTG9va291dCAtIE1lbm8gWWEgV2luIEhlYWx0aCBDZW50cmUiLCJhZGRyZXNzIjoiMSBNZW5vIFlhIFdpbiBXYXksIFNpb3V4IExvb2tvdXQsIFA4VCAxQjQifSx7Im5hbWUiOiJTbW9vdGggUm9jayBGYWxscyBIb3NwaXRhbCIsImFkZHJlc3MiOiIxMDcgS2VsbHkgUmQsIFNtb290aCBSb2NrIEZhbGxzLCBQMEwgMkIwIn0seyJuYW1lIjoiU291dGggQnJ1Y2UgR3JleSBIZWFsdGggQ2VudHJlIChTQkdIQykgLSBDaGVzbGV5IiwiYWRkcmVzcyI6IjM5IDJuZCBTdCBTRSwgQ2hlc2xleSwgTjBHIDFMMCJ9LHsibmFtZSI6IlNvdXRoIEJydWNlIEdyZXkgSGVhbHRoIENlbnRyZSAoU0JHSEMpIC0gRHVyaGFtIiwiYWRkcmVzcyI6IjMyMCBDb2xsZWdlIFN0LCBEdXJoYW0sIE4wRyAxUjAifSx7Im5hbWUiOiJTb3V0aCBCcnVjZSBHcmV5IEhlYWx0aCBDZW50cmUgKFNCR0hDKSAtIFdhbGtlcnRvbiIsImFkZHJlc3MiOiIyMSBNY0dpdmVybiBTdCBXLCBXYWxrZXJ0b24sIE4wRyAyVjAifSx7Im5hbWUiOiJTb3V0aGxha2UgUmVnaW9uYWwgSGVhbHRoIENlbnRyZSIsImFkZHJlc3MiOiI1OTYgRGF2aXMgRHIsIE5ld21hcmtldCwgTDNZIDJQOSJ9LHsibmFtZSI6IlNvdXRod2VzdCBDZW50cmUgZm9yIEZvcmVuc2ljIE1lbnRhbCBIZWFsdGggQ2FyZSIsImFkZHJlc3MiOiI0MDEgU3Vuc2V0IERyLCBTdC4gVGhvbWFzLCBONVAgM1Y5In0seyJuYW1lIjoiU3QuIEpvc2VwaCdzIENhcmUgR3JvdXAgLSBMYWtlaGVhZCBQc3ljaGlhdHJpYyBIb3NwaXRhbCIsImFkZHJlc3MiOiI1ODAgQWxnb21hIFN0IE4sIFRodW5kZXIgQmF5LCBQN0EgOEM1In0seyJuYW1lIjoiU3QuIEpvc2VwaCdzIENhcmUgR3JvdXAgLSBTdC4gSm9zZXBoJ3MgSG9zcGl0YWwiLCJhZGRyZXNzIjoiMzUgQWxnb21hIFN0IE4sIFRodW5kZXIgQmF5LCBQN0IgNUc3In0seyJuYW1lIjoiU3QuIEpvc2VwaCdzIEhlYWx0aCBDYXJlIExvbmRvbiAtIFBhcmt3b29kIEluc3RpdHV0ZSIsImFkZHJlc3MiOiI1NTAgV2VsbGluZ3RvbiBSZCBTLCBMb25kb24sIE42QyAwQTcifSx7Im5hbWUiOiJTdC4gSm9zZXBoJ3MgSGVhbHRoIENhcmUgTG9uZG9uIC0gU3QuIEpvc2VwaCdzIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjI2OCBHcm9zdmVub3IgU3QsIExvbmRvbiwgTjZBIDRWMiJ9LHsibmFtZSI6IlN0LiBKb3NlcGgncyBIZWFsdGhjYXJlIEhhbWlsdG9uIC0gQ2hhcmx0b24gQ2FtcHVzIiwiYWRkcmVzcyI6IjUwIENoYXJsdG9uIEF2ZSBFLCBIYW1pbHRvbiwgTDhOIDRBNiJ9LHsibmFtZSI6IlN0LiBKb3NlcGgncyBIZWFsdGhjYXJlIEhhbWlsdG9uIC0gS2luZyBDYW1wdXMgVUNDIiwiYWRkcmVzcyI6IjI3NTcgS2luZyBTdCBFLCBIYW1pbHRvbiwgTDhHIDVFNCJ9LHsibmFtZSI6IlN0LiBKb3NlcGgncyBIZWFsdGhjYXJlIEhhbWlsdG9uIC0gV2VzdCA1dGggQ2FtcHVzIiwiYWRkcmVzcyI6IjEwMCBXZXN0IDV0aCBTdCwgSGFtaWx0b24sIEw5QyAwRTMifSx7Im5hbWUiOiJTdC4gTWFyeSdzIEdlbmVyYWwgSG9zcGl0YWwiLCJhZGRyZXNzIjoiOTExIFF1ZWVuJ3MgQmx2ZCwgS2l0Y2hlbmVyLCBOMk0gMUIyIn0seyJuYW1lIjoiU3QuIFRob21hcyBFbGdpbiBHZW5lcmFsIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjE4OSBFbG0gU3QsIFN0LiBUaG9tYXMsIE41UiA1QzQifSx7Im5hbWUiOiJTdGV2ZW5zb24gTWVtb3JpYWwgSG9zcGl0YWwiLCJhZGRyZXNzIjoiMjAwIEZsZXRjaGVyIENyZXMsIEFsbGlzdG9uLCBMOVIgMVc3In0seyJuYW1lIjoiU3RyYXRocm95IE1pZGRsZXNleCBHZW5lcmFsIEhvc3BpdGFsIiwiYWRkcmVzcyI6IjM5NSBDYXJyaWUgU3QsIFN0cmF0aHJveSwgTjdHIDNKNCJ9LHsibmFtZSI6IlN0dXJnZW9uIEZhbGxzIC0gV2VzdCBOaXBpc3NpbmcgR2VuZXJhbCBIb3NwaXRhbCIsImFkZHJlc3MiOiI3MjUgY2hlbWluIENvdXJzb2wgUmQsIFN0dXJnZW9uIEZhbGxzLCBQMkIgMlk2In0seyJuYW1lIjoiU3Vubnlicm9vayBIZWFsdGggU2NpZW5jZXMgQ2VudHJlIChTSFNDKSAtIEhvbGxhbmQgT3J0aG9wYWVkaWMgJiBBcnRocml0aWMgQ2VudHJlIiwiYWRkcmVzcyI6IjQzIFdlbGxlc2xleSBTdCBFLCBUb3JvbnRvLCBNNFkgMUgxIn0seyJuYW1lIjoiU3Vubnlicm9vayBIZWFsdGggU2NpZW5jZXMgQ2VudHJlIChTSFNDKSAtIFN0LiBKb2huJ3MgUmVoYWIiLCJhZGRyZXNzIjoiMjg1IEN1bW1lciBBdmUsIFRvcm9udG8sIE0yTSAyRzEifSx7Im5hbWUiOiJTdW5ueWJyb29rIEhlYWx0aCBTY2llbmNlcyBDZW50cmUgKFNIU0MpIC0gQmF5dmlldyBDYW1wdXMiLCJhZGRyZXNzIjoiMjA3NSBCYXl2aWV3IEF2ZSwgVG9yb250bywgTTROIDNNNSJ9LHsibmFtZSI6IlRoZSBIb3NwaXRhbCBmb3IgU2ljayBDaGlsZHJlbiAoU2lja0tpZHMpIiwiYWRkcmVzcyI6IjU1NSBVbml2ZXJzaXR5IEF2ZSwgVG9yb250bywgTTVHIDFYOCJ9LHsibmFtZSI6IlRoZSBPdHRhd2EgSG9zcGl0YWwgLSBDaXZpYyBDYW1wdXMiLCJhZGRyZXNzIjoiMTA1MyBDYXJsaW5nIEF2ZSwgT3R0YXdhLCBLMVkgNEU5In0seyJuYW1lIjoiVGhlIE90dGF3YSBIb3NwaXRhbCAtIEdlbmVyYWwgQ2FtcHVzIiwiYWRkcmVzcyI6IjUwMSBTbXl0aCBSZCwgT3R0YXdhLCBLMUggOEw2In0seyJuYW1lIjoiVGhlIE90dGF3YSBIb3NwaXRhbCAtIFJpdmVyc2lkZSBDYW1wdXMiLCJhZGRyZXNzIjoiMTk2NyBSaXZlcnNpZGUgRHIsIE90dGF3YSwgSzFIIDdXOSJ9LHsibmFtZSI6IlRoZSBXaWxsZXR0IEhvc3BpdGFsIiwiYWRkcmVzcyI6IjIzOCBHcmFuZCBSaXZlciBTdCBOLCBQYXJpcywgTjNMIDJONyJ9LHsibmFtZSI6IlRodW5kZXIgQmF5IFJlZ2lvbmFsIEhlYWx0aCBTY2llbmNlcyBDZW50cmUiLCJhZGRyZXNzIjoiOTgwIE9saXZlciBSZCwgVGh1bmRlciBCYXksIFA3QiA2VjQifSx7Im5hbWUiOiJUaWxsc29uYnVyZyBEaXN0cmljdCBNZW1vcmlhbCBIb3NwaXRhbCIsImFkZHJlc3MiOiIxNjcgUm9scGggU3QsIFRpbGxzb25idXJnLCBONEcgM1k5In0seyJuYW1lIjoiVGltbWlucyBhbmQgRGlzdHJpY3QgSG9zcGl0YWwiLCJhZGRyZXNzIjoiNzAwIFJvc3MgQXZlIEUsIFRpbW1pbnMsIFA0TiA4UDIifSx7Im5hbWUiOiJUb3JvbnRvIEdyYWNlIEhlYWx0aCBDZW50cmUiLCJhZGRyZXNzIjoiNjUwIENodXJjaCBTdCwgVG9yb250bywgTTRZIDJHNSJ9LHsibmFtZSI6IlRyaWxsaXVtIEhlYWx0aCBQYXJ0bmVycyAoVEhQKSAtIENyZWRpdCBWYWxsZXkgSG9zcGl0YWwiLCJhZGRyZXNzIjoiMjIwMCBFZ2xpbnRvbiBBdmUgVywgTWlzc2lzc2F1Z2EsIEw1TSAyTjEifSx7Im5hbWUiOiJUcmlsbGl1bSBIZWFsdGggUGFydG5lcnMgKFRIUCkgLSBNaXNzaXNzYXVnYSBIb3NwaXRhbCIsImFkZHJlc3MiOiIxMDAgUXVlZW5zd2F5IFcsIE1pc3Npc3NhdWdhLCBMNUIgMUI4In0seyJuYW1lIjoiVHJpbGxpdW0gSGVhbHRoIFBhcnRuZXJzIChUSFApIC0gUXVlZW5zd2F5IEhlYWx0aCBDZW50cmUiLCJhZGRyZXNzIjoiMTUwIFNoZXJ3YXkgRHIsIEV0b2JpY29rZSwgTTlDIDFBNSJ9LHsibmFtZSI6IlVuaXR5IEhlYWx0aCBUb3JvbnRvIC0gUHJvdmlkZW5jZSBIZWFsdGhjYXJlIiwiYWRkcmVzcyI6IjMyNzYgU3QgQ2xhaXIgQXZlIEUsIFRvcm9udG8sIE0xTCAxVzEifSx7Im5hbWUiOiJVbml0eSBIZWFsdGggVG9yb250byAtIFN0LiBKb3NlcGgncyBIZWFsdGggQ2VudHJlIiwiYWRkcmVzcyI6IjMwIFRoZSBRdWVlbnN3YXksIFRvcm9udG8sIE02UiAxQjUifSx7Im5hbWUiOiJVbml0eSBIZWFsdGggVG9yb250byAtIFN0LiBNaWNoYWVsJ3MgSG9zcGl0YWwiLCJhZGRyZXNzIjoiMzAgQm9uZCBTdCwgVG9yb250bywgTTVCIDFXOCJ9LHsibmFtZSI6IlVuaXZlcnNpdHkgSGVhbHRoIE5ldHdvcmsgKFVITikgLSBCaWNrbGUgQ2VudHJlIiwiYWRkcmVzcyI6IjEzMCBEdW5uIEF2ZSwgVG9yb250bywgTTZLIDJSNyJ9LHsibmFtZSI6IlVuaXZlcnNpdHkgSGVhbHRoIE5ldHdvcmsgKFVITikgLSBQcmluY2VzcyBNYXJnYXJldCBDYW5jZXIgQ2VudHJlIiwiYWRkcmVzcyI6IjYxMCBVbml2ZXJzaXR5IEF2ZSwgVG9yb250bywgTTVHIDJNOSJ9LHsibmFtZSI6IlVuaXZlcnNpdHkgSGVhbHRoIE5ldHdvcmsgKFVITikgLSBUb3JvbnRvIEdlbmVyYWwgSG9zcGl0YWwgKFRHSCkiLCJhZGRyZXNzIjoiMjAwIEVsaXphYmV0aCBTdCwgVG9yb250bywgTTVHIDJDNCJ9LHsibmFtZSI6IlVuaXZlcnNpdHkgSGVhbHRoIE5ldHdvcmsgKFVITikgLSBUb3JvbnRvIFJlaGFiaWxpdGF0aW9uIEluc3RpdHV0ZSAoVFJJKSIsImFkZHJlc3MiOiI1NTAgVW5pdmVyc2l0eSBBdmUsIFRvcm9udG8sIE01RyAyQTIifSx7Im5hbWUiOiJVbml2ZXJzaXR5IEhlYWx0aCBOZXR3b3JrIChVSE4pIC0gVG9yb250byBXZXN0ZXJuIEhvc3BpdGFsIChUV0gpIiwiYWRkcmVzcyI6IjM5OSBCYXRodXJzdCBTdCwgVG9yb250bywgTTVUIDJTOCJ9LHsibmFtZSI6IldheXBvaW50IENlbnRyZSBmb3IgTWVudGFsIEhlYWx0aCBDYXJlIiwiYWRkcmVzcyI6IjUwMCBMYWZvbnRhaW5lIFJkIFcsIFBlbmV0YW5ndWlzaGVuZSwgTDlNIDFHMyJ9LHsibmFtZSI6Ildlc3QgUGFycnkgU291bmQgSGVhbHRoIENlbnRyZSIsImFkZHJlc3MiOiI2IEFsYmVydCBTdCwgUGFycnkgU291bmQsIFAyQSAzQTQifSx7Im5hbWUiOiJXaWxsaWFtIE9zbGVyIEhlYWx0aCBTeXN0ZW0gKFdPSFMpIC0gUGVlbCBNZW1vcmlhbCBDZW50cmUgVUNDIiwiYWRkcmVzcyI6IjIwIEx5bmNoIFN0LCBCcmFtcHRvbiwgTDZXIDJaOCJ9LHsibmFtZSI6IldpbGxpYW0gT3NsZXIgSGVhbHRoIFN5c3RlbSAoV09IUykgLSBCcmFtcHRvbiBDaXZpYyBIb3NwaXRhbCIsImFkZHJlc3MiOiIyMTAwIEJvdmFpcmQgRHIgRSwgQnJhbXB0b24sIEw2UiAzSjcifSx7Im5hbWUiOiJXaWxsaWFtIE9zbGVyIEhlYWx0aCBTeXN0ZW0gKFdPSFMpIC0gRXRvYmljb2tlIEdlbmVyYWwgSG9zcGl0YWwiLCJhZGRyZXNzIjoiMTAxIEh1bWJlciBDb2xsZWdlIEJsdmQsIEV0b2JpY29rZSwgTTlWIDFSOCJ9LHsibmFtZSI6IldpbmNoZXN0ZXIgRGlzdHJpY3QgTWVtb3JpYWwgSG9zcGl0YWwiLCJhZGRyZXNzIjoiNTY2IExvdWlzZSBTdCwgV2luY2hlc3RlciwgSzBDIDJLMCJ9LHsibmFtZSI6IldpbmRzb3IgUmVnaW9uYWwgSG9zcGl0YWwgKFdSSCkgLSBNZXQgQ2FtcHVzIiwiYWRkcmVzcyI6IjE5OTUgTGVucyBBdmUsIFdpbmRzb3IsIE44VyAxTDkifSx7Im5hbWUiOiJXaW5kc29yIFJlZ2lvbmFsIEhvc3BpdGFsIChXUkgpIC0gT3VlbGxldHRlIENhbXB1cyIsImFkZHJlc3MiOiIxMDMwIE91ZWxsZXR0ZSBBdmUsIFdpbmRzb3IsIE45QSAxRTEifSx7Im5hbWUiOiJXaW5naGFtIGFuZCBEaXN0cmljdCBIb3NwaXRhbCIsImFkZHJlc3MiOiIyNzAgQ2FybGluZyBUZXJyYWNlLCBXaW5naGFtLCBOMEcgMlcwIn0seyJuYW1lIjoiV29tZW4ncyBDb2xsZWdlIEhvc3BpdGFsIChXQ0gpIiwiYWRkcmVzcyI6Ijc2IEdyZW52aWxsZSBTdCwgVG9yb250bywgTTVTIDFCMiJ9LHsibmFtZSI6Ildvb2RzdG9jayBIb3NwaXRhbCIsImFkZHJlc3MiOiIzMTAgSnVsaWFuYSBEciwgV29vZHN0b2NrLCBONFYgMEE0In1dfQ=="));
+const LOCATION_DATA=JSON.parse('{"locations":[{"name":"Alexandra Hospital Ingersoll","address":"29 Noxon St, Ingersoll, N5C 1B8"},{"name":"Almonte General Hospital","address":"75 Spring St, Almonte, K0A 1A0"},{"name":"Arnprior Regional Health","address":"350 John St N, Arnprior, K7S 2P6"},{"name":"Atikokan General Hospital","address":"120 Dorothy St, Atikokan, P0T 1C0"},{"name":"Attawapiskat Hospital","address":"1 Health Care Lane, Attawapiskat, P0L 1A0"},{"name":"Bancroft - Quinte Health North Hastings Hospital","address":"1H Manor Lane, Bancroft, K0L 1C0"},{"name":"Barry\'s Bay - St. Francis Memorial Hospital","address":"7 St. Francis Memorial Dr, Barry\'s Bay, K0J 1B0"},{"name":"Baycrest Hospital","address":"3560 Bathurst St, Toronto, M6A 2E1"},{"name":"Bingham Memorial Hospital","address":"507 8th Ave, Matheson, P0K 1N0"},{"name":"Blanche River Health - Englehart Site","address":"61 5th Ave, Englehart, P0J 1H0"},{"name":"Bluewater Health - Charlotte Eleanor Englehart Site","address":"450 Blanche St, Petrolia, N0N 1R0"},{"name":"Bluewater Health - Sarnia Site","address":"89 Norman St, Sarnia, N7T 6S3"},{"name":"Bracebridge - South Muskoka Memorial Hospital","address":"75 Ann St, Bracebridge, P1L 2E4"},{"name":"Brantford General Hospital","address":"200 Terrace Hill St, Brantford, N3R 1G9"},{"name":"Brightshores Health System - Lion\'s Head","address":"22 Moore St, Lion\'s Head, N0H 1W0"},{"name":"Brightshores Health System - Markdale","address":"220 Toronto St S, Markdale, N0C 1H0"},{"name":"Brightshores Health System - Meaford","address":"229 Nelson St W, Meaford, N4L 1A3"},{"name":"Brightshores Health System - Owen Sound","address":"1800 8th St E, Owen Sound, N4K 6M9"},{"name":"Brightshores Health System - Southampton","address":"340 High St, Southampton, N0H 2L0"},{"name":"Brightshores Health System - Wiarton","address":"369 Mary St, Wiarton, N0H 2T0"},{"name":"Brockville General Hospital - Charles St Site","address":"75 Charles St, Brockville, K6V 1S8"},{"name":"Bruy\\u00e8re Health - Saint-Vincent Hospital","address":"60 Cambridge St N, Ottawa, K1R 7A5"},{"name":"Bruy\\u00e8re Health - \\u00c9lisabeth Bruy\\u00e8re Hospital","address":"43 Bruy\\u00e8re St, Ottawa, K1N 5C8"},{"name":"Centre for Addiction and Mental Health (CAMH) - College St Site","address":"250 College St, Toronto, M5T 1R8"},{"name":"Centre for Addiction and Mental Health (CAMH) - Queen St Site","address":"1001 Queen St W, Toronto, M6J 1H4"},{"name":"Children\'s Hospital of Eastern Ontario (CHEO)","address":"401 Smyth Rd, Ottawa, K1H 8L1"},{"name":"Cambridge Memorial Hospital","address":"700 Coronation Blvd, Cambridge, N1R 3G2"},{"name":"Campbellford Memorial Hospital","address":"146 Oliver Rd, Campbellford, K0L 1L0"},{"name":"Carleton Place & District Memorial Hospital","address":"211 Lake Ave E, Carleton Place, K7C 1J4"},{"name":"Casey House Hospital","address":"119 Isabella St, Toronto, M4Y 1P2"},{"name":"Chapleau Health Services","address":"6 Broomhead Rd, Chapleau, P0M 1K0"},{"name":"Chatham-Kent Health Alliance - Chatham Site","address":"80 Grand Ave W, Chatham, N7L 1B7"},{"name":"Chatham-Kent Health Alliance - Wallaceburg Site","address":"325 Margaret Ave, Wallaceburg, N8A 2A7"},{"name":"Clinton Public Hospital","address":"98 Shipley St, Clinton, N0M 1L0"},{"name":"Collingwood General and Marine Hospital","address":"459 Hume St, Collingwood, L9Y 1W9"},{"name":"Cornwall Community Hospital - McConnell Site","address":"840 McConnell Ave, Cornwall, K6H 5S5"},{"name":"Deep River and District Health","address":"117 Banting Dr, Deep River, K0J 1P0"},{"name":"Dryden Regional Health Centre","address":"58 Goodall St, Dryden, P8N 2Z6"},{"name":"Dunnville - Haldimand War Memorial Hospital","address":"400 Broad St W, Dunnville, N1A 2P7"},{"name":"Elliot Lake - St. Joseph\'s General Hospital","address":"70 Spine Rd, Elliot Lake, P5A 1X2"},{"name":"Erie Shores HealthCare","address":"194 Talbot St W, Leamington, N8H 1N9"},{"name":"Espanola General Hospital","address":"822 Centre St, Espanola, P5E 1J3"},{"name":"Exeter - South Huron Hospital","address":"24 Huron St W, Exeter, N0M 1S2"},{"name":"Fort Albany Hospital","address":"1 Hospital Rd, Fort Albany, P0L 1H0"},{"name":"Fort Frances La Verendrye Hospital","address":"110 Victoria Ave, Fort Frances, P9A 2B7"},{"name":"Georgian Bay General Hospital","address":"1112 St. Andrew\'s Dr, Midland, L4R 4P4"},{"name":"Geraldton District Hospital","address":"500 Hogarth Ave W, Geraldton, P0T 1M0"},{"name":"Goderich - Alexandra Marine and General Hospital","address":"120 Napier St, Goderich, N7A 1W5"},{"name":"Grand River Hospital (GRH) - Freeport Campus","address":"3570 King St E, Kitchener, N2A 2W1"},{"name":"Grand River Hospital (GRH) - KW Campus","address":"835 King St W, Kitchener, N2G 1G3"},{"name":"Grimsby - West Lincoln Memorial Hospital","address":"169 Main St E, Grimsby, L3M 1P3"},{"name":"Groves Memorial Community Hospital","address":"131 Frederick Campbell St, Fergus, N1M 0H3"},{"name":"Guelph General Hospital","address":"115 Delhi St, Guelph, N1E 4J4"},{"name":"Hagersville - West Haldimand General Hospital","address":"75 Parkview Rd, Hagersville, N0A 1H0"},{"name":"Haliburton Highlands Health Services","address":"7199 Gelert Rd, Haliburton, K0M 1S0"},{"name":"Halton Healthcare - Georgetown Hospital","address":"1 Princess Anne Dr, Georgetown, L7G 2B8"},{"name":"Halton Healthcare - Milton District Hospital","address":"7030 Derry Rd, Milton, L9T 7H6"},{"name":"Halton Healthcare - Oakville Trafalgar Memorial Hospital","address":"3001 Hospital Gate, Oakville, L6M 0L8"},{"name":"Hamilton Health Sciences (HHS) - Hamilton General Hospital","address":"237 Barton St E, Hamilton, L8L 2X2"},{"name":"Hamilton Health Sciences (HHS) - Juravinski Hospital","address":"711 Concession St, Hamilton, L8V 1C3"},{"name":"Hamilton Health Sciences (HHS) - Main St West Urgent Care","address":"690 Main St W, Hamilton, L8S 1A4"},{"name":"Hamilton Health Sciences (HHS) - McMaster University Medical Centre (MUMC)","address":"1200 Main St W, Hamilton, L8N 3Z5"},{"name":"Hamilton Health Sciences (HHS) - St. Peter\'s Hospital","address":"88 Maplewood Ave, Hamilton, L8M 1W9"},{"name":"Hanover and District Hospital","address":"90 7th Ave, Hanover, N4N 1N1"},{"name":"Hawkesbury and District General Hospital","address":"1111 Ghislain St, Hawkesbury, K6A 3G5"},{"name":"Headwaters Health Care Centre","address":"100 Rolling Hills Dr, Orangeville, L9W 4X9"},{"name":"Health Sciences North - Ramsey Lake Health Centre","address":"41 Ramsey Lake Rd, Sudbury, P3E 5J1"},{"name":"Health Sciences North - Sudbury Outpatient Centre","address":"865 Regent St, Sudbury, P3E 3Y9"},{"name":"Hearst - Notre-Dame Hospital","address":"1405 Edward St, Hearst, P0L 1N0"},{"name":"Holland Bloorview Kids Rehabilitation Hospital","address":"150 Kilgour Rd, Toronto, M4G 1R8"},{"name":"Homewood Health Centre","address":"150 Delhi St, Guelph, N1E 6K9"},{"name":"Hornepayne Community Hospital","address":"278 Front St, Hornepayne, P0M 1Z0"},{"name":"Hotel Dieu Shaver Health and Rehabilitation Centre","address":"541 Glenridge Ave, St. Catharines, L2T 4C2"},{"name":"Humber River Health (HRH)","address":"1235 Wilson Ave, North York, M3M 0B2"},{"name":"Huron Perth Healthcare Alliance - St. Marys Memorial Hospital","address":"267 Queen St W, St. Marys, N4X 1B6"},{"name":"Huron Perth Healthcare Alliance - Stratford General Hospital","address":"46 General Hospital Dr, Stratford, N5A 2Y6"},{"name":"H\\u00f4pital Glengarry Memorial Hospital","address":"20260 County Rd 43, Alexandria, K0C 1A0"},{"name":"H\\u00f4pital Montfort","address":"713 Montreal Rd, Ottawa, K1K 0T2"},{"name":"H\\u00f4tel-Dieu Grace Healthcare","address":"1453 Prince Rd, Windsor, N9C 3Z4"},{"name":"Iroquois Falls - Anson General Hospital","address":"58 Anson Dr, Iroquois Falls, P0K 1E0"},{"name":"Joseph Brant Hospital","address":"1245 Lakeshore Rd, Burlington, L7S 0A2"},{"name":"Kapuskasing - Sensenbrenner Hospital","address":"101 Progress Cres, Kapuskasing, P5N 3H5"},{"name":"Kemptville District Hospital","address":"2675 Concession Rd, Kemptville, K0G 1J0"},{"name":"Kenora - Lake of The Woods District Hospital","address":"21 Sylvan St W, Kenora, P9N 3W7"},{"name":"Kincardine Site; South Bruce Grey Health Centre","address":"1199 Queen St, Kincardine, N2Z 1G6"},{"name":"Kingston Health Sciences Centre - Hotel Dieu Hospital","address":"166 Brock St, Kingston, K7L 5G2"},{"name":"Kingston Health Sciences Centre - Kingston General Hospital","address":"76 Stuart St, Kingston, K7L 2V7"},{"name":"Kirkland Lake - Blanche River Health","address":"145 Government Rd E, Kirkland Lake, P2N 3P4"},{"name":"Lady Dunn Health Centre","address":"17 Government Rd, Wawa, P0S 1K0"},{"name":"Lady Minto Hospital - Cochrane","address":"241 Eighth St, Cochrane, P0L 1C0"},{"name":"Lakeridge Health - Ajax Pickering Hospital","address":"580 Harwood Ave S, Ajax, L1S 2J4"},{"name":"Lakeridge Health - Bowmanville Hospital","address":"47 Liberty St S, Bowmanville, L1C 2N4"},{"name":"Lakeridge Health - Oshawa Hospital","address":"1 Hospital Ct, Oshawa, L1G 2B9"},{"name":"Lakeridge Health - Port Perry Hospital","address":"451 Paxton St, Port Perry, L9L 1L9"},{"name":"Lakeridge Health - Whitby Hospital","address":"300 Gordon St, Whitby, L1N 5T2"},{"name":"Lennox and Addington County General Hospital","address":"8 Richmond Park Dr, Napanee, K7R 2Z4"},{"name":"Listowel Memorial Hospital","address":"255 Elizabeth St E, Listowel, N4W 2P5"},{"name":"London Health Sciences Centre - University Hospital","address":"339 Windermere Rd, London, N6A 5A5"},{"name":"London Health Sciences Centre - Victoria Hospital","address":"800 Commissioners Rd E, London, N6A 5W9"},{"name":"Mackenzie Health - Cortellucci Vaughan Hospital","address":"3200 Major Mackenzie Dr W, Vaughan, L6A 4Z3"},{"name":"Mackenzie Health - Richmond Hill Hospital","address":"10 Trench St, Richmond Hill, L4C 4Z3"},{"name":"Manitoulin Health Centre - Little Current Site","address":"11 Meredith St, Little Current, P0P 1K0"},{"name":"Manitoulin Health Centre - Mindemoya Site","address":"2120 Hwy 551, Mindemoya, P0P 1S0"},{"name":"Manitouwadge General Hospital","address":"1 Health Care Cres, Manitouwadge, P0T 2C0"},{"name":"Mattawa Hospital","address":"217 Turcotte Park Rd, Mattawa, P0H 1V0"},{"name":"Michael Garron Hospital (MGH)","address":"825 Coxwell Ave, East York, M4C 3E7"},{"name":"Moose Factory - Weeneebayko Area Health Authority","address":"19 Hospital Dr, Moose Factory, P0L 1W0"},{"name":"Muskoka Algonquin Healthcare - Huntsville District Memorial Hospital","address":"100 Frank Miller Dr, Huntsville, P1H 1H7"},{"name":"New Liskeard - Temiskaming Hospital","address":"421 Shepherdson Rd, New Liskeard, P0J 1P0"},{"name":"Newbury - Four Counties Health Services","address":"1824 Concession Dr, Newbury, N0L 1Z0"},{"name":"Niagara Health - Fort Erie Urgent Care Centre","address":"230 Bertie St, Fort Erie, L2A 1Z2"},{"name":"Niagara Health - Greater Niagara General Site","address":"5546 Portage Rd, Niagara Falls, L2E 6X2"},{"name":"Niagara Health - Port Colborne Urgent Care Centre","address":"260 Sugarloaf St, Port Colborne, L3K 2N7"},{"name":"Niagara Health - St. Catharines Site","address":"1200 Fourth Ave, St. Catharines, L2S 0A9"},{"name":"Niagara Health - Welland County General Site","address":"65 Third St, Welland, L3B 4W6"},{"name":"North Bay Regional Health Centre","address":"50 College Dr, North Bay, P1B 5A4"},{"name":"North Shore Health Network - Blind River Site","address":"525 Causley St, Blind River, P0R 1B0"},{"name":"North Shore Health Network - Richards Landing Site","address":"1180 Richards St, Richards Landing, P0R 1J0"},{"name":"North Shore Health Network - Thessalon Site","address":"221 Algoma St, Thessalon, P0R 1L0"},{"name":"North Wellington Health Care - Louise Marshall Hospital","address":"630 Dublin St, Mount Forest, N0G 2L3"},{"name":"North Wellington Health Care - Palmerston and District Hospital","address":"500 Whites Rd, Palmerston, N0G 2P0"},{"name":"North York General Hospital (NYGH) - Branson Ambulatory Care Centre","address":"555 Finch Ave W, North York, M2R 1N5"},{"name":"North York General Hospital (NYGH) - General Site","address":"4001 Leslie St, North York, M2K 1E1"},{"name":"North of Superior - McCausland Hospital","address":"20B Cartier Rd, Terrace Bay, P0T 2W0"},{"name":"North of Superior - Wilson Memorial General Hospital","address":"26 Peninsula Rd, Marathon, P0T 2E0"},{"name":"Northumberland Hills Hospital","address":"1000 DePalma Dr, Cobourg, K9A 5W6"},{"name":"Oak Valley Health - Markham Stouffville Hospital","address":"381 Church St, Markham, L3P 7P3"},{"name":"Oak Valley Health - Uxbridge Hospital","address":"4 Campbell Dr, Uxbridge, L9P 1S4"},{"name":"Ontario Shores Centre for Mental Health Sciences","address":"700 Victoria St W, Whitby, L1N 2K5"},{"name":"Orillia Soldiers\' Memorial Hospital","address":"170 Colborne St W, Orillia, L3V 2Z3"},{"name":"Pembroke Regional Hospital","address":"705 Mackay St, Pembroke, K8A 1G8"},{"name":"Perth and Smiths Falls District Hospital - Perth Site","address":"33 Drummond St W, Perth, K7H 2K1"},{"name":"Perth and Smiths Falls District Hospital - Smiths Falls Site","address":"60 Cornelia St W, Smiths Falls, K7A 2H9"},{"name":"Peterborough Regional Health Centre","address":"1 Hospital Dr, Peterborough, K9J 7C6"},{"name":"Providence Care Hospital","address":"752 King St W, Kingston, K7L 4X3"},{"name":"Queensway Carleton Hospital","address":"3045 Baseline Rd, Ottawa, K2H 8P4"},{"name":"Quinte Health - Belleville General Hospital","address":"265 Dundas St E, Belleville, K8N 5A9"},{"name":"Quinte Health - Prince Edward County Memorial","address":"403 Main St E, Picton, K0K 2T0"},{"name":"Quinte Health - Trenton Memorial Hospital","address":"242 King St, Trenton, K8V 5S6"},{"name":"Red Lake Margaret Cochenour Memorial Hospital","address":"51 Hwy 105, Red Lake, P0V 2M0"},{"name":"Renfrew Victoria Hospital","address":"499 Raglan St N, Renfrew, K7V 1P6"},{"name":"Riverside Health Care - Emo Health Centre","address":"170 Front St, Emo, P0W 1E0"},{"name":"Riverside Health Care - Rainy River Health Centre","address":"115 4th St, Rainy River, P0W 1L0"},{"name":"Ross Memorial Hospital","address":"10 Angeline St N, Lindsay, K9V 4M8"},{"name":"Royal Ottawa Mental Health Centre","address":"1145 Carling Ave, Ottawa, K1Z 7K4"},{"name":"Royal Victoria Regional Health Centre","address":"201 Georgian Dr, Barrie, L4M 6M2"},{"name":"Runnymede Healthcare Centre","address":"625 Runnymede Rd, Toronto, M6S 3A3"},{"name":"Sault Area Hospital","address":"750 Great Northern Rd, Sault Ste. Marie, P6B 0A3"},{"name":"Scarborough Health Network (SHN)- Birchmount Hospital","address":"3030 Birchmount Rd, Scarborough, M1W 3W3"},{"name":"Scarborough Health Network (SHN) - Centenary Hospital","address":"2867 Ellesmere Rd, Scarborough, M1E 4B9"},{"name":"Scarborough Health Network (SHN) - General Hospital","address":"3050 Lawrence Ave E, Scarborough, M1P 2V5"},{"name":"Seaforth Community Hospital","address":"24 Centennial Dr, Seaforth, N0K 1W0"},{"name":"Simcoe - Norfolk General Hospital","address":"365 West St, Simcoe, N3Y 1T7"},{"name":"Sinai Health - Hennick Bridgepoint Hospital","address":"1 Bridgepoint Dr, Toronto, M4M 2B5"},{"name":"Sinai Health - Mount Sinai Hospital","address":"600 University Ave, Toronto, M5G 1X5"},{"name":"Sioux Lookout - Meno Ya Win Health Centre","address":"1 Meno Ya Win Way, Sioux Lookout, P8T 1B4"},{"name":"Smooth Rock Falls Hospital","address":"107 Kelly Rd, Smooth Rock Falls, P0L 2B0"},{"name":"South Bruce Grey Health Centre (SBGHC) - Chesley","address":"39 2nd St SE, Chesley, N0G 1L0"},{"name":"South Bruce Grey Health Centre (SBGHC) - Durham","address":"320 College St, Durham, N0G 1R0"},{"name":"South Bruce Grey Health Centre (SBGHC) - Walkerton","address":"21 McGivern St W, Walkerton, N0G 2V0"},{"name":"Southlake Regional Health Centre","address":"596 Davis Dr, Newmarket, L3Y 2P9"},{"name":"Southwest Centre for Forensic Mental Health Care","address":"401 Sunset Dr, St. Thomas, N5P 3V9"},{"name":"St. Joseph\'s Care Group - Lakehead Psychiatric Hospital","address":"580 Algoma St N, Thunder Bay, P7A 8C5"},{"name":"St. Joseph\'s Care Group - St. Joseph\'s Hospital","address":"35 Algoma St N, Thunder Bay, P7B 5G7"},{"name":"St. Joseph\'s Health Care London - Parkwood Institute","address":"550 Wellington Rd S, London, N6C 0A7"},{"name":"St. Joseph\'s Health Care London - St. Joseph\'s Hospital","address":"268 Grosvenor St, London, N6A 4V2"},{"name":"St. Joseph\'s Healthcare Hamilton - Charlton Campus","address":"50 Charlton Ave E, Hamilton, L8N 4A6"},{"name":"St. Joseph\'s Healthcare Hamilton - King Campus UCC","address":"2757 King St E, Hamilton, L8G 5E4"},{"name":"St. Joseph\'s Healthcare Hamilton - West 5th Campus","address":"100 West 5th St, Hamilton, L9C 0E3"},{"name":"St. Mary\'s General Hospital","address":"911 Queen\'s Blvd, Kitchener, N2M 1B2"},{"name":"St. Thomas Elgin General Hospital","address":"189 Elm St, St. Thomas, N5R 5C4"},{"name":"Stevenson Memorial Hospital","address":"200 Fletcher Cres, Alliston, L9R 1W7"},{"name":"Strathroy Middlesex General Hospital","address":"395 Carrie St, Strathroy, N7G 3J4"},{"name":"Sturgeon Falls - West Nipissing General Hospital","address":"725 chemin Coursol Rd, Sturgeon Falls, P2B 2Y6"},{"name":"Sunnybrook Health Sciences Centre (SHSC) - Holland Orthopaedic & Arthritic Centre","address":"43 Wellesley St E, Toronto, M4Y 1H1"},{"name":"Sunnybrook Health Sciences Centre (SHSC) - St. John\'s Rehab","address":"285 Cummer Ave, Toronto, M2M 2G1"},{"name":"Sunnybrook Health Sciences Centre (SHSC) - Bayview Campus","address":"2075 Bayview Ave, Toronto, M4N 3M5"},{"name":"The Hospital for Sick Children (SickKids)","address":"555 University Ave, Toronto, M5G 1X8"},{"name":"The Ottawa Hospital - Civic Campus","address":"1053 Carling Ave, Ottawa, K1Y 4E9"},{"name":"The Ottawa Hospital - General Campus","address":"501 Smyth Rd, Ottawa, K1H 8L6"},{"name":"The Ottawa Hospital - Riverside Campus","address":"1967 Riverside Dr, Ottawa, K1H 7W9"},{"name":"The Willett Hospital","address":"238 Grand River St N, Paris, N3L 2N7"},{"name":"Thunder Bay Regional Health Sciences Centre","address":"980 Oliver Rd, Thunder Bay, P7B 6V4"},{"name":"Tillsonburg District Memorial Hospital","address":"167 Rolph St, Tillsonburg, N4G 3Y9"},{"name":"Timmins and District Hospital","address":"700 Ross Ave E, Timmins, P4N 8P2"},{"name":"Toronto Grace Health Centre","address":"650 Church St, Toronto, M4Y 2G5"},{"name":"Trillium Health Partners (THP) - Credit Valley Hospital","address":"2200 Eglinton Ave W, Mississauga, L5M 2N1"},{"name":"Trillium Health Partners (THP) - Mississauga Hospital","address":"100 Queensway W, Mississauga, L5B 1B8"},{"name":"Trillium Health Partners (THP) - Queensway Health Centre","address":"150 Sherway Dr, Etobicoke, M9C 1A5"},{"name":"Unity Health Toronto - Providence Healthcare","address":"3276 St Clair Ave E, Toronto, M1L 1W1"},{"name":"Unity Health Toronto - St. Joseph\'s Health Centre","address":"30 The Queensway, Toronto, M6R 1B5"},{"name":"Unity Health Toronto - St. Michael\'s Hospital","address":"30 Bond St, Toronto, M5B 1W8"},{"name":"University Health Network (UHN) - Bickle Centre","address":"130 Dunn Ave, Toronto, M6K 2R7"},{"name":"University Health Network (UHN) - Princess Margaret Cancer Centre","address":"610 University Ave, Toronto, M5G 2M9"},{"name":"University Health Network (UHN) - Toronto General Hospital (TGH)","address":"200 Elizabeth St, Toronto, M5G 2C4"},{"name":"University Health Network (UHN) - Toronto Rehabilitation Institute (TRI)","address":"550 University Ave, Toronto, M5G 2A2"},{"name":"University Health Network (UHN) - Toronto Western Hospital (TWH)","address":"399 Bathurst St, Toronto, M5T 2S8"},{"name":"Waypoint Centre for Mental Health Care","address":"500 Lafontaine Rd W, Penetanguishene, L9M 1G3"},{"name":"West Parry Sound Health Centre","address":"6 Albert St, Parry Sound, P2A 3A4"},{"name":"William Osler Health System (WOHS) - Peel Memorial Centre UCC","address":"20 Lynch St, Brampton, L6W 2Z8"},{"name":"William Osler Health System (WOHS) - Brampton Civic Hospital","address":"2100 Bovaird Dr E, Brampton, L6R 3J7"},{"name":"William Osler Health System (WOHS) - Etobicoke General Hospital","address":"101 Humber College Blvd, Etobicoke, M9V 1R8"},{"name":"Winchester District Memorial Hospital","address":"566 Louise St, Winchester, K0C 2K0"},{"name":"Windsor Regional Hospital (WRH) - Met Campus","address":"1995 Lens Ave, Windsor, N8W 1L9"},{"name":"Windsor Regional Hospital (WRH) - Ouellette Campus","address":"1030 Ouellette Ave, Windsor, N9A 1E1"},{"name":"Wingham and District Hospital","address":"270 Carling Terrace, Wingham, N0G 2W0"},{"name":"Women\'s College Hospital (WCH)","address":"76 Grenville St, Toronto, M5S 1B2"},{"name":"Woodstock Hospital","address":"310 Juliana Dr, Woodstock, N4V 0A4"}],"index_url":null}');
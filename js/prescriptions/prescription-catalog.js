@@ -0,0 +1,2 @@
+// Auto-generated by build.py - do not edit
+const PRESCRIPTION_CATALOG=JSON.parse('{"source":{"file":"Prescriptions.xlsx","record_count":402},"chunks":[{"specialty":"Allergy","url":"js/prescriptions/chunks/allergy.json","count":10,"size":6237,"revision":"63c1e87465a2"},{"specialty":"Analgesia","url":"js/prescriptions/chunks/analgesia.json","count":25,"size":16849,"revision":"b8e890d0a792"},{"specialty":"Antiemetic","url":"js/prescriptions/chunks/antiemetic.json","count":9,"size":5567,"revision":"ce33a731e690"},{"specialty":"Anti-infective","url":"js/prescriptions/chunks/anti-infective.json","count":88,"size":49684,"revision":"d209257ee7c0"},{"specialty":"Neuro & Endocrine","url":"js/prescriptions/chunks/neuro-endocrine.json","count":8,"size":4592,"revision":"f0facb36f720"},{"specialty":"Eye","url":"js/prescriptions/chunks/eye.json","count":15,"size":9425,"revision":"4a4bc99cdb02"},{"specialty":"ENT","url":"js/prescriptions/chunks/ent.json","count":40,"size":23118,"revision":"40421d84e860"},{"specialty":"Cardiac & Heme","url":"js/prescriptions/chunks/cardiac-heme.json","count":22,"size":13556,"revision":"25769478d64f"},{"specialty":"Respiratory","url":"js/prescriptions/chunks/respiratory.json","count":31,"size":18354,"revision":"6752f34b3da1"},{"specialty":"GI","url":"js/prescriptions/chunks/gi.json","count":28,"size":15966,"revision":"da29b8c00bab"},{"specialty":"GU","url":"js/prescriptions/chunks/gu.json","count":11,"size":6169,"revision":"8af2fb0ce9ad"},{"specialty":"OBGYN","url":"js/prescriptions/chunks/obgyn.json","count":9,"size":5852,"revision":"811ea154c381"},{"specialty":"STI","url":"js/prescriptions/chunks/sti.json","count":7,"size":4110,"revision":"0e9b81ef9f88"},{"specialty":"Derm","url":"js/prescriptions/chunks/derm.json","count":44,"size":25822,"revision":"0e164bd403fa"},{"specialty":"Psych","url":"js/prescriptions/chunks/psych.json","count":3,"size":1755,"revision":"d8073d01dd08"},{"specialty":"Substance Use","url":"js/prescriptions/chunks/substance-use.json","count":38,"size":22720,"revision":"d2a57a91faf9"},{"specialty":"Non-Med","url":"js/prescriptions/chunks/non-med.json","count":14,"size":5810,"revision":"34ed502412f2"}],"counts":{"Adult":{"total":282,"specialties":{"Allergy":{"total":5,"subcategories":{}},"Analgesia":{"total":20,"subcategories":{}},"Antiemetic":{"total":6,"subcategories":{}},"Anti-infective":{"total":56,"subcategories":{}},"Neuro & Endocrine":{"total":8,"subcategories":{}},"Eye":{"total":8,"subcategories":{}},"ENT":{"total":24,"subcategories":{"Ear":9,"Nose":4,"Throat":3,"Other":8}},"Cardiac & Heme":{"total":22,"subcategories":{}},"Respiratory":{"total":17,"subcategories":{}},"GI":{"total":25,"subcategories":{}},"GU":{"total":8,"subcategories":{}},"OBGYN":{"total":9,"subcategories":{}},"STI":{"total":7,"subcategories":{}},"Derm":{"total":26,"subcategories":{}},"Psych":{"total":3,"subcategories":{}},"Substance Use":{"total":38,"subcategories":{"Withdrawal Management":16,"Symptom Relief":7,"Other":15}}}},"Pediatric":{"total":106,"specialties":{"Allergy":{"total":5,"subcategories":{}},"Analgesia":{"total":5,"subcategories":{}},"Antiemetic":{"total":3,"subcategories":{}},"Anti-infective":{"total":32,"subcategories":{}},"Eye":{"total":7,"subcategories":{}},"ENT":{"total":16,"subcategories":{"Ear":7,"Nose":3,"Throat":3,"Other":3}},"Respiratory":{"total":14,"subcategories":{}},"GI":{"total":3,"subcategories":{}},"GU":{"total":3,"subcategories":{}},"Derm":{"total":18,"subcategories":{}}}},"Non-Med":{"total":14,"specialties":{"Non-Med":{"total":14,"subcategories":{}}}}},"sites":[]}');
@@ -1,2 +0,0 @@
-// Auto-generated by build.py - do not edit
-const PRESCRIPTION_DATA=JSON.parse(atob("eyJzb3VyY2UiOnsiZmlsZSI6IlByZXNjcmlwdGlvbnMueGxzeCIsInJlY29yZF9jb3VudCI6NDAyfSwibWVkcyI6W3sic3BlY2lhbHR5IjoiQWxsZXJneSIsIm1lZCI6IkVwaW5lcGhyaW5lIGF1dG8taW5qZWN0b3IiLCJicmFuZHMiOlsiRXBpUGVuIiwiQWxsZXJqZWN0IiwiQXV2aS1RIl0sImluZGljYXRpb24iOiJBbmFwaHlsYXhpcyIsImRvc2VfdGV4dCI6IjAuM21nIiwicm91dGUiOiJJTSIsImZyZXF1ZW5jeSI6IiIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxIGRldmljZSIsInBybiI6ImFuYXBoeWxheGlzIiwiZm9ybSI6ImRldmljZSIsImNvbW1lbnRzIjoiUGhhcm1hY2lzdCBtYXkgZGlzcGVuc2UgZ2VuZXJpYyBvciBicmFuZCAoZS5nLiBFcGlQZW4sIEFsbGVyamVjdCwgQXV2aS1RKSBwZXIgcGF0aWVudCBwcmVmZXJlbmNlIG9yIGRldmljZSBhdmFpbGFiaWxpdHkuIFlvdSBtdXN0IHByZXNlbnQgdG8gRUQgYWZ0ZXIgdXNpbmcgdGhlIGRldmljZSBlYWNoIHRpbWUuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIxIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFsbGVyZ3kgfCBhZHVsdCB8IGFuYXBoeWxheGlzIHwgZXBpbmVwaHJpbmUgYXV0by1pbmplY3RvciB8IGVwaXBlbiBhbGxlcmplY3QgYXV2aS1xIHwgMC4zbWcgfCBhbmFwaHlsYXhpcyB8IHBoYXJtYWNpc3QgbWF5IGRpc3BlbnNlIGdlbmVyaWMgb3IgYnJhbmQgKGUuZy4gZXBpcGVuLCBhbGxlcmplY3QsIGF1dmktcSkgcGVyIHBhdGllbnQgcHJlZmVyZW5jZSBvciBkZXZpY2UgYXZhaWxhYmlsaXR5LiB5b3UgbXVzdCBwcmVzZW50IHRvIGVkIGFmdGVyIHVzaW5nIHRoZSBkZXZpY2UgZWFjaCB0aW1lLiJ9LHsic3BlY2lhbHR5IjoiQWxsZXJneSIsIm1lZCI6IkRpcGhlbmh5ZHJhbWluZSIsImJyYW5kcyI6WyJCZW5hZHJ5bCJdLCJpbmRpY2F0aW9uIjoiQWxsZXJneSBzeW1wdG9tcyIsImRvc2VfdGV4dCI6IjI1LTUwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicTQtNmgiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMjQgdGFiIiwicHJuIjoiYWxsZXJneSIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6Ik1heGltdW0gMjVtZyBlYWNoIHRpbWUgaWYgZWxkZXJseSBvciBrbm93biBoZXBhdGljIGlzc3Vlcy4gTGltaXQgdXNlIHRvIG1heGltdW0gMyBkYXlzLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbGxlcmd5IHwgYWR1bHQgfCBhbGxlcmd5IHN5bXB0b21zIHwgZGlwaGVuaHlkcmFtaW5lIHwgYmVuYWRyeWwgfCAyNS01MG1nIHwgYWxsZXJneSB8IG1heGltdW0gMjVtZyBlYWNoIHRpbWUgaWYgZWxkZXJseSBvciBrbm93biBoZXBhdGljIGlzc3Vlcy4gbGltaXQgdXNlIHRvIG1heGltdW0gMyBkYXlzLiJ9LHsic3BlY2lhbHR5IjoiQWxsZXJneSIsIm1lZCI6IkNldGlyaXppbmUiLCJicmFuZHMiOlsiUmVhY3RpbmUiLCJaeXJ0ZWMiXSwiaW5kaWNhdGlvbiI6IkFsbGVyZ3kgc3ltcHRvbXMiLCJkb3NlX3RleHQiOiIxMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiMTQgdGFiIiwicHJuIjoiYWxsZXJneSIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6Ik1heSBpbmNyZWFzZSB0byAxMG1nIHR3aWNlIGRhaWx5IGFzIG5lZWRlZC4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYWxsZXJneSB8IGFkdWx0IHwgYWxsZXJneSBzeW1wdG9tcyB8IGNldGlyaXppbmUgfCByZWFjdGluZSB6eXJ0ZWMgfCAxMG1nIHwgYWxsZXJneSB8IG1heSBpbmNyZWFzZSB0byAxMG1nIHR3aWNlIGRhaWx5IGFzIG5lZWRlZC4ifSx7InNwZWNpYWx0eSI6IkFsbGVyZ3kiLCJtZWQiOiJIeWRyb3h5emluZSIsImJyYW5kcyI6WyJBdGFyYXgiLCJWaXN0YXJpbCJdLCJpbmRpY2F0aW9uIjoiQWxsZXJneSBzeW1wdG9tcyIsImRvc2VfdGV4dCI6IjI1bWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiUUlEIiwiZHVyYXRpb24iOiI1IGRheSIsImRpc3BlbnNlIjoiMjAgdGFiIiwicHJuIjoiYWxsZXJneSIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkNhbiBjYXVzZSBzZWRhdGlvbjsgY29uc2lkZXIgc3RhcnRpbmcgYXQgMjUtNTBtZyBvbmNlIGRhaWx5IGFzIG5lZWRlZCBhdCBiZWR0aW1lLiBBdm9pZCBpbiBwcmVnbmFuY3kuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFsbGVyZ3kgfCBhZHVsdCB8IGFsbGVyZ3kgc3ltcHRvbXMgfCBoeWRyb3h5emluZSB8IGF0YXJheCB2aXN0YXJpbCB8IDI1bWcgfCBhbGxlcmd5IHwgY2FuIGNhdXNlIHNlZGF0aW9uOyBjb25zaWRlciBzdGFydGluZyBhdCAyNS01MG1nIG9uY2UgZGFpbHkgYXMgbmVlZGVkIGF0IGJlZHRpbWUuIGF2b2lkIGluIHByZWduYW5jeS4ifSx7InNwZWNpYWx0eSI6IkFsbGVyZ3kiLCJtZWQiOiJQcmVkbmlzb25lIiwiYnJhbmRzIjpbIldpbnByZWQiLCJEZWx0YXNvbmUiLCJSYXlvcyJdLCJpbmRpY2F0aW9uIjoiQW5naW9lZGVtYSIsImRvc2VfdGV4dCI6IjUwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiI1IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6Ik1heSBjYXVzZSBzdG9tYWNoIGlycml0YXRpb24sIHRha2Ugd2l0aCBmb29kLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbGxlcmd5IHwgYWR1bHQgfCBhbmdpb2VkZW1hIHwgcHJlZG5pc29uZSB8IHdpbnByZWQgZGVsdGFzb25lIHJheW9zIHwgNTBtZyB8IG1heSBjYXVzZSBzdG9tYWNoIGlycml0YXRpb24sIHRha2Ugd2l0aCBmb29kLiJ9LHsic3BlY2lhbHR5IjoiQWxsZXJneSIsIm1lZCI6IkVwaW5lcGhyaW5lIGF1dG8taW5qZWN0b3IiLCJicmFuZHMiOlsiRXBpUGVuIEpyIiwiQWxsZXJqZWN0IiwiQXV2aS1RIl0sImluZGljYXRpb24iOiJBbmFwaHlsYXhpcyIsImRvc2VfdGV4dCI6IjAuMTVtZyIsInJvdXRlIjoiSU0iLCJmcmVxdWVuY3kiOiIiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMSBkZXZpY2UiLCJwcm4iOiJhbmFwaHlsYXhpcyIsImZvcm0iOiJkZXZpY2UiLCJjb21tZW50cyI6IkZvciB3ZWlnaHQgPDMwa2cgKDY2bGIpLiBQaGFybWFjaXN0IG1heSBkaXNwZW5zZSBnZW5lcmljIG9yIGJyYW5kIChlLmcuIEVwaVBlbiwgQWxsZXJqZWN0LCBBdXZpLVEpIHBlciBwYXRpZW50IHByZWZlcmVuY2Ugb3IgZGV2aWNlIGF2YWlsYWJpbGl0eS4gWW91IG11c3QgcHJlc2VudCB0byBFRCBhZnRlciB1c2luZyB0aGUgZGV2aWNlIGVhY2ggdGltZS4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIxIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFsbGVyZ3kgfCBwZWRpYXRyaWMgfCBhbmFwaHlsYXhpcyB8IGVwaW5lcGhyaW5lIGF1dG8taW5qZWN0b3IgfCBlcGlwZW4ganIgYWxsZXJqZWN0IGF1dmktcSB8IDAuMTVtZyB8IGFuYXBoeWxheGlzIHwgZm9yIHdlaWdodCA8MzBrZyAoNjZsYikuIHBoYXJtYWNpc3QgbWF5IGRpc3BlbnNlIGdlbmVyaWMgb3IgYnJhbmQgKGUuZy4gZXBpcGVuLCBhbGxlcmplY3QsIGF1dmktcSkgcGVyIHBhdGllbnQgcHJlZmVyZW5jZSBvciBkZXZpY2UgYXZhaWxhYmlsaXR5LiB5b3UgbXVzdCBwcmVzZW50IHRvIGVkIGFmdGVyIHVzaW5nIHRoZSBkZXZpY2UgZWFjaCB0aW1lLiJ9LHsic3BlY2lhbHR5IjoiQWxsZXJneSIsIm1lZCI6IkVwaW5lcGhyaW5lIGF1dG8taW5qZWN0b3IiLCJicmFuZHMiOlsiRXBpUGVuIiwiQWxsZXJqZWN0IiwiQXV2aS1RIl0sImluZGljYXRpb24iOiJBbmFwaHlsYXhpcyIsImRvc2VfdGV4dCI6IjAuM21nIiwicm91dGUiOiJJTSIsImZyZXF1ZW5jeSI6IiIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxIGRldmljZSIsInBybiI6ImFuYXBoeWxheGlzIiwiZm9ybSI6ImRldmljZSIsImNvbW1lbnRzIjoiRm9yIHdlaWdodCBcdTIyNjUzMGtnICg2NmxiKS4gUGhhcm1hY2lzdCBtYXkgZGlzcGVuc2UgZ2VuZXJpYyBvciBicmFuZCAoZS5nLiBFcGlQZW4sIEFsbGVyamVjdCwgQXV2aS1RKSBwZXIgcGF0aWVudCBwcmVmZXJlbmNlIG9yIGRldmljZSBhdmFpbGFiaWxpdHkuIFlvdSBtdXN0IHByZXNlbnQgdG8gRUQgYWZ0ZXIgdXNpbmcgdGhlIGRldmljZSBlYWNoIHRpbWUuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbGxlcmd5IHwgcGVkaWF0cmljIHwgYW5hcGh5bGF4aXMgfCBlcGluZXBocmluZSBhdXRvLWluamVjdG9yIHwgZXBpcGVuIGFsbGVyamVjdCBhdXZpLXEgfCAwLjNtZyB8IGFuYXBoeWxheGlzIHwgZm9yIHdlaWdodCBcdTIyNjUzMGtnICg2NmxiKS4gcGhhcm1hY2lzdCBtYXkgZGlzcGVuc2UgZ2VuZXJpYyBvciBicmFuZCAoZS5nLiBlcGlwZW4sIGFsbGVyamVjdCwgYXV2aS1xKSBwZXIgcGF0aWVudCBwcmVmZXJlbmNlIG9yIGRldmljZSBhdmFpbGFiaWxpdHkuIHlvdSBtdXN0IHByZXNlbnQgdG8gZWQgYWZ0ZXIgdXNpbmcgdGhlIGRldmljZSBlYWNoIHRpbWUuIn0seyJzcGVjaWFsdHkiOiJBbGxlcmd5IiwibWVkIjoiQ2V0aXJpemluZSIsImJyYW5kcyI6WyJSZWFjdGluZSIsIlp5cnRlYyJdLCJpbmRpY2F0aW9uIjoiQWxsZXJneSBzeW1wdG9tcyIsImRvc2VfdGV4dCI6IjIuNW1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiI1IGRheSIsImRpc3BlbnNlIjoiIiwicHJuIjoiYWxsZXJneSIsImZvcm0iOiJzb2x1dGlvbiIsImNvbW1lbnRzIjoiRm9yIGFnZSA2IG1vbnRocyB0byBsZXNzIHRoYW4gMiB5ZWFycy4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFsbGVyZ3kgfCBwZWRpYXRyaWMgfCBhbGxlcmd5IHN5bXB0b21zIHwgY2V0aXJpemluZSB8IHJlYWN0aW5lIHp5cnRlYyB8IDIuNW1nIHwgYWxsZXJneSB8IGZvciBhZ2UgNiBtb250aHMgdG8gbGVzcyB0aGFuIDIgeWVhcnMuIn0seyJzcGVjaWFsdHkiOiJBbGxlcmd5IiwibWVkIjoiQ2V0aXJpemluZSIsImJyYW5kcyI6WyJSZWFjdGluZSIsIlp5cnRlYyJdLCJpbmRpY2F0aW9uIjoiQWxsZXJneSBzeW1wdG9tcyIsImRvc2VfdGV4dCI6IjIuNS01bWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiIiLCJwcm4iOiJhbGxlcmd5IiwiZm9ybSI6InNvbHV0aW9uIiwiY29tbWVudHMiOiJGb3IgYWdlIDItNSB5ZWFycy4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFsbGVyZ3kgfCBwZWRpYXRyaWMgfCBhbGxlcmd5IHN5bXB0b21zIHwgY2V0aXJpemluZSB8IHJlYWN0aW5lIHp5cnRlYyB8IDIuNS01bWcgfCBhbGxlcmd5IHwgZm9yIGFnZSAyLTUgeWVhcnMuIn0seyJzcGVjaWFsdHkiOiJBbGxlcmd5IiwibWVkIjoiQ2V0aXJpemluZSIsImJyYW5kcyI6WyJSZWFjdGluZSIsIlp5cnRlYyJdLCJpbmRpY2F0aW9uIjoiQWxsZXJneSBzeW1wdG9tcyIsImRvc2VfdGV4dCI6IjUtMTBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJPRCIsImR1cmF0aW9uIjoiNSBkYXkiLCJkaXNwZW5zZSI6IiIsInBybiI6ImFsbGVyZ3kiLCJmb3JtIjoic29sdXRpb24iLCJjb21tZW50cyI6IkZvciBhZ2UgZ3JlYXRlciB0aGFuIDUgeWVhcnMuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbGxlcmd5IHwgcGVkaWF0cmljIHwgYWxsZXJneSBzeW1wdG9tcyB8IGNldGlyaXppbmUgfCByZWFjdGluZSB6eXJ0ZWMgfCA1LTEwbWcgfCBhbGxlcmd5IHwgZm9yIGFnZSBncmVhdGVyIHRoYW4gNSB5ZWFycy4ifSx7InNwZWNpYWx0eSI6IkFuYWxnZXNpYSIsIm1lZCI6IkFjZXRhbWlub3BoZW4iLCJicmFuZHMiOlsiUGFyYWNldGFtb2wiLCJUeWxlbm9sIl0sImluZGljYXRpb24iOiJQYWluL2ZldmVyIiwiZG9zZV90ZXh0IjoiNjUwLTk3NW1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InE0aCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiI3IGRheSIsInBybiI6InBhaW4vZmV2ZXIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJNYXhpbXVtIDQwMDBtZyBwZXIgMjQgaG91cnMgZnJvbSBhbGwgc291cmNlcy4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW5hbGdlc2lhIHwgYWR1bHQgfCBwYWluL2ZldmVyIHwgYWNldGFtaW5vcGhlbiB8IHBhcmFjZXRhbW9sIHR5bGVub2wgfCA2NTAtOTc1bWcgfCBwYWluL2ZldmVyIHwgbWF4aW11bSA0MDAwbWcgcGVyIDI0IGhvdXJzIGZyb20gYWxsIHNvdXJjZXMuIn0seyJzcGVjaWFsdHkiOiJBbmFsZ2VzaWEiLCJtZWQiOiJJYnVwcm9mZW4iLCJicmFuZHMiOlsiQWR2aWwiLCJNb3RyaW4iXSwiaW5kaWNhdGlvbiI6IlBhaW4iLCJkb3NlX3RleHQiOiIyMDAtNDAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicTRoIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjcgZGF5IiwicHJuIjoicGFpbiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6Ik1heGltdW0gMjQwMG1nIHBlciAyNCBob3Vycy4gTWF5IGNhdXNlIHN0b21hY2ggaXJyaXRhdGlvbiwgdGFrZSB3aXRoIGZvb2QuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFuYWxnZXNpYSB8IGFkdWx0IHwgcGFpbiB8IGlidXByb2ZlbiB8IGFkdmlsIG1vdHJpbiB8IDIwMC00MDBtZyB8IHBhaW4gfCBtYXhpbXVtIDI0MDBtZyBwZXIgMjQgaG91cnMuIG1heSBjYXVzZSBzdG9tYWNoIGlycml0YXRpb24sIHRha2Ugd2l0aCBmb29kLiJ9LHsic3BlY2lhbHR5IjoiQW5hbGdlc2lhIiwibWVkIjoiS2V0b3JvbGFjIiwiYnJhbmRzIjpbIlRvcmFkb2wiXSwiaW5kaWNhdGlvbiI6IlBhaW4iLCJkb3NlX3RleHQiOiIxMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InE2aCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIyMCB0YWIiLCJwcm4iOiJwYWluIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiTWF4aW11bSA0MG1nIHBlciAyNCBob3Vycy4gTWF5IGNhdXNlIHN0b21hY2ggaXJyaXRhdGlvbiwgdGFrZSB3aXRoIGZvb2QuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFuYWxnZXNpYSB8IGFkdWx0IHwgcGFpbiB8IGtldG9yb2xhYyB8IHRvcmFkb2wgfCAxMG1nIHwgcGFpbiB8IG1heGltdW0gNDBtZyBwZXIgMjQgaG91cnMuIG1heSBjYXVzZSBzdG9tYWNoIGlycml0YXRpb24sIHRha2Ugd2l0aCBmb29kLiJ9LHsic3BlY2lhbHR5IjoiQW5hbGdlc2lhIiwibWVkIjoiTmFwcm94ZW4iLCJicmFuZHMiOlsiQWxldmUiLCJOYXByb3N5biJdLCJpbmRpY2F0aW9uIjoiUGFpbiIsImRvc2VfdGV4dCI6IjM3NW1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxNCB0YWIiLCJwcm4iOiJwYWluIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiRG8gbm90IHRha2Ugd2l0aCBvdGhlciBOU0FJRHMgKGUuZy4gaWJ1cHJvZmVuKS4gTWF5IHRha2Ugd2l0aCBUeWxlbm9sLiBNYXkgY2F1c2Ugc3RvbWFjaCBpcnJpdGF0aW9uLCB0YWtlIHdpdGggZm9vZC4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW5hbGdlc2lhIHwgYWR1bHQgfCBwYWluIHwgbmFwcm94ZW4gfCBhbGV2ZSBuYXByb3N5biB8IDM3NW1nIHwgcGFpbiB8IGRvIG5vdCB0YWtlIHdpdGggb3RoZXIgbnNhaWRzIChlLmcuIGlidXByb2ZlbikuIG1heSB0YWtlIHdpdGggdHlsZW5vbC4gbWF5IGNhdXNlIHN0b21hY2ggaXJyaXRhdGlvbiwgdGFrZSB3aXRoIGZvb2QuIn0seyJzcGVjaWFsdHkiOiJBbmFsZ2VzaWEiLCJtZWQiOiJOYXByb3hlbiIsImJyYW5kcyI6WyJBbGV2ZSIsIk5hcHJvc3luIl0sImluZGljYXRpb24iOiJQYWluIiwiZG9zZV90ZXh0IjoiNTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjI4IHRhYiIsInBybiI6InBhaW4iLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJEbyBub3QgdGFrZSB3aXRoIG90aGVyIE5TQUlEcyAoZS5nLiBpYnVwcm9mZW4pLiBNYXkgdGFrZSB3aXRoIFR5bGVub2wuIE1heSBjYXVzZSBzdG9tYWNoIGlycml0YXRpb24sIHRha2Ugd2l0aCBmb29kLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbmFsZ2VzaWEgfCBhZHVsdCB8IHBhaW4gfCBuYXByb3hlbiB8IGFsZXZlIG5hcHJvc3luIHwgNTAwbWcgfCBwYWluIHwgZG8gbm90IHRha2Ugd2l0aCBvdGhlciBuc2FpZHMgKGUuZy4gaWJ1cHJvZmVuKS4gbWF5IHRha2Ugd2l0aCB0eWxlbm9sLiBtYXkgY2F1c2Ugc3RvbWFjaCBpcnJpdGF0aW9uLCB0YWtlIHdpdGggZm9vZC4ifSx7InNwZWNpYWx0eSI6IkFuYWxnZXNpYSIsIm1lZCI6IlR5bGVub2wgd2l0aCBDb2RlaW5lIE5vLiAxIiwiYnJhbmRzIjpbIlR5bGVub2wgTm8uIDEiLCJUeWxlbm9sICMxIiwiTGVub2x0ZWMgTm8uIDEiLCJMZW5vbHRlYyAjMSJdLCJpbmRpY2F0aW9uIjoiUGFpbiIsImRvc2VfdGV4dCI6IjEtMiB0YWIiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicTRoIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjIwIHRhYiIsInBybiI6InBhaW4iLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJNYXhpbXVtIGFjZXRhbWlub3BoZW4gNDAwMG1nL2NvZGVpbmUgMzYwbWcgcGVyIDI0IGhvdXJzIGZyb20gYWxsIHNvdXJjZXMuIFdhdGNoIGZvciBzZWRhdGlvbi4gRG8gbm90IGRyaXZlIG9yIG9wZXJhdGUgaGVhdnkgbWFjaGluZXJ5LiBUYWtlIG1pbmltdW0gYW1vdW50IHRvIGFjaGlldmUgcGFpbiBjb250cm9sLiBDb25zaWRlciBzdG9vbCBzb2Z0ZW5lciB3aGlsZSB0YWtpbmcgbWVkaWNhdGlvbi4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW5hbGdlc2lhIHwgYWR1bHQgfCBwYWluIHwgdHlsZW5vbCB3aXRoIGNvZGVpbmUgbm8uIDEgfCB0eWxlbm9sIG5vLiAxIHR5bGVub2wgIzEgbGVub2x0ZWMgbm8uIDEgbGVub2x0ZWMgIzEgfCAxLTIgdGFiIHwgcGFpbiB8IG1heGltdW0gYWNldGFtaW5vcGhlbiA0MDAwbWcvY29kZWluZSAzNjBtZyBwZXIgMjQgaG91cnMgZnJvbSBhbGwgc291cmNlcy4gd2F0Y2ggZm9yIHNlZGF0aW9uLiBkbyBub3QgZHJpdmUgb3Igb3BlcmF0ZSBoZWF2eSBtYWNoaW5lcnkuIHRha2UgbWluaW11bSBhbW91bnQgdG8gYWNoaWV2ZSBwYWluIGNvbnRyb2wuIGNvbnNpZGVyIHN0b29sIHNvZnRlbmVyIHdoaWxlIHRha2luZyBtZWRpY2F0aW9uLiJ9LHsic3BlY2lhbHR5IjoiQW5hbGdlc2lhIiwibWVkIjoiVHlsZW5vbCB3aXRoIENvZGVpbmUgTm8uIDIiLCJicmFuZHMiOlsiVHlsZW5vbCBOby4gMiIsIlR5bGVub2wgIzIiLCJMZW5vbHRlYyBOby4gMiIsIkxlbm9sdGVjICMyIl0sImluZGljYXRpb24iOiJQYWluIiwiZG9zZV90ZXh0IjoiMS0yIHRhYiIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxNGgiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMjAgdGFiIiwicHJuIjoicGFpbiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6Ik1heGltdW0gYWNldGFtaW5vcGhlbiA0MDAwbWcvY29kZWluZSAzNjBtZyBwZXIgMjQgaG91cnMgZnJvbSBhbGwgc291cmNlcy4gV2F0Y2ggZm9yIHNlZGF0aW9uLiBEbyBub3QgZHJpdmUgb3Igb3BlcmF0ZSBoZWF2eSBtYWNoaW5lcnkuIFRha2UgbWluaW11bSBhbW91bnQgdG8gYWNoaWV2ZSBwYWluIGNvbnRyb2wuIENvbnNpZGVyIHN0b29sIHNvZnRlbmVyIHdoaWxlIHRha2luZyBtZWRpY2F0aW9uLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbmFsZ2VzaWEgfCBhZHVsdCB8IHBhaW4gfCB0eWxlbm9sIHdpdGggY29kZWluZSBuby4gMiB8IHR5bGVub2wgbm8uIDIgdHlsZW5vbCAjMiBsZW5vbHRlYyBuby4gMiBsZW5vbHRlYyAjMiB8IDEtMiB0YWIgfCBwYWluIHwgbWF4aW11bSBhY2V0YW1pbm9waGVuIDQwMDBtZy9jb2RlaW5lIDM2MG1nIHBlciAyNCBob3VycyBmcm9tIGFsbCBzb3VyY2VzLiB3YXRjaCBmb3Igc2VkYXRpb24uIGRvIG5vdCBkcml2ZSBvciBvcGVyYXRlIGhlYXZ5IG1hY2hpbmVyeS4gdGFrZSBtaW5pbXVtIGFtb3VudCB0byBhY2hpZXZlIHBhaW4gY29udHJvbC4gY29uc2lkZXIgc3Rvb2wgc29mdGVuZXIgd2hpbGUgdGFraW5nIG1lZGljYXRpb24uIn0seyJzcGVjaWFsdHkiOiJBbmFsZ2VzaWEiLCJtZWQiOiJUeWxlbm9sIHdpdGggQ29kZWluZSBOby4gMyIsImJyYW5kcyI6WyJUeWxlbm9sIE5vLiAzIiwiVHlsZW5vbCAjMyIsIkxlbm9sdGVjIE5vLiAzIiwiTGVub2x0ZWMgIzMiXSwiaW5kaWNhdGlvbiI6IlBhaW4iLCJkb3NlX3RleHQiOiIxLTIgdGFiIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InE0aCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIyMCB0YWIiLCJwcm4iOiJwYWluIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiTWF4aW11bSBhY2V0YW1pbm9waGVuIDQwMDBtZy9jb2RlaW5lIDM2MG1nIHBlciAyNCBob3VycyBmcm9tIGFsbCBzb3VyY2VzLiBXYXRjaCBmb3Igc2VkYXRpb24uIERvIG5vdCBkcml2ZSBvciBvcGVyYXRlIGhlYXZ5IG1hY2hpbmVyeS4gVGFrZSBtaW5pbXVtIGFtb3VudCB0byBhY2hpZXZlIHBhaW4gY29udHJvbC4gQ29uc2lkZXIgc3Rvb2wgc29mdGVuZXIgd2hpbGUgdGFraW5nIG1lZGljYXRpb24uIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFuYWxnZXNpYSB8IGFkdWx0IHwgcGFpbiB8IHR5bGVub2wgd2l0aCBjb2RlaW5lIG5vLiAzIHwgdHlsZW5vbCBuby4gMyB0eWxlbm9sICMzIGxlbm9sdGVjIG5vLiAzIGxlbm9sdGVjICMzIHwgMS0yIHRhYiB8IHBhaW4gfCBtYXhpbXVtIGFjZXRhbWlub3BoZW4gNDAwMG1nL2NvZGVpbmUgMzYwbWcgcGVyIDI0IGhvdXJzIGZyb20gYWxsIHNvdXJjZXMuIHdhdGNoIGZvciBzZWRhdGlvbi4gZG8gbm90IGRyaXZlIG9yIG9wZXJhdGUgaGVhdnkgbWFjaGluZXJ5LiB0YWtlIG1pbmltdW0gYW1vdW50IHRvIGFjaGlldmUgcGFpbiBjb250cm9sLiBjb25zaWRlciBzdG9vbCBzb2Z0ZW5lciB3aGlsZSB0YWtpbmcgbWVkaWNhdGlvbi4ifSx7InNwZWNpYWx0eSI6IkFuYWxnZXNpYSIsIm1lZCI6IkFjZXRhbWlub3BoZW4gKyBPeHljb2RvbmUiLCJicmFuZHMiOlsiUGVyY29jZXQiLCJPeHljb2NldCIsIkVuZG9jZXQiXSwiaW5kaWNhdGlvbiI6IlBhaW4iLCJkb3NlX3RleHQiOiIxIHRhYiIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxNmgiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMjAgdGFiIiwicHJuIjoicGFpbiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6Ik1heGltdW0gYWNldGFtaW5vcGhlbiA0MDAwbWcgcGVyIDI0IGhvdXJzIGZyb20gYWxsIHNvdXJjZXMuIFdhdGNoIGZvciBzZWRhdGlvbi4gRG8gbm90IGRyaXZlIG9yIG9wZXJhdGUgaGVhdnkgbWFjaGluZXJ5LiBUYWtlIG1pbmltdW0gYW1vdW50IHRvIGFjaGlldmUgcGFpbiBjb250cm9sLiBDb25zaWRlciBzdG9vbCBzb2Z0ZW5lciB3aGlsZSB0YWtpbmcgbWVkaWNhdGlvbi4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW5hbGdlc2lhIHwgYWR1bHQgfCBwYWluIHwgYWNldGFtaW5vcGhlbiArIG94eWNvZG9uZSB8IHBlcmNvY2V0IG94eWNvY2V0IGVuZG9jZXQgfCAxIHRhYiB8IHBhaW4gfCBtYXhpbXVtIGFjZXRhbWlub3BoZW4gNDAwMG1nIHBlciAyNCBob3VycyBmcm9tIGFsbCBzb3VyY2VzLiB3YXRjaCBmb3Igc2VkYXRpb24uIGRvIG5vdCBkcml2ZSBvciBvcGVyYXRlIGhlYXZ5IG1hY2hpbmVyeS4gdGFrZSBtaW5pbXVtIGFtb3VudCB0byBhY2hpZXZlIHBhaW4gY29udHJvbC4gY29uc2lkZXIgc3Rvb2wgc29mdGVuZXIgd2hpbGUgdGFraW5nIG1lZGljYXRpb24uIn0seyJzcGVjaWFsdHkiOiJBbmFsZ2VzaWEiLCJtZWQiOiJNb3JwaGluZSIsImJyYW5kcyI6WyJTdGF0ZXgiXSwiaW5kaWNhdGlvbiI6IlBhaW4iLCJkb3NlX3RleHQiOiI1bWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicTRoIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjIwIHRhYiIsInBybiI6InBhaW4iLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJXYXRjaCBmb3Igc2VkYXRpb24uIERvIG5vdCBkcml2ZSBvciBvcGVyYXRlIGhlYXZ5IG1hY2hpbmVyeS4gVGFrZSBtaW5pbXVtIGFtb3VudCB0byBhY2hpZXZlIHBhaW4gY29udHJvbC4gQ29uc2lkZXIgc3Rvb2wgc29mdGVuZXIgd2hpbGUgdGFraW5nIG1lZGljYXRpb24uIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFuYWxnZXNpYSB8IGFkdWx0IHwgcGFpbiB8IG1vcnBoaW5lIHwgc3RhdGV4IHwgNW1nIHwgcGFpbiB8IHdhdGNoIGZvciBzZWRhdGlvbi4gZG8gbm90IGRyaXZlIG9yIG9wZXJhdGUgaGVhdnkgbWFjaGluZXJ5LiB0YWtlIG1pbmltdW0gYW1vdW50IHRvIGFjaGlldmUgcGFpbiBjb250cm9sLiBjb25zaWRlciBzdG9vbCBzb2Z0ZW5lciB3aGlsZSB0YWtpbmcgbWVkaWNhdGlvbi4ifSx7InNwZWNpYWx0eSI6IkFuYWxnZXNpYSIsIm1lZCI6Ik1vcnBoaW5lIiwiYnJhbmRzIjpbIlN0YXRleCJdLCJpbmRpY2F0aW9uIjoiUGFpbiIsImRvc2VfdGV4dCI6IjEwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicTRoIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjIwIHRhYiIsInBybiI6InBhaW4iLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJXYXRjaCBmb3Igc2VkYXRpb24uIERvIG5vdCBkcml2ZSBvciBvcGVyYXRlIGhlYXZ5IG1hY2hpbmVyeS4gVGFrZSBtaW5pbXVtIGFtb3VudCB0byBhY2hpZXZlIHBhaW4gY29udHJvbC4gQ29uc2lkZXIgc3Rvb2wgc29mdGVuZXIgd2hpbGUgdGFraW5nIG1lZGljYXRpb24uIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFuYWxnZXNpYSB8IGFkdWx0IHwgcGFpbiB8IG1vcnBoaW5lIHwgc3RhdGV4IHwgMTBtZyB8IHBhaW4gfCB3YXRjaCBmb3Igc2VkYXRpb24uIGRvIG5vdCBkcml2ZSBvciBvcGVyYXRlIGhlYXZ5IG1hY2hpbmVyeS4gdGFrZSBtaW5pbXVtIGFtb3VudCB0byBhY2hpZXZlIHBhaW4gY29udHJvbC4gY29uc2lkZXIgc3Rvb2wgc29mdGVuZXIgd2hpbGUgdGFraW5nIG1lZGljYXRpb24uIn0seyJzcGVjaWFsdHkiOiJBbmFsZ2VzaWEiLCJtZWQiOiJIeWRyb21vcnBob25lIiwiYnJhbmRzIjpbIkRpbGF1ZGlkIl0sImluZGljYXRpb24iOiJQYWluIiwiZG9zZV90ZXh0IjoiMC41LTFtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxNGgiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMjAgdGFiIiwicHJuIjoicGFpbiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkRpc3BlbnNlIHR3ZW50eSAwLjVtZyB0YWJzIChwaGFybWFjeSB0byBjdXQgMW1nIHRhYnMgaW4gaGFsZikuIFdhdGNoIGZvciBzZWRhdGlvbi4gRG8gbm90IGRyaXZlIG9yIG9wZXJhdGUgaGVhdnkgbWFjaGluZXJ5LiBUYWtlIG1pbmltdW0gYW1vdW50IHRvIGFjaGlldmUgcGFpbiBjb250cm9sLiBDb25zaWRlciBzdG9vbCBzb2Z0ZW5lciB3aGlsZSB0YWtpbmcgbWVkaWNhdGlvbi4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW5hbGdlc2lhIHwgYWR1bHQgfCBwYWluIHwgaHlkcm9tb3JwaG9uZSB8IGRpbGF1ZGlkIHwgMC41LTFtZyB8IHBhaW4gfCBkaXNwZW5zZSB0d2VudHkgMC41bWcgdGFicyAocGhhcm1hY3kgdG8gY3V0IDFtZyB0YWJzIGluIGhhbGYpLiB3YXRjaCBmb3Igc2VkYXRpb24uIGRvIG5vdCBkcml2ZSBvciBvcGVyYXRlIGhlYXZ5IG1hY2hpbmVyeS4gdGFrZSBtaW5pbXVtIGFtb3VudCB0byBhY2hpZXZlIHBhaW4gY29udHJvbC4gY29uc2lkZXIgc3Rvb2wgc29mdGVuZXIgd2hpbGUgdGFraW5nIG1lZGljYXRpb24uIn0seyJzcGVjaWFsdHkiOiJBbmFsZ2VzaWEiLCJtZWQiOiJIeWRyb21vcnBob25lIiwiYnJhbmRzIjpbIkRpbGF1ZGlkIl0sImluZGljYXRpb24iOiJQYWluIiwiZG9zZV90ZXh0IjoiMS0ybWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicTRoIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjIwIHRhYiIsInBybiI6InBhaW4iLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJEaXNwZW5zZSAxbWcgdGFicy4gV2F0Y2ggZm9yIHNlZGF0aW9uLiBEbyBub3QgZHJpdmUgb3Igb3BlcmF0ZSBoZWF2eSBtYWNoaW5lcnkuIFRha2UgbWluaW11bSBhbW91bnQgdG8gYWNoaWV2ZSBwYWluIGNvbnRyb2wuIENvbnNpZGVyIHN0b29sIHNvZnRlbmVyIHdoaWxlIHRha2luZyBtZWRpY2F0aW9uLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbmFsZ2VzaWEgfCBhZHVsdCB8IHBhaW4gfCBoeWRyb21vcnBob25lIHwgZGlsYXVkaWQgfCAxLTJtZyB8IHBhaW4gfCBkaXNwZW5zZSAxbWcgdGFicy4gd2F0Y2ggZm9yIHNlZGF0aW9uLiBkbyBub3QgZHJpdmUgb3Igb3BlcmF0ZSBoZWF2eSBtYWNoaW5lcnkuIHRha2UgbWluaW11bSBhbW91bnQgdG8gYWNoaWV2ZSBwYWluIGNvbnRyb2wuIGNvbnNpZGVyIHN0b29sIHNvZnRlbmVyIHdoaWxlIHRha2luZyBtZWRpY2F0aW9uLiJ9LHsic3BlY2lhbHR5IjoiQW5hbGdlc2lhIiwibWVkIjoiQ3ljbG9iZW56YXByaW5lIiwiYnJhbmRzIjpbIkZsZXhlcmlsIiwiQW1yaXgiXSwiaW5kaWNhdGlvbiI6IlBhaW4vbXVzY2xlIHNwYXNtIiwiZG9zZV90ZXh0IjoiMTBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJUSUQiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMTAgdGFiIiwicHJuIjoibXVzY2xlIHNwYXNtIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiT25seSB0YWtlIGZvciBmaXJzdCAyIGRheXMgb2YgaW5qdXJ5LiBXYXRjaCBmb3Igc2VkYXRpb24uIERvIG5vdCBkcml2ZSBvciBvcGVyYXRlIGhlYXZ5IG1hY2hpbmVyeS4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW5hbGdlc2lhIHwgYWR1bHQgfCBwYWluL211c2NsZSBzcGFzbSB8IGN5Y2xvYmVuemFwcmluZSB8IGZsZXhlcmlsIGFtcml4IHwgMTBtZyB8IG11c2NsZSBzcGFzbSB8IG9ubHkgdGFrZSBmb3IgZmlyc3QgMiBkYXlzIG9mIGluanVyeS4gd2F0Y2ggZm9yIHNlZGF0aW9uLiBkbyBub3QgZHJpdmUgb3Igb3BlcmF0ZSBoZWF2eSBtYWNoaW5lcnkuIn0seyJzcGVjaWFsdHkiOiJBbmFsZ2VzaWEiLCJtZWQiOiJHYWJhcGVudGluIiwiYnJhbmRzIjpbIk5ldXJvbnRpbiIsIkdyYWxpc2UiXSwiaW5kaWNhdGlvbiI6IlBhaW4gKG5ldXJvcGF0aGljKSIsImRvc2VfdGV4dCI6IjMwMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IlRJRCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiI0MCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJUYWtlIDEgY2FwIGRhaWx5IG9uIGRheSBvbmUsIDEgY2FwIEJJRCBvbiBkYXkgdHdvLCB0aGVuIDEgY2FwIFRJRCBvbiBkYXkgdGhyZWUgYW5kIHRoZXJlYWZ0ZXIuIEZvbGxvdy11cCB3aXRoIGZhbWlseSBkb2N0b3IgZm9yIGd1aWRhbmNlIG9uIG9uZ29pbmcgZG9zaW5nIGFuZCByZWZpbGxzLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbmFsZ2VzaWEgfCBhZHVsdCB8IHBhaW4gKG5ldXJvcGF0aGljKSB8IGdhYmFwZW50aW4gfCBuZXVyb250aW4gZ3JhbGlzZSB8IDMwMG1nIHwgdGFrZSAxIGNhcCBkYWlseSBvbiBkYXkgb25lLCAxIGNhcCBiaWQgb24gZGF5IHR3bywgdGhlbiAxIGNhcCB0aWQgb24gZGF5IHRocmVlIGFuZCB0aGVyZWFmdGVyLiBmb2xsb3ctdXAgd2l0aCBmYW1pbHkgZG9jdG9yIGZvciBndWlkYW5jZSBvbiBvbmdvaW5nIGRvc2luZyBhbmQgcmVmaWxscy4ifSx7InNwZWNpYWx0eSI6IkFuYWxnZXNpYSIsIm1lZCI6IlByZWdhYmFsaW4iLCJicmFuZHMiOlsiTHlyaWNhIl0sImluZGljYXRpb24iOiJQYWluIChuZXVyb3BhdGhpYykiLCJkb3NlX3RleHQiOiIyNW1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjI4IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkZvbGxvdyB1cCB3aXRoIGZhbWlseSBkb2N0b3IgZm9yIGd1aWRhbmNlIG9uIG9uZ29pbmcgZG9zaW5nIGFuZCByZWZpbGxzLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbmFsZ2VzaWEgfCBhZHVsdCB8IHBhaW4gKG5ldXJvcGF0aGljKSB8IHByZWdhYmFsaW4gfCBseXJpY2EgfCAyNW1nIHwgZm9sbG93IHVwIHdpdGggZmFtaWx5IGRvY3RvciBmb3IgZ3VpZGFuY2Ugb24gb25nb2luZyBkb3NpbmcgYW5kIHJlZmlsbHMuIn0seyJzcGVjaWFsdHkiOiJBbmFsZ2VzaWEiLCJtZWQiOiJIeW9zY2luZSBCdXR5bGJyb21pZGUiLCJicmFuZHMiOlsiQnVzY29wYW4iLCJTY29wb2xhbWluZSBCdXR5bGJyb21pZGUiXSwiaW5kaWNhdGlvbiI6IkdJL0dVIHNwYXNtIiwiZG9zZV90ZXh0IjoiMTAtMjBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJUSUQiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMTggdGFiIiwicHJuIjoicGFpbiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkRpc3BlbnNlIDEwbWcgdGFicy4gTWF4aW11bSA2MG1nIHBlciAyNCBob3Vycy4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW5hbGdlc2lhIHwgYWR1bHQgfCBnaS9ndSBzcGFzbSB8IGh5b3NjaW5lIGJ1dHlsYnJvbWlkZSB8IGJ1c2NvcGFuIHNjb3BvbGFtaW5lIGJ1dHlsYnJvbWlkZSB8IDEwLTIwbWcgfCBwYWluIHwgZGlzcGVuc2UgMTBtZyB0YWJzLiBtYXhpbXVtIDYwbWcgcGVyIDI0IGhvdXJzLiJ9LHsic3BlY2lhbHR5IjoiQW5hbGdlc2lhIiwibWVkIjoiQ29sY2hpY2luZSIsImJyYW5kcyI6WyJDb2xjcnlzIiwiTWl0aWdhcmUiXSwiaW5kaWNhdGlvbiI6IkdvdXQgZmxhcmUiLCJkb3NlX3RleHQiOiIwLjZtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiIiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMTAgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiRGF5IDE6IHRha2UgMiB0YWJzIGltbWVkaWF0ZWx5IHRoZW4gMSB0YWIgb25lIGhvdXIgbGF0ZXIuIERheXMgMi02OiB0YWtlIDEgdGFiIG9uY2UgZGFpbHk7IGNhbiBjb250aW51ZSBmb3IgdXAgdG8gNDggaG91cnMgYWZ0ZXIgZmxhcmUgcmVzb2x2ZXMuIFNlZSBkb2N0b3IgaWYgcGFpbiBwZXJzaXN0cy4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW5hbGdlc2lhIHwgYWR1bHQgfCBnb3V0IGZsYXJlIHwgY29sY2hpY2luZSB8IGNvbGNyeXMgbWl0aWdhcmUgfCAwLjZtZyB8IGRheSAxOiB0YWtlIDIgdGFicyBpbW1lZGlhdGVseSB0aGVuIDEgdGFiIG9uZSBob3VyIGxhdGVyLiBkYXlzIDItNjogdGFrZSAxIHRhYiBvbmNlIGRhaWx5OyBjYW4gY29udGludWUgZm9yIHVwIHRvIDQ4IGhvdXJzIGFmdGVyIGZsYXJlIHJlc29sdmVzLiBzZWUgZG9jdG9yIGlmIHBhaW4gcGVyc2lzdHMuIn0seyJzcGVjaWFsdHkiOiJBbmFsZ2VzaWEiLCJtZWQiOiJMaWRvY2FpbmUgdmlzY291cyBzb2x1dGlvbiAoMiUpIiwiYnJhbmRzIjpbXSwiaW5kaWNhdGlvbiI6Ik9yYWwgdWxjZXJzIiwiZG9zZV90ZXh0IjoiIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InEzaCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxMDBtbCIsInBybiI6InBhaW4iLCJmb3JtIjoic29sdXRpb24iLCJjb21tZW50cyI6Ik1heSByZXF1aXJlIGNvbXBvdW5kaW5nLiBDYW4gcHJvdmlkZSBlcXVpdmFsZW50IHZhcmlhbnQgdGhhdCBpcyBhdmFpbGFibGUuIEFwcGx5IDFtbCB0byBhZmZlY3RlZCBhcmVhKHMpIHdpdGggYSBjb3R0b24gc3dhYi4gRG8gbm90IGV4Y2VlZCAwLjJtTC9rZyBvZiBib2R5IHdlaWdodC4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW5hbGdlc2lhIHwgYWR1bHQgfCBvcmFsIHVsY2VycyB8IGxpZG9jYWluZSB2aXNjb3VzIHNvbHV0aW9uICgyJSkgfCBwYWluIHwgbWF5IHJlcXVpcmUgY29tcG91bmRpbmcuIGNhbiBwcm92aWRlIGVxdWl2YWxlbnQgdmFyaWFudCB0aGF0IGlzIGF2YWlsYWJsZS4gYXBwbHkgMW1sIHRvIGFmZmVjdGVkIGFyZWEocykgd2l0aCBhIGNvdHRvbiBzd2FiLiBkbyBub3QgZXhjZWVkIDAuMm1sL2tnIG9mIGJvZHkgd2VpZ2h0LiJ9LHsic3BlY2lhbHR5IjoiQW5hbGdlc2lhIiwibWVkIjoiTGlkb2NhaW5lICsgUHJpbG9jYWluZSAoRU1MQSkgY3JlYW0iLCJicmFuZHMiOltdLCJpbmRpY2F0aW9uIjoiVG9waWNhbCBhbmFsZ2VzaWEiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0b3BpY2FsIiwiZnJlcXVlbmN5IjoicTNoIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6InBhaW4iLCJmb3JtIjoiY3JlYW0iLCJjb21tZW50cyI6IkNhbiBwcm92aWRlIGVxdWl2YWxlbnQgdmFyaWFudCB0aGF0IGlzIGF2YWlsYWJsZS4gT25lIGFwcGxpY2F0aW9uID0gYXBwbHkgMW1sIHRvIGFmZmVjdGVkIGFyZWEocykgd2l0aCBhIGNvdHRvbiBzd2FiLiBEbyBub3QgZXhjZWVkIDAuMm1ML2tnIG9mIGJvZHkgd2VpZ2h0LiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbmFsZ2VzaWEgfCBhZHVsdCB8IHRvcGljYWwgYW5hbGdlc2lhIHwgbGlkb2NhaW5lICsgcHJpbG9jYWluZSAoZW1sYSkgY3JlYW0gfCAxIGFwcGxpY2F0aW9uIHwgcGFpbiB8IGNhbiBwcm92aWRlIGVxdWl2YWxlbnQgdmFyaWFudCB0aGF0IGlzIGF2YWlsYWJsZS4gb25lIGFwcGxpY2F0aW9uID0gYXBwbHkgMW1sIHRvIGFmZmVjdGVkIGFyZWEocykgd2l0aCBhIGNvdHRvbiBzd2FiLiBkbyBub3QgZXhjZWVkIDAuMm1sL2tnIG9mIGJvZHkgd2VpZ2h0LiJ9LHsic3BlY2lhbHR5IjoiQW5hbGdlc2lhIiwibWVkIjoiQWNldGFtaW5vcGhlbiAoODBtZy9tbCBkcm9wcykiLCJicmFuZHMiOlsiVHlsZW5vbCJdLCJpbmRpY2F0aW9uIjoiUGFpbi9mZXZlciIsImRvc2VfdGV4dCI6IjE1bWcva2cvZG9zZSIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxNGgiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiNyBkYXkiLCJwcm4iOiJmZXZlciIsImZvcm0iOiJkcm9wcyIsImNvbW1lbnRzIjoiRm9yIGFnZSAwLTIzIG1vbnRocy4gTWF4aW11bSA1IGRvc2VzIHBlciAyNCBob3VycyAoNzVtZy9rZy9kYXkgb3IgNDAwMG1nL2RheSwgd2hpY2hldmVyIGlzIGxlc3MpLiBDb21tdW5pdHkgcGhhcm1hY2lzdCB0byBwcm92aWRlIG9yYWwgc3lyaW5nZS9kb3NpbmcgY3VwIGFuZCBjb3Vuc2VsIG9uIHZvbHVtZSB0byBiZSBhZG1pbmlzdGVyZWQuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6dHJ1ZSwiZG9zZV9wZXJfa2dfbWciOjE1LjAsIm1heF9kb3NlX21nIjoxMDAwLjAsInNlYXJjaF90ZXh0IjoiYW5hbGdlc2lhIHwgcGVkaWF0cmljIHwgcGFpbi9mZXZlciB8IGFjZXRhbWlub3BoZW4gKDgwbWcvbWwgZHJvcHMpIHwgdHlsZW5vbCB8IDE1bWcva2cvZG9zZSB8IGZldmVyIHwgZm9yIGFnZSAwLTIzIG1vbnRocy4gbWF4aW11bSA1IGRvc2VzIHBlciAyNCBob3VycyAoNzVtZy9rZy9kYXkgb3IgNDAwMG1nL2RheSwgd2hpY2hldmVyIGlzIGxlc3MpLiBjb21tdW5pdHkgcGhhcm1hY2lzdCB0byBwcm92aWRlIG9yYWwgc3lyaW5nZS9kb3NpbmcgY3VwIGFuZCBjb3Vuc2VsIG9uIHZvbHVtZSB0byBiZSBhZG1pbmlzdGVyZWQuIn0seyJzcGVjaWFsdHkiOiJBbmFsZ2VzaWEiLCJtZWQiOiJBY2V0YW1pbm9waGVuICgxNjBtZy81bWwgc3VzcGVuc2lvbikiLCJicmFuZHMiOlsiVHlsZW5vbCJdLCJpbmRpY2F0aW9uIjoiUGFpbi9mZXZlciIsImRvc2VfdGV4dCI6IjE1bWcva2cvZG9zZSIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxNGgiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiNyBkYXkiLCJwcm4iOiJmZXZlciIsImZvcm0iOiJzdXNwZW5zaW9uIiwiY29tbWVudHMiOiJGb3IgYWdlcyAyIGFuZCBvbGRlci4gTWF4aW11bSA1IGRvc2VzIHBlciAyNCBob3VycyAoNzVtZy9rZy9kYXkgb3IgNDAwMG1nL2RheSwgd2hpY2hldmVyIGlzIGxlc3MpLiBDb21tdW5pdHkgcGhhcm1hY2lzdCB0byBwcm92aWRlIG9yYWwgc3lyaW5nZS9kb3NpbmcgY3VwIGFuZCBjb3Vuc2VsIG9uIHZvbHVtZSB0byBiZSBhZG1pbmlzdGVyZWQuIE1heSBub3QgYmUgY292ZXJlZCB1bmRlciBPSElQKy4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjp0cnVlLCJkb3NlX3Blcl9rZ19tZyI6MTUuMCwibWF4X2Rvc2VfbWciOjEwMDAuMCwic2VhcmNoX3RleHQiOiJhbmFsZ2VzaWEgfCBwZWRpYXRyaWMgfCBwYWluL2ZldmVyIHwgYWNldGFtaW5vcGhlbiAoMTYwbWcvNW1sIHN1c3BlbnNpb24pIHwgdHlsZW5vbCB8IDE1bWcva2cvZG9zZSB8IGZldmVyIHwgZm9yIGFnZXMgMiBhbmQgb2xkZXIuIG1heGltdW0gNSBkb3NlcyBwZXIgMjQgaG91cnMgKDc1bWcva2cvZGF5IG9yIDQwMDBtZy9kYXksIHdoaWNoZXZlciBpcyBsZXNzKS4gY29tbXVuaXR5IHBoYXJtYWNpc3QgdG8gcHJvdmlkZSBvcmFsIHN5cmluZ2UvZG9zaW5nIGN1cCBhbmQgY291bnNlbCBvbiB2b2x1bWUgdG8gYmUgYWRtaW5pc3RlcmVkLiBtYXkgbm90IGJlIGNvdmVyZWQgdW5kZXIgb2hpcCsuIn0seyJzcGVjaWFsdHkiOiJBbmFsZ2VzaWEiLCJtZWQiOiJJYnVwcm9mZW4gKDEwMG1nLzVtbCBzdXNwZW5zaW9uKSIsImJyYW5kcyI6WyJBZHZpbCIsIk1vdHJpbiJdLCJpbmRpY2F0aW9uIjoiUGFpbi9mZXZlciIsImRvc2VfdGV4dCI6IjEwbWcva2cvZG9zZSIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxNmgiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiNyBkYXkiLCJwcm4iOiJmZXZlciIsImZvcm0iOiJzdXNwZW5zaW9uIiwiY29tbWVudHMiOiJGb3IgYWdlcyA2IG1vbnRocyBhbmQgb2xkZXIuIE1heGltdW0gNCBkb3NlcyBwZXIgMjQgaG91cnMgKDQwbWcva2cvZGF5IG9yIDI0MDBtZy9kYXksIHdoaWNoZXZlciBpcyBsZXNzKS4gUm91bmQgZG93biB0byBuZWFyZXN0IDAuNW1sLiBQaGFybWFjaXN0IHRvIHByb3ZpZGUgb3JhbCBzeXJpbmdlL2Rvc2luZyBjdXAuIE1heSBzdWJzdGl0dXRlIGlmIGlidXByb2ZlbiAxMDBtZy81bUwgbGlxdWlkIG5vdCBhdmFpbGFibGUgd2l0aCBhcHByb3ByaWF0ZSBpbnN0cnVjdGlvbiB0byBwYXRpZW50L2NhcmVnaXZlci4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjp0cnVlLCJkb3NlX3Blcl9rZ19tZyI6MTAuMCwibWF4X2Rvc2VfbWciOjYwMC4wLCJzZWFyY2hfdGV4dCI6ImFuYWxnZXNpYSB8IHBlZGlhdHJpYyB8IHBhaW4vZmV2ZXIgfCBpYnVwcm9mZW4gKDEwMG1nLzVtbCBzdXNwZW5zaW9uKSB8IGFkdmlsIG1vdHJpbiB8IDEwbWcva2cvZG9zZSB8IGZldmVyIHwgZm9yIGFnZXMgNiBtb250aHMgYW5kIG9sZGVyLiBtYXhpbXVtIDQgZG9zZXMgcGVyIDI0IGhvdXJzICg0MG1nL2tnL2RheSBvciAyNDAwbWcvZGF5LCB3aGljaGV2ZXIgaXMgbGVzcykuIHJvdW5kIGRvd24gdG8gbmVhcmVzdCAwLjVtbC4gcGhhcm1hY2lzdCB0byBwcm92aWRlIG9yYWwgc3lyaW5nZS9kb3NpbmcgY3VwLiBtYXkgc3Vic3RpdHV0ZSBpZiBpYnVwcm9mZW4gMTAwbWcvNW1sIGxpcXVpZCBub3QgYXZhaWxhYmxlIHdpdGggYXBwcm9wcmlhdGUgaW5zdHJ1Y3Rpb24gdG8gcGF0aWVudC9jYXJlZ2l2ZXIuIn0seyJzcGVjaWFsdHkiOiJBbmFsZ2VzaWEiLCJtZWQiOiJMaWRvY2FpbmUgdmlzY291cyBzb2x1dGlvbiAoMiUpIiwiYnJhbmRzIjpbXSwiaW5kaWNhdGlvbiI6Ik9yYWwgdWxjZXJzIiwiZG9zZV90ZXh0IjoiIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InEzaCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxMDBtbCIsInBybiI6InBhaW4iLCJmb3JtIjoic29sdXRpb24iLCJjb21tZW50cyI6Ik1heSByZXF1aXJlIGNvbXBvdW5kaW5nLiBDYW4gcHJvdmlkZSBlcXVpdmFsZW50IHZhcmlhbnQgdGhhdCBpcyBhdmFpbGFibGUuIEFwcGx5IDFtbCB0byBhZmZlY3RlZCBhcmVhKHMpIHdpdGggYSBjb3R0b24gc3dhYi4gRG8gbm90IGV4Y2VlZCAwLjJtTC9rZyBvZiBib2R5IHdlaWdodC4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFuYWxnZXNpYSB8IHBlZGlhdHJpYyB8IG9yYWwgdWxjZXJzIHwgbGlkb2NhaW5lIHZpc2NvdXMgc29sdXRpb24gKDIlKSB8IHBhaW4gfCBtYXkgcmVxdWlyZSBjb21wb3VuZGluZy4gY2FuIHByb3ZpZGUgZXF1aXZhbGVudCB2YXJpYW50IHRoYXQgaXMgYXZhaWxhYmxlLiBhcHBseSAxbWwgdG8gYWZmZWN0ZWQgYXJlYShzKSB3aXRoIGEgY290dG9uIHN3YWIuIGRvIG5vdCBleGNlZWQgMC4ybWwva2cgb2YgYm9keSB3ZWlnaHQuIn0seyJzcGVjaWFsdHkiOiJBbmFsZ2VzaWEiLCJtZWQiOiJMaWRvY2FpbmUgKyBQcmlsb2NhaW5lIChFTUxBKSBjcmVhbSIsImJyYW5kcyI6W10sImluZGljYXRpb24iOiJUb3BpY2FsIGFuYWxnZXNpYSIsImRvc2VfdGV4dCI6IjEgYXBwbGljYXRpb24iLCJyb3V0ZSI6InRvcGljYWwiLCJmcmVxdWVuY3kiOiJxM2giLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoicGFpbiIsImZvcm0iOiJjcmVhbSIsImNvbW1lbnRzIjoiQ2FuIHByb3ZpZGUgZXF1aXZhbGVudCB2YXJpYW50IHRoYXQgaXMgYXZhaWxhYmxlLiBPbmUgYXBwbGljYXRpb24gPSBhcHBseSAxbWwgdG8gYWZmZWN0ZWQgYXJlYShzKSB3aXRoIGEgY290dG9uIHN3YWIuIERvIG5vdCBleGNlZWQgMC4ybUwva2cgb2YgYm9keSB3ZWlnaHQuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbmFsZ2VzaWEgfCBwZWRpYXRyaWMgfCB0b3BpY2FsIGFuYWxnZXNpYSB8IGxpZG9jYWluZSArIHByaWxvY2FpbmUgKGVtbGEpIGNyZWFtIHwgMSBhcHBsaWNhdGlvbiB8IHBhaW4gfCBjYW4gcHJvdmlkZSBlcXVpdmFsZW50IHZhcmlhbnQgdGhhdCBpcyBhdmFpbGFibGUuIG9uZSBhcHBsaWNhdGlvbiA9IGFwcGx5IDFtbCB0byBhZmZlY3RlZCBhcmVhKHMpIHdpdGggYSBjb3R0b24gc3dhYi4gZG8gbm90IGV4Y2VlZCAwLjJtbC9rZyBvZiBib2R5IHdlaWdodC4ifSx7InNwZWNpYWx0eSI6IkFudGllbWV0aWMiLCJtZWQiOiJPbmRhbnNldHJvbiIsImJyYW5kcyI6WyJab2ZyYW4iLCJadXBsZW56Il0sImluZGljYXRpb24iOiJOYXVzZWEvdm9taXRpbmciLCJkb3NlX3RleHQiOiI4bWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicThoIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjggdGFiIiwicHJuIjoibmF1c2VhL3ZvbWl0aW5nIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiTWF5IGRpc3BlbnNlIHN1Ymxpbmd1YWwgaWYgcGF0aWVudCBwcmVmZXJlbmNlLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpZW1ldGljIHwgYWR1bHQgfCBuYXVzZWEvdm9taXRpbmcgfCBvbmRhbnNldHJvbiB8IHpvZnJhbiB6dXBsZW56IHwgOG1nIHwgbmF1c2VhL3ZvbWl0aW5nIHwgbWF5IGRpc3BlbnNlIHN1Ymxpbmd1YWwgaWYgcGF0aWVudCBwcmVmZXJlbmNlLiJ9LHsic3BlY2lhbHR5IjoiQW50aWVtZXRpYyIsIm1lZCI6IkRpbWVuaHlkcmluYXRlIiwiYnJhbmRzIjpbIkdyYXZvbCIsIkRyYW1hbWluZSJdLCJpbmRpY2F0aW9uIjoiTmF1c2VhL3ZvbWl0aW5nIiwiZG9zZV90ZXh0IjoiNTBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxNmgiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMTIgdGFiIiwicHJuIjoibmF1c2VhL3ZvbWl0aW5nIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiTWF4aW11bSAyMDBtZyBwZXIgMjQgaG91cnMuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGllbWV0aWMgfCBhZHVsdCB8IG5hdXNlYS92b21pdGluZyB8IGRpbWVuaHlkcmluYXRlIHwgZ3Jhdm9sIGRyYW1hbWluZSB8IDUwbWcgfCBuYXVzZWEvdm9taXRpbmcgfCBtYXhpbXVtIDIwMG1nIHBlciAyNCBob3Vycy4ifSx7InNwZWNpYWx0eSI6IkFudGllbWV0aWMiLCJtZWQiOiJNZXRvY2xvcHJhbWlkZSIsImJyYW5kcyI6WyJNYXhlcmFuIiwiUmVnbGFuIl0sImluZGljYXRpb24iOiJOYXVzZWEvdm9taXRpbmciLCJkb3NlX3RleHQiOiIxMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InE2aCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxMiB0YWIiLCJwcm4iOiJuYXVzZWEvdm9taXRpbmciLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aWVtZXRpYyB8IGFkdWx0IHwgbmF1c2VhL3ZvbWl0aW5nIHwgbWV0b2Nsb3ByYW1pZGUgfCBtYXhlcmFuIHJlZ2xhbiB8IDEwbWcgfCBuYXVzZWEvdm9taXRpbmcifSx7InNwZWNpYWx0eSI6IkFudGllbWV0aWMiLCJtZWQiOiJEb3h5bGFtaW5lICsgUHlyaWRveGluZSIsImJyYW5kcyI6WyJEaWNsZWN0aW4iLCJEaWNsZWdpcyIsIkJvbmplc3RhIl0sImluZGljYXRpb24iOiJOYXVzZWEvdm9taXRpbmciLCJkb3NlX3RleHQiOiIxMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IiIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIyOCB0YWIiLCJwcm4iOiJuYXVzZWEvdm9taXRpbmciLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJUYWtlIDIgdGFicyBhdCBiZWR0aW1lIG9uIGRheXMgMSBhbmQgMjsgaWYgc3ltcHRvbXMgcGVyc2lzdCwgdGFrZSAxIHRhYiBpbiBtb3JuaW5nIGFuZCAyIHRhYnMgYXQgYmVkdGltZSBvbiBkYXkgMzsgaWYgc3ltcHRvbXMgcGVyc2lzdCwgdGFrZSAxIHRhYiBpbiBtb3JuaW5nLCAxIHRhYiBpbiBhZnRlcm5vb24sIGFuZCAyIHRhYnMgYXQgYmVkdGltZSBvbiBkYXkgNCAoTWF4IDQgdGFicy9kYXkpLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpZW1ldGljIHwgYWR1bHQgfCBuYXVzZWEvdm9taXRpbmcgfCBkb3h5bGFtaW5lICsgcHlyaWRveGluZSB8IGRpY2xlY3RpbiBkaWNsZWdpcyBib25qZXN0YSB8IDEwbWcgfCBuYXVzZWEvdm9taXRpbmcgfCB0YWtlIDIgdGFicyBhdCBiZWR0aW1lIG9uIGRheXMgMSBhbmQgMjsgaWYgc3ltcHRvbXMgcGVyc2lzdCwgdGFrZSAxIHRhYiBpbiBtb3JuaW5nIGFuZCAyIHRhYnMgYXQgYmVkdGltZSBvbiBkYXkgMzsgaWYgc3ltcHRvbXMgcGVyc2lzdCwgdGFrZSAxIHRhYiBpbiBtb3JuaW5nLCAxIHRhYiBpbiBhZnRlcm5vb24sIGFuZCAyIHRhYnMgYXQgYmVkdGltZSBvbiBkYXkgNCAobWF4IDQgdGFicy9kYXkpLiJ9LHsic3BlY2lhbHR5IjoiQW50aWVtZXRpYyIsIm1lZCI6IkNhcHNhaWNpbiBjcmVhbSIsImJyYW5kcyI6WyJab3N0cml4IiwiQ2FwemFzaW4iXSwiaW5kaWNhdGlvbiI6Ik5hdXNlYS92b21pdGluZyIsImRvc2VfdGV4dCI6IjEgYXBwbGljYXRpb24iLCJyb3V0ZSI6InRvcGljYWwiLCJmcmVxdWVuY3kiOiJxNmgiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoibmF1c2VhL3ZvbWl0aW5nIiwiZm9ybSI6ImNyZWFtIiwiY29tbWVudHMiOiJBcHBsaWNhdGlvbiBpbnN0cnVjdGlvbjogYXBwbHkgYSB0aGluIGZpbG0gdG8gdGhlIGFiZG9tZW4uIFN0b3Agb25jZSBzeW1wdG9tcyByZXNvbHZlLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpZW1ldGljIHwgYWR1bHQgfCBuYXVzZWEvdm9taXRpbmcgfCBjYXBzYWljaW4gY3JlYW0gfCB6b3N0cml4IGNhcHphc2luIHwgMSBhcHBsaWNhdGlvbiB8IG5hdXNlYS92b21pdGluZyB8IGFwcGxpY2F0aW9uIGluc3RydWN0aW9uOiBhcHBseSBhIHRoaW4gZmlsbSB0byB0aGUgYWJkb21lbi4gc3RvcCBvbmNlIHN5bXB0b21zIHJlc29sdmUuIn0seyJzcGVjaWFsdHkiOiJBbnRpZW1ldGljIiwibWVkIjoiTG9yYXplcGFtIiwiYnJhbmRzIjpbIkF0aXZhbiJdLCJpbmRpY2F0aW9uIjoiVmVydGlnbyIsImRvc2VfdGV4dCI6IjAuNS0xbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicTZoIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjE1IHRhYiIsInBybiI6InZlcnRpZ28iLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJGb3IgdmVydGlnby4gRGlzcGVuc2UgMC41bWcgdGFicy4gUmVzZXJ2ZSBmb3IgZXBpc29kZXMgbGFzdGluZyBob3VycyB0byBkYXlzLiBXYXRjaCBmb3Igc2VkYXRpb24uIERvIG5vdCB0YWtlIHdpdGggYWxjb2hvbCBvciBzZWRhdGl2ZXMuIERvIG5vdCBkcml2ZSBvciBvcGVyYXRlIGhlYXZ5IG1hY2hpbmVyeS4gQ2hyb25pYyB1c2UgbWF5IGltcGVkZSBhZGFwdGF0aW9uIGFuZCByZWNvdmVyeS4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aWVtZXRpYyB8IGFkdWx0IHwgdmVydGlnbyB8IGxvcmF6ZXBhbSB8IGF0aXZhbiB8IDAuNS0xbWcgfCB2ZXJ0aWdvIHwgZm9yIHZlcnRpZ28uIGRpc3BlbnNlIDAuNW1nIHRhYnMuIHJlc2VydmUgZm9yIGVwaXNvZGVzIGxhc3RpbmcgaG91cnMgdG8gZGF5cy4gd2F0Y2ggZm9yIHNlZGF0aW9uLiBkbyBub3QgdGFrZSB3aXRoIGFsY29ob2wgb3Igc2VkYXRpdmVzLiBkbyBub3QgZHJpdmUgb3Igb3BlcmF0ZSBoZWF2eSBtYWNoaW5lcnkuIGNocm9uaWMgdXNlIG1heSBpbXBlZGUgYWRhcHRhdGlvbiBhbmQgcmVjb3ZlcnkuIn0seyJzcGVjaWFsdHkiOiJBbnRpZW1ldGljIiwibWVkIjoiT25kYW5zZXRyb24iLCJicmFuZHMiOlsiWm9mcmFuIiwiWnVwbGVueiJdLCJpbmRpY2F0aW9uIjoiTmF1c2VhL3ZvbWl0aW5nIiwiZG9zZV90ZXh0IjoiMm1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InE2aCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiI4IHRhYiIsInBybiI6Im5hdXNlYS92b21pdGluZyIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkZvciB3ZWlnaHQgNy0xNWtnIChhdm9pZCBpbiBhZ2UgPDYgbW9udGhzKS4gRGlzcGVuc2UgT0RUIHBlciBwYXRpZW50IHByZWZlcmVuY2UuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpZW1ldGljIHwgcGVkaWF0cmljIHwgbmF1c2VhL3ZvbWl0aW5nIHwgb25kYW5zZXRyb24gfCB6b2ZyYW4genVwbGVueiB8IDJtZyB8IG5hdXNlYS92b21pdGluZyB8IGZvciB3ZWlnaHQgNy0xNWtnIChhdm9pZCBpbiBhZ2UgPDYgbW9udGhzKS4gZGlzcGVuc2Ugb2R0IHBlciBwYXRpZW50IHByZWZlcmVuY2UuIn0seyJzcGVjaWFsdHkiOiJBbnRpZW1ldGljIiwibWVkIjoiT25kYW5zZXRyb24iLCJicmFuZHMiOlsiWm9mcmFuIiwiWnVwbGVueiJdLCJpbmRpY2F0aW9uIjoiTmF1c2VhL3ZvbWl0aW5nIiwiZG9zZV90ZXh0IjoiNG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InE2aCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiI4IHRhYiIsInBybiI6Im5hdXNlYS92b21pdGluZyIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkZvciB3ZWlnaHQgMTUtMzBrZy4gRGlzcGVuc2UgT0RUIHBlciBwYXRpZW50IHByZWZlcmVuY2UuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpZW1ldGljIHwgcGVkaWF0cmljIHwgbmF1c2VhL3ZvbWl0aW5nIHwgb25kYW5zZXRyb24gfCB6b2ZyYW4genVwbGVueiB8IDRtZyB8IG5hdXNlYS92b21pdGluZyB8IGZvciB3ZWlnaHQgMTUtMzBrZy4gZGlzcGVuc2Ugb2R0IHBlciBwYXRpZW50IHByZWZlcmVuY2UuIn0seyJzcGVjaWFsdHkiOiJBbnRpZW1ldGljIiwibWVkIjoiT25kYW5zZXRyb24iLCJicmFuZHMiOlsiWm9mcmFuIiwiWnVwbGVueiJdLCJpbmRpY2F0aW9uIjoiTmF1c2VhL3ZvbWl0aW5nIiwiZG9zZV90ZXh0IjoiOG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InE2aCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiI4IHRhYiIsInBybiI6Im5hdXNlYS92b21pdGluZyIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkZvciB3ZWlnaHQgPjMwa2cuIERpc3BlbnNlIE9EVCBwZXIgcGF0aWVudCBwcmVmZXJlbmNlLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aWVtZXRpYyB8IHBlZGlhdHJpYyB8IG5hdXNlYS92b21pdGluZyB8IG9uZGFuc2V0cm9uIHwgem9mcmFuIHp1cGxlbnogfCA4bWcgfCBuYXVzZWEvdm9taXRpbmcgfCBmb3Igd2VpZ2h0ID4zMGtnLiBkaXNwZW5zZSBvZHQgcGVyIHBhdGllbnQgcHJlZmVyZW5jZS4ifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiQW1veC1DbGF2ICg4NzUvMTI1bWcpIiwiYnJhbmRzIjpbIkNsYXZ1bGluIiwiQXVnbWVudGluIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxIHRhYiIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiIxMCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBhZHVsdCB8IGFtb3gtY2xhdiAoODc1LzEyNW1nKSB8IGNsYXZ1bGluIGF1Z21lbnRpbiB8IDEgdGFiIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkFtb3gtQ2xhdiAoODc1LzEyNW1nKSIsImJyYW5kcyI6WyJDbGF2dWxpbiIsIkF1Z21lbnRpbiJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMSB0YWIiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiMTQgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgYWR1bHQgfCBhbW94LWNsYXYgKDg3NS8xMjVtZykgfCBjbGF2dWxpbiBhdWdtZW50aW4gfCAxIHRhYiJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJBbW94LUNsYXYgKDg3NS8xMjVtZykiLCJicmFuZHMiOlsiQ2xhdnVsaW4iLCJBdWdtZW50aW4iXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjEgdGFiIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiMTAgZGF5IiwiZGlzcGVuc2UiOiIyMCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBhZHVsdCB8IGFtb3gtY2xhdiAoODc1LzEyNW1nKSB8IGNsYXZ1bGluIGF1Z21lbnRpbiB8IDEgdGFiIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkFtb3gtQ2xhdiAoODc1LzEyNW1nKSIsImJyYW5kcyI6WyJDbGF2dWxpbiIsIkF1Z21lbnRpbiJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMSB0YWIiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIxNCBkYXkiLCJkaXNwZW5zZSI6IjI4IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IGFkdWx0IHwgYW1veC1jbGF2ICg4NzUvMTI1bWcpIHwgY2xhdnVsaW4gYXVnbWVudGluIHwgMSB0YWIifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiQW1veC1DbGF2ICg1MDAvMTI1bWcpIiwiYnJhbmRzIjpbIkNsYXZ1bGluIiwiQXVnbWVudGluIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxIHRhYiIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIxNCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJSZW5hbCBkb3NlIGFkanVzdGVkIGZvciBwYXRpZW50cyB3aXRoIENyQ2wgMTAgdG8gMzBtbC9taW4uIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgYWR1bHQgfCBhbW94LWNsYXYgKDUwMC8xMjVtZykgfCBjbGF2dWxpbiBhdWdtZW50aW4gfCAxIHRhYiB8IHJlbmFsIGRvc2UgYWRqdXN0ZWQgZm9yIHBhdGllbnRzIHdpdGggY3JjbCAxMCB0byAzMG1sL21pbi4ifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiQW1veGljaWxsaW4iLCJicmFuZHMiOlsiQW1veGlsIiwiVHJpbW94Il0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiI1MDBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJUSUQiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIyMSB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBhZHVsdCB8IGFtb3hpY2lsbGluIHwgYW1veGlsIHRyaW1veCB8IDUwMG1nIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkFtb3hpY2lsbGluIiwiYnJhbmRzIjpbIkFtb3hpbCIsIlRyaW1veCJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMTAwMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IlRJRCIsImR1cmF0aW9uIjoiNSBkYXkiLCJkaXNwZW5zZSI6IjE1IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IGFkdWx0IHwgYW1veGljaWxsaW4gfCBhbW94aWwgdHJpbW94IHwgMTAwMG1nIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkFtb3hpY2lsbGluIiwiYnJhbmRzIjpbIkFtb3hpbCIsIlRyaW1veCJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMTAwMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IlRJRCIsImR1cmF0aW9uIjoiMTAgZGF5IiwiZGlzcGVuc2UiOiIzMCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBhZHVsdCB8IGFtb3hpY2lsbGluIHwgYW1veGlsIHRyaW1veCB8IDEwMDBtZyJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJBeml0aHJvbXljaW4iLCJicmFuZHMiOlsiWml0aHJvbWF4IiwiWm1heCJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiNTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiI3IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IGFkdWx0IHwgYXppdGhyb215Y2luIHwgeml0aHJvbWF4IHptYXggfCA1MDBtZyJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJDYW5lc3RlbiAoMSUpICsgSHlkcm9jb3J0aXNvbmUgKDElKSBjcmVhbSIsImJyYW5kcyI6WyJDYW5lc3RlbiBIQyIsIkxvdHJpc29uZSJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMSBhcHBsaWNhdGlvbiIsInJvdXRlIjoidG9waWNhbCIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiMiB3ZWVrIiwiZGlzcGVuc2UiOiIxIHR1YmUiLCJwcm4iOiIiLCJmb3JtIjoiY3JlYW0iLCJjb21tZW50cyI6IlN0b3Agb25jZSBzeW1wdG9tcyByZXNvbHZlLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IGFkdWx0IHwgY2FuZXN0ZW4gKDElKSArIGh5ZHJvY29ydGlzb25lICgxJSkgY3JlYW0gfCBjYW5lc3RlbiBoYyBsb3RyaXNvbmUgfCAxIGFwcGxpY2F0aW9uIHwgc3RvcCBvbmNlIHN5bXB0b21zIHJlc29sdmUuIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkNlZmFkcm94aWwiLCJicmFuZHMiOlsiRHVyaWNlZiJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiNTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiMTQgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiSWYgdW5hdmFpbGFibGUsIG1heSByZXBsYWNlIHdpdGggY2VwaGFsZXhpbiA1MDBtZyBQTyBRSUQgZm9yIDcgZGF5cy4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBhZHVsdCB8IGNlZmFkcm94aWwgfCBkdXJpY2VmIHwgNTAwbWcgfCBpZiB1bmF2YWlsYWJsZSwgbWF5IHJlcGxhY2Ugd2l0aCBjZXBoYWxleGluIDUwMG1nIHBvIHFpZCBmb3IgNyBkYXlzLiJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJDZWZ1cm94aW1lIiwiYnJhbmRzIjpbIkNlZnRpbiJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMjUwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIxMCBkYXkiLCJkaXNwZW5zZSI6IjIwIHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IGFkdWx0IHwgY2VmdXJveGltZSB8IGNlZnRpbiB8IDI1MG1nIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkNlZnVyb3hpbWUiLCJicmFuZHMiOlsiQ2VmdGluIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiI1MDBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiIxMCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBhZHVsdCB8IGNlZnVyb3hpbWUgfCBjZWZ0aW4gfCA1MDBtZyJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJDZWZ1cm94aW1lIiwiYnJhbmRzIjpbIkNlZnRpbiJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiNTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIxMCBkYXkiLCJkaXNwZW5zZSI6IjIwIHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IGFkdWx0IHwgY2VmdXJveGltZSB8IGNlZnRpbiB8IDUwMG1nIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkNlcGhhbGV4aW4iLCJicmFuZHMiOlsiS2VmbGV4Il0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiI1MDBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJRSUQiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiIyMCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBhZHVsdCB8IGNlcGhhbGV4aW4gfCBrZWZsZXggfCA1MDBtZyJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJDZXBoYWxleGluIiwiYnJhbmRzIjpbIktlZmxleCJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiNTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiUUlEIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiMjggdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgYWR1bHQgfCBjZXBoYWxleGluIHwga2VmbGV4IHwgNTAwbWcifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiQ2lwcm9mbG94YWNpbiArIERleGFtZXRoYXNvbmUgb3RpYyIsImJyYW5kcyI6WyJDaXByb2RleCJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiNCBkcm9wcyIsInJvdXRlIjoidG8gYWZmZWN0ZWQgZWFyKHMpIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiMSBib3R0bGUiLCJwcm4iOiIiLCJmb3JtIjoiZHJvcHMiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IGFkdWx0IHwgY2lwcm9mbG94YWNpbiArIGRleGFtZXRoYXNvbmUgb3RpYyB8IGNpcHJvZGV4IHwgNCBkcm9wcyJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJDaXByb2Zsb3hhY2luIG9waHRoYWxtaWMgZHJvcHMgKDAuMyUpIiwiYnJhbmRzIjpbIkNpbG94YW4iXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjEtMiBkcm9wcyIsInJvdXRlIjoidG8gYWZmZWN0ZWQgZXllKHMpIiwiZnJlcXVlbmN5IjoiUUlEIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiMSBib3R0bGUiLCJwcm4iOiIiLCJmb3JtIjoiZHJvcHMiLCJjb21tZW50cyI6IklmIGNvbnRhY3QgbGVucyB3ZWFyZXIsIHJlbW92ZSBsZW5zIGZvciBkdXJhdGlvbiBvZiB0cmVhdG1lbnQuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgYWR1bHQgfCBjaXByb2Zsb3hhY2luIG9waHRoYWxtaWMgZHJvcHMgKDAuMyUpIHwgY2lsb3hhbiB8IDEtMiBkcm9wcyB8IGlmIGNvbnRhY3QgbGVucyB3ZWFyZXIsIHJlbW92ZSBsZW5zIGZvciBkdXJhdGlvbiBvZiB0cmVhdG1lbnQuIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkNpcHJvZmxveGFjaW4iLCJicmFuZHMiOlsiQ2lwcm8iXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjUwMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InExMmgiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIxNCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBhZHVsdCB8IGNpcHJvZmxveGFjaW4gfCBjaXBybyB8IDUwMG1nIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkNpcHJvZmxveGFjaW4iLCJicmFuZHMiOlsiQ2lwcm8iXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6Ijc1MG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InExMmgiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIxNCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJIaWdoIGRvc2UgdGhlcmFweSAoaS5lLiBmb3IgUHNldWRvbW9uYXMsIGJvbmUsIG9yIGpvaW50IGluZmVjdGlvbnMpLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IGFkdWx0IHwgY2lwcm9mbG94YWNpbiB8IGNpcHJvIHwgNzUwbWcgfCBoaWdoIGRvc2UgdGhlcmFweSAoaS5lLiBmb3IgcHNldWRvbW9uYXMsIGJvbmUsIG9yIGpvaW50IGluZmVjdGlvbnMpLiJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJDbGluZGFteWNpbiBjcmVhbSAoMiUpIiwiYnJhbmRzIjpbIkRhbGFjaW4iLCJDbGVvY2luIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJQViIsImZyZXF1ZW5jeSI6InFIUyIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJjcmVhbSIsImNvbW1lbnRzIjoiT25lIGFwcGxpY2F0aW9uID0gNWcgY29udGFpbmluZyB+MTAwbWcgY2xpbmRhbXljaW4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBhZHVsdCB8IGNsaW5kYW15Y2luIGNyZWFtICgyJSkgfCBkYWxhY2luIGNsZW9jaW4gfCAxIGFwcGxpY2F0aW9uIHwgb25lIGFwcGxpY2F0aW9uID0gNWcgY29udGFpbmluZyB+MTAwbWcgY2xpbmRhbXljaW4ifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiQ2xvdHJpbWF6b2xlIGNyZWFtICgxJSkiLCJicmFuZHMiOlsiQ2FuZXN0ZW4iLCJMb3RyaW1pbiJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMSBhcHBsaWNhdGlvbiIsInJvdXRlIjoidG8gYWZmZWN0ZWQgZWFyKHMpIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIyIHdlZWsiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJjcmVhbSIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgYWR1bHQgfCBjbG90cmltYXpvbGUgY3JlYW0gKDElKSB8IGNhbmVzdGVuIGxvdHJpbWluIHwgMSBhcHBsaWNhdGlvbiJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJDbG90cmltYXpvbGUgY3JlYW0gKDElKSIsImJyYW5kcyI6WyJDYW5lc3RlbiIsIkxvdHJpbWluIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJQViIsImZyZXF1ZW5jeSI6InFIUyIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJjcmVhbSIsImNvbW1lbnRzIjoiT25lIGFwcGxpY2F0aW9uID0gNWcuIE1heSBhbHNvIGFwcGx5IGV4dGVybmFsbHkgdHdpY2UgZGFpbHkgZm9yIDcgZGF5cywgYXMgbmVlZGVkLCBmb3IgaXRjaGluZyBhbmQgaXJyaXRhdGlvbi4gU2FmZSBpbiBwcmVnbmFuY3kuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgYWR1bHQgfCBjbG90cmltYXpvbGUgY3JlYW0gKDElKSB8IGNhbmVzdGVuIGxvdHJpbWluIHwgMSBhcHBsaWNhdGlvbiB8IG9uZSBhcHBsaWNhdGlvbiA9IDVnLiBtYXkgYWxzbyBhcHBseSBleHRlcm5hbGx5IHR3aWNlIGRhaWx5IGZvciA3IGRheXMsIGFzIG5lZWRlZCwgZm9yIGl0Y2hpbmcgYW5kIGlycml0YXRpb24uIHNhZmUgaW4gcHJlZ25hbmN5LiJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJEb2x1dGVncmF2aXIiLCJicmFuZHMiOlsiVGl2aWNheSJdLCJpbmRpY2F0aW9uIjoiSElWIFBFUCAocG9zdC1leHBvc3VyZSBwcm9waHlsYXhpcykiLCJkb3NlX3RleHQiOiI1MG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiIyOCBkYXkiLCJkaXNwZW5zZSI6IjI4IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IlN0YXJ0IGFzIHNvb24gYXMgcG9zc2libGUgYWZ0ZXIgZXhwb3N1cmUgKGFuZCB3aXRoaW4gNzIgaG91cnMgb2YgZXhwb3N1cmUpLiBUYWtlIGluIGNvbWJpbmF0aW9uIHdpdGggVHJ1dmFkYS4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBhZHVsdCB8IGhpdiBwZXAgKHBvc3QtZXhwb3N1cmUgcHJvcGh5bGF4aXMpIHwgZG9sdXRlZ3JhdmlyIHwgdGl2aWNheSB8IDUwbWcgfCBzdGFydCBhcyBzb29uIGFzIHBvc3NpYmxlIGFmdGVyIGV4cG9zdXJlIChhbmQgd2l0aGluIDcyIGhvdXJzIG9mIGV4cG9zdXJlKS4gdGFrZSBpbiBjb21iaW5hdGlvbiB3aXRoIHRydXZhZGEuIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkRveHljeWNsaW5lIiwiYnJhbmRzIjpbIlZpYnJhbXljaW4iLCJEb3h5Y2luIiwiQXBwcmlsb24iXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjEwMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IjE0IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkF2b2lkIGluIHByZWduYW5jeSBvciBsYWN0YXRpbmcgcGVvcGxlLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IGFkdWx0IHwgZG94eWN5Y2xpbmUgfCB2aWJyYW15Y2luIGRveHljaW4gYXBwcmlsb24gfCAxMDBtZyB8IGF2b2lkIGluIHByZWduYW5jeSBvciBsYWN0YXRpbmcgcGVvcGxlLiJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJEb3h5Y3ljbGluZSIsImJyYW5kcyI6WyJWaWJyYW15Y2luIiwiRG94eWNpbiIsIkFwcHJpbG9uIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxMDBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjEwIGRheSIsImRpc3BlbnNlIjoiMjAgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiQXZvaWQgaW4gcHJlZ25hbmN5IG9yIGxhY3RhdGluZyBwZW9wbGUuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgYWR1bHQgfCBkb3h5Y3ljbGluZSB8IHZpYnJhbXljaW4gZG94eWNpbiBhcHByaWxvbiB8IDEwMG1nIHwgYXZvaWQgaW4gcHJlZ25hbmN5IG9yIGxhY3RhdGluZyBwZW9wbGUuIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkRveHljeWNsaW5lIiwiYnJhbmRzIjpbIlZpYnJhbXljaW4iLCJEb3h5Y2luIiwiQXBwcmlsb24iXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjEwMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiMTQgZGF5IiwiZGlzcGVuc2UiOiIyOCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJBdm9pZCBpbiBwcmVnbmFuY3kgb3IgbGFjdGF0aW5nIHBlb3BsZS4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBhZHVsdCB8IGRveHljeWNsaW5lIHwgdmlicmFteWNpbiBkb3h5Y2luIGFwcHJpbG9uIHwgMTAwbWcgfCBhdm9pZCBpbiBwcmVnbmFuY3kgb3IgbGFjdGF0aW5nIHBlb3BsZS4ifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiRG94eWN5Y2xpbmUiLCJicmFuZHMiOlsiVmlicmFteWNpbiIsIkRveHljaW4iLCJBcHByaWxvbiJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjMgd2VlayIsImRpc3BlbnNlIjoiMjEgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiQXZvaWQgaW4gcHJlZ25hbmN5IG9yIGxhY3RhdGluZyBwZW9wbGUuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgYWR1bHQgfCBkb3h5Y3ljbGluZSB8IHZpYnJhbXljaW4gZG94eWNpbiBhcHByaWxvbiB8IDEwMG1nIHwgYXZvaWQgaW4gcHJlZ25hbmN5IG9yIGxhY3RhdGluZyBwZW9wbGUuIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkVyeXRocm9teWNpbiBvcGh0aGFsbWljIG9pbnRtZW50ICgwLjUlKSIsImJyYW5kcyI6WyJJbG90eWNpbiIsIkRpb215Y2luIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0byBhZmZlY3RlZCBleWUocykiLCJmcmVxdWVuY3kiOiJRSUQiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIxIHR1YmUiLCJwcm4iOiIiLCJmb3JtIjoib2ludG1lbnQiLCJjb21tZW50cyI6IkFwcGxpY2F0aW9uIGluc3RydWN0aW9uOiBJbnN0aWxsIH4xY20gcmliYm9uIHRvIGluc2lkZSBvZiBsb3dlciBsaWQuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgYWR1bHQgfCBlcnl0aHJvbXljaW4gb3BodGhhbG1pYyBvaW50bWVudCAoMC41JSkgfCBpbG90eWNpbiBkaW9teWNpbiB8IDEgYXBwbGljYXRpb24gfCBhcHBsaWNhdGlvbiBpbnN0cnVjdGlvbjogaW5zdGlsbCB+MWNtIHJpYmJvbiB0byBpbnNpZGUgb2YgbG93ZXIgbGlkLiJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJGbHVjb25hem9sZSIsImJyYW5kcyI6WyJEaWZsdWNhbiJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMTUwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5Ijoib25jZSIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxIGRvc2UiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJBdm9pZCBpbiBwcmVnbmFuY3kuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgYWR1bHQgfCBmbHVjb25hem9sZSB8IGRpZmx1Y2FuIHwgMTUwbWcgfCBhdm9pZCBpbiBwcmVnbmFuY3kuIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkZvc2ZvbXljaW4iLCJicmFuZHMiOlsiTW9udXJvbCJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiM2ciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5Ijoib25jZSIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxIHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IGFkdWx0IHwgZm9zZm9teWNpbiB8IG1vbnVyb2wgfCAzZyJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJGdXNpZGljIEFjaWQgY3JlYW0gKDIlKSIsImJyYW5kcyI6WyJGdWNpZGluIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0b3BpY2FsIiwiZnJlcXVlbmN5IjoiVElEIiwiZHVyYXRpb24iOiIyIHdlZWsiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJjcmVhbSIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgYWR1bHQgfCBmdXNpZGljIGFjaWQgY3JlYW0gKDIlKSB8IGZ1Y2lkaW4gfCAxIGFwcGxpY2F0aW9uIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IktldG9jb25hem9sZSBjcmVhbSAoMiUpIiwiYnJhbmRzIjpbIk1vbmlzdGF0IiwiTWljYXRpbiJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMSBhcHBsaWNhdGlvbiIsInJvdXRlIjoidG9waWNhbCIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiIyIHdlZWsiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJjcmVhbSIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgYWR1bHQgfCBrZXRvY29uYXpvbGUgY3JlYW0gKDIlKSB8IG1vbmlzdGF0IG1pY2F0aW4gfCAxIGFwcGxpY2F0aW9uIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6Ikxldm9mbG94YWNpbiIsImJyYW5kcyI6WyJMZXZhcXVpbiJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiNzUwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiI1IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IGFkdWx0IHwgbGV2b2Zsb3hhY2luIHwgbGV2YXF1aW4gfCA3NTBtZyJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJNZXRyb25pZGF6b2xlIiwiYnJhbmRzIjpbIkZsYWd5bCJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiNTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiMTQgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgYWR1bHQgfCBtZXRyb25pZGF6b2xlIHwgZmxhZ3lsIHwgNTAwbWcifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiTWV0cm9uaWRhem9sZSIsImJyYW5kcyI6WyJGbGFneWwiXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjUwMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InE4aCIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IjIxIHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IGFkdWx0IHwgbWV0cm9uaWRhem9sZSB8IGZsYWd5bCB8IDUwMG1nIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6Ik1ldHJvbmlkYXpvbGUiLCJicmFuZHMiOlsiRmxhZ3lsIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiI1MDBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjE0IGRheSIsImRpc3BlbnNlIjoiMjggdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgYWR1bHQgfCBtZXRyb25pZGF6b2xlIHwgZmxhZ3lsIHwgNTAwbWcifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiTWljb25hem9sZSBjcmVhbSAoNCUpIiwiYnJhbmRzIjpbIk1vbmlzdGF0IiwiTWljYXRpbiJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMSBhcHBsaWNhdGlvbiIsInJvdXRlIjoiUFYiLCJmcmVxdWVuY3kiOiJxSFMiLCJkdXJhdGlvbiI6IjMgZGF5IiwiZGlzcGVuc2UiOiIxIHR1YmUiLCJwcm4iOiIiLCJmb3JtIjoiY3JlYW0iLCJjb21tZW50cyI6Ik9uZSBhcHBsaWNhdGlvbiA9IDVnLiBNYXkgYWxzbyBhcHBseSBleHRlcm5hbGx5IHR3aWNlIGRhaWx5IGZvciA3IGRheXMsIGFzIG5lZWRlZCwgZm9yIGl0Y2hpbmcgYW5kIGlycml0YXRpb24uIFNhZmUgaW4gcHJlZ25hbmN5LiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IGFkdWx0IHwgbWljb25hem9sZSBjcmVhbSAoNCUpIHwgbW9uaXN0YXQgbWljYXRpbiB8IDEgYXBwbGljYXRpb24gfCBvbmUgYXBwbGljYXRpb24gPSA1Zy4gbWF5IGFsc28gYXBwbHkgZXh0ZXJuYWxseSB0d2ljZSBkYWlseSBmb3IgNyBkYXlzLCBhcyBuZWVkZWQsIGZvciBpdGNoaW5nIGFuZCBpcnJpdGF0aW9uLiBzYWZlIGluIHByZWduYW5jeS4ifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiTW94aWZsb3hhY2luIiwiYnJhbmRzIjpbIkF2ZWxveCJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiNDAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiI3IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IGFkdWx0IHwgbW94aWZsb3hhY2luIHwgYXZlbG94IHwgNDAwbWcifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiTXVwaXJvY2luIGNyZWFtICgyJSkiLCJicmFuZHMiOlsiQmFjdHJvYmFuIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0b3BpY2FsIiwiZnJlcXVlbmN5IjoiVElEIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoiIiwiZm9ybSI6ImNyZWFtIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBhZHVsdCB8IG11cGlyb2NpbiBjcmVhbSAoMiUpIHwgYmFjdHJvYmFuIHwgMSBhcHBsaWNhdGlvbiJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJOaXRyb2Z1cmFudG9pbiIsImJyYW5kcyI6WyJNYWNyb2JpZCIsIk1hY3JvZGFudGluIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxMDBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiIxMCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBhZHVsdCB8IG5pdHJvZnVyYW50b2luIHwgbWFjcm9iaWQgbWFjcm9kYW50aW4gfCAxMDBtZyJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJOaXRyb2Z1cmFudG9pbiIsImJyYW5kcyI6WyJNYWNyb2JpZCIsIk1hY3JvZGFudGluIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxMDBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIxNCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBhZHVsdCB8IG5pdHJvZnVyYW50b2luIHwgbWFjcm9iaWQgbWFjcm9kYW50aW4gfCAxMDBtZyJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJOeXN0YXRpbiIsImJyYW5kcyI6WyJNeWNvc3RhdGluIiwiTmlsc3RhdCJdLCJpbmRpY2F0aW9uIjoiT3JhbCB0aHJ1c2ggKGFkdWx0L2NoaWxkKSIsImRvc2VfdGV4dCI6IjVtbCIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJRSUQiLCJkdXJhdGlvbiI6IjE0IGRheSIsImRpc3BlbnNlIjoiMSBib3R0bGUiLCJwcm4iOiJ0aHJ1c2giLCJmb3JtIjoic3VzcGVuc2lvbiIsImNvbW1lbnRzIjoiU3dpc2ggaW4gdGhlIG1vdXRoIGFuZCByZXRhaW4gZm9yIGFzIGxvbmcgYXMgcG9zc2libGUgKHNldmVyYWwgbWludXRlcykgYmVmb3JlIHN3YWxsb3dpbmcuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIxIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgYWR1bHQgfCBvcmFsIHRocnVzaCAoYWR1bHQvY2hpbGQpIHwgbnlzdGF0aW4gfCBteWNvc3RhdGluIG5pbHN0YXQgfCA1bWwgfCB0aHJ1c2ggfCBzd2lzaCBpbiB0aGUgbW91dGggYW5kIHJldGFpbiBmb3IgYXMgbG9uZyBhcyBwb3NzaWJsZSAoc2V2ZXJhbCBtaW51dGVzKSBiZWZvcmUgc3dhbGxvd2luZy4ifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiUGVybWV0aHJpbiBsb3Rpb24gKDElKSIsImJyYW5kcyI6WyJOaXgiLCJLd2VsbGFkYS1QIl0sImluZGljYXRpb24iOiJIZWFkIGxpY2UiLCJkb3NlX3RleHQiOiIiLCJyb3V0ZSI6IiIsImZyZXF1ZW5jeSI6IiIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxIHR1YmUiLCJwcm4iOiIiLCJmb3JtIjoiIiwiY29tbWVudHMiOiJXYXNoIGhhaXIgYmVmb3JlIGFwcGxpY2F0aW9uLiBBcHBseSBsb3Rpb24gdG8gc2F0dXJhdGUgaGFpciBhbmQgc2NhbHAsIGxlYXZlIGluIGZvciAxMCBtaW51dGVzIHRoZW4gcmluc2UuIFJlbW92ZSByZW1haW5pbmcgbml0cyB3aXRoIGNvbWIuIFJlcGVhdCB0cmVhdG1lbnQgaW4gNyBkYXlzLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IGFkdWx0IHwgaGVhZCBsaWNlIHwgcGVybWV0aHJpbiBsb3Rpb24gKDElKSB8IG5peCBrd2VsbGFkYS1wIHwgd2FzaCBoYWlyIGJlZm9yZSBhcHBsaWNhdGlvbi4gYXBwbHkgbG90aW9uIHRvIHNhdHVyYXRlIGhhaXIgYW5kIHNjYWxwLCBsZWF2ZSBpbiBmb3IgMTAgbWludXRlcyB0aGVuIHJpbnNlLiByZW1vdmUgcmVtYWluaW5nIG5pdHMgd2l0aCBjb21iLiByZXBlYXQgdHJlYXRtZW50IGluIDcgZGF5cy4ifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiUGVybWV0aHJpbiBjcmVhbSAoNSUpIiwiYnJhbmRzIjpbIk5peCIsIkt3ZWxsYWRhLVAiXSwiaW5kaWNhdGlvbiI6IlNjYWJpZXMiLCJkb3NlX3RleHQiOiIiLCJyb3V0ZSI6IiIsImZyZXF1ZW5jeSI6IiIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxIHR1YmUiLCJwcm4iOiIiLCJmb3JtIjoiIiwiY29tbWVudHMiOiJBcHBseSB0byBlbnRpcmUgYm9keSBmcm9tIHNjYWxwIHRvIHNvbGVzICgzMCBnIGZvciBhdmVyYWdlIGFkdWx0KTsgbGVhdmUgb24gZm9yIDgtMTQgaG91cnMgd2FzaGluZyBvZmYuIFJlcGVhdCB0cmVhdG1lbnQgaW4gNyBkYXlzLiBUcmVhdCBjbG9zZSBjb250YWN0cy4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjEiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBhZHVsdCB8IHNjYWJpZXMgfCBwZXJtZXRocmluIGNyZWFtICg1JSkgfCBuaXgga3dlbGxhZGEtcCB8IGFwcGx5IHRvIGVudGlyZSBib2R5IGZyb20gc2NhbHAgdG8gc29sZXMgKDMwIGcgZm9yIGF2ZXJhZ2UgYWR1bHQpOyBsZWF2ZSBvbiBmb3IgOC0xNCBob3VycyB3YXNoaW5nIG9mZi4gcmVwZWF0IHRyZWF0bWVudCBpbiA3IGRheXMuIHRyZWF0IGNsb3NlIGNvbnRhY3RzLiJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJUTVAvU01YIERTICg4MDAvMTYwbWcpIiwiYnJhbmRzIjpbIlNlcHRyYSBEUyIsIkJhY3RyaW0gRFMiLCJTdWxmYW1ldGhveGF6b2xlICsgVHJpbWV0aG9wcmltIERTIiwiVE1QLVNNWCBEUyJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMSB0YWIiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiMTQgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgYWR1bHQgfCB0bXAvc214IGRzICg4MDAvMTYwbWcpIHwgc2VwdHJhIGRzIGJhY3RyaW0gZHMgc3VsZmFtZXRob3hhem9sZSArIHRyaW1ldGhvcHJpbSBkcyB0bXAtc214IGRzIHwgMSB0YWIifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiVE1QL1NNWCBEUyAoODAwLzE2MG1nKSIsImJyYW5kcyI6WyJTZXB0cmEgRFMiLCJCYWN0cmltIERTIiwiU3VsZmFtZXRob3hhem9sZSArIFRyaW1ldGhvcHJpbSBEUyIsIlRNUC1TTVggRFMiXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjEgdGFiIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiMTQgZGF5IiwiZGlzcGVuc2UiOiIyOCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBhZHVsdCB8IHRtcC9zbXggZHMgKDgwMC8xNjBtZykgfCBzZXB0cmEgZHMgYmFjdHJpbSBkcyBzdWxmYW1ldGhveGF6b2xlICsgdHJpbWV0aG9wcmltIGRzIHRtcC1zbXggZHMgfCAxIHRhYiJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJUTVAvU01YIFNTICg0MDAvODBtZykiLCJicmFuZHMiOlsiU2VwdHJhIiwiQmFjdHJpbSIsIlN1bGZhbWV0aG94YXpvbGUgKyBUcmltZXRob3ByaW0iLCJUTVAtU01YIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxIHRhYiIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIxNCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJSZW5hbCBkb3NlIGFkanVzdGVkIGZvciBwYXRpZW50cyB3aXRoIENyQ2wgMTAgdG8gMjltbC9taW4uIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgYWR1bHQgfCB0bXAvc214IHNzICg0MDAvODBtZykgfCBzZXB0cmEgYmFjdHJpbSBzdWxmYW1ldGhveGF6b2xlICsgdHJpbWV0aG9wcmltIHRtcC1zbXggfCAxIHRhYiB8IHJlbmFsIGRvc2UgYWRqdXN0ZWQgZm9yIHBhdGllbnRzIHdpdGggY3JjbCAxMCB0byAyOW1sL21pbi4ifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiVG9icmFteWNpbiBvcGh0aGFsbWljIG9pbnRtZW50ICgwLjMlKSIsImJyYW5kcyI6WyJUb2JyZXgiXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjEgYXBwbGljYXRpb24iLCJyb3V0ZSI6InRvIGFmZmVjdGVkIGV5ZShzKSIsImZyZXF1ZW5jeSI6IlFJRCIsImR1cmF0aW9uIjoiNy0xNCBkYXkiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJvaW50bWVudCIsImNvbW1lbnRzIjoiU3RvcCBvbmNlIHN5bXB0b21zIHJlc29sdmUuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgYWR1bHQgfCB0b2JyYW15Y2luIG9waHRoYWxtaWMgb2ludG1lbnQgKDAuMyUpIHwgdG9icmV4IHwgMSBhcHBsaWNhdGlvbiB8IHN0b3Agb25jZSBzeW1wdG9tcyByZXNvbHZlLiJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJFbXRyaWNpdGFiaW5lICsgVGVub2ZvdmlyIiwiYnJhbmRzIjpbIlRydXZhZGEiXSwiaW5kaWNhdGlvbiI6IkhJViBQRVAgKHBvc3QtZXhwb3N1cmUgcHJvcGh5bGF4aXMpIiwiZG9zZV90ZXh0IjoiMSB0YWIiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjI4IGRheSIsImRpc3BlbnNlIjoiMjggdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiU3RhcnQgYXMgc29vbiBhcyBwb3NzaWJsZSBhZnRlciBleHBvc3VyZSAoYW5kIHdpdGhpbiA3MiBob3VycyBvZiBleHBvc3VyZSkuIFRha2UgaW4gY29tYmluYXRpb24gd2l0aCBEb2x1dGVncmF2aXIuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgYWR1bHQgfCBoaXYgcGVwIChwb3N0LWV4cG9zdXJlIHByb3BoeWxheGlzKSB8IGVtdHJpY2l0YWJpbmUgKyB0ZW5vZm92aXIgfCB0cnV2YWRhIHwgMSB0YWIgfCBzdGFydCBhcyBzb29uIGFzIHBvc3NpYmxlIGFmdGVyIGV4cG9zdXJlIChhbmQgd2l0aGluIDcyIGhvdXJzIG9mIGV4cG9zdXJlKS4gdGFrZSBpbiBjb21iaW5hdGlvbiB3aXRoIGRvbHV0ZWdyYXZpci4ifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiVmFsYWN5Y2xvdmlyIiwiYnJhbmRzIjpbIlZhbHRyZXgiXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjFnIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiI1IGRheSIsImRpc3BlbnNlIjoiNSB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBhZHVsdCB8IHZhbGFjeWNsb3ZpciB8IHZhbHRyZXggfCAxZyJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJWYWxhY3ljbG92aXIiLCJicmFuZHMiOlsiVmFsdHJleCJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiMTQgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgYWR1bHQgfCB2YWxhY3ljbG92aXIgfCB2YWx0cmV4IHwgMWcifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiVmFsYWN5Y2xvdmlyIiwiYnJhbmRzIjpbIlZhbHRyZXgiXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjFnIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IlRJRCIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IjIxIHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IGFkdWx0IHwgdmFsYWN5Y2xvdmlyIHwgdmFsdHJleCB8IDFnIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IlZhbGFjeWNsb3ZpciIsImJyYW5kcyI6WyJWYWx0cmV4Il0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJUSUQiLCJkdXJhdGlvbiI6IjEwIGRheSIsImRpc3BlbnNlIjoiMzAgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgYWR1bHQgfCB2YWxhY3ljbG92aXIgfCB2YWx0cmV4IHwgMWcifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiVmFuY29teWNpbiIsImJyYW5kcyI6WyJWYW5jb2NpbiJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMTI1bWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiUUlEIiwiZHVyYXRpb24iOiIxMCBkYXkiLCJkaXNwZW5zZSI6IjQwIHRhYiIsInBybiI6IiIsImZvcm0iOiJjYXBzdWxlIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBhZHVsdCB8IHZhbmNvbXljaW4gfCB2YW5jb2NpbiB8IDEyNW1nIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6Ik1veGlmbG94YWNpbiBvcGh0aGFsbWljIGRyb3BzICgwLjUlKSIsImJyYW5kcyI6WyJWaWdhbW94Il0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxIGRyb3AiLCJyb3V0ZSI6InRvIGFmZmVjdGVkIGV5ZShzKSIsImZyZXF1ZW5jeSI6IlRJRCIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IjEgYm90dGxlIiwicHJuIjoiIiwiZm9ybSI6ImRyb3BzIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBhZHVsdCB8IG1veGlmbG94YWNpbiBvcGh0aGFsbWljIGRyb3BzICgwLjUlKSB8IHZpZ2Ftb3ggfCAxIGRyb3AifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiQW1veC1DbGF2IiwiYnJhbmRzIjpbIkNsYXZ1bGluIiwiQXVnbWVudGluIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIyMi41bWcva2cvZG9zZSIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoic3VzcGVuc2lvbiIsImNvbW1lbnRzIjoiNDVtZyBhbW94L2tnL2RheS4gTWF4aW11bSBkb3NlID0gODc1bWcgYW1veGljaWxsaW4vZG9zZS4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjp0cnVlLCJkb3NlX3Blcl9rZ19tZyI6MjIuNSwibWF4X2Rvc2VfbWciOjg3NS4wLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgcGVkaWF0cmljIHwgYW1veC1jbGF2IHwgY2xhdnVsaW4gYXVnbWVudGluIHwgMjIuNW1nL2tnL2Rvc2UgfCA0NW1nIGFtb3gva2cvZGF5LiBtYXhpbXVtIGRvc2UgPSA4NzVtZyBhbW94aWNpbGxpbi9kb3NlLiJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJBbW94LUNsYXYiLCJicmFuZHMiOlsiQ2xhdnVsaW4iLCJBdWdtZW50aW4iXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjIyLjVtZy9rZy9kb3NlIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJzdXNwZW5zaW9uIiwiY29tbWVudHMiOiI0NW1nIGFtb3gva2cvZGF5LiBNYXhpbXVtIGRvc2UgPSA4NzVtZyBhbW94aWNpbGxpbi9kb3NlLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOnRydWUsImRvc2VfcGVyX2tnX21nIjoyMi41LCJtYXhfZG9zZV9tZyI6ODc1LjAsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBwZWRpYXRyaWMgfCBhbW94LWNsYXYgfCBjbGF2dWxpbiBhdWdtZW50aW4gfCAyMi41bWcva2cvZG9zZSB8IDQ1bWcgYW1veC9rZy9kYXkuIG1heGltdW0gZG9zZSA9IDg3NW1nIGFtb3hpY2lsbGluL2Rvc2UuIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkFtb3gtQ2xhdiAoMjAwLzguNW1nLzVtTCkiLCJicmFuZHMiOlsiQ2xhdnVsaW4iLCJBdWdtZW50aW4iXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjQ1bWcva2cvZG9zZSIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxMTJoIiwiZHVyYXRpb24iOiI1IGRheSIsImRpc3BlbnNlIjoiIiwicHJuIjoiIiwiZm9ybSI6InN1c3BlbnNpb24iLCJjb21tZW50cyI6IjkwbWcgYW1veC9rZy9kYXkuIE1heGltdW0gZG9zZSA9IDQwMDBtZyBhbW94L2RheS4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjp0cnVlLCJkb3NlX3Blcl9rZ19tZyI6NDUuMCwibWF4X2Rvc2VfbWciOjIwMDAuMCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IHBlZGlhdHJpYyB8IGFtb3gtY2xhdiAoMjAwLzguNW1nLzVtbCkgfCBjbGF2dWxpbiBhdWdtZW50aW4gfCA0NW1nL2tnL2Rvc2UgfCA5MG1nIGFtb3gva2cvZGF5LiBtYXhpbXVtIGRvc2UgPSA0MDAwbWcgYW1veC9kYXkuIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkFtb3hpY2lsbGluIiwiYnJhbmRzIjpbIkFtb3hpbCIsIlRyaW1veCJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMjIuNW1nL2tnL2Rvc2UiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiIiwicHJuIjoiIiwiZm9ybSI6InN1c3BlbnNpb24iLCJjb21tZW50cyI6IjQ1bWcgYW1veC9rZy9kYXkuIE1heGltdW0gZG9zZSA9IDMwMDBtZyBhbW94L2RheS4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjp0cnVlLCJkb3NlX3Blcl9rZ19tZyI6MjIuNSwibWF4X2Rvc2VfbWciOjE1MDAuMCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IHBlZGlhdHJpYyB8IGFtb3hpY2lsbGluIHwgYW1veGlsIHRyaW1veCB8IDIyLjVtZy9rZy9kb3NlIHwgNDVtZyBhbW94L2tnL2RheS4gbWF4aW11bSBkb3NlID0gMzAwMG1nIGFtb3gvZGF5LiJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJBbW94aWNpbGxpbiIsImJyYW5kcyI6WyJBbW94aWwiLCJUcmltb3giXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjMwbWcva2cvZG9zZSIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJUSUQiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoic3VzcGVuc2lvbiIsImNvbW1lbnRzIjoiOTBtZyBhbW94L2tnL2RheS4gTWF4aW11bSBkb3NlID0gNDAwMG1nIGFtb3gvZGF5LiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOnRydWUsImRvc2VfcGVyX2tnX21nIjozMC4wLCJtYXhfZG9zZV9tZyI6MTMzMy4wLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgcGVkaWF0cmljIHwgYW1veGljaWxsaW4gfCBhbW94aWwgdHJpbW94IHwgMzBtZy9rZy9kb3NlIHwgOTBtZyBhbW94L2tnL2RheS4gbWF4aW11bSBkb3NlID0gNDAwMG1nIGFtb3gvZGF5LiJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJBbW94aWNpbGxpbiIsImJyYW5kcyI6WyJBbW94aWwiLCJUcmltb3giXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjMwbWcva2cvZG9zZSIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJUSUQiLCJkdXJhdGlvbiI6IjEwIGRheSIsImRpc3BlbnNlIjoiIiwicHJuIjoiIiwiZm9ybSI6InN1c3BlbnNpb24iLCJjb21tZW50cyI6IjkwbWcgYW1veC9rZy9kYXkuIE1heGltdW0gZG9zZSA9IDQwMDBtZyBhbW94L2RheS4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjp0cnVlLCJkb3NlX3Blcl9rZ19tZyI6MzAuMCwibWF4X2Rvc2VfbWciOjEzMzMuMCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IHBlZGlhdHJpYyB8IGFtb3hpY2lsbGluIHwgYW1veGlsIHRyaW1veCB8IDMwbWcva2cvZG9zZSB8IDkwbWcgYW1veC9rZy9kYXkuIG1heGltdW0gZG9zZSA9IDQwMDBtZyBhbW94L2RheS4ifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiQW1veGljaWxsaW4iLCJicmFuZHMiOlsiQW1veGlsIiwiVHJpbW94Il0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiI1MG1nL2tnL2RheSIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJPRCIsImR1cmF0aW9uIjoiMTAgZGF5IiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoic3VzcGVuc2lvbiIsImNvbW1lbnRzIjoiNTBtZyBhbW94L2tnL2RheS4gTWF4aW11bSBkb3NlID0gMTAwMG1nIGFtb3gvZGF5LiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOnRydWUsImRvc2VfcGVyX2tnX21nIjo1MC4wLCJtYXhfZG9zZV9tZyI6MTAwMC4wLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgcGVkaWF0cmljIHwgYW1veGljaWxsaW4gfCBhbW94aWwgdHJpbW94IHwgNTBtZy9rZy9kYXkgfCA1MG1nIGFtb3gva2cvZGF5LiBtYXhpbXVtIGRvc2UgPSAxMDAwbWcgYW1veC9kYXkuIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkF6aXRocm9teWNpbiIsImJyYW5kcyI6WyJaaXRocm9tYXgiLCJabWF4Il0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxMG1nL2tnL2Rvc2UiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoic3VzcGVuc2lvbiIsImNvbW1lbnRzIjoiMTBtZy9rZyAobWF4aW11bSA1MDBtZy9kb3NlKSBQTyBkYWlseSBvbiBkYXkgMSwgdGhlbiA1bWcva2cvZG9zZSAobWF4aW11bSAyNTBtZy9kb3NlKSBQTyBkYWlseSBmb3IgZGF5cyAyLTUuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IHBlZGlhdHJpYyB8IGF6aXRocm9teWNpbiB8IHppdGhyb21heCB6bWF4IHwgMTBtZy9rZy9kb3NlIHwgMTBtZy9rZyAobWF4aW11bSA1MDBtZy9kb3NlKSBwbyBkYWlseSBvbiBkYXkgMSwgdGhlbiA1bWcva2cvZG9zZSAobWF4aW11bSAyNTBtZy9kb3NlKSBwbyBkYWlseSBmb3IgZGF5cyAyLTUuIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkF6aXRocm9teWNpbiIsImJyYW5kcyI6WyJaaXRocm9tYXgiLCJabWF4Il0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxMm1nL2tnL2Rvc2UiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoic3VzcGVuc2lvbiIsImNvbW1lbnRzIjoiMTJtZy9rZy9kb3NlIFBPIGRhaWx5IGZvciA1IGRheXMuIE1heGltdW0gZG9zZSA9IDUwMG1nL2Rvc2UuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6dHJ1ZSwiZG9zZV9wZXJfa2dfbWciOjEyLjAsIm1heF9kb3NlX21nIjo1MDAuMCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IHBlZGlhdHJpYyB8IGF6aXRocm9teWNpbiB8IHppdGhyb21heCB6bWF4IHwgMTJtZy9rZy9kb3NlIHwgMTJtZy9rZy9kb3NlIHBvIGRhaWx5IGZvciA1IGRheXMuIG1heGltdW0gZG9zZSA9IDUwMG1nL2Rvc2UuIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkNhbmVzdGVuICgxJSkgKyBIeWRyb2NvcnRpc29uZSAoMSUpIGNyZWFtIiwiYnJhbmRzIjpbIkNhbmVzdGVuIEhDIiwiTG90cmlzb25lIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0b3BpY2FsIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIxIHdlZWsiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJjcmVhbSIsImNvbW1lbnRzIjoiU3RvcCBvbmNlIHN5bXB0b21zIHJlc29sdmUuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IHBlZGlhdHJpYyB8IGNhbmVzdGVuICgxJSkgKyBoeWRyb2NvcnRpc29uZSAoMSUpIGNyZWFtIHwgY2FuZXN0ZW4gaGMgbG90cmlzb25lIHwgMSBhcHBsaWNhdGlvbiB8IHN0b3Agb25jZSBzeW1wdG9tcyByZXNvbHZlLiJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJDZWZhZHJveGlsIiwiYnJhbmRzIjpbIkR1cmljZWYiXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjE1bWcva2cvZG9zZSIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxMTJoIiwiZHVyYXRpb24iOiI1IGRheSIsImRpc3BlbnNlIjoiIiwicHJuIjoiIiwiZm9ybSI6InN1c3BlbnNpb24iLCJjb21tZW50cyI6Ik1heGltdW0gZG9zZSA9IDUwMG1nL2Rvc2UuIElmIHVuYXZhaWxhYmxlLCBtYXkgcmVwbGFjZSB3aXRoIGNlcGhhbGV4aW4gMjVtZy9rZy9kb3NlIFBPIHE4aCBmb3IgNyBkYXlzIChtYXhpbXVtIGRvc2UgPSA1MDBtZy9kb3NlKS4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjp0cnVlLCJkb3NlX3Blcl9rZ19tZyI6MTUuMCwibWF4X2Rvc2VfbWciOjUwMC4wLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgcGVkaWF0cmljIHwgY2VmYWRyb3hpbCB8IGR1cmljZWYgfCAxNW1nL2tnL2Rvc2UgfCBtYXhpbXVtIGRvc2UgPSA1MDBtZy9kb3NlLiBpZiB1bmF2YWlsYWJsZSwgbWF5IHJlcGxhY2Ugd2l0aCBjZXBoYWxleGluIDI1bWcva2cvZG9zZSBwbyBxOGggZm9yIDcgZGF5cyAobWF4aW11bSBkb3NlID0gNTAwbWcvZG9zZSkuIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkNlZnByb3ppbCIsImJyYW5kcyI6WyJDZWZ6aWwiXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjE1bWcva2cvZG9zZSIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxMTJoIiwiZHVyYXRpb24iOiI1IGRheSIsImRpc3BlbnNlIjoiIiwicHJuIjoiIiwiZm9ybSI6InN1c3BlbnNpb24iLCJjb21tZW50cyI6IjMwbWcva2cvZGF5LiBNYXhpbXVtIGRvc2UgPSA1MDBtZy9kb3NlLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOnRydWUsImRvc2VfcGVyX2tnX21nIjoxNS4wLCJtYXhfZG9zZV9tZyI6NTAwLjAsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBwZWRpYXRyaWMgfCBjZWZwcm96aWwgfCBjZWZ6aWwgfCAxNW1nL2tnL2Rvc2UgfCAzMG1nL2tnL2RheS4gbWF4aW11bSBkb3NlID0gNTAwbWcvZG9zZS4ifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiQ2VmdXJveGltZSIsImJyYW5kcyI6WyJDZWZ0aW4iXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjEwbWcva2cvZG9zZSIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjEwIGRheSIsImRpc3BlbnNlIjoiIiwicHJuIjoiIiwiZm9ybSI6InN1c3BlbnNpb24iLCJjb21tZW50cyI6Ik1heGltdW0gZG9zZSA9IDI1MG1nL2Rvc2UuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6dHJ1ZSwiZG9zZV9wZXJfa2dfbWciOjEwLjAsIm1heF9kb3NlX21nIjoyNTAuMCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IHBlZGlhdHJpYyB8IGNlZnVyb3hpbWUgfCBjZWZ0aW4gfCAxMG1nL2tnL2Rvc2UgfCBtYXhpbXVtIGRvc2UgPSAyNTBtZy9kb3NlLiJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJDZWZ1cm94aW1lIiwiYnJhbmRzIjpbIkNlZnRpbiJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMTVtZy9rZy9kb3NlIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InExMmgiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoic3VzcGVuc2lvbiIsImNvbW1lbnRzIjoiMzBtZy9rZy9kYXkuIE1heGltdW0gZG9zZSA9IDUwMG1nL2Rvc2UuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6dHJ1ZSwiZG9zZV9wZXJfa2dfbWciOjE1LjAsIm1heF9kb3NlX21nIjo1MDAuMCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IHBlZGlhdHJpYyB8IGNlZnVyb3hpbWUgfCBjZWZ0aW4gfCAxNW1nL2tnL2Rvc2UgfCAzMG1nL2tnL2RheS4gbWF4aW11bSBkb3NlID0gNTAwbWcvZG9zZS4ifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiQ2VmdXJveGltZSIsImJyYW5kcyI6WyJDZWZ0aW4iXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjE1bWcva2cvZG9zZSIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxMTJoIiwiZHVyYXRpb24iOiIxMCBkYXkiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJzdXNwZW5zaW9uIiwiY29tbWVudHMiOiIzMG1nL2tnL2RheS4gTWF4aW11bSBkb3NlID0gNTAwbWcvZG9zZS4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjp0cnVlLCJkb3NlX3Blcl9rZ19tZyI6MTUuMCwibWF4X2Rvc2VfbWciOjUwMC4wLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgcGVkaWF0cmljIHwgY2VmdXJveGltZSB8IGNlZnRpbiB8IDE1bWcva2cvZG9zZSB8IDMwbWcva2cvZGF5LiBtYXhpbXVtIGRvc2UgPSA1MDBtZy9kb3NlLiJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJDZWZ1cm94aW1lIiwiYnJhbmRzIjpbIkNlZnRpbiJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiNTBtZy9rZy9kb3NlIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InE2aCIsImR1cmF0aW9uIjoiNSBkYXkiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJzdXNwZW5zaW9uIiwiY29tbWVudHMiOiIxNTBtZy9rZy9kYXkuIE1heGltdW0gZG9zZSA9IDIwMDBtZy9kb3NlLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOnRydWUsImRvc2VfcGVyX2tnX21nIjo1MC4wLCJtYXhfZG9zZV9tZyI6MjAwMC4wLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgcGVkaWF0cmljIHwgY2VmdXJveGltZSB8IGNlZnRpbiB8IDUwbWcva2cvZG9zZSB8IDE1MG1nL2tnL2RheS4gbWF4aW11bSBkb3NlID0gMjAwMG1nL2Rvc2UuIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkNlcGhhbGV4aW4iLCJicmFuZHMiOlsiS2VmbGV4Il0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIyNW1nL2tnL2Rvc2UiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicThoIiwiZHVyYXRpb24iOiI1IGRheSIsImRpc3BlbnNlIjoiIiwicHJuIjoiIiwiZm9ybSI6InN1c3BlbnNpb24iLCJjb21tZW50cyI6Ijc1bWcva2cvZGF5LiBNYXhpbXVtIGRvc2UgPSA1MDBtZy9kb3NlLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOnRydWUsImRvc2VfcGVyX2tnX21nIjoyNS4wLCJtYXhfZG9zZV9tZyI6NTAwLjAsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBwZWRpYXRyaWMgfCBjZXBoYWxleGluIHwga2VmbGV4IHwgMjVtZy9rZy9kb3NlIHwgNzVtZy9rZy9kYXkuIG1heGltdW0gZG9zZSA9IDUwMG1nL2Rvc2UuIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkNpcHJvZmxveGFjaW4gKyBEZXhhbWV0aGFzb25lIG90aWMiLCJicmFuZHMiOlsiQ2lwcm9kZXgiXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjQgZHJvcHMiLCJyb3V0ZSI6InRvIGFmZmVjdGVkIGVhcihzKSIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IjEgYm90dGxlIiwicHJuIjoiIiwiZm9ybSI6ImRyb3BzIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgcGVkaWF0cmljIHwgY2lwcm9mbG94YWNpbiArIGRleGFtZXRoYXNvbmUgb3RpYyB8IGNpcHJvZGV4IHwgNCBkcm9wcyJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJDaXByb2Zsb3hhY2luIG9waHRoYWxtaWMgZHJvcHMgKDAuMyUpIiwiYnJhbmRzIjpbIkNpbG94YW4iXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjEtMiBkcm9wcyIsInJvdXRlIjoidG8gYWZmZWN0ZWQgZXllKHMpIiwiZnJlcXVlbmN5IjoiUUlEIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiMSBib3R0bGUiLCJwcm4iOiIiLCJmb3JtIjoiZHJvcHMiLCJjb21tZW50cyI6IklmIGNvbnRhY3QgbGVucyB3ZWFyZXIsIHJlbW92ZSBsZW5zIGZvciBkdXJhdGlvbiBvZiB0cmVhdG1lbnQuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IHBlZGlhdHJpYyB8IGNpcHJvZmxveGFjaW4gb3BodGhhbG1pYyBkcm9wcyAoMC4zJSkgfCBjaWxveGFuIHwgMS0yIGRyb3BzIHwgaWYgY29udGFjdCBsZW5zIHdlYXJlciwgcmVtb3ZlIGxlbnMgZm9yIGR1cmF0aW9uIG9mIHRyZWF0bWVudC4ifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiQ2xpbmRhbXljaW4iLCJicmFuZHMiOlsiRGFsYWNpbiIsIkNsZW9jaW4iXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjEwbWcva2cvZG9zZSIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJUSUQiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoic29sdXRpb24iLCJjb21tZW50cyI6IjMwbWcva2cvZGF5LiBNYXhpbXVtIGRvc2UgPSAxODAwbWcvZGF5IG9yIDYwMG1nL2Rvc2UuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6dHJ1ZSwiZG9zZV9wZXJfa2dfbWciOjEwLjAsIm1heF9kb3NlX21nIjo2MDAuMCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IHBlZGlhdHJpYyB8IGNsaW5kYW15Y2luIHwgZGFsYWNpbiBjbGVvY2luIHwgMTBtZy9rZy9kb3NlIHwgMzBtZy9rZy9kYXkuIG1heGltdW0gZG9zZSA9IDE4MDBtZy9kYXkgb3IgNjAwbWcvZG9zZS4ifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiQ2xvdHJpbWF6b2xlIGNyZWFtICgxJSkiLCJicmFuZHMiOlsiQ2FuZXN0ZW4iLCJMb3RyaW1pbiJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMSBhcHBsaWNhdGlvbiIsInJvdXRlIjoidG8gYWZmZWN0ZWQgZWFyKHMpIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIyIHdlZWsiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJjcmVhbSIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IHBlZGlhdHJpYyB8IGNsb3RyaW1hem9sZSBjcmVhbSAoMSUpIHwgY2FuZXN0ZW4gbG90cmltaW4gfCAxIGFwcGxpY2F0aW9uIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IkRveHljeWNsaW5lIiwiYnJhbmRzIjpbIlZpYnJhbXljaW4iLCJEb3h5Y2luIiwiQXBwcmlsb24iXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjIuMm1nL2tnL2Rvc2UiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIyMSBkYXkiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJzdXNwZW5zaW9uIiwiY29tbWVudHMiOiJBdm9pZCBpbiBhZ2UgPDggeWVhcnMuIDRtZy9rZy9kYXkuIE1heGltdW0gZG9zZSA9IDEwMG1nL2Rvc2UuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6dHJ1ZSwiZG9zZV9wZXJfa2dfbWciOjIuMiwibWF4X2Rvc2VfbWciOjEwMC4wLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgcGVkaWF0cmljIHwgZG94eWN5Y2xpbmUgfCB2aWJyYW15Y2luIGRveHljaW4gYXBwcmlsb24gfCAyLjJtZy9rZy9kb3NlIHwgYXZvaWQgaW4gYWdlIDw4IHllYXJzLiA0bWcva2cvZGF5LiBtYXhpbXVtIGRvc2UgPSAxMDBtZy9kb3NlLiJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJFcnl0aHJvbXljaW4gb3BodGhhbG1pYyBvaW50bWVudCAoMC41JSkiLCJicmFuZHMiOlsiSWxvdHljaW4iLCJEaW9teWNpbiJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMSBhcHBsaWNhdGlvbiIsInJvdXRlIjoidG8gYWZmZWN0ZWQgZXllKHMpIiwiZnJlcXVlbmN5IjoiUUlEIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoiIiwiZm9ybSI6Im9pbnRtZW50IiwiY29tbWVudHMiOiJBcHBsaWNhdGlvbiBpbnN0cnVjdGlvbjogSW5zdGlsbCB+MWNtIHJpYmJvbiB0byBpbnNpZGUgb2YgbG93ZXIgbGlkLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBwZWRpYXRyaWMgfCBlcnl0aHJvbXljaW4gb3BodGhhbG1pYyBvaW50bWVudCAoMC41JSkgfCBpbG90eWNpbiBkaW9teWNpbiB8IDEgYXBwbGljYXRpb24gfCBhcHBsaWNhdGlvbiBpbnN0cnVjdGlvbjogaW5zdGlsbCB+MWNtIHJpYmJvbiB0byBpbnNpZGUgb2YgbG93ZXIgbGlkLiJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJGdXNpZGljIEFjaWQgY3JlYW0gKDIlKSIsImJyYW5kcyI6WyJGdWNpZGluIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0b3BpY2FsIiwiZnJlcXVlbmN5IjoiVElEIiwiZHVyYXRpb24iOiIyIHdlZWsiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJjcmVhbSIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IHBlZGlhdHJpYyB8IGZ1c2lkaWMgYWNpZCBjcmVhbSAoMiUpIHwgZnVjaWRpbiB8IDEgYXBwbGljYXRpb24ifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiS2V0b2NvbmF6b2xlIGdlbCAoMiUpIiwiYnJhbmRzIjpbIk1vbmlzdGF0IiwiTWljYXRpbiJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMSBhcHBsaWNhdGlvbiIsInJvdXRlIjoidG9waWNhbCIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiMiB3ZWVrIiwiZGlzcGVuc2UiOiIxIHR1YmUiLCJwcm4iOiIiLCJmb3JtIjoiZ2VsIiwiY29tbWVudHMiOiJGb3IgYWdlIFx1MjI2NTEyIHllYXJzLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBwZWRpYXRyaWMgfCBrZXRvY29uYXpvbGUgZ2VsICgyJSkgfCBtb25pc3RhdCBtaWNhdGluIHwgMSBhcHBsaWNhdGlvbiB8IGZvciBhZ2UgXHUyMjY1MTIgeWVhcnMuIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6Ik1veGlmbG94YWNpbiBvcGh0aGFsbWljIGRyb3BzICgwLjUlKSIsImJyYW5kcyI6WyJWaWdhbW94Il0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxIGRyb3AiLCJyb3V0ZSI6InRvIGFmZmVjdGVkIGV5ZShzKSIsImZyZXF1ZW5jeSI6IlRJRCIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IjEgYm90dGxlIiwicHJuIjoiIiwiZm9ybSI6ImRyb3BzIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImFudGktaW5mZWN0aXZlIHwgcGVkaWF0cmljIHwgbW94aWZsb3hhY2luIG9waHRoYWxtaWMgZHJvcHMgKDAuNSUpIHwgdmlnYW1veCB8IDEgZHJvcCJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJNdXBpcm9jaW4gY3JlYW0gKDIlKSIsImJyYW5kcyI6WyJCYWN0cm9iYW4iXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjEgYXBwbGljYXRpb24iLCJyb3V0ZSI6InRvcGljYWwiLCJmcmVxdWVuY3kiOiJUSUQiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIxIHR1YmUiLCJwcm4iOiIiLCJmb3JtIjoiY3JlYW0iLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBwZWRpYXRyaWMgfCBtdXBpcm9jaW4gY3JlYW0gKDIlKSB8IGJhY3Ryb2JhbiB8IDEgYXBwbGljYXRpb24ifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiTnlzdGF0aW4iLCJicmFuZHMiOlsiTXljb3N0YXRpbiIsIk5pbHN0YXQiXSwiaW5kaWNhdGlvbiI6Ik9yYWwgdGhydXNoIChpbmZhbnQpIiwiZG9zZV90ZXh0IjoiMm1MIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IlFJRCIsImR1cmF0aW9uIjoiMTQgZGF5IiwiZGlzcGVuc2UiOiIxIGJvdHRsZSIsInBybiI6InRocnVzaCIsImZvcm0iOiJzdXNwZW5zaW9uIiwiY29tbWVudHMiOiIxbUwgPSAxMDAsMDAwVS4gU3F1aXJ0IGhhbGYgb2YgZG9zZSB0byBlYWNoIHNpZGUgb2YgbW91dGggYW5kIGxldCBzd2FsbG93LiBDbGVhbiBtb3V0aCBhZnRlciBlYWNoIGJyZWFzdGZlZWQuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IHBlZGlhdHJpYyB8IG9yYWwgdGhydXNoIChpbmZhbnQpIHwgbnlzdGF0aW4gfCBteWNvc3RhdGluIG5pbHN0YXQgfCAybWwgfCB0aHJ1c2ggfCAxbWwgPSAxMDAsMDAwdS4gc3F1aXJ0IGhhbGYgb2YgZG9zZSB0byBlYWNoIHNpZGUgb2YgbW91dGggYW5kIGxldCBzd2FsbG93LiBjbGVhbiBtb3V0aCBhZnRlciBlYWNoIGJyZWFzdGZlZWQuIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IlBlcm1ldGhyaW4gbG90aW9uICgxJSkiLCJicmFuZHMiOlsiTml4IiwiS3dlbGxhZGEtUCJdLCJpbmRpY2F0aW9uIjoiSGVhZCBsaWNlIChhZ2UgXHUyMjY1MiBtb250aHMpIiwiZG9zZV90ZXh0IjoiIiwicm91dGUiOiIiLCJmcmVxdWVuY3kiOiIiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoiIiwiZm9ybSI6IiIsImNvbW1lbnRzIjoiV2FzaCBoYWlyIGZpcnN0LCB0aGVuIGFwcGx5IGxvdGlvbiB0byBzYXR1cmF0ZSBoYWlyIGFuZCBzY2FscDsgbGVhdmUgZm9yIDEwIG1pbnV0ZXMgdGhlbiByaW5zZS4gUmVtb3ZlIHJlbWFpbmluZyBuaXRzIHdpdGggY29tYi4gUmVwZWF0IHRyZWF0bWVudCBpbiA3IGRheXMuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IHBlZGlhdHJpYyB8IGhlYWQgbGljZSAoYWdlIFx1MjI2NTIgbW9udGhzKSB8IHBlcm1ldGhyaW4gbG90aW9uICgxJSkgfCBuaXgga3dlbGxhZGEtcCB8IHdhc2ggaGFpciBmaXJzdCwgdGhlbiBhcHBseSBsb3Rpb24gdG8gc2F0dXJhdGUgaGFpciBhbmQgc2NhbHA7IGxlYXZlIGZvciAxMCBtaW51dGVzIHRoZW4gcmluc2UuIHJlbW92ZSByZW1haW5pbmcgbml0cyB3aXRoIGNvbWIuIHJlcGVhdCB0cmVhdG1lbnQgaW4gNyBkYXlzLiJ9LHsic3BlY2lhbHR5IjoiQW50aS1pbmZlY3RpdmUiLCJtZWQiOiJQZXJtZXRocmluIGNyZWFtICg1JSkiLCJicmFuZHMiOlsiTml4IiwiS3dlbGxhZGEtUCJdLCJpbmRpY2F0aW9uIjoiU2NhYmllcyAoYWdlIFx1MjI2NTIgbW9udGhzKSIsImRvc2VfdGV4dCI6IiIsInJvdXRlIjoiIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiIiLCJjb21tZW50cyI6IkFwcGx5IGFuZCBtYXNzYWdlIGluIGNyZWFtIGZyb20gaGVhZCB0byB0b2U7IGxlYXZlIG9uIGZvciA4LTE0IGhvdXJzIGJlZm9yZSB3YXNoaW5nIG9mZiB3aXRoIHdhdGVyOyBmb3IgaW5mYW50cywgYWxzbyBhcHBseSBvbiB0aGUgaGFpcmxpbmUsIG5lY2ssIHNjYWxwLCB0ZW1wbGUsIGFuZCBmb3JlaGVhZC4gUmVwZWF0IHRyZWF0bWVudCBpbiA3IGRheXMuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IHBlZGlhdHJpYyB8IHNjYWJpZXMgKGFnZSBcdTIyNjUyIG1vbnRocykgfCBwZXJtZXRocmluIGNyZWFtICg1JSkgfCBuaXgga3dlbGxhZGEtcCB8IGFwcGx5IGFuZCBtYXNzYWdlIGluIGNyZWFtIGZyb20gaGVhZCB0byB0b2U7IGxlYXZlIG9uIGZvciA4LTE0IGhvdXJzIGJlZm9yZSB3YXNoaW5nIG9mZiB3aXRoIHdhdGVyOyBmb3IgaW5mYW50cywgYWxzbyBhcHBseSBvbiB0aGUgaGFpcmxpbmUsIG5lY2ssIHNjYWxwLCB0ZW1wbGUsIGFuZCBmb3JlaGVhZC4gcmVwZWF0IHRyZWF0bWVudCBpbiA3IGRheXMuIn0seyJzcGVjaWFsdHkiOiJBbnRpLWluZmVjdGl2ZSIsIm1lZCI6IlRNUC9TTVgiLCJicmFuZHMiOlsiU2VwdHJhIiwiQmFjdHJpbSIsIlN1bGZhbWV0aG94YXpvbGUgKyBUcmltZXRob3ByaW0iLCJUTVAtU01YIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIiLCJyb3V0ZSI6IiIsImZyZXF1ZW5jeSI6IiIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoic3VzcGVuc2lvbiIsImNvbW1lbnRzIjoiNm1nIHRyaW1ldGhvcHJpbS9rZyBQTyBxMTJoIGZvciA3IGRheXMuIDEybWcva2cvZGF5LiBNYXhpbXVtIGRvc2UgPSAxNjBtZyB0cmltZXRob3ByaW0vZG9zZS4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjp0cnVlLCJkb3NlX3Blcl9rZ19tZyI6Ni4wLCJtYXhfZG9zZV9tZyI6MTYwLjAsInNlYXJjaF90ZXh0IjoiYW50aS1pbmZlY3RpdmUgfCBwZWRpYXRyaWMgfCB0bXAvc214IHwgc2VwdHJhIGJhY3RyaW0gc3VsZmFtZXRob3hhem9sZSArIHRyaW1ldGhvcHJpbSB0bXAtc214IHwgNm1nIHRyaW1ldGhvcHJpbS9rZyBwbyBxMTJoIGZvciA3IGRheXMuIDEybWcva2cvZGF5LiBtYXhpbXVtIGRvc2UgPSAxNjBtZyB0cmltZXRob3ByaW0vZG9zZS4ifSx7InNwZWNpYWx0eSI6IkFudGktaW5mZWN0aXZlIiwibWVkIjoiVG9icmFteWNpbiBvcGh0aGFsbWljIG9pbnRtZW50ICgwLjMlKSIsImJyYW5kcyI6WyJUb2JyZXgiXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjEgYXBwbGljYXRpb24iLCJyb3V0ZSI6InRvIGFmZmVjdGVkIGV5ZShzKSIsImZyZXF1ZW5jeSI6IlFJRCIsImR1cmF0aW9uIjoiNy0xNCBkYXkiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJvaW50bWVudCIsImNvbW1lbnRzIjoiU3RvcCBvbmNlIHN5bXB0b21zIHJlc29sdmUuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJhbnRpLWluZmVjdGl2ZSB8IHBlZGlhdHJpYyB8IHRvYnJhbXljaW4gb3BodGhhbG1pYyBvaW50bWVudCAoMC4zJSkgfCB0b2JyZXggfCAxIGFwcGxpY2F0aW9uIHwgc3RvcCBvbmNlIHN5bXB0b21zIHJlc29sdmUuIn0seyJzcGVjaWFsdHkiOiJOZXVybyAmIEVuZG9jcmluZSIsIm1lZCI6IkFjZXR5bHNhbGljeWxpYyBBY2lkIiwiYnJhbmRzIjpbIkFTQSIsIkFzcGlyaW4iLCJFbnRyb3BoZW4iLCJBc2FwaGVuIiwiTm92YXNlbiIsIkJheWVyIiwiQnVmZmVyaW4iXSwiaW5kaWNhdGlvbiI6IlRJQS9zdHJva2UiLCJkb3NlX3RleHQiOiI4MW1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiI0IHdlZWsiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkZvbGxvdyB1cCB3aXRoIG5ldXJvbG9naXN0IHRvIGFzc2VzcyBvbmdvaW5nIHVzZS4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoibmV1cm8gJiBlbmRvY3JpbmUgfCBhZHVsdCB8IHRpYS9zdHJva2UgfCBhY2V0eWxzYWxpY3lsaWMgYWNpZCB8IGFzYSBhc3BpcmluIGVudHJvcGhlbiBhc2FwaGVuIG5vdmFzZW4gYmF5ZXIgYnVmZmVyaW4gfCA4MW1nIHwgZm9sbG93IHVwIHdpdGggbmV1cm9sb2dpc3QgdG8gYXNzZXNzIG9uZ29pbmcgdXNlLiJ9LHsic3BlY2lhbHR5IjoiTmV1cm8gJiBFbmRvY3JpbmUiLCJtZWQiOiJBY2V0eWxzYWxpY3lsaWMgQWNpZCIsImJyYW5kcyI6WyJBU0EiLCJBc3BpcmluIiwiRW50cm9waGVuIiwiQXNhcGhlbiIsIk5vdmFzZW4iLCJCYXllciIsIkJ1ZmZlcmluIl0sImluZGljYXRpb24iOiJUSUEvc3Ryb2tlIiwiZG9zZV90ZXh0IjoiODBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJPRCIsImR1cmF0aW9uIjoiNCB3ZWVrIiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJGb2xsb3cgdXAgd2l0aCBuZXVyb2xvZ2lzdCB0byBhc3Nlc3Mgb25nb2luZyB1c2UuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6Im5ldXJvICYgZW5kb2NyaW5lIHwgYWR1bHQgfCB0aWEvc3Ryb2tlIHwgYWNldHlsc2FsaWN5bGljIGFjaWQgfCBhc2EgYXNwaXJpbiBlbnRyb3BoZW4gYXNhcGhlbiBub3Zhc2VuIGJheWVyIGJ1ZmZlcmluIHwgODBtZyB8IGZvbGxvdyB1cCB3aXRoIG5ldXJvbG9naXN0IHRvIGFzc2VzcyBvbmdvaW5nIHVzZS4ifSx7InNwZWNpYWx0eSI6Ik5ldXJvICYgRW5kb2NyaW5lIiwibWVkIjoiQ2xvcGlkb2dyZWwiLCJicmFuZHMiOlsiUGxhdml4Il0sImluZGljYXRpb24iOiJUSUEvc3Ryb2tlIiwiZG9zZV90ZXh0IjoiNzVtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJPRCIsImR1cmF0aW9uIjoiMjEgZGF5IiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJUYWtlIGNvbmN1cnJlbnRseSB3aXRoIGFzcGlyaW4uIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6Im5ldXJvICYgZW5kb2NyaW5lIHwgYWR1bHQgfCB0aWEvc3Ryb2tlIHwgY2xvcGlkb2dyZWwgfCBwbGF2aXggfCA3NW1nIHwgdGFrZSBjb25jdXJyZW50bHkgd2l0aCBhc3BpcmluLiJ9LHsic3BlY2lhbHR5IjoiTmV1cm8gJiBFbmRvY3JpbmUiLCJtZWQiOiJDbG9waWRvZ3JlbCIsImJyYW5kcyI6WyJQbGF2aXgiXSwiaW5kaWNhdGlvbiI6IlRJQS9zdHJva2UgKHdpdGggaW50cmFjcmFuaWFsIGxhcmdlIGFydGVyeSBhdGhlcm9zY2xlcm9zaXMpIiwiZG9zZV90ZXh0IjoiNzVtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJPRCIsImR1cmF0aW9uIjoiOTAgZGF5IiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJUYWtlIGNvbmN1cnJlbnRseSB3aXRoIGFzcGlyaW4uIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6Im5ldXJvICYgZW5kb2NyaW5lIHwgYWR1bHQgfCB0aWEvc3Ryb2tlICh3aXRoIGludHJhY3JhbmlhbCBsYXJnZSBhcnRlcnkgYXRoZXJvc2NsZXJvc2lzKSB8IGNsb3BpZG9ncmVsIHwgcGxhdml4IHwgNzVtZyB8IHRha2UgY29uY3VycmVudGx5IHdpdGggYXNwaXJpbi4ifSx7InNwZWNpYWx0eSI6Ik5ldXJvICYgRW5kb2NyaW5lIiwibWVkIjoiQXRlbm9sb2wiLCJicmFuZHMiOlsiVGVub3JtaW4iXSwiaW5kaWNhdGlvbiI6Ikh5cGVydGh5cm9pZGlzbSIsImRvc2VfdGV4dCI6IjI1bWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjQgd2VlayIsImRpc3BlbnNlIjoiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiRm9sbG93IHVwIHdpdGggdXN1YWwgY2FyZSBwcm92aWRlciBmb3IgcmVhc3Nlc3NtZW50LiBBdm9pZCBpbiBwcmVnbmFuY3kuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6Im5ldXJvICYgZW5kb2NyaW5lIHwgYWR1bHQgfCBoeXBlcnRoeXJvaWRpc20gfCBhdGVub2xvbCB8IHRlbm9ybWluIHwgMjVtZyB8IGZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlYXNzZXNzbWVudC4gYXZvaWQgaW4gcHJlZ25hbmN5LiJ9LHsic3BlY2lhbHR5IjoiTmV1cm8gJiBFbmRvY3JpbmUiLCJtZWQiOiJNZXRmb3JtaW4iLCJicmFuZHMiOlsiR2x1Y29waGFnZSIsIkdsdW1ldHphIiwiRm9ydGFtZXQiXSwiaW5kaWNhdGlvbiI6IkRpYWJldGVzIiwiZG9zZV90ZXh0IjoiNTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiI0IHdlZWsiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlYXNzZXNzbWVudC4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoibmV1cm8gJiBlbmRvY3JpbmUgfCBhZHVsdCB8IGRpYWJldGVzIHwgbWV0Zm9ybWluIHwgZ2x1Y29waGFnZSBnbHVtZXR6YSBmb3J0YW1ldCB8IDUwMG1nIHwgZm9sbG93IHVwIHdpdGggdXN1YWwgY2FyZSBwcm92aWRlciBmb3IgcmVhc3Nlc3NtZW50LiJ9LHsic3BlY2lhbHR5IjoiTmV1cm8gJiBFbmRvY3JpbmUiLCJtZWQiOiJFbXBhZ2xpZmxvemluIiwiYnJhbmRzIjpbIkphcmRpYW5jZSJdLCJpbmRpY2F0aW9uIjoiRGlhYmV0ZXMiLCJkb3NlX3RleHQiOiIxMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiI0IHdlZWsiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlYXNzZXNzbWVudC4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoibmV1cm8gJiBlbmRvY3JpbmUgfCBhZHVsdCB8IGRpYWJldGVzIHwgZW1wYWdsaWZsb3ppbiB8IGphcmRpYW5jZSB8IDEwbWcgfCBmb2xsb3cgdXAgd2l0aCB1c3VhbCBjYXJlIHByb3ZpZGVyIGZvciByZWFzc2Vzc21lbnQuIn0seyJzcGVjaWFsdHkiOiJOZXVybyAmIEVuZG9jcmluZSIsIm1lZCI6IlNpdGFnbGlwdGluIiwiYnJhbmRzIjpbIkphbnV2aWEiXSwiaW5kaWNhdGlvbiI6IkRpYWJldGVzIiwiZG9zZV90ZXh0IjoiMTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjQgd2VlayIsImRpc3BlbnNlIjoiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiRm9sbG93IHVwIHdpdGggdXN1YWwgY2FyZSBwcm92aWRlciBmb3IgcmVhc3Nlc3NtZW50LiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJuZXVybyAmIGVuZG9jcmluZSB8IGFkdWx0IHwgZGlhYmV0ZXMgfCBzaXRhZ2xpcHRpbiB8IGphbnV2aWEgfCAxMDBtZyB8IGZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlYXNzZXNzbWVudC4ifSx7InNwZWNpYWx0eSI6IkV5ZSIsIm1lZCI6Ikx1YnJpY2F0aW5nIGV5ZSBkcm9wcyAocHJlc2VydmF0aXZlIGZyZWUpIiwiYnJhbmRzIjpbIkh5bG8iLCJSZWZyZXNoIiwiU3lzdGFuZSIsIkh5ZHJhc2Vuc2UiLCJUaGVyYVRlYXJzIl0sImluZGljYXRpb24iOiJEcnkgZXllL2lycml0YXRpb24iLCJkb3NlX3RleHQiOiIxLTIgZHJvcHMiLCJyb3V0ZSI6InRvIGFmZmVjdGVkIGV5ZShzKSIsImZyZXF1ZW5jeSI6IiIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxIGJvdHRsZSIsInBybiI6IiIsImZvcm0iOiJkcm9wcyIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIxIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImV5ZSB8IGFkdWx0IHwgZHJ5IGV5ZS9pcnJpdGF0aW9uIHwgbHVicmljYXRpbmcgZXllIGRyb3BzIChwcmVzZXJ2YXRpdmUgZnJlZSkgfCBoeWxvIHJlZnJlc2ggc3lzdGFuZSBoeWRyYXNlbnNlIHRoZXJhdGVhcnMgfCAxLTIgZHJvcHMifSx7InNwZWNpYWx0eSI6IkV5ZSIsIm1lZCI6IkVyeXRocm9teWNpbiBvcGh0aGFsbWljIG9pbnRtZW50ICgwLjUlKSIsImJyYW5kcyI6WyJJbG90eWNpbiIsIkRpb215Y2luIl0sImluZGljYXRpb24iOiJCbGVwaGFyaXRpcy9zdHllIChyZWZyYWN0b3J5L3NldmVyZSkiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0byBhZmZlY3RlZCBleWUocykiLCJmcmVxdWVuY3kiOiJRSUQiLCJkdXJhdGlvbiI6IjctMTQgZGF5IiwiZGlzcGVuc2UiOiIxIHR1YmUiLCJwcm4iOiIiLCJmb3JtIjoib2ludG1lbnQiLCJjb21tZW50cyI6IlN0b3Agb25jZSBzeW1wdG9tcyByZXNvbHZlLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJleWUgfCBhZHVsdCB8IGJsZXBoYXJpdGlzL3N0eWUgKHJlZnJhY3Rvcnkvc2V2ZXJlKSB8IGVyeXRocm9teWNpbiBvcGh0aGFsbWljIG9pbnRtZW50ICgwLjUlKSB8IGlsb3R5Y2luIGRpb215Y2luIHwgMSBhcHBsaWNhdGlvbiB8IHN0b3Agb25jZSBzeW1wdG9tcyByZXNvbHZlLiJ9LHsic3BlY2lhbHR5IjoiRXllIiwibWVkIjoiRG94eWN5Y2xpbmUiLCJicmFuZHMiOlsiVmlicmFteWNpbiIsIkRveHljaW4iLCJBcHByaWxvbiIsIk9yYWNlYSJdLCJpbmRpY2F0aW9uIjoiQmxlcGhhcml0aXMvc3R5ZSAocmVmcmFjdG9yeS9zZXZlcmUpIiwiZG9zZV90ZXh0IjoiMTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjMgd2VlayIsImRpc3BlbnNlIjoiMjEgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiQXZvaWQgaW4gcHJlZ25hbmN5IG9yIGxhY3RhdGluZyBwZW9wbGUuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImV5ZSB8IGFkdWx0IHwgYmxlcGhhcml0aXMvc3R5ZSAocmVmcmFjdG9yeS9zZXZlcmUpIHwgZG94eWN5Y2xpbmUgfCB2aWJyYW15Y2luIGRveHljaW4gYXBwcmlsb24gb3JhY2VhIHwgMTAwbWcgfCBhdm9pZCBpbiBwcmVnbmFuY3kgb3IgbGFjdGF0aW5nIHBlb3BsZS4ifSx7InNwZWNpYWx0eSI6IkV5ZSIsIm1lZCI6Ik9sb3BhdGFkaW5lIG9waHRoYWxtaWMgZHJvcHMgKDAuMiUpIiwiYnJhbmRzIjpbIlBhdGFkYXkiXSwiaW5kaWNhdGlvbiI6IkFsbGVyZ2ljIGNvbmp1bmN0aXZpdGlzIiwiZG9zZV90ZXh0IjoiMSBkcm9wIiwicm91dGUiOiJ0byBhZmZlY3RlZCBleWUocykiLCJmcmVxdWVuY3kiOiJPRCIsImR1cmF0aW9uIjoiNS03IGRheSIsImRpc3BlbnNlIjoiMSBib3R0bGUiLCJwcm4iOiIiLCJmb3JtIjoiZHJvcHMiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJleWUgfCBhZHVsdCB8IGFsbGVyZ2ljIGNvbmp1bmN0aXZpdGlzIHwgb2xvcGF0YWRpbmUgb3BodGhhbG1pYyBkcm9wcyAoMC4yJSkgfCBwYXRhZGF5IHwgMSBkcm9wIn0seyJzcGVjaWFsdHkiOiJFeWUiLCJtZWQiOiJFcnl0aHJvbXljaW4gb3BodGhhbG1pYyBvaW50bWVudCAoMC41JSkiLCJicmFuZHMiOlsiSWxvdHljaW4iLCJEaW9teWNpbiJdLCJpbmRpY2F0aW9uIjoiQmFjdGVyaWFsIGNvbmp1bmN0aXZpdGlzIChub24tY29udGFjdCBsZW5zIHdlYXJlcikiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0byBhZmZlY3RlZCBleWUocykiLCJmcmVxdWVuY3kiOiJRSUQiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIxIHR1YmUiLCJwcm4iOiIiLCJmb3JtIjoib2ludG1lbnQiLCJjb21tZW50cyI6IkFwcGxpY2F0aW9uIGluc3RydWN0aW9uOiBJbnN0aWxsIH4xY20gcmliYm9uIHRvIGluc2lkZSBvZiBsb3dlciBsaWQuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImV5ZSB8IGFkdWx0IHwgYmFjdGVyaWFsIGNvbmp1bmN0aXZpdGlzIChub24tY29udGFjdCBsZW5zIHdlYXJlcikgfCBlcnl0aHJvbXljaW4gb3BodGhhbG1pYyBvaW50bWVudCAoMC41JSkgfCBpbG90eWNpbiBkaW9teWNpbiB8IDEgYXBwbGljYXRpb24gfCBhcHBsaWNhdGlvbiBpbnN0cnVjdGlvbjogaW5zdGlsbCB+MWNtIHJpYmJvbiB0byBpbnNpZGUgb2YgbG93ZXIgbGlkLiJ9LHsic3BlY2lhbHR5IjoiRXllIiwibWVkIjoiTW94aWZsb3hhY2luIG9waHRoYWxtaWMgZHJvcHMgKDAuNSUpIiwiYnJhbmRzIjpbIlZpZ2Ftb3giXSwiaW5kaWNhdGlvbiI6IkJhY3RlcmlhbCBjb25qdW5jdGl2aXRpcyAoY29udGFjdCBsZW5zIHdlYXJlcikiLCJkb3NlX3RleHQiOiIxIGRyb3AiLCJyb3V0ZSI6InRvIGFmZmVjdGVkIGV5ZShzKSIsImZyZXF1ZW5jeSI6IlFJRCIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IjEgYm90dGxlIiwicHJuIjoiIiwiZm9ybSI6ImRyb3BzIiwiY29tbWVudHMiOiJSZW1vdmUgY29udGFjdHMgZm9yIGR1cmF0aW9uIG9mIHRyZWF0bWVudC4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZXllIHwgYWR1bHQgfCBiYWN0ZXJpYWwgY29uanVuY3Rpdml0aXMgKGNvbnRhY3QgbGVucyB3ZWFyZXIpIHwgbW94aWZsb3hhY2luIG9waHRoYWxtaWMgZHJvcHMgKDAuNSUpIHwgdmlnYW1veCB8IDEgZHJvcCB8IHJlbW92ZSBjb250YWN0cyBmb3IgZHVyYXRpb24gb2YgdHJlYXRtZW50LiJ9LHsic3BlY2lhbHR5IjoiRXllIiwibWVkIjoiVG9icmFteWNpbiBvcGh0aGFsbWljIGRyb3BzICgwLjMlKSIsImJyYW5kcyI6WyJUb2JyZXgiXSwiaW5kaWNhdGlvbiI6IkJhY3RlcmlhbCBjb25qdW5jdGl2aXRpcyAod2l0aCBmbHVvcm9xdWlub2xvbmUgYWxsZXJneSkiLCJkb3NlX3RleHQiOiIxLTIgZHJvcHMiLCJyb3V0ZSI6InRvIGFmZmVjdGVkIGV5ZShzKSIsImZyZXF1ZW5jeSI6InE0aCIsImR1cmF0aW9uIjoiNSBkYXkiLCJkaXNwZW5zZSI6IjEgYm90dGxlIiwicHJuIjoiIiwiZm9ybSI6ImRyb3BzIiwiY29tbWVudHMiOiJJZiB1c2luZyBjb250YWN0IGxlbnMsIHJlbW92ZSBmb3IgZHVyYXRpb24gb2YgdHJlYXRtZW50LiBQcm9sb25nZWQgdXNlID41IGRheXMgbWF5IGNhdXNlIHRveGljIGtlcmF0aXRpcy4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZXllIHwgYWR1bHQgfCBiYWN0ZXJpYWwgY29uanVuY3Rpdml0aXMgKHdpdGggZmx1b3JvcXVpbm9sb25lIGFsbGVyZ3kpIHwgdG9icmFteWNpbiBvcGh0aGFsbWljIGRyb3BzICgwLjMlKSB8IHRvYnJleCB8IDEtMiBkcm9wcyB8IGlmIHVzaW5nIGNvbnRhY3QgbGVucywgcmVtb3ZlIGZvciBkdXJhdGlvbiBvZiB0cmVhdG1lbnQuIHByb2xvbmdlZCB1c2UgPjUgZGF5cyBtYXkgY2F1c2UgdG94aWMga2VyYXRpdGlzLiJ9LHsic3BlY2lhbHR5IjoiRXllIiwibWVkIjoiTW94aWZsb3hhY2luIG9waHRoYWxtaWMgZHJvcHMgKDAuNSUpIiwiYnJhbmRzIjpbIlZpZ2Ftb3giXSwiaW5kaWNhdGlvbiI6IkNvcm5lYWwgYWJyYXNpb24iLCJkb3NlX3RleHQiOiIxIGRyb3AiLCJyb3V0ZSI6InRvIGFmZmVjdGVkIGV5ZShzKSIsImZyZXF1ZW5jeSI6IlRJRCIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IjEgYm90dGxlIiwicHJuIjoiIiwiZm9ybSI6ImRyb3BzIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZXllIHwgYWR1bHQgfCBjb3JuZWFsIGFicmFzaW9uIHwgbW94aWZsb3hhY2luIG9waHRoYWxtaWMgZHJvcHMgKDAuNSUpIHwgdmlnYW1veCB8IDEgZHJvcCJ9LHsic3BlY2lhbHR5IjoiRXllIiwibWVkIjoiTHVicmljYXRpbmcgZXllIGRyb3BzIChwcmVzZXJ2YXRpdmUgZnJlZSkiLCJicmFuZHMiOlsiSHlsbyIsIlJlZnJlc2giLCJTeXN0YW5lIiwiSHlkcmFzZW5zZSIsIlRoZXJhVGVhcnMiXSwiaW5kaWNhdGlvbiI6IkRyeSBleWUvaXJyaXRhdGlvbiIsImRvc2VfdGV4dCI6IjEtMiBkcm9wcyIsInJvdXRlIjoidG8gYWZmZWN0ZWQgZXllKHMpIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgYm90dGxlIiwicHJuIjoiIiwiZm9ybSI6ImRyb3BzIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIxIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImV5ZSB8IHBlZGlhdHJpYyB8IGRyeSBleWUvaXJyaXRhdGlvbiB8IGx1YnJpY2F0aW5nIGV5ZSBkcm9wcyAocHJlc2VydmF0aXZlIGZyZWUpIHwgaHlsbyByZWZyZXNoIHN5c3RhbmUgaHlkcmFzZW5zZSB0aGVyYXRlYXJzIHwgMS0yIGRyb3BzIn0seyJzcGVjaWFsdHkiOiJFeWUiLCJtZWQiOiJFcnl0aHJvbXljaW4gb3BodGhhbG1pYyBvaW50bWVudCAoMC41JSkiLCJicmFuZHMiOlsiSWxvdHljaW4iLCJEaW9teWNpbiJdLCJpbmRpY2F0aW9uIjoiQmxlcGhhcml0aXMvc3R5ZSAocmVmcmFjdG9yeS9zZXZlcmUpIiwiZG9zZV90ZXh0IjoiMSBhcHBsaWNhdGlvbiIsInJvdXRlIjoidG8gYWZmZWN0ZWQgZXllKHMpIiwiZnJlcXVlbmN5IjoiUUlEIiwiZHVyYXRpb24iOiI3LTE0IGRheSIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoiIiwiZm9ybSI6Im9pbnRtZW50IiwiY29tbWVudHMiOiJTdG9wIG9uY2Ugc3ltcHRvbXMgcmVzb2x2ZS4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImV5ZSB8IHBlZGlhdHJpYyB8IGJsZXBoYXJpdGlzL3N0eWUgKHJlZnJhY3Rvcnkvc2V2ZXJlKSB8IGVyeXRocm9teWNpbiBvcGh0aGFsbWljIG9pbnRtZW50ICgwLjUlKSB8IGlsb3R5Y2luIGRpb215Y2luIHwgMSBhcHBsaWNhdGlvbiB8IHN0b3Agb25jZSBzeW1wdG9tcyByZXNvbHZlLiJ9LHsic3BlY2lhbHR5IjoiRXllIiwibWVkIjoiT2xvcGF0YWRpbmUgb3BodGhhbG1pYyBkcm9wcyAoMC4yJSkiLCJicmFuZHMiOlsiUGF0YWRheSJdLCJpbmRpY2F0aW9uIjoiQWxsZXJnaWMgY29uanVuY3Rpdml0aXMiLCJkb3NlX3RleHQiOiIxIGRyb3AiLCJyb3V0ZSI6InRvIGFmZmVjdGVkIGV5ZShzKSIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiI1LTcgZGF5IiwiZGlzcGVuc2UiOiIxIGJvdHRsZSIsInBybiI6IiIsImZvcm0iOiJkcm9wcyIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJleWUgfCBwZWRpYXRyaWMgfCBhbGxlcmdpYyBjb25qdW5jdGl2aXRpcyB8IG9sb3BhdGFkaW5lIG9waHRoYWxtaWMgZHJvcHMgKDAuMiUpIHwgcGF0YWRheSB8IDEgZHJvcCJ9LHsic3BlY2lhbHR5IjoiRXllIiwibWVkIjoiRXJ5dGhyb215Y2luIG9waHRoYWxtaWMgb2ludG1lbnQgKDAuNSUpIiwiYnJhbmRzIjpbIklsb3R5Y2luIiwiRGlvbXljaW4iXSwiaW5kaWNhdGlvbiI6IkJhY3RlcmlhbCBjb25qdW5jdGl2aXRpcyAobm9uLWNvbnRhY3QgbGVucyB3ZWFyZXIpIiwiZG9zZV90ZXh0IjoiMSBhcHBsaWNhdGlvbiIsInJvdXRlIjoidG8gYWZmZWN0ZWQgZXllKHMpIiwiZnJlcXVlbmN5IjoiUUlEIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoiIiwiZm9ybSI6Im9pbnRtZW50IiwiY29tbWVudHMiOiJBcHBsaWNhdGlvbiBpbnN0cnVjdGlvbjogSW5zdGlsbCB+MWNtIHJpYmJvbiB0byBpbnNpZGUgb2YgbG93ZXIgbGlkLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZXllIHwgcGVkaWF0cmljIHwgYmFjdGVyaWFsIGNvbmp1bmN0aXZpdGlzIChub24tY29udGFjdCBsZW5zIHdlYXJlcikgfCBlcnl0aHJvbXljaW4gb3BodGhhbG1pYyBvaW50bWVudCAoMC41JSkgfCBpbG90eWNpbiBkaW9teWNpbiB8IDEgYXBwbGljYXRpb24gfCBhcHBsaWNhdGlvbiBpbnN0cnVjdGlvbjogaW5zdGlsbCB+MWNtIHJpYmJvbiB0byBpbnNpZGUgb2YgbG93ZXIgbGlkLiJ9LHsic3BlY2lhbHR5IjoiRXllIiwibWVkIjoiTW94aWZsb3hhY2luIG9waHRoYWxtaWMgZHJvcHMgKDAuNSUpIiwiYnJhbmRzIjpbIlZpZ2Ftb3giXSwiaW5kaWNhdGlvbiI6IkJhY3RlcmlhbCBjb25qdW5jdGl2aXRpcyAoY29udGFjdCBsZW5zIHdlYXJlcikiLCJkb3NlX3RleHQiOiIxIGRyb3AiLCJyb3V0ZSI6InRvIGFmZmVjdGVkIGV5ZShzKSIsImZyZXF1ZW5jeSI6IlFJRCIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IjEgYm90dGxlIiwicHJuIjoiIiwiZm9ybSI6ImRyb3BzIiwiY29tbWVudHMiOiJSZW1vdmUgY29udGFjdHMgZm9yIGR1cmF0aW9uIG9mIHRyZWF0bWVudC4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImV5ZSB8IHBlZGlhdHJpYyB8IGJhY3RlcmlhbCBjb25qdW5jdGl2aXRpcyAoY29udGFjdCBsZW5zIHdlYXJlcikgfCBtb3hpZmxveGFjaW4gb3BodGhhbG1pYyBkcm9wcyAoMC41JSkgfCB2aWdhbW94IHwgMSBkcm9wIHwgcmVtb3ZlIGNvbnRhY3RzIGZvciBkdXJhdGlvbiBvZiB0cmVhdG1lbnQuIn0seyJzcGVjaWFsdHkiOiJFeWUiLCJtZWQiOiJUb2JyYW15Y2luIG9waHRoYWxtaWMgZHJvcHMgKDAuMyUpIiwiYnJhbmRzIjpbIlRvYnJleCJdLCJpbmRpY2F0aW9uIjoiQmFjdGVyaWFsIGNvbmp1bmN0aXZpdGlzICh3aXRoIGZsdW9yb3F1aW5vbG9uZSBhbGxlcmd5KSIsImRvc2VfdGV4dCI6IjEtMiBkcm9wcyIsInJvdXRlIjoidG8gYWZmZWN0ZWQgZXllKHMpIiwiZnJlcXVlbmN5IjoicTRoIiwiZHVyYXRpb24iOiI1IGRheSIsImRpc3BlbnNlIjoiMSBib3R0bGUiLCJwcm4iOiIiLCJmb3JtIjoiZHJvcHMiLCJjb21tZW50cyI6IklmIHVzaW5nIGNvbnRhY3QgbGVucywgcmVtb3ZlIGZvciBkdXJhdGlvbiBvZiB0cmVhdG1lbnQuIFByb2xvbmdlZCB1c2UgPjUgZGF5cyBtYXkgY2F1c2UgdG94aWMga2VyYXRpdGlzLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZXllIHwgcGVkaWF0cmljIHwgYmFjdGVyaWFsIGNvbmp1bmN0aXZpdGlzICh3aXRoIGZsdW9yb3F1aW5vbG9uZSBhbGxlcmd5KSB8IHRvYnJhbXljaW4gb3BodGhhbG1pYyBkcm9wcyAoMC4zJSkgfCB0b2JyZXggfCAxLTIgZHJvcHMgfCBpZiB1c2luZyBjb250YWN0IGxlbnMsIHJlbW92ZSBmb3IgZHVyYXRpb24gb2YgdHJlYXRtZW50LiBwcm9sb25nZWQgdXNlID41IGRheXMgbWF5IGNhdXNlIHRveGljIGtlcmF0aXRpcy4ifSx7InNwZWNpYWx0eSI6IkV5ZSIsIm1lZCI6Ik1veGlmbG94YWNpbiBvcGh0aGFsbWljIGRyb3BzICgwLjUlKSIsImJyYW5kcyI6WyJWaWdhbW94Il0sImluZGljYXRpb24iOiJDb3JuZWFsIGFicmFzaW9uIiwiZG9zZV90ZXh0IjoiMSBkcm9wIiwicm91dGUiOiJ0byBhZmZlY3RlZCBleWUocykiLCJmcmVxdWVuY3kiOiJUSUQiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIxIGJvdHRsZSIsInBybiI6IiIsImZvcm0iOiJkcm9wcyIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJleWUgfCBwZWRpYXRyaWMgfCBjb3JuZWFsIGFicmFzaW9uIHwgbW94aWZsb3hhY2luIG9waHRoYWxtaWMgZHJvcHMgKDAuNSUpIHwgdmlnYW1veCB8IDEgZHJvcCJ9LHsic3BlY2lhbHR5IjoiRU5UIiwibWVkIjoiQW1veGljaWxsaW4iLCJicmFuZHMiOlsiQW1veGlsIiwiVHJpbW94Il0sImluZGljYXRpb24iOiJPdGl0aXMgbWVkaWEgKGhpZ2ggcmlzazogYWdlID42NSwgaW1tdW5vY29tcHJvbWlzZWQsIGFudGliaW90aWNzIHdpdGhpbiBsYXN0IG1vbnRoKSIsImRvc2VfdGV4dCI6IjEwMDBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJUSUQiLCJkdXJhdGlvbiI6IjEwIGRheSIsImRpc3BlbnNlIjoiMzAgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiJFYXIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImVudCB8IGFkdWx0IHwgZWFyIHwgb3RpdGlzIG1lZGlhIChoaWdoIHJpc2s6IGFnZSA+NjUsIGltbXVub2NvbXByb21pc2VkLCBhbnRpYmlvdGljcyB3aXRoaW4gbGFzdCBtb250aCkgfCBhbW94aWNpbGxpbiB8IGFtb3hpbCB0cmltb3ggfCAxMDAwbWcifSx7InNwZWNpYWx0eSI6IkVOVCIsIm1lZCI6IkFtb3gtQ2xhdiAoODc1LzEyNW1nKSIsImJyYW5kcyI6WyJDbGF2dWxpbiIsIkF1Z21lbnRpbiJdLCJpbmRpY2F0aW9uIjoiT3RpdGlzIG1lZGlhIChtaWxkLW1vZGVyYXRlIHN5bXB0b21zKSIsImRvc2VfdGV4dCI6IjEgdGFiIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiNSBkYXkiLCJkaXNwZW5zZSI6IjEwIHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiRWFyIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJlbnQgfCBhZHVsdCB8IGVhciB8IG90aXRpcyBtZWRpYSAobWlsZC1tb2RlcmF0ZSBzeW1wdG9tcykgfCBhbW94LWNsYXYgKDg3NS8xMjVtZykgfCBjbGF2dWxpbiBhdWdtZW50aW4gfCAxIHRhYiJ9LHsic3BlY2lhbHR5IjoiRU5UIiwibWVkIjoiQW1veC1DbGF2ICg4NzUvMTI1bWcpIiwiYnJhbmRzIjpbIkNsYXZ1bGluIiwiQXVnbWVudGluIl0sImluZGljYXRpb24iOiJPdGl0aXMgbWVkaWEgKHNldmVyZSBzeW1wdG9tcykiLCJkb3NlX3RleHQiOiIxIHRhYiIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjEwIGRheSIsImRpc3BlbnNlIjoiMjAgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiJFYXIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImVudCB8IGFkdWx0IHwgZWFyIHwgb3RpdGlzIG1lZGlhIChzZXZlcmUgc3ltcHRvbXMpIHwgYW1veC1jbGF2ICg4NzUvMTI1bWcpIHwgY2xhdnVsaW4gYXVnbWVudGluIHwgMSB0YWIifSx7InNwZWNpYWx0eSI6IkVOVCIsIm1lZCI6IkNlZnVyb3hpbWUiLCJicmFuZHMiOlsiQ2VmdGluIl0sImluZGljYXRpb24iOiJPdGl0aXMgbWVkaWEgKG1pbGQtbW9kZXJhdGUgc3ltcHRvbXMsIHBlbmljaWxsaW4gYWxsZXJneSkiLCJkb3NlX3RleHQiOiI1MDBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiIxMCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IkVhciIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZW50IHwgYWR1bHQgfCBlYXIgfCBvdGl0aXMgbWVkaWEgKG1pbGQtbW9kZXJhdGUgc3ltcHRvbXMsIHBlbmljaWxsaW4gYWxsZXJneSkgfCBjZWZ1cm94aW1lIHwgY2VmdGluIHwgNTAwbWcifSx7InNwZWNpYWx0eSI6IkVOVCIsIm1lZCI6IkNlZnVyb3hpbWUiLCJicmFuZHMiOlsiQ2VmdGluIl0sImluZGljYXRpb24iOiJPdGl0aXMgbWVkaWEgKHNldmVyZSBzeW1wdG9tcywgcGVuaWNpbGxpbiBhbGxlcmd5KSIsImRvc2VfdGV4dCI6IjUwMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiMTAgZGF5IiwiZGlzcGVuc2UiOiIyMCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IkVhciIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZW50IHwgYWR1bHQgfCBlYXIgfCBvdGl0aXMgbWVkaWEgKHNldmVyZSBzeW1wdG9tcywgcGVuaWNpbGxpbiBhbGxlcmd5KSB8IGNlZnVyb3hpbWUgfCBjZWZ0aW4gfCA1MDBtZyJ9LHsic3BlY2lhbHR5IjoiRU5UIiwibWVkIjoiQXppdGhyb215Y2luIiwiYnJhbmRzIjpbIlppdGhyb21heCIsIlptYXgiXSwiaW5kaWNhdGlvbiI6Ik90aXRpcyBtZWRpYSAobWlsZC1tb2RlcmF0ZSBzeW1wdG9tcywgcGVuaWNpbGxpbiBhbmFwaHlsYXhpcykiLCJkb3NlX3RleHQiOiIiLCJyb3V0ZSI6IiIsImZyZXF1ZW5jeSI6IiIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoiIiwiY29tbWVudHMiOiI1MDBtZyBQTyBkYWlseSBvbiBkYXkgMSwgdGhlbiAyNTBtZyBQTyBkYWlseSBmb3IgZGF5cyAyLTUuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiJFYXIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImVudCB8IGFkdWx0IHwgZWFyIHwgb3RpdGlzIG1lZGlhIChtaWxkLW1vZGVyYXRlIHN5bXB0b21zLCBwZW5pY2lsbGluIGFuYXBoeWxheGlzKSB8IGF6aXRocm9teWNpbiB8IHppdGhyb21heCB6bWF4IHwgNTAwbWcgcG8gZGFpbHkgb24gZGF5IDEsIHRoZW4gMjUwbWcgcG8gZGFpbHkgZm9yIGRheXMgMi01LiJ9LHsic3BlY2lhbHR5IjoiRU5UIiwibWVkIjoiQXppdGhyb215Y2luIiwiYnJhbmRzIjpbIlppdGhyb21heCIsIlptYXgiXSwiaW5kaWNhdGlvbiI6Ik90aXRpcyBtZWRpYSAoc2V2ZXJlIHN5bXB0b21zLCBwZW5pY2lsbGluIGFuYXBoeWxheGlzKSIsImRvc2VfdGV4dCI6IiIsInJvdXRlIjoiIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiIiLCJjb21tZW50cyI6IjUwMG1nIFBPIGRhaWx5IG9uIGRheSAxLCB0aGVuIDI1MG1nIFBPIGRhaWx5IGZvciBkYXlzIDItMTAuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiJFYXIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImVudCB8IGFkdWx0IHwgZWFyIHwgb3RpdGlzIG1lZGlhIChzZXZlcmUgc3ltcHRvbXMsIHBlbmljaWxsaW4gYW5hcGh5bGF4aXMpIHwgYXppdGhyb215Y2luIHwgeml0aHJvbWF4IHptYXggfCA1MDBtZyBwbyBkYWlseSBvbiBkYXkgMSwgdGhlbiAyNTBtZyBwbyBkYWlseSBmb3IgZGF5cyAyLTEwLiJ9LHsic3BlY2lhbHR5IjoiRU5UIiwibWVkIjoiQ2lwcm9mbG94YWNpbiArIERleGFtZXRoYXNvbmUgb3RpYyIsImJyYW5kcyI6WyJDaXByb2RleCJdLCJpbmRpY2F0aW9uIjoiT3RpdGlzIGV4dGVybmEiLCJkb3NlX3RleHQiOiI0IGRyb3BzIiwicm91dGUiOiJ0byBhZmZlY3RlZCBlYXIocykiLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIxIGJvdHRsZSIsInBybiI6IiIsImZvcm0iOiJkcm9wcyIsImNvbW1lbnRzIjoiTFUgY29kZSA9IDUwOS4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IkVhciIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZW50IHwgYWR1bHQgfCBlYXIgfCBvdGl0aXMgZXh0ZXJuYSB8IGNpcHJvZmxveGFjaW4gKyBkZXhhbWV0aGFzb25lIG90aWMgfCBjaXByb2RleCB8IDQgZHJvcHMgfCBsdSBjb2RlID0gNTA5LiJ9LHsic3BlY2lhbHR5IjoiRU5UIiwibWVkIjoiQ2xvdHJpbWF6b2xlIGNyZWFtICgxJSkiLCJicmFuZHMiOlsiQ2FuZXN0ZW4iLCJMb3RyaW1pbiJdLCJpbmRpY2F0aW9uIjoiT3RpdGlzIGV4dGVybmEiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0b3BpY2FsIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIyIHdlZWsiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJjcmVhbSIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiJFYXIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImVudCB8IGFkdWx0IHwgZWFyIHwgb3RpdGlzIGV4dGVybmEgfCBjbG90cmltYXpvbGUgY3JlYW0gKDElKSB8IGNhbmVzdGVuIGxvdHJpbWluIHwgMSBhcHBsaWNhdGlvbiJ9LHsic3BlY2lhbHR5IjoiRU5UIiwibWVkIjoiTW9tZXRhc29uZSIsImJyYW5kcyI6WyJOYXNvbmV4Il0sImluZGljYXRpb24iOiJOYXNhbCBjb25nZXN0aW9uIiwiZG9zZV90ZXh0IjoiMS0yIHNwcmF5Iiwicm91dGUiOiJuYXNhbCIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiIyIHdlZWsiLCJkaXNwZW5zZSI6IjEgYm90dGxlIiwicHJuIjoiIiwiZm9ybSI6InNwcmF5IiwiY29tbWVudHMiOiI1MG1jZy9zcHJheS4gU3RvcCBvbmNlIHN5bXB0b21zIGltcHJvdmVkLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiTm9zZSIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZW50IHwgYWR1bHQgfCBub3NlIHwgbmFzYWwgY29uZ2VzdGlvbiB8IG1vbWV0YXNvbmUgfCBuYXNvbmV4IHwgMS0yIHNwcmF5IHwgNTBtY2cvc3ByYXkuIHN0b3Agb25jZSBzeW1wdG9tcyBpbXByb3ZlZC4ifSx7InNwZWNpYWx0eSI6IkVOVCIsIm1lZCI6IkNpY2xlc29uaWRlIiwiYnJhbmRzIjpbIk9tbmFyaXMiLCJaZXRvbm5hIl0sImluZGljYXRpb24iOiJOYXNhbCBjb25nZXN0aW9uIiwiZG9zZV90ZXh0IjoiMS0yIHNwcmF5Iiwicm91dGUiOiJuYXNhbCIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiIyIHdlZWsiLCJkaXNwZW5zZSI6IjEgYm90dGxlIiwicHJuIjoiIiwiZm9ybSI6InNwcmF5IiwiY29tbWVudHMiOiI1MG1jZy9zcHJheS4gU3RvcCBvbmNlIHN5bXB0b21zIGltcHJvdmVkLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiTm9zZSIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZW50IHwgYWR1bHQgfCBub3NlIHwgbmFzYWwgY29uZ2VzdGlvbiB8IGNpY2xlc29uaWRlIHwgb21uYXJpcyB6ZXRvbm5hIHwgMS0yIHNwcmF5IHwgNTBtY2cvc3ByYXkuIHN0b3Agb25jZSBzeW1wdG9tcyBpbXByb3ZlZC4ifSx7InNwZWNpYWx0eSI6IkVOVCIsIm1lZCI6IkZsdXRpY2Fzb25lIiwiYnJhbmRzIjpbIkZsb25hc2UiXSwiaW5kaWNhdGlvbiI6Ik5hc2FsIGNvbmdlc3Rpb24iLCJkb3NlX3RleHQiOiIxLTIgc3ByYXkiLCJyb3V0ZSI6Im5hc2FsIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjIgd2VlayIsImRpc3BlbnNlIjoiMSBib3R0bGUiLCJwcm4iOiIiLCJmb3JtIjoic3ByYXkiLCJjb21tZW50cyI6IjUwbWNnL3NwcmF5LiBTdG9wIG9uY2Ugc3ltcHRvbXMgaW1wcm92ZWQuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiJOb3NlIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJlbnQgfCBhZHVsdCB8IG5vc2UgfCBuYXNhbCBjb25nZXN0aW9uIHwgZmx1dGljYXNvbmUgfCBmbG9uYXNlIHwgMS0yIHNwcmF5IHwgNTBtY2cvc3ByYXkuIHN0b3Agb25jZSBzeW1wdG9tcyBpbXByb3ZlZC4ifSx7InNwZWNpYWx0eSI6IkVOVCIsIm1lZCI6IlBzZXVkb2VwaGVkcmluZSIsImJyYW5kcyI6WyJTdWRhZmVkIl0sImluZGljYXRpb24iOiJOYXNhbCBjb25nZXN0aW9uIiwiZG9zZV90ZXh0IjoiNjBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxNmgiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiIyMCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJNYXggMjQwbWcgcGVyIDI0IGhvdXJzLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiTm9zZSIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZW50IHwgYWR1bHQgfCBub3NlIHwgbmFzYWwgY29uZ2VzdGlvbiB8IHBzZXVkb2VwaGVkcmluZSB8IHN1ZGFmZWQgfCA2MG1nIHwgbWF4IDI0MG1nIHBlciAyNCBob3Vycy4ifSx7InNwZWNpYWx0eSI6IkVOVCIsIm1lZCI6IkFtb3hpY2lsbGluIiwiYnJhbmRzIjpbIkFtb3hpbCIsIlRyaW1veCJdLCJpbmRpY2F0aW9uIjoiU3RyZXAgdGhyb2F0IiwiZG9zZV90ZXh0IjoiMTAwMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiIxMCBkYXkiLCJkaXNwZW5zZSI6IjEwIHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiVGhyb2F0IiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJlbnQgfCBhZHVsdCB8IHRocm9hdCB8IHN0cmVwIHRocm9hdCB8IGFtb3hpY2lsbGluIHwgYW1veGlsIHRyaW1veCB8IDEwMDBtZyJ9LHsic3BlY2lhbHR5IjoiRU5UIiwibWVkIjoiQ2VmdXJveGltZSIsImJyYW5kcyI6WyJDZWZ0aW4iXSwiaW5kaWNhdGlvbiI6IlN0cmVwIHRocm9hdCAocGVuaWNpbGxpbiBhbGxlcmd5KSIsImRvc2VfdGV4dCI6IjI1MG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiMTAgZGF5IiwiZGlzcGVuc2UiOiIyMCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IlRocm9hdCIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZW50IHwgYWR1bHQgfCB0aHJvYXQgfCBzdHJlcCB0aHJvYXQgKHBlbmljaWxsaW4gYWxsZXJneSkgfCBjZWZ1cm94aW1lIHwgY2VmdGluIHwgMjUwbWcifSx7InNwZWNpYWx0eSI6IkVOVCIsIm1lZCI6IkF6aXRocm9teWNpbiIsImJyYW5kcyI6WyJaaXRocm9tYXgiLCJabWF4Il0sImluZGljYXRpb24iOiJTdHJlcCB0aHJvYXQgKHBlbmljaWxsaW4gYW5hcGh5bGF4aXMpIiwiZG9zZV90ZXh0IjoiNTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjMgZGF5IiwiZGlzcGVuc2UiOiIzIHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiVGhyb2F0IiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJlbnQgfCBhZHVsdCB8IHRocm9hdCB8IHN0cmVwIHRocm9hdCAocGVuaWNpbGxpbiBhbmFwaHlsYXhpcykgfCBheml0aHJvbXljaW4gfCB6aXRocm9tYXggem1heCB8IDUwMG1nIn0seyJzcGVjaWFsdHkiOiJFTlQiLCJtZWQiOiJBbW94LUNsYXYgKDg3NS8xMjVtZykiLCJicmFuZHMiOlsiQ2xhdnVsaW4iLCJBdWdtZW50aW4iXSwiaW5kaWNhdGlvbiI6IlNpbnVzaXRpcyIsImRvc2VfdGV4dCI6IjEgdGFiIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IjE0IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiT3RoZXIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImVudCB8IGFkdWx0IHwgb3RoZXIgfCBzaW51c2l0aXMgfCBhbW94LWNsYXYgKDg3NS8xMjVtZykgfCBjbGF2dWxpbiBhdWdtZW50aW4gfCAxIHRhYiJ9LHsic3BlY2lhbHR5IjoiRU5UIiwibWVkIjoiRG94eWN5Y2xpbmUiLCJicmFuZHMiOlsiVmlicmFteWNpbiIsIkRveHljaW4iLCJBcHByaWxvbiJdLCJpbmRpY2F0aW9uIjoiU2ludXNpdGlzIChwZW5pY2lsbGluIGFsbGVyZ3kpIiwiZG9zZV90ZXh0IjoiMTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiMTQgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiJPdGhlciIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZW50IHwgYWR1bHQgfCBvdGhlciB8IHNpbnVzaXRpcyAocGVuaWNpbGxpbiBhbGxlcmd5KSB8IGRveHljeWNsaW5lIHwgdmlicmFteWNpbiBkb3h5Y2luIGFwcHJpbG9uIHwgMTAwbWcifSx7InNwZWNpYWx0eSI6IkVOVCIsIm1lZCI6IkFtb3hpY2lsbGluIiwiYnJhbmRzIjpbIkFtb3hpbCIsIlRyaW1veCJdLCJpbmRpY2F0aW9uIjoiRGVudGFsIGluZmVjdGlvbiIsImRvc2VfdGV4dCI6IjUwMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IlRJRCIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IjIxIHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiT3RoZXIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImVudCB8IGFkdWx0IHwgb3RoZXIgfCBkZW50YWwgaW5mZWN0aW9uIHwgYW1veGljaWxsaW4gfCBhbW94aWwgdHJpbW94IHwgNTAwbWcifSx7InNwZWNpYWx0eSI6IkVOVCIsIm1lZCI6Ik55c3RhdGluIiwiYnJhbmRzIjpbIk15Y29zdGF0aW4iLCJOaWxzdGF0Il0sImluZGljYXRpb24iOiJPcmFsIHRocnVzaCAoYWR1bHQvY2hpbGQpIiwiZG9zZV90ZXh0IjoiNW1sIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IlFJRCIsImR1cmF0aW9uIjoiMTQgZGF5IiwiZGlzcGVuc2UiOiIxIGJvdHRsZSIsInBybiI6InRocnVzaCIsImZvcm0iOiJzdXNwZW5zaW9uIiwiY29tbWVudHMiOiJTd2lzaCBpbiB0aGUgbW91dGggYW5kIHJldGFpbiBmb3IgYXMgbG9uZyBhcyBwb3NzaWJsZSAoc2V2ZXJhbCBtaW51dGVzKSBiZWZvcmUgc3dhbGxvd2luZy4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6Ik90aGVyIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJlbnQgfCBhZHVsdCB8IG90aGVyIHwgb3JhbCB0aHJ1c2ggKGFkdWx0L2NoaWxkKSB8IG55c3RhdGluIHwgbXljb3N0YXRpbiBuaWxzdGF0IHwgNW1sIHwgdGhydXNoIHwgc3dpc2ggaW4gdGhlIG1vdXRoIGFuZCByZXRhaW4gZm9yIGFzIGxvbmcgYXMgcG9zc2libGUgKHNldmVyYWwgbWludXRlcykgYmVmb3JlIHN3YWxsb3dpbmcuIn0seyJzcGVjaWFsdHkiOiJFTlQiLCJtZWQiOiJMaWRvY2FpbmUgdmlzY291cyBzb2x1dGlvbiAoMiUpIiwiYnJhbmRzIjpbXSwiaW5kaWNhdGlvbiI6Ik9yYWwgdWxjZXJzIiwiZG9zZV90ZXh0IjoiIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InEzaCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxMDBtbCIsInBybiI6Im1vdXRoIHBhaW4iLCJmb3JtIjoic29sdXRpb24iLCJjb21tZW50cyI6Ik1heSByZXF1aXJlIGNvbXBvdW5kaW5nLiBDYW4gcHJvdmlkZSBlcXVpdmFsZW50IHZhcmlhbnQgdGhhdCBpcyBhdmFpbGFibGUuIDE1bUwgc3dpc2hlZCBpbiB0aGUgbW91dGggYW5kIHNwaXQgb3V0IChtYXhpbXVtIDQuNW1nL2tnIFtvciAzMDBtZyBwZXIgZG9zZV07IDggZG9zZXMgcGVyIDI0LWhvdXIgcGVyaW9kKS4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6Ik90aGVyIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJlbnQgfCBhZHVsdCB8IG90aGVyIHwgb3JhbCB1bGNlcnMgfCBsaWRvY2FpbmUgdmlzY291cyBzb2x1dGlvbiAoMiUpIHwgbW91dGggcGFpbiB8IG1heSByZXF1aXJlIGNvbXBvdW5kaW5nLiBjYW4gcHJvdmlkZSBlcXVpdmFsZW50IHZhcmlhbnQgdGhhdCBpcyBhdmFpbGFibGUuIDE1bWwgc3dpc2hlZCBpbiB0aGUgbW91dGggYW5kIHNwaXQgb3V0IChtYXhpbXVtIDQuNW1nL2tnIFtvciAzMDBtZyBwZXIgZG9zZV07IDggZG9zZXMgcGVyIDI0LWhvdXIgcGVyaW9kKS4ifSx7InNwZWNpYWx0eSI6IkVOVCIsIm1lZCI6IkxpZG9jYWluZSB2aXNjb3VzIHNvbHV0aW9uICgyJSkiLCJicmFuZHMiOltdLCJpbmRpY2F0aW9uIjoiUGFpbiAodGhyb2F0KSIsImRvc2VfdGV4dCI6IiIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxM2giLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMTAwbWwiLCJwcm4iOiJ0aHJvYXQgcGFpbiIsImZvcm0iOiJzb2x1dGlvbiIsImNvbW1lbnRzIjoiTWF5IHJlcXVpcmUgY29tcG91bmRpbmcuIENhbiBwcm92aWRlIGVxdWl2YWxlbnQgdmFyaWFudCB0aGF0IGlzIGF2YWlsYWJsZS4gMTVtTCBnYXJnbGVkIChtYXhpbXVtOiA0LjVtZy9rZyBbb3IgMzAwbWcgcGVyIGRvc2VdOyA4IGRvc2VzIHBlciAyNC1ob3VyIHBlcmlvZCkuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiJPdGhlciIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZW50IHwgYWR1bHQgfCBvdGhlciB8IHBhaW4gKHRocm9hdCkgfCBsaWRvY2FpbmUgdmlzY291cyBzb2x1dGlvbiAoMiUpIHwgdGhyb2F0IHBhaW4gfCBtYXkgcmVxdWlyZSBjb21wb3VuZGluZy4gY2FuIHByb3ZpZGUgZXF1aXZhbGVudCB2YXJpYW50IHRoYXQgaXMgYXZhaWxhYmxlLiAxNW1sIGdhcmdsZWQgKG1heGltdW06IDQuNW1nL2tnIFtvciAzMDBtZyBwZXIgZG9zZV07IDggZG9zZXMgcGVyIDI0LWhvdXIgcGVyaW9kKS4ifSx7InNwZWNpYWx0eSI6IkVOVCIsIm1lZCI6IkJldGFoaXN0aW5lIiwiYnJhbmRzIjpbIlNlcmMiXSwiaW5kaWNhdGlvbiI6Ik1lbmllcmUncyBkaXNlYXNlIiwiZG9zZV90ZXh0IjoiOG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiI0IHdlZWsiLCJkaXNwZW5zZSI6IjI4IHRhYiIsInBybiI6InZlcnRpZ28iLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJNYXkgaW5jcmVhc2UgdG8gOG1nIHR3aWNlIGRhaWx5IGFmdGVyIHR3byB3ZWVrcyBpZiBpbmFkZXF1YXRlIHN5bXB0b20gY29udHJvbC4gRm9sbG93IHVwIHdpdGggdXN1YWwgY2FyZSBwcm92aWRlciBmb3IgcmVhc3Nlc3NtZW50L3JlZmlsbC4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6Ik90aGVyIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJlbnQgfCBhZHVsdCB8IG90aGVyIHwgbWVuaWVyZSdzIGRpc2Vhc2UgfCBiZXRhaGlzdGluZSB8IHNlcmMgfCA4bWcgfCB2ZXJ0aWdvIHwgbWF5IGluY3JlYXNlIHRvIDhtZyB0d2ljZSBkYWlseSBhZnRlciB0d28gd2Vla3MgaWYgaW5hZGVxdWF0ZSBzeW1wdG9tIGNvbnRyb2wuIGZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlYXNzZXNzbWVudC9yZWZpbGwuIn0seyJzcGVjaWFsdHkiOiJFTlQiLCJtZWQiOiJMb3JhemVwYW0iLCJicmFuZHMiOlsiQXRpdmFuIl0sImluZGljYXRpb24iOiJWZXJ0aWdvIiwiZG9zZV90ZXh0IjoiMC41LTFtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxNmgiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMTUgdGFiIiwicHJuIjoidmVydGlnbyIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkRpc3BlbnNlIDAuNW1nIHRhYnMuIFJlc2VydmUgZm9yIGVwaXNvZGVzIGxhc3RpbmcgaG91cnMgdG8gZGF5cy4gV2F0Y2ggZm9yIHNlZGF0aW9uLiBEbyBub3QgdGFrZSB3aXRoIGFsY29ob2wgb3Igc2VkYXRpdmVzLiBEbyBub3QgZHJpdmUgb3Igb3BlcmF0ZSBoZWF2eSBtYWNoaW5lcnkuIENocm9uaWMgdXNlIG1heSBpbXBlZGUgYWRhcHRhdGlvbiBhbmQgcmVjb3ZlcnkuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiJPdGhlciIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZW50IHwgYWR1bHQgfCBvdGhlciB8IHZlcnRpZ28gfCBsb3JhemVwYW0gfCBhdGl2YW4gfCAwLjUtMW1nIHwgdmVydGlnbyB8IGRpc3BlbnNlIDAuNW1nIHRhYnMuIHJlc2VydmUgZm9yIGVwaXNvZGVzIGxhc3RpbmcgaG91cnMgdG8gZGF5cy4gd2F0Y2ggZm9yIHNlZGF0aW9uLiBkbyBub3QgdGFrZSB3aXRoIGFsY29ob2wgb3Igc2VkYXRpdmVzLiBkbyBub3QgZHJpdmUgb3Igb3BlcmF0ZSBoZWF2eSBtYWNoaW5lcnkuIGNocm9uaWMgdXNlIG1heSBpbXBlZGUgYWRhcHRhdGlvbiBhbmQgcmVjb3ZlcnkuIn0seyJzcGVjaWFsdHkiOiJFTlQiLCJtZWQiOiJBbW94aWNpbGxpbiIsImJyYW5kcyI6WyJBbW94aWwiLCJUcmltb3giXSwiaW5kaWNhdGlvbiI6Ik90aXRpcyBtZWRpYSAoYWdlIDwyIHllYXJzLCBUTSBwZXJmb3JhdGlvbiwgb3IgcmVjdXJyZW50IEFPTSkiLCJkb3NlX3RleHQiOiI0NW1nL2tnL2Rvc2UiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicTEyaCIsImR1cmF0aW9uIjoiMTAgZGF5IiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoic3VzcGVuc2lvbiIsImNvbW1lbnRzIjoiOTBtZy9rZy9kYXkuIE1heGltdW0gZG9zZSA9IDRnL2RheS4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiJFYXIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjp0cnVlLCJkb3NlX3Blcl9rZ19tZyI6NDUuMCwibWF4X2Rvc2VfbWciOjIwMDAuMCwic2VhcmNoX3RleHQiOiJlbnQgfCBwZWRpYXRyaWMgfCBlYXIgfCBvdGl0aXMgbWVkaWEgKGFnZSA8MiB5ZWFycywgdG0gcGVyZm9yYXRpb24sIG9yIHJlY3VycmVudCBhb20pIHwgYW1veGljaWxsaW4gfCBhbW94aWwgdHJpbW94IHwgNDVtZy9rZy9kb3NlIHwgOTBtZy9rZy9kYXkuIG1heGltdW0gZG9zZSA9IDRnL2RheS4ifSx7InNwZWNpYWx0eSI6IkVOVCIsIm1lZCI6IkFtb3hpY2lsbGluIiwiYnJhbmRzIjpbIkFtb3hpbCIsIlRyaW1veCJdLCJpbmRpY2F0aW9uIjoiT3RpdGlzIG1lZGlhIChhZ2UgMi0xOCB5ZWFycywgbm8gVE0gcGVyZm9yYXRpb24sIGFuZCBubyByZWN1cnJlbnQgQU9NKSIsImRvc2VfdGV4dCI6IjQ1bWcva2cvZG9zZSIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxMTJoIiwiZHVyYXRpb24iOiI1IGRheSIsImRpc3BlbnNlIjoiIiwicHJuIjoiIiwiZm9ybSI6InN1c3BlbnNpb24iLCJjb21tZW50cyI6IjkwbWcva2cvZGF5LiBNYXhpbXVtIGRvc2UgPSA0Zy9kYXkuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiRWFyIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6dHJ1ZSwiZG9zZV9wZXJfa2dfbWciOjQ1LjAsIm1heF9kb3NlX21nIjoyMDAwLjAsInNlYXJjaF90ZXh0IjoiZW50IHwgcGVkaWF0cmljIHwgZWFyIHwgb3RpdGlzIG1lZGlhIChhZ2UgMi0xOCB5ZWFycywgbm8gdG0gcGVyZm9yYXRpb24sIGFuZCBubyByZWN1cnJlbnQgYW9tKSB8IGFtb3hpY2lsbGluIHwgYW1veGlsIHRyaW1veCB8IDQ1bWcva2cvZG9zZSB8IDkwbWcva2cvZGF5LiBtYXhpbXVtIGRvc2UgPSA0Zy9kYXkuIn0seyJzcGVjaWFsdHkiOiJFTlQiLCJtZWQiOiJDZWZ1cm94aW1lIiwiYnJhbmRzIjpbIkNlZnRpbiJdLCJpbmRpY2F0aW9uIjoiT3RpdGlzIG1lZGlhIChhZ2UgPDIgeWVhcnMsIFRNIHBlcmZvcmF0aW9uLCBvciByZWN1cnJlbnQgQU9NOyBwZW5pY2lsbGluIGFsbGVyZ3kpIiwiZG9zZV90ZXh0IjoiMTVtZy9rZy9kb3NlIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InExMmgiLCJkdXJhdGlvbiI6IjEwIGRheSIsImRpc3BlbnNlIjoiIiwicHJuIjoiIiwiZm9ybSI6InN1c3BlbnNpb24iLCJjb21tZW50cyI6IjMwbWcva2cvZGF5LiBNYXhpbXVtIGRvc2UgPSA1MDBtZy9kb3NlLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IkVhciIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOnRydWUsImRvc2VfcGVyX2tnX21nIjoxNS4wLCJtYXhfZG9zZV9tZyI6NTAwLjAsInNlYXJjaF90ZXh0IjoiZW50IHwgcGVkaWF0cmljIHwgZWFyIHwgb3RpdGlzIG1lZGlhIChhZ2UgPDIgeWVhcnMsIHRtIHBlcmZvcmF0aW9uLCBvciByZWN1cnJlbnQgYW9tOyBwZW5pY2lsbGluIGFsbGVyZ3kpIHwgY2VmdXJveGltZSB8IGNlZnRpbiB8IDE1bWcva2cvZG9zZSB8IDMwbWcva2cvZGF5LiBtYXhpbXVtIGRvc2UgPSA1MDBtZy9kb3NlLiJ9LHsic3BlY2lhbHR5IjoiRU5UIiwibWVkIjoiQ2VmdXJveGltZSIsImJyYW5kcyI6WyJDZWZ0aW4iXSwiaW5kaWNhdGlvbiI6Ik90aXRpcyBtZWRpYSAoYWdlIDItMTggeWVhcnMsIG5vIFRNIHBlcmZvcmF0aW9uLCBhbmQgbm8gcmVjdXJyZW50IEFPTTsgcGVuaWNpbGxpbiBhbGxlcmd5KSIsImRvc2VfdGV4dCI6IjE1bWcva2cvZG9zZSIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxMTJoIiwiZHVyYXRpb24iOiI1IGRheSIsImRpc3BlbnNlIjoiIiwicHJuIjoiIiwiZm9ybSI6InN1c3BlbnNpb24iLCJjb21tZW50cyI6IjMwbWcva2cvZGF5LiBNYXhpbXVtIGRvc2UgPSA1MDBtZy9kb3NlLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IkVhciIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOnRydWUsImRvc2VfcGVyX2tnX21nIjoxNS4wLCJtYXhfZG9zZV9tZyI6NTAwLjAsInNlYXJjaF90ZXh0IjoiZW50IHwgcGVkaWF0cmljIHwgZWFyIHwgb3RpdGlzIG1lZGlhIChhZ2UgMi0xOCB5ZWFycywgbm8gdG0gcGVyZm9yYXRpb24sIGFuZCBubyByZWN1cnJlbnQgYW9tOyBwZW5pY2lsbGluIGFsbGVyZ3kpIHwgY2VmdXJveGltZSB8IGNlZnRpbiB8IDE1bWcva2cvZG9zZSB8IDMwbWcva2cvZGF5LiBtYXhpbXVtIGRvc2UgPSA1MDBtZy9kb3NlLiJ9LHsic3BlY2lhbHR5IjoiRU5UIiwibWVkIjoiQXppdGhyb215Y2luIiwiYnJhbmRzIjpbIlppdGhyb21heCIsIlptYXgiXSwiaW5kaWNhdGlvbiI6Ik90aXRpcyBtZWRpYSAoYWdlIFx1MjI2NTYgbW9udGhzKSIsImRvc2VfdGV4dCI6IjVtZy9rZy9kb3NlIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiI1IGRheSIsImRpc3BlbnNlIjoiIiwicHJuIjoiIiwiZm9ybSI6InN1c3BlbnNpb24iLCJjb21tZW50cyI6IjEwbWcva2cgKG1heGltdW0gNTAwbWcvZG9zZSkgUE8gZGFpbHkgb24gZGF5IDEsIHRoZW4gNW1nL2tnL2Rvc2UgKG1heGltdW0gMjUwbWcvZG9zZSkgUE8gZGFpbHkgZm9yIGRheXMgMi01LiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IkVhciIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZW50IHwgcGVkaWF0cmljIHwgZWFyIHwgb3RpdGlzIG1lZGlhIChhZ2UgXHUyMjY1NiBtb250aHMpIHwgYXppdGhyb215Y2luIHwgeml0aHJvbWF4IHptYXggfCA1bWcva2cvZG9zZSB8IDEwbWcva2cgKG1heGltdW0gNTAwbWcvZG9zZSkgcG8gZGFpbHkgb24gZGF5IDEsIHRoZW4gNW1nL2tnL2Rvc2UgKG1heGltdW0gMjUwbWcvZG9zZSkgcG8gZGFpbHkgZm9yIGRheXMgMi01LiJ9LHsic3BlY2lhbHR5IjoiRU5UIiwibWVkIjoiQ2lwcm9mbG94YWNpbiArIERleGFtZXRoYXNvbmUgb3RpYyIsImJyYW5kcyI6WyJDaXByb2RleCJdLCJpbmRpY2F0aW9uIjoiT3RpdGlzIGV4dGVybmEiLCJkb3NlX3RleHQiOiI0IGRyb3BzIiwicm91dGUiOiJ0byBhZmZlY3RlZCBlYXIocykiLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIxIGJvdHRsZSIsInBybiI6IiIsImZvcm0iOiJkcm9wcyIsImNvbW1lbnRzIjoiTFUgY29kZSA9IDUwOS4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiJFYXIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImVudCB8IHBlZGlhdHJpYyB8IGVhciB8IG90aXRpcyBleHRlcm5hIHwgY2lwcm9mbG94YWNpbiArIGRleGFtZXRoYXNvbmUgb3RpYyB8IGNpcHJvZGV4IHwgNCBkcm9wcyB8IGx1IGNvZGUgPSA1MDkuIn0seyJzcGVjaWFsdHkiOiJFTlQiLCJtZWQiOiJDbG90cmltYXpvbGUgY3JlYW0gKDElKSIsImJyYW5kcyI6WyJDYW5lc3RlbiIsIkxvdHJpbWluIl0sImluZGljYXRpb24iOiJPdGl0aXMgZXh0ZXJuYSIsImRvc2VfdGV4dCI6IjEgYXBwbGljYXRpb24iLCJyb3V0ZSI6InRvcGljYWwiLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjIgd2VlayIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoiIiwiZm9ybSI6ImNyZWFtIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiJFYXIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImVudCB8IHBlZGlhdHJpYyB8IGVhciB8IG90aXRpcyBleHRlcm5hIHwgY2xvdHJpbWF6b2xlIGNyZWFtICgxJSkgfCBjYW5lc3RlbiBsb3RyaW1pbiB8IDEgYXBwbGljYXRpb24ifSx7InNwZWNpYWx0eSI6IkVOVCIsIm1lZCI6Ik1vbWV0YXNvbmUiLCJicmFuZHMiOlsiTmFzb25leCJdLCJpbmRpY2F0aW9uIjoiTmFzYWwgY29uZ2VzdGlvbiIsImRvc2VfdGV4dCI6IiIsInJvdXRlIjoibmFzYWwiLCJmcmVxdWVuY3kiOiIiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiIiwicHJuIjoiIiwiZm9ybSI6InNwcmF5IiwiY29tbWVudHMiOiJBZ2UgMi0xMSB5ZWFyczogMSBzcHJheSAoNTAgbWNnKSBwZXIgbm9zdHJpbCBvbmNlIGRhaWx5LiBBZ2UgMTIgeWVhcnMgb3Igb2xkZXI6IDIgc3ByYXlzICgxMDAgbWNnKSBwZXIgbm9zdHJpbCBvbmNlIGRhaWx5LiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6Ik5vc2UiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImVudCB8IHBlZGlhdHJpYyB8IG5vc2UgfCBuYXNhbCBjb25nZXN0aW9uIHwgbW9tZXRhc29uZSB8IG5hc29uZXggfCBhZ2UgMi0xMSB5ZWFyczogMSBzcHJheSAoNTAgbWNnKSBwZXIgbm9zdHJpbCBvbmNlIGRhaWx5LiBhZ2UgMTIgeWVhcnMgb3Igb2xkZXI6IDIgc3ByYXlzICgxMDAgbWNnKSBwZXIgbm9zdHJpbCBvbmNlIGRhaWx5LiJ9LHsic3BlY2lhbHR5IjoiRU5UIiwibWVkIjoiQ2ljbGVzb25pZGUiLCJicmFuZHMiOlsiT21uYXJpcyIsIlpldG9ubmEiXSwiaW5kaWNhdGlvbiI6Ik5hc2FsIGNvbmdlc3Rpb24iLCJkb3NlX3RleHQiOiIiLCJyb3V0ZSI6Im5hc2FsIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJzcHJheSIsImNvbW1lbnRzIjoiQWdlIDItMTEgeWVhcnM6IDEgc3ByYXkgKDUwIG1jZykgcGVyIG5vc3RyaWwgb25jZSBkYWlseS4gQWdlIDEyIHllYXJzIG9yIG9sZGVyOiAyIHNwcmF5cyAoMTAwIG1jZykgcGVyIG5vc3RyaWwgb25jZSBkYWlseS4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiJOb3NlIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJlbnQgfCBwZWRpYXRyaWMgfCBub3NlIHwgbmFzYWwgY29uZ2VzdGlvbiB8IGNpY2xlc29uaWRlIHwgb21uYXJpcyB6ZXRvbm5hIHwgYWdlIDItMTEgeWVhcnM6IDEgc3ByYXkgKDUwIG1jZykgcGVyIG5vc3RyaWwgb25jZSBkYWlseS4gYWdlIDEyIHllYXJzIG9yIG9sZGVyOiAyIHNwcmF5cyAoMTAwIG1jZykgcGVyIG5vc3RyaWwgb25jZSBkYWlseS4ifSx7InNwZWNpYWx0eSI6IkVOVCIsIm1lZCI6IkZsdXRpY2Fzb25lIiwiYnJhbmRzIjpbIkZsb25hc2UiXSwiaW5kaWNhdGlvbiI6Ik5hc2FsIGNvbmdlc3Rpb24iLCJkb3NlX3RleHQiOiIiLCJyb3V0ZSI6Im5hc2FsIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJzcHJheSIsImNvbW1lbnRzIjoiQWdlIDItMTEgeWVhcnM6IDEgc3ByYXkgKDI3LjVtY2cpIHBlciBub3N0cmlsIG9uY2UgZGFpbHkuIEFnZSAxMiB5ZWFycyBvciBvbGRlcjogMiBzcHJheXMgKDU1bWNnKSBwZXIgbm9zdHJpbCBvbmNlIGRhaWx5LiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6Ik5vc2UiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImVudCB8IHBlZGlhdHJpYyB8IG5vc2UgfCBuYXNhbCBjb25nZXN0aW9uIHwgZmx1dGljYXNvbmUgfCBmbG9uYXNlIHwgYWdlIDItMTEgeWVhcnM6IDEgc3ByYXkgKDI3LjVtY2cpIHBlciBub3N0cmlsIG9uY2UgZGFpbHkuIGFnZSAxMiB5ZWFycyBvciBvbGRlcjogMiBzcHJheXMgKDU1bWNnKSBwZXIgbm9zdHJpbCBvbmNlIGRhaWx5LiJ9LHsic3BlY2lhbHR5IjoiRU5UIiwibWVkIjoiQW1veGljaWxsaW4iLCJicmFuZHMiOlsiQW1veGlsIiwiVHJpbW94Il0sImluZGljYXRpb24iOiJTdHJlcCB0aHJvYXQiLCJkb3NlX3RleHQiOiI1MG1nL2tnL2RheSIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJPRCIsImR1cmF0aW9uIjoiMTAgZGF5IiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoic3VzcGVuc2lvbiIsImNvbW1lbnRzIjoiTWF4aW11bSBkb3NlID0gMTAwMG1nL2RheS4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiJUaHJvYXQiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjp0cnVlLCJkb3NlX3Blcl9rZ19tZyI6NTAuMCwibWF4X2Rvc2VfbWciOjEwMDAuMCwic2VhcmNoX3RleHQiOiJlbnQgfCBwZWRpYXRyaWMgfCB0aHJvYXQgfCBzdHJlcCB0aHJvYXQgfCBhbW94aWNpbGxpbiB8IGFtb3hpbCB0cmltb3ggfCA1MG1nL2tnL2RheSB8IG1heGltdW0gZG9zZSA9IDEwMDBtZy9kYXkuIn0seyJzcGVjaWFsdHkiOiJFTlQiLCJtZWQiOiJDZWZ1cm94aW1lIiwiYnJhbmRzIjpbIkNlZnRpbiJdLCJpbmRpY2F0aW9uIjoiU3RyZXAgdGhyb2F0IChwZW5pY2lsbGluIGFsbGVyZ3kpIiwiZG9zZV90ZXh0IjoiMTBtZy9rZy9kb3NlIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiMTAgZGF5IiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoic3VzcGVuc2lvbiIsImNvbW1lbnRzIjoiTWF4aW11bSBkb3NlID0gMjUwbWcvZG9zZS4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiJUaHJvYXQiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjp0cnVlLCJkb3NlX3Blcl9rZ19tZyI6MTAuMCwibWF4X2Rvc2VfbWciOjI1MC4wLCJzZWFyY2hfdGV4dCI6ImVudCB8IHBlZGlhdHJpYyB8IHRocm9hdCB8IHN0cmVwIHRocm9hdCAocGVuaWNpbGxpbiBhbGxlcmd5KSB8IGNlZnVyb3hpbWUgfCBjZWZ0aW4gfCAxMG1nL2tnL2Rvc2UgfCBtYXhpbXVtIGRvc2UgPSAyNTBtZy9kb3NlLiJ9LHsic3BlY2lhbHR5IjoiRU5UIiwibWVkIjoiQXppdGhyb215Y2luIiwiYnJhbmRzIjpbIlppdGhyb21heCIsIlptYXgiXSwiaW5kaWNhdGlvbiI6IlN0cmVwIHRocm9hdCAocGVuaWNpbGxpbiBhbmFwaHlsYXhpcykiLCJkb3NlX3RleHQiOiIxMm1nL2tnL2Rvc2UiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoic3VzcGVuc2lvbiIsImNvbW1lbnRzIjoiMTJtZy9rZy9kb3NlIFBPIGRhaWx5IGZvciA1IGRheXMuIE1heGltdW0gZG9zZSA9IDUwMG1nL2Rvc2UuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiVGhyb2F0IiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6dHJ1ZSwiZG9zZV9wZXJfa2dfbWciOjEyLjAsIm1heF9kb3NlX21nIjo1MDAuMCwic2VhcmNoX3RleHQiOiJlbnQgfCBwZWRpYXRyaWMgfCB0aHJvYXQgfCBzdHJlcCB0aHJvYXQgKHBlbmljaWxsaW4gYW5hcGh5bGF4aXMpIHwgYXppdGhyb215Y2luIHwgeml0aHJvbWF4IHptYXggfCAxMm1nL2tnL2Rvc2UgfCAxMm1nL2tnL2Rvc2UgcG8gZGFpbHkgZm9yIDUgZGF5cy4gbWF4aW11bSBkb3NlID0gNTAwbWcvZG9zZS4ifSx7InNwZWNpYWx0eSI6IkVOVCIsIm1lZCI6IkFtb3hpY2lsbGluIiwiYnJhbmRzIjpbIkFtb3hpbCIsIlRyaW1veCJdLCJpbmRpY2F0aW9uIjoiRGVudGFsIGluZmVjdGlvbiIsImRvc2VfdGV4dCI6IjIyLjVtZy9rZy9kb3NlIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJzdXNwZW5zaW9uIiwiY29tbWVudHMiOiJNYXhpbXVtIGRvc2UgPSAzZy9kYXkuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiT3RoZXIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjp0cnVlLCJkb3NlX3Blcl9rZ19tZyI6MjIuNSwibWF4X2Rvc2VfbWciOjE1MDAuMCwic2VhcmNoX3RleHQiOiJlbnQgfCBwZWRpYXRyaWMgfCBvdGhlciB8IGRlbnRhbCBpbmZlY3Rpb24gfCBhbW94aWNpbGxpbiB8IGFtb3hpbCB0cmltb3ggfCAyMi41bWcva2cvZG9zZSB8IG1heGltdW0gZG9zZSA9IDNnL2RheS4ifSx7InNwZWNpYWx0eSI6IkVOVCIsIm1lZCI6IkxpZG9jYWluZSB2aXNjb3VzIHNvbHV0aW9uICgyJSkiLCJicmFuZHMiOltdLCJpbmRpY2F0aW9uIjoiT3JhbCB1bGNlcnMiLCJkb3NlX3RleHQiOiIiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicTNoIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjUwbWwiLCJwcm4iOiJwYWluIiwiZm9ybSI6InNvbHV0aW9uIiwiY29tbWVudHMiOiJNYXkgcmVxdWlyZSBjb21wb3VuZGluZy4gQ2FuIHByb3ZpZGUgZXF1aXZhbGVudCB2YXJpYW50IHRoYXQgaXMgYXZhaWxhYmxlLiBBcHBseSAxbWwgdG8gYWZmZWN0ZWQgYXJlYShzKSB3aXRoIGEgY290dG9uIHN3YWIuIERvIG5vdCBleGNlZWQgMC4ybUwva2cgb2YgYm9keSB3ZWlnaHQuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiT3RoZXIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImVudCB8IHBlZGlhdHJpYyB8IG90aGVyIHwgb3JhbCB1bGNlcnMgfCBsaWRvY2FpbmUgdmlzY291cyBzb2x1dGlvbiAoMiUpIHwgcGFpbiB8IG1heSByZXF1aXJlIGNvbXBvdW5kaW5nLiBjYW4gcHJvdmlkZSBlcXVpdmFsZW50IHZhcmlhbnQgdGhhdCBpcyBhdmFpbGFibGUuIGFwcGx5IDFtbCB0byBhZmZlY3RlZCBhcmVhKHMpIHdpdGggYSBjb3R0b24gc3dhYi4gZG8gbm90IGV4Y2VlZCAwLjJtbC9rZyBvZiBib2R5IHdlaWdodC4ifSx7InNwZWNpYWx0eSI6IkVOVCIsIm1lZCI6Ik55c3RhdGluIiwiYnJhbmRzIjpbIk15Y29zdGF0aW4iLCJOaWxzdGF0Il0sImluZGljYXRpb24iOiJPcmFsIHRocnVzaCAoaW5mYW50KSIsImRvc2VfdGV4dCI6IjJtTCIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJRSUQiLCJkdXJhdGlvbiI6IjE0IGRheSIsImRpc3BlbnNlIjoiMSBib3R0bGUiLCJwcm4iOiJ0aHJ1c2giLCJmb3JtIjoic3VzcGVuc2lvbiIsImNvbW1lbnRzIjoiMW1MID0gMTAwLDAwMFUuIFNxdWlydCBoYWxmIG9mIGRvc2UgdG8gZWFjaCBzaWRlIG9mIG1vdXRoIGFuZCBsZXQgc3dhbGxvdy4gQ2xlYW4gbW91dGggYWZ0ZXIgZWFjaCBicmVhc3RmZWVkLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6Ik90aGVyIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJlbnQgfCBwZWRpYXRyaWMgfCBvdGhlciB8IG9yYWwgdGhydXNoIChpbmZhbnQpIHwgbnlzdGF0aW4gfCBteWNvc3RhdGluIG5pbHN0YXQgfCAybWwgfCB0aHJ1c2ggfCAxbWwgPSAxMDAsMDAwdS4gc3F1aXJ0IGhhbGYgb2YgZG9zZSB0byBlYWNoIHNpZGUgb2YgbW91dGggYW5kIGxldCBzd2FsbG93LiBjbGVhbiBtb3V0aCBhZnRlciBlYWNoIGJyZWFzdGZlZWQuIn0seyJzcGVjaWFsdHkiOiJDYXJkaWFjICYgSGVtZSIsIm1lZCI6Ik5pdHJvZ2x5Y2VyaW4gKHNwcmF5KSIsImJyYW5kcyI6WyJOaXRyb2xpbmd1YWwiXSwiaW5kaWNhdGlvbiI6IkNoZXN0IHBhaW4iLCJkb3NlX3RleHQiOiIxLTIgc3ByYXlzIiwicm91dGUiOiJTTCIsImZyZXF1ZW5jeSI6InE1bWlucyIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxIGJvdHRsZSIsInBybiI6ImNoZXN0IHBhaW4iLCJmb3JtIjoic3ByYXkiLCJjb21tZW50cyI6IjEtMiBzcHJheXMgYXQgY2hlc3QgcGFpbiBvbnNldDsgcmVwZWF0IGV2ZXJ5IDUgbWludXRlcyBpZiBwYWluIHBlcnNpc3RzOyBtYXkgYWRtaW5pc3RlciB1cCB0byAzIHNwcmF5cyBpbiBhIDE1LW1pbnV0ZSBwZXJpb2QuIElmIHBhaW4gaXMgbm90IHJlbGlldmVkIG9yIHdvcnNlbnMgNSBtaW51dGVzIGFmdGVyIDEgZG9zZSwgc2VlayBlbWVyZ2VuY3kgbWVkaWNhbCBhdHRlbnRpb24uIFVzZSBzaXR0aW5nIGRvd24uIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIxIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImNhcmRpYWMgJiBoZW1lIHwgYWR1bHQgfCBjaGVzdCBwYWluIHwgbml0cm9nbHljZXJpbiAoc3ByYXkpIHwgbml0cm9saW5ndWFsIHwgMS0yIHNwcmF5cyB8IGNoZXN0IHBhaW4gfCAxLTIgc3ByYXlzIGF0IGNoZXN0IHBhaW4gb25zZXQ7IHJlcGVhdCBldmVyeSA1IG1pbnV0ZXMgaWYgcGFpbiBwZXJzaXN0czsgbWF5IGFkbWluaXN0ZXIgdXAgdG8gMyBzcHJheXMgaW4gYSAxNS1taW51dGUgcGVyaW9kLiBpZiBwYWluIGlzIG5vdCByZWxpZXZlZCBvciB3b3JzZW5zIDUgbWludXRlcyBhZnRlciAxIGRvc2UsIHNlZWsgZW1lcmdlbmN5IG1lZGljYWwgYXR0ZW50aW9uLiB1c2Ugc2l0dGluZyBkb3duLiJ9LHsic3BlY2lhbHR5IjoiQ2FyZGlhYyAmIEhlbWUiLCJtZWQiOiJBY2V0eWxzYWxpY3lsaWMgQWNpZCIsImJyYW5kcyI6WyJBU0EiLCJBc3BpcmluIiwiRW50cm9waGVuIiwiQXNhcGhlbiIsIk5vdmFzZW4iLCJCYXllciIsIkJ1ZmZlcmluIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiI4MW1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiI0IHdlZWsiLCJkaXNwZW5zZSI6IjI4IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlYXNzZXNzbWVudC9yZWZpbGwuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIyIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImNhcmRpYWMgJiBoZW1lIHwgYWR1bHQgfCBhY2V0eWxzYWxpY3lsaWMgYWNpZCB8IGFzYSBhc3BpcmluIGVudHJvcGhlbiBhc2FwaGVuIG5vdmFzZW4gYmF5ZXIgYnVmZmVyaW4gfCA4MW1nIHwgZm9sbG93IHVwIHdpdGggdXN1YWwgY2FyZSBwcm92aWRlciBmb3IgcmVhc3Nlc3NtZW50L3JlZmlsbC4ifSx7InNwZWNpYWx0eSI6IkNhcmRpYWMgJiBIZW1lIiwibWVkIjoiQXBpeGFiYW4iLCJicmFuZHMiOlsiRWxpcXVpcyJdLCJpbmRpY2F0aW9uIjoiQXRyaWFsIGZpYnJpbGxhdGlvbiIsImRvc2VfdGV4dCI6IjVtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjQgd2VlayIsImRpc3BlbnNlIjoiNTYgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiTFUgY29kZSA9IDQ0OC4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjEiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiY2FyZGlhYyAmIGhlbWUgfCBhZHVsdCB8IGF0cmlhbCBmaWJyaWxsYXRpb24gfCBhcGl4YWJhbiB8IGVsaXF1aXMgfCA1bWcgfCBsdSBjb2RlID0gNDQ4LiJ9LHsic3BlY2lhbHR5IjoiQ2FyZGlhYyAmIEhlbWUiLCJtZWQiOiJBcGl4YWJhbiIsImJyYW5kcyI6WyJFbGlxdWlzIl0sImluZGljYXRpb24iOiJBdHJpYWwgZmlicmlsbGF0aW9uIChyZWR1Y2VkIGRvc2UgZm9yIDIvMyBvZjogQ3IgXHUyMjY1MTMzLCBhZ2UgXHUyMjY1ODAsIHdlaWdodCBcdTIyNjQ2MGtnKSIsImRvc2VfdGV4dCI6IjIuNW1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiNCB3ZWVrIiwiZGlzcGVuc2UiOiI1NiB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJMVSBjb2RlID0gNDQ4LiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJjYXJkaWFjICYgaGVtZSB8IGFkdWx0IHwgYXRyaWFsIGZpYnJpbGxhdGlvbiAocmVkdWNlZCBkb3NlIGZvciAyLzMgb2Y6IGNyIFx1MjI2NTEzMywgYWdlIFx1MjI2NTgwLCB3ZWlnaHQgXHUyMjY0NjBrZykgfCBhcGl4YWJhbiB8IGVsaXF1aXMgfCAyLjVtZyB8IGx1IGNvZGUgPSA0NDguIn0seyJzcGVjaWFsdHkiOiJDYXJkaWFjICYgSGVtZSIsIm1lZCI6IkFwaXhhYmFuIiwiYnJhbmRzIjpbIkVsaXF1aXMiXSwiaW5kaWNhdGlvbiI6IlZURSAoUEUvRFZUKSIsImRvc2VfdGV4dCI6IiIsInJvdXRlIjoiIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiIiLCJjb21tZW50cyI6IjEwbWcgUE8gQklEIGZvciA3IGRheXMsIHRoZW4gNW1nIFBPIEJJRCB0aGVyZWFmdGVyLiBEaXNwZW5zZSA0IHdlZWtzLiBMVSBjb2RlID0gNDQ0LiBBdm9pZCBpbiBDckNsIDwxNW1ML21pbiBvciBkaWFseXNpcy4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiY2FyZGlhYyAmIGhlbWUgfCBhZHVsdCB8IHZ0ZSAocGUvZHZ0KSB8IGFwaXhhYmFuIHwgZWxpcXVpcyB8IDEwbWcgcG8gYmlkIGZvciA3IGRheXMsIHRoZW4gNW1nIHBvIGJpZCB0aGVyZWFmdGVyLiBkaXNwZW5zZSA0IHdlZWtzLiBsdSBjb2RlID0gNDQ0LiBhdm9pZCBpbiBjcmNsIDwxNW1sL21pbiBvciBkaWFseXNpcy4ifSx7InNwZWNpYWx0eSI6IkNhcmRpYWMgJiBIZW1lIiwibWVkIjoiUml2YXJveGFiYW4iLCJicmFuZHMiOlsiWGFyZWx0byJdLCJpbmRpY2F0aW9uIjoiVlRFIChQRS9EVlQpIiwiZG9zZV90ZXh0IjoiIiwicm91dGUiOiIiLCJmcmVxdWVuY3kiOiIiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiIiwicHJuIjoiIiwiZm9ybSI6IiIsImNvbW1lbnRzIjoiMTVtZyBQTyBCSUQgZm9yIDIxIGRheXMsIHRoZW4gMjBtZyBQTyBPRCB0aGVyZWFmdGVyLiBEaXNwZW5zZSA0IHdlZWtzLiBUYWtlIHdpdGggZm9vZC4gTFUgY29kZSA9IDQ0NC4gQXZvaWQgaW4gQ3JDbCA8MTVtTC9taW4gb3IgZGlhbHlzaXMuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImNhcmRpYWMgJiBoZW1lIHwgYWR1bHQgfCB2dGUgKHBlL2R2dCkgfCByaXZhcm94YWJhbiB8IHhhcmVsdG8gfCAxNW1nIHBvIGJpZCBmb3IgMjEgZGF5cywgdGhlbiAyMG1nIHBvIG9kIHRoZXJlYWZ0ZXIuIGRpc3BlbnNlIDQgd2Vla3MuIHRha2Ugd2l0aCBmb29kLiBsdSBjb2RlID0gNDQ0LiBhdm9pZCBpbiBjcmNsIDwxNW1sL21pbiBvciBkaWFseXNpcy4ifSx7InNwZWNpYWx0eSI6IkNhcmRpYWMgJiBIZW1lIiwibWVkIjoiTWV0b3Byb2xvbCIsImJyYW5kcyI6WyJMb3ByZXNvciIsIkJldGFsb2MiXSwiaW5kaWNhdGlvbiI6IkF0cmlhbCBmaWJyaWxsYXRpb24iLCJkb3NlX3RleHQiOiIyNW1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiNCB3ZWVrIiwiZGlzcGVuc2UiOiI1NiB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJGb2xsb3cgdXAgd2l0aCB1c3VhbCBjYXJlIHByb3ZpZGVyIGZvciByZWFzc2Vzc21lbnQvcmVmaWxsLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJjYXJkaWFjICYgaGVtZSB8IGFkdWx0IHwgYXRyaWFsIGZpYnJpbGxhdGlvbiB8IG1ldG9wcm9sb2wgfCBsb3ByZXNvciBiZXRhbG9jIHwgMjVtZyB8IGZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlYXNzZXNzbWVudC9yZWZpbGwuIn0seyJzcGVjaWFsdHkiOiJDYXJkaWFjICYgSGVtZSIsIm1lZCI6IkJpc29wcm9sb2wiLCJicmFuZHMiOlsiTW9ub2NvciIsIlplYmV0YSJdLCJpbmRpY2F0aW9uIjoiQXRyaWFsIGZpYnJpbGxhdGlvbiIsImRvc2VfdGV4dCI6IjIuNW1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiI0IHdlZWsiLCJkaXNwZW5zZSI6IjI4IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlYXNzZXNzbWVudC9yZWZpbGwuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIxIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImNhcmRpYWMgJiBoZW1lIHwgYWR1bHQgfCBhdHJpYWwgZmlicmlsbGF0aW9uIHwgYmlzb3Byb2xvbCB8IG1vbm9jb3IgemViZXRhIHwgMi41bWcgfCBmb2xsb3cgdXAgd2l0aCB1c3VhbCBjYXJlIHByb3ZpZGVyIGZvciByZWFzc2Vzc21lbnQvcmVmaWxsLiJ9LHsic3BlY2lhbHR5IjoiQ2FyZGlhYyAmIEhlbWUiLCJtZWQiOiJEaWx0aWF6ZW0gWFIiLCJicmFuZHMiOlsiVGlhemFjIiwiQ2FyZGl6ZW0iXSwiaW5kaWNhdGlvbiI6IkF0cmlhbCBmaWJyaWxsYXRpb24iLCJkb3NlX3RleHQiOiIxMjBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJPRCIsImR1cmF0aW9uIjoiNCB3ZWVrIiwiZGlzcGVuc2UiOiIyOCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJGb2xsb3cgdXAgd2l0aCB1c3VhbCBjYXJlIHByb3ZpZGVyIGZvciByZWFzc2Vzc21lbnQvcmVmaWxsLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJjYXJkaWFjICYgaGVtZSB8IGFkdWx0IHwgYXRyaWFsIGZpYnJpbGxhdGlvbiB8IGRpbHRpYXplbSB4ciB8IHRpYXphYyBjYXJkaXplbSB8IDEyMG1nIHwgZm9sbG93IHVwIHdpdGggdXN1YWwgY2FyZSBwcm92aWRlciBmb3IgcmVhc3Nlc3NtZW50L3JlZmlsbC4ifSx7InNwZWNpYWx0eSI6IkNhcmRpYWMgJiBIZW1lIiwibWVkIjoiRnVyb3NlbWlkZSIsImJyYW5kcyI6WyJMYXNpeCJdLCJpbmRpY2F0aW9uIjoiSGVhcnQgZmFpbHVyZS9mbHVpZCBvdmVybG9hZC9lZGVtYSIsImRvc2VfdGV4dCI6IjQwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiI3IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgd2hlbiBwcmVzY3JpcHRpb24gZG9uZSBmb3IgcmVhc3Nlc3NtZW50LiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJjYXJkaWFjICYgaGVtZSB8IGFkdWx0IHwgaGVhcnQgZmFpbHVyZS9mbHVpZCBvdmVybG9hZC9lZGVtYSB8IGZ1cm9zZW1pZGUgfCBsYXNpeCB8IDQwbWcgfCBmb2xsb3cgdXAgd2l0aCB1c3VhbCBjYXJlIHByb3ZpZGVyIHdoZW4gcHJlc2NyaXB0aW9uIGRvbmUgZm9yIHJlYXNzZXNzbWVudC4ifSx7InNwZWNpYWx0eSI6IkNhcmRpYWMgJiBIZW1lIiwibWVkIjoiUGVyaW5kb3ByaWwiLCJicmFuZHMiOlsiQ292ZXJzeWwiXSwiaW5kaWNhdGlvbiI6Ikh5cGVydGVuc2lvbiIsImRvc2VfdGV4dCI6IjRtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJPRCIsImR1cmF0aW9uIjoiNCB3ZWVrIiwiZGlzcGVuc2UiOiIyOCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJDaGVjayBibG9vZCBwcmVzc3VyZSAxLTIgdGltZXMgcGVyIGRheSBhbmQgYnJpbmcgYXZlcmFnZSByZWFkaW5nIHRvIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlYXNzZXNzbWVudCB3aXRoaW4gMiB3ZWVrcy4gQXZvaWQgaW4gZmVydGlsZSB3b21lbi4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiY2FyZGlhYyAmIGhlbWUgfCBhZHVsdCB8IGh5cGVydGVuc2lvbiB8IHBlcmluZG9wcmlsIHwgY292ZXJzeWwgfCA0bWcgfCBjaGVjayBibG9vZCBwcmVzc3VyZSAxLTIgdGltZXMgcGVyIGRheSBhbmQgYnJpbmcgYXZlcmFnZSByZWFkaW5nIHRvIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlYXNzZXNzbWVudCB3aXRoaW4gMiB3ZWVrcy4gYXZvaWQgaW4gZmVydGlsZSB3b21lbi4ifSx7InNwZWNpYWx0eSI6IkNhcmRpYWMgJiBIZW1lIiwibWVkIjoiUmFtaXByaWwiLCJicmFuZHMiOlsiQWx0YWNlIl0sImluZGljYXRpb24iOiJIeXBlcnRlbnNpb24iLCJkb3NlX3RleHQiOiIyLjVtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJPRCIsImR1cmF0aW9uIjoiNCB3ZWVrIiwiZGlzcGVuc2UiOiIyOCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJDaGVjayBibG9vZCBwcmVzc3VyZSAxLTIgdGltZXMgcGVyIGRheSBhbmQgYnJpbmcgYXZlcmFnZSByZWFkaW5nIHRvIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlYXNzZXNzbWVudCB3aXRoaW4gMiB3ZWVrcy4gQXZvaWQgaW4gZmVydGlsZSB3b21lbi4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiY2FyZGlhYyAmIGhlbWUgfCBhZHVsdCB8IGh5cGVydGVuc2lvbiB8IHJhbWlwcmlsIHwgYWx0YWNlIHwgMi41bWcgfCBjaGVjayBibG9vZCBwcmVzc3VyZSAxLTIgdGltZXMgcGVyIGRheSBhbmQgYnJpbmcgYXZlcmFnZSByZWFkaW5nIHRvIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlYXNzZXNzbWVudCB3aXRoaW4gMiB3ZWVrcy4gYXZvaWQgaW4gZmVydGlsZSB3b21lbi4ifSx7InNwZWNpYWx0eSI6IkNhcmRpYWMgJiBIZW1lIiwibWVkIjoiQ2FuZGVzYXJ0YW4iLCJicmFuZHMiOlsiQXRhY2FuZCJdLCJpbmRpY2F0aW9uIjoiSHlwZXJ0ZW5zaW9uIiwiZG9zZV90ZXh0IjoiOG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiI0IHdlZWsiLCJkaXNwZW5zZSI6IjI4IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkNoZWNrIGJsb29kIHByZXNzdXJlIDEtMiB0aW1lcyBwZXIgZGF5IGFuZCBicmluZyBhdmVyYWdlIHJlYWRpbmcgdG8gdXN1YWwgY2FyZSBwcm92aWRlciBmb3IgcmVhc3Nlc3NtZW50IHdpdGhpbiAyIHdlZWtzLiBBdm9pZCBpbiBmZXJ0aWxlIHdvbWVuLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJjYXJkaWFjICYgaGVtZSB8IGFkdWx0IHwgaHlwZXJ0ZW5zaW9uIHwgY2FuZGVzYXJ0YW4gfCBhdGFjYW5kIHwgOG1nIHwgY2hlY2sgYmxvb2QgcHJlc3N1cmUgMS0yIHRpbWVzIHBlciBkYXkgYW5kIGJyaW5nIGF2ZXJhZ2UgcmVhZGluZyB0byB1c3VhbCBjYXJlIHByb3ZpZGVyIGZvciByZWFzc2Vzc21lbnQgd2l0aGluIDIgd2Vla3MuIGF2b2lkIGluIGZlcnRpbGUgd29tZW4uIn0seyJzcGVjaWFsdHkiOiJDYXJkaWFjICYgSGVtZSIsIm1lZCI6Ik1ldG9wcm9sb2wiLCJicmFuZHMiOlsiTG9wcmVzb3IiLCJCZXRhbG9jIl0sImluZGljYXRpb24iOiJIeXBlcnRlbnNpb24iLCJkb3NlX3RleHQiOiI1MG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiNCB3ZWVrIiwiZGlzcGVuc2UiOiI1NiB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJDaGVjayBibG9vZCBwcmVzc3VyZSAxLTIgdGltZXMgcGVyIGRheSBhbmQgYnJpbmcgYXZlcmFnZSByZWFkaW5nIHRvIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlYXNzZXNzbWVudCB3aXRoaW4gMiB3ZWVrcy4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiY2FyZGlhYyAmIGhlbWUgfCBhZHVsdCB8IGh5cGVydGVuc2lvbiB8IG1ldG9wcm9sb2wgfCBsb3ByZXNvciBiZXRhbG9jIHwgNTBtZyB8IGNoZWNrIGJsb29kIHByZXNzdXJlIDEtMiB0aW1lcyBwZXIgZGF5IGFuZCBicmluZyBhdmVyYWdlIHJlYWRpbmcgdG8gdXN1YWwgY2FyZSBwcm92aWRlciBmb3IgcmVhc3Nlc3NtZW50IHdpdGhpbiAyIHdlZWtzLiJ9LHsic3BlY2lhbHR5IjoiQ2FyZGlhYyAmIEhlbWUiLCJtZWQiOiJBbWxvZGlwaW5lIiwiYnJhbmRzIjpbIk5vcnZhc2MiXSwiaW5kaWNhdGlvbiI6Ikh5cGVydGVuc2lvbiIsImRvc2VfdGV4dCI6IjVtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJPRCIsImR1cmF0aW9uIjoiNCB3ZWVrIiwiZGlzcGVuc2UiOiIyOCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJDaGVjayBibG9vZCBwcmVzc3VyZSAxLTIgdGltZXMgcGVyIGRheSBhbmQgYnJpbmcgYXZlcmFnZSByZWFkaW5nIHRvIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlYXNzZXNzbWVudCB3aXRoaW4gMiB3ZWVrcy4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiY2FyZGlhYyAmIGhlbWUgfCBhZHVsdCB8IGh5cGVydGVuc2lvbiB8IGFtbG9kaXBpbmUgfCBub3J2YXNjIHwgNW1nIHwgY2hlY2sgYmxvb2QgcHJlc3N1cmUgMS0yIHRpbWVzIHBlciBkYXkgYW5kIGJyaW5nIGF2ZXJhZ2UgcmVhZGluZyB0byB1c3VhbCBjYXJlIHByb3ZpZGVyIGZvciByZWFzc2Vzc21lbnQgd2l0aGluIDIgd2Vla3MuIn0seyJzcGVjaWFsdHkiOiJDYXJkaWFjICYgSGVtZSIsIm1lZCI6IkNobG9ydGhhbGlkb25lIiwiYnJhbmRzIjpbIlRoYWxpdG9uZSJdLCJpbmRpY2F0aW9uIjoiSHlwZXJ0ZW5zaW9uIiwiZG9zZV90ZXh0IjoiMTIuNW1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiI0IHdlZWsiLCJkaXNwZW5zZSI6IjI4IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkNoZWNrIGJsb29kIHByZXNzdXJlIDEtMiB0aW1lcyBwZXIgZGF5IGFuZCBicmluZyBhdmVyYWdlIHJlYWRpbmcgdG8gdXN1YWwgY2FyZSBwcm92aWRlciBmb3IgcmVhc3Nlc3NtZW50IHdpdGhpbiAyIHdlZWtzLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJjYXJkaWFjICYgaGVtZSB8IGFkdWx0IHwgaHlwZXJ0ZW5zaW9uIHwgY2hsb3J0aGFsaWRvbmUgfCB0aGFsaXRvbmUgfCAxMi41bWcgfCBjaGVjayBibG9vZCBwcmVzc3VyZSAxLTIgdGltZXMgcGVyIGRheSBhbmQgYnJpbmcgYXZlcmFnZSByZWFkaW5nIHRvIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlYXNzZXNzbWVudCB3aXRoaW4gMiB3ZWVrcy4ifSx7InNwZWNpYWx0eSI6IkNhcmRpYWMgJiBIZW1lIiwibWVkIjoiQ29sY2hpY2luZSIsImJyYW5kcyI6WyJDb2xjcnlzIl0sImluZGljYXRpb24iOiJQZXJpY2FyZGl0aXMgKHdlaWdodCA8NzBrZykiLCJkb3NlX3RleHQiOiIwLjZtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJPRCIsImR1cmF0aW9uIjoiMiB3ZWVrIiwiZGlzcGVuc2UiOiIyOCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJGb2xsb3cgdXAgd2l0aCB1c3VhbCBjYXJlIHByb3ZpZGVyIGZvciByZWFzc2Vzc21lbnQuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIxIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImNhcmRpYWMgJiBoZW1lIHwgYWR1bHQgfCBwZXJpY2FyZGl0aXMgKHdlaWdodCA8NzBrZykgfCBjb2xjaGljaW5lIHwgY29sY3J5cyB8IDAuNm1nIHwgZm9sbG93IHVwIHdpdGggdXN1YWwgY2FyZSBwcm92aWRlciBmb3IgcmVhc3Nlc3NtZW50LiJ9LHsic3BlY2lhbHR5IjoiQ2FyZGlhYyAmIEhlbWUiLCJtZWQiOiJDb2xjaGljaW5lIiwiYnJhbmRzIjpbIkNvbGNyeXMiXSwiaW5kaWNhdGlvbiI6IlBlcmljYXJkaXRpcyAod2VpZ2h0IFx1MjI2NTcwa2cpIiwiZG9zZV90ZXh0IjoiMC42bWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIyIHdlZWsiLCJkaXNwZW5zZSI6IjI4IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlYXNzZXNzbWVudC4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjEiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiY2FyZGlhYyAmIGhlbWUgfCBhZHVsdCB8IHBlcmljYXJkaXRpcyAod2VpZ2h0IFx1MjI2NTcwa2cpIHwgY29sY2hpY2luZSB8IGNvbGNyeXMgfCAwLjZtZyB8IGZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlYXNzZXNzbWVudC4ifSx7InNwZWNpYWx0eSI6IkNhcmRpYWMgJiBIZW1lIiwibWVkIjoiUG90YXNzaXVtIENobG9yaWRlIEVSIiwiYnJhbmRzIjpbIk1pY3JvLUsiLCJTbG93LUsiLCJLLUR1ciJdLCJpbmRpY2F0aW9uIjoiUG90YXNzaXVtIHJlcGxhY2VtZW50IiwiZG9zZV90ZXh0IjoiMjBtbW9sIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiMyBkYXkiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgYXMgZGlyZWN0ZWQgdG8gbW9uaXRvciBzZXJ1bSBwb3Rhc3NpdW0gbGV2ZWwuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImNhcmRpYWMgJiBoZW1lIHwgYWR1bHQgfCBwb3Rhc3NpdW0gcmVwbGFjZW1lbnQgfCBwb3Rhc3NpdW0gY2hsb3JpZGUgZXIgfCBtaWNyby1rIHNsb3ctayBrLWR1ciB8IDIwbW1vbCB8IGZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgYXMgZGlyZWN0ZWQgdG8gbW9uaXRvciBzZXJ1bSBwb3Rhc3NpdW0gbGV2ZWwuIn0seyJzcGVjaWFsdHkiOiJDYXJkaWFjICYgSGVtZSIsIm1lZCI6IkNhbGNpdW0gQ2FyYm9uYXRlIiwiYnJhbmRzIjpbIkNhbHRyYXRlIl0sImluZGljYXRpb24iOiJDYWxjaXVtIHJlcGxhY2VtZW50IiwiZG9zZV90ZXh0IjoiNTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiI2MCBkYXkiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IlRha2Ugd2l0aCBmb29kLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJjYXJkaWFjICYgaGVtZSB8IGFkdWx0IHwgY2FsY2l1bSByZXBsYWNlbWVudCB8IGNhbGNpdW0gY2FyYm9uYXRlIHwgY2FsdHJhdGUgfCA1MDBtZyB8IHRha2Ugd2l0aCBmb29kLiJ9LHsic3BlY2lhbHR5IjoiQ2FyZGlhYyAmIEhlbWUiLCJtZWQiOiJNYWduZXNpdW0gT3hpZGUiLCJicmFuZHMiOlsiTWFnLU94Il0sImluZGljYXRpb24iOiJNYWduZXNpdW0gcmVwbGFjZW1lbnQiLCJkb3NlX3RleHQiOiI0MDBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJPRCIsImR1cmF0aW9uIjoiNjAgZGF5IiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJUYWtlIHdpdGggZm9vZCBhdCBsZWFzdCAyIGhvdXJzIGFwYXJ0IGZyb20gb3RoZXIgbWVkaWNhdGlvbnMuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImNhcmRpYWMgJiBoZW1lIHwgYWR1bHQgfCBtYWduZXNpdW0gcmVwbGFjZW1lbnQgfCBtYWduZXNpdW0gb3hpZGUgfCBtYWctb3ggfCA0MDBtZyB8IHRha2Ugd2l0aCBmb29kIGF0IGxlYXN0IDIgaG91cnMgYXBhcnQgZnJvbSBvdGhlciBtZWRpY2F0aW9ucy4ifSx7InNwZWNpYWx0eSI6IkNhcmRpYWMgJiBIZW1lIiwibWVkIjoiRmVycm91cyBGdW1hcmF0ZSIsImJyYW5kcyI6WyJQYWxhZmVyIiwiRXVyby1GZXIiXSwiaW5kaWNhdGlvbiI6Iklyb24gcmVwbGFjZW1lbnQiLCJkb3NlX3RleHQiOiIzMDBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxTVdGIiwiZHVyYXRpb24iOiI2MCBkYXkiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IlRha2Ugb24gZW1wdHkgc3RvbWFjaCB3aXRoIHZpdGFtaW4gQy4gQXZvaWQgdGFraW5nIHdpdGggY2FsY2l1bSBjb250YWluaW5nIGZvb2RzLiBGb2xsb3cgdXAgd2l0aCB1c3VhbCBjYXJlIHByb3ZpZGVyIHRvIGFzc2VzcyBvbmdvaW5nIHN1cHBsZW1lbnRhdGlvbiByZXF1aXJlbWVudC4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiY2FyZGlhYyAmIGhlbWUgfCBhZHVsdCB8IGlyb24gcmVwbGFjZW1lbnQgfCBmZXJyb3VzIGZ1bWFyYXRlIHwgcGFsYWZlciBldXJvLWZlciB8IDMwMG1nIHwgdGFrZSBvbiBlbXB0eSBzdG9tYWNoIHdpdGggdml0YW1pbiBjLiBhdm9pZCB0YWtpbmcgd2l0aCBjYWxjaXVtIGNvbnRhaW5pbmcgZm9vZHMuIGZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgdG8gYXNzZXNzIG9uZ29pbmcgc3VwcGxlbWVudGF0aW9uIHJlcXVpcmVtZW50LiJ9LHsic3BlY2lhbHR5IjoiUmVzcGlyYXRvcnkiLCJtZWQiOiJTYWxidXRhbW9sIiwiYnJhbmRzIjpbIlZlbnRvbGluIl0sImluZGljYXRpb24iOiJBc3RobWEvQ09QRCIsImRvc2VfdGV4dCI6IjItNCBwdWZmIiwicm91dGUiOiJpbmhhbGF0aW9uIiwiZnJlcXVlbmN5IjoicTRoIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgTURJIiwicHJuIjoic2hvcnRuZXNzIG9mIGJyZWF0aCIsImZvcm0iOiJNREkiLCJjb21tZW50cyI6IlBoYXJtYWNpc3QgdG8gZ2l2ZSBlZHVjYXRpb24gaWYgbmVlZGVkLiBEaXNwZW5zZSBhZXJvY2hhbWJlciBhcyBhcHByb3ByaWF0ZS4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjEiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoicmVzcGlyYXRvcnkgfCBhZHVsdCB8IGFzdGhtYS9jb3BkIHwgc2FsYnV0YW1vbCB8IHZlbnRvbGluIHwgMi00IHB1ZmYgfCBzaG9ydG5lc3Mgb2YgYnJlYXRoIHwgcGhhcm1hY2lzdCB0byBnaXZlIGVkdWNhdGlvbiBpZiBuZWVkZWQuIGRpc3BlbnNlIGFlcm9jaGFtYmVyIGFzIGFwcHJvcHJpYXRlLiJ9LHsic3BlY2lhbHR5IjoiUmVzcGlyYXRvcnkiLCJtZWQiOiJUaW90cm9waXVtIEJyb21pZGUgKDE4bWNnKSIsImJyYW5kcyI6WyJTcGlyaXZhIl0sImluZGljYXRpb24iOiJBc3RobWEvQ09QRCIsImRvc2VfdGV4dCI6IjEgcHVmZiIsInJvdXRlIjoiaW5oYWxhdGlvbiIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgTURJIiwicHJuIjoiIiwiZm9ybSI6Ik1ESSIsImNvbW1lbnRzIjoiUGhhcm1hY2lzdCB0byBnaXZlIGVkdWNhdGlvbiBpZiBuZWVkZWQuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIxIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6InJlc3BpcmF0b3J5IHwgYWR1bHQgfCBhc3RobWEvY29wZCB8IHRpb3Ryb3BpdW0gYnJvbWlkZSAoMThtY2cpIHwgc3Bpcml2YSB8IDEgcHVmZiB8IHBoYXJtYWNpc3QgdG8gZ2l2ZSBlZHVjYXRpb24gaWYgbmVlZGVkLiJ9LHsic3BlY2lhbHR5IjoiUmVzcGlyYXRvcnkiLCJtZWQiOiJGbHV0aWNhc29uZSBQcm9waW9uYXRlICgxMjVtY2cpIiwiYnJhbmRzIjpbIkZsb3ZlbnQiXSwiaW5kaWNhdGlvbiI6IkFzdGhtYS9DT1BEIiwiZG9zZV90ZXh0IjoiMiBwdWZmIiwicm91dGUiOiJpbmhhbGF0aW9uIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgTURJIiwicHJuIjoiIiwiZm9ybSI6Ik1ESSIsImNvbW1lbnRzIjoiUGhhcm1hY2lzdCB0byBnaXZlIGVkdWNhdGlvbiBpZiBuZWVkZWQuIERpc3BlbnNlIGFlcm9jaGFtYmVyIGFzIGFwcHJvcHJpYXRlLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJyZXNwaXJhdG9yeSB8IGFkdWx0IHwgYXN0aG1hL2NvcGQgfCBmbHV0aWNhc29uZSBwcm9waW9uYXRlICgxMjVtY2cpIHwgZmxvdmVudCB8IDIgcHVmZiB8IHBoYXJtYWNpc3QgdG8gZ2l2ZSBlZHVjYXRpb24gaWYgbmVlZGVkLiBkaXNwZW5zZSBhZXJvY2hhbWJlciBhcyBhcHByb3ByaWF0ZS4ifSx7InNwZWNpYWx0eSI6IlJlc3BpcmF0b3J5IiwibWVkIjoiQnVkZXNvbmlkZSAoMjAwbWNnKSIsImJyYW5kcyI6WyJQdWxtaWNvcnQiXSwiaW5kaWNhdGlvbiI6IkFzdGhtYS9DT1BEIiwiZG9zZV90ZXh0IjoiMiBwdWZmIiwicm91dGUiOiJpbmhhbGF0aW9uIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgTURJIiwicHJuIjoiIiwiZm9ybSI6Ik1ESSIsImNvbW1lbnRzIjoiUGhhcm1hY2lzdCB0byBnaXZlIGVkdWNhdGlvbiBpZiBuZWVkZWQuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIxIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6InJlc3BpcmF0b3J5IHwgYWR1bHQgfCBhc3RobWEvY29wZCB8IGJ1ZGVzb25pZGUgKDIwMG1jZykgfCBwdWxtaWNvcnQgfCAyIHB1ZmYgfCBwaGFybWFjaXN0IHRvIGdpdmUgZWR1Y2F0aW9uIGlmIG5lZWRlZC4ifSx7InNwZWNpYWx0eSI6IlJlc3BpcmF0b3J5IiwibWVkIjoiQnVkZXNvbmlkZSArIEZvcm1vdGVyb2wgKDIwMC82bWNnKSIsImJyYW5kcyI6WyJTeW1iaWNvcnQiXSwiaW5kaWNhdGlvbiI6IkFzdGhtYS9DT1BEIiwiZG9zZV90ZXh0IjoiMiBwdWZmIiwicm91dGUiOiJpbmhhbGF0aW9uIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgTURJIiwicHJuIjoiIiwiZm9ybSI6Ik1ESSIsImNvbW1lbnRzIjoiMS0yIGluaGFsZXMgMS0yIHRpbWVzIGRhaWx5OyB0aXRyYXRlIHRvIGxvd2VzdCBlZmZlY3RpdmUgZG9zYWdlLiBNYXkgaW5jcmVhc2UgdG8gMiBpbmhhbGVzIGV2ZXJ5IDQgaG91cnMgYXMgbmVlZGVkLiBJZiBzZXZlcmUgc3ltcHRvbXMsIHRha2UgMiBpbmhhbGVzIGV2ZXJ5IDIwIG1pbnV0ZXMgZm9yIDMgZG9zZXMgYW5kIHNlZWsgbWVkaWNhbCBhdHRlbnRpb247IE1heCBkb3NlOiAxMiBpbmhhbGVzL2RheS4gTFUgY29kZTogMzMwLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJyZXNwaXJhdG9yeSB8IGFkdWx0IHwgYXN0aG1hL2NvcGQgfCBidWRlc29uaWRlICsgZm9ybW90ZXJvbCAoMjAwLzZtY2cpIHwgc3ltYmljb3J0IHwgMiBwdWZmIHwgMS0yIGluaGFsZXMgMS0yIHRpbWVzIGRhaWx5OyB0aXRyYXRlIHRvIGxvd2VzdCBlZmZlY3RpdmUgZG9zYWdlLiBtYXkgaW5jcmVhc2UgdG8gMiBpbmhhbGVzIGV2ZXJ5IDQgaG91cnMgYXMgbmVlZGVkLiBpZiBzZXZlcmUgc3ltcHRvbXMsIHRha2UgMiBpbmhhbGVzIGV2ZXJ5IDIwIG1pbnV0ZXMgZm9yIDMgZG9zZXMgYW5kIHNlZWsgbWVkaWNhbCBhdHRlbnRpb247IG1heCBkb3NlOiAxMiBpbmhhbGVzL2RheS4gbHUgY29kZTogMzMwLiJ9LHsic3BlY2lhbHR5IjoiUmVzcGlyYXRvcnkiLCJtZWQiOiJGbHV0aWNhc29uZSBQcm9waW9uYXRlICsgU2FsbWV0ZXJvbCAoMTI1bWNnIE1ESSkiLCJicmFuZHMiOlsiQWR2YWlyIl0sImluZGljYXRpb24iOiJBc3RobWEvQ09QRCIsImRvc2VfdGV4dCI6IjIgcHVmZiIsInJvdXRlIjoiaW5oYWxhdGlvbiIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxIE1ESSIsInBybiI6IiIsImZvcm0iOiJNREkiLCJjb21tZW50cyI6IlBoYXJtYWNpc3QgdG8gZ2l2ZSBlZHVjYXRpb24gaWYgbmVlZGVkLiBEaXNwZW5zZSBhZXJvY2hhbWJlciBhcyBhcHByb3ByaWF0ZS4gTFUgY29kZSA9IDMzMC4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjEiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoicmVzcGlyYXRvcnkgfCBhZHVsdCB8IGFzdGhtYS9jb3BkIHwgZmx1dGljYXNvbmUgcHJvcGlvbmF0ZSArIHNhbG1ldGVyb2wgKDEyNW1jZyBtZGkpIHwgYWR2YWlyIHwgMiBwdWZmIHwgcGhhcm1hY2lzdCB0byBnaXZlIGVkdWNhdGlvbiBpZiBuZWVkZWQuIGRpc3BlbnNlIGFlcm9jaGFtYmVyIGFzIGFwcHJvcHJpYXRlLiBsdSBjb2RlID0gMzMwLiJ9LHsic3BlY2lhbHR5IjoiUmVzcGlyYXRvcnkiLCJtZWQiOiJGbHV0aWNhc29uZSBGdXJvYXRlICsgVW1lY2xpZGluaXVtICsgVmlsYW50ZXJvbCIsImJyYW5kcyI6WyJUcmVsZWd5IEVsbGlwdGEiXSwiaW5kaWNhdGlvbiI6IkFzdGhtYS9DT1BEIiwiZG9zZV90ZXh0IjoiMSBwdWZmIiwicm91dGUiOiJpbmhhbGF0aW9uIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMSBNREkiLCJwcm4iOiIiLCJmb3JtIjoiTURJIiwiY29tbWVudHMiOiJQaGFybWFjaXN0IHRvIGdpdmUgZWR1Y2F0aW9uIGlmIG5lZWRlZC4gTFUgY29kZSA9IDU2Ny4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjEiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoicmVzcGlyYXRvcnkgfCBhZHVsdCB8IGFzdGhtYS9jb3BkIHwgZmx1dGljYXNvbmUgZnVyb2F0ZSArIHVtZWNsaWRpbml1bSArIHZpbGFudGVyb2wgfCB0cmVsZWd5IGVsbGlwdGEgfCAxIHB1ZmYgfCBwaGFybWFjaXN0IHRvIGdpdmUgZWR1Y2F0aW9uIGlmIG5lZWRlZC4gbHUgY29kZSA9IDU2Ny4ifSx7InNwZWNpYWx0eSI6IlJlc3BpcmF0b3J5IiwibWVkIjoiQWVyb2NoYW1iZXIiLCJicmFuZHMiOltdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiIiwicm91dGUiOiIiLCJmcmVxdWVuY3kiOiIiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMSBkZXZpY2UiLCJwcm4iOiIiLCJmb3JtIjoiIiwiY29tbWVudHMiOiJQaGFybWFjaXN0IHRvIGdpdmUgZWR1Y2F0aW9uIGlmIG5lZWRlZC4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IiIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJyZXNwaXJhdG9yeSB8IGFkdWx0IHwgYWVyb2NoYW1iZXIgfCBwaGFybWFjaXN0IHRvIGdpdmUgZWR1Y2F0aW9uIGlmIG5lZWRlZC4ifSx7InNwZWNpYWx0eSI6IlJlc3BpcmF0b3J5IiwibWVkIjoiUHJlZG5pc29uZSIsImJyYW5kcyI6WyJEZWx0YXNvbmUiLCJSYXlvcyJdLCJpbmRpY2F0aW9uIjoiQXN0aG1hL0NPUEQiLCJkb3NlX3RleHQiOiI1MG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiI0IGRheSIsImRpc3BlbnNlIjoiNCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJTdGFydCAyNCBob3VycyBhZnRlciBmaXJzdCBkb3NlIGluIEVELiBNb25pdG9yIGJsb29kIGdsdWNvc2UgaWYgZGlhYmV0aWMuIE1heSBjYXVzZSBzdG9tYWNoIGlycml0YXRpb24sIHRha2Ugd2l0aCBmb29kLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJyZXNwaXJhdG9yeSB8IGFkdWx0IHwgYXN0aG1hL2NvcGQgfCBwcmVkbmlzb25lIHwgZGVsdGFzb25lIHJheW9zIHwgNTBtZyB8IHN0YXJ0IDI0IGhvdXJzIGFmdGVyIGZpcnN0IGRvc2UgaW4gZWQuIG1vbml0b3IgYmxvb2QgZ2x1Y29zZSBpZiBkaWFiZXRpYy4gbWF5IGNhdXNlIHN0b21hY2ggaXJyaXRhdGlvbiwgdGFrZSB3aXRoIGZvb2QuIn0seyJzcGVjaWFsdHkiOiJSZXNwaXJhdG9yeSIsIm1lZCI6IkFtb3hpY2lsbGluIiwiYnJhbmRzIjpbIkFtb3hpbCIsIlRyaW1veCJdLCJpbmRpY2F0aW9uIjoiUG5ldW1vbmlhIChubyByaXNrIGZhY3RvcnMgZm9yIGNvbXBsaWNhdGlvbnMpIiwiZG9zZV90ZXh0IjoiMTAwMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IlRJRCIsImR1cmF0aW9uIjoiNSBkYXkiLCJkaXNwZW5zZSI6IjE1IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJyZXNwaXJhdG9yeSB8IGFkdWx0IHwgcG5ldW1vbmlhIChubyByaXNrIGZhY3RvcnMgZm9yIGNvbXBsaWNhdGlvbnMpIHwgYW1veGljaWxsaW4gfCBhbW94aWwgdHJpbW94IHwgMTAwMG1nIn0seyJzcGVjaWFsdHkiOiJSZXNwaXJhdG9yeSIsIm1lZCI6IkFtb3gtQ2xhdiAoODc1LzEyNW1nKSIsImJyYW5kcyI6WyJDbGF2dWxpbiIsIkF1Z21lbnRpbiJdLCJpbmRpY2F0aW9uIjoiUG5ldW1vbmlhIChyaXNrIGZhY3RvcnMgZm9yIGNvbXBsaWNhdGlvbnMpIiwiZG9zZV90ZXh0IjoiMSB0YWIiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiI1IGRheSIsImRpc3BlbnNlIjoiMTAgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6InJlc3BpcmF0b3J5IHwgYWR1bHQgfCBwbmV1bW9uaWEgKHJpc2sgZmFjdG9ycyBmb3IgY29tcGxpY2F0aW9ucykgfCBhbW94LWNsYXYgKDg3NS8xMjVtZykgfCBjbGF2dWxpbiBhdWdtZW50aW4gfCAxIHRhYiJ9LHsic3BlY2lhbHR5IjoiUmVzcGlyYXRvcnkiLCJtZWQiOiJBeml0aHJvbXljaW4iLCJicmFuZHMiOlsiWml0aHJvbWF4IiwiWm1heCJdLCJpbmRpY2F0aW9uIjoiUG5ldW1vbmlhIChyaXNrIGZhY3RvcnMgZm9yIGNvbXBsaWNhdGlvbnMsIG5vdCBpbXByb3Zpbmcgb24gZmlyc3QtbGluZSBhZ2VudHMpIiwiZG9zZV90ZXh0IjoiNTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiI1IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJyZXNwaXJhdG9yeSB8IGFkdWx0IHwgcG5ldW1vbmlhIChyaXNrIGZhY3RvcnMgZm9yIGNvbXBsaWNhdGlvbnMsIG5vdCBpbXByb3Zpbmcgb24gZmlyc3QtbGluZSBhZ2VudHMpIHwgYXppdGhyb215Y2luIHwgeml0aHJvbWF4IHptYXggfCA1MDBtZyJ9LHsic3BlY2lhbHR5IjoiUmVzcGlyYXRvcnkiLCJtZWQiOiJDZWZ1cm94aW1lIiwiYnJhbmRzIjpbIkNlZnRpbiJdLCJpbmRpY2F0aW9uIjoiUG5ldW1vbmlhIChwZW5pY2lsbGluIGFsbGVyZ3kpIiwiZG9zZV90ZXh0IjoiNTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiI1IGRheSIsImRpc3BlbnNlIjoiMTAgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6InJlc3BpcmF0b3J5IHwgYWR1bHQgfCBwbmV1bW9uaWEgKHBlbmljaWxsaW4gYWxsZXJneSkgfCBjZWZ1cm94aW1lIHwgY2VmdGluIHwgNTAwbWcifSx7InNwZWNpYWx0eSI6IlJlc3BpcmF0b3J5IiwibWVkIjoiTW94aWZsb3hhY2luIiwiYnJhbmRzIjpbIkF2ZWxveCJdLCJpbmRpY2F0aW9uIjoiUG5ldW1vbmlhIChwZW5pY2lsbGluIGFuYXBoeWxheGlzKSIsImRvc2VfdGV4dCI6IjQwMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiI1IGRheSIsImRpc3BlbnNlIjoiNSB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoicmVzcGlyYXRvcnkgfCBhZHVsdCB8IHBuZXVtb25pYSAocGVuaWNpbGxpbiBhbmFwaHlsYXhpcykgfCBtb3hpZmxveGFjaW4gfCBhdmVsb3ggfCA0MDBtZyJ9LHsic3BlY2lhbHR5IjoiUmVzcGlyYXRvcnkiLCJtZWQiOiJEZXh0cm9tZXRob3JwaGFuIiwiYnJhbmRzIjpbIkJlbnlsaW4iLCJSb2JpdHVzc2luIiwiQnVja2xleSdzIl0sImluZGljYXRpb24iOiJDb3VnaCIsImRvc2VfdGV4dCI6IjEwLTIwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicTRoIiwiZHVyYXRpb24iOiIyIHdlZWsiLCJkaXNwZW5zZSI6IjEwMG1sIiwicHJuIjoiY291Z2giLCJmb3JtIjoic3lydXAiLCJjb21tZW50cyI6Ik1heGltdW0gMTIwbWcgcGVyIDI0IGhvdXJzLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJyZXNwaXJhdG9yeSB8IGFkdWx0IHwgY291Z2ggfCBkZXh0cm9tZXRob3JwaGFuIHwgYmVueWxpbiByb2JpdHVzc2luIGJ1Y2tsZXkncyB8IDEwLTIwbWcgfCBjb3VnaCB8IG1heGltdW0gMTIwbWcgcGVyIDI0IGhvdXJzLiJ9LHsic3BlY2lhbHR5IjoiUmVzcGlyYXRvcnkiLCJtZWQiOiJIeWRyb2NvZG9uZSArIEhvbWF0cm9waW4iLCJicmFuZHMiOlsiSHljb2RhbiJdLCJpbmRpY2F0aW9uIjoiQ291Z2giLCJkb3NlX3RleHQiOiI1bWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicTQtNmgiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiNzVtbCIsInBybiI6ImNvdWdoIiwiZm9ybSI6InN1c3BlbnNpb24iLCJjb21tZW50cyI6Ikh5ZHJvY29kb25lIDFtZy9tbCBvcmFsIGxpcXVpZC4gTWF4aW11bSBkb3NlID0gMzBtZy9kYXkuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6InJlc3BpcmF0b3J5IHwgYWR1bHQgfCBjb3VnaCB8IGh5ZHJvY29kb25lICsgaG9tYXRyb3BpbiB8IGh5Y29kYW4gfCA1bWcgfCBjb3VnaCB8IGh5ZHJvY29kb25lIDFtZy9tbCBvcmFsIGxpcXVpZC4gbWF4aW11bSBkb3NlID0gMzBtZy9kYXkuIn0seyJzcGVjaWFsdHkiOiJSZXNwaXJhdG9yeSIsIm1lZCI6Ik5pcm1hdHJlbHZpciArIFJpdG9uYXZpciIsImJyYW5kcyI6WyJQYXhsb3ZpZCJdLCJpbmRpY2F0aW9uIjoiTWlsZC1tb2RlcmF0ZSBDT1ZJRCAod2l0aG91dCByZW5hbC9oZXBhdGljIGltcGFpcm1lbnQpIiwiZG9zZV90ZXh0IjoiIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IiIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiI1IGRheSIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IlN0YXJ0IHdpdGhpbiA1IGRheXMgb2Ygc3ltcHRvbSBvbnNldC4gTmlybWF0cmVsdmlyIDMwMG1nIGFuZCByaXRvbmF2aXIgMTAwbWcgUE8gQklEIGZvciA1IGRheXMuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6InJlc3BpcmF0b3J5IHwgYWR1bHQgfCBtaWxkLW1vZGVyYXRlIGNvdmlkICh3aXRob3V0IHJlbmFsL2hlcGF0aWMgaW1wYWlybWVudCkgfCBuaXJtYXRyZWx2aXIgKyByaXRvbmF2aXIgfCBwYXhsb3ZpZCB8IHN0YXJ0IHdpdGhpbiA1IGRheXMgb2Ygc3ltcHRvbSBvbnNldC4gbmlybWF0cmVsdmlyIDMwMG1nIGFuZCByaXRvbmF2aXIgMTAwbWcgcG8gYmlkIGZvciA1IGRheXMuIn0seyJzcGVjaWFsdHkiOiJSZXNwaXJhdG9yeSIsIm1lZCI6IlNhbGJ1dGFtb2wiLCJicmFuZHMiOlsiVmVudG9saW4iXSwiaW5kaWNhdGlvbiI6IkFzdGhtYSByZWxpZXZlciIsImRvc2VfdGV4dCI6IjEtMiBwdWZmIiwicm91dGUiOiJpbmhhbGF0aW9uIiwiZnJlcXVlbmN5IjoicTJoIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgTURJIiwicHJuIjoic2hvcnRuZXNzIG9mIGJyZWF0aCIsImZvcm0iOiJNREkiLCJjb21tZW50cyI6IlBoYXJtYWNpc3QgdG8gZ2l2ZSBlZHVjYXRpb24gaWYgbmVlZGVkLiBEaXNwZW5zZSBhZXJvY2hhbWJlciBpZiBwYXRpZW50IGRvZXMgbm90IGhhdmUgb25lLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjEiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoicmVzcGlyYXRvcnkgfCBwZWRpYXRyaWMgfCBhc3RobWEgcmVsaWV2ZXIgfCBzYWxidXRhbW9sIHwgdmVudG9saW4gfCAxLTIgcHVmZiB8IHNob3J0bmVzcyBvZiBicmVhdGggfCBwaGFybWFjaXN0IHRvIGdpdmUgZWR1Y2F0aW9uIGlmIG5lZWRlZC4gZGlzcGVuc2UgYWVyb2NoYW1iZXIgaWYgcGF0aWVudCBkb2VzIG5vdCBoYXZlIG9uZS4ifSx7InNwZWNpYWx0eSI6IlJlc3BpcmF0b3J5IiwibWVkIjoiRmx1dGljYXNvbmUgUHJvcGlvbmF0ZSAoNTBtY2cpIiwiYnJhbmRzIjpbIkZsb3ZlbnQiXSwiaW5kaWNhdGlvbiI6IkFzdGhtYSBtYWludGVuYW5jZSAoYWdlIDQtMTEgeWVhcnMpIiwiZG9zZV90ZXh0IjoiMSBwdWZmIiwicm91dGUiOiJpbmhhbGF0aW9uIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgTURJIiwicHJuIjoiIiwiZm9ybSI6Ik1ESSIsImNvbW1lbnRzIjoiUGhhcm1hY2lzdCB0byBnaXZlIGVkdWNhdGlvbiBpZiBuZWVkZWQuIERpc3BlbnNlIGFlcm9jaGFtYmVyIGFzIGFwcHJvcHJpYXRlLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjEiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoicmVzcGlyYXRvcnkgfCBwZWRpYXRyaWMgfCBhc3RobWEgbWFpbnRlbmFuY2UgKGFnZSA0LTExIHllYXJzKSB8IGZsdXRpY2Fzb25lIHByb3Bpb25hdGUgKDUwbWNnKSB8IGZsb3ZlbnQgfCAxIHB1ZmYgfCBwaGFybWFjaXN0IHRvIGdpdmUgZWR1Y2F0aW9uIGlmIG5lZWRlZC4gZGlzcGVuc2UgYWVyb2NoYW1iZXIgYXMgYXBwcm9wcmlhdGUuIn0seyJzcGVjaWFsdHkiOiJSZXNwaXJhdG9yeSIsIm1lZCI6IkZsdXRpY2Fzb25lIFByb3Bpb25hdGUgKDEwMG1jZykiLCJicmFuZHMiOlsiRmxvdmVudCJdLCJpbmRpY2F0aW9uIjoiQXN0aG1hIG1haW50ZW5hbmNlIChhZ2UgXHUyMjY1MTIgeWVhcnMpIiwiZG9zZV90ZXh0IjoiMSBwdWZmIiwicm91dGUiOiJpbmhhbGF0aW9uIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgTURJIiwicHJuIjoiIiwiZm9ybSI6Ik1ESSIsImNvbW1lbnRzIjoiUGhhcm1hY2lzdCB0byBnaXZlIGVkdWNhdGlvbiBpZiBuZWVkZWQuIERpc3BlbnNlIGFlcm9jaGFtYmVyIGFzIGFwcHJvcHJpYXRlLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjEiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoicmVzcGlyYXRvcnkgfCBwZWRpYXRyaWMgfCBhc3RobWEgbWFpbnRlbmFuY2UgKGFnZSBcdTIyNjUxMiB5ZWFycykgfCBmbHV0aWNhc29uZSBwcm9waW9uYXRlICgxMDBtY2cpIHwgZmxvdmVudCB8IDEgcHVmZiB8IHBoYXJtYWNpc3QgdG8gZ2l2ZSBlZHVjYXRpb24gaWYgbmVlZGVkLiBkaXNwZW5zZSBhZXJvY2hhbWJlciBhcyBhcHByb3ByaWF0ZS4ifSx7InNwZWNpYWx0eSI6IlJlc3BpcmF0b3J5IiwibWVkIjoiQnVkZXNvbmlkZSAoMjAwbWNnKSIsImJyYW5kcyI6WyJQdWxtaWNvcnQiXSwiaW5kaWNhdGlvbiI6IkFzdGhtYSBtYWludGVuYW5jZSAoYWdlIDYtMTEgeWVhcnMpIiwiZG9zZV90ZXh0IjoiMSBwdWZmIiwicm91dGUiOiJpbmhhbGF0aW9uIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgTURJIiwicHJuIjoiIiwiZm9ybSI6Ik1ESSIsImNvbW1lbnRzIjoiUGhhcm1hY2lzdCB0byBnaXZlIGVkdWNhdGlvbiBpZiBuZWVkZWQuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJyZXNwaXJhdG9yeSB8IHBlZGlhdHJpYyB8IGFzdGhtYSBtYWludGVuYW5jZSAoYWdlIDYtMTEgeWVhcnMpIHwgYnVkZXNvbmlkZSAoMjAwbWNnKSB8IHB1bG1pY29ydCB8IDEgcHVmZiB8IHBoYXJtYWNpc3QgdG8gZ2l2ZSBlZHVjYXRpb24gaWYgbmVlZGVkLiJ9LHsic3BlY2lhbHR5IjoiUmVzcGlyYXRvcnkiLCJtZWQiOiJCdWRlc29uaWRlICgyMDBtY2cpIiwiYnJhbmRzIjpbIlB1bG1pY29ydCJdLCJpbmRpY2F0aW9uIjoiQXN0aG1hIG1haW50ZW5hbmNlIChhZ2UgXHUyMjY1MTIgeWVhcnMpIiwiZG9zZV90ZXh0IjoiMiBwdWZmIiwicm91dGUiOiJpbmhhbGF0aW9uIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgTURJIiwicHJuIjoiIiwiZm9ybSI6Ik1ESSIsImNvbW1lbnRzIjoiUGhhcm1hY2lzdCB0byBnaXZlIGVkdWNhdGlvbiBpZiBuZWVkZWQuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJyZXNwaXJhdG9yeSB8IHBlZGlhdHJpYyB8IGFzdGhtYSBtYWludGVuYW5jZSAoYWdlIFx1MjI2NTEyIHllYXJzKSB8IGJ1ZGVzb25pZGUgKDIwMG1jZykgfCBwdWxtaWNvcnQgfCAyIHB1ZmYgfCBwaGFybWFjaXN0IHRvIGdpdmUgZWR1Y2F0aW9uIGlmIG5lZWRlZC4ifSx7InNwZWNpYWx0eSI6IlJlc3BpcmF0b3J5IiwibWVkIjoiQnVkZXNvbmlkZSArIEZvcm1vdGVyb2wgKDIwMC82bWNnKSIsImJyYW5kcyI6WyJTeW1iaWNvcnQiXSwiaW5kaWNhdGlvbiI6IkFzdGhtYSByZWxpZXZlci9tYWludGVuYW5jZSAoYWdlIFx1MjI2NTQgeWVhcnMpIiwiZG9zZV90ZXh0IjoiIiwicm91dGUiOiJpbmhhbGF0aW9uIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgTURJIiwicHJuIjoiIiwiZm9ybSI6Ik1ESSIsImNvbW1lbnRzIjoiMS0yIGluaGFsYXRpb25zIG9uY2Ugb3IgdHdpY2UgZGFpbHk7IHRpdHJhdGUgdG8gbG93ZXN0IGVmZmVjdGl2ZSBkb3NhZ2UgdG8gbWFpbnRhaW4gY29udHJvbC4gTWF5IGluY3JlYXNlIHRvIDQgaW5oYWxhdGlvbnMgdHdpY2UgZGFpbHkgYXMgdGVtcG9yYXJ5IHRyZWF0bWVudCBpbiBwZXJpb2RzIG9mIHdvcnNlbmluZyBzeW1wdG9tczsgTWF4aW11bSBkYWlseSBkb3NlOiA4IGluaGFsYXRpb25zL2RheS4gTFUgY29kZTogMzMwLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjEiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoicmVzcGlyYXRvcnkgfCBwZWRpYXRyaWMgfCBhc3RobWEgcmVsaWV2ZXIvbWFpbnRlbmFuY2UgKGFnZSBcdTIyNjU0IHllYXJzKSB8IGJ1ZGVzb25pZGUgKyBmb3Jtb3Rlcm9sICgyMDAvNm1jZykgfCBzeW1iaWNvcnQgfCAxLTIgaW5oYWxhdGlvbnMgb25jZSBvciB0d2ljZSBkYWlseTsgdGl0cmF0ZSB0byBsb3dlc3QgZWZmZWN0aXZlIGRvc2FnZSB0byBtYWludGFpbiBjb250cm9sLiBtYXkgaW5jcmVhc2UgdG8gNCBpbmhhbGF0aW9ucyB0d2ljZSBkYWlseSBhcyB0ZW1wb3JhcnkgdHJlYXRtZW50IGluIHBlcmlvZHMgb2Ygd29yc2VuaW5nIHN5bXB0b21zOyBtYXhpbXVtIGRhaWx5IGRvc2U6IDggaW5oYWxhdGlvbnMvZGF5LiBsdSBjb2RlOiAzMzAuIn0seyJzcGVjaWFsdHkiOiJSZXNwaXJhdG9yeSIsIm1lZCI6IkZsdXRpY2Fzb25lIFByb3Bpb25hdGUgKyBTYWxtZXRlcm9sICgxMjVtY2cgTURJKSIsImJyYW5kcyI6WyJBZHZhaXIiXSwiaW5kaWNhdGlvbiI6IkFzdGhtYSBtYWludGVuYW5jZSAoYWdlIFx1MjI2NTEyIHllYXJzKSIsImRvc2VfdGV4dCI6IjIgcHVmZiIsInJvdXRlIjoiaW5oYWxhdGlvbiIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxIE1ESSIsInBybiI6IiIsImZvcm0iOiJNREkiLCJjb21tZW50cyI6IlBoYXJtYWNpc3QgdG8gZ2l2ZSBlZHVjYXRpb24gaWYgbmVlZGVkLiBEaXNwZW5zZSBhZXJvY2hhbWJlciBhcyBhcHByb3ByaWF0ZS4gTFUgY29kZSA9IDMzMC4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIxIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6InJlc3BpcmF0b3J5IHwgcGVkaWF0cmljIHwgYXN0aG1hIG1haW50ZW5hbmNlIChhZ2UgXHUyMjY1MTIgeWVhcnMpIHwgZmx1dGljYXNvbmUgcHJvcGlvbmF0ZSArIHNhbG1ldGVyb2wgKDEyNW1jZyBtZGkpIHwgYWR2YWlyIHwgMiBwdWZmIHwgcGhhcm1hY2lzdCB0byBnaXZlIGVkdWNhdGlvbiBpZiBuZWVkZWQuIGRpc3BlbnNlIGFlcm9jaGFtYmVyIGFzIGFwcHJvcHJpYXRlLiBsdSBjb2RlID0gMzMwLiJ9LHsic3BlY2lhbHR5IjoiUmVzcGlyYXRvcnkiLCJtZWQiOiJBZXJvY2hhbWJlciIsImJyYW5kcyI6W10sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIiLCJyb3V0ZSI6IiIsImZyZXF1ZW5jeSI6IiIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxIGRldmljZSIsInBybiI6IiIsImZvcm0iOiIiLCJjb21tZW50cyI6IlBoYXJtYWNpc3QgdG8gZ2l2ZSBlZHVjYXRpb24gaWYgbmVlZGVkLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IiIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJyZXNwaXJhdG9yeSB8IHBlZGlhdHJpYyB8IGFlcm9jaGFtYmVyIHwgcGhhcm1hY2lzdCB0byBnaXZlIGVkdWNhdGlvbiBpZiBuZWVkZWQuIn0seyJzcGVjaWFsdHkiOiJSZXNwaXJhdG9yeSIsIm1lZCI6IkRleGFtZXRoYXNvbmUiLCJicmFuZHMiOlsiRGVjYWRyb24iLCJEZXhhc29uIl0sImluZGljYXRpb24iOiJBc3RobWEgZXhhY2VyYmF0aW9uIiwiZG9zZV90ZXh0IjoiMC42bWcva2cvZG9zZSIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJvbmNlIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgZG9zZSIsInBybiI6IiIsImZvcm0iOiJzb2x1dGlvbiIsImNvbW1lbnRzIjoiTWF4aW11bSBkb3NlID0gMTZtZy4gR2l2ZSAyNC0zNiBob3VycyBhZnRlciBmaXJzdCBkb3NlIGluIEVELiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOnRydWUsImRvc2VfcGVyX2tnX21nIjowLjYsIm1heF9kb3NlX21nIjoxNi4wLCJzZWFyY2hfdGV4dCI6InJlc3BpcmF0b3J5IHwgcGVkaWF0cmljIHwgYXN0aG1hIGV4YWNlcmJhdGlvbiB8IGRleGFtZXRoYXNvbmUgfCBkZWNhZHJvbiBkZXhhc29uIHwgMC42bWcva2cvZG9zZSB8IG1heGltdW0gZG9zZSA9IDE2bWcuIGdpdmUgMjQtMzYgaG91cnMgYWZ0ZXIgZmlyc3QgZG9zZSBpbiBlZC4ifSx7InNwZWNpYWx0eSI6IlJlc3BpcmF0b3J5IiwibWVkIjoiQW1veGljaWxsaW4iLCJicmFuZHMiOlsiQW1veGlsIiwiVHJpbW94Il0sImluZGljYXRpb24iOiJQbmV1bW9uaWEiLCJkb3NlX3RleHQiOiI0NW1nL2tnL2Rvc2UiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicTEyaCIsImR1cmF0aW9uIjoiNSBkYXkiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJzdXNwZW5zaW9uIiwiY29tbWVudHMiOiI5MG1nL2tnL2RheS4gTWF4aW11bSBkb3NlID0gNGcvZGF5LiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOnRydWUsImRvc2VfcGVyX2tnX21nIjo0NS4wLCJtYXhfZG9zZV9tZyI6MjAwMC4wLCJzZWFyY2hfdGV4dCI6InJlc3BpcmF0b3J5IHwgcGVkaWF0cmljIHwgcG5ldW1vbmlhIHwgYW1veGljaWxsaW4gfCBhbW94aWwgdHJpbW94IHwgNDVtZy9rZy9kb3NlIHwgOTBtZy9rZy9kYXkuIG1heGltdW0gZG9zZSA9IDRnL2RheS4ifSx7InNwZWNpYWx0eSI6IlJlc3BpcmF0b3J5IiwibWVkIjoiQW1veC1DbGF2ICg2MDBtZy80Mi45bWcpIiwiYnJhbmRzIjpbIkNsYXZ1bGluIiwiQXVnbWVudGluIl0sImluZGljYXRpb24iOiJQbmV1bW9uaWEiLCJkb3NlX3RleHQiOiI0NW1nL2tnL2Rvc2UiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicTEyaCIsImR1cmF0aW9uIjoiNSBkYXkiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJzdXNwZW5zaW9uIiwiY29tbWVudHMiOiI5MG1nIGFtb3gva2cvZGF5LiBNYXhpbXVtIGRvc2UgPSA0ZyBhbW94L2RheS4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjp0cnVlLCJkb3NlX3Blcl9rZ19tZyI6NDUuMCwibWF4X2Rvc2VfbWciOjIwMDAuMCwic2VhcmNoX3RleHQiOiJyZXNwaXJhdG9yeSB8IHBlZGlhdHJpYyB8IHBuZXVtb25pYSB8IGFtb3gtY2xhdiAoNjAwbWcvNDIuOW1nKSB8IGNsYXZ1bGluIGF1Z21lbnRpbiB8IDQ1bWcva2cvZG9zZSB8IDkwbWcgYW1veC9rZy9kYXkuIG1heGltdW0gZG9zZSA9IDRnIGFtb3gvZGF5LiJ9LHsic3BlY2lhbHR5IjoiUmVzcGlyYXRvcnkiLCJtZWQiOiJBeml0aHJvbXljaW4iLCJicmFuZHMiOlsiWml0aHJvbWF4IiwiWm1heCJdLCJpbmRpY2F0aW9uIjoiUG5ldW1vbmlhIiwiZG9zZV90ZXh0IjoiNW1nL2tnL2Rvc2UiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoic3VzcGVuc2lvbiIsImNvbW1lbnRzIjoiMTBtZy9rZyBvbmNlIG9uIGRheSAxIChtYXggNTAwbWcvZG9zZSksIHRoZW4gNW1nL2tnL2Rvc2Ugb25jZSBkYWlseSBvbiBkYXlzIDItNSAobWF4IDI1MG1nL2Rvc2UpLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoicmVzcGlyYXRvcnkgfCBwZWRpYXRyaWMgfCBwbmV1bW9uaWEgfCBheml0aHJvbXljaW4gfCB6aXRocm9tYXggem1heCB8IDVtZy9rZy9kb3NlIHwgMTBtZy9rZyBvbmNlIG9uIGRheSAxIChtYXggNTAwbWcvZG9zZSksIHRoZW4gNW1nL2tnL2Rvc2Ugb25jZSBkYWlseSBvbiBkYXlzIDItNSAobWF4IDI1MG1nL2Rvc2UpLiJ9LHsic3BlY2lhbHR5IjoiUmVzcGlyYXRvcnkiLCJtZWQiOiJDZWZwcm96aWwiLCJicmFuZHMiOlsiQ2VmemlsIl0sImluZGljYXRpb24iOiJQbmV1bW9uaWEgKHBlbmljaWxsaW4gYWxsZXJneSkiLCJkb3NlX3RleHQiOiIxNW1nL2tnL2Rvc2UiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicTEyaCIsImR1cmF0aW9uIjoiNSBkYXkiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJzdXNwZW5zaW9uIiwiY29tbWVudHMiOiIzMG1nL2tnL2RheS4gTWF4aW11bSBkb3NlID0gNTAwbWcvZG9zZS4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjp0cnVlLCJkb3NlX3Blcl9rZ19tZyI6MTUuMCwibWF4X2Rvc2VfbWciOjUwMC4wLCJzZWFyY2hfdGV4dCI6InJlc3BpcmF0b3J5IHwgcGVkaWF0cmljIHwgcG5ldW1vbmlhIChwZW5pY2lsbGluIGFsbGVyZ3kpIHwgY2VmcHJvemlsIHwgY2VmemlsIHwgMTVtZy9rZy9kb3NlIHwgMzBtZy9rZy9kYXkuIG1heGltdW0gZG9zZSA9IDUwMG1nL2Rvc2UuIn0seyJzcGVjaWFsdHkiOiJSZXNwaXJhdG9yeSIsIm1lZCI6IkNsaW5kYW15Y2luIiwiYnJhbmRzIjpbIkRhbGFjaW4gQyIsIkNsZW9jaW4iXSwiaW5kaWNhdGlvbiI6IlBuZXVtb25pYSAocGVuaWNpbGxpbiBhbmFwaHlsYXhpcykiLCJkb3NlX3RleHQiOiIxMG1nL2tnL2Rvc2UiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiVElEIiwiZHVyYXRpb24iOiI1IGRheSIsImRpc3BlbnNlIjoiIiwicHJuIjoiIiwiZm9ybSI6InNvbHV0aW9uIiwiY29tbWVudHMiOiIzMG1nL2tnL2RheS4gTWF4aW11bSBkb3NlID0gMTgwMG1nL2RheSBvciA2MDBtZy9kb3NlLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOnRydWUsImRvc2VfcGVyX2tnX21nIjoxMC4wLCJtYXhfZG9zZV9tZyI6NjAwLjAsInNlYXJjaF90ZXh0IjoicmVzcGlyYXRvcnkgfCBwZWRpYXRyaWMgfCBwbmV1bW9uaWEgKHBlbmljaWxsaW4gYW5hcGh5bGF4aXMpIHwgY2xpbmRhbXljaW4gfCBkYWxhY2luIGMgY2xlb2NpbiB8IDEwbWcva2cvZG9zZSB8IDMwbWcva2cvZGF5LiBtYXhpbXVtIGRvc2UgPSAxODAwbWcvZGF5IG9yIDYwMG1nL2Rvc2UuIn0seyJzcGVjaWFsdHkiOiJHSSIsIm1lZCI6IkZhbW90aWRpbmUiLCJicmFuZHMiOlsiUGVwY2lkIl0sImluZGljYXRpb24iOiJHRVJEIChhY2lkIHJlZmx1eCkiLCJkb3NlX3RleHQiOiIxMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiNCB3ZWVrIiwiZGlzcGVuc2UiOiI1NiB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJGb2xsb3cgdXAgd2l0aCB1c3VhbCBjYXJlIHByb3ZpZGVyIGluIDQgd2Vla3MgZm9yIHJlYXNzZXNzbWVudC4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZ2kgfCBhZHVsdCB8IGdlcmQgKGFjaWQgcmVmbHV4KSB8IGZhbW90aWRpbmUgfCBwZXBjaWQgfCAxMG1nIHwgZm9sbG93IHVwIHdpdGggdXN1YWwgY2FyZSBwcm92aWRlciBpbiA0IHdlZWtzIGZvciByZWFzc2Vzc21lbnQuIn0seyJzcGVjaWFsdHkiOiJHSSIsIm1lZCI6IlJhYmVwcmF6b2xlIiwiYnJhbmRzIjpbIlBhcmlldCIsIkFjaXBoZXgiXSwiaW5kaWNhdGlvbiI6IkdFUkQgKGFjaWQgcmVmbHV4KSIsImRvc2VfdGV4dCI6IjIwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicUFNIiwiZHVyYXRpb24iOiI0IHdlZWsiLCJkaXNwZW5zZSI6IjI4IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgaW4gNCB3ZWVrcyBmb3IgcmVhc3Nlc3NtZW50LiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJnaSB8IGFkdWx0IHwgZ2VyZCAoYWNpZCByZWZsdXgpIHwgcmFiZXByYXpvbGUgfCBwYXJpZXQgYWNpcGhleCB8IDIwbWcgfCBmb2xsb3cgdXAgd2l0aCB1c3VhbCBjYXJlIHByb3ZpZGVyIGluIDQgd2Vla3MgZm9yIHJlYXNzZXNzbWVudC4ifSx7InNwZWNpYWx0eSI6IkdJIiwibWVkIjoiUGFudG9wcmF6b2xlIiwiYnJhbmRzIjpbIlBhbnRvbG9jIiwiUHJvdG9uaXgiLCJUZWN0YSJdLCJpbmRpY2F0aW9uIjoiR0VSRCAoYWNpZCByZWZsdXgpIiwiZG9zZV90ZXh0IjoiNDBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJPRCIsImR1cmF0aW9uIjoiNCB3ZWVrIiwiZGlzcGVuc2UiOiIyOCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJGb2xsb3cgdXAgd2l0aCB1c3VhbCBjYXJlIHByb3ZpZGVyIGluIDQtOCB3ZWVrcyBmb3IgcmVhc3Nlc3NtZW50LiBMVSBjb2RlID0gMjkzLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJnaSB8IGFkdWx0IHwgZ2VyZCAoYWNpZCByZWZsdXgpIHwgcGFudG9wcmF6b2xlIHwgcGFudG9sb2MgcHJvdG9uaXggdGVjdGEgfCA0MG1nIHwgZm9sbG93IHVwIHdpdGggdXN1YWwgY2FyZSBwcm92aWRlciBpbiA0LTggd2Vla3MgZm9yIHJlYXNzZXNzbWVudC4gbHUgY29kZSA9IDI5My4ifSx7InNwZWNpYWx0eSI6IkdJIiwibWVkIjoiT21lcHJhem9sZSIsImJyYW5kcyI6WyJMb3NlYyIsIlByaWxvc2VjIl0sImluZGljYXRpb24iOiJHRVJEIChhY2lkIHJlZmx1eCkiLCJkb3NlX3RleHQiOiIyMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiI0IHdlZWsiLCJkaXNwZW5zZSI6IjI4IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgaW4gNC04IHdlZWtzIGZvciByZWFzc2Vzc21lbnQuIExVIGNvZGUgPSAyOTMuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIxIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImdpIHwgYWR1bHQgfCBnZXJkIChhY2lkIHJlZmx1eCkgfCBvbWVwcmF6b2xlIHwgbG9zZWMgcHJpbG9zZWMgfCAyMG1nIHwgZm9sbG93IHVwIHdpdGggdXN1YWwgY2FyZSBwcm92aWRlciBpbiA0LTggd2Vla3MgZm9yIHJlYXNzZXNzbWVudC4gbHUgY29kZSA9IDI5My4ifSx7InNwZWNpYWx0eSI6IkdJIiwibWVkIjoiU3VjcmFsZmF0ZSIsImJyYW5kcyI6WyJDYXJhZmF0ZSJdLCJpbmRpY2F0aW9uIjoiUFVEIChwZXB0aWMgdWxjZXIgZGlzZWFzZSkiLCJkb3NlX3RleHQiOiIxZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJRSUQiLCJkdXJhdGlvbiI6IjQgd2VlayIsImRpc3BlbnNlIjoiMTEyIHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgaW4gNC04IHdlZWtzIGZvciByZWFzc2Vzc21lbnQuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIxIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImdpIHwgYWR1bHQgfCBwdWQgKHBlcHRpYyB1bGNlciBkaXNlYXNlKSB8IHN1Y3JhbGZhdGUgfCBjYXJhZmF0ZSB8IDFnIHwgZm9sbG93IHVwIHdpdGggdXN1YWwgY2FyZSBwcm92aWRlciBpbiA0LTggd2Vla3MgZm9yIHJlYXNzZXNzbWVudC4ifSx7InNwZWNpYWx0eSI6IkdJIiwibWVkIjoiU3VjcmFsZmF0ZSIsImJyYW5kcyI6WyJDYXJhZmF0ZSJdLCJpbmRpY2F0aW9uIjoiR0VSRCAoYWNpZCByZWZsdXgpIChpbiBwcmVnbmFuY3kpIiwiZG9zZV90ZXh0IjoiMWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiVElEIiwiZHVyYXRpb24iOiI0IHdlZWsiLCJkaXNwZW5zZSI6Ijg0IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgaW4gNC04IHdlZWtzIGZvciByZWFzc2Vzc21lbnQuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIxIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImdpIHwgYWR1bHQgfCBnZXJkIChhY2lkIHJlZmx1eCkgKGluIHByZWduYW5jeSkgfCBzdWNyYWxmYXRlIHwgY2FyYWZhdGUgfCAxZyB8IGZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgaW4gNC04IHdlZWtzIGZvciByZWFzc2Vzc21lbnQuIn0seyJzcGVjaWFsdHkiOiJHSSIsIm1lZCI6IlBzeWxsaXVtIiwiYnJhbmRzIjpbIk1ldGFtdWNpbCJdLCJpbmRpY2F0aW9uIjoiQ29uc3RpcGF0aW9uIiwiZG9zZV90ZXh0IjoiMSBwYWNrIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IiIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxNCBkb3NlIiwicHJuIjoiY29uc3RpcGF0aW9uIiwiZm9ybSI6InBvd2RlciIsImNvbW1lbnRzIjoiQnVsayBmb3JtaW5nIGFnZW50LiBUYWtlIDEtMiB0aW1lcyBkYWlseSB1bnRpbCByZWd1bGFyIHNvZnQgYm93ZWwgbW92ZW1lbnRzLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJnaSB8IGFkdWx0IHwgY29uc3RpcGF0aW9uIHwgcHN5bGxpdW0gfCBtZXRhbXVjaWwgfCAxIHBhY2sgfCBjb25zdGlwYXRpb24gfCBidWxrIGZvcm1pbmcgYWdlbnQuIHRha2UgMS0yIHRpbWVzIGRhaWx5IHVudGlsIHJlZ3VsYXIgc29mdCBib3dlbCBtb3ZlbWVudHMuIn0seyJzcGVjaWFsdHkiOiJHSSIsIm1lZCI6IlBFRyAzMzUwIiwiYnJhbmRzIjpbIlBvbHlldGh5bGVuZSBHbHljb2wiLCJSZXN0b3JhTEFYIiwiTGF4LUEtRGF5IiwiTWlyYWxheCIsIkdvTHl0ZWx5Il0sImluZGljYXRpb24iOiJDb25zdGlwYXRpb24iLCJkb3NlX3RleHQiOiIxN2ciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgYm90dGxlIiwicHJuIjoiY29uc3RpcGF0aW9uIiwiZm9ybSI6InBvd2RlciIsImNvbW1lbnRzIjoiT3Ntb3RpYyBhZ2VudC4gVGFrZSAxLTIgdGltZXMgZGFpbHkgdW50aWwgcmVndWxhciBzb2Z0IGJvd2VsIG1vdmVtZW50cy4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjEiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZ2kgfCBhZHVsdCB8IGNvbnN0aXBhdGlvbiB8IHBlZyAzMzUwIHwgcG9seWV0aHlsZW5lIGdseWNvbCByZXN0b3JhbGF4IGxheC1hLWRheSBtaXJhbGF4IGdvbHl0ZWx5IHwgMTdnIHwgY29uc3RpcGF0aW9uIHwgb3Ntb3RpYyBhZ2VudC4gdGFrZSAxLTIgdGltZXMgZGFpbHkgdW50aWwgcmVndWxhciBzb2Z0IGJvd2VsIG1vdmVtZW50cy4ifSx7InNwZWNpYWx0eSI6IkdJIiwibWVkIjoiTGFjdHVsb3NlIiwiYnJhbmRzIjpbIkVudWxvc2UiXSwiaW5kaWNhdGlvbiI6IkNvbnN0aXBhdGlvbiIsImRvc2VfdGV4dCI6IjE1LTMwbWwiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgYm90dGxlIiwicHJuIjoiY29uc3RpcGF0aW9uIiwiZm9ybSI6InN5cnVwIiwiY29tbWVudHMiOiJPc21vdGljIGFnZW50LiBUYWtlIDE1LTMwbWwgZGFpbHksIG1heSBpbmNyZWFzZSB0byA0NS02MG1sIGRhaWx5LCBpZiBuZWNlc3NhcnksIHVudGlsIHJlZ3VsYXIgc29mdCBib3dlbCBtb3ZlbWVudHMuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIxIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImdpIHwgYWR1bHQgfCBjb25zdGlwYXRpb24gfCBsYWN0dWxvc2UgfCBlbnVsb3NlIHwgMTUtMzBtbCB8IGNvbnN0aXBhdGlvbiB8IG9zbW90aWMgYWdlbnQuIHRha2UgMTUtMzBtbCBkYWlseSwgbWF5IGluY3JlYXNlIHRvIDQ1LTYwbWwgZGFpbHksIGlmIG5lY2Vzc2FyeSwgdW50aWwgcmVndWxhciBzb2Z0IGJvd2VsIG1vdmVtZW50cy4ifSx7InNwZWNpYWx0eSI6IkdJIiwibWVkIjoiTWFnbmVzaXVtIEh5ZHJveGlkZSIsImJyYW5kcyI6WyJNaWxrIG9mIE1hZ25lc2lhIl0sImluZGljYXRpb24iOiJDb25zdGlwYXRpb24iLCJkb3NlX3RleHQiOiIzMG1sIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IiIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxIGJvdHRsZSIsInBybiI6ImNvbnN0aXBhdGlvbiIsImZvcm0iOiJzdXNwZW5zaW9uIiwiY29tbWVudHMiOiJPc21vdGljIGFnZW50LiBUYWtlIDMwLTYwbWwvZGF5IG9uY2UgZGFpbHkgYXQgYmVkdGltZSB1bnRpbCByZWd1bGFyIHNvZnQgYm93ZWwgbW92ZW1lbnRzLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJnaSB8IGFkdWx0IHwgY29uc3RpcGF0aW9uIHwgbWFnbmVzaXVtIGh5ZHJveGlkZSB8IG1pbGsgb2YgbWFnbmVzaWEgfCAzMG1sIHwgY29uc3RpcGF0aW9uIHwgb3Ntb3RpYyBhZ2VudC4gdGFrZSAzMC02MG1sL2RheSBvbmNlIGRhaWx5IGF0IGJlZHRpbWUgdW50aWwgcmVndWxhciBzb2Z0IGJvd2VsIG1vdmVtZW50cy4ifSx7InNwZWNpYWx0eSI6IkdJIiwibWVkIjoiU2Vubm9zaWRlcyIsImJyYW5kcyI6WyJTZW5uYSIsIlNlbm9rb3QiXSwiaW5kaWNhdGlvbiI6IkNvbnN0aXBhdGlvbiIsImRvc2VfdGV4dCI6IjEtMiB0YWIiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIxNCBkYXkiLCJkaXNwZW5zZSI6IjI4IHRhYiIsInBybiI6ImNvbnN0aXBhdGlvbiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IlN0aW11bGFudCBhZ2VudC4gVGFrZSAxNy4ybWcgb25jZSBkYWlseSwgbWF5IHNsb3dseSBpbmNyZWFzZSB1cCB0byBtYXhpbXVtIDM0LjRtZyB0d2ljZSBkYWlseSB1bnRpbCByZWd1bGFyIHNvZnQgYm93ZWwgbW92ZW1lbnRzLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJnaSB8IGFkdWx0IHwgY29uc3RpcGF0aW9uIHwgc2Vubm9zaWRlcyB8IHNlbm5hIHNlbm9rb3QgfCAxLTIgdGFiIHwgY29uc3RpcGF0aW9uIHwgc3RpbXVsYW50IGFnZW50LiB0YWtlIDE3LjJtZyBvbmNlIGRhaWx5LCBtYXkgc2xvd2x5IGluY3JlYXNlIHVwIHRvIG1heGltdW0gMzQuNG1nIHR3aWNlIGRhaWx5IHVudGlsIHJlZ3VsYXIgc29mdCBib3dlbCBtb3ZlbWVudHMuIn0seyJzcGVjaWFsdHkiOiJHSSIsIm1lZCI6IlNvZGl1bSBQaG9zcGhhdGUgZW5lbWEgKG9pbCkiLCJicmFuZHMiOlsiRmxlZXQiXSwiaW5kaWNhdGlvbiI6IkNvbnN0aXBhdGlvbiIsImRvc2VfdGV4dCI6IjEgYXBwbGljYXRpb24iLCJyb3V0ZSI6IlBSIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiI1IGFwcCIsInBybiI6ImNvbnN0aXBhdGlvbiIsImZvcm0iOiJlbmVtYSIsImNvbW1lbnRzIjoiVXNlIHVudGlsIHJlZ3VsYXIgc29mdCBib3dlbCBtb3ZlbWVudHMuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIxIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImdpIHwgYWR1bHQgfCBjb25zdGlwYXRpb24gfCBzb2RpdW0gcGhvc3BoYXRlIGVuZW1hIChvaWwpIHwgZmxlZXQgfCAxIGFwcGxpY2F0aW9uIHwgY29uc3RpcGF0aW9uIHwgdXNlIHVudGlsIHJlZ3VsYXIgc29mdCBib3dlbCBtb3ZlbWVudHMuIn0seyJzcGVjaWFsdHkiOiJHSSIsIm1lZCI6IlNvZGl1bSBQaG9zcGhhdGUgZW5lbWEgKHNhbGluZSkiLCJicmFuZHMiOlsiRmxlZXQiXSwiaW5kaWNhdGlvbiI6IkNvbnN0aXBhdGlvbiIsImRvc2VfdGV4dCI6IjEgYXBwbGljYXRpb24iLCJyb3V0ZSI6IlBSIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiI1IGFwcCIsInBybiI6ImNvbnN0aXBhdGlvbiIsImZvcm0iOiJlbmVtYSIsImNvbW1lbnRzIjoiVXNlIHVudGlsIHJlZ3VsYXIgc29mdCBib3dlbCBtb3ZlbWVudHMuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIxIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImdpIHwgYWR1bHQgfCBjb25zdGlwYXRpb24gfCBzb2RpdW0gcGhvc3BoYXRlIGVuZW1hIChzYWxpbmUpIHwgZmxlZXQgfCAxIGFwcGxpY2F0aW9uIHwgY29uc3RpcGF0aW9uIHwgdXNlIHVudGlsIHJlZ3VsYXIgc29mdCBib3dlbCBtb3ZlbWVudHMuIn0seyJzcGVjaWFsdHkiOiJHSSIsIm1lZCI6IkJpc2Fjb2R5bCIsImJyYW5kcyI6WyJEdWxjb2xheCJdLCJpbmRpY2F0aW9uIjoiQ29uc3RpcGF0aW9uIiwiZG9zZV90ZXh0IjoiMTBtZyIsInJvdXRlIjoiUFIiLCJmcmVxdWVuY3kiOiJPRCIsImR1cmF0aW9uIjoiNSBkYXkiLCJkaXNwZW5zZSI6IjUgc3VwcCIsInBybiI6ImNvbnN0aXBhdGlvbiIsImZvcm0iOiJzdXBwb3NpdG9yeSIsImNvbW1lbnRzIjoiVXNlIHVudGlsIHJlZ3VsYXIgc29mdCBib3dlbCBtb3ZlbWVudHMuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIxIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImdpIHwgYWR1bHQgfCBjb25zdGlwYXRpb24gfCBiaXNhY29keWwgfCBkdWxjb2xheCB8IDEwbWcgfCBjb25zdGlwYXRpb24gfCB1c2UgdW50aWwgcmVndWxhciBzb2Z0IGJvd2VsIG1vdmVtZW50cy4ifSx7InNwZWNpYWx0eSI6IkdJIiwibWVkIjoiTG9wZXJhbWlkZSIsImJyYW5kcyI6WyJJbW9kaXVtIl0sImluZGljYXRpb24iOiJEaWFycmhlYSIsImRvc2VfdGV4dCI6IiIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiIiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMTYgdGFiIiwicHJuIjoiZGlhcnJoZWEiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJUYWtlIDRtZyBpbml0aWFsbHksIHRoZW4gMm1nIGFmdGVyIGVhY2ggbG9vc2Ugc3Rvb2wuIE1heGltdW0gOG1nIHBlciAyNCBob3Vycy4gTGltaXQgdXNlIHRvIGxlc3MgdGhhbiA0OCBob3Vycy4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjEiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZ2kgfCBhZHVsdCB8IGRpYXJyaGVhIHwgbG9wZXJhbWlkZSB8IGltb2RpdW0gfCBkaWFycmhlYSB8IHRha2UgNG1nIGluaXRpYWxseSwgdGhlbiAybWcgYWZ0ZXIgZWFjaCBsb29zZSBzdG9vbC4gbWF4aW11bSA4bWcgcGVyIDI0IGhvdXJzLiBsaW1pdCB1c2UgdG8gbGVzcyB0aGFuIDQ4IGhvdXJzLiJ9LHsic3BlY2lhbHR5IjoiR0kiLCJtZWQiOiJBeml0aHJvbXljaW4iLCJicmFuZHMiOlsiWml0aHJvbWF4IiwiWm1heCJdLCJpbmRpY2F0aW9uIjoiRGlhcnJoZWEgKGluZmVjdGlvdXMpIiwiZG9zZV90ZXh0IjoiNTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjMgZGF5IiwiZGlzcGVuc2UiOiIzIHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJnaSB8IGFkdWx0IHwgZGlhcnJoZWEgKGluZmVjdGlvdXMpIHwgYXppdGhyb215Y2luIHwgeml0aHJvbWF4IHptYXggfCA1MDBtZyJ9LHsic3BlY2lhbHR5IjoiR0kiLCJtZWQiOiJDaXByb2Zsb3hhY2luIiwiYnJhbmRzIjpbIkNpcHJvIl0sImluZGljYXRpb24iOiJEaXZlcnRpY3VsaXRpcyIsImRvc2VfdGV4dCI6IjUwMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InExMmgiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIxNCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZ2kgfCBhZHVsdCB8IGRpdmVydGljdWxpdGlzIHwgY2lwcm9mbG94YWNpbiB8IGNpcHJvIHwgNTAwbWcifSx7InNwZWNpYWx0eSI6IkdJIiwibWVkIjoiTWV0cm9uaWRhem9sZSIsImJyYW5kcyI6WyJGbGFneWwiXSwiaW5kaWNhdGlvbiI6IkRpdmVydGljdWxpdGlzIiwiZG9zZV90ZXh0IjoiNTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicThoIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiMjEgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImdpIHwgYWR1bHQgfCBkaXZlcnRpY3VsaXRpcyB8IG1ldHJvbmlkYXpvbGUgfCBmbGFneWwgfCA1MDBtZyJ9LHsic3BlY2lhbHR5IjoiR0kiLCJtZWQiOiJWYW5jb215Y2luIiwiYnJhbmRzIjpbIlZhbmNvY2luIl0sImluZGljYXRpb24iOiJDLiBkaWZmaWNpbGUiLCJkb3NlX3RleHQiOiIxMjVtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJRSUQiLCJkdXJhdGlvbiI6IjEwIGRheSIsImRpc3BlbnNlIjoiNDAgY2FwIiwicHJuIjoiIiwiZm9ybSI6ImNhcHN1bGUiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJnaSB8IGFkdWx0IHwgYy4gZGlmZmljaWxlIHwgdmFuY29teWNpbiB8IHZhbmNvY2luIHwgMTI1bWcifSx7InNwZWNpYWx0eSI6IkdJIiwibWVkIjoiTmlmZWRpcGluZSBvaW50bWVudCAoMC4yLTAuMyUpIiwiYnJhbmRzIjpbXSwiaW5kaWNhdGlvbiI6IkFuYWwgZmlzc3VyZSIsImRvc2VfdGV4dCI6IjEgYXBwbGljYXRpb24iLCJyb3V0ZSI6InRvcGljYWwiLCJmcmVxdWVuY3kiOiJxNmgiLCJkdXJhdGlvbiI6IjQgd2VlayIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoiYW5hbCBmaXNzdXJlIiwiZm9ybSI6Im9pbnRtZW50IiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjEiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZ2kgfCBhZHVsdCB8IGFuYWwgZmlzc3VyZSB8IG5pZmVkaXBpbmUgb2ludG1lbnQgKDAuMi0wLjMlKSB8IDEgYXBwbGljYXRpb24gfCBhbmFsIGZpc3N1cmUifSx7InNwZWNpYWx0eSI6IkdJIiwibWVkIjoiUHJhbW94aW5lICsgWmluYyBTdWxmYXRlICsgSHlkcm9jb3J0aXNvbmUgb2ludG1lbnQiLCJicmFuZHMiOlsiQW51c29sIEhDIl0sImluZGljYXRpb24iOiJIZW1vcnJob2lkcyIsImRvc2VfdGV4dCI6IjEgYXBwbGljYXRpb24iLCJyb3V0ZSI6InRvcGljYWwiLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIxIHR1YmUiLCJwcm4iOiJoZW1vcnJob2lkcyIsImZvcm0iOiJvaW50bWVudCIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImdpIHwgYWR1bHQgfCBoZW1vcnJob2lkcyB8IHByYW1veGluZSArIHppbmMgc3VsZmF0ZSArIGh5ZHJvY29ydGlzb25lIG9pbnRtZW50IHwgYW51c29sIGhjIHwgMSBhcHBsaWNhdGlvbiB8IGhlbW9ycmhvaWRzIn0seyJzcGVjaWFsdHkiOiJHSSIsIm1lZCI6IlByYW1veGluZSArIFppbmMgU3VsZmF0ZSArIEh5ZHJvY29ydGlzb25lIiwiYnJhbmRzIjpbIkFudXNvbCBIQyJdLCJpbmRpY2F0aW9uIjoiSGVtb3JyaG9pZHMiLCJkb3NlX3RleHQiOiIxIHN1cHBvc2l0b3J5Iiwicm91dGUiOiJQUiIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IjEgYm94IiwicHJuIjoiaGVtb3JyaG9pZHMiLCJmb3JtIjoic3VwcG9zaXRvcnkiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJnaSB8IGFkdWx0IHwgaGVtb3JyaG9pZHMgfCBwcmFtb3hpbmUgKyB6aW5jIHN1bGZhdGUgKyBoeWRyb2NvcnRpc29uZSB8IGFudXNvbCBoYyB8IDEgc3VwcG9zaXRvcnkgfCBoZW1vcnJob2lkcyJ9LHsic3BlY2lhbHR5IjoiR0kiLCJtZWQiOiJQaGVueWxlcGhyaW5lIG9pbnRtZW50ICgwLjI1JSkiLCJicmFuZHMiOlsiUHJlcGFyYXRpb24gSCJdLCJpbmRpY2F0aW9uIjoiSGVtb3JyaG9pZHMiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0b3BpY2FsIiwiZnJlcXVlbmN5IjoicTZoIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoiaGVtb3JyaG9pZHMiLCJmb3JtIjoib2ludG1lbnQiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJnaSB8IGFkdWx0IHwgaGVtb3JyaG9pZHMgfCBwaGVueWxlcGhyaW5lIG9pbnRtZW50ICgwLjI1JSkgfCBwcmVwYXJhdGlvbiBoIHwgMSBhcHBsaWNhdGlvbiB8IGhlbW9ycmhvaWRzIn0seyJzcGVjaWFsdHkiOiJHSSIsIm1lZCI6IlBoZW55bGVwaHJpbmUiLCJicmFuZHMiOlsiUHJlcGFyYXRpb24gSCJdLCJpbmRpY2F0aW9uIjoiSGVtb3JyaG9pZHMiLCJkb3NlX3RleHQiOiIiLCJyb3V0ZSI6IlBSIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgYm94IiwicHJuIjoiaGVtb3JyaG9pZHMiLCJmb3JtIjoic3VwcG9zaXRvcnkiLCJjb21tZW50cyI6Ikluc2VydCAxIHN1cHBvc2l0b3J5IHBlciByZWN0dW0gMS00IHRpbWVzIGRhaWx5IGZvciB1cCB0byA3IGRheXMgYXMgbmVlZGVkLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJnaSB8IGFkdWx0IHwgaGVtb3JyaG9pZHMgfCBwaGVueWxlcGhyaW5lIHwgcHJlcGFyYXRpb24gaCB8IGhlbW9ycmhvaWRzIHwgaW5zZXJ0IDEgc3VwcG9zaXRvcnkgcGVyIHJlY3R1bSAxLTQgdGltZXMgZGFpbHkgZm9yIHVwIHRvIDcgZGF5cyBhcyBuZWVkZWQuIn0seyJzcGVjaWFsdHkiOiJHSSIsIm1lZCI6IkFsYmVuZGF6b2xlIiwiYnJhbmRzIjpbIkFsYmVuemEiXSwiaW5kaWNhdGlvbiI6IlBpbndvcm0vd2hpcHdvcm0iLCJkb3NlX3RleHQiOiIiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjIgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiRGlzcGVuc2UgdHdvIDQwMG1nIHRhYnMuIFRha2UgNDAwbWcgbm93IGFzIGEgc2luZ2xlIGRvc2UsIHRoZW4gcmVwZWF0IGRvc2UgaW4gMiB3ZWVrcy4gQXZvaWQgaW4gcHJlZ25hbmN5LiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJnaSB8IGFkdWx0IHwgcGlud29ybS93aGlwd29ybSB8IGFsYmVuZGF6b2xlIHwgYWxiZW56YSB8IGRpc3BlbnNlIHR3byA0MDBtZyB0YWJzLiB0YWtlIDQwMG1nIG5vdyBhcyBhIHNpbmdsZSBkb3NlLCB0aGVuIHJlcGVhdCBkb3NlIGluIDIgd2Vla3MuIGF2b2lkIGluIHByZWduYW5jeS4ifSx7InNwZWNpYWx0eSI6IkdJIiwibWVkIjoiUEVHIDMzNTAiLCJicmFuZHMiOlsiUG9seWV0aHlsZW5lIEdseWNvbCIsIlJlc3RvcmFMQVgiLCJMYXgtQS1EYXkiLCJNaXJhbGF4IiwiR29MeXRlbHkiXSwiaW5kaWNhdGlvbiI6IkNvbnN0aXBhdGlvbiIsImRvc2VfdGV4dCI6IiIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiIiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMSBtb250aCIsInBybiI6ImNvbnN0aXBhdGlvbiIsImZvcm0iOiJwb3dkZXIiLCJjb21tZW50cyI6Ik9zbW90aWMgYWdlbnQuIEZvbGxvdyBDSEVPIGNvbnN0aXBhdGlvbiBoYW5kb3V0IGZvciB3ZWlnaHQtYmFzZWQgZG9zaW5nLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjEiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZ2kgfCBwZWRpYXRyaWMgfCBjb25zdGlwYXRpb24gfCBwZWcgMzM1MCB8IHBvbHlldGh5bGVuZSBnbHljb2wgcmVzdG9yYWxheCBsYXgtYS1kYXkgbWlyYWxheCBnb2x5dGVseSB8IGNvbnN0aXBhdGlvbiB8IG9zbW90aWMgYWdlbnQuIGZvbGxvdyBjaGVvIGNvbnN0aXBhdGlvbiBoYW5kb3V0IGZvciB3ZWlnaHQtYmFzZWQgZG9zaW5nLiJ9LHsic3BlY2lhbHR5IjoiR0kiLCJtZWQiOiJHbHljZXJpbiIsImJyYW5kcyI6WyJSb3VnaWVyIiwiRXF1YXRlIl0sImluZGljYXRpb24iOiJDb25zdGlwYXRpb24iLCJkb3NlX3RleHQiOiIxIGluZmFudCBzdXBwb3NpdG9yeSIsInJvdXRlIjoiUFIiLCJmcmVxdWVuY3kiOiJPRCIsImR1cmF0aW9uIjoiNSBkYXkiLCJkaXNwZW5zZSI6IjUgc3VwcG9zaXRvcnkiLCJwcm4iOiJjb25zdGlwYXRpb24iLCJmb3JtIjoic3VwcG9zaXRvcnkiLCJjb21tZW50cyI6IlVzZSB1bnRpbCByZWd1bGFyIHNvZnQgYm93ZWwgbW92ZW1lbnRzLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZ2kgfCBwZWRpYXRyaWMgfCBjb25zdGlwYXRpb24gfCBnbHljZXJpbiB8IHJvdWdpZXIgZXF1YXRlIHwgMSBpbmZhbnQgc3VwcG9zaXRvcnkgfCBjb25zdGlwYXRpb24gfCB1c2UgdW50aWwgcmVndWxhciBzb2Z0IGJvd2VsIG1vdmVtZW50cy4ifSx7InNwZWNpYWx0eSI6IkdJIiwibWVkIjoiT3JhbCBFbGVjdHJvbHl0ZSBTb2x1dGlvbiIsImJyYW5kcyI6WyJQZWRpYWx5dGUiLCJHYXN0cm9seXRlIiwiSHlkcmFseXRlIiwiRW5mYWx5dGUiXSwiaW5kaWNhdGlvbiI6IkRlaHlkcmF0aW9uIiwiZG9zZV90ZXh0IjoiIiwicm91dGUiOiIiLCJmcmVxdWVuY3kiOiIiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiNSBib3R0bGUiLCJwcm4iOiIiLCJmb3JtIjoiIiwiY29tbWVudHMiOiJUYWtlIHNtYWxsIHNpcHMgZnJlcXVlbnRseS4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImdpIHwgcGVkaWF0cmljIHwgZGVoeWRyYXRpb24gfCBvcmFsIGVsZWN0cm9seXRlIHNvbHV0aW9uIHwgcGVkaWFseXRlIGdhc3Ryb2x5dGUgaHlkcmFseXRlIGVuZmFseXRlIHwgdGFrZSBzbWFsbCBzaXBzIGZyZXF1ZW50bHkuIn0seyJzcGVjaWFsdHkiOiJHVSIsIm1lZCI6IkZvc2ZvbXljaW4iLCJicmFuZHMiOlsiTW9udXJvbCJdLCJpbmRpY2F0aW9uIjoiVVRJIChjeXN0aXRpcywgbWFsZSBvciBmZW1hbGUpIiwiZG9zZV90ZXh0IjoiM2ciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5Ijoib25jZSIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxIHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJndSB8IGFkdWx0IHwgdXRpIChjeXN0aXRpcywgbWFsZSBvciBmZW1hbGUpIHwgZm9zZm9teWNpbiB8IG1vbnVyb2wgfCAzZyJ9LHsic3BlY2lhbHR5IjoiR1UiLCJtZWQiOiJOaXRyb2Z1cmFudG9pbiIsImJyYW5kcyI6WyJNYWNyb2JpZCIsIk1hY3JvZGFudGluIl0sImluZGljYXRpb24iOiJVVEkgKGN5c3RpdGlzLCBmZW1hbGUpIiwiZG9zZV90ZXh0IjoiMTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiI1IGRheSIsImRpc3BlbnNlIjoiMTAgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6Imd1IHwgYWR1bHQgfCB1dGkgKGN5c3RpdGlzLCBmZW1hbGUpIHwgbml0cm9mdXJhbnRvaW4gfCBtYWNyb2JpZCBtYWNyb2RhbnRpbiB8IDEwMG1nIn0seyJzcGVjaWFsdHkiOiJHVSIsIm1lZCI6Ik5pdHJvZnVyYW50b2luIiwiYnJhbmRzIjpbIk1hY3JvYmlkIiwiTWFjcm9kYW50aW4iXSwiaW5kaWNhdGlvbiI6IlVUSSAoY3lzdGl0aXMsIG1hbGUpIiwiZG9zZV90ZXh0IjoiMTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiMTQgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6Imd1IHwgYWR1bHQgfCB1dGkgKGN5c3RpdGlzLCBtYWxlKSB8IG5pdHJvZnVyYW50b2luIHwgbWFjcm9iaWQgbWFjcm9kYW50aW4gfCAxMDBtZyJ9LHsic3BlY2lhbHR5IjoiR1UiLCJtZWQiOiJDZXBoYWxleGluIiwiYnJhbmRzIjpbIktlZmxleCJdLCJpbmRpY2F0aW9uIjoiVVRJIChjeXN0aXRpcyBpbiBwcmVnbmFuY3kpIiwiZG9zZV90ZXh0IjoiNTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiUUlEIiwiZHVyYXRpb24iOiI1IGRheSIsImRpc3BlbnNlIjoiMjAgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6Imd1IHwgYWR1bHQgfCB1dGkgKGN5c3RpdGlzIGluIHByZWduYW5jeSkgfCBjZXBoYWxleGluIHwga2VmbGV4IHwgNTAwbWcifSx7InNwZWNpYWx0eSI6IkdVIiwibWVkIjoiVE1QL1NNWCBEUyAoODAwLzE2MG1nKSIsImJyYW5kcyI6WyJTZXB0cmEgRFMiLCJCYWN0cmltIERTIiwiU3VsZmFtZXRob3hhem9sZSArIFRyaW1ldGhvcHJpbSBEUyIsIlRNUC1TTVggRFMiXSwiaW5kaWNhdGlvbiI6IlVUSSAocHllbG9uZXBocml0aXMsIGNvbXBsaWNhdGVkLCBvciBjYXRoZXRlci1hc3NvY2lhdGVkOyBtYWxlIG9yIGZlbWFsZSkiLCJkb3NlX3RleHQiOiIxIHRhYiIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIxNCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZ3UgfCBhZHVsdCB8IHV0aSAocHllbG9uZXBocml0aXMsIGNvbXBsaWNhdGVkLCBvciBjYXRoZXRlci1hc3NvY2lhdGVkOyBtYWxlIG9yIGZlbWFsZSkgfCB0bXAvc214IGRzICg4MDAvMTYwbWcpIHwgc2VwdHJhIGRzIGJhY3RyaW0gZHMgc3VsZmFtZXRob3hhem9sZSArIHRyaW1ldGhvcHJpbSBkcyB0bXAtc214IGRzIHwgMSB0YWIifSx7InNwZWNpYWx0eSI6IkdVIiwibWVkIjoiVE1QL1NNWCBTUyAoNDAwLzgwbWcpIiwiYnJhbmRzIjpbIlNlcHRyYSIsIkJhY3RyaW0iLCJTdWxmYW1ldGhveGF6b2xlICsgVHJpbWV0aG9wcmltIiwiVE1QLVNNWCJdLCJpbmRpY2F0aW9uIjoiVVRJIChweWVsb25lcGhyaXRpcywgY29tcGxpY2F0ZWQsIG9yIGNhdGhldGVyLWFzc29jaWF0ZWQ7IG1hbGUgb3IgZmVtYWxlKSIsImRvc2VfdGV4dCI6IjEgdGFiIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IjE0IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IlJlbmFsIGRvc2UgYWRqdXN0ZWQgZm9yIHBhdGllbnRzIHdpdGggQ3JDbCAxMCB0byAzMG1sL21pbi4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZ3UgfCBhZHVsdCB8IHV0aSAocHllbG9uZXBocml0aXMsIGNvbXBsaWNhdGVkLCBvciBjYXRoZXRlci1hc3NvY2lhdGVkOyBtYWxlIG9yIGZlbWFsZSkgfCB0bXAvc214IHNzICg0MDAvODBtZykgfCBzZXB0cmEgYmFjdHJpbSBzdWxmYW1ldGhveGF6b2xlICsgdHJpbWV0aG9wcmltIHRtcC1zbXggfCAxIHRhYiB8IHJlbmFsIGRvc2UgYWRqdXN0ZWQgZm9yIHBhdGllbnRzIHdpdGggY3JjbCAxMCB0byAzMG1sL21pbi4ifSx7InNwZWNpYWx0eSI6IkdVIiwibWVkIjoiVGFtc3Vsb3NpbiBDUiIsImJyYW5kcyI6WyJGbG9tYXgiXSwiaW5kaWNhdGlvbiI6IkJQSCIsImRvc2VfdGV4dCI6IjAuNG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiI0IHdlZWsiLCJkaXNwZW5zZSI6IjI4IHRhYiIsInBybiI6IiIsImZvcm0iOiJFUiB0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJndSB8IGFkdWx0IHwgYnBoIHwgdGFtc3Vsb3NpbiBjciB8IGZsb21heCB8IDAuNG1nIn0seyJzcGVjaWFsdHkiOiJHVSIsIm1lZCI6IlRhbXN1bG9zaW4gQ1IiLCJicmFuZHMiOlsiRmxvbWF4Il0sImluZGljYXRpb24iOiJLaWRuZXkgc3RvbmVzIiwiZG9zZV90ZXh0IjoiMC40bWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjIgd2VlayIsImRpc3BlbnNlIjoiMTQgdGFiIiwicHJuIjoiIiwiZm9ybSI6IkVSIHRhYiIsImNvbW1lbnRzIjoiVGFrZSB1bnRpbCBzdG9uZSBwYXNzYWdlIGZvciB1cCB0byA0IHdlZWtzLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJndSB8IGFkdWx0IHwga2lkbmV5IHN0b25lcyB8IHRhbXN1bG9zaW4gY3IgfCBmbG9tYXggfCAwLjRtZyB8IHRha2UgdW50aWwgc3RvbmUgcGFzc2FnZSBmb3IgdXAgdG8gNCB3ZWVrcy4ifSx7InNwZWNpYWx0eSI6IkdVIiwibWVkIjoiQ2VwaGFsZXhpbiIsImJyYW5kcyI6WyJLZWZsZXgiXSwiaW5kaWNhdGlvbiI6IlVUSSAoY3lzdGl0aXMpIiwiZG9zZV90ZXh0IjoiMjVtZy9rZy9kb3NlIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InExMmgiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoic3VzcGVuc2lvbiIsImNvbW1lbnRzIjoiNTBtZy9rZy9kYXkuIE1heGltdW0gZG9zZSA9IDUwMG1nL2Rvc2UuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6dHJ1ZSwiZG9zZV9wZXJfa2dfbWciOjI1LjAsIm1heF9kb3NlX21nIjo1MDAuMCwic2VhcmNoX3RleHQiOiJndSB8IHBlZGlhdHJpYyB8IHV0aSAoY3lzdGl0aXMpIHwgY2VwaGFsZXhpbiB8IGtlZmxleCB8IDI1bWcva2cvZG9zZSB8IDUwbWcva2cvZGF5LiBtYXhpbXVtIGRvc2UgPSA1MDBtZy9kb3NlLiJ9LHsic3BlY2lhbHR5IjoiR1UiLCJtZWQiOiJDZXBoYWxleGluIiwiYnJhbmRzIjpbIktlZmxleCJdLCJpbmRpY2F0aW9uIjoiVVRJIChweWVsb25lcGhyaXRpcykiLCJkb3NlX3RleHQiOiIzMG1nL2tnL2Rvc2UiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicThoIiwiZHVyYXRpb24iOiIxMCBkYXkiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJzdXNwZW5zaW9uIiwiY29tbWVudHMiOiI5MG1nL2tnL2RheS4gTWF4aW11bSBkb3NlID0gMTAwMG1nL2Rvc2UuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6dHJ1ZSwiZG9zZV9wZXJfa2dfbWciOjMwLjAsIm1heF9kb3NlX21nIjoxMDAwLjAsInNlYXJjaF90ZXh0IjoiZ3UgfCBwZWRpYXRyaWMgfCB1dGkgKHB5ZWxvbmVwaHJpdGlzKSB8IGNlcGhhbGV4aW4gfCBrZWZsZXggfCAzMG1nL2tnL2Rvc2UgfCA5MG1nL2tnL2RheS4gbWF4aW11bSBkb3NlID0gMTAwMG1nL2Rvc2UuIn0seyJzcGVjaWFsdHkiOiJHVSIsIm1lZCI6IlRNUC9TTVgiLCJicmFuZHMiOlsiU2VwdHJhIiwiQmFjdHJpbSIsIlN1bGZhbWV0aG94YXpvbGUgKyBUcmltZXRob3ByaW0iLCJUTVAtU01YIl0sImluZGljYXRpb24iOiJVVEkgKGN5c3RpdGlzIG9yIHB5ZWxvbmVwaHJpdGlzKSIsImRvc2VfdGV4dCI6IiIsInJvdXRlIjoiIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJzdXNwZW5zaW9uIiwiY29tbWVudHMiOiI2bWcgdHJpbWV0aG9wcmltL2tnIFBPIHExMmggZm9yIDcgZGF5cy4gMTJtZy9rZy9kYXkuIE1heGltdW0gZG9zZSA9IDE2MG1nIHRyaW1ldGhvcHJpbS9kb3NlLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOnRydWUsImRvc2VfcGVyX2tnX21nIjo2LjAsIm1heF9kb3NlX21nIjoxNjAuMCwic2VhcmNoX3RleHQiOiJndSB8IHBlZGlhdHJpYyB8IHV0aSAoY3lzdGl0aXMgb3IgcHllbG9uZXBocml0aXMpIHwgdG1wL3NteCB8IHNlcHRyYSBiYWN0cmltIHN1bGZhbWV0aG94YXpvbGUgKyB0cmltZXRob3ByaW0gdG1wLXNteCB8IDZtZyB0cmltZXRob3ByaW0va2cgcG8gcTEyaCBmb3IgNyBkYXlzLiAxMm1nL2tnL2RheS4gbWF4aW11bSBkb3NlID0gMTYwbWcgdHJpbWV0aG9wcmltL2Rvc2UuIn0seyJzcGVjaWFsdHkiOiJPQkdZTiIsIm1lZCI6Ik1ldHJvbmlkYXpvbGUiLCJicmFuZHMiOlsiRmxhZ3lsIl0sImluZGljYXRpb24iOiJCYWN0ZXJpYWwgdmFnaW5vc2lzIiwiZG9zZV90ZXh0IjoiNTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiMTQgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6Im9iZ3luIHwgYWR1bHQgfCBiYWN0ZXJpYWwgdmFnaW5vc2lzIHwgbWV0cm9uaWRhem9sZSB8IGZsYWd5bCB8IDUwMG1nIn0seyJzcGVjaWFsdHkiOiJPQkdZTiIsIm1lZCI6IkNsaW5kYW15Y2luIGNyZWFtICgyJSkiLCJicmFuZHMiOlsiRGFsYWNpbiIsIkNsZW9jaW4iXSwiaW5kaWNhdGlvbiI6IkJhY3RlcmlhbCB2YWdpbm9zaXMiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJQViIsImZyZXF1ZW5jeSI6InFIUyIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJjcmVhbSIsImNvbW1lbnRzIjoiT25lIGFwcGxpY2F0aW9uID0gNWcgY29udGFpbmluZyB+MTAwbWcgY2xpbmRhbXljaW4uIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6Im9iZ3luIHwgYWR1bHQgfCBiYWN0ZXJpYWwgdmFnaW5vc2lzIHwgY2xpbmRhbXljaW4gY3JlYW0gKDIlKSB8IGRhbGFjaW4gY2xlb2NpbiB8IDEgYXBwbGljYXRpb24gfCBvbmUgYXBwbGljYXRpb24gPSA1ZyBjb250YWluaW5nIH4xMDBtZyBjbGluZGFteWNpbi4ifSx7InNwZWNpYWx0eSI6Ik9CR1lOIiwibWVkIjoiRmx1Y29uYXpvbGUiLCJicmFuZHMiOlsiRGlmbHVjYW4iXSwiaW5kaWNhdGlvbiI6IlZ1bHZvdmFnaW5hbCBjYW5kaWRpYXNpcyIsImRvc2VfdGV4dCI6IjE1MG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6Im9uY2UiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMSBkb3NlIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiQXZvaWQgaW4gcHJlZ25hbmN5LiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJvYmd5biB8IGFkdWx0IHwgdnVsdm92YWdpbmFsIGNhbmRpZGlhc2lzIHwgZmx1Y29uYXpvbGUgfCBkaWZsdWNhbiB8IDE1MG1nIHwgYXZvaWQgaW4gcHJlZ25hbmN5LiJ9LHsic3BlY2lhbHR5IjoiT0JHWU4iLCJtZWQiOiJDbG90cmltYXpvbGUgY3JlYW0gKDElKSIsImJyYW5kcyI6WyJDYW5lc3RlbiIsIkxvdHJpbWluIl0sImluZGljYXRpb24iOiJWdWx2b3ZhZ2luYWwgY2FuZGlkaWFzaXMiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJQViIsImZyZXF1ZW5jeSI6InFIUyIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJjcmVhbSIsImNvbW1lbnRzIjoiMSBhcHBsaWNhdGlvbiA9IDVnLiBNYXkgYWxzbyBhcHBseSBleHRlcm5hbGx5IHR3aWNlIGRhaWx5IGZvciA3IGRheXMsIGFzIG5lZWRlZCwgZm9yIGl0Y2hpbmcgYW5kIGlycml0YXRpb24uIFNhZmUgaW4gcHJlZ25hbmN5LiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJvYmd5biB8IGFkdWx0IHwgdnVsdm92YWdpbmFsIGNhbmRpZGlhc2lzIHwgY2xvdHJpbWF6b2xlIGNyZWFtICgxJSkgfCBjYW5lc3RlbiBsb3RyaW1pbiB8IDEgYXBwbGljYXRpb24gfCAxIGFwcGxpY2F0aW9uID0gNWcuIG1heSBhbHNvIGFwcGx5IGV4dGVybmFsbHkgdHdpY2UgZGFpbHkgZm9yIDcgZGF5cywgYXMgbmVlZGVkLCBmb3IgaXRjaGluZyBhbmQgaXJyaXRhdGlvbi4gc2FmZSBpbiBwcmVnbmFuY3kuIn0seyJzcGVjaWFsdHkiOiJPQkdZTiIsIm1lZCI6Ik1pY29uYXpvbGUgY3JlYW0gKDQlKSIsImJyYW5kcyI6WyJNb25pc3RhdCIsIk1pY2F0aW4iXSwiaW5kaWNhdGlvbiI6IlZ1bHZvdmFnaW5hbCBjYW5kaWRpYXNpcyIsImRvc2VfdGV4dCI6IjEgYXBwbGljYXRpb24iLCJyb3V0ZSI6IlBWIiwiZnJlcXVlbmN5IjoicUhTIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoiIiwiZm9ybSI6ImNyZWFtIiwiY29tbWVudHMiOiIxIGFwcGxpY2F0aW9uID0gNWcuIE1heSBhbHNvIGFwcGx5IGV4dGVybmFsbHkgdHdpY2UgZGFpbHkgZm9yIDcgZGF5cywgYXMgbmVlZGVkLCBmb3IgaXRjaGluZyBhbmQgaXJyaXRhdGlvbi4gU2FmZSBpbiBwcmVnbmFuY3kuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6Im9iZ3luIHwgYWR1bHQgfCB2dWx2b3ZhZ2luYWwgY2FuZGlkaWFzaXMgfCBtaWNvbmF6b2xlIGNyZWFtICg0JSkgfCBtb25pc3RhdCBtaWNhdGluIHwgMSBhcHBsaWNhdGlvbiB8IDEgYXBwbGljYXRpb24gPSA1Zy4gbWF5IGFsc28gYXBwbHkgZXh0ZXJuYWxseSB0d2ljZSBkYWlseSBmb3IgNyBkYXlzLCBhcyBuZWVkZWQsIGZvciBpdGNoaW5nIGFuZCBpcnJpdGF0aW9uLiBzYWZlIGluIHByZWduYW5jeS4ifSx7InNwZWNpYWx0eSI6Ik9CR1lOIiwibWVkIjoiVHJhbmV4YW1pYyBBY2lkIiwiYnJhbmRzIjpbIkN5a2xva2Fwcm9uIiwiTHlzdGVkYSIsIlRYQSJdLCJpbmRpY2F0aW9uIjoiQWJub3JtYWwgdXRlcmluZSBibGVlZCIsImRvc2VfdGV4dCI6IjEuNWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiVElEIiwiZHVyYXRpb24iOiI1IGRheSIsImRpc3BlbnNlIjoiMTUgdGFiIiwicHJuIjoiYWJub3JtYWwgdXRlcmluZSBibGVlZCIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IlN0b3Agb25jZSBibGVlZGluZyByZXNvbHZlcy4gVGFrZSBmb3IgbWF4aW11bSA1IGRheXMuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6Im9iZ3luIHwgYWR1bHQgfCBhYm5vcm1hbCB1dGVyaW5lIGJsZWVkIHwgdHJhbmV4YW1pYyBhY2lkIHwgY3lrbG9rYXByb24gbHlzdGVkYSB0eGEgfCAxLjVnIHwgYWJub3JtYWwgdXRlcmluZSBibGVlZCB8IHN0b3Agb25jZSBibGVlZGluZyByZXNvbHZlcy4gdGFrZSBmb3IgbWF4aW11bSA1IGRheXMuIn0seyJzcGVjaWFsdHkiOiJPQkdZTiIsIm1lZCI6IlVsaXByaXN0YWwiLCJicmFuZHMiOlsiRWxsYSJdLCJpbmRpY2F0aW9uIjoiRW1lcmdlbmN5IGNvbnRyYWNlcHRpb24iLCJkb3NlX3RleHQiOiIzMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6Im9uY2UiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMSB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJUYWtlIGFzIHNvb24gYXMgcG9zc2libGUsIGJ1dCB3aXRoaW4gMTIwIGhvdXJzICg1IGRheXMpIG9mIHVucHJvdGVjdGVkIGludGVyY291cnNlIG9yIGNvbnRyYWNlcHRpdmUgZmFpbHVyZS4gSWYgdm9taXRpbmcgb2NjdXJzIHdpdGhpbiAzIGhvdXJzIG9mIGFkbWluaXN0cmF0aW9uLCByZXBlYXQgYSBkb3NlIChvbmUgcmVmaWxsIHByb3ZpZGVkKS4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjEiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoib2JneW4gfCBhZHVsdCB8IGVtZXJnZW5jeSBjb250cmFjZXB0aW9uIHwgdWxpcHJpc3RhbCB8IGVsbGEgfCAzMG1nIHwgdGFrZSBhcyBzb29uIGFzIHBvc3NpYmxlLCBidXQgd2l0aGluIDEyMCBob3VycyAoNSBkYXlzKSBvZiB1bnByb3RlY3RlZCBpbnRlcmNvdXJzZSBvciBjb250cmFjZXB0aXZlIGZhaWx1cmUuIGlmIHZvbWl0aW5nIG9jY3VycyB3aXRoaW4gMyBob3VycyBvZiBhZG1pbmlzdHJhdGlvbiwgcmVwZWF0IGEgZG9zZSAob25lIHJlZmlsbCBwcm92aWRlZCkuIn0seyJzcGVjaWFsdHkiOiJPQkdZTiIsIm1lZCI6Ik1pc29wcm9zdG9sIiwiYnJhbmRzIjpbIkN5dG90ZWMiXSwiaW5kaWNhdGlvbiI6IkVhcmx5IHByZWduYW5jeSBsb3NzICg8MTMgd2Vla3MgZ2VzdGF0aW9uKSIsImRvc2VfdGV4dCI6IjgwMG1jZyIsInJvdXRlIjoiUFYiLCJmcmVxdWVuY3kiOiJvbmNlIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjIgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiTWF5IHJlcGVhdCB3aXRoIG9uZSBkb3NlIGlmIG5lZWRlZCwgXHUyMjY1MyBob3VycyBhZnRlciB0aGUgZmlyc3QgZG9zZSBhbmQgdHlwaWNhbGx5IHdpdGhpbiA3IGRheXMgaWYgbm8gcmVzcG9uc2UgdG8gdGhlIGluaXRpYWwgZG9zZSBpcyBvYnNlcnZlZC4gRm9sbG93IHVwIHdpdGggdXN1YWwgY2FyZSBwcm92aWRlci4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoib2JneW4gfCBhZHVsdCB8IGVhcmx5IHByZWduYW5jeSBsb3NzICg8MTMgd2Vla3MgZ2VzdGF0aW9uKSB8IG1pc29wcm9zdG9sIHwgY3l0b3RlYyB8IDgwMG1jZyB8IG1heSByZXBlYXQgd2l0aCBvbmUgZG9zZSBpZiBuZWVkZWQsIFx1MjI2NTMgaG91cnMgYWZ0ZXIgdGhlIGZpcnN0IGRvc2UgYW5kIHR5cGljYWxseSB3aXRoaW4gNyBkYXlzIGlmIG5vIHJlc3BvbnNlIHRvIHRoZSBpbml0aWFsIGRvc2UgaXMgb2JzZXJ2ZWQuIGZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIuIn0seyJzcGVjaWFsdHkiOiJPQkdZTiIsIm1lZCI6IkNvbmp1Z2F0ZWQgRXN0cm9nZW5zIHZhZ2luYWwgY3JlYW0iLCJicmFuZHMiOlsiUHJlbWFyaW4iXSwiaW5kaWNhdGlvbiI6Ikdlbml0b3VyaW5hcnkgc3luZHJvbWUgb2YgbWVub3BhdXNlIiwiZG9zZV90ZXh0IjoiMC41ZyIsInJvdXRlIjoiUFYiLCJmcmVxdWVuY3kiOiJPRCIsImR1cmF0aW9uIjoiNCB3ZWVrIiwiZGlzcGVuc2UiOiIxIHR1YmUiLCJwcm4iOiIiLCJmb3JtIjoiY3JlYW0iLCJjb21tZW50cyI6IkluaXRpYWw6IDAuNS0xIGcgb25jZSBkYWlseSBmb3IgMiB3ZWVrcy4gTWFpbnRlbmFuY2U6IDAuNS0xIGcgb25lIHRvIHRocmVlIHRpbWVzIHBlciB3ZWVrOyBhZGp1c3QgZG9zZSBiYXNlZCBvbiByZXNwb25zZSAocmFuZ2U6IDAuNS0yZy9kYXkpLiBGb2xsb3cgdXAgd2l0aCB1c3VhbCBjYXJlIHByb3ZpZGVyIGZvciByZWFzc2Vzc21lbnQvcmVmaWxsLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJvYmd5biB8IGFkdWx0IHwgZ2VuaXRvdXJpbmFyeSBzeW5kcm9tZSBvZiBtZW5vcGF1c2UgfCBjb25qdWdhdGVkIGVzdHJvZ2VucyB2YWdpbmFsIGNyZWFtIHwgcHJlbWFyaW4gfCAwLjVnIHwgaW5pdGlhbDogMC41LTEgZyBvbmNlIGRhaWx5IGZvciAyIHdlZWtzLiBtYWludGVuYW5jZTogMC41LTEgZyBvbmUgdG8gdGhyZWUgdGltZXMgcGVyIHdlZWs7IGFkanVzdCBkb3NlIGJhc2VkIG9uIHJlc3BvbnNlIChyYW5nZTogMC41LTJnL2RheSkuIGZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlYXNzZXNzbWVudC9yZWZpbGwuIn0seyJzcGVjaWFsdHkiOiJTVEkiLCJtZWQiOiJEb3h5Y3ljbGluZSIsImJyYW5kcyI6WyJWaWJyYW15Y2luIiwiRG94eWNpbiIsIkFwcHJpbG9uIl0sImluZGljYXRpb24iOiJDaGxhbXlkaWEiLCJkb3NlX3RleHQiOiIxMDBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIxNCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJBdm9pZCBpbiBwcmVnbmFuY3kuIFRyZWF0IHBhcnRuZXJzLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJzdGkgfCBhZHVsdCB8IGNobGFteWRpYSB8IGRveHljeWNsaW5lIHwgdmlicmFteWNpbiBkb3h5Y2luIGFwcHJpbG9uIHwgMTAwbWcgfCBhdm9pZCBpbiBwcmVnbmFuY3kuIHRyZWF0IHBhcnRuZXJzLiJ9LHsic3BlY2lhbHR5IjoiU1RJIiwibWVkIjoiVmFsYWN5Y2xvdmlyIiwiYnJhbmRzIjpbIlZhbHRyZXgiXSwiaW5kaWNhdGlvbiI6IkhTViAoaW5pdGlhbCBlcGlzb2RlKSIsImRvc2VfdGV4dCI6IjFnIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IjE0IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJzdGkgfCBhZHVsdCB8IGhzdiAoaW5pdGlhbCBlcGlzb2RlKSB8IHZhbGFjeWNsb3ZpciB8IHZhbHRyZXggfCAxZyJ9LHsic3BlY2lhbHR5IjoiU1RJIiwibWVkIjoiVmFsYWN5Y2xvdmlyIiwiYnJhbmRzIjpbIlZhbHRyZXgiXSwiaW5kaWNhdGlvbiI6IkhTViAocmVjdXJyZW50IGVwaXNvZGUpIiwiZG9zZV90ZXh0IjoiMWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiI1IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJzdGkgfCBhZHVsdCB8IGhzdiAocmVjdXJyZW50IGVwaXNvZGUpIHwgdmFsYWN5Y2xvdmlyIHwgdmFsdHJleCB8IDFnIn0seyJzcGVjaWFsdHkiOiJTVEkiLCJtZWQiOiJIZXBhdGl0aXMgQS1IZXBhdGl0aXMgQiB2YWNjaW5lIiwiYnJhbmRzIjpbXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjFtbCIsInJvdXRlIjoiSU0iLCJmcmVxdWVuY3kiOiIiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMyBkb3NlIiwicHJuIjoiIiwiZm9ybSI6ImluamVjdGlvbiIsImNvbW1lbnRzIjoiUGxlYXNlIGdldCBmaXJzdCBkb3NlIGFkbWluaXN0ZXJlZCBhdCBwYXRpZW50J3MgcHJlZmVyZW5jZSBhbmQgbmV4dCBkb3NlcyBhdCAxIG1vbnRoIGFuZCA2IG1vbnRocyB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6InN0aSB8IGFkdWx0IHwgaGVwYXRpdGlzIGEtaGVwYXRpdGlzIGIgdmFjY2luZSB8IDFtbCB8IHBsZWFzZSBnZXQgZmlyc3QgZG9zZSBhZG1pbmlzdGVyZWQgYXQgcGF0aWVudCdzIHByZWZlcmVuY2UgYW5kIG5leHQgZG9zZXMgYXQgMSBtb250aCBhbmQgNiBtb250aHMgd2l0aCB1c3VhbCBjYXJlIHByb3ZpZGVyLiJ9LHsic3BlY2lhbHR5IjoiU1RJIiwibWVkIjoiSGVwYXRpdGlzIEIgdmFjY2luZSIsImJyYW5kcyI6W10sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxbWwiLCJyb3V0ZSI6IklNIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjMgZG9zZSIsInBybiI6IiIsImZvcm0iOiJpbmplY3Rpb24iLCJjb21tZW50cyI6IlBsZWFzZSBnZXQgZmlyc3QgZG9zZSBhZG1pbmlzdGVyZWQgYXQgcGF0aWVudCdzIHByZWZlcmVuY2UgYW5kIG5leHQgZG9zZXMgYXQgMSBtb250aCBhbmQgNiBtb250aHMgd2l0aCB1c3VhbCBjYXJlIHByb3ZpZGVyLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJzdGkgfCBhZHVsdCB8IGhlcGF0aXRpcyBiIHZhY2NpbmUgfCAxbWwgfCBwbGVhc2UgZ2V0IGZpcnN0IGRvc2UgYWRtaW5pc3RlcmVkIGF0IHBhdGllbnQncyBwcmVmZXJlbmNlIGFuZCBuZXh0IGRvc2VzIGF0IDEgbW9udGggYW5kIDYgbW9udGhzIHdpdGggdXN1YWwgY2FyZSBwcm92aWRlci4ifSx7InNwZWNpYWx0eSI6IlNUSSIsIm1lZCI6IkVtdHJpY2l0YWJpbmUgKyBUZW5vZm92aXIiLCJicmFuZHMiOlsiVHJ1dmFkYSJdLCJpbmRpY2F0aW9uIjoiSElWIFBFUCAocG9zdC1leHBvc3VyZSBwcm9waHlsYXhpcykiLCJkb3NlX3RleHQiOiIxIHRhYiIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJPRCIsImR1cmF0aW9uIjoiMjggZGF5IiwiZGlzcGVuc2UiOiIyOCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJTdGFydCBhcyBzb29uIGFzIHBvc3NpYmxlIGFmdGVyIGV4cG9zdXJlIChhbmQgd2l0aGluIDcyIGhvdXJzIG9mIGV4cG9zdXJlKS4gVGFrZSBpbiBjb21iaW5hdGlvbiB3aXRoIERvbHV0ZWdyYXZpci4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoic3RpIHwgYWR1bHQgfCBoaXYgcGVwIChwb3N0LWV4cG9zdXJlIHByb3BoeWxheGlzKSB8IGVtdHJpY2l0YWJpbmUgKyB0ZW5vZm92aXIgfCB0cnV2YWRhIHwgMSB0YWIgfCBzdGFydCBhcyBzb29uIGFzIHBvc3NpYmxlIGFmdGVyIGV4cG9zdXJlIChhbmQgd2l0aGluIDcyIGhvdXJzIG9mIGV4cG9zdXJlKS4gdGFrZSBpbiBjb21iaW5hdGlvbiB3aXRoIGRvbHV0ZWdyYXZpci4ifSx7InNwZWNpYWx0eSI6IlNUSSIsIm1lZCI6IkRvbHV0ZWdyYXZpciIsImJyYW5kcyI6WyJUaXZpY2F5Il0sImluZGljYXRpb24iOiJISVYgUEVQIChwb3N0LWV4cG9zdXJlIHByb3BoeWxheGlzKSIsImRvc2VfdGV4dCI6IjUwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjI4IGRheSIsImRpc3BlbnNlIjoiMjggdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiU3RhcnQgYXMgc29vbiBhcyBwb3NzaWJsZSBhZnRlciBleHBvc3VyZSAoYW5kIHdpdGhpbiA3MiBob3VycyBvZiBleHBvc3VyZSkuIFRha2UgaW4gY29tYmluYXRpb24gd2l0aCBUcnV2YWRhLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJzdGkgfCBhZHVsdCB8IGhpdiBwZXAgKHBvc3QtZXhwb3N1cmUgcHJvcGh5bGF4aXMpIHwgZG9sdXRlZ3JhdmlyIHwgdGl2aWNheSB8IDUwbWcgfCBzdGFydCBhcyBzb29uIGFzIHBvc3NpYmxlIGFmdGVyIGV4cG9zdXJlIChhbmQgd2l0aGluIDcyIGhvdXJzIG9mIGV4cG9zdXJlKS4gdGFrZSBpbiBjb21iaW5hdGlvbiB3aXRoIHRydXZhZGEuIn0seyJzcGVjaWFsdHkiOiJEZXJtIiwibWVkIjoiSHlkcm9jb3J0aXNvbmUgY3JlYW0gKDElKSIsImJyYW5kcyI6WyJIeWRlcm0iLCJDb3J0YXRlIiwiRW1vLUNvcnQiXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjEgYXBwbGljYXRpb24iLCJyb3V0ZSI6InRvcGljYWwiLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjIgd2VlayIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoiIiwiZm9ybSI6ImNyZWFtIiwiY29tbWVudHMiOiJMb3cgcG90ZW5jeSBmb3IgZmFjZSwgc3RvcCBvbmNlIHN5bXB0b21zIHJlc29sdmUuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImRlcm0gfCBhZHVsdCB8IGh5ZHJvY29ydGlzb25lIGNyZWFtICgxJSkgfCBoeWRlcm0gY29ydGF0ZSBlbW8tY29ydCB8IDEgYXBwbGljYXRpb24gfCBsb3cgcG90ZW5jeSBmb3IgZmFjZSwgc3RvcCBvbmNlIHN5bXB0b21zIHJlc29sdmUuIn0seyJzcGVjaWFsdHkiOiJEZXJtIiwibWVkIjoiSHlkcm9jb3J0aXNvbmUgb2ludG1lbnQgKDElKSIsImJyYW5kcyI6WyJIeWRlcm0iLCJDb3J0YXRlIiwiRW1vLUNvcnQiXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjEgYXBwbGljYXRpb24iLCJyb3V0ZSI6InRvcGljYWwiLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjIgd2VlayIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoiIiwiZm9ybSI6Im9pbnRtZW50IiwiY29tbWVudHMiOiJMb3cgcG90ZW5jeSBmb3IgZmFjZSwgc3RvcCBvbmNlIHN5bXB0b21zIHJlc29sdmUuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImRlcm0gfCBhZHVsdCB8IGh5ZHJvY29ydGlzb25lIG9pbnRtZW50ICgxJSkgfCBoeWRlcm0gY29ydGF0ZSBlbW8tY29ydCB8IDEgYXBwbGljYXRpb24gfCBsb3cgcG90ZW5jeSBmb3IgZmFjZSwgc3RvcCBvbmNlIHN5bXB0b21zIHJlc29sdmUuIn0seyJzcGVjaWFsdHkiOiJEZXJtIiwibWVkIjoiSHlkcm9jb3J0aXNvbmUgVmFsZXJhdGUgY3JlYW0gKDAuMiUpIiwiYnJhbmRzIjpbIkh5ZHJvVmFsIiwiV2VzdGNvcnQiXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjEgYXBwbGljYXRpb24iLCJyb3V0ZSI6InRvcGljYWwiLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjIgd2VlayIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoiIiwiZm9ybSI6ImNyZWFtIiwiY29tbWVudHMiOiJNb2RlcmF0ZSBwb3RlbmN5IGZvciBib2R5LCBzdG9wIG9uY2Ugc3ltcHRvbXMgcmVzb2x2ZS4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZGVybSB8IGFkdWx0IHwgaHlkcm9jb3J0aXNvbmUgdmFsZXJhdGUgY3JlYW0gKDAuMiUpIHwgaHlkcm92YWwgd2VzdGNvcnQgfCAxIGFwcGxpY2F0aW9uIHwgbW9kZXJhdGUgcG90ZW5jeSBmb3IgYm9keSwgc3RvcCBvbmNlIHN5bXB0b21zIHJlc29sdmUuIn0seyJzcGVjaWFsdHkiOiJEZXJtIiwibWVkIjoiSHlkcm9jb3J0aXNvbmUgVmFsZXJhdGUgb2ludG1lbnQgKDAuMiUpIiwiYnJhbmRzIjpbIkh5ZHJvVmFsIiwiV2VzdGNvcnQiXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjEgYXBwbGljYXRpb24iLCJyb3V0ZSI6InRvcGljYWwiLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjIgd2VlayIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoiIiwiZm9ybSI6Im9pbnRtZW50IiwiY29tbWVudHMiOiJNb2RlcmF0ZSBwb3RlbmN5IGZvciBib2R5LCBzdG9wIG9uY2Ugc3ltcHRvbXMgcmVzb2x2ZS4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZGVybSB8IGFkdWx0IHwgaHlkcm9jb3J0aXNvbmUgdmFsZXJhdGUgb2ludG1lbnQgKDAuMiUpIHwgaHlkcm92YWwgd2VzdGNvcnQgfCAxIGFwcGxpY2F0aW9uIHwgbW9kZXJhdGUgcG90ZW5jeSBmb3IgYm9keSwgc3RvcCBvbmNlIHN5bXB0b21zIHJlc29sdmUuIn0seyJzcGVjaWFsdHkiOiJEZXJtIiwibWVkIjoiQ2xvYmV0YXNvbCBjcmVhbSAoMC4wNSUpIiwiYnJhbmRzIjpbIkRlcm1vdmF0ZSIsIkNsb2JleCIsIlRlbW92YXRlIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0b3BpY2FsIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIyIHdlZWsiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJjcmVhbSIsImNvbW1lbnRzIjoiSGlnaCBwb3RlbmN5IGZvciBib2R5LCBzdG9wIG9uY2Ugc3ltcHRvbXMgcmVzb2x2ZS4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZGVybSB8IGFkdWx0IHwgY2xvYmV0YXNvbCBjcmVhbSAoMC4wNSUpIHwgZGVybW92YXRlIGNsb2JleCB0ZW1vdmF0ZSB8IDEgYXBwbGljYXRpb24gfCBoaWdoIHBvdGVuY3kgZm9yIGJvZHksIHN0b3Agb25jZSBzeW1wdG9tcyByZXNvbHZlLiJ9LHsic3BlY2lhbHR5IjoiRGVybSIsIm1lZCI6IkJldGFtZXRoYXNvbmUgRGlwcm9waW9uYXRlIG9pbnRtZW50ICgwLjA1JSkiLCJicmFuZHMiOlsiRGlwcm9zb25lIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0b3BpY2FsIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIyIHdlZWsiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJvaW50bWVudCIsImNvbW1lbnRzIjoiSGlnaCBwb3RlbmN5IGZvciBib2R5LCBzdG9wIG9uY2Ugc3ltcHRvbXMgcmVzb2x2ZS4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZGVybSB8IGFkdWx0IHwgYmV0YW1ldGhhc29uZSBkaXByb3Bpb25hdGUgb2ludG1lbnQgKDAuMDUlKSB8IGRpcHJvc29uZSB8IDEgYXBwbGljYXRpb24gfCBoaWdoIHBvdGVuY3kgZm9yIGJvZHksIHN0b3Agb25jZSBzeW1wdG9tcyByZXNvbHZlLiJ9LHsic3BlY2lhbHR5IjoiRGVybSIsIm1lZCI6IkNhbmVzdGVuICgxJSkgKyBIeWRyb2NvcnRpc29uZSAoMSUpIGNyZWFtIiwiYnJhbmRzIjpbIkNhbmVzdGVuIEhDIiwiTG90cmlzb25lIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0b3BpY2FsIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIyIHdlZWsiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJjcmVhbSIsImNvbW1lbnRzIjoiU3RvcCBvbmNlIHN5bXB0b21zIHJlc29sdmUuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImRlcm0gfCBhZHVsdCB8IGNhbmVzdGVuICgxJSkgKyBoeWRyb2NvcnRpc29uZSAoMSUpIGNyZWFtIHwgY2FuZXN0ZW4gaGMgbG90cmlzb25lIHwgMSBhcHBsaWNhdGlvbiB8IHN0b3Agb25jZSBzeW1wdG9tcyByZXNvbHZlLiJ9LHsic3BlY2lhbHR5IjoiRGVybSIsIm1lZCI6IktldG9jb25hem9sZSBjcmVhbSAoMiUpIiwiYnJhbmRzIjpbIk1vbmlzdGF0IiwiTWljYXRpbiJdLCJpbmRpY2F0aW9uIjoiQ3V0YW5lb3VzIGNhbmRpZGlhc2lzIiwiZG9zZV90ZXh0IjoiMSBhcHBsaWNhdGlvbiIsInJvdXRlIjoidG9waWNhbCIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiIyIHdlZWsiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJjcmVhbSIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImRlcm0gfCBhZHVsdCB8IGN1dGFuZW91cyBjYW5kaWRpYXNpcyB8IGtldG9jb25hem9sZSBjcmVhbSAoMiUpIHwgbW9uaXN0YXQgbWljYXRpbiB8IDEgYXBwbGljYXRpb24ifSx7InNwZWNpYWx0eSI6IkRlcm0iLCJtZWQiOiJQZXJtZXRocmluIGxvdGlvbiAoMSUpIiwiYnJhbmRzIjpbIk5peCIsIkt3ZWxsYWRhLVAiXSwiaW5kaWNhdGlvbiI6IkhlYWQgbGljZSIsImRvc2VfdGV4dCI6IiIsInJvdXRlIjoiIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiIiLCJjb21tZW50cyI6Ildhc2ggaGFpciBiZWZvcmUgYXBwbGljYXRpb24uIEFwcGx5IGxvdGlvbiB0byBzYXR1cmF0ZSBoYWlyIGFuZCBzY2FscCwgbGVhdmUgaW4gZm9yIDEwIG1pbnV0ZXMgdGhlbiByaW5zZS4gUmVtb3ZlIHJlbWFpbmluZyBuaXRzIHdpdGggY29tYi4gUmVwZWF0IHRyZWF0bWVudCBpbiA3IGRheXMuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIxIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImRlcm0gfCBhZHVsdCB8IGhlYWQgbGljZSB8IHBlcm1ldGhyaW4gbG90aW9uICgxJSkgfCBuaXgga3dlbGxhZGEtcCB8IHdhc2ggaGFpciBiZWZvcmUgYXBwbGljYXRpb24uIGFwcGx5IGxvdGlvbiB0byBzYXR1cmF0ZSBoYWlyIGFuZCBzY2FscCwgbGVhdmUgaW4gZm9yIDEwIG1pbnV0ZXMgdGhlbiByaW5zZS4gcmVtb3ZlIHJlbWFpbmluZyBuaXRzIHdpdGggY29tYi4gcmVwZWF0IHRyZWF0bWVudCBpbiA3IGRheXMuIn0seyJzcGVjaWFsdHkiOiJEZXJtIiwibWVkIjoiUGVybWV0aHJpbiBjcmVhbSAoNSUpIiwiYnJhbmRzIjpbIk5peCIsIkt3ZWxsYWRhLVAiXSwiaW5kaWNhdGlvbiI6IlNjYWJpZXMiLCJkb3NlX3RleHQiOiIiLCJyb3V0ZSI6IiIsImZyZXF1ZW5jeSI6IiIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxIHR1YmUiLCJwcm4iOiIiLCJmb3JtIjoiIiwiY29tbWVudHMiOiJBcHBseSB0byBlbnRpcmUgYm9keSBmcm9tIHNjYWxwIHRvIHNvbGVzICgzMCBnIGZvciBhdmVyYWdlIGFkdWx0KTsgbGVhdmUgb24gZm9yIDgtMTQgaG91cnMgd2FzaGluZyBvZmYuIFJlcGVhdCB0cmVhdG1lbnQgaW4gNyBkYXlzLiBUcmVhdCBjbG9zZSBjb250YWN0cy4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjEiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZGVybSB8IGFkdWx0IHwgc2NhYmllcyB8IHBlcm1ldGhyaW4gY3JlYW0gKDUlKSB8IG5peCBrd2VsbGFkYS1wIHwgYXBwbHkgdG8gZW50aXJlIGJvZHkgZnJvbSBzY2FscCB0byBzb2xlcyAoMzAgZyBmb3IgYXZlcmFnZSBhZHVsdCk7IGxlYXZlIG9uIGZvciA4LTE0IGhvdXJzIHdhc2hpbmcgb2ZmLiByZXBlYXQgdHJlYXRtZW50IGluIDcgZGF5cy4gdHJlYXQgY2xvc2UgY29udGFjdHMuIn0seyJzcGVjaWFsdHkiOiJEZXJtIiwibWVkIjoiU2lsdmVyIFN1bGZhZGlhemluZSBjcmVhbSIsImJyYW5kcyI6WyJGbGFtYXppbmUiLCJTaWx2YWRlbmUiXSwiaW5kaWNhdGlvbiI6IkJ1cm4iLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0b3BpY2FsIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIyIHdlZWsiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJjcmVhbSIsImNvbW1lbnRzIjoiU3RvcCBvbmNlIGhlYWxpbmcgaGFzIG9jY3VycmVkLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJkZXJtIHwgYWR1bHQgfCBidXJuIHwgc2lsdmVyIHN1bGZhZGlhemluZSBjcmVhbSB8IGZsYW1hemluZSBzaWx2YWRlbmUgfCAxIGFwcGxpY2F0aW9uIHwgc3RvcCBvbmNlIGhlYWxpbmcgaGFzIG9jY3VycmVkLiJ9LHsic3BlY2lhbHR5IjoiRGVybSIsIm1lZCI6IkZ1c2lkaWMgQWNpZCBjcmVhbSAoMiUpIiwiYnJhbmRzIjpbIkZ1Y2lkaW4iXSwiaW5kaWNhdGlvbiI6IlNraW4gaW5mZWN0aW9uIiwiZG9zZV90ZXh0IjoiMSBhcHBsaWNhdGlvbiIsInJvdXRlIjoidG9waWNhbCIsImZyZXF1ZW5jeSI6IlRJRCIsImR1cmF0aW9uIjoiMiB3ZWVrIiwiZGlzcGVuc2UiOiIxIHR1YmUiLCJwcm4iOiIiLCJmb3JtIjoiY3JlYW0iLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJkZXJtIHwgYWR1bHQgfCBza2luIGluZmVjdGlvbiB8IGZ1c2lkaWMgYWNpZCBjcmVhbSAoMiUpIHwgZnVjaWRpbiB8IDEgYXBwbGljYXRpb24ifSx7InNwZWNpYWx0eSI6IkRlcm0iLCJtZWQiOiJNdXBpcm9jaW4gY3JlYW0gKDIlKSIsImJyYW5kcyI6WyJCYWN0cm9iYW4iXSwiaW5kaWNhdGlvbiI6IkZvbGxpY3VsaXRpcy9pbXBldGlnbyIsImRvc2VfdGV4dCI6IjEgYXBwbGljYXRpb24iLCJyb3V0ZSI6InRvcGljYWwiLCJmcmVxdWVuY3kiOiJUSUQiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIxIHR1YmUiLCJwcm4iOiIiLCJmb3JtIjoiY3JlYW0iLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJkZXJtIHwgYWR1bHQgfCBmb2xsaWN1bGl0aXMvaW1wZXRpZ28gfCBtdXBpcm9jaW4gY3JlYW0gKDIlKSB8IGJhY3Ryb2JhbiB8IDEgYXBwbGljYXRpb24ifSx7InNwZWNpYWx0eSI6IkRlcm0iLCJtZWQiOiJDZXBoYWxleGluIiwiYnJhbmRzIjpbIktlZmxleCJdLCJpbmRpY2F0aW9uIjoiU2tpbiBpbmZlY3Rpb24gKG1pbGQpIiwiZG9zZV90ZXh0IjoiNTAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiUUlEIiwiZHVyYXRpb24iOiI1IGRheSIsImRpc3BlbnNlIjoiMjAgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImRlcm0gfCBhZHVsdCB8IHNraW4gaW5mZWN0aW9uIChtaWxkKSB8IGNlcGhhbGV4aW4gfCBrZWZsZXggfCA1MDBtZyJ9LHsic3BlY2lhbHR5IjoiRGVybSIsIm1lZCI6IkNlcGhhbGV4aW4iLCJicmFuZHMiOlsiS2VmbGV4Il0sImluZGljYXRpb24iOiJTa2luIGluZmVjdGlvbiAobWlsZCkiLCJkb3NlX3RleHQiOiI1MDBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJRSUQiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIyOCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZGVybSB8IGFkdWx0IHwgc2tpbiBpbmZlY3Rpb24gKG1pbGQpIHwgY2VwaGFsZXhpbiB8IGtlZmxleCB8IDUwMG1nIn0seyJzcGVjaWFsdHkiOiJEZXJtIiwibWVkIjoiQ2VmYWRyb3hpbCIsImJyYW5kcyI6WyJEdXJpY2VmIl0sImluZGljYXRpb24iOiJTa2luIGluZmVjdGlvbiAobWlsZCkiLCJkb3NlX3RleHQiOiI1MDBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIxNCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJJZiB1bmF2YWlsYWJsZSwgbWF5IHJlcGxhY2Ugd2l0aCBjZXBoYWxleGluIDUwMG1nIFBPIFFJRCBmb3IgNyBkYXlzLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJkZXJtIHwgYWR1bHQgfCBza2luIGluZmVjdGlvbiAobWlsZCkgfCBjZWZhZHJveGlsIHwgZHVyaWNlZiB8IDUwMG1nIHwgaWYgdW5hdmFpbGFibGUsIG1heSByZXBsYWNlIHdpdGggY2VwaGFsZXhpbiA1MDBtZyBwbyBxaWQgZm9yIDcgZGF5cy4ifSx7InNwZWNpYWx0eSI6IkRlcm0iLCJtZWQiOiJNb3hpZmxveGFjaW4iLCJicmFuZHMiOlsiQXZlbG94Il0sImluZGljYXRpb24iOiJTa2luIGluZmVjdGlvbiAobWlsZCwgY2VwaGFsb3Nwb3JpbiBhbGxlcmd5KSIsImRvc2VfdGV4dCI6IjQwMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6Ik9EIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiNyB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZGVybSB8IGFkdWx0IHwgc2tpbiBpbmZlY3Rpb24gKG1pbGQsIGNlcGhhbG9zcG9yaW4gYWxsZXJneSkgfCBtb3hpZmxveGFjaW4gfCBhdmVsb3ggfCA0MDBtZyJ9LHsic3BlY2lhbHR5IjoiRGVybSIsIm1lZCI6IlRNUC9TTVggRFMgKDgwMC8xNjBtZykiLCJicmFuZHMiOlsiU2VwdHJhIERTIiwiQmFjdHJpbSBEUyIsIlN1bGZhbWV0aG94YXpvbGUgKyBUcmltZXRob3ByaW0gRFMiLCJUTVAtU01YIERTIl0sImluZGljYXRpb24iOiJTa2luIGluZmVjdGlvbiAoTVJTQSBjb3ZlcmFnZSkiLCJkb3NlX3RleHQiOiIxIHRhYiIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIxNCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZGVybSB8IGFkdWx0IHwgc2tpbiBpbmZlY3Rpb24gKG1yc2EgY292ZXJhZ2UpIHwgdG1wL3NteCBkcyAoODAwLzE2MG1nKSB8IHNlcHRyYSBkcyBiYWN0cmltIGRzIHN1bGZhbWV0aG94YXpvbGUgKyB0cmltZXRob3ByaW0gZHMgdG1wLXNteCBkcyB8IDEgdGFiIn0seyJzcGVjaWFsdHkiOiJEZXJtIiwibWVkIjoiQW1veC1DbGF2ICg4NzUvMTI1bWcpIiwiYnJhbmRzIjpbIkNsYXZ1bGluIiwiQXVnbWVudGluIl0sImluZGljYXRpb24iOiJTa2luIGluZmVjdGlvbiAobW9kZXJhdGUpIiwiZG9zZV90ZXh0IjoiMSB0YWIiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIxNCBkYXkiLCJkaXNwZW5zZSI6IjI4IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJkZXJtIHwgYWR1bHQgfCBza2luIGluZmVjdGlvbiAobW9kZXJhdGUpIHwgYW1veC1jbGF2ICg4NzUvMTI1bWcpIHwgY2xhdnVsaW4gYXVnbWVudGluIHwgMSB0YWIifSx7InNwZWNpYWx0eSI6IkRlcm0iLCJtZWQiOiJBbW94LUNsYXYgKDg3NS8xMjVtZykiLCJicmFuZHMiOlsiQ2xhdnVsaW4iLCJBdWdtZW50aW4iXSwiaW5kaWNhdGlvbiI6IkFuaW1hbCBiaXRlIGluZmVjdGlvbiBwcm9waHlsYXhpcyIsImRvc2VfdGV4dCI6IjEgdGFiIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiNSBkYXkiLCJkaXNwZW5zZSI6IjEwIHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJkZXJtIHwgYWR1bHQgfCBhbmltYWwgYml0ZSBpbmZlY3Rpb24gcHJvcGh5bGF4aXMgfCBhbW94LWNsYXYgKDg3NS8xMjVtZykgfCBjbGF2dWxpbiBhdWdtZW50aW4gfCAxIHRhYiJ9LHsic3BlY2lhbHR5IjoiRGVybSIsIm1lZCI6IkFtb3gtQ2xhdiAoODc1LzEyNW1nKSIsImJyYW5kcyI6WyJDbGF2dWxpbiIsIkF1Z21lbnRpbiJdLCJpbmRpY2F0aW9uIjoiQW5pbWFsIGJpdGUgaW5mZWN0aW9uIHRyZWF0bWVudCIsImRvc2VfdGV4dCI6IjEgdGFiIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IjE0IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJkZXJtIHwgYWR1bHQgfCBhbmltYWwgYml0ZSBpbmZlY3Rpb24gdHJlYXRtZW50IHwgYW1veC1jbGF2ICg4NzUvMTI1bWcpIHwgY2xhdnVsaW4gYXVnbWVudGluIHwgMSB0YWIifSx7InNwZWNpYWx0eSI6IkRlcm0iLCJtZWQiOiJEb3h5Y3ljbGluZSIsImJyYW5kcyI6WyJWaWJyYW15Y2luIiwiRG94eWNpbiIsIkFwcHJpbG9uIl0sImluZGljYXRpb24iOiJMeW1lIChlcnl0aGVtYSBtaWdyYW5zKSIsImRvc2VfdGV4dCI6IjEwMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiMTAgZGF5IiwiZGlzcGVuc2UiOiIyMCB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJBdm9pZCBpbiBwcmVnbmFuY3kgb3IgbGFjdGF0aW5nIHBlb3BsZS4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZGVybSB8IGFkdWx0IHwgbHltZSAoZXJ5dGhlbWEgbWlncmFucykgfCBkb3h5Y3ljbGluZSB8IHZpYnJhbXljaW4gZG94eWNpbiBhcHByaWxvbiB8IDEwMG1nIHwgYXZvaWQgaW4gcHJlZ25hbmN5IG9yIGxhY3RhdGluZyBwZW9wbGUuIn0seyJzcGVjaWFsdHkiOiJEZXJtIiwibWVkIjoiUHJlZG5pc29uZSIsImJyYW5kcyI6WyJXaW5wcmVkIiwiRGVsdGFzb25lIiwiUmF5b3MiXSwiaW5kaWNhdGlvbiI6IkJlbGwncyBwYWxzeSIsImRvc2VfdGV4dCI6IjYwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZGVybSB8IGFkdWx0IHwgYmVsbCdzIHBhbHN5IHwgcHJlZG5pc29uZSB8IHdpbnByZWQgZGVsdGFzb25lIHJheW9zIHwgNjBtZyJ9LHsic3BlY2lhbHR5IjoiRGVybSIsIm1lZCI6IlZhbGFjeWNsb3ZpciIsImJyYW5kcyI6WyJWYWx0cmV4Il0sImluZGljYXRpb24iOiJCZWxsJ3MgcGFsc3kiLCJkb3NlX3RleHQiOiIxZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJUSUQiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZGVybSB8IGFkdWx0IHwgYmVsbCdzIHBhbHN5IHwgdmFsYWN5Y2xvdmlyIHwgdmFsdHJleCB8IDFnIn0seyJzcGVjaWFsdHkiOiJEZXJtIiwibWVkIjoiVmFsYWN5Y2xvdmlyIiwiYnJhbmRzIjpbIlZhbHRyZXgiXSwiaW5kaWNhdGlvbiI6IlNoaW5nbGVzIiwiZG9zZV90ZXh0IjoiMWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiVElEIiwiZHVyYXRpb24iOiIxMCBkYXkiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJkZXJtIHwgYWR1bHQgfCBzaGluZ2xlcyB8IHZhbGFjeWNsb3ZpciB8IHZhbHRyZXggfCAxZyJ9LHsic3BlY2lhbHR5IjoiRGVybSIsIm1lZCI6Ik5ld21hbidzIE5pcHBsZSBPaW50bWVudCIsImJyYW5kcyI6W10sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0b3BpY2FsIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjMwZyIsInBybiI6IlBhaW4iLCJmb3JtIjoib2ludG1lbnQiLCJjb21tZW50cyI6IkNvbXBvdW5kIChmaWxsIGF0IGNvbXBvdW5kaW5nIHBoYXJtYWN5KTogbXVwaXJvY2luIDIlIG9pbnRtZW50IDE1ZyArIGJldGFtZXRoYXNvbmUgMC4xJSBvaW50bWVudCAxNWcgKyBtaWNvbmF6b2xlIHBvd2RlciB0byBmaW5hbCAyJSBjb25jZW50cmF0aW9uLiBObyBzdWJzdGl0dXRpb25zLiBBcHBseSBzcGFyaW5nbHkgYWZ0ZXIgZWFjaCBmZWVkLiBEbyBub3Qgd2FzaCBvciB3aXBlIG9mZi4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjEiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZGVybSB8IGFkdWx0IHwgbmV3bWFuJ3MgbmlwcGxlIG9pbnRtZW50IHwgMSBhcHBsaWNhdGlvbiB8IHBhaW4gfCBjb21wb3VuZCAoZmlsbCBhdCBjb21wb3VuZGluZyBwaGFybWFjeSk6IG11cGlyb2NpbiAyJSBvaW50bWVudCAxNWcgKyBiZXRhbWV0aGFzb25lIDAuMSUgb2ludG1lbnQgMTVnICsgbWljb25hem9sZSBwb3dkZXIgdG8gZmluYWwgMiUgY29uY2VudHJhdGlvbi4gbm8gc3Vic3RpdHV0aW9ucy4gYXBwbHkgc3BhcmluZ2x5IGFmdGVyIGVhY2ggZmVlZC4gZG8gbm90IHdhc2ggb3Igd2lwZSBvZmYuIn0seyJzcGVjaWFsdHkiOiJEZXJtIiwibWVkIjoiSHlkcm9jb3J0aXNvbmUgY3JlYW0gKDElKSIsImJyYW5kcyI6WyJIeWRlcm0iLCJDb3J0YXRlIiwiRW1vLUNvcnQiXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjEgYXBwbGljYXRpb24iLCJyb3V0ZSI6InRvcGljYWwiLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjEgd2VlayIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoiIiwiZm9ybSI6ImNyZWFtIiwiY29tbWVudHMiOiJMb3cgcG90ZW5jeSBmb3IgZmFjZSwgc3RvcCBvbmNlIHN5bXB0b21zIHJlc29sdmUuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJkZXJtIHwgcGVkaWF0cmljIHwgaHlkcm9jb3J0aXNvbmUgY3JlYW0gKDElKSB8IGh5ZGVybSBjb3J0YXRlIGVtby1jb3J0IHwgMSBhcHBsaWNhdGlvbiB8IGxvdyBwb3RlbmN5IGZvciBmYWNlLCBzdG9wIG9uY2Ugc3ltcHRvbXMgcmVzb2x2ZS4ifSx7InNwZWNpYWx0eSI6IkRlcm0iLCJtZWQiOiJIeWRyb2NvcnRpc29uZSBvaW50bWVudCAoMSUpIiwiYnJhbmRzIjpbIkh5ZGVybSIsIkNvcnRhdGUiLCJFbW8tQ29ydCJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMSBhcHBsaWNhdGlvbiIsInJvdXRlIjoidG9waWNhbCIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiMiB3ZWVrIiwiZGlzcGVuc2UiOiIxIHR1YmUiLCJwcm4iOiIiLCJmb3JtIjoib2ludG1lbnQiLCJjb21tZW50cyI6IkxvdyBwb3RlbmN5IGZvciBmYWNlLCBzdG9wIG9uY2Ugc3ltcHRvbXMgcmVzb2x2ZS4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImRlcm0gfCBwZWRpYXRyaWMgfCBoeWRyb2NvcnRpc29uZSBvaW50bWVudCAoMSUpIHwgaHlkZXJtIGNvcnRhdGUgZW1vLWNvcnQgfCAxIGFwcGxpY2F0aW9uIHwgbG93IHBvdGVuY3kgZm9yIGZhY2UsIHN0b3Agb25jZSBzeW1wdG9tcyByZXNvbHZlLiJ9LHsic3BlY2lhbHR5IjoiRGVybSIsIm1lZCI6Ikh5ZHJvY29ydGlzb25lIFZhbGVyYXRlIGNyZWFtICgwLjIlKSIsImJyYW5kcyI6WyJIeWRyb1ZhbCIsIldlc3Rjb3J0Il0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0b3BpY2FsIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIyIHdlZWsiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJjcmVhbSIsImNvbW1lbnRzIjoiTW9kZXJhdGUgcG90ZW5jeSBmb3IgYm9keSwgc3RvcCBvbmNlIHN5bXB0b21zIHJlc29sdmUuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJkZXJtIHwgcGVkaWF0cmljIHwgaHlkcm9jb3J0aXNvbmUgdmFsZXJhdGUgY3JlYW0gKDAuMiUpIHwgaHlkcm92YWwgd2VzdGNvcnQgfCAxIGFwcGxpY2F0aW9uIHwgbW9kZXJhdGUgcG90ZW5jeSBmb3IgYm9keSwgc3RvcCBvbmNlIHN5bXB0b21zIHJlc29sdmUuIn0seyJzcGVjaWFsdHkiOiJEZXJtIiwibWVkIjoiSHlkcm9jb3J0aXNvbmUgVmFsZXJhdGUgb2ludG1lbnQgKDAuMiUpIiwiYnJhbmRzIjpbIkh5ZHJvVmFsIiwiV2VzdGNvcnQiXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjEgYXBwbGljYXRpb24iLCJyb3V0ZSI6InRvcGljYWwiLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjIgd2VlayIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoiIiwiZm9ybSI6Im9pbnRtZW50IiwiY29tbWVudHMiOiJNb2RlcmF0ZSBwb3RlbmN5IGZvciBib2R5LCBzdG9wIG9uY2Ugc3ltcHRvbXMgcmVzb2x2ZS4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImRlcm0gfCBwZWRpYXRyaWMgfCBoeWRyb2NvcnRpc29uZSB2YWxlcmF0ZSBvaW50bWVudCAoMC4yJSkgfCBoeWRyb3ZhbCB3ZXN0Y29ydCB8IDEgYXBwbGljYXRpb24gfCBtb2RlcmF0ZSBwb3RlbmN5IGZvciBib2R5LCBzdG9wIG9uY2Ugc3ltcHRvbXMgcmVzb2x2ZS4ifSx7InNwZWNpYWx0eSI6IkRlcm0iLCJtZWQiOiJDbG9iZXRhc29sIGNyZWFtICgwLjA1JSkiLCJicmFuZHMiOlsiRGVybW92YXRlIiwiQ2xvYmV4IiwiVGVtb3ZhdGUiXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IjEgYXBwbGljYXRpb24iLCJyb3V0ZSI6InRvcGljYWwiLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjIgd2VlayIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoiIiwiZm9ybSI6ImNyZWFtIiwiY29tbWVudHMiOiJGb3IgYWdlIFx1MjI2NTEyIHllYXJzLiBIaWdoIHBvdGVuY3kgZm9yIGJvZHksIHN0b3Agb25jZSBzeW1wdG9tcyByZXNvbHZlLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZGVybSB8IHBlZGlhdHJpYyB8IGNsb2JldGFzb2wgY3JlYW0gKDAuMDUlKSB8IGRlcm1vdmF0ZSBjbG9iZXggdGVtb3ZhdGUgfCAxIGFwcGxpY2F0aW9uIHwgZm9yIGFnZSBcdTIyNjUxMiB5ZWFycy4gaGlnaCBwb3RlbmN5IGZvciBib2R5LCBzdG9wIG9uY2Ugc3ltcHRvbXMgcmVzb2x2ZS4ifSx7InNwZWNpYWx0eSI6IkRlcm0iLCJtZWQiOiJCZXRhbWV0aGFzb25lIERpcHJvcGlvbmF0ZSBvaW50bWVudCAoMC4wNSUpIiwiYnJhbmRzIjpbIkRpcHJvc29uZSJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMSBhcHBsaWNhdGlvbiIsInJvdXRlIjoidG9waWNhbCIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiMiB3ZWVrIiwiZGlzcGVuc2UiOiIxIHR1YmUiLCJwcm4iOiIiLCJmb3JtIjoib2ludG1lbnQiLCJjb21tZW50cyI6IkZvciBhZ2UgXHUyMjY1MTIgeWVhcnMuIEhpZ2ggcG90ZW5jeSBmb3IgYm9keSwgc3RvcCBvbmNlIHN5bXB0b21zIHJlc29sdmUuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJkZXJtIHwgcGVkaWF0cmljIHwgYmV0YW1ldGhhc29uZSBkaXByb3Bpb25hdGUgb2ludG1lbnQgKDAuMDUlKSB8IGRpcHJvc29uZSB8IDEgYXBwbGljYXRpb24gfCBmb3IgYWdlIFx1MjI2NTEyIHllYXJzLiBoaWdoIHBvdGVuY3kgZm9yIGJvZHksIHN0b3Agb25jZSBzeW1wdG9tcyByZXNvbHZlLiJ9LHsic3BlY2lhbHR5IjoiRGVybSIsIm1lZCI6IkNhbmVzdGVuICgxJSkgKyBIeWRyb2NvcnRpc29uZSAoMSUpIGNyZWFtIiwiYnJhbmRzIjpbIkNhbmVzdGVuIEhDIiwiTG90cmlzb25lIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0b3BpY2FsIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIxIHdlZWsiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJjcmVhbSIsImNvbW1lbnRzIjoiU3RvcCBvbmNlIHN5bXB0b21zIHJlc29sdmUuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJkZXJtIHwgcGVkaWF0cmljIHwgY2FuZXN0ZW4gKDElKSArIGh5ZHJvY29ydGlzb25lICgxJSkgY3JlYW0gfCBjYW5lc3RlbiBoYyBsb3RyaXNvbmUgfCAxIGFwcGxpY2F0aW9uIHwgc3RvcCBvbmNlIHN5bXB0b21zIHJlc29sdmUuIn0seyJzcGVjaWFsdHkiOiJEZXJtIiwibWVkIjoiS2V0b2NvbmF6b2xlIGdlbCAoMiUpIiwiYnJhbmRzIjpbIk1vbmlzdGF0IiwiTWljYXRpbiJdLCJpbmRpY2F0aW9uIjoiU2Vib3JyaGVpYyBkZXJtYXRpdGlzIChhZ2UgXHUyMjY1MTIgeWVhcnMpIiwiZG9zZV90ZXh0IjoiMSBhcHBsaWNhdGlvbiIsInJvdXRlIjoidG9waWNhbCIsImZyZXF1ZW5jeSI6IkJJRCIsImR1cmF0aW9uIjoiMiB3ZWVrIiwiZGlzcGVuc2UiOiIxIHR1YmUiLCJwcm4iOiIiLCJmb3JtIjoiZ2VsIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImRlcm0gfCBwZWRpYXRyaWMgfCBzZWJvcnJoZWljIGRlcm1hdGl0aXMgKGFnZSBcdTIyNjUxMiB5ZWFycykgfCBrZXRvY29uYXpvbGUgZ2VsICgyJSkgfCBtb25pc3RhdCBtaWNhdGluIHwgMSBhcHBsaWNhdGlvbiJ9LHsic3BlY2lhbHR5IjoiRGVybSIsIm1lZCI6IlBlcm1ldGhyaW4gbG90aW9uICgxJSkiLCJicmFuZHMiOlsiTml4IiwiS3dlbGxhZGEtUCJdLCJpbmRpY2F0aW9uIjoiSGVhZCBsaWNlIChhZ2UgXHUyMjY1MiBtb250aHMpIiwiZG9zZV90ZXh0IjoiIiwicm91dGUiOiIiLCJmcmVxdWVuY3kiOiIiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoiIiwiZm9ybSI6IiIsImNvbW1lbnRzIjoiV2FzaCBoYWlyIGZpcnN0LCB0aGVuIGFwcGx5IGxvdGlvbiB0byBzYXR1cmF0ZSBoYWlyIGFuZCBzY2FscDsgbGVhdmUgZm9yIDEwIG1pbnV0ZXMgdGhlbiByaW5zZS4gUmVtb3ZlIHJlbWFpbmluZyBuaXRzIHdpdGggY29tYi4gUmVwZWF0IHRyZWF0bWVudCBpbiA3IGRheXMuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJkZXJtIHwgcGVkaWF0cmljIHwgaGVhZCBsaWNlIChhZ2UgXHUyMjY1MiBtb250aHMpIHwgcGVybWV0aHJpbiBsb3Rpb24gKDElKSB8IG5peCBrd2VsbGFkYS1wIHwgd2FzaCBoYWlyIGZpcnN0LCB0aGVuIGFwcGx5IGxvdGlvbiB0byBzYXR1cmF0ZSBoYWlyIGFuZCBzY2FscDsgbGVhdmUgZm9yIDEwIG1pbnV0ZXMgdGhlbiByaW5zZS4gcmVtb3ZlIHJlbWFpbmluZyBuaXRzIHdpdGggY29tYi4gcmVwZWF0IHRyZWF0bWVudCBpbiA3IGRheXMuIn0seyJzcGVjaWFsdHkiOiJEZXJtIiwibWVkIjoiUGVybWV0aHJpbiBjcmVhbSAoNSUpIiwiYnJhbmRzIjpbIk5peCIsIkt3ZWxsYWRhLVAiXSwiaW5kaWNhdGlvbiI6IlNjYWJpZXMgKGFnZSBcdTIyNjUyIG1vbnRocykiLCJkb3NlX3RleHQiOiIiLCJyb3V0ZSI6IiIsImZyZXF1ZW5jeSI6IiIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxIHR1YmUiLCJwcm4iOiIiLCJmb3JtIjoiIiwiY29tbWVudHMiOiJBcHBseSBhbmQgbWFzc2FnZSBpbiBjcmVhbSBmcm9tIGhlYWQgdG8gdG9lOyBsZWF2ZSBvbiBmb3IgOC0xNCBob3VycyBiZWZvcmUgd2FzaGluZyBvZmYgd2l0aCB3YXRlcjsgZm9yIGluZmFudHMsIGFsc28gYXBwbHkgb24gdGhlIGhhaXJsaW5lLCBuZWNrLCBzY2FscCwgdGVtcGxlLCBhbmQgZm9yZWhlYWQuIFJlcGVhdCB0cmVhdG1lbnQgaW4gNyBkYXlzLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjEiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZGVybSB8IHBlZGlhdHJpYyB8IHNjYWJpZXMgKGFnZSBcdTIyNjUyIG1vbnRocykgfCBwZXJtZXRocmluIGNyZWFtICg1JSkgfCBuaXgga3dlbGxhZGEtcCB8IGFwcGx5IGFuZCBtYXNzYWdlIGluIGNyZWFtIGZyb20gaGVhZCB0byB0b2U7IGxlYXZlIG9uIGZvciA4LTE0IGhvdXJzIGJlZm9yZSB3YXNoaW5nIG9mZiB3aXRoIHdhdGVyOyBmb3IgaW5mYW50cywgYWxzbyBhcHBseSBvbiB0aGUgaGFpcmxpbmUsIG5lY2ssIHNjYWxwLCB0ZW1wbGUsIGFuZCBmb3JlaGVhZC4gcmVwZWF0IHRyZWF0bWVudCBpbiA3IGRheXMuIn0seyJzcGVjaWFsdHkiOiJEZXJtIiwibWVkIjoiU2lsdmVyIFN1bGZhZGlhemluZSBjcmVhbSIsImJyYW5kcyI6WyJGbGFtYXppbmUiLCJTaWx2YWRlbmUiXSwiaW5kaWNhdGlvbiI6IkJ1cm4iLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0b3BpY2FsIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIyIHdlZWsiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJjcmVhbSIsImNvbW1lbnRzIjoiU3RvcCBvbmNlIGhlYWxpbmcgaGFzIG9jY3VycmVkLiIsInBvcHVsYXRpb24iOiJQZWRpYXRyaWMiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoiZGVybSB8IHBlZGlhdHJpYyB8IGJ1cm4gfCBzaWx2ZXIgc3VsZmFkaWF6aW5lIGNyZWFtIHwgZmxhbWF6aW5lIHNpbHZhZGVuZSB8IDEgYXBwbGljYXRpb24gfCBzdG9wIG9uY2UgaGVhbGluZyBoYXMgb2NjdXJyZWQuIn0seyJzcGVjaWFsdHkiOiJEZXJtIiwibWVkIjoiRnVzaWRpYyBBY2lkIGNyZWFtICgyJSkiLCJicmFuZHMiOlsiRnVjaWRpbiJdLCJpbmRpY2F0aW9uIjoiU2tpbiBpbmZlY3Rpb24iLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0b3BpY2FsIiwiZnJlcXVlbmN5IjoiVElEIiwiZHVyYXRpb24iOiIyIHdlZWsiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJjcmVhbSIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJkZXJtIHwgcGVkaWF0cmljIHwgc2tpbiBpbmZlY3Rpb24gfCBmdXNpZGljIGFjaWQgY3JlYW0gKDIlKSB8IGZ1Y2lkaW4gfCAxIGFwcGxpY2F0aW9uIn0seyJzcGVjaWFsdHkiOiJEZXJtIiwibWVkIjoiTXVwaXJvY2luIGNyZWFtICgyJSkiLCJicmFuZHMiOlsiQmFjdHJvYmFuIl0sImluZGljYXRpb24iOiJGb2xsaWN1bGl0aXMvaW1wZXRpZ28iLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0b3BpY2FsIiwiZnJlcXVlbmN5IjoiVElEIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoiIiwiZm9ybSI6ImNyZWFtIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6ImRlcm0gfCBwZWRpYXRyaWMgfCBmb2xsaWN1bGl0aXMvaW1wZXRpZ28gfCBtdXBpcm9jaW4gY3JlYW0gKDIlKSB8IGJhY3Ryb2JhbiB8IDEgYXBwbGljYXRpb24ifSx7InNwZWNpYWx0eSI6IkRlcm0iLCJtZWQiOiJDZXBoYWxleGluIiwiYnJhbmRzIjpbIktlZmxleCJdLCJpbmRpY2F0aW9uIjoiU2tpbiBpbmZlY3Rpb24gKG1pbGQpIiwiZG9zZV90ZXh0IjoiMjVtZy9rZy9kb3NlIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InE4aCIsImR1cmF0aW9uIjoiNSBkYXkiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJzdXNwZW5zaW9uIiwiY29tbWVudHMiOiI3NW1nL2tnL2RheS4gTWF4aW11bSBkb3NlID0gNTAwbWcvZG9zZS4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjp0cnVlLCJkb3NlX3Blcl9rZ19tZyI6MjUuMCwibWF4X2Rvc2VfbWciOjUwMC4wLCJzZWFyY2hfdGV4dCI6ImRlcm0gfCBwZWRpYXRyaWMgfCBza2luIGluZmVjdGlvbiAobWlsZCkgfCBjZXBoYWxleGluIHwga2VmbGV4IHwgMjVtZy9rZy9kb3NlIHwgNzVtZy9rZy9kYXkuIG1heGltdW0gZG9zZSA9IDUwMG1nL2Rvc2UuIn0seyJzcGVjaWFsdHkiOiJEZXJtIiwibWVkIjoiQ2VmYWRyb3hpbCIsImJyYW5kcyI6WyJEdXJpY2VmIl0sImluZGljYXRpb24iOiJTa2luIGluZmVjdGlvbiAobWlsZCkiLCJkb3NlX3RleHQiOiIxNW1nL2tnL2Rvc2UiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicTEyaCIsImR1cmF0aW9uIjoiNSBkYXkiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJzdXNwZW5zaW9uIiwiY29tbWVudHMiOiJNYXhpbXVtIGRvc2UgPSA1MDBtZy9kb3NlLiBJZiB1bmF2YWlsYWJsZSwgbWF5IHJlcGxhY2Ugd2l0aCBjZXBoYWxleGluIDI1bWcva2cvZG9zZSBQTyBxOGggZm9yIDcgZGF5cyAobWF4aW11bSBkb3NlID0gNTAwbWcvZG9zZSkuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6dHJ1ZSwiZG9zZV9wZXJfa2dfbWciOjE1LjAsIm1heF9kb3NlX21nIjo1MDAuMCwic2VhcmNoX3RleHQiOiJkZXJtIHwgcGVkaWF0cmljIHwgc2tpbiBpbmZlY3Rpb24gKG1pbGQpIHwgY2VmYWRyb3hpbCB8IGR1cmljZWYgfCAxNW1nL2tnL2Rvc2UgfCBtYXhpbXVtIGRvc2UgPSA1MDBtZy9kb3NlLiBpZiB1bmF2YWlsYWJsZSwgbWF5IHJlcGxhY2Ugd2l0aCBjZXBoYWxleGluIDI1bWcva2cvZG9zZSBwbyBxOGggZm9yIDcgZGF5cyAobWF4aW11bSBkb3NlID0gNTAwbWcvZG9zZSkuIn0seyJzcGVjaWFsdHkiOiJEZXJtIiwibWVkIjoiQW1veC1DbGF2IiwiYnJhbmRzIjpbIkNsYXZ1bGluIiwiQXVnbWVudGluIl0sImluZGljYXRpb24iOiJBbmltYWwgYml0ZSBpbmZlY3Rpb24gcHJvcGh5bGF4aXMiLCJkb3NlX3RleHQiOiIyMi41bWcva2cvZG9zZSIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IjUgZGF5IiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoic3VzcGVuc2lvbiIsImNvbW1lbnRzIjoiMjIuNW1nIGFtb3hpY2lsbGluL2tnIFBPIEJJRCBmb3IgNSBkYXlzLiA0NW1nL2tnL2RheS4gTWF4aW11bSBkb3NlID0gODc1bWcgYW1veGljaWxsaW4vZG9zZS4iLCJwb3B1bGF0aW9uIjoiUGVkaWF0cmljIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjp0cnVlLCJkb3NlX3Blcl9rZ19tZyI6MjIuNSwibWF4X2Rvc2VfbWciOjg3NS4wLCJzZWFyY2hfdGV4dCI6ImRlcm0gfCBwZWRpYXRyaWMgfCBhbmltYWwgYml0ZSBpbmZlY3Rpb24gcHJvcGh5bGF4aXMgfCBhbW94LWNsYXYgfCBjbGF2dWxpbiBhdWdtZW50aW4gfCAyMi41bWcva2cvZG9zZSB8IDIyLjVtZyBhbW94aWNpbGxpbi9rZyBwbyBiaWQgZm9yIDUgZGF5cy4gNDVtZy9rZy9kYXkuIG1heGltdW0gZG9zZSA9IDg3NW1nIGFtb3hpY2lsbGluL2Rvc2UuIn0seyJzcGVjaWFsdHkiOiJEZXJtIiwibWVkIjoiQW1veC1DbGF2IiwiYnJhbmRzIjpbIkNsYXZ1bGluIiwiQXVnbWVudGluIl0sImluZGljYXRpb24iOiJBbmltYWwgYml0ZSBpbmZlY3Rpb24gdHJlYXRtZW50IiwiZG9zZV90ZXh0IjoiMjIuNW1nL2tnL2Rvc2UiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiIiwicHJuIjoiIiwiZm9ybSI6InN1c3BlbnNpb24iLCJjb21tZW50cyI6IjIyLjVtZyBhbW94aWNpbGxpbi9rZyBQTyBCSUQgZm9yIDcgZGF5cy4gNDVtZy9rZy9kYXkuIE1heGltdW0gZG9zZSA9IDg3NW1nIGFtb3hpY2lsbGluL2Rvc2UuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6dHJ1ZSwiZG9zZV9wZXJfa2dfbWciOjIyLjUsIm1heF9kb3NlX21nIjo4NzUuMCwic2VhcmNoX3RleHQiOiJkZXJtIHwgcGVkaWF0cmljIHwgYW5pbWFsIGJpdGUgaW5mZWN0aW9uIHRyZWF0bWVudCB8IGFtb3gtY2xhdiB8IGNsYXZ1bGluIGF1Z21lbnRpbiB8IDIyLjVtZy9rZy9kb3NlIHwgMjIuNW1nIGFtb3hpY2lsbGluL2tnIHBvIGJpZCBmb3IgNyBkYXlzLiA0NW1nL2tnL2RheS4gbWF4aW11bSBkb3NlID0gODc1bWcgYW1veGljaWxsaW4vZG9zZS4ifSx7InNwZWNpYWx0eSI6IkRlcm0iLCJtZWQiOiJEb3h5Y3ljbGluZSIsImJyYW5kcyI6WyJWaWJyYW15Y2luIiwiRG94eWNpbiIsIkFwcHJpbG9uIl0sImluZGljYXRpb24iOiJMeW1lIChlcnl0aGVtYSBtaWdyYW5zKSIsImRvc2VfdGV4dCI6IjIuMm1nL2tnL2Rvc2UiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIxMCBkYXkiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiJzdXNwZW5zaW9uIiwiY29tbWVudHMiOiI0LjRtZy9rZy9kYXkuIE1heGltdW0gZG9zZSA9IDEwMG1nL2Rvc2UuIiwicG9wdWxhdGlvbiI6IlBlZGlhdHJpYyIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6dHJ1ZSwiZG9zZV9wZXJfa2dfbWciOjIuMiwibWF4X2Rvc2VfbWciOjEwMC4wLCJzZWFyY2hfdGV4dCI6ImRlcm0gfCBwZWRpYXRyaWMgfCBseW1lIChlcnl0aGVtYSBtaWdyYW5zKSB8IGRveHljeWNsaW5lIHwgdmlicmFteWNpbiBkb3h5Y2luIGFwcHJpbG9uIHwgMi4ybWcva2cvZG9zZSB8IDQuNG1nL2tnL2RheS4gbWF4aW11bSBkb3NlID0gMTAwbWcvZG9zZS4ifSx7InNwZWNpYWx0eSI6IlBzeWNoIiwibWVkIjoiTG9yYXplcGFtIiwiYnJhbmRzIjpbIkF0aXZhbiJdLCJpbmRpY2F0aW9uIjoiQW54aWV0eSIsImRvc2VfdGV4dCI6IjFtZyIsInJvdXRlIjoiUE8vU0wiLCJmcmVxdWVuY3kiOiJvbmNlIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgdGFiIiwicHJuIjoiYW54aWV0eSIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IlRha2UgNDUgbWludXRlcyBiZWZvcmUgcHJvY2VkdXJlLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJwc3ljaCB8IGFkdWx0IHwgYW54aWV0eSB8IGxvcmF6ZXBhbSB8IGF0aXZhbiB8IDFtZyB8IGFueGlldHkgfCB0YWtlIDQ1IG1pbnV0ZXMgYmVmb3JlIHByb2NlZHVyZS4ifSx7InNwZWNpYWx0eSI6IlBzeWNoIiwibWVkIjoiTG9yYXplcGFtIiwiYnJhbmRzIjpbIkF0aXZhbiJdLCJpbmRpY2F0aW9uIjoiQW54aWV0eSIsImRvc2VfdGV4dCI6IjAuNS0xbWciLCJyb3V0ZSI6IlBPL1NMIiwiZnJlcXVlbmN5IjoicTZoIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjYgdGFiIiwicHJuIjoiYW54aWV0eSIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkRpc3BlbnNlIDAuNW1nIHRhYnMuIFVzZSBvbmx5IGZvciBzaG9ydCBkdXJhdGlvbiBhcyBjYW4gYmUgaGFiaXQtZm9ybWluZy4gRm9sbG93IHVwIHdpdGggdXN1YWwgY2FyZSBwcm92aWRlci4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0IjoicHN5Y2ggfCBhZHVsdCB8IGFueGlldHkgfCBsb3JhemVwYW0gfCBhdGl2YW4gfCAwLjUtMW1nIHwgYW54aWV0eSB8IGRpc3BlbnNlIDAuNW1nIHRhYnMuIHVzZSBvbmx5IGZvciBzaG9ydCBkdXJhdGlvbiBhcyBjYW4gYmUgaGFiaXQtZm9ybWluZy4gZm9sbG93IHVwIHdpdGggdXN1YWwgY2FyZSBwcm92aWRlci4ifSx7InNwZWNpYWx0eSI6IlBzeWNoIiwibWVkIjoiTG9yYXplcGFtIiwiYnJhbmRzIjpbIkF0aXZhbiJdLCJpbmRpY2F0aW9uIjoiQW54aWV0eSIsImRvc2VfdGV4dCI6IjEtMm1nIiwicm91dGUiOiJQTy9TTCIsImZyZXF1ZW5jeSI6InE2aCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiI2IHRhYiIsInBybiI6ImFueGlldHkiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJEaXNwZW5zZSAxbWcgdGFicy4gVXNlIG9ubHkgZm9yIHNob3J0IGR1cmF0aW9uIGFzIGNhbiBiZSBoYWJpdC1mb3JtaW5nLiBGb2xsb3cgdXAgd2l0aCB1c3VhbCBjYXJlIHByb3ZpZGVyLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJwc3ljaCB8IGFkdWx0IHwgYW54aWV0eSB8IGxvcmF6ZXBhbSB8IGF0aXZhbiB8IDEtMm1nIHwgYW54aWV0eSB8IGRpc3BlbnNlIDFtZyB0YWJzLiB1c2Ugb25seSBmb3Igc2hvcnQgZHVyYXRpb24gYXMgY2FuIGJlIGhhYml0LWZvcm1pbmcuIGZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIuIn0seyJzcGVjaWFsdHkiOiJTdWJzdGFuY2UgVXNlIiwibWVkIjoiTG9yYXplcGFtIiwiYnJhbmRzIjpbIkF0aXZhbiJdLCJpbmRpY2F0aW9uIjoiQWxjb2hvbCB3aXRoZHJhd2FsICh3aXRoIGNpcnJob3NpcyBvciBzZXZlcmUgcmVzcGlyYXRvcnkgZGlzZWFzZSkiLCJkb3NlX3RleHQiOiIiLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEzIHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkRpc3BlbnNlIDFtZyB0YWJzLiBEYXkgMTogMW1nIFBPIFFJRC4gRGF5IDI6IDFtZyBQTyBUSUQuIERheSAzOiAxbWcgQklELiBEYXkgNCBhbmQgdGhlcmVhZnRlcjogMW1nIE9ELiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiV2l0aGRyYXdhbCBNYW5hZ2VtZW50IiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJzdWJzdGFuY2UgdXNlIHwgYWR1bHQgfCB3aXRoZHJhd2FsIG1hbmFnZW1lbnQgfCBhbGNvaG9sIHdpdGhkcmF3YWwgKHdpdGggY2lycmhvc2lzIG9yIHNldmVyZSByZXNwaXJhdG9yeSBkaXNlYXNlKSB8IGxvcmF6ZXBhbSB8IGF0aXZhbiB8IGRpc3BlbnNlIDFtZyB0YWJzLiBkYXkgMTogMW1nIHBvIHFpZC4gZGF5IDI6IDFtZyBwbyB0aWQuIGRheSAzOiAxbWcgYmlkLiBkYXkgNCBhbmQgdGhlcmVhZnRlcjogMW1nIG9kLiJ9LHsic3BlY2lhbHR5IjoiU3Vic3RhbmNlIFVzZSIsIm1lZCI6IkRpYXplcGFtIiwiYnJhbmRzIjpbIlZhbGl1bSJdLCJpbmRpY2F0aW9uIjoiQWxjb2hvbCB3aXRoZHJhd2FsIiwiZG9zZV90ZXh0IjoiIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6IiIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxMyB0YWIiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJEaXNwZW5zZSAxMG1nIHRhYnMuIERheSAxOiAxMG1nIFBPIFFJRC4gRGF5IDI6IDEwbWcgUE8gVElELiBEYXkgMzogMTBtZyBQTyBCSUQuIERheSA0IGFuZCB0aGVyZWFmdGVyOiAxMG1nIFBPIHFIUy4gSG9sZCBpZiBzZWRhdGVkLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiV2l0aGRyYXdhbCBNYW5hZ2VtZW50IiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJzdWJzdGFuY2UgdXNlIHwgYWR1bHQgfCB3aXRoZHJhd2FsIG1hbmFnZW1lbnQgfCBhbGNvaG9sIHdpdGhkcmF3YWwgfCBkaWF6ZXBhbSB8IHZhbGl1bSB8IGRpc3BlbnNlIDEwbWcgdGFicy4gZGF5IDE6IDEwbWcgcG8gcWlkLiBkYXkgMjogMTBtZyBwbyB0aWQuIGRheSAzOiAxMG1nIHBvIGJpZC4gZGF5IDQgYW5kIHRoZXJlYWZ0ZXI6IDEwbWcgcG8gcWhzLiBob2xkIGlmIHNlZGF0ZWQuIn0seyJzcGVjaWFsdHkiOiJTdWJzdGFuY2UgVXNlIiwibWVkIjoiR2FiYXBlbnRpbiIsImJyYW5kcyI6WyJOZXVyb250aW4iXSwiaW5kaWNhdGlvbiI6IkFsY29ob2wgd2l0aGRyYXdhbCAobm90IGZvciBwYXRpZW50cyB3aXRoIGtub3duIGhpc3Rvcnkgb2Ygc2V2ZXJlIG9yIGNvbXBsaWNhdGVkIHdpdGhkcmF3YWwpIiwiZG9zZV90ZXh0IjoiMzAwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiVElEIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjE4IHRhYiIsInBybiI6ImFsY29ob2wgd2l0aGRyYXdhbCIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IlRha2UgMzAwbWcgUE8gVElEIHNjaGVkdWxlZC4gQ2FuIHRha2UgYWRkaXRpb25hbCAzMDBtZyBQTyBxOGggUFJOIChtYXggMyBkb3Nlcy9kYXkpLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiV2l0aGRyYXdhbCBNYW5hZ2VtZW50IiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJzdWJzdGFuY2UgdXNlIHwgYWR1bHQgfCB3aXRoZHJhd2FsIG1hbmFnZW1lbnQgfCBhbGNvaG9sIHdpdGhkcmF3YWwgKG5vdCBmb3IgcGF0aWVudHMgd2l0aCBrbm93biBoaXN0b3J5IG9mIHNldmVyZSBvciBjb21wbGljYXRlZCB3aXRoZHJhd2FsKSB8IGdhYmFwZW50aW4gfCBuZXVyb250aW4gfCAzMDBtZyB8IGFsY29ob2wgd2l0aGRyYXdhbCB8IHRha2UgMzAwbWcgcG8gdGlkIHNjaGVkdWxlZC4gY2FuIHRha2UgYWRkaXRpb25hbCAzMDBtZyBwbyBxOGggcHJuIChtYXggMyBkb3Nlcy9kYXkpLiJ9LHsic3BlY2lhbHR5IjoiU3Vic3RhbmNlIFVzZSIsIm1lZCI6IlRoaWFtaW5lIiwiYnJhbmRzIjpbIkJldGF4aW4iXSwiaW5kaWNhdGlvbiI6IkFsY29ob2wgdXNlIGRpc29yZGVyIChXZXJuaWNrZSBlbmNlcGhhbG9wYXRoeSBwcmV2ZW50aW9uKSIsImRvc2VfdGV4dCI6IjEwMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InFBTSIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiI0IHdlZWsiLCJwcm4iOiIiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IldpdGhkcmF3YWwgTWFuYWdlbWVudCIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoic3Vic3RhbmNlIHVzZSB8IGFkdWx0IHwgd2l0aGRyYXdhbCBtYW5hZ2VtZW50IHwgYWxjb2hvbCB1c2UgZGlzb3JkZXIgKHdlcm5pY2tlIGVuY2VwaGFsb3BhdGh5IHByZXZlbnRpb24pIHwgdGhpYW1pbmUgfCBiZXRheGluIHwgMTAwbWcifSx7InNwZWNpYWx0eSI6IlN1YnN0YW5jZSBVc2UiLCJtZWQiOiJOYWx0cmV4b25lIiwiYnJhbmRzIjpbIlJldmlhIl0sImluZGljYXRpb24iOiJBbGNvaG9sIHVzZSBkaXNvcmRlciAoYXZvaWQgaW4gbGl2ZXIgZmFpbHVyZS9jb25jdXJyZW50IG9waW9pZCB1c2UpIiwiZG9zZV90ZXh0IjoiNTBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxQU0iLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiNCB3ZWVrIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiTFUgY29kZSA9IDUzMi4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IldpdGhkcmF3YWwgTWFuYWdlbWVudCIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoic3Vic3RhbmNlIHVzZSB8IGFkdWx0IHwgd2l0aGRyYXdhbCBtYW5hZ2VtZW50IHwgYWxjb2hvbCB1c2UgZGlzb3JkZXIgKGF2b2lkIGluIGxpdmVyIGZhaWx1cmUvY29uY3VycmVudCBvcGlvaWQgdXNlKSB8IG5hbHRyZXhvbmUgfCByZXZpYSB8IDUwbWcgfCBsdSBjb2RlID0gNTMyLiJ9LHsic3BlY2lhbHR5IjoiU3Vic3RhbmNlIFVzZSIsIm1lZCI6IkFjYW1wcm9zYXRlIiwiYnJhbmRzIjpbIkNhbXByYWwiXSwiaW5kaWNhdGlvbiI6IkFsY29ob2wgdXNlIGRpc29yZGVyIChhdm9pZCBpbiBzZXZlcmUgcmVuYWwgZmFpbHVyZSkiLCJkb3NlX3RleHQiOiI2NjZtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJUSUQiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiNCB3ZWVrIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiTFUgY29kZSA9IDUzMS4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IldpdGhkcmF3YWwgTWFuYWdlbWVudCIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoic3Vic3RhbmNlIHVzZSB8IGFkdWx0IHwgd2l0aGRyYXdhbCBtYW5hZ2VtZW50IHwgYWxjb2hvbCB1c2UgZGlzb3JkZXIgKGF2b2lkIGluIHNldmVyZSByZW5hbCBmYWlsdXJlKSB8IGFjYW1wcm9zYXRlIHwgY2FtcHJhbCB8IDY2Nm1nIHwgbHUgY29kZSA9IDUzMS4ifSx7InNwZWNpYWx0eSI6IlN1YnN0YW5jZSBVc2UiLCJtZWQiOiJCdXByZW5vcnBoaW5lICsgTmFsb3hvbmUgKDJtZy0wLjVtZykiLCJicmFuZHMiOlsiU3Vib3hvbmUiXSwiaW5kaWNhdGlvbiI6Ik9waW9pZCB1c2UgZGlzb3JkZXIgKEVEIHN0YXJ0KSIsImRvc2VfdGV4dCI6IiIsInJvdXRlIjoiU0wiLCJmcmVxdWVuY3kiOiIiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMTYgdGFiIiwicHJuIjoid2l0aGRyYXdhbCBzeW1wdG9tcyIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IltTdGFydCBkYXRlIC0gZW5kIGRhdGUgaW5jbHVzaXZlXS4gVGFrZSAyLTRtZyBTTCBxMWggUFJOIChtYXhpbXVtIDE2bWcgcGVyIDI0IGhvdXJzKS4gRGlzcGVuc2UgbmFsb3hvbmUga2l0IGlmIHBhdGllbnQgZG9lcyBub3QgaGF2ZSBvbmUuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiJXaXRoZHJhd2FsIE1hbmFnZW1lbnQiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6InN1YnN0YW5jZSB1c2UgfCBhZHVsdCB8IHdpdGhkcmF3YWwgbWFuYWdlbWVudCB8IG9waW9pZCB1c2UgZGlzb3JkZXIgKGVkIHN0YXJ0KSB8IGJ1cHJlbm9ycGhpbmUgKyBuYWxveG9uZSAoMm1nLTAuNW1nKSB8IHN1Ym94b25lIHwgd2l0aGRyYXdhbCBzeW1wdG9tcyB8IFtzdGFydCBkYXRlIC0gZW5kIGRhdGUgaW5jbHVzaXZlXS4gdGFrZSAyLTRtZyBzbCBxMWggcHJuIChtYXhpbXVtIDE2bWcgcGVyIDI0IGhvdXJzKS4gZGlzcGVuc2UgbmFsb3hvbmUga2l0IGlmIHBhdGllbnQgZG9lcyBub3QgaGF2ZSBvbmUuIn0seyJzcGVjaWFsdHkiOiJTdWJzdGFuY2UgVXNlIiwibWVkIjoiQnVwcmVub3JwaGluZSArIE5hbG94b25lICg0bWctMW1nKSIsImJyYW5kcyI6WyJTdWJveG9uZSJdLCJpbmRpY2F0aW9uIjoiT3Bpb2lkIHVzZSBkaXNvcmRlciAocHJlc2NyaXB0aW9uIHJlbmV3YWwpIiwiZG9zZV90ZXh0IjoiMSB0YWIiLCJyb3V0ZSI6IlNMIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiI3IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiV2l0aGRyYXdhbCBNYW5hZ2VtZW50IiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJzdWJzdGFuY2UgdXNlIHwgYWR1bHQgfCB3aXRoZHJhd2FsIG1hbmFnZW1lbnQgfCBvcGlvaWQgdXNlIGRpc29yZGVyIChwcmVzY3JpcHRpb24gcmVuZXdhbCkgfCBidXByZW5vcnBoaW5lICsgbmFsb3hvbmUgKDRtZy0xbWcpIHwgc3Vib3hvbmUgfCAxIHRhYiJ9LHsic3BlY2lhbHR5IjoiU3Vic3RhbmNlIFVzZSIsIm1lZCI6IkJ1cHJlbm9ycGhpbmUgKyBOYWxveG9uZSAoNm1nLTEuNW1nKSIsImJyYW5kcyI6WyJTdWJveG9uZSJdLCJpbmRpY2F0aW9uIjoiT3Bpb2lkIHVzZSBkaXNvcmRlciAocHJlc2NyaXB0aW9uIHJlbmV3YWwpIiwiZG9zZV90ZXh0IjoiMSB0YWIiLCJyb3V0ZSI6IlNMIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiI3IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiV2l0aGRyYXdhbCBNYW5hZ2VtZW50IiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJzdWJzdGFuY2UgdXNlIHwgYWR1bHQgfCB3aXRoZHJhd2FsIG1hbmFnZW1lbnQgfCBvcGlvaWQgdXNlIGRpc29yZGVyIChwcmVzY3JpcHRpb24gcmVuZXdhbCkgfCBidXByZW5vcnBoaW5lICsgbmFsb3hvbmUgKDZtZy0xLjVtZykgfCBzdWJveG9uZSB8IDEgdGFiIn0seyJzcGVjaWFsdHkiOiJTdWJzdGFuY2UgVXNlIiwibWVkIjoiQnVwcmVub3JwaGluZSArIE5hbG94b25lICg4bWctMm1nKSIsImJyYW5kcyI6WyJTdWJveG9uZSJdLCJpbmRpY2F0aW9uIjoiT3Bpb2lkIHVzZSBkaXNvcmRlciAocHJlc2NyaXB0aW9uIHJlbmV3YWwpIiwiZG9zZV90ZXh0IjoiMSB0YWIiLCJyb3V0ZSI6IlNMIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IjcgZGF5IiwiZGlzcGVuc2UiOiI3IHRhYiIsInBybiI6IiIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiV2l0aGRyYXdhbCBNYW5hZ2VtZW50IiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJzdWJzdGFuY2UgdXNlIHwgYWR1bHQgfCB3aXRoZHJhd2FsIG1hbmFnZW1lbnQgfCBvcGlvaWQgdXNlIGRpc29yZGVyIChwcmVzY3JpcHRpb24gcmVuZXdhbCkgfCBidXByZW5vcnBoaW5lICsgbmFsb3hvbmUgKDhtZy0ybWcpIHwgc3Vib3hvbmUgfCAxIHRhYiJ9LHsic3BlY2lhbHR5IjoiU3Vic3RhbmNlIFVzZSIsIm1lZCI6IkJ1cHJlbm9ycGhpbmUgKyBOYWxveG9uZSAoMTZtZy00bWcpIiwiYnJhbmRzIjpbIlN1Ym94b25lIl0sImluZGljYXRpb24iOiJPcGlvaWQgdXNlIGRpc29yZGVyIChwcmVzY3JpcHRpb24gcmVuZXdhbCkiLCJkb3NlX3RleHQiOiIxIHRhYiIsInJvdXRlIjoiU0wiLCJmcmVxdWVuY3kiOiJPRCIsImR1cmF0aW9uIjoiNyBkYXkiLCJkaXNwZW5zZSI6IjcgdGFiIiwicHJuIjoiIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiJXaXRoZHJhd2FsIE1hbmFnZW1lbnQiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6InN1YnN0YW5jZSB1c2UgfCBhZHVsdCB8IHdpdGhkcmF3YWwgbWFuYWdlbWVudCB8IG9waW9pZCB1c2UgZGlzb3JkZXIgKHByZXNjcmlwdGlvbiByZW5ld2FsKSB8IGJ1cHJlbm9ycGhpbmUgKyBuYWxveG9uZSAoMTZtZy00bWcpIHwgc3Vib3hvbmUgfCAxIHRhYiJ9LHsic3BlY2lhbHR5IjoiU3Vic3RhbmNlIFVzZSIsIm1lZCI6IkNsb25pZGluZSIsImJyYW5kcyI6WyJDYXRhcHJlcyJdLCJpbmRpY2F0aW9uIjoiT3Bpb2lkIHdpdGhkcmF3YWwiLCJkb3NlX3RleHQiOiIwLjEtMC4ybWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiUUlEIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEwIHRhYiIsInBybiI6IndpdGhkcmF3YWwgc3ltcHRvbXMiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJEaXNwZW5zZSAwLjFtZyB0YWJzLiBIb2xkIGlmIGJsb29kIHByZXNzdXJlIFx1MjI2NDkwLzYwIG9yIHBhdGllbnQgZGl6enkuIE1heGltdW0gMC44bWcgcGVyIDI0IGhvdXJzLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiV2l0aGRyYXdhbCBNYW5hZ2VtZW50IiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJzdWJzdGFuY2UgdXNlIHwgYWR1bHQgfCB3aXRoZHJhd2FsIG1hbmFnZW1lbnQgfCBvcGlvaWQgd2l0aGRyYXdhbCB8IGNsb25pZGluZSB8IGNhdGFwcmVzIHwgMC4xLTAuMm1nIHwgd2l0aGRyYXdhbCBzeW1wdG9tcyB8IGRpc3BlbnNlIDAuMW1nIHRhYnMuIGhvbGQgaWYgYmxvb2QgcHJlc3N1cmUgXHUyMjY0OTAvNjAgb3IgcGF0aWVudCBkaXp6eS4gbWF4aW11bSAwLjhtZyBwZXIgMjQgaG91cnMuIn0seyJzcGVjaWFsdHkiOiJTdWJzdGFuY2UgVXNlIiwibWVkIjoiTmljb3RpbmUgR3VtIiwiYnJhbmRzIjpbIk5pY29yZXR0ZSIsIlRocml2ZSJdLCJpbmRpY2F0aW9uIjoiTmljb3RpbmUgcmVwbGFjZW1lbnQiLCJkb3NlX3RleHQiOiIybWciLCJyb3V0ZSI6ImNoZXdlZCIsImZyZXF1ZW5jeSI6InE0aCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxOCBkb3NlIiwicHJuIjoic21va2luZyBjZXNzYXRpb24iLCJmb3JtIjoiZ3VtIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IldpdGhkcmF3YWwgTWFuYWdlbWVudCIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoic3Vic3RhbmNlIHVzZSB8IGFkdWx0IHwgd2l0aGRyYXdhbCBtYW5hZ2VtZW50IHwgbmljb3RpbmUgcmVwbGFjZW1lbnQgfCBuaWNvdGluZSBndW0gfCBuaWNvcmV0dGUgdGhyaXZlIHwgMm1nIHwgc21va2luZyBjZXNzYXRpb24ifSx7InNwZWNpYWx0eSI6IlN1YnN0YW5jZSBVc2UiLCJtZWQiOiJOaWNvdGluZSBQYXRjaCIsImJyYW5kcyI6WyJOaWNvZGVybSJdLCJpbmRpY2F0aW9uIjoiTmljb3RpbmUgcmVwbGFjZW1lbnQgKDwxMCBjaWdhcmV0dGVzL2RheSkiLCJkb3NlX3RleHQiOiI3bWciLCJyb3V0ZSI6IlREIiwiZnJlcXVlbmN5IjoiT0QiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiNSBkYXkiLCJwcm4iOiJzbW9raW5nIGNlc3NhdGlvbiIsImZvcm0iOiJwYXRjaCIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiJXaXRoZHJhd2FsIE1hbmFnZW1lbnQiLCJyZWZpbGwiOiIxIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6InN1YnN0YW5jZSB1c2UgfCBhZHVsdCB8IHdpdGhkcmF3YWwgbWFuYWdlbWVudCB8IG5pY290aW5lIHJlcGxhY2VtZW50ICg8MTAgY2lnYXJldHRlcy9kYXkpIHwgbmljb3RpbmUgcGF0Y2ggfCBuaWNvZGVybSB8IDdtZyB8IHNtb2tpbmcgY2Vzc2F0aW9uIn0seyJzcGVjaWFsdHkiOiJTdWJzdGFuY2UgVXNlIiwibWVkIjoiTmljb3RpbmUgUGF0Y2giLCJicmFuZHMiOlsiTmljb2Rlcm0iXSwiaW5kaWNhdGlvbiI6Ik5pY290aW5lIHJlcGxhY2VtZW50ICg8MTAgY2lnYXJldHRlcy9kYXkpIiwiZG9zZV90ZXh0IjoiMTRtZyIsInJvdXRlIjoiVEQiLCJmcmVxdWVuY3kiOiJPRCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiI1IGRheSIsInBybiI6InNtb2tpbmcgY2Vzc2F0aW9uIiwiZm9ybSI6InBhdGNoIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IldpdGhkcmF3YWwgTWFuYWdlbWVudCIsInJlZmlsbCI6IjEiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoic3Vic3RhbmNlIHVzZSB8IGFkdWx0IHwgd2l0aGRyYXdhbCBtYW5hZ2VtZW50IHwgbmljb3RpbmUgcmVwbGFjZW1lbnQgKDwxMCBjaWdhcmV0dGVzL2RheSkgfCBuaWNvdGluZSBwYXRjaCB8IG5pY29kZXJtIHwgMTRtZyB8IHNtb2tpbmcgY2Vzc2F0aW9uIn0seyJzcGVjaWFsdHkiOiJTdWJzdGFuY2UgVXNlIiwibWVkIjoiTmljb3RpbmUgUGF0Y2giLCJicmFuZHMiOlsiTmljb2Rlcm0iXSwiaW5kaWNhdGlvbiI6Ik5pY290aW5lIHJlcGxhY2VtZW50ICg+MTAgY2lnYXJldHRlcy9kYXkpIiwiZG9zZV90ZXh0IjoiMjFtZyIsInJvdXRlIjoiVEQiLCJmcmVxdWVuY3kiOiJPRCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiI1IGRheSIsInBybiI6InNtb2tpbmcgY2Vzc2F0aW9uIiwiZm9ybSI6InBhdGNoIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IldpdGhkcmF3YWwgTWFuYWdlbWVudCIsInJlZmlsbCI6IjEiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoic3Vic3RhbmNlIHVzZSB8IGFkdWx0IHwgd2l0aGRyYXdhbCBtYW5hZ2VtZW50IHwgbmljb3RpbmUgcmVwbGFjZW1lbnQgKD4xMCBjaWdhcmV0dGVzL2RheSkgfCBuaWNvdGluZSBwYXRjaCB8IG5pY29kZXJtIHwgMjFtZyB8IHNtb2tpbmcgY2Vzc2F0aW9uIn0seyJzcGVjaWFsdHkiOiJTdWJzdGFuY2UgVXNlIiwibWVkIjoiT2xhbnphcGluZSIsImJyYW5kcyI6WyJaeXByZXhhIl0sImluZGljYXRpb24iOiJTdWJzdGFuY2UgdXNlIHN5bXB0b21zIChlLmcuIHNsZWVwLCBhbnhpZXR5LCBhZ2l0YXRpb24sIHBzeWNob3NpcykiLCJkb3NlX3RleHQiOiI1bWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicWhzIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjUgZGF5IiwicHJuIjoiYWdpdGF0aW9uIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiTWF5IHRha2UgMiB0YWJzICgxMG1nKSBxaHMgaWYgbmVlZGVkLiBGb2xsb3cgdXAgd2l0aCB1c3VhbCBjYXJlIHByb3ZpZGVyIGZvciByZWZpbGxzLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiU3ltcHRvbSBSZWxpZWYiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6InN1YnN0YW5jZSB1c2UgfCBhZHVsdCB8IHN5bXB0b20gcmVsaWVmIHwgc3Vic3RhbmNlIHVzZSBzeW1wdG9tcyAoZS5nLiBzbGVlcCwgYW54aWV0eSwgYWdpdGF0aW9uLCBwc3ljaG9zaXMpIHwgb2xhbnphcGluZSB8IHp5cHJleGEgfCA1bWcgfCBhZ2l0YXRpb24gfCBtYXkgdGFrZSAyIHRhYnMgKDEwbWcpIHFocyBpZiBuZWVkZWQuIGZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlZmlsbHMuIn0seyJzcGVjaWFsdHkiOiJTdWJzdGFuY2UgVXNlIiwibWVkIjoiUXVldGlhcGluZSIsImJyYW5kcyI6WyJTZXJvcXVlbCJdLCJpbmRpY2F0aW9uIjoiU3Vic3RhbmNlIHVzZSBzeW1wdG9tcyAoZS5nLiBhbnhpZXR5LCBhZ2l0YXRpb24pIiwiZG9zZV90ZXh0IjoiMjVtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxNGgiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiNSBkYXkiLCJwcm4iOiJhZ2l0YXRpb24iLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJNYXhpbXVtIDEwMG1nIGluIDI0IGhvdXJzLiBGb2xsb3cgdXAgd2l0aCB1c3VhbCBjYXJlIHByb3ZpZGVyIGZvciByZWZpbGxzLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiU3ltcHRvbSBSZWxpZWYiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6InN1YnN0YW5jZSB1c2UgfCBhZHVsdCB8IHN5bXB0b20gcmVsaWVmIHwgc3Vic3RhbmNlIHVzZSBzeW1wdG9tcyAoZS5nLiBhbnhpZXR5LCBhZ2l0YXRpb24pIHwgcXVldGlhcGluZSB8IHNlcm9xdWVsIHwgMjVtZyB8IGFnaXRhdGlvbiB8IG1heGltdW0gMTAwbWcgaW4gMjQgaG91cnMuIGZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlZmlsbHMuIn0seyJzcGVjaWFsdHkiOiJTdWJzdGFuY2UgVXNlIiwibWVkIjoiUXVldGlhcGluZSIsImJyYW5kcyI6WyJTZXJvcXVlbCJdLCJpbmRpY2F0aW9uIjoiU3Vic3RhbmNlIHVzZSBzeW1wdG9tcyAoZS5nLiBhbnhpZXR5LCBhZ2l0YXRpb24pIGluIGVsZGVyIGFnZSIsImRvc2VfdGV4dCI6IjEyLjVtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxNGgiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiNSBkYXkiLCJwcm4iOiJhZ2l0YXRpb24iLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJNYXhpbXVtIDUwbWcgaW4gMjQgaG91cnMuIEZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlZmlsbHMuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiJTeW1wdG9tIFJlbGllZiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoic3Vic3RhbmNlIHVzZSB8IGFkdWx0IHwgc3ltcHRvbSByZWxpZWYgfCBzdWJzdGFuY2UgdXNlIHN5bXB0b21zIChlLmcuIGFueGlldHksIGFnaXRhdGlvbikgaW4gZWxkZXIgYWdlIHwgcXVldGlhcGluZSB8IHNlcm9xdWVsIHwgMTIuNW1nIHwgYWdpdGF0aW9uIHwgbWF4aW11bSA1MG1nIGluIDI0IGhvdXJzLiBmb2xsb3cgdXAgd2l0aCB1c3VhbCBjYXJlIHByb3ZpZGVyIGZvciByZWZpbGxzLiJ9LHsic3BlY2lhbHR5IjoiU3Vic3RhbmNlIFVzZSIsIm1lZCI6IlF1ZXRpYXBpbmUiLCJicmFuZHMiOlsiU2Vyb3F1ZWwiXSwiaW5kaWNhdGlvbiI6IlNsZWVwIChvZmYgbGFiZWwgdXNlIGZvciBwYXRpZW50cyB3aXRoIHN1YnN0YW5jZSB1c2Ugc3ltcHRvbXMpIiwiZG9zZV90ZXh0IjoiMjVtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxaHMiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiNSBkYXkiLCJwcm4iOiJzbGVlcCIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IkZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlZmlsbHMuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiJTeW1wdG9tIFJlbGllZiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoic3Vic3RhbmNlIHVzZSB8IGFkdWx0IHwgc3ltcHRvbSByZWxpZWYgfCBzbGVlcCAob2ZmIGxhYmVsIHVzZSBmb3IgcGF0aWVudHMgd2l0aCBzdWJzdGFuY2UgdXNlIHN5bXB0b21zKSB8IHF1ZXRpYXBpbmUgfCBzZXJvcXVlbCB8IDI1bWcgfCBzbGVlcCB8IGZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlZmlsbHMuIn0seyJzcGVjaWFsdHkiOiJTdWJzdGFuY2UgVXNlIiwibWVkIjoiVHJhem9kb25lIiwiYnJhbmRzIjpbIkRlc3lyZWwiXSwiaW5kaWNhdGlvbiI6IlNsZWVwIiwiZG9zZV90ZXh0IjoiNTAtNzVtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxaHMiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiNSBkYXkiLCJwcm4iOiJzbGVlcCIsImZvcm0iOiJ0YWIiLCJjb21tZW50cyI6IlRha2Ugd2l0aCBmb29kLiBGb2xsb3cgdXAgd2l0aCB1c3VhbCBjYXJlIHByb3ZpZGVyIGZvciByZWZpbGxzLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiU3ltcHRvbSBSZWxpZWYiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6InN1YnN0YW5jZSB1c2UgfCBhZHVsdCB8IHN5bXB0b20gcmVsaWVmIHwgc2xlZXAgfCB0cmF6b2RvbmUgfCBkZXN5cmVsIHwgNTAtNzVtZyB8IHNsZWVwIHwgdGFrZSB3aXRoIGZvb2QuIGZvbGxvdyB1cCB3aXRoIHVzdWFsIGNhcmUgcHJvdmlkZXIgZm9yIHJlZmlsbHMuIn0seyJzcGVjaWFsdHkiOiJTdWJzdGFuY2UgVXNlIiwibWVkIjoiVHJhem9kb25lIiwiYnJhbmRzIjpbIkRlc3lyZWwiXSwiaW5kaWNhdGlvbiI6IlNsZWVwIChpbiBlbGRlcmx5KSIsImRvc2VfdGV4dCI6IjI1LTUwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicWhzIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjUgZGF5IiwicHJuIjoic2xlZXAiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJUYWtlIHdpdGggZm9vZC4gRm9sbG93IHVwIHdpdGggdXN1YWwgY2FyZSBwcm92aWRlciBmb3IgcmVmaWxscy4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6IlN5bXB0b20gUmVsaWVmIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJzdWJzdGFuY2UgdXNlIHwgYWR1bHQgfCBzeW1wdG9tIHJlbGllZiB8IHNsZWVwIChpbiBlbGRlcmx5KSB8IHRyYXpvZG9uZSB8IGRlc3lyZWwgfCAyNS01MG1nIHwgc2xlZXAgfCB0YWtlIHdpdGggZm9vZC4gZm9sbG93IHVwIHdpdGggdXN1YWwgY2FyZSBwcm92aWRlciBmb3IgcmVmaWxscy4ifSx7InNwZWNpYWx0eSI6IlN1YnN0YW5jZSBVc2UiLCJtZWQiOiJNZWxhdG9uaW4iLCJicmFuZHMiOlsiQ2lyY2FkaW4iXSwiaW5kaWNhdGlvbiI6IlNsZWVwIiwiZG9zZV90ZXh0IjoiNS0xMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InFocyIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiI3IGRheSIsInBybiI6InNsZWVwIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiSW1tZWRpYXRlIHJlbGVhc2UgZm9ybXVsYXRpb24uIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiJTeW1wdG9tIFJlbGllZiIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoic3Vic3RhbmNlIHVzZSB8IGFkdWx0IHwgc3ltcHRvbSByZWxpZWYgfCBzbGVlcCB8IG1lbGF0b25pbiB8IGNpcmNhZGluIHwgNS0xMG1nIHwgc2xlZXAgfCBpbW1lZGlhdGUgcmVsZWFzZSBmb3JtdWxhdGlvbi4ifSx7InNwZWNpYWx0eSI6IlN1YnN0YW5jZSBVc2UiLCJtZWQiOiJBY2V0YW1pbm9waGVuIiwiYnJhbmRzIjpbIlBhcmFjZXRhbW9sIiwiVHlsZW5vbCJdLCJpbmRpY2F0aW9uIjoiUGFpbi9mZXZlciIsImRvc2VfdGV4dCI6IjY1MC05NzVtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxNGgiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiNyBkYXkiLCJwcm4iOiJwYWluL2ZldmVyIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiTWF4aW11bSA0MDAwbWcgcGVyIDI0IGhvdXJzIGZyb20gYWxsIHNvdXJjZXMuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiJPdGhlciIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoic3Vic3RhbmNlIHVzZSB8IGFkdWx0IHwgb3RoZXIgfCBwYWluL2ZldmVyIHwgYWNldGFtaW5vcGhlbiB8IHBhcmFjZXRhbW9sIHR5bGVub2wgfCA2NTAtOTc1bWcgfCBwYWluL2ZldmVyIHwgbWF4aW11bSA0MDAwbWcgcGVyIDI0IGhvdXJzIGZyb20gYWxsIHNvdXJjZXMuIn0seyJzcGVjaWFsdHkiOiJTdWJzdGFuY2UgVXNlIiwibWVkIjoiSWJ1cHJvZmVuIiwiYnJhbmRzIjpbIkFkdmlsIiwiTW90cmluIl0sImluZGljYXRpb24iOiJQYWluL2ZldmVyIiwiZG9zZV90ZXh0IjoiMjAwLTQwMG1nIiwicm91dGUiOiJQTyIsImZyZXF1ZW5jeSI6InE0aCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiI3IGRheSIsInBybiI6InBhaW4iLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJNYXhpbXVtIDI0MDBtZyBwZXIgMjQgaG91cnMuIE1heSBjYXVzZSBzdG9tYWNoIGlycml0YXRpb24sIHRha2Ugd2l0aCBmb29kLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiT3RoZXIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6InN1YnN0YW5jZSB1c2UgfCBhZHVsdCB8IG90aGVyIHwgcGFpbi9mZXZlciB8IGlidXByb2ZlbiB8IGFkdmlsIG1vdHJpbiB8IDIwMC00MDBtZyB8IHBhaW4gfCBtYXhpbXVtIDI0MDBtZyBwZXIgMjQgaG91cnMuIG1heSBjYXVzZSBzdG9tYWNoIGlycml0YXRpb24sIHRha2Ugd2l0aCBmb29kLiJ9LHsic3BlY2lhbHR5IjoiU3Vic3RhbmNlIFVzZSIsIm1lZCI6Ik9uZGFuc2V0cm9uIiwiYnJhbmRzIjpbIlpvZnJhbiIsIlp1cGxlbnoiXSwiaW5kaWNhdGlvbiI6Ik5hdXNlYS92b21pdGluZyIsImRvc2VfdGV4dCI6IjRtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxNC02aCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxMiB0YWIiLCJwcm4iOiJuYXVzZWEvdm9taXRpbmciLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJNYXkgdGFrZSAxLTIgdGFicyAoNC04bWcpIHE0LTZoIFBSTi4gTWF5IGRpc3BlbnNlIFNML09EVCBpZiBwYXRpZW50IHByZWZlcmVuY2UuIE1heGltdW0gMjRtZy8yNGguIEhvbGQgaWYgc2VkYXRlZC4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6Ik90aGVyIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJzdWJzdGFuY2UgdXNlIHwgYWR1bHQgfCBvdGhlciB8IG5hdXNlYS92b21pdGluZyB8IG9uZGFuc2V0cm9uIHwgem9mcmFuIHp1cGxlbnogfCA0bWcgfCBuYXVzZWEvdm9taXRpbmcgfCBtYXkgdGFrZSAxLTIgdGFicyAoNC04bWcpIHE0LTZoIHBybi4gbWF5IGRpc3BlbnNlIHNsL29kdCBpZiBwYXRpZW50IHByZWZlcmVuY2UuIG1heGltdW0gMjRtZy8yNGguIGhvbGQgaWYgc2VkYXRlZC4ifSx7InNwZWNpYWx0eSI6IlN1YnN0YW5jZSBVc2UiLCJtZWQiOiJEaW1lbmh5ZHJpbmF0ZSIsImJyYW5kcyI6WyJHcmF2b2wiLCJEcmFtYW1pbmUiXSwiaW5kaWNhdGlvbiI6Ik5hdXNlYS92b21pdGluZyIsImRvc2VfdGV4dCI6IjUwbWciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoicTQtNmgiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMTIgdGFiIiwicHJuIjoibmF1c2VhL3ZvbWl0aW5nIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiTWF4aW11bSA0IGRvc2VzICgyMDBtZykgcGVyIDI0IGhvdXJzLiBIb2xkIGlmIHNlZGF0ZWQuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiJPdGhlciIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoic3Vic3RhbmNlIHVzZSB8IGFkdWx0IHwgb3RoZXIgfCBuYXVzZWEvdm9taXRpbmcgfCBkaW1lbmh5ZHJpbmF0ZSB8IGdyYXZvbCBkcmFtYW1pbmUgfCA1MG1nIHwgbmF1c2VhL3ZvbWl0aW5nIHwgbWF4aW11bSA0IGRvc2VzICgyMDBtZykgcGVyIDI0IGhvdXJzLiBob2xkIGlmIHNlZGF0ZWQuIn0seyJzcGVjaWFsdHkiOiJTdWJzdGFuY2UgVXNlIiwibWVkIjoiRGlwaGVuaHlkcmFtaW5lIiwiYnJhbmRzIjpbIkJlbmFkcnlsIl0sImluZGljYXRpb24iOiJBbGxlcmd5IHN5bXB0b21zIiwiZG9zZV90ZXh0IjoiMjUtNTBtZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJxNC02aCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIyNCB0YWIiLCJwcm4iOiJhbGxlcmd5IiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiTWF4aW11bSAyNW1nIGVhY2ggdGltZSBpZiBlbGRlcmx5IG9yIGtub3duIGhlcGF0aWMgaXNzdWVzLiBMaW1pdCB1c2UgdG8gbWF4aW11bSAzIGRheXMuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiJPdGhlciIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoic3Vic3RhbmNlIHVzZSB8IGFkdWx0IHwgb3RoZXIgfCBhbGxlcmd5IHN5bXB0b21zIHwgZGlwaGVuaHlkcmFtaW5lIHwgYmVuYWRyeWwgfCAyNS01MG1nIHwgYWxsZXJneSB8IG1heGltdW0gMjVtZyBlYWNoIHRpbWUgaWYgZWxkZXJseSBvciBrbm93biBoZXBhdGljIGlzc3Vlcy4gbGltaXQgdXNlIHRvIG1heGltdW0gMyBkYXlzLiJ9LHsic3BlY2lhbHR5IjoiU3Vic3RhbmNlIFVzZSIsIm1lZCI6Ikh5ZHJvY29ydGlzb25lICgwLjUlKSIsImJyYW5kcyI6WyJDb3J0YXRlIiwiSHljb3J0Il0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0b3BpY2FsIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6IiIsImZvcm0iOiJjcmVhbSIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiJPdGhlciIsInJlZmlsbCI6IjAiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoic3Vic3RhbmNlIHVzZSB8IGFkdWx0IHwgb3RoZXIgfCBoeWRyb2NvcnRpc29uZSAoMC41JSkgfCBjb3J0YXRlIGh5Y29ydCB8IDEgYXBwbGljYXRpb24ifSx7InNwZWNpYWx0eSI6IlN1YnN0YW5jZSBVc2UiLCJtZWQiOiJEaWNsb2ZlbmFjIERpZXRoeWxhbWluZSIsImJyYW5kcyI6WyJWb2x0YXJlbiBFbXVsZ2VsIl0sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0b3BpY2FsIiwiZnJlcXVlbmN5IjoiUUlEIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgdHViZSIsInBybiI6InBhaW4iLCJmb3JtIjoiY3JlYW0iLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiT3RoZXIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6InN1YnN0YW5jZSB1c2UgfCBhZHVsdCB8IG90aGVyIHwgZGljbG9mZW5hYyBkaWV0aHlsYW1pbmUgfCB2b2x0YXJlbiBlbXVsZ2VsIHwgMSBhcHBsaWNhdGlvbiB8IHBhaW4ifSx7InNwZWNpYWx0eSI6IlN1YnN0YW5jZSBVc2UiLCJtZWQiOiJQb2x5bXl4aW4gQiArIEJhY2l0cmFjaW4iLCJicmFuZHMiOlsiUG9seXNwb3JpbiJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiMSBhcHBsaWNhdGlvbiIsInJvdXRlIjoidG9waWNhbCIsImZyZXF1ZW5jeSI6IlRJRCIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxIHR1YmUiLCJwcm4iOiJ3b3VuZCBtYW5hZ2VtZW50IiwiZm9ybSI6Im9pbnRtZW50IiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6Ik90aGVyIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJzdWJzdGFuY2UgdXNlIHwgYWR1bHQgfCBvdGhlciB8IHBvbHlteXhpbiBiICsgYmFjaXRyYWNpbiB8IHBvbHlzcG9yaW4gfCAxIGFwcGxpY2F0aW9uIHwgd291bmQgbWFuYWdlbWVudCJ9LHsic3BlY2lhbHR5IjoiU3Vic3RhbmNlIFVzZSIsIm1lZCI6IlBlcm1ldGhyaW4gbG90aW9uICgxJSkiLCJicmFuZHMiOlsiTml4IiwiS3dlbGxhZGEtUCJdLCJpbmRpY2F0aW9uIjoiSGVhZCBsaWNlIiwiZG9zZV90ZXh0IjoiIiwicm91dGUiOiIiLCJmcmVxdWVuY3kiOiIiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoiIiwiZm9ybSI6IiIsImNvbW1lbnRzIjoiV2FzaCBoYWlyIGJlZm9yZSBhcHBsaWNhdGlvbi4gQXBwbHkgbG90aW9uIHRvIHNhdHVyYXRlIGhhaXIgYW5kIHNjYWxwLCBsZWF2ZSBpbiBmb3IgMTAgbWludXRlcyB0aGVuIHJpbnNlLiBSZW1vdmUgcmVtYWluaW5nIG5pdHMgd2l0aCBjb21iLiBSZXBlYXQgdHJlYXRtZW50IGluIDcgZGF5cy4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6Ik90aGVyIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJzdWJzdGFuY2UgdXNlIHwgYWR1bHQgfCBvdGhlciB8IGhlYWQgbGljZSB8IHBlcm1ldGhyaW4gbG90aW9uICgxJSkgfCBuaXgga3dlbGxhZGEtcCB8IHdhc2ggaGFpciBiZWZvcmUgYXBwbGljYXRpb24uIGFwcGx5IGxvdGlvbiB0byBzYXR1cmF0ZSBoYWlyIGFuZCBzY2FscCwgbGVhdmUgaW4gZm9yIDEwIG1pbnV0ZXMgdGhlbiByaW5zZS4gcmVtb3ZlIHJlbWFpbmluZyBuaXRzIHdpdGggY29tYi4gcmVwZWF0IHRyZWF0bWVudCBpbiA3IGRheXMuIn0seyJzcGVjaWFsdHkiOiJTdWJzdGFuY2UgVXNlIiwibWVkIjoiUGVybWV0aHJpbiBjcmVhbSAoNSUpIiwiYnJhbmRzIjpbIk5peCIsIkt3ZWxsYWRhLVAiXSwiaW5kaWNhdGlvbiI6IlNjYWJpZXMiLCJkb3NlX3RleHQiOiIiLCJyb3V0ZSI6IiIsImZyZXF1ZW5jeSI6IiIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxIHR1YmUiLCJwcm4iOiIiLCJmb3JtIjoiIiwiY29tbWVudHMiOiJBcHBseSB0byBlbnRpcmUgYm9keSBmcm9tIHNjYWxwIHRvIHNvbGVzICgzMCBnIGZvciBhdmVyYWdlIGFkdWx0KTsgbGVhdmUgb24gZm9yIDgtMTQgaG91cnMgd2FzaGluZyBvZmYuIFJlcGVhdCB0cmVhdG1lbnQgaW4gNyBkYXlzLiBUcmVhdCBjbG9zZSBjb250YWN0cy4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6Ik90aGVyIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJzdWJzdGFuY2UgdXNlIHwgYWR1bHQgfCBvdGhlciB8IHNjYWJpZXMgfCBwZXJtZXRocmluIGNyZWFtICg1JSkgfCBuaXgga3dlbGxhZGEtcCB8IGFwcGx5IHRvIGVudGlyZSBib2R5IGZyb20gc2NhbHAgdG8gc29sZXMgKDMwIGcgZm9yIGF2ZXJhZ2UgYWR1bHQpOyBsZWF2ZSBvbiBmb3IgOC0xNCBob3VycyB3YXNoaW5nIG9mZi4gcmVwZWF0IHRyZWF0bWVudCBpbiA3IGRheXMuIHRyZWF0IGNsb3NlIGNvbnRhY3RzLiJ9LHsic3BlY2lhbHR5IjoiU3Vic3RhbmNlIFVzZSIsIm1lZCI6IlBzeWxsaXVtIiwiYnJhbmRzIjpbIk1ldGFtdWNpbCJdLCJpbmRpY2F0aW9uIjoiQ29uc3RpcGF0aW9uIiwiZG9zZV90ZXh0IjoiMy40ZyIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMSBib3giLCJwcm4iOiJjb25zdGlwYXRpb24iLCJmb3JtIjoicG93ZGVyIiwiY29tbWVudHMiOiJCdWxrIGZvcm1pbmcgYWdlbnQuIENhbiBpbmNyZWFzZSB1cCB0byAxNGcgdHdpY2UgZGFpbHkgdW50aWwgcmVndWxhciBzb2Z0IGJvd2VsIG1vdmVtZW50cy4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6Ik90aGVyIiwicmVmaWxsIjoiMCIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJzdWJzdGFuY2UgdXNlIHwgYWR1bHQgfCBvdGhlciB8IGNvbnN0aXBhdGlvbiB8IHBzeWxsaXVtIHwgbWV0YW11Y2lsIHwgMy40ZyB8IGNvbnN0aXBhdGlvbiB8IGJ1bGsgZm9ybWluZyBhZ2VudC4gY2FuIGluY3JlYXNlIHVwIHRvIDE0ZyB0d2ljZSBkYWlseSB1bnRpbCByZWd1bGFyIHNvZnQgYm93ZWwgbW92ZW1lbnRzLiJ9LHsic3BlY2lhbHR5IjoiU3Vic3RhbmNlIFVzZSIsIm1lZCI6IlBFRyAzMzUwIiwiYnJhbmRzIjpbIlBvbHlldGh5bGVuZSBHbHljb2wiLCJSZXN0b3JhTEFYIiwiTGF4LUEtRGF5IiwiTWlyYWxheCIsIkdvTHl0ZWx5Il0sImluZGljYXRpb24iOiJDb25zdGlwYXRpb24iLCJkb3NlX3RleHQiOiIxN2ciLCJyb3V0ZSI6IlBPIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjE0IGRvc2UiLCJwcm4iOiJjb25zdGlwYXRpb24iLCJmb3JtIjoicG93ZGVyIiwiY29tbWVudHMiOiJPc21vdGljIGFnZW50LiBUYWtlIDEtMiB0aW1lcyBkYWlseSB1bnRpbCByZWd1bGFyIHNvZnQgYm93ZWwgbW92ZW1lbnRzLiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiT3RoZXIiLCJyZWZpbGwiOiIxIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6InN1YnN0YW5jZSB1c2UgfCBhZHVsdCB8IG90aGVyIHwgY29uc3RpcGF0aW9uIHwgcGVnIDMzNTAgfCBwb2x5ZXRoeWxlbmUgZ2x5Y29sIHJlc3RvcmFsYXggbGF4LWEtZGF5IG1pcmFsYXggZ29seXRlbHkgfCAxN2cgfCBjb25zdGlwYXRpb24gfCBvc21vdGljIGFnZW50LiB0YWtlIDEtMiB0aW1lcyBkYWlseSB1bnRpbCByZWd1bGFyIHNvZnQgYm93ZWwgbW92ZW1lbnRzLiJ9LHsic3BlY2lhbHR5IjoiU3Vic3RhbmNlIFVzZSIsIm1lZCI6IlNlbm5vc2lkZXMiLCJicmFuZHMiOlsiU2VubmEiLCJTZW5va290Il0sImluZGljYXRpb24iOiJDb25zdGlwYXRpb24iLCJkb3NlX3RleHQiOiIyIHRhYiIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiJCSUQiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiNTYgdGFiIiwicHJuIjoiY29uc3RpcGF0aW9uIiwiZm9ybSI6InRhYiIsImNvbW1lbnRzIjoiU3RpbXVsYW50IGFnZW50LiBUYWtlIDE3LjJtZyBvbmNlIGRhaWx5LCBtYXkgc2xvd2x5IGluY3JlYXNlIHVwIHRvIG1heGltdW0gMzQuNG1nIHR3aWNlIGRhaWx5IHVudGlsIHJlZ3VsYXIgc29mdCBib3dlbCBtb3ZlbWVudHMuIiwicG9wdWxhdGlvbiI6IkFkdWx0Iiwic3ViY2F0ZWdvcnkiOiJPdGhlciIsInJlZmlsbCI6IjEiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoic3Vic3RhbmNlIHVzZSB8IGFkdWx0IHwgb3RoZXIgfCBjb25zdGlwYXRpb24gfCBzZW5ub3NpZGVzIHwgc2VubmEgc2Vub2tvdCB8IDIgdGFiIHwgY29uc3RpcGF0aW9uIHwgc3RpbXVsYW50IGFnZW50LiB0YWtlIDE3LjJtZyBvbmNlIGRhaWx5LCBtYXkgc2xvd2x5IGluY3JlYXNlIHVwIHRvIG1heGltdW0gMzQuNG1nIHR3aWNlIGRhaWx5IHVudGlsIHJlZ3VsYXIgc29mdCBib3dlbCBtb3ZlbWVudHMuIn0seyJzcGVjaWFsdHkiOiJTdWJzdGFuY2UgVXNlIiwibWVkIjoiTG9wZXJhbWlkZSIsImJyYW5kcyI6WyJJbW9kaXVtIl0sImluZGljYXRpb24iOiJEaWFycmhlYSIsImRvc2VfdGV4dCI6IiIsInJvdXRlIjoiUE8iLCJmcmVxdWVuY3kiOiIiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMTYgdGFiIiwicHJuIjoiZGlhcnJoZWEiLCJmb3JtIjoidGFiIiwiY29tbWVudHMiOiJUYWtlIDRtZyBpbml0aWFsbHksIHRoZW4gMm1nIGFmdGVyIGVhY2ggbG9vc2Ugc3Rvb2wuIE1heGltdW0gOG1nIHBlciAyNCBob3Vycy4gTGltaXQgdXNlIHRvIGxlc3MgdGhhbiA0OCBob3Vycy4iLCJwb3B1bGF0aW9uIjoiQWR1bHQiLCJzdWJjYXRlZ29yeSI6Ik90aGVyIiwicmVmaWxsIjoiMSIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJzdWJzdGFuY2UgdXNlIHwgYWR1bHQgfCBvdGhlciB8IGRpYXJyaGVhIHwgbG9wZXJhbWlkZSB8IGltb2RpdW0gfCBkaWFycmhlYSB8IHRha2UgNG1nIGluaXRpYWxseSwgdGhlbiAybWcgYWZ0ZXIgZWFjaCBsb29zZSBzdG9vbC4gbWF4aW11bSA4bWcgcGVyIDI0IGhvdXJzLiBsaW1pdCB1c2UgdG8gbGVzcyB0aGFuIDQ4IGhvdXJzLiJ9LHsic3BlY2lhbHR5IjoiU3Vic3RhbmNlIFVzZSIsIm1lZCI6IlByYW1veGluZSArIFppbmMgU3VsZmF0ZSArIEh5ZHJvY29ydGlzb25lIiwiYnJhbmRzIjpbIkFudXNvbCBIQyJdLCJpbmRpY2F0aW9uIjoiSGVtb3JyaG9pZHMiLCJkb3NlX3RleHQiOiIxIGFwcGxpY2F0aW9uIiwicm91dGUiOiJ0b3BpY2FsIiwiZnJlcXVlbmN5IjoiQklEIiwiZHVyYXRpb24iOiI3IGRheSIsImRpc3BlbnNlIjoiMSB0dWJlIiwicHJuIjoiaGVtb3JyaG9pZHMiLCJmb3JtIjoib2ludG1lbnQiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiJBZHVsdCIsInN1YmNhdGVnb3J5IjoiT3RoZXIiLCJyZWZpbGwiOiIwIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6InN1YnN0YW5jZSB1c2UgfCBhZHVsdCB8IG90aGVyIHwgaGVtb3JyaG9pZHMgfCBwcmFtb3hpbmUgKyB6aW5jIHN1bGZhdGUgKyBoeWRyb2NvcnRpc29uZSB8IGFudXNvbCBoYyB8IDEgYXBwbGljYXRpb24gfCBoZW1vcnJob2lkcyJ9LHsic3BlY2lhbHR5IjoiTm9uLU1lZCIsIm1lZCI6IkFua2xlIHN0aXJydXAiLCJicmFuZHMiOltdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiIiwicm91dGUiOiIiLCJmcmVxdWVuY3kiOiIiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMSB1bml0IiwicHJuIjoiIiwiZm9ybSI6IiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IiIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6Im5vbi1tZWQgfCBhbmtsZSBzdGlycnVwIn0seyJzcGVjaWFsdHkiOiJOb24tTWVkIiwibWVkIjoiVmVsY3JvIGFua2xlIHN1cHBvcnQiLCJicmFuZHMiOltdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiIiwicm91dGUiOiIiLCJmcmVxdWVuY3kiOiIiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMSB1bml0IiwicHJuIjoiIiwiZm9ybSI6IiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IiIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6Im5vbi1tZWQgfCB2ZWxjcm8gYW5rbGUgc3VwcG9ydCJ9LHsic3BlY2lhbHR5IjoiTm9uLU1lZCIsIm1lZCI6IkFpcmNhc3Qgd2Fsa2VyIChzaG9ydCkiLCJicmFuZHMiOltdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiIiwicm91dGUiOiIiLCJmcmVxdWVuY3kiOiIiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMSB1bml0IiwicHJuIjoiIiwiZm9ybSI6IiIsImNvbW1lbnRzIjoiIiwicG9wdWxhdGlvbiI6IiIsInN1YmNhdGVnb3J5IjoiIiwicmVmaWxsIjoiIiwid2VpZ2h0X2Jhc2VkIjpmYWxzZSwiZG9zZV9wZXJfa2dfbWciOm51bGwsIm1heF9kb3NlX21nIjpudWxsLCJzZWFyY2hfdGV4dCI6Im5vbi1tZWQgfCBhaXJjYXN0IHdhbGtlciAoc2hvcnQpIn0seyJzcGVjaWFsdHkiOiJOb24tTWVkIiwibWVkIjoiQWlyY2FzdCB3YWxrZXIgKGxvbmcpIiwiYnJhbmRzIjpbXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IiIsInJvdXRlIjoiIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgdW5pdCIsInBybiI6IiIsImZvcm0iOiIiLCJjb21tZW50cyI6IiIsInBvcHVsYXRpb24iOiIiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IiIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJub24tbWVkIHwgYWlyY2FzdCB3YWxrZXIgKGxvbmcpIn0seyJzcGVjaWFsdHkiOiJOb24tTWVkIiwibWVkIjoiUmVtb3ZhYmxlIHRodW1iIHNwaWNhIHNwbGludCIsImJyYW5kcyI6W10sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIiLCJyb3V0ZSI6IiIsImZyZXF1ZW5jeSI6IiIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxIHVuaXQiLCJwcm4iOiIiLCJmb3JtIjoiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoibm9uLW1lZCB8IHJlbW92YWJsZSB0aHVtYiBzcGljYSBzcGxpbnQifSx7InNwZWNpYWx0eSI6Ik5vbi1NZWQiLCJtZWQiOiJDcnV0Y2hlcyIsImJyYW5kcyI6W10sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIiLCJyb3V0ZSI6IiIsImZyZXF1ZW5jeSI6IiIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxIHBhaXIiLCJwcm4iOiIiLCJmb3JtIjoiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoibm9uLW1lZCB8IGNydXRjaGVzIn0seyJzcGVjaWFsdHkiOiJOb24tTWVkIiwibWVkIjoiRG9jdG9yJ3Mgbm90ZSIsImJyYW5kcyI6W10sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIiLCJyb3V0ZSI6IiIsImZyZXF1ZW5jeSI6IiIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIiLCJwcm4iOiIiLCJmb3JtIjoiIiwiY29tbWVudHMiOiIiLCJwb3B1bGF0aW9uIjoiIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoibm9uLW1lZCB8IGRvY3RvcidzIG5vdGUifSx7InNwZWNpYWx0eSI6Ik5vbi1NZWQiLCJtZWQiOiJQaHlzaW90aGVyYXB5IHJlZmVycmFsIiwiYnJhbmRzIjpbXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IiIsInJvdXRlIjoiIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiIiLCJjb21tZW50cyI6IlBhdGllbnQgcmVxdWlyZXMgcGh5c2lvdGhlcmFweSBmb3IiLCJwb3B1bGF0aW9uIjoiIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoibm9uLW1lZCB8IHBoeXNpb3RoZXJhcHkgcmVmZXJyYWwgfCBwYXRpZW50IHJlcXVpcmVzIHBoeXNpb3RoZXJhcHkgZm9yIn0seyJzcGVjaWFsdHkiOiJOb24tTWVkIiwibWVkIjoiTWFzc2FnZSB0aGVyYXB5IHJlZmVycmFsIiwiYnJhbmRzIjpbXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IiIsInJvdXRlIjoiIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IiIsInBybiI6IiIsImZvcm0iOiIiLCJjb21tZW50cyI6IlBhdGllbnQgcmVxdWlyZXMgbWFzc2FnZSB0aGVyYXB5IGZvciIsInBvcHVsYXRpb24iOiIiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IiIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJub24tbWVkIHwgbWFzc2FnZSB0aGVyYXB5IHJlZmVycmFsIHwgcGF0aWVudCByZXF1aXJlcyBtYXNzYWdlIHRoZXJhcHkgZm9yIn0seyJzcGVjaWFsdHkiOiJOb24tTWVkIiwibWVkIjoiQ29tcHJlc3Npb24gc3RvY2tpbmcgKDEwLTIwbW1IZykiLCJicmFuZHMiOltdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiIiwicm91dGUiOiIiLCJmcmVxdWVuY3kiOiIiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMSBwYWlyIiwicHJuIjoiIiwiZm9ybSI6IiIsImNvbW1lbnRzIjoiTWlsZCBzdHJlbmd0aC4gVXNlIGFzIGRpcmVjdGVkLiIsInBvcHVsYXRpb24iOiIiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IiIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJub24tbWVkIHwgY29tcHJlc3Npb24gc3RvY2tpbmcgKDEwLTIwbW1oZykgfCBtaWxkIHN0cmVuZ3RoLiB1c2UgYXMgZGlyZWN0ZWQuIn0seyJzcGVjaWFsdHkiOiJOb24tTWVkIiwibWVkIjoiQ29tcHJlc3Npb24gc3RvY2tpbmcgKDIwLTMwbW1IZykiLCJicmFuZHMiOltdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiIiwicm91dGUiOiIiLCJmcmVxdWVuY3kiOiIiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMSBwYWlyIiwicHJuIjoiIiwiZm9ybSI6IiIsImNvbW1lbnRzIjoiTW9kZXJhdGUgc3RyZW5ndGguIFVzZSBhcyBkaXJlY3RlZC4iLCJwb3B1bGF0aW9uIjoiIiwic3ViY2F0ZWdvcnkiOiIiLCJyZWZpbGwiOiIiLCJ3ZWlnaHRfYmFzZWQiOmZhbHNlLCJkb3NlX3Blcl9rZ19tZyI6bnVsbCwibWF4X2Rvc2VfbWciOm51bGwsInNlYXJjaF90ZXh0Ijoibm9uLW1lZCB8IGNvbXByZXNzaW9uIHN0b2NraW5nICgyMC0zMG1taGcpIHwgbW9kZXJhdGUgc3RyZW5ndGguIHVzZSBhcyBkaXJlY3RlZC4ifSx7InNwZWNpYWx0eSI6Ik5vbi1NZWQiLCJtZWQiOiJHbHVjb21ldGVyIiwiYnJhbmRzIjpbIk9uZVRvdWNoIiwiQWNjdS1DaGVrIiwiQ29udG91ciIsIkZyZWVTdHlsZSBMaWJyZSJdLCJpbmRpY2F0aW9uIjoiIiwiZG9zZV90ZXh0IjoiIiwicm91dGUiOiIiLCJmcmVxdWVuY3kiOiIiLCJkdXJhdGlvbiI6IiIsImRpc3BlbnNlIjoiMSB1bml0IiwicHJuIjoiIiwiZm9ybSI6IiIsImNvbW1lbnRzIjoiUGxlYXNlIGdpdmUgZWR1Y2F0aW9uIGlmIHJlcXVpcmVkLiIsInBvcHVsYXRpb24iOiIiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IiIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJub24tbWVkIHwgZ2x1Y29tZXRlciB8IG9uZXRvdWNoIGFjY3UtY2hlayBjb250b3VyIGZyZWVzdHlsZSBsaWJyZSB8IHBsZWFzZSBnaXZlIGVkdWNhdGlvbiBpZiByZXF1aXJlZC4ifSx7InNwZWNpYWx0eSI6Ik5vbi1NZWQiLCJtZWQiOiJHbHVjb3NlIHRlc3Qgc3RyaXBzIiwiYnJhbmRzIjpbXSwiaW5kaWNhdGlvbiI6IiIsImRvc2VfdGV4dCI6IiIsInJvdXRlIjoiIiwiZnJlcXVlbmN5IjoiIiwiZHVyYXRpb24iOiIiLCJkaXNwZW5zZSI6IjEgYm94IiwicHJuIjoiIiwiZm9ybSI6IiIsImNvbW1lbnRzIjoiUGxlYXNlIGdpdmUgZWR1Y2F0aW9uIGlmIHJlcXVpcmVkLiIsInBvcHVsYXRpb24iOiIiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IiIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJub24tbWVkIHwgZ2x1Y29zZSB0ZXN0IHN0cmlwcyB8IHBsZWFzZSBnaXZlIGVkdWNhdGlvbiBpZiByZXF1aXJlZC4ifSx7InNwZWNpYWx0eSI6Ik5vbi1NZWQiLCJtZWQiOiJBZXJvY2hhbWJlciIsImJyYW5kcyI6W10sImluZGljYXRpb24iOiIiLCJkb3NlX3RleHQiOiIiLCJyb3V0ZSI6IiIsImZyZXF1ZW5jeSI6IiIsImR1cmF0aW9uIjoiIiwiZGlzcGVuc2UiOiIxIGRldmljZSIsInBybiI6IiIsImZvcm0iOiIiLCJjb21tZW50cyI6IlBoYXJtYWNpc3QgdG8gZ2l2ZSBlZHVjYXRpb24gaWYgbmVlZGVkLiIsInBvcHVsYXRpb24iOiIiLCJzdWJjYXRlZ29yeSI6IiIsInJlZmlsbCI6IiIsIndlaWdodF9iYXNlZCI6ZmFsc2UsImRvc2VfcGVyX2tnX21nIjpudWxsLCJtYXhfZG9zZV9tZyI6bnVsbCwic2VhcmNoX3RleHQiOiJub24tbWVkIHwgYWVyb2NoYW1iZXIgfCBwaGFybWFjaXN0IHRvIGdpdmUgZWR1Y2F0aW9uIGlmIG5lZWRlZC4ifV19"));
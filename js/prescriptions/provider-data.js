@@ -1,2 +1,2 @@
 // Auto-generated by build.py - do not edit
-const PROVIDER_DATA=JSON.parse(atob("W3sibmFtZSI6IkFsdmluIFlhbmciLCJjcHNvIjoiMTE4NzQ5In0seyJuYW1lIjoiUHJpc2NpbGxhIFl1bmciLCJjcHNvIjoiMTE1NzE2In0seyJuYW1lIjoiSm9zaHVhIFNoYXBpcm8iLCJjcHNvIjoiMTE4NzkzIn1d"));
+const PROVIDER_DATA=JSON.parse('[{"name":"Alvin Yang","cpso":"118749"},{"name":"Priscilla Yung","cpso":"115716"},{"name":"Joshua Shapiro","cpso":"118793"}]');
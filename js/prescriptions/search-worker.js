@@ -0,0 +1,76 @@
+/**
+ * ED Prescriptions — Search Worker
+ *
+ * Runs SearchManager (01-core.js) off the main thread. The page
+ * (SearchWorkerClient in 01-core.js) posts the searchable medications —
+ * base chunks with the site overlay applied — whenever they change, then
+ * one message per keystroke.
+ *
+ * Messages in:
+ *  - { type: "meds", revision, meds }   replace the searchable medications
+ *  - { type: "fuzzy", url }             load a FuzzyIndex for typo matching
+ *  - { type: "search", seq, query, searchIndications }
+ *
+ * Messages out:
+ *  - { type: "results", seq, revision, adult, pediatric, other }
+ *      ranked ids (Int32Array) into the meds of that revision
+ *
+ * SearchManager.search is synchronous, so queries that arrive while one
+ * is scoring queue up; only the newest of them is run.
+ */
+class PrescriptionSearchWorker {
+  constructor(searchManager, post, fuzzyIndex) {
+    this.searchManager = searchManager;
+    this.post = post; // post(message, transfer)
+    this.fuzzyIndex = fuzzyIndex;
+    this.revision = 0;
+    this.ids = new Map(); // med -> index in the posted meds
+    this.pending = null; // newest search not yet run
+  }
+
+  onMessage(message) {
+    switch (message.type) {
+      case "meds":
+        this.revision = message.revision;
+        this.searchManager.medications = message.meds;
+        this.ids = new Map(message.meds.map((med, i) => [med, i]));
+        break;
+      case "fuzzy":
+        this.fuzzyIndex.load(message.url)
+          .then(index => this.searchManager.setFuzzyIndex(index))
+          .catch(error => console.warn("Fuzzy index unavailable:", error));
+        break;
+      case "search":
+        if (!this.pending) setTimeout(() => this.runPending(), 0);
+        this.pending = message;
+        break;
+    }
+  }
+
+  runPending() {
+    const job = this.pending;
+    this.pending = null;
+    this.searchManager.searchIndications = Boolean(job.searchIndications);
+    const groups = this.searchManager.search(job.query);
+
+    const toIds = meds => Int32Array.from(meds, med => this.ids.get(med));
+    const adult = toIds(groups.adult);
+    const pediatric = toIds(groups.pediatric);
+    const other = toIds(groups.other);
+    this.post({
+      type: "results", seq: job.seq, revision: this.revision, adult, pediatric, other
+    }, [adult.buffer, pediatric.buffer, other.buffer]);
+  }
+}
+
+if (typeof importScripts === "function") {
+  // 01-core.js publishes its helpers on window, which a worker lacks
+  self.window = self;
+  importScripts("../fuzzy-index.js", "01-core.js");
+  const searchWorker = new PrescriptionSearchWorker(
+    new SearchManager([]),
+    (message, transfer) => self.postMessage(message, transfer || []),
+    FuzzyIndex
+  );
+  self.onmessage = event => searchWorker.onMessage(event.data);
+}
@@ -101,6 +101,20 @@
     if (!location.hash || location.hash === "#") {
       history.replaceState(null, "", "#billing");
     }
+
+    Shell._registerServiceWorker();
+  };
+
+  // ─── Offline Cache ─────────────────────────────────────────────
+  // sw.js is generated by tools/build.py. Skipped on localhost so edits
+  // to CSS/JS show up on reload without rebuilding the precache manifest.
+  Shell._registerServiceWorker = function () {
+    if (!("serviceWorker" in navigator)) return;
+    var host = location.hostname;
+    if (host === "localhost" || host === "127.0.0.1") return;
+    navigator.serviceWorker.register("sw.js").catch(function (err) {
+      console.warn("Service worker registration failed:", err);
+    });
   };
 
   // ─── Page Switching ────────────────────────────────────────────
@@ -415,33 +429,37 @@
   };
 
   Shell._onSearchInput = function (query) {
-    // Run billing search
-    var billingResults = null;
+    // Run billing search (in its worker; resolves null if superseded)
+    var billingSearch = null;
     if (window.App && window.App.doSearch) {
-      billingResults = window.App.doSearch(query);
+      billingSearch = window.App.doSearch(query);
     }
 
-    // Run prescription search
-    var rxResults = null;
+    // Run prescription search (also in a worker; resolves with the rendered groups)
+    var rxSearch = null;
     if (window.app && window.app.controllers && window.app.controllers.search) {
-      window.app.controllers.search.search(query);
-      // Get result count from the search manager
-      if (window.app.managers && window.app.managers.search && query && query.trim()) {
-        var groups = window.app.managers.search.search(query);
-        if (groups) {
-          rxResults = [].concat(groups.adult || [], groups.pediatric || [], groups.other || []);
-        }
-      }
+      rxSearch = window.app.controllers.search.search(query);
     }
 
-    // Cache results
-    Shell.searchResults = {
-      billing: billingResults,
-      rx: rxResults
-    };
+    Promise.all([billingSearch, rxSearch]).then(function (results) {
+      var billingResults = results[0];
+      var groups = results[1];
+      if (billingSearch && !billingResults) return; // a newer query is running
+      if (query.trim() && rxSearch && !groups) return; // likewise for prescriptions
+
+      var rxResults = groups
+        ? [].concat(groups.adult || [], groups.pediatric || [], groups.other || [])
+        : null;
 
-    // Smart auto-switch
-    Shell._handleAutoSwitch(billingResults, rxResults);
+      // Cache results
+      Shell.searchResults = {
+        billing: billingResults,
+        rx: rxResults
+      };
+
+      // Smart auto-switch
+      Shell._handleAutoSwitch(billingResults, rxResults);
+    });
   };
 
   Shell._handleAutoSwitch = function (billingResults, rxResults) {
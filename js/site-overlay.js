@@ -0,0 +1,81 @@
+/**
+ * EM Hub — Per-site formulary overlays
+ *
+ * A site overlay (js/prescriptions/sites/<id>.json, built by
+ * tools/build.py from data/sites/<Site name>.xlsx) lists the rows one
+ * site adds, overrides or removes relative to the shared prescription
+ * base, grouped by specialty, plus the site's merged folder counts.
+ *
+ * apply() merges one specialty's ops into that specialty's base chunk,
+ * exactly as tools/site_overlays.py apply_overlay does for the whole list:
+ * keys join specialty / population / subcategory / med / indication, the
+ * nth override/remove for a key targets the key's nth base row, overrides
+ * keep the row's position, removes drop it and adds go last.
+ */
+var SiteOverlay = (function () {
+  "use strict";
+
+  var KEY_FIELDS = ["specialty", "population", "subcategory", "med", "indication"];
+
+  function medKey(med) {
+    return KEY_FIELDS.map(function (field) { return String(med[field] || ""); }).join(" / ");
+  }
+
+  /** Number repeats of a key " #2", " #3", ... in order of appearance */
+  function numberer() {
+    var seen = new Map();
+    return function (med) {
+      var key = medKey(med);
+      var n = (seen.get(key) || 0) + 1;
+      seen.set(key, n);
+      return n === 1 ? key : key + " #" + n;
+    };
+  }
+
+  /** Return meds with ops applied; meds itself is not modified */
+  function apply(meds, ops) {
+    if (!ops || ops.length === 0) return meds;
+
+    var indexByKey = new Map();
+    var baseKey = numberer();
+    meds.forEach(function (med, i) { indexByKey.set(baseKey(med), i); });
+
+    var replacements = new Map(); // base index -> med, or null to remove
+    var additions = [];
+    var opKey = numberer();
+    ops.forEach(function (op) {
+      if (op.action === "add") {
+        additions.push(op.med);
+        return;
+      }
+      var index = indexByKey.get(opKey(op.med));
+      if (index !== undefined) {
+        replacements.set(index, op.action === "override" ? op.med : null);
+      }
+    });
+
+    var merged = [];
+    meds.forEach(function (med, i) {
+      var replacement = replacements.has(i) ? replacements.get(i) : med;
+      if (replacement !== null) merged.push(replacement);
+    });
+    return merged.concat(additions);
+  }
+
+  function load(url) {
+    return fetch(url).then(function (res) {
+      if (!res.ok) throw new Error("Failed to load " + url + ": " + res.status);
+      return res.json();
+    });
+  }
+
+  return {
+    apply: apply,
+    load: load,
+    medKey: medKey,
+  };
+})();
+
+if (typeof module !== "undefined" && module.exports) {
+  module.exports = SiteOverlay;
+}
@@ -0,0 +1,80 @@
+// Auto-generated by build.py - do not edit
+/**
+ * EM Hub — Offline-first service worker
+ *
+ * Serves every precached asset cache-first. Cache keys carry the asset's
+ * content revision, so a new build only downloads assets whose revision
+ * changed; unchanged entries are reused and stale ones are dropped once
+ * the new worker activates.
+ */
+"use strict";
+
+var PRECACHE_VERSION = "d7776833c208fc8a";
+var PRECACHE_ASSETS = [["css/billing/components.css","66d61006b19259cd"],["css/billing/layout.css","8f4eeb5a0841727d"],["css/billing/reset.css","5d681adf5139705d"],["css/billing/theme-original.css","910c88d2ec4733ca"],["css/billing/typography.css","53f84a92b01d8d43"],["css/prescriptions/styles.css","c8c3fd48fa65b4d8"],["css/shell.css","459d86cda5a4d3b4"],["css/styles.css","9ec2d251945b5f04"],["css/theme.css","0ec236db9d4636ac"],["data/billing/anatomy_sections.json","d4c2fc20f7f3efb7"],["data/billing/billing_calendar.json","0a3780382503c2b3"],["data/billing/billing_codes.json","c3dd43aaf4aaf3f6"],["data/billing/billing_views.json","69cb0a5653ffffd0"],["data/billing/diagnostic_codes.json","855e15d469526aa3"],["data/billing/diagnostic_tree.json","6a4d00cc7494ad56"],["data/billing/general_tips.json","e4c236b2772f60d4"],["data/billing/oncall_tables.json","2eebcb5366e4d827"],["data/billing/search-index.bin","23fff110021785b3"],["data/billing/suggestion_index.json","018d0efb5967ef8a"],["data/fuzzy-index.json","6e652a5c49ed1180"],["index.html","0de5299b5069c806"],["js/billing/app.js","05821ebe70541c2d"],["js/billing/calculations.js","f882a4cb5f87a814"],["js/billing/context-panel.js","27673b5030ffd433"],["js/billing/modals.js","19a8549ea832341d"],["js/billing/navigation.js","8d5c4c873481a428"],["js/billing/search-client.js","00930afabd4b17db"],["js/billing/search-worker.js","b36b0709296931bf"],["js/billing/search.js","ce323e555697761d"],["js/billing/swipe.js","095d537143213897"],["js/billing/time-highlight.js","8d987931af10d1e2"],["js/billing/user.js","dd3efb926970632b"],["js/billing/utils.js","4f1302f86254b80d"],["js/fuzzy-index.js","e92b10d4000e072e"],["js/location-index.js","4dcf9cbd8856e994"],["js/prescriptions/01-core.js","99b658ef79b4b54c"],["js/prescriptions/02-ui.js","178f6be74b548a42"],["js/prescriptions/03-controllers.js","1942a1d99d9b586b"],["js/prescriptions/04-app.js","1f3d53aeaf87d4e9"],["js/prescriptions/chunks/allergy.json","63c1e87465a2944b"],["js/prescriptions/chunks/analgesia.json","b8e890d0a792a413"],["js/prescriptions/chunks/anti-infective.json","d209257ee7c08d5c"],["js/prescriptions/chunks/antiemetic.json","ce33a731e6905edb"],["js/prescriptions/chunks/cardiac-heme.json","25769478d64f60c4"],["js/prescriptions/chunks/derm.json","0e164bd403fae621"],["js/prescriptions/chunks/ent.json","40421d84e86074c3"],["js/prescriptions/chunks/eye.json","4a4bc99cdb0260de"],["js/prescriptions/chunks/gi.json","da29b8c00bab7929"],["js/prescriptions/chunks/gu.json","8af2fb0ce9ad005f"],["js/prescriptions/chunks/neuro-endocrine.json","f0facb36f720e159"],["js/prescriptions/chunks/non-med.json","34ed502412f236e1"],["js/prescriptions/chunks/obgyn.json","811ea154c3812d5c"],["js/prescriptions/chunks/psych.json","d8073d01dd08c932"],["js/prescriptions/chunks/respiratory.json","6752f34b3da138cb"],["js/prescriptions/chunks/sti.json","0e9b81ef9f88f5d6"],["js/prescriptions/chunks/substance-use.json","d2a57a91faf97cc7"],["js/prescriptions/location-data.js","97cec5b777b62436"],["js/prescriptions/prescription-catalog.js","8106c932610b3071"],["js/prescriptions/provider-data.js","b275edf908168e95"],["js/prescriptions/search-worker.js","7463523742cb40fc"],["js/shell.js","e577a8ff69694fe3"],["js/site-overlay.js","1ae7b53ddb215732"],["manifest.json","266b12d57eb91346"]]; // [url, revision] pairs
+var CACHE_NAME = "emhub-precache";
+
+var SCOPE = self.registration.scope;
+
+function assetUrl(url) {
+  return new URL(url, SCOPE).href;
+}
+
+function cacheKey(url, revision) {
+  return assetUrl(url) + "?__rev=" + revision;
+}
+
+// Request URL (without query/hash) -> revisioned cache key
+var KEY_BY_URL = {};
+PRECACHE_ASSETS.forEach(function (asset) {
+  KEY_BY_URL[assetUrl(asset[0])] = cacheKey(asset[0], asset[1]);
+});
+KEY_BY_URL[SCOPE] = KEY_BY_URL[assetUrl("index.html")];
+
+self.addEventListener("install", function (event) {
+  event.waitUntil(
+    caches.open(CACHE_NAME).then(function (cache) {
+      return Promise.all(PRECACHE_ASSETS.map(function (asset) {
+        var key = cacheKey(asset[0], asset[1]);
+        return cache.match(key).then(function (hit) {
+          if (hit) return; // unchanged since a previous install
+          return fetch(assetUrl(asset[0]), { cache: "no-cache" }).then(function (res) {
+            if (!res.ok) throw new Error("Precache failed for " + asset[0] + ": " + res.status);
+            return cache.put(key, res);
+          });
+        });
+      }));
+    })
+  );
+});
+
+self.addEventListener("activate", function (event) {
+  var wanted = new Set(Object.keys(KEY_BY_URL).map(function (url) {
+    return KEY_BY_URL[url];
+  }));
+  event.waitUntil(
+    caches.open(CACHE_NAME).then(function (cache) {
+      return cache.keys().then(function (requests) {
+        return Promise.all(requests.map(function (req) {
+          return wanted.has(req.url) ? null : cache.delete(req);
+        }));
+      });
+    }).then(function () {
+      return self.clients.claim();
+    })
+  );
+});
+
+self.addEventListener("fetch", function (event) {
+  if (event.request.method !== "GET") return;
+  var url = new URL(event.request.url);
+  var key = KEY_BY_URL[url.origin + url.pathname];
+  if (!key) return; // not precached: default network handling
+
+  event.respondWith(
+    caches.open(CACHE_NAME).then(function (cache) {
+      return cache.match(key).then(function (hit) {
+        return hit || fetch(event.request);
+      });
+    })
+  );
+});
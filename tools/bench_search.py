@@ -0,0 +1,368 @@
+#!/opt/homebrew/bin/python3
+"""
+Search latency and relevance benchmark.
+
+Replays a labelled query corpus against both client search engines
+(js/billing/search.js and SearchManager in js/prescriptions/01-core.js)
+running headless in Node, over the real data and over synthetic copies
+scaled up from it. Reports p50/p95/p99 latency and mean recall@k per
+engine and scale, so index and search changes can be judged on numbers.
+
+Corpus format (JSON Lines, see bench/search_queries.jsonl):
+    {"engine": "billing", "query": "colles", "expected": ["billing:F027"]}
+    {"engine": "prescriptions", "query": "keflex", "expected": ["Cephalexin"]}
+Billing labels are "billing:<code>" or "diagnostic:<code>"; prescription
+labels are medication names. "expected" may be omitted (latency only),
+so raw query logs can be replayed after wrapping each line.
+
+Scaling: each record is kept and joined by (scale - 1) clones with a
+suffixed code or name and one word swapped for another word from the
+dataset, which produces near-miss distractors rather than exact copies.
+Recall only counts the original records.
+
+Usage:
+    python bench_search.py
+    python bench_search.py --scales 1 10 100 --repeat 5 --k 10
+    python bench_search.py --no-fuzzy --json before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import logging
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import build
+import fuzzy_index
+import prescription_converter as converter
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+DEFAULT_CORPUS = Path(__file__).parent / "bench" / "search_queries.jsonl"
+DEFAULT_SCALES = (1, 10, 100)
+ENGINES = ("billing", "prescriptions")
+PERCENTILES = (50, 95, 99)
+
+# Runs every query once to warm up, then `repeat` timed times. Prints a
+# JSON list of {ms: [...], ranked: [...]} in corpus order.
+_NODE_RUNNER = """\
+const fs = require("fs");
+const path = require("path");
+const vm = require("vm");
+const [root, work, repeat] = process.argv.slice(1);
+const read = (name) => JSON.parse(fs.readFileSync(path.join(work, name), "utf8"));
+const queries = read("queries.json");
+const fuzzyArtifact = fs.existsSync(path.join(work, "fuzzy-index.json"))
+  ? read("fuzzy-index.json") : null;
+const FuzzyIndex = require(path.join(root, "js/fuzzy-index.js"));
+
+// Billing engine: plain script with CommonJS exports
+global.fetch = async (p) => ({ ok: true, json: async () => read(path.basename(p)) });
+const billing = require(path.join(root, "js/billing/search.js"));
+
+// Prescription engine: browser script, evaluated with minimal globals
+const context = vm.createContext({
+  console, atob, setTimeout, clearTimeout, window: {}, navigator: {},
+  document: { addEventListener() {}, getElementById() { return null; } },
+  localStorage: { getItem() { return null; }, setItem() {} },
+});
+vm.runInContext(
+  fs.readFileSync(path.join(root, "js/prescriptions/01-core.js"), "utf8")
+    + "\\nthis.SearchManager = SearchManager;",
+  context,
+);
+const manager = new context.SearchManager(read("meds.json"));
+let ranked = [];
+const groupByPopulation = manager.groupByPopulation;
+manager.groupByPopulation = function (meds) {
+  ranked = meds; // deduplicated, in score order
+  return groupByPopulation.call(this, meds);
+};
+
+function runBilling(query) {
+  const r = billing.search(query);
+  return r.billing.map((e) => "billing:" + e.code.code)
+    .concat(r.diagnostic.map((e) => "diagnostic:" + e.code.code));
+}
+
+function runPrescriptions(query) {
+  manager.search(query);
+  return ranked.map((med) => med.med);
+}
+
+(async () => {
+  await billing.loadSearchData("");
+  if (fuzzyArtifact) {
+    const index = FuzzyIndex.create(fuzzyArtifact);
+    billing.setFuzzyIndex(index);
+    manager.setFuzzyIndex(index);
+  }
+  const results = [];
+  for (const q of queries) {
+    const run = q.engine === "billing" ? runBilling : runPrescriptions;
+    const result = run(q.query); // warm-up, and the ranking we report
+    const ms = [];
+    for (let i = 0; i < Number(repeat); i++) {
+      const start = process.hrtime.bigint();
+      run(q.query);
+      ms.push(Number(process.hrtime.bigint() - start) / 1e6);
+    }
+    results.push({ ms, ranked: result });
+  }
+  process.stdout.write(JSON.stringify(results));
+})().catch((e) => { console.error(e); process.exit(1); });
+"""
+
+
+# ---------------------------------------------------------------------------
+# Corpus & Datasets
+# ---------------------------------------------------------------------------
+
+
+def load_corpus(path: Path) -> list[dict[str, Any]]:
+    """Load a JSON Lines query corpus, skipping blank and # comment lines."""
+    queries: list[dict[str, Any]] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            entry = json.loads(line)
+            if entry.get("engine") not in ENGINES:
+                raise ValueError(f"{path}:{line_no}: unknown engine {entry.get('engine')!r}")
+            entry.setdefault("expected", [])
+            queries.append(entry)
+    return queries
+
+
+def _swap_word(text: str, vocabulary: list[str], rng: random.Random) -> str:
+    """Replace one word of 4+ letters in text with a random vocabulary word."""
+    words = text.split(" ")
+    candidates = [i for i, w in enumerate(words) if len(w) >= 4 and w.isalpha()]
+    if not candidates:
+        return text
+    words[rng.choice(candidates)] = rng.choice(vocabulary)
+    return " ".join(words)
+
+
+def scale_records(
+    records: list[dict[str, Any]], scale: int, id_field: str, text_field: str,
+    seed: int = 0,
+) -> list[dict[str, Any]]:
+    """Return records followed by (scale - 1) perturbed clones of each.
+
+    Clones get "~<n>" appended to id_field and one word of text_field
+    swapped, so they compete in ranking without matching labels.
+    """
+    rng = random.Random(seed)
+    vocabulary = sorted({
+        w for r in records for w in str(r.get(text_field, "")).split(" ")
+        if len(w) >= 4 and w.isalpha()
+    })
+    scaled = list(records)
+    for n in range(1, scale):
+        for record in records:
+            clone = copy.deepcopy(record)
+            clone[id_field] = f"{record[id_field]}~{n}"
+            if text_field != id_field:
+                clone[text_field] = _swap_word(str(record.get(text_field, "")), vocabulary, rng)
+            scaled.append(clone)
+    return scaled
+
+
+def load_datasets() -> dict[str, list[dict[str, Any]]] | None:
+    """Load the real billing, diagnostic and prescription data."""
+    data = converter.convert_excel(build.PRESCRIPTION_ENTRY.source)
+    if data is None:
+        return None
+    return {
+        "billing_codes": build._load_json(build.BILLING_DIR / "billing_codes.json"),
+        "diagnostic_codes": build._load_json(build.BILLING_DIR / "diagnostic_codes.json"),
+        "meds": data["meds"],
+    }
+
+
+def scale_datasets(
+    datasets: dict[str, list[dict[str, Any]]], scale: int,
+) -> dict[str, list[dict[str, Any]]]:
+    """Scale every dataset by the same factor."""
+    return {
+        "billing_codes": scale_records(datasets["billing_codes"], scale, "code", "name", seed=1),
+        "diagnostic_codes": scale_records(datasets["diagnostic_codes"], scale, "code", "name", seed=2),
+        "meds": scale_records(datasets["meds"], scale, "med", "indication", seed=3),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+
+def run_node(
+    node: str, datasets: dict[str, list[dict[str, Any]]],
+    queries: list[dict[str, Any]], repeat: int, fuzzy: bool,
+) -> list[dict[str, Any]]:
+    """Run the corpus through both engines in Node; return per-query results."""
+    with tempfile.TemporaryDirectory() as tmp:
+        work = Path(tmp)
+        for name, records in datasets.items():
+            (work / f"{name}.json").write_text(json.dumps(records), encoding="utf-8")
+        (work / "queries.json").write_text(json.dumps(queries), encoding="utf-8")
+        if fuzzy:
+            terms = fuzzy_index.extract_terms(fuzzy_index.collect_texts(
+                datasets["meds"], datasets["billing_codes"], datasets["diagnostic_codes"],
+            ))
+            index = fuzzy_index.build_index(terms)
+            (work / "fuzzy-index.json").write_text(json.dumps(index), encoding="utf-8")
+        proc = subprocess.run(
+            [node, "-e", _NODE_RUNNER, str(build.PROJECT_ROOT), str(work), str(repeat)],
+            capture_output=True, text=True, check=True,
+        )
+    return json.loads(proc.stdout)
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Return the pct-th percentile of samples (linear interpolation)."""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def recall_at_k(ranked: list[str], expected: list[str], k: int) -> float:
+    """Fraction of expected labels present in the top k results.
+
+    Billing and diagnostic results are separate columns in the UI, so each
+    "<list>:" label prefix is cut at k on its own.
+    """
+    top: set[str] = set()
+    taken: dict[str, int] = {}
+    for label in ranked:
+        group = label.split(":", 1)[0] if ":" in label else ""
+        if taken.get(group, 0) < k:
+            top.add(label)
+            taken[group] = taken.get(group, 0) + 1
+    return sum(label in top for label in expected) / len(expected)
+
+
+def summarize(
+    queries: list[dict[str, Any]], results: list[dict[str, Any]], k: int,
+) -> dict[str, dict[str, Any]]:
+    """Aggregate latency percentiles and recall@k per engine."""
+    summary: dict[str, dict[str, Any]] = {}
+    for engine in ENGINES:
+        pairs = [(q, r) for q, r in zip(queries, results) if q["engine"] == engine]
+        if not pairs:
+            continue
+        samples = [ms for _, r in pairs for ms in r["ms"]]
+        labelled = [(q, r) for q, r in pairs if q["expected"]]
+        misses = [q["query"] for q, r in labelled
+                  if recall_at_k(r["ranked"], q["expected"], k) < 1]
+        summary[engine] = {
+            "queries": len(pairs),
+            "samples": len(samples),
+            **{f"p{p}": percentile(samples, p) for p in PERCENTILES},
+            "recall": (sum(recall_at_k(r["ranked"], q["expected"], k) for q, r in labelled)
+                       / len(labelled)) if labelled else None,
+            "misses": misses,
+        }
+    return summary
+
+
+def format_report(report: dict[int, dict[str, dict[str, Any]]], k: int) -> str:
+    """Format the per-scale summaries as a fixed-width table."""
+    header = ("scale", "engine", "queries", "p50 ms", "p95 ms", "p99 ms", f"recall@{k}")
+    lines = [header]
+    for scale, engines in report.items():
+        for engine, s in engines.items():
+            lines.append((
+                f"{scale}x", engine, str(s["queries"]),
+                *(f"{s[f'p{p}']:.3f}" for p in PERCENTILES),
+                "-" if s["recall"] is None else f"{s['recall']:.3f}",
+            ))
+    widths = [max(len(line[i]) for line in lines) for i in range(len(header))]
+    return "\n".join(
+        "  ".join(col.ljust(w) if i < 2 else col.rjust(w)
+                  for i, (col, w) in enumerate(zip(line, widths)))
+        for line in lines
+    )
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark client search latency and recall.")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS,
+                        help="JSON Lines query corpus (default: bench/search_queries.jsonl)")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES),
+                        help="Dataset scale factors (default: 1 10 100)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Timed runs per query after one warm-up (default: 3)")
+    parser.add_argument("--k", type=int, default=10, help="Cutoff for recall@k (default: 10)")
+    parser.add_argument("--fuzzy", action=argparse.BooleanOptionalAction, default=True,
+                        help="Load a fuzzy index built from each dataset (default: on)")
+    parser.add_argument("--json", type=Path, default=None, metavar="PATH",
+                        help="Also write the full report as JSON")
+    parser.add_argument("--verbose", "-v", action="store_true",
+                        help="List queries that miss an expected result")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the benchmark. Returns 0 on success, 1 on failure."""
+    args = parse_args()
+    converter.setup_logging(verbose=False)
+    logging.getLogger(converter.__name__).setLevel(logging.ERROR)
+
+    node = shutil.which("node")
+    if node is None:
+        logger.error("node not found on PATH")
+        return 1
+    queries = load_corpus(args.corpus)
+    datasets = load_datasets()
+    if datasets is None:
+        return 1
+
+    report: dict[int, dict[str, dict[str, Any]]] = {}
+    for scale in args.scales:
+        logger.info("Running %d queries at %dx...", len(queries), scale)
+        scaled = scale_datasets(datasets, scale)
+        try:
+            results = run_node(node, scaled, queries, args.repeat, args.fuzzy)
+        except subprocess.CalledProcessError as e:
+            logger.error("Node runner failed:\n%s", e.stderr)
+            return 1
+        report[scale] = summarize(queries, results, args.k)
+
+    print(format_report(report, args.k))
+    if args.verbose:
+        for scale, engines in report.items():
+            for engine, s in engines.items():
+                if s["misses"]:
+                    print(f"{scale}x {engine} misses: {', '.join(s['misses'])}")
+    if args.json is not None:
+        args.json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
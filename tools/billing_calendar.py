@@ -0,0 +1,253 @@
+"""
+Billing calendar generation.
+
+Computes Ontario statutory holidays under the OHIP Schedule of Benefits
+H-code definition and the resulting billing time periods for a span of
+years, and writes them as data/billing/billing_calendar.json. The client
+(js/billing/time-highlight.js) then finds the current period with a
+binary search over sorted interval start times instead of recomputing
+Easter and nth-weekday rules on every check.
+
+Two period schemes are emitted:
+
+    assessment   night 00-08, weekday_day 08-17, weekday_evening 17-24,
+                 weekend_holiday 08-24 (H-code time highlighting)
+    oncall       night 00-07, weekday_daytime 07-17, weekday_evening 17-24,
+                 weekend_holiday 07-24 (oncall_tables.json scenarios)
+
+Interval times are wall-clock minutes since 1970-01-01 00:00 with no
+time zone attached, so daylight-saving changes never move a boundary.
+"""
+
+from __future__ import annotations
+
+import logging
+from bisect import bisect_right
+from itertools import accumulate
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import json_codec
+import prescription_converter as converter
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+CALENDAR_VERSION = 1
+
+# Years covered relative to the build year.
+YEARS_BEFORE = 1
+YEARS_AFTER = 5
+
+_EPOCH = datetime(1970, 1, 1)
+_MONDAY, _FRIDAY, _SATURDAY, _SUNDAY = 0, 4, 5, 6
+
+
+class PeriodScheme(NamedTuple):
+    night_end_hour: int
+    evening_start_hour: int
+    night: str
+    weekday_day: str
+    weekday_evening: str
+    weekend_holiday: str
+
+    @property
+    def periods(self) -> tuple[str, ...]:
+        return (self.night, self.weekday_day, self.weekday_evening, self.weekend_holiday)
+
+
+SCHEMES: dict[str, PeriodScheme] = {
+    "assessment": PeriodScheme(
+        8, 17, "night", "weekday_day", "weekday_evening", "weekend_holiday",
+    ),
+    "oncall": PeriodScheme(
+        7, 17, "night", "weekday_daytime", "weekday_evening", "weekend_holiday",
+    ),
+}
+
+
+# ---------------------------------------------------------------------------
+# Holidays
+# ---------------------------------------------------------------------------
+
+
+def easter_sunday(year: int) -> date:
+    """Easter Sunday via the Anonymous Gregorian algorithm."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """Return the nth (1-based) weekday (0=Mon..6=Sun) of a month."""
+    first = date(year, month, 1)
+    offset = (weekday - first.weekday()) % 7
+    return first + timedelta(days=offset + 7 * (n - 1))
+
+
+def holidays(year: int) -> dict[date, str]:
+    """Return the OHIP H-code holidays of a year, mapped to their names."""
+    days: dict[date, str] = {}
+
+    new_year = date(year, 1, 1)
+    days[new_year] = "New Year's Day"
+    if new_year.weekday() == _SATURDAY:
+        days[date(year, 1, 3)] = "New Year's Day (observed)"
+    elif new_year.weekday() == _SUNDAY:
+        days[date(year, 1, 2)] = "New Year's Day (observed)"
+
+    days[nth_weekday(year, 2, _MONDAY, 3)] = "Family Day"
+    days[easter_sunday(year) - timedelta(days=2)] = "Good Friday"
+
+    may24 = date(year, 5, 24)
+    days[may24 - timedelta(days=may24.weekday())] = "Victoria Day"
+
+    # Canada Day on a weekend adds BOTH the Friday before and Monday after.
+    canada = date(year, 7, 1)
+    days[canada] = "Canada Day"
+    if canada.weekday() in (_SATURDAY, _SUNDAY):
+        friday = canada - timedelta(days=(canada.weekday() - _FRIDAY))
+        days[friday] = "Canada Day (observed)"
+        days[canada + timedelta(days=7 - canada.weekday())] = "Canada Day (observed)"
+
+    days[nth_weekday(year, 8, _MONDAY, 1)] = "Civic Holiday"
+    days[nth_weekday(year, 9, _MONDAY, 1)] = "Labour Day"
+    days[nth_weekday(year, 10, _MONDAY, 2)] = "Thanksgiving"
+
+    for day in range(25, 32):
+        days[date(year, 12, day)] = "Christmas Day" if day == 25 else "Christmas Break"
+    christmas = date(year, 12, 25)
+    if christmas.weekday() == _SATURDAY:
+        days[date(year, 12, 24)] = "Christmas Day (observed)"
+    elif christmas.weekday() == _SUNDAY:
+        days[date(year, 12, 23)] = "Christmas Day (observed)"
+
+    return dict(sorted(days.items()))
+
+
+# ---------------------------------------------------------------------------
+# Time Periods
+# ---------------------------------------------------------------------------
+
+
+def wall_minutes(moment: datetime) -> int:
+    """Minutes since 1970-01-01 00:00, ignoring any time zone."""
+    return int((moment.replace(tzinfo=None) - _EPOCH).total_seconds() // 60)
+
+
+def build_intervals(
+    scheme: PeriodScheme, first_year: int, last_year: int, holiday_dates: set[date],
+) -> tuple[list[int], list[str], int]:
+    """Return (starts, periods, end) covering first_year..last_year inclusive.
+
+    Adjacent segments with the same period are merged, so each start is a
+    real period change.
+    """
+    starts: list[int] = []
+    periods: list[str] = []
+
+    def add(moment: datetime, period: str) -> None:
+        if periods and periods[-1] == period:
+            return
+        starts.append(wall_minutes(moment))
+        periods.append(period)
+
+    day = date(first_year, 1, 1)
+    end = date(last_year + 1, 1, 1)
+    while day < end:
+        midnight = datetime(day.year, day.month, day.day)
+        add(midnight, scheme.night)
+        morning = midnight + timedelta(hours=scheme.night_end_hour)
+        if day.weekday() in (_SATURDAY, _SUNDAY) or day in holiday_dates:
+            add(morning, scheme.weekend_holiday)
+        else:
+            add(morning, scheme.weekday_day)
+            add(midnight + timedelta(hours=scheme.evening_start_hour), scheme.weekday_evening)
+        day += timedelta(days=1)
+
+    return starts, periods, wall_minutes(datetime(end.year, 1, 1))
+
+
+def build_calendar(first_year: int, last_year: int) -> dict[str, Any]:
+    """Build the calendar artifact for first_year..last_year inclusive.
+
+    Each scheme stores its period names once; intervals are encoded as
+    start-time deltas (minutes) plus period indices, decoded by the client
+    with a running sum.
+    """
+    holiday_names: dict[date, str] = {}
+    for year in range(first_year, last_year + 1):
+        holiday_names.update(holidays(year))
+
+    schemes: dict[str, Any] = {}
+    for name, scheme in SCHEMES.items():
+        starts, periods, end = build_intervals(
+            scheme, first_year, last_year, set(holiday_names),
+        )
+        index = {period: i for i, period in enumerate(scheme.periods)}
+        schemes[name] = {
+            "periods": list(scheme.periods),
+            "base": starts[0],
+            "end": end,
+            "deltas": [0] + [b - a for a, b in zip(starts, starts[1:])],
+            "period_ids": [index[p] for p in periods],
+        }
+
+    return {
+        "version": CALENDAR_VERSION,
+        "first_year": first_year,
+        "last_year": last_year,
+        "holidays": {d.isoformat(): n for d, n in holiday_names.items()},
+        "schemes": schemes,
+    }
+
+
+def period_at(calendar: dict[str, Any], scheme_name: str, moment: datetime) -> str | None:
+    """Look up the period at a wall-clock moment (None outside the calendar).
+
+    Reference implementation of the client's binary search.
+    """
+    scheme = calendar["schemes"][scheme_name]
+    starts = list(accumulate(scheme["deltas"], initial=scheme["base"]))[1:]
+    minutes = wall_minutes(moment)
+    if minutes < starts[0] or minutes >= scheme["end"]:
+        return None
+    position = bisect_right(starts, minutes) - 1
+    return scheme["periods"][scheme["period_ids"][position]]
+
+
+# ---------------------------------------------------------------------------
+# Build Step
+# ---------------------------------------------------------------------------
+
+
+def write_calendar(output_path: Path, first_year: int, last_year: int) -> bool:
+    """Write the billing calendar for first_year..last_year as JSON.
+
+    Returns True on success, False on failure.
+    """
+    try:
+        calendar = build_calendar(first_year, last_year)
+        content = json_codec.dumps(calendar, compact=True)
+        converter.write_file_atomically(output_path, content, suffix=".json")
+    except Exception as e:
+        logger.error("  Error writing %s: %s", output_path.name, e)
+        return False
+
+    logger.info(
+        "  Wrote %s (%d-%d, %d holidays, %d bytes)",
+        output_path, first_year, last_year, len(calendar["holidays"]), len(content),
+    )
+    return True
@@ -0,0 +1,170 @@
+"""
+Pre-joined billing views.
+
+anatomy_sections.json (Ortho & MSK section headers) and oncall_tables.json
+(on-call premium scenarios) reference billing codes by string. This stage
+validates every reference against billing_codes.json and writes
+data/billing/billing_views.json, where each reference carries the integer
+index of its billing_codes.json entry plus the code's name and fee, so the
+client renders a section with one array read instead of building a
+code -> entry map on every navigation.
+
+Codes are not unique in billing_codes.json; as in the client's lookups,
+the last entry for a code wins.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any
+
+import json_codec
+import prescription_converter as converter
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+VIEWS_VERSION = 1
+
+
+# ---------------------------------------------------------------------------
+# View Construction
+# ---------------------------------------------------------------------------
+
+
+def index_codes(billing_codes: list[dict[str, Any]]) -> dict[str, int]:
+    """Map each code to its (last) position in billing_codes."""
+    return {entry["code"]: i for i, entry in enumerate(billing_codes)}
+
+
+def _resolve(
+    code: str, positions: dict[str, int], billing_codes: list[dict[str, Any]],
+) -> dict[str, Any] | None:
+    """Return the inlined {i, code, name, fee} row for code, or None."""
+    i = positions.get(code)
+    if i is None:
+        return None
+    entry = billing_codes[i]
+    return {"i": i, "code": code, "name": entry["name"], "fee": entry["fee"]}
+
+
+def build_anatomy_view(
+    anatomy_sections: dict[str, list[dict[str, Any]]],
+    positions: dict[str, int],
+    billing_codes: list[dict[str, Any]],
+    missing: list[str],
+) -> dict[str, list[dict[str, Any]]]:
+    """Resolve each section's code list into inlined rows.
+
+    Dividers pass through unchanged; unknown codes are dropped (as the
+    client already did) and recorded in missing as "subgroup / header: code".
+    """
+    view: dict[str, list[dict[str, Any]]] = {}
+    for subgroup, sections in anatomy_sections.items():
+        resolved: list[dict[str, Any]] = []
+        for section in sections:
+            if "divider" in section:
+                resolved.append({"divider": section["divider"]})
+                continue
+            rows = []
+            for code in section.get("codes", []):
+                row = _resolve(code, positions, billing_codes)
+                if row is None:
+                    missing.append(f"{subgroup} / {section.get('header', '')}: {code}")
+                else:
+                    rows.append(row)
+            resolved.append({"header": section.get("header", ""), "rows": rows})
+        view[subgroup] = resolved
+    return view
+
+
+def build_oncall_view(
+    oncall_tables: dict[str, Any],
+    positions: dict[str, int],
+    billing_codes: list[dict[str, Any]],
+    missing: list[str],
+) -> dict[str, Any]:
+    """Flatten on-call scenarios into ordered role rows.
+
+    A role with a known code takes its name and fee from the billing list
+    unless the table sets them; null codes are placeholders and kept as-is.
+    """
+    view: dict[str, Any] = {}
+    for table_key, table in oncall_tables.items():
+        if not isinstance(table, dict):
+            view[table_key] = {"title": str(table), "scenarios": {}}
+            continue
+        scenarios: dict[str, list[dict[str, Any]]] = {}
+        for scenario_key, roles in (table.get("scenarios") or {}).items():
+            rows = []
+            for role, data in roles.items():
+                code = data.get("code")
+                row = {"role": role, "i": None, "code": code,
+                       "name": data.get("name") or "", "fee": data.get("fee")}
+                if code:
+                    billing = _resolve(code, positions, billing_codes)
+                    if billing is None:
+                        missing.append(f"{table_key} / {scenario_key} / {role}: {code}")
+                    else:
+                        row["i"] = billing["i"]
+                        row["name"] = row["name"] or billing["name"]
+                        if row["fee"] is None:
+                            row["fee"] = billing["fee"]
+                rows.append(row)
+            scenarios[scenario_key] = rows
+        view[table_key] = {"title": table.get("title", table_key), "scenarios": scenarios}
+    return view
+
+
+def build_views(
+    billing_codes: list[dict[str, Any]],
+    anatomy_sections: dict[str, list[dict[str, Any]]],
+    oncall_tables: dict[str, Any],
+) -> tuple[dict[str, Any], list[str]]:
+    """Build the views artifact; also return the unresolved references."""
+    positions = index_codes(billing_codes)
+    missing: list[str] = []
+    views = {
+        "version": VIEWS_VERSION,
+        "billing_count": len(billing_codes),
+        "anatomy": build_anatomy_view(anatomy_sections, positions, billing_codes, missing),
+        "oncall": build_oncall_view(oncall_tables, positions, billing_codes, missing),
+    }
+    return views, missing
+
+
+# ---------------------------------------------------------------------------
+# Build Step
+# ---------------------------------------------------------------------------
+
+
+def write_billing_views(
+    output_path: Path,
+    billing_codes: list[dict[str, Any]],
+    anatomy_sections: dict[str, list[dict[str, Any]]],
+    oncall_tables: dict[str, Any],
+) -> bool:
+    """Build the pre-joined views and write them as JSON.
+
+    Unresolved codes are logged as warnings but do not fail the build.
+    Returns True on success, False on failure.
+    """
+    try:
+        views, missing = build_views(billing_codes, anatomy_sections, oncall_tables)
+        content = json_codec.dumps(views, compact=True, ensure_ascii=False)
+        converter.write_file_atomically(output_path, content, suffix=".json")
+    except Exception as e:
+        logger.error("  Error writing %s: %s", output_path.name, e)
+        return False
+
+    for reference in missing:
+        logger.warning("  Unknown billing code in %s", reference)
+    logger.info(
+        "  Wrote %s (%d anatomy subgroups, %d on-call tables, %d missing codes)",
+        output_path, len(views["anatomy"]), len(views["oncall"]), len(missing),
+    )
+    return True
@@ -2,25 +2,50 @@
 """
 Build script for ED Prescriptions.
 
-Converts source data files into base64-encoded JS files that get loaded
-by the browser. Run this after editing any data source file.
+Converts source data files into JS files that JSON.parse an embedded
+string literal (plus per-specialty prescription chunks and per-site
+formulary overlays, see site_overlays) that get loaded by the browser,
+then regenerates the service worker precache manifest and writes
+.gz/.br siblings of every served asset (used by serve.py).
+Run this after editing any data source file or any HTML/CSS/JS asset
+(the service worker keeps serving cached copies until it is rebuilt).
 
 Usage:
     python build.py
     python build.py --verbose
+    python build.py --sqlite            # also write data/reference.sqlite
+    python build.py --no-snapshot       # skip appending to data/snapshots.sqlite
+    python build.py --data-format base64  # legacy atob() wrapping
 """
 
 from __future__ import annotations
 
 import argparse
 import base64
+import hashlib
 import json
 import logging
+import re
 import sys
+from collections import defaultdict
+from datetime import date
 from pathlib import Path
 from typing import Any, NamedTuple
 
+import billing_calendar
+import billing_views
+import change_report
+import compress
+import dpd_crossref
+import fuzzy_index
+import json_codec
+import location_index
+import precache
 import prescription_converter as converter
+import search_index
+import snapshot_store
+import site_overlays
+import sqlite_export
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +55,25 @@ logger = logging.getLogger(__name__)
 
 PROJECT_ROOT = (Path(__file__).parent / "..").resolve()
 DATA_DIR = PROJECT_ROOT / "data"
+BILLING_DIR = DATA_DIR / "billing"
 JS_DIR = PROJECT_ROOT / "js" / "prescriptions"
+CHUNK_DIR = JS_DIR / "chunks"
+SITES_DIR = DATA_DIR / "sites"
+SITE_OVERLAY_DIR = JS_DIR / "sites"
+
+DEFAULT_SQLITE_PATH = DATA_DIR / "reference.sqlite"
+SNAPSHOT_STORE_PATH = DATA_DIR / "snapshots.sqlite"
+FUZZY_INDEX_PATH = DATA_DIR / "fuzzy-index.json"
+CALENDAR_PATH = BILLING_DIR / "billing_calendar.json"
+BILLING_VIEWS_PATH = BILLING_DIR / "billing_views.json"
+SEARCH_INDEX_PATH = BILLING_DIR / "search-index.bin"
+LOCATION_INDEX_PATH = DATA_DIR / "location-index.json"
+FSA_CENTROIDS_PATH = DATA_DIR / "fsa_centroids.csv"
+DPD_DIR = DATA_DIR / "dpd"
+DPD_REPORT_PATH = DATA_DIR / "dpd-report.json"
+
+# Encodings supported by render_js_data.
+DATA_FORMATS = ("literal", "base64")
 
 
 class DataFileEntry(NamedTuple):
@@ -39,18 +82,31 @@ class DataFileEntry(NamedTuple):
     var_name: str
 
 
+# The catalog is small and loads synchronously; full medication records
+# live in per-specialty JSON chunks under CHUNK_DIR, fetched after first paint.
 PRESCRIPTION_ENTRY = DataFileEntry(
     source=DATA_DIR / "Prescriptions.xlsx",
-    output=JS_DIR / "prescription-data.js",
-    var_name="PRESCRIPTION_DATA",
+    output=JS_DIR / "prescription-catalog.js",
+    var_name="PRESCRIPTION_CATALOG",
+)
+
+# Converter fields the browser never reads, left out of the chunks. The
+# client builds its own search fields (SearchManager.buildSearchableFields);
+# search_text stays in the converter output for the SQLite export.
+CHUNK_OMITTED_FIELDS = frozenset({"search_text"})
+
+# Populations with their own folder; everything else is grouped as Non-Med
+# (mirrors NavigationDataHelper.getNonMedMedications).
+_FOLDER_POPULATIONS = frozenset({"Adult", "Pediatric"})
+
+LOCATION_ENTRY = DataFileEntry(
+    source=DATA_DIR / "Locations.json",
+    output=JS_DIR / "location-data.js",
+    var_name="LOCATION_DATA",
 )
 
 JSON_ENTRIES = [
-    DataFileEntry(
-        source=DATA_DIR / "Locations.json",
-        output=JS_DIR / "location-data.js",
-        var_name="LOCATION_DATA",
-    ),
+    LOCATION_ENTRY,
     DataFileEntry(
         source=DATA_DIR / "AuthorizedProviders.json",
         output=JS_DIR / "provider-data.js",
@@ -64,44 +120,299 @@ JSON_ENTRIES = [
 # ---------------------------------------------------------------------------
 
 
-def write_js_file(output_path: Path, var_name: str, data: Any) -> bool:
-    """Write data as a base64-encoded JS variable, atomically."""
+def _js_single_quoted(text: str) -> str:
+    """Escape text for embedding in a single-quoted JS string literal."""
+    return (
+        text.replace("\\", "\\\\")
+        .replace("'", "\\'")
+        .replace("\u2028", "\\u2028")
+        .replace("\u2029", "\\u2029")
+    )
+
+
+def render_js_data(var_name: str, data: Any, data_format: str = "literal") -> str:
+    """Render data as a JS variable declaration in the given format.
+
+    "literal" embeds the JSON text in a JSON.parse('...') call: V8 and
+    SpiderMonkey parse a JSON string faster than the equivalent object
+    literal, and the text stays compressible. "base64" is the legacy
+    JSON.parse(atob("...")) form, kept for comparison.
+    """
+    json_text = json_codec.dumps(data, compact=True)
+    if data_format == "literal":
+        payload = f"JSON.parse('{_js_single_quoted(json_text)}')"
+    elif data_format == "base64":
+        encoded = base64.b64encode(json_text.encode("utf-8")).decode("ascii")
+        payload = f'JSON.parse(atob("{encoded}"))'
+    else:
+        raise ValueError(f"Unknown data format: {data_format}")
+    return (
+        f"// Auto-generated by build.py - do not edit\n"
+        f"const {var_name}={payload};\n"
+    )
+
+
+def write_js_file(
+    output_path: Path, var_name: str, data: Any, data_format: str = "literal",
+) -> bool:
+    """Write data as a JS variable (see render_js_data), atomically."""
     try:
-        json_bytes = json.dumps(data, separators=(",", ":")).encode("utf-8")
-        encoded = base64.b64encode(json_bytes).decode("ascii")
-        content = (
-            f"// Auto-generated by build.py - do not edit\n"
-            f"const {var_name}=JSON.parse(atob(\"{encoded}\"));\n"
-        )
+        content = render_js_data(var_name, data, data_format)
         converter.write_file_atomically(output_path, content, suffix=".js")
-        logger.info("  Wrote %s (%d bytes encoded)", output_path, len(encoded))
+        logger.info("  Wrote %s (%d bytes, %s)", output_path, len(content), data_format)
         return True
     except Exception as e:
         logger.error("  Error writing %s: %s", output_path.name, e)
         return False
 
 
+# ---------------------------------------------------------------------------
+# Prescription Catalog & Chunks
+# ---------------------------------------------------------------------------
+
+
+def _chunk_slug(specialty: str, taken: set[str]) -> str:
+    """Return a unique, URL-safe file stem for a specialty name."""
+    base = re.sub(r"[^a-z0-9]+", "-", specialty.lower()).strip("-") or "specialty"
+    slug, n = base, 2
+    while slug in taken:
+        slug, n = f"{base}-{n}", n + 1
+    taken.add(slug)
+    return slug
+
+
+def _count_tree(meds: list[dict[str, Any]]) -> dict[str, Any]:
+    """Count meds per population -> specialty -> subcategory.
+
+    Keys are trimmed the same way NavigationDataHelper normalizes them, so
+    the front end can answer countMeds() before any chunk has loaded.
+    """
+    tree: dict[str, Any] = {}
+    for med in meds:
+        pop = (med.get("population") or "").strip()
+        if pop not in _FOLDER_POPULATIONS:
+            pop = "Non-Med"
+        spec = (med.get("specialty") or "").strip()
+        sub = (med.get("subcategory") or "").strip()
+
+        pop_node = tree.setdefault(pop, {"total": 0, "specialties": {}})
+        pop_node["total"] += 1
+        if not spec:
+            continue
+        spec_node = pop_node["specialties"].setdefault(
+            spec, {"total": 0, "subcategories": {}},
+        )
+        spec_node["total"] += 1
+        if sub:
+            subs = spec_node["subcategories"]
+            subs[sub] = subs.get(sub, 0) + 1
+    return tree
+
+
+def _chunk_med(med: dict[str, Any]) -> dict[str, Any]:
+    """Return a medication record as the browser receives it."""
+    return {key: value for key, value in med.items() if key not in CHUNK_OMITTED_FIELDS}
+
+
+def split_prescriptions(
+    data: dict[str, Any],
+) -> tuple[dict[str, Any], dict[str, bytes]]:
+    """Split converter output into a catalog plus per-specialty chunks.
+
+    Returns (catalog, chunks) where chunks maps file name -> JSON bytes.
+    Chunks keep the converter's sheet/row order, so concatenating them in
+    catalog order reproduces the original ``meds`` list, less
+    CHUNK_OMITTED_FIELDS.
+    """
+    by_specialty: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for med in data["meds"]:
+        by_specialty[med["specialty"]].append(_chunk_med(med))
+
+    chunks: dict[str, bytes] = {}
+    chunk_index: list[dict[str, Any]] = []
+    taken: set[str] = set()
+    for specialty, meds in by_specialty.items():
+        file_name = f"{_chunk_slug(specialty, taken)}.json"
+        payload = json_codec.dumps(
+            {"specialty": specialty, "meds": meds}, compact=True,
+        ).encode("utf-8")
+        chunks[file_name] = payload
+        chunk_index.append({
+            "specialty": specialty,
+            "url": (CHUNK_DIR / file_name).relative_to(PROJECT_ROOT).as_posix(),
+            "count": len(meds),
+            "size": len(payload),
+            "revision": hashlib.sha256(payload).hexdigest()[:12],
+        })
+
+    catalog = {
+        "source": data["source"],
+        "chunks": chunk_index,
+        "counts": _count_tree(data["meds"]),
+    }
+    return catalog, chunks
+
+
+def write_chunks(chunk_dir: Path, chunks: dict[str, bytes]) -> bool:
+    """Write chunk files and delete chunks left over from removed specialties.
+
+    Also used for site overlay artifacts (one "chunk" per site).
+    """
+    try:
+        for file_name, payload in chunks.items():
+            converter.write_file_atomically(
+                chunk_dir / file_name, payload.decode("utf-8"), suffix=".json",
+            )
+        for stale in chunk_dir.glob("*.json"):
+            if stale.name not in chunks:
+                logger.info("  Removing stale chunk %s", stale.name)
+                stale.unlink()
+    except Exception as e:
+        logger.error("  Error writing prescription chunks: %s", e)
+        return False
+
+    logger.info(
+        "  Wrote %d chunks to %s (%d bytes)",
+        len(chunks), chunk_dir, sum(len(p) for p in chunks.values()),
+    )
+    return True
+
+
+def load_chunk_meds(chunk_dir: Path) -> list[dict[str, Any]] | None:
+    """Return the meds in a previous build's chunks, or None if unavailable.
+
+    Medication keys (converter.MED_KEY_FIELDS) include the specialty, so
+    the order chunks are read in does not affect a change report.
+    """
+    meds: list[dict[str, Any]] = []
+    try:
+        for path in sorted(chunk_dir.glob("*.json")):
+            meds.extend(_load_json(path)["meds"])
+    except (OSError, json.JSONDecodeError, KeyError) as e:
+        logger.warning("  Previous chunks unreadable (%s) - reporting all as added", e)
+        return None
+    return meds or None
+
+
+# ---------------------------------------------------------------------------
+# Site Overlays
+# ---------------------------------------------------------------------------
+
+
+def render_site_overlay(
+    overlay: dict[str, Any], base_meds: list[dict[str, Any]],
+) -> tuple[dict[str, Any], int]:
+    """Build a site's overlay artifact, returning (artifact, unmatched ops).
+
+    The artifact holds the site's ops grouped by specialty (applied by
+    js/site-overlay.js to each base chunk as it loads) and the folder
+    counts of the merged formulary, which replace the catalog's counts.
+    """
+    merged, unmatched = site_overlays.apply_overlay(base_meds, overlay["ops"])
+    ops = [{"action": op["action"], "med": _chunk_med(op["med"])} for op in overlay["ops"]]
+    artifact = {
+        "site": overlay["site"],
+        "ops": site_overlays.ops_by_specialty(ops),
+        "counts": _count_tree(merged),
+    }
+    return artifact, unmatched
+
+
+def build_site_overlays(
+    sites_dir: Path, output_dir: Path, base_meds: list[dict[str, Any]],
+) -> list[dict[str, Any]] | None:
+    """Convert every site overlay workbook and write its artifact.
+
+    Returns the catalog's site index (one entry per site), or None if an
+    overlay failed to convert or has ops matching no base row.
+    """
+    overlay_paths = site_overlays.find_overlays(sites_dir)
+    if not overlay_paths and not output_dir.exists():
+        return []
+    logger.info("Building %d site overlays...", len(overlay_paths))
+
+    files: dict[str, bytes] = {}
+    index: list[dict[str, Any]] = []
+    taken: set[str] = set()
+    success = True
+    for path in overlay_paths:
+        overlay = site_overlays.convert_overlay(path)
+        if overlay is None:
+            success = False
+            continue
+        artifact, unmatched = render_site_overlay(overlay, base_meds)
+        if unmatched:
+            logger.error("  %s: %d overlay rows match no base row", path.name, unmatched)
+            success = False
+        site_id = _chunk_slug(overlay["site"], taken)
+        payload = json_codec.dumps(artifact, compact=True).encode("utf-8")
+        files[f"{site_id}.json"] = payload
+        index.append({
+            "site": overlay["site"],
+            "id": site_id,
+            "url": (SITE_OVERLAY_DIR / f"{site_id}.json").relative_to(PROJECT_ROOT).as_posix(),
+            "ops": len(overlay["ops"]),
+            "size": len(payload),
+            "revision": hashlib.sha256(payload).hexdigest()[:12],
+        })
+
+    if not write_chunks(output_dir, files):
+        return None
+    return index if success else None
+
+
 # ---------------------------------------------------------------------------
 # Build Steps
 # ---------------------------------------------------------------------------
 
 
-def build_prescriptions(entry: DataFileEntry) -> bool:
-    """Convert Excel prescriptions to JS data file."""
+def build_prescriptions(
+    entry: DataFileEntry, data_format: str = "literal",
+) -> dict[str, Any] | None:
+    """Convert Excel prescriptions to the catalog JS file and chunk files.
+
+    The catalog also indexes the site overlays built on top of the base,
+    and a change report against the previous chunks is written next to
+    the workbook. Returns the converted base data (for later build steps), or None on
+    failure.
+    """
     logger.info("Building prescription data...")
     data = converter.convert_excel(entry.source)
     if data is None:
-        return False
-    return write_js_file(entry.output, entry.var_name, data)
-
-
-def build_json_file(entry: DataFileEntry) -> bool:
-    """Convert a JSON source file to a JS data file."""
+        return None
+    previous = load_chunk_meds(CHUNK_DIR)
+    catalog, chunks = split_prescriptions(data)
+    if not write_chunks(CHUNK_DIR, chunks):
+        return None
+    # Compared as shipped, since the previous chunks omit CHUNK_OMITTED_FIELDS
+    report = change_report.build_report(
+        previous, [_chunk_med(med) for med in data["meds"]], converter.MED_KEY_FIELDS,
+    )
+    if not change_report.write_report(change_report.report_path(entry.source), report):
+        return None
+    sites = build_site_overlays(SITES_DIR, SITE_OVERLAY_DIR, data["meds"])
+    if sites is None:
+        return None
+    catalog["sites"] = sites
+    if not write_js_file(entry.output, entry.var_name, catalog, data_format):
+        return None
+    return data
+
+
+def build_json_file(
+    entry: DataFileEntry, data_format: str = "literal", extra: dict[str, Any] | None = None,
+) -> bool:
+    """Convert a JSON source file to a JS data file.
+
+    extra keys are added to the source's top-level object.
+    """
     logger.info("Building %s...", entry.output.name)
     try:
         with open(entry.source, "r", encoding="utf-8") as f:
             data = json.load(f)
-        return write_js_file(entry.output, entry.var_name, data)
+        if extra:
+            data.update(extra)
+        return write_js_file(entry.output, entry.var_name, data, data_format)
     except FileNotFoundError:
         logger.error("  Source file not found: %s", entry.source)
         return False
@@ -110,6 +421,136 @@ def build_json_file(entry: DataFileEntry) -> bool:
         return False
 
 
+def _load_json(path: Path) -> Any:
+    """Load a JSON source file, raising on missing or invalid files."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _load_sources(target: str, *paths: Path) -> list[Any] | None:
+    """Load a build step's JSON sources, or log why not and return None."""
+    try:
+        return [_load_json(path) for path in paths]
+    except FileNotFoundError as e:
+        logger.error("  Source file not found: %s", e.filename)
+    except json.JSONDecodeError as e:
+        logger.error("  Invalid JSON source for %s: %s", target, e)
+    return None
+
+
+def build_fuzzy_index(output_path: Path, prescriptions: dict[str, Any]) -> bool:
+    """Write the typo-tolerant term index over prescription and billing data."""
+    logger.info("Building %s...", output_path.name)
+    sources = _load_sources(
+        output_path.name, BILLING_DIR / "billing_codes.json", BILLING_DIR / "diagnostic_codes.json",
+    )
+    if sources is None:
+        return False
+    billing_codes, diagnostic_codes = sources
+    return fuzzy_index.write_fuzzy_index(
+        output_path, prescriptions["meds"], billing_codes, diagnostic_codes,
+    )
+
+
+def build_dpd_crossref(
+    dpd_dir: Path, report_path: Path, prescriptions: dict[str, Any],
+) -> bool:
+    """Check meds against a local DPD extract, attaching DINs for later steps."""
+    logger.info("Cross-referencing the Drug Product Database...")
+    return dpd_crossref.write_crossref(dpd_dir, prescriptions["meds"], report_path)
+
+
+def build_billing_views(output_path: Path) -> bool:
+    """Write anatomy and on-call views pre-joined against billing codes."""
+    logger.info("Building %s...", output_path.name)
+    sources = _load_sources(
+        output_path.name,
+        BILLING_DIR / "billing_codes.json",
+        BILLING_DIR / "anatomy_sections.json",
+        BILLING_DIR / "oncall_tables.json",
+    )
+    if sources is None:
+        return False
+    billing_codes, anatomy_sections, oncall = sources
+    return billing_views.write_billing_views(
+        output_path, billing_codes, anatomy_sections, oncall.get("tables", {}),
+    )
+
+
+def build_search_index(output_path: Path) -> bool:
+    """Write the binary billing search index for the search worker."""
+    logger.info("Building %s...", output_path.name)
+    sources = _load_sources(
+        output_path.name, BILLING_DIR / "billing_codes.json", BILLING_DIR / "diagnostic_codes.json",
+    )
+    if sources is None:
+        return False
+    billing_codes, diagnostic_codes = sources
+    return search_index.write_search_index(output_path, billing_codes, diagnostic_codes)
+
+
+def build_calendar(output_path: Path, build_year: int) -> bool:
+    """Write the holiday/time-period calendar around the build year."""
+    logger.info("Building %s...", output_path.name)
+    return billing_calendar.write_calendar(
+        output_path,
+        build_year - billing_calendar.YEARS_BEFORE,
+        build_year + billing_calendar.YEARS_AFTER,
+    )
+
+
+def build_location_index(output_path: Path, centroids_path: Path) -> bool:
+    """Write the nearest-hospital index (skipped without a centroid table)."""
+    logger.info("Building %s...", output_path.name)
+    sources = _load_sources(output_path.name, DATA_DIR / "Locations.json")
+    if sources is None:
+        return False
+    locations = sources[0].get("locations", [])
+    return location_index.write_location_index(output_path, locations, centroids_path)
+
+
+def build_sqlite(db_path: Path, prescriptions: dict[str, Any]) -> bool:
+    """Export prescriptions plus billing/location JSON sources to SQLite."""
+    logger.info("Building %s...", db_path.name)
+    sources = _load_sources(
+        db_path.name,
+        BILLING_DIR / "billing_codes.json",
+        BILLING_DIR / "diagnostic_codes.json",
+        BILLING_DIR / "anatomy_sections.json",
+        BILLING_DIR / "oncall_tables.json",
+        DATA_DIR / "Locations.json",
+    )
+    if sources is None:
+        return False
+    billing_codes, diagnostic_codes, anatomy_sections, oncall, locations = sources
+    data = sqlite_export.ReferenceData(
+        meds=prescriptions["meds"],
+        billing_codes=billing_codes,
+        diagnostic_codes=diagnostic_codes,
+        anatomy_sections=anatomy_sections,
+        oncall_tables=oncall.get("tables", {}),
+        locations=locations.get("locations", []),
+    )
+    return sqlite_export.export_sqlite(db_path, data)
+
+
+def build_snapshot(store_path: Path, prescriptions: dict[str, Any]) -> bool:
+    """Append this build's prescriptions and billing/diagnostic codes to the store."""
+    logger.info("Recording snapshot in %s...", store_path.name)
+    sources = _load_sources(
+        store_path.name, BILLING_DIR / "billing_codes.json", BILLING_DIR / "diagnostic_codes.json",
+    )
+    if sources is None:
+        return False
+    billing_codes, diagnostic_codes = sources
+    datasets = {
+        "prescriptions": prescriptions["meds"],
+        "billing_codes": billing_codes,
+        "diagnostic_codes": diagnostic_codes,
+    }
+    return snapshot_store.write_snapshot(store_path, datasets, label="build")
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -125,6 +566,28 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Enable verbose debug logging",
     )
+    parser.add_argument(
+        "--sqlite",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_SQLITE_PATH,
+        default=None,
+        metavar="PATH",
+        help="Also export all reference data to SQLite "
+             "(default path: data/reference.sqlite)",
+    )
+    parser.add_argument(
+        "--no-snapshot",
+        action="store_true",
+        help="Do not append this build to the snapshot store "
+             "(data/snapshots.sqlite)",
+    )
+    parser.add_argument(
+        "--data-format",
+        choices=DATA_FORMATS,
+        default="literal",
+        help="How JS data files embed their JSON (default: literal)",
+    )
     return parser.parse_args()
 
 
@@ -137,12 +600,56 @@ def main() -> int:
     logger.info("BUILDING DATA FILES")
     logger.info("=" * 60)
 
-    success = build_prescriptions(PRESCRIPTION_ENTRY)
+    prescriptions = build_prescriptions(PRESCRIPTION_ENTRY, args.data_format)
+    success = prescriptions is not None
+
+    if not build_location_index(LOCATION_INDEX_PATH, FSA_CENTROIDS_PATH):
+        success = False
+    # location-data.js tells the client whether there is an index to fetch
+    location_index_url = (
+        LOCATION_INDEX_PATH.relative_to(PROJECT_ROOT).as_posix()
+        if FSA_CENTROIDS_PATH.exists() and LOCATION_INDEX_PATH.exists() else None
+    )
 
     for entry in JSON_ENTRIES:
-        if not build_json_file(entry):
+        extra = {"index_url": location_index_url} if entry is LOCATION_ENTRY else None
+        if not build_json_file(entry, args.data_format, extra):
             success = False
 
+    if prescriptions is not None:
+        if not build_fuzzy_index(FUZZY_INDEX_PATH, prescriptions):
+            success = False
+        # Before the SQLite export and snapshot, which keep the DINs
+        if not build_dpd_crossref(DPD_DIR, DPD_REPORT_PATH, prescriptions):
+            success = False
+
+    if not build_billing_views(BILLING_VIEWS_PATH):
+        success = False
+
+    if not build_search_index(SEARCH_INDEX_PATH):
+        success = False
+
+    if not build_calendar(CALENDAR_PATH, date.today().year):
+        success = False
+
+    if args.sqlite is not None and prescriptions is not None:
+        if not build_sqlite(args.sqlite, prescriptions):
+            success = False
+
+    if not args.no_snapshot and prescriptions is not None:
+        if not build_snapshot(SNAPSHOT_STORE_PATH, prescriptions):
+            success = False
+
+    # The manifest hashes every asset written above, and compression
+    # covers the manifest and sw.js, so these two steps run last.
+    logger.info("Building service worker precache...")
+    if not precache.write_precache(PROJECT_ROOT):
+        success = False
+
+    logger.info("Compressing assets...")
+    if not compress.write_compressed(PROJECT_ROOT):
+        success = False
+
     logger.info("=" * 60)
     if success:
         logger.info("BUILD COMPLETE - all data files generated")
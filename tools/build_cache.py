@@ -0,0 +1,166 @@
+"""
+Shared, directory-backed artifact cache for the converters.
+
+convert_excel, convert_billing and convert_diagnostic store their
+serialized output under a key derived from:
+  - the bytes of every input file (the workbook),
+  - the bytes of the converter source files,
+  - the option set (CLI options, library versions, output file name).
+Identical inputs therefore convert once per cache directory, and a hit
+returns the exact bytes a fresh conversion would write.
+
+The directory defaults to data/.cache/build; point EMHUB_BUILD_CACHE_DIR
+at a shared mount to share conversions between laptops and CI runners.
+Writes are atomic renames, so concurrent builds can share a directory.
+When the directory grows past EMHUB_BUILD_CACHE_MAX_MB (default 256),
+the least recently used artifacts are evicted (reads refresh an entry's
+mtime).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+KEY_VERSION = 1
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "data" / ".cache" / "build"
+DEFAULT_MAX_MB = 256
+
+CACHE_DIR_ENV = "EMHUB_BUILD_CACHE_DIR"
+MAX_MB_ENV = "EMHUB_BUILD_CACHE_MAX_MB"
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+
+def _file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class BuildCache:
+    """Content-addressed artifact store in one directory, LRU-bounded."""
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def key(
+        self,
+        namespace: str,
+        inputs: list[Path],
+        sources: list[Path],
+        options: dict[str, Any] | None = None,
+    ) -> str:
+        """Return the artifact key for a conversion.
+
+        Raises OSError if an input or source file cannot be read.
+        """
+        manifest = {
+            "version": KEY_VERSION,
+            "namespace": namespace,
+            "inputs": [_file_digest(p) for p in inputs],
+            "sources": [_file_digest(p) for p in sources],
+            "options": options or {},
+        }
+        text = json.dumps(manifest, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """Artifacts are sharded by the first two hex digits of their key."""
+        return self.directory / key[:2] / key
+
+    def get(self, key: str) -> bytes | None:
+        """Return the artifact for key, or None on a miss."""
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            os.utime(path)  # mark as recently used for eviction
+        except OSError:
+            pass
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store an artifact (best effort) and evict down to the size bound."""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=path.parent, prefix=".tmp-", delete=False) as f:
+                f.write(data)
+            # mkstemp creates 0600 files; the directory may be shared.
+            os.chmod(f.name, 0o644)
+            Path(f.name).replace(path)
+        except OSError as e:
+            logger.warning("Could not write build cache entry %s: %s", key[:12], e)
+            return
+        self.evict()
+
+    def entries(self) -> list[tuple[float, int, Path]]:
+        """Return (mtime, size, path) for every stored artifact."""
+        found = []
+        if not self.directory.is_dir():
+            return found
+        for shard in self.directory.iterdir():
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard):
+                if entry.is_file() and not entry.name.startswith(".tmp-"):
+                    stat = entry.stat()
+                    found.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+        return found
+
+    def evict(self) -> int:
+        """Delete least recently used artifacts until under max_bytes.
+
+        Returns the number of artifacts removed.
+        """
+        entries = sorted(self.entries(), key=lambda e: e[0])
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass  # evicted concurrently
+            total -= size
+            removed += 1
+        if removed:
+            logger.debug("Build cache evicted %d artifacts", removed)
+        return removed
+
+
+def open_cache(directory: Path | None = None, max_mb: float | None = None) -> BuildCache:
+    """Return the build cache, honouring EMHUB_BUILD_CACHE_DIR/_MAX_MB."""
+    if directory is None:
+        env_dir = os.environ.get(CACHE_DIR_ENV)
+        directory = Path(env_dir).expanduser() if env_dir else DEFAULT_CACHE_DIR
+    if max_mb is None:
+        try:
+            max_mb = float(os.environ.get(MAX_MB_ENV, DEFAULT_MAX_MB))
+        except ValueError:
+            logger.warning("Invalid %s - using %d", MAX_MB_ENV, DEFAULT_MAX_MB)
+            max_mb = DEFAULT_MAX_MB
+    return BuildCache(directory, int(max_mb * 1024 * 1024))
@@ -0,0 +1,162 @@
+"""
+Change-impact reports between two conversions of the same data.
+
+Each converter compares the records it just produced with the output it
+replaces and writes <output>.changes.json next to it:
+
+- summary counts and lists of added and removed keys
+- modified records with old/new values for every changed field
+- fee_changes (when the converter names a fee field)
+- index: key -> SHA-256 of the record's canonical JSON
+
+Records are matched by a stable key built from key fields (repeats are
+numbered " #2", " #3", ... in source order), hashed once, and only
+mismatched ones are diffed. Used by tools/prescription_converter.py,
+tools/build.py and data/billing/xlsx_to_json.py; like json_codec it
+needs nothing outside the standard library, so the standalone billing
+converter can import it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import tempfile
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import json_codec
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+# Reports are written next to the output, e.g. Prescriptions.changes.json.
+REPORT_SUFFIX: str = ".changes.json"
+
+
+# ---------------------------------------------------------------------------
+# Keys & Hashes
+# ---------------------------------------------------------------------------
+
+
+def canonical_json(record: Any) -> str:
+    """Serialize a record deterministically (sorted keys, no whitespace)."""
+    return json_codec.dumps(record, compact=True, ensure_ascii=False, sort_keys=True)
+
+
+def record_hash(record: Any) -> str:
+    """Return the SHA-256 hex digest of a record's canonical JSON."""
+    return hashlib.sha256(canonical_json(record).encode("utf-8")).hexdigest()
+
+
+def keyed_records(
+    records: list[dict[str, Any]], key_fields: tuple[str, ...],
+) -> dict[str, dict[str, Any]]:
+    """Map each record's stable key to the record, in source order.
+
+    The key joins key_fields with " / "; repeats get " #n" suffixes.
+    """
+    seen: Counter[str] = Counter()
+    keyed: dict[str, dict[str, Any]] = {}
+    for record in records:
+        key = " / ".join(str(record.get(f) or "") for f in key_fields)
+        seen[key] += 1
+        keyed[key if seen[key] == 1 else f"{key} #{seen[key]}"] = record
+    return keyed
+
+
+# ---------------------------------------------------------------------------
+# Reports
+# ---------------------------------------------------------------------------
+
+
+def build_report(
+    old_records: list[dict[str, Any]] | None,
+    new_records: list[dict[str, Any]],
+    key_fields: tuple[str, ...],
+    fee_field: str | None = None,
+) -> dict[str, Any]:
+    """Compare two conversions record by record.
+
+    Records are matched by stable key and compared by hash, so only
+    modified records are diffed field by field. old_records is None when
+    there is no previous output. When fee_field is given, modified records
+    whose fee changed are also listed under "fee_changes". "index" maps
+    every current key to its record hash for incremental consumers.
+    """
+    old = keyed_records(old_records or [], key_fields)
+    new = keyed_records(new_records, key_fields)
+    old_hashes = {key: record_hash(r) for key, r in old.items()}
+    new_hashes = {key: record_hash(r) for key, r in new.items()}
+
+    modified: list[dict[str, Any]] = []
+    fee_changes: list[dict[str, Any]] = []
+    for key, digest in new_hashes.items():
+        if key not in old_hashes or old_hashes[key] == digest:
+            continue
+        before, after = old[key], new[key]
+        fields = {
+            f: {"old": before.get(f), "new": after.get(f)}
+            for f in sorted(before.keys() | after.keys())
+            if before.get(f) != after.get(f)
+        }
+        modified.append({"key": key, "fields": fields})
+        if fee_field is not None and fee_field in fields:
+            fee_changes.append({"key": key, **fields[fee_field]})
+
+    added = [key for key in new_hashes if key not in old_hashes]
+    removed = [key for key in old_hashes if key not in new_hashes]
+    report: dict[str, Any] = {
+        "previous_count": None if old_records is None else len(old_records),
+        "count": len(new_records),
+        "summary": {
+            "added": len(added),
+            "removed": len(removed),
+            "modified": len(modified),
+            "unchanged": len(new_hashes) - len(added) - len(modified),
+        },
+        "added": added,
+        "removed": removed,
+        "modified": modified,
+    }
+    if fee_field is not None:
+        report["fee_changes"] = fee_changes
+    report["index"] = new_hashes
+    return report
+
+
+def report_path(output_path: Path) -> Path:
+    """Return the change report path for an output file."""
+    return output_path.with_name(output_path.stem + REPORT_SUFFIX)
+
+
+def write_report(path: Path, report: dict[str, Any]) -> bool:
+    """Write a change report as JSON (atomically) and log its summary.
+
+    Returns True on success, False on failure.
+    """
+    tmp_path: Path | None = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, suffix=".json", delete=False,
+        ) as f:
+            tmp_path = Path(f.name)
+            f.write(json_codec.dumps(report, ensure_ascii=False))
+        tmp_path.replace(path)
+    except OSError as e:
+        logger.error("Error writing change report: %s", e)
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        return False
+    summary = report["summary"]
+    logger.info(
+        "Changes: %d added, %d removed, %d modified -> %s",
+        summary["added"], summary["removed"], summary["modified"], path.name,
+    )
+    for change in report.get("fee_changes", []):
+        logger.info("  fee changed: %s %s -> %s", change["key"], change["old"], change["new"])
+    return True
@@ -0,0 +1,162 @@
+#!/opt/homebrew/bin/python3
+"""
+Compare JS data-file encodings by size and parse time.
+
+Renders each data file in every format supported by build.render_js_data
+and reports the raw, gzip and (if the brotli module is installed) brotli
+sizes, plus the median time Node takes to evaluate the file. Parse timing
+is skipped when node is not on PATH.
+
+Usage:
+    python compare_data_formats.py
+    python compare_data_formats.py --runs 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import logging
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import build
+import prescription_converter as converter
+
+try:
+    import brotli
+except ImportError:  # optional: only adds a column to the report
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Parse Timing
+# ---------------------------------------------------------------------------
+
+# Evaluates each file in a fresh context `runs` times and prints the
+# median wall time in milliseconds for each, as a JSON object.
+_NODE_TIMER = """\
+const fs = require("fs");
+const vm = require("vm");
+const [runs, ...files] = process.argv.slice(1); // node -e: no script path
+const result = {};
+for (const file of files) {
+  const script = new vm.Script(fs.readFileSync(file, "utf8"));
+  const times = [];
+  for (let i = 0; i < Number(runs); i++) {
+    const context = vm.createContext({ atob });
+    const start = process.hrtime.bigint();
+    script.runInContext(context);
+    times.push(Number(process.hrtime.bigint() - start) / 1e6);
+  }
+  times.sort((a, b) => a - b);
+  result[file] = times[Math.floor(times.length / 2)];
+}
+console.log(JSON.stringify(result));
+"""
+
+
+def time_parse(paths: list[Path], runs: int) -> dict[str, float] | None:
+    """Return the median evaluation time (ms) per file, or None without node."""
+    node = shutil.which("node")
+    if node is None:
+        logger.warning("node not found - skipping parse timing")
+        return None
+    proc = subprocess.run(
+        [node, "-e", _NODE_TIMER, str(runs), *map(str, paths)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(proc.stdout)
+
+
+# ---------------------------------------------------------------------------
+# Report
+# ---------------------------------------------------------------------------
+
+
+def collect_datasets() -> dict[str, Any] | None:
+    """Load each dataset the build writes as a JS variable."""
+    data = converter.convert_excel(build.PRESCRIPTION_ENTRY.source)
+    if data is None:
+        return None
+    catalog, _ = build.split_prescriptions(data)
+    datasets: dict[str, Any] = {
+        # Monolithic file as shipped before the catalog/chunk split.
+        "PRESCRIPTION_DATA": data,
+        build.PRESCRIPTION_ENTRY.var_name: catalog,
+    }
+    for entry in build.JSON_ENTRIES:
+        datasets[entry.var_name] = build._load_json(entry.source)
+    return datasets
+
+
+def compare(datasets: dict[str, Any], runs: int) -> list[dict[str, Any]]:
+    """Render every dataset in every format and measure it."""
+    rows: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for var_name, data in datasets.items():
+            for data_format in build.DATA_FORMATS:
+                content = build.render_js_data(var_name, data, data_format).encode("utf-8")
+                path = Path(tmp) / f"{var_name}.{data_format}.js"
+                path.write_bytes(content)
+                rows.append({
+                    "name": var_name, "format": data_format, "path": path,
+                    "raw": len(content),
+                    "gzip": len(gzip.compress(content, compresslevel=9)),
+                    "brotli": len(brotli.compress(content, quality=11)) if brotli else None,
+                })
+        times = time_parse([r["path"] for r in rows], runs)
+    for row in rows:
+        row["parse_ms"] = times[str(row["path"])] if times else None
+    return rows
+
+
+def format_report(rows: list[dict[str, Any]]) -> str:
+    """Format the measurements as a fixed-width table."""
+    def cell(value: Any) -> str:
+        if value is None:
+            return "-"
+        return f"{value:.3f}" if isinstance(value, float) else str(value)
+
+    header = ("data", "format", "raw", "gzip", "brotli", "parse ms")
+    lines = [header] + [
+        (r["name"], r["format"], cell(r["raw"]), cell(r["gzip"]),
+         cell(r["brotli"]), cell(r["parse_ms"]))
+        for r in rows
+    ]
+    widths = [max(len(line[i]) for line in lines) for i in range(len(header))]
+    return "\n".join(
+        "  ".join(col.ljust(w) if i < 2 else col.rjust(w)
+                  for i, (col, w) in enumerate(zip(line, widths)))
+        for line in lines
+    )
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main() -> int:
+    """Print the comparison table. Returns 0 on success, 1 on failure."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=25,
+                        help="Evaluations per file for parse timing (default: 25)")
+    args = parser.parse_args()
+    converter.setup_logging(verbose=False)
+
+    datasets = collect_datasets()
+    if datasets is None:
+        return 1
+    print(format_report(compare(datasets, args.runs)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
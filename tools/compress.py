@@ -0,0 +1,140 @@
+"""
+Pre-compressed asset generation.
+
+Writes a .gz sibling (and a .br sibling when the optional brotli module
+is installed) next to every asset the app serves, at maximum compression.
+serve.py sends these to clients that accept the encoding; static hosts
+that support pre-compressed files (nginx gzip_static/brotli_static,
+Caddy precompressed) can use them as-is.
+
+Run as part of build.py, after the precache step so sw.js and the
+precache manifest are compressed too.
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+from collections.abc import Callable
+from pathlib import Path
+
+import precache
+import prescription_converter as converter
+
+try:
+    import brotli
+except ImportError:  # optional: gzip siblings are still written
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+# Files generated into the project root by the precache step.
+_GENERATED_FILES: tuple[str, ...] = (
+    precache.MANIFEST_FILENAME,
+    precache.SERVICE_WORKER_FILENAME,
+)
+
+# Below this size the encoding overhead outweighs any saving.
+MIN_SIZE = 512
+
+
+def _gzip(content: bytes) -> bytes:
+    # mtime=0 keeps the output byte-identical across builds.
+    return gzip.compress(content, compresslevel=9, mtime=0)
+
+
+def _brotli(content: bytes) -> bytes:
+    return brotli.compress(content, quality=11)
+
+
+# (extension, compressor) pairs available in this environment.
+ENCODINGS: tuple[tuple[str, Callable[[bytes], bytes]], ...] = (
+    ((".gz", _gzip),) + (((".br", _brotli),) if brotli is not None else ())
+)
+_ALL_EXTENSIONS: tuple[str, ...] = (".gz", ".br")
+
+
+# ---------------------------------------------------------------------------
+# Compression
+# ---------------------------------------------------------------------------
+
+
+def collect_compressible(root: Path) -> list[Path]:
+    """Return every served asset under root that is worth compressing."""
+    assets = precache.collect_assets(root)
+    assets += [root / name for name in _GENERATED_FILES if (root / name).is_file()]
+    return [p for p in assets if p.stat().st_size >= MIN_SIZE]
+
+
+def compress_file(path: Path) -> dict[str, int]:
+    """Write compressed siblings of path, returning {extension: size}.
+
+    A sibling is only kept when it is smaller than the original; otherwise
+    any existing sibling with that extension is removed.
+    """
+    content = path.read_bytes()
+    written: dict[str, int] = {}
+    for ext, compressor in ENCODINGS:
+        sibling = path.with_name(path.name + ext)
+        compressed = compressor(content)
+        if len(compressed) < len(content):
+            if not sibling.is_file() or sibling.read_bytes() != compressed:
+                converter.write_file_atomically(sibling, compressed, suffix=ext)
+            elif sibling.stat().st_mtime_ns < path.stat().st_mtime_ns:
+                sibling.touch()  # serve.py ignores siblings older than their source
+            written[ext] = len(compressed)
+        elif sibling.exists():
+            sibling.unlink()
+    return written
+
+
+def remove_stale_siblings(root: Path, keep: set[Path]) -> int:
+    """Delete compressed siblings that this build did not refresh.
+
+    That covers siblings of removed or too-small assets, and .br files
+    when brotli is not installed (they would otherwise go out of date).
+    """
+    active = {ext for ext, _ in ENCODINGS}
+    removed = 0
+    patterns = precache.PRECACHE_PATTERNS + _GENERATED_FILES
+    for pattern in patterns:
+        for ext in _ALL_EXTENSIONS:
+            for sibling in root.glob(pattern + ext):
+                if ext not in active or sibling.with_suffix("") not in keep:
+                    logger.debug("  Removing stale %s", sibling)
+                    sibling.unlink()
+                    removed += 1
+    return removed
+
+
+def write_compressed(root: Path) -> bool:
+    """Write .gz/.br siblings for all served assets under root.
+
+    Returns True on success, False on failure.
+    """
+    if brotli is None:
+        logger.info("  brotli module not installed - writing gzip only")
+    try:
+        assets = collect_compressible(root)
+        raw_total = 0
+        totals = {ext: 0 for ext, _ in ENCODINGS}
+        for path in assets:
+            raw_total += path.stat().st_size
+            for ext, size in compress_file(path).items():
+                totals[ext] += size
+        removed = remove_stale_siblings(root, set(assets))
+    except Exception as e:
+        logger.error("  Error writing compressed assets: %s", e)
+        return False
+
+    summary = ", ".join(f"{ext} {size} bytes" for ext, size in totals.items())
+    logger.info(
+        "  Compressed %d assets (%d bytes raw; %s)%s",
+        len(assets), raw_total, summary,
+        f", removed {removed} stale" if removed else "",
+    )
+    return True
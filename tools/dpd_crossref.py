@@ -0,0 +1,423 @@
+"""
+Offline cross-reference of the formulary against Health Canada's Drug
+Product Database (DPD).
+
+process_row trusts the Med, Alias and Form text as typed. This build step
+checks it against a local DPD extract and attaches DINs to the records.
+
+No extract ships with the repo. Download the DPD "allfiles" extract (plus
+the inactive "allfiles_ia" one to flag discontinued products) and unzip
+it into data/dpd/: drug.txt, ingred.txt, form.txt and status.txt. The
+_ia (inactive), _dr (dormant) and _ap (approved) variants of each file
+are read too when present. The step is skipped with a warning when the
+directory is absent.
+
+load_dpd() streams the files once into hashed indexes on normalized names:
+  - ingredient key: the product's sorted base ingredients
+    ("amoxicillin + clavulanic acid") -> products
+  - brand prefix: every leading run of words of a brand name
+    ("advil", "advil liqui gels") -> products
+cross_reference() then resolves each distinct med name and brand with a
+few dict lookups, so a build costs O(DPD rows + formulary rows) and can
+run every time instead of as a manual audit.
+
+Each checked record gets "dins": the DINs of marketed products with its
+ingredients (or, when the name does not resolve, its brands) in its
+dosage form. The report lists meds and brands with no DPD product, meds
+whose products are all discontinued, brands whose products have other
+ingredients, and meds with no product in their form. Names the DPD
+spells differently can be mapped in _NAME_EQUIVALENTS.
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import logging
+import re
+import unicodedata
+from collections import defaultdict
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import json_codec
+import prescription_converter as converter
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+# Extract file variants: active, inactive, dormant, approved-not-marketed.
+DPD_FILE_SUFFIXES: tuple[str, ...] = ("", "_ia", "_dr", "_ap")
+
+# Column positions in the headerless DPD extract files.
+_DRUG_CODE = 0
+_DRUG_CLASS, _DRUG_DIN, _DRUG_BRAND = 2, 3, 4
+_INGREDIENT_NAME = 2
+_FORM_NAME = 2
+_STATUS_CURRENT, _STATUS_NAME = 1, 2
+
+MARKETED_STATUS = "MARKETED"
+
+# Records that name supplies, devices or referrals rather than drugs.
+SKIPPED_SPECIALTIES: frozenset[str] = frozenset({"Non-Med"})
+SKIPPED_FORMS: frozenset[str] = frozenset({"device"})
+
+# Formulary spellings -> DPD base ingredient names (" + " separates
+# ingredients). Extend when the report flags a false miss.
+_NAME_EQUIVALENTS: dict[str, str] = {
+    "amox clav": "amoxicillin + clavulanic acid",
+    "asa": "acetylsalicylic acid",
+    "clavulanate": "clavulanic acid",
+    "peg 3350": "polyethylene glycol 3350",
+    "smx": "sulfamethoxazole",
+    "tmp": "trimethoprim",
+    "tylenol": "acetaminophen",
+}
+
+# Words in a med name that describe the product, not an ingredient.
+_PRODUCT_WORDS: frozenset[str] = frozenset({
+    "auto", "cr", "cream", "drops", "ds", "enema", "er", "gel", "gum",
+    "injector", "lotion", "ointment", "ophthalmic", "otic", "patch",
+    "solution", "spray", "ss", "suspension", "vaginal", "viscous", "xr",
+})
+
+# Hydration states dropped from DPD salt names.
+_HYDRATE_WORDS: frozenset[str] = frozenset({
+    "anhydrous", "dihydrate", "hemihydrate", "hydrate", "monohydrate",
+    "sesquihydrate", "trihydrate",
+})
+
+# Converter form -> words of matching DPD pharmaceutical forms.
+_FORM_WORDS: dict[str, frozenset[str]] = {
+    "tab": frozenset({"tablet"}),
+    "ER tab": frozenset({"tablet"}),
+    "capsule": frozenset({"capsule"}),
+    "suspension": frozenset({"suspension"}),
+    "syrup": frozenset({"syrup", "liquid", "solution"}),
+    "solution": frozenset({"solution", "liquid"}),
+    "drops": frozenset({"drops", "solution", "suspension"}),
+    "cream": frozenset({"cream"}),
+    "ointment": frozenset({"ointment"}),
+    "gel": frozenset({"gel"}),
+    "lotion": frozenset({"lotion"}),
+    "MDI": frozenset({"aerosol", "metered"}),
+    "spray": frozenset({"spray", "aerosol"}),
+    "powder": frozenset({"powder"}),
+    "suppository": frozenset({"suppository"}),
+    "patch": frozenset({"patch"}),
+    "enema": frozenset({"enema"}),
+    "injection": frozenset({"solution", "injection", "kit"}),
+    "gum": frozenset({"gum"}),
+}
+
+# Most ingredient keys a med name may expand to (each ambiguous component
+# multiplies them).
+_MAX_KEYS = 16
+
+_PAREN_RE = re.compile(r"\([^)]*\)")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_COMPONENT_SPLIT_RE = re.compile(r"\s*(?:\+|/|\bwith\b)\s*")
+_NUMBERED_RE = re.compile(r"\bno\.?\s*\d+\b")
+
+
+class DpdIndex(NamedTuple):
+    """Hashed lookups over one DPD extract."""
+
+    products: dict[str, dict[str, Any]]         # drug code -> product
+    by_ingredients: dict[str, list[str]]        # ingredient key -> drug codes
+    by_brand: dict[str, list[str]]              # brand prefix -> drug codes
+    ingredient_names: dict[str, frozenset[str]]  # name, salt or first word -> bases
+
+
+# ---------------------------------------------------------------------------
+# Normalization
+# ---------------------------------------------------------------------------
+
+
+def normalize(text: str) -> str:
+    """Lowercase, strip accents and reduce punctuation to single spaces."""
+    text = unicodedata.normalize("NFKD", text or "").encode("ascii", "ignore").decode()
+    return _NON_ALNUM_RE.sub(" ", text.lower()).strip()
+
+
+def _without(text: str, words: frozenset[str]) -> str:
+    return " ".join(w for w in text.split() if w not in words)
+
+
+def split_ingredient(name: str) -> tuple[str, str]:
+    """Split a DPD ingredient into (base, salt), e.g.
+
+    "AMLODIPINE (AMLODIPINE BESYLATE)" -> ("amlodipine", "amlodipine besylate").
+    Salt is "" when the name has no parenthesized form.
+    """
+    base, _, rest = name.partition("(")
+    return (
+        _without(normalize(base), _HYDRATE_WORDS),
+        _without(normalize(rest), _HYDRATE_WORDS),
+    )
+
+
+def ingredient_key(bases: set[str] | frozenset[str]) -> str:
+    """Join base ingredient names into an order-independent key."""
+    return " + ".join(sorted(bases))
+
+
+def med_components(name: str) -> list[str]:
+    """Split a formulary med name into normalized ingredient names.
+
+    Strengths in parentheses, product words ("cream", "XR") and brand
+    numbering ("No. 3") are dropped; _NAME_EQUIVALENTS is applied.
+    """
+    text = _NUMBERED_RE.sub(" ", _PAREN_RE.sub(" ", name.lower()))
+    components = []
+    for part in _COMPONENT_SPLIT_RE.split(text):
+        part = _without(normalize(part), _PRODUCT_WORDS)
+        if part:
+            components.extend(_NAME_EQUIVALENTS.get(part, part).split(" + "))
+    return components
+
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+
+def _read_rows(dpd_dir: Path, table: str) -> Iterator[list[str]]:
+    """Yield rows of every variant of a DPD table that exists in dpd_dir."""
+    for suffix in DPD_FILE_SUFFIXES:
+        path = dpd_dir / f"{table}{suffix}.txt"
+        if not path.exists():
+            continue
+        # English columns are ASCII; the French ones may be Latin-1.
+        with open(path, newline="", encoding="utf-8", errors="replace") as f:
+            yield from csv.reader(f)
+
+
+def load_dpd(dpd_dir: Path) -> DpdIndex:
+    """Stream a DPD extract directory into a DpdIndex (human products only).
+
+    Raises FileNotFoundError if drug.txt is missing.
+    """
+    if not (dpd_dir / "drug.txt").exists():
+        raise FileNotFoundError(f"{dpd_dir / 'drug.txt'} not found")
+
+    products: dict[str, dict[str, Any]] = {}
+    for row in _read_rows(dpd_dir, "drug"):
+        if len(row) > _DRUG_BRAND and row[_DRUG_CLASS].strip().lower() == "human":
+            products[row[_DRUG_CODE]] = {
+                "din": row[_DRUG_DIN].strip(), "brand": row[_DRUG_BRAND].strip(),
+                "status": "", "forms": set(), "ingredients": set(),
+            }
+
+    salts: dict[str, set[str]] = defaultdict(set)
+    for row in _read_rows(dpd_dir, "ingred"):
+        product = products.get(row[_DRUG_CODE]) if len(row) > _INGREDIENT_NAME else None
+        if product is not None:
+            base, salt = split_ingredient(row[_INGREDIENT_NAME])
+            product["ingredients"].add(base)
+            if salt and salt != base:
+                salts[salt].add(base)
+
+    for row in _read_rows(dpd_dir, "form"):
+        product = products.get(row[_DRUG_CODE]) if len(row) > _FORM_NAME else None
+        if product is not None:
+            product["forms"].update(normalize(row[_FORM_NAME]).split())
+
+    for row in _read_rows(dpd_dir, "status"):
+        product = products.get(row[_DRUG_CODE]) if len(row) > _STATUS_NAME else None
+        if product is not None and row[_STATUS_CURRENT].strip().upper() == "Y":
+            product["status"] = row[_STATUS_NAME].strip().upper()
+
+    by_ingredients: dict[str, list[str]] = defaultdict(list)
+    by_brand: dict[str, list[str]] = defaultdict(list)
+    names: dict[str, set[str]] = defaultdict(set)
+    for code, product in products.items():
+        if product["ingredients"]:
+            by_ingredients[ingredient_key(product["ingredients"])].append(code)
+        words = normalize(product["brand"]).split()
+        for n in range(1, len(words) + 1):
+            by_brand[" ".join(words[:n])].append(code)
+        for base in product["ingredients"]:
+            names[base].add(base)
+            if " " in base:
+                names[base.split()[0]].add(base)
+
+    # An exact base name wins over a salt form or a first-word match.
+    for salt, bases in salts.items():
+        if salt not in names or salt not in names[salt]:
+            names[salt].update(bases)
+
+    return DpdIndex(
+        products=products,
+        by_ingredients=dict(by_ingredients),
+        by_brand=dict(by_brand),
+        ingredient_names={
+            name: frozenset({name}) if name in bases else frozenset(bases)
+            for name, bases in names.items()
+        },
+    )
+
+
+# ---------------------------------------------------------------------------
+# Matching
+# ---------------------------------------------------------------------------
+
+
+def match_name(index: DpdIndex, name: str) -> set[str] | None:
+    """Return drug codes whose ingredients match a med name.
+
+    Returns None when some component of the name is not a DPD ingredient.
+    """
+    choices = []
+    for component in med_components(name):
+        bases = index.ingredient_names.get(component)
+        if not bases:
+            return None
+        choices.append(sorted(bases))
+    if not choices:
+        return None
+    codes: set[str] = set()
+    for combination in itertools.islice(itertools.product(*choices), _MAX_KEYS):
+        codes.update(index.by_ingredients.get(ingredient_key(set(combination)), ()))
+    return codes
+
+
+def match_brand(index: DpdIndex, brand: str) -> set[str]:
+    """Return drug codes whose brand name starts with brand's words."""
+    return set(index.by_brand.get(normalize(brand), ()))
+
+
+def in_form(product: dict[str, Any], form: str) -> bool:
+    """True if the product's dosage form matches a converter form (or the
+    form is blank or unmapped)."""
+    words = _FORM_WORDS.get(form)
+    return words is None or not words.isdisjoint(product["forms"])
+
+
+def cross_reference(
+    index: DpdIndex, meds: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Attach "dins" to each checked med in place and return the report.
+
+    Each distinct (med, form) and (brand, med) pair is resolved once.
+    """
+    report: dict[str, Any] = {
+        "source": {
+            "products": len(index.products),
+            "marketed": sum(p["status"] == MARKETED_STATUS for p in index.products.values()),
+        },
+        "unmatched_meds": [], "unmatched_brands": [], "brand_mismatches": [],
+        "discontinued": [], "form_mismatches": [],
+    }
+    resolved: dict[tuple[str, str, tuple[str, ...]], list[str]] = {}
+    checked_brands: set[tuple[str, str]] = set()
+    checked = 0
+
+    for med in meds:
+        if med["specialty"] in SKIPPED_SPECIALTIES or med.get("form") in SKIPPED_FORMS:
+            continue
+        checked += 1
+        name, form, brands = med["med"], med.get("form") or "", tuple(med.get("brands") or ())
+        cache_key = (name, form, brands)
+        if cache_key not in resolved:
+            resolved[cache_key] = _resolve(index, name, form, brands, checked_brands, report)
+        med["dins"] = list(resolved[cache_key])
+
+    report["source"]["checked_meds"] = checked
+    return report
+
+
+def _resolve(
+    index: DpdIndex, name: str, form: str, brands: tuple[str, ...],
+    checked_brands: set[tuple[str, str]], report: dict[str, Any],
+) -> list[str]:
+    """Match one med name/form/brands combination and record any problems."""
+    name_codes = match_name(index, name)
+    brand_codes: set[str] = set()
+    for brand in brands:
+        codes = match_brand(index, brand)
+        brand_codes |= codes
+        if (brand, name) in checked_brands:
+            continue
+        checked_brands.add((brand, name))
+        if not codes:
+            report["unmatched_brands"].append({"brand": brand, "med": name})
+        elif name_codes and codes.isdisjoint(name_codes):
+            report["brand_mismatches"].append({
+                "brand": brand, "med": name,
+                "dpd_ingredients": sorted({
+                    ingredient_key(index.products[c]["ingredients"]) for c in codes
+                }),
+            })
+
+    candidates = name_codes or brand_codes
+    if not candidates:
+        report["unmatched_meds"].append({"med": name, "form": form})
+        return []
+
+    marketed = [index.products[c] for c in candidates
+                if index.products[c]["status"] == MARKETED_STATUS]
+    if not marketed:
+        report["discontinued"].append({
+            "med": name, "form": form,
+            "statuses": sorted({index.products[c]["status"] or "UNKNOWN" for c in candidates}),
+        })
+        return []
+
+    dins = sorted({p["din"] for p in marketed if in_form(p, form)})
+    if not dins:
+        report["form_mismatches"].append({
+            "med": name, "form": form,
+            "dpd_forms": sorted({w for p in marketed for w in p["forms"]}),
+        })
+    return dins
+
+
+# ---------------------------------------------------------------------------
+# Build Step
+# ---------------------------------------------------------------------------
+
+
+def write_crossref(
+    dpd_dir: Path, meds: list[dict[str, Any]], report_path: Path,
+) -> bool:
+    """Cross-reference meds against the DPD extract and write the report.
+
+    Attaches "dins" to meds in place. A missing extract is not an error:
+    the step is skipped with a warning. Returns True on success or skip,
+    False on failure.
+    """
+    if not dpd_dir.is_dir():
+        logger.warning(
+            "  %s not found - skipping DPD cross-reference (see tools/dpd_crossref.py)",
+            dpd_dir.name,
+        )
+        return True
+
+    try:
+        index = load_dpd(dpd_dir)
+        report = cross_reference(index, meds)
+        content = json_codec.dumps(report, ensure_ascii=False) + "\n"
+        converter.write_file_atomically(report_path, content, suffix=".json")
+    except Exception as e:
+        logger.error("  Error cross-referencing DPD extract %s: %s", dpd_dir, e)
+        return False
+
+    for entry in report["unmatched_meds"]:
+        logger.warning("  No DPD product for %s (%s)", entry["med"], entry["form"] or "no form")
+    for entry in report["discontinued"]:
+        logger.warning("  All DPD products discontinued for %s: %s",
+                       entry["med"], ", ".join(entry["statuses"]))
+    logger.info(
+        "  DPD: %d products; %d meds checked, %d unmatched, %d discontinued, "
+        "%d form mismatches, %d unmatched brands, %d brand mismatches (%s)",
+        len(index.products), report["source"]["checked_meds"],
+        len(report["unmatched_meds"]), len(report["discontinued"]),
+        len(report["form_mismatches"]), len(report["unmatched_brands"]),
+        len(report["brand_mismatches"]), report_path,
+    )
+    return True
@@ -0,0 +1,203 @@
+"""
+Typo-tolerant term index for client-side search.
+
+Collects the vocabulary both search engines match words against
+(medication names, brands and indications; billing names and search
+terms; diagnostic subcategories and names) and writes a trigram index
+over it. js/fuzzy-index.js loads the artifact and answers "which known
+words are within N edits of this one?" by counting shared trigrams and
+verifying only the few surviving candidates with Levenshtein distance,
+instead of running an edit-distance DP against every word of every record.
+
+The distance policy mirrors SearchManager.fuzzyMatches: no typo tolerance
+for words under 5 characters, 1 edit for 5-6 characters, 2 for longer.
+
+A trigram index was chosen over a symmetric-delete dictionary because the
+delete variants at distance 2 come to ~77k keys (~1.5 MB of JSON) for this
+vocabulary, against ~3k trigrams (~115 KB) here.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import json_codec
+import prescription_converter as converter
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+INDEX_VERSION = 1
+
+# Shortest word that gets typo tolerance (see SearchManager.fuzzyMatches).
+MIN_TERM_LENGTH = 5
+
+# Words are split on whitespace as the JS engines do, then stripped of
+# surrounding punctuation; only alphabetic words (allowing inner - ' / &)
+# are indexed, since words with digits are doses and strengths.
+_EDGE_PUNCTUATION = "()[]{},.;:!?\"'"
+_TERM_RE = re.compile(r"^[a-z][a-z'&/-]*$")
+
+# Padding matches js/fuzzy-index.js: two leading spaces, one trailing.
+_PAD_START = "  "
+_PAD_END = " "
+
+
+# ---------------------------------------------------------------------------
+# Index Construction
+# ---------------------------------------------------------------------------
+
+
+def trigrams(word: str) -> set[str]:
+    """Return the set of padded trigrams of word."""
+    padded = f"{_PAD_START}{word}{_PAD_END}"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def extract_terms(texts: Iterable[str]) -> set[str]:
+    """Return the indexable lowercase words found in texts."""
+    terms: set[str] = set()
+    for text in texts:
+        for word in (text or "").lower().split():
+            word = word.strip(_EDGE_PUNCTUATION)
+            if len(word) >= MIN_TERM_LENGTH and _TERM_RE.match(word):
+                terms.add(word)
+    return terms
+
+
+def collect_texts(
+    meds: list[dict[str, Any]],
+    billing_codes: list[dict[str, Any]],
+    diagnostic_codes: list[dict[str, Any]],
+) -> list[str]:
+    """Return every field value the search engines match words against."""
+    texts: list[str] = []
+    for med in meds:
+        texts.append(med.get("med", ""))
+        texts.extend(med.get("brands") or [])
+        texts.append(med.get("indication", ""))
+    for entry in billing_codes:
+        texts.append(entry.get("name", ""))
+        texts.extend(entry.get("search_terms") or [])
+    for entry in diagnostic_codes:
+        texts.append(entry.get("subcategory", ""))
+        texts.append(entry.get("name", ""))
+        texts.extend(entry.get("search_terms") or [])
+    return texts
+
+
+def build_index(terms: Iterable[str]) -> dict[str, Any]:
+    """Build the trigram index artifact for a vocabulary.
+
+    Terms are sorted, so term ids (and the output) are deterministic.
+    Posting lists hold ascending term ids.
+    """
+    sorted_terms = sorted(set(terms))
+    postings: dict[str, list[int]] = {}
+    for term_id, term in enumerate(sorted_terms):
+        for gram in sorted(trigrams(term)):
+            postings.setdefault(gram, []).append(term_id)
+    return {
+        "version": INDEX_VERSION,
+        "min_length": MIN_TERM_LENGTH,
+        "terms": sorted_terms,
+        "trigrams": dict(sorted(postings.items())),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Lookup (reference implementation of js/fuzzy-index.js)
+# ---------------------------------------------------------------------------
+
+
+def allowed_distance(word: str) -> int:
+    """Return the edit budget for a query word."""
+    if len(word) < MIN_TERM_LENGTH:
+        return 0
+    return 1 if len(word) <= 6 else 2
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Return the Levenshtein distance between a and b."""
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ca != cb),
+            ))
+        previous = current
+    return previous[-1]
+
+
+def lookup(
+    index: dict[str, Any], word: str, max_distance: int | None = None,
+) -> list[tuple[str, int]]:
+    """Return (term, distance) pairs within the edit budget, closest first.
+
+    A term within distance d shares at least max(|G(word)|, |G(term)|) - 3d
+    padded trigrams with word (each edit touches at most three), so only
+    terms reaching that count are verified.
+    """
+    word = word.lower()
+    budget = allowed_distance(word) if max_distance is None else max_distance
+    if budget <= 0:
+        return []
+
+    grams = trigrams(word)
+    counts: dict[int, int] = {}
+    for gram in grams:
+        for term_id in index["trigrams"].get(gram, ()):
+            counts[term_id] = counts.get(term_id, 0) + 1
+
+    matches: list[tuple[str, int]] = []
+    for term_id, shared in counts.items():
+        term = index["terms"][term_id]
+        if abs(len(term) - len(word)) > budget:
+            continue
+        if shared < max(len(grams), len(trigrams(term))) - 3 * budget:
+            continue
+        distance = levenshtein(word, term)
+        if distance <= budget:
+            matches.append((term, distance))
+    return sorted(matches, key=lambda m: (m[1], m[0]))
+
+
+# ---------------------------------------------------------------------------
+# Build Step
+# ---------------------------------------------------------------------------
+
+
+def write_fuzzy_index(
+    output_path: Path,
+    meds: list[dict[str, Any]],
+    billing_codes: list[dict[str, Any]],
+    diagnostic_codes: list[dict[str, Any]],
+) -> bool:
+    """Build the fuzzy index from all searchable data and write it as JSON.
+
+    Returns True on success, False on failure.
+    """
+    try:
+        terms = extract_terms(collect_texts(meds, billing_codes, diagnostic_codes))
+        index = build_index(terms)
+        content = json_codec.dumps(index, compact=True)
+        converter.write_file_atomically(output_path, content, suffix=".json")
+    except Exception as e:
+        logger.error("  Error writing %s: %s", output_path.name, e)
+        return False
+
+    logger.info(
+        "  Wrote %s (%d terms, %d trigrams, %d bytes)",
+        output_path, len(index["terms"]), len(index["trigrams"]), len(content),
+    )
+    return True
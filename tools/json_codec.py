@@ -0,0 +1,131 @@
+"""
+JSON serialization with an optional fast backend.
+
+dumps() produces exactly the bytes stdlib json.dumps would for the
+converters' data (str keys, str/int/float/bool/None values, lists and
+dicts), using orjson when it is installed and stdlib json otherwise:
+  - pretty (default): indent=2, stdlib's "," / ": " separators
+  - compact=True: no whitespace, for machine-only artifacts
+  - ensure_ascii=True: non-ASCII escaped as \\uXXXX, as stdlib does
+
+orjson differs from stdlib in two places, both handled here:
+  - it never escapes non-ASCII, so escaping is applied afterwards;
+  - it formats floats below 1e-4 or from 1e16 up differently ("1e16" vs
+    "1e+16"), so any output that may contain such a number is re-encoded
+    with stdlib. Values orjson rejects (non-str keys, ints beyond 64 bits,
+    other types) fall back to stdlib the same way.
+Non-finite floats are outside the contract: stdlib writes NaN/Infinity
+(not valid JSON), orjson writes null. The converters never produce them.
+
+Set EMHUB_JSON_BACKEND=stdlib to force the stdlib encoder.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json writes the same bytes, slower
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+BACKEND_ENV = "EMHUB_JSON_BACKEND"
+
+# Number shapes where orjson and repr(float) disagree: orjson writes
+# "1e16"/"1.5e-7" without a sign and 0.00001 in positional notation.
+# Matches inside strings only cost a redundant stdlib encode.
+_FLOAT_MISMATCH_RE = re.compile(rb"\d[eE]|0\.0000")
+
+# stdlib's ensure_ascii escapes everything outside printable ASCII (0x20-0x7e);
+# orjson already escapes the control characters.
+_NON_ASCII_RE = re.compile("[^\x00-\x7e]")
+
+
+# ---------------------------------------------------------------------------
+# Backends
+# ---------------------------------------------------------------------------
+
+
+def available_backends() -> list[str]:
+    """Return the installed backends, fastest first."""
+    return (["orjson"] if orjson is not None else []) + ["stdlib"]
+
+
+def default_backend() -> str:
+    """Return the backend dumps() uses, honouring EMHUB_JSON_BACKEND."""
+    requested = os.environ.get(BACKEND_ENV, "").strip().lower()
+    if requested:
+        if requested in available_backends():
+            return requested
+        logger.warning("%s=%s is not available - using %s",
+                       BACKEND_ENV, requested, available_backends()[0])
+    return available_backends()[0]
+
+
+def _escape_char(match: re.Match[str]) -> str:
+    """Escape one character as stdlib's ensure_ascii does."""
+    code = ord(match.group(0))
+    if code < 0x10000:
+        return f"\\u{code:04x}"
+    code -= 0x10000
+    return f"\\u{0xD800 | (code >> 10):04x}\\u{0xDC00 | (code & 0x3FF):04x}"
+
+
+def _dumps_stdlib(obj: Any, compact: bool, ensure_ascii: bool, sort_keys: bool) -> str:
+    if compact:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=ensure_ascii, sort_keys=sort_keys)
+    return json.dumps(obj, indent=2, ensure_ascii=ensure_ascii, sort_keys=sort_keys)
+
+
+def _dumps_orjson(obj: Any, compact: bool, ensure_ascii: bool, sort_keys: bool) -> str | None:
+    """Encode with orjson, or return None if the result could differ from stdlib."""
+    option = (0 if compact else orjson.OPT_INDENT_2) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+    try:
+        encoded = orjson.dumps(obj, option=option)
+    except TypeError:  # orjson.JSONEncodeError
+        return None
+    if _FLOAT_MISMATCH_RE.search(encoded):
+        return None
+    text = encoded.decode("utf-8")
+    if ensure_ascii and (not text.isascii() or "\x7f" in text):
+        text = _NON_ASCII_RE.sub(_escape_char, text)
+    return text
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def dumps(
+    obj: Any,
+    *,
+    compact: bool = False,
+    ensure_ascii: bool = True,
+    sort_keys: bool = False,
+    backend: str | None = None,
+) -> str:
+    """Serialize obj to a JSON string (no trailing newline).
+
+    Equivalent to json.dumps(obj, indent=2) or, with compact=True,
+    json.dumps(obj, separators=(",", ":")), with the given ensure_ascii
+    and sort_keys, whichever backend is used.
+    """
+    backend = backend or default_backend()
+    if backend == "orjson" and orjson is not None:
+        text = _dumps_orjson(obj, compact, ensure_ascii, sort_keys)
+        if text is not None:
+            return text
+    elif backend not in ("orjson", "stdlib"):
+        raise ValueError(f"Unknown JSON backend: {backend}")
+    return _dumps_stdlib(obj, compact, ensure_ascii, sort_keys)
@@ -0,0 +1,230 @@
+"""
+Offline nearest-hospital index for Locations.json.
+
+Parses the postal code at the end of each location address, joins its
+forward sortation area (FSA, the first three characters) to a centroid
+table, and writes data/location-index.json: a k-d tree over the located
+hospitals plus the centroid of every FSA, so js/location-index.js can
+answer "nearest sites to K1H" in O(log n) without network calls.
+
+No FSA centroid table ships with the repo. Supply one as
+data/fsa_centroids.csv with a header row and columns fsa, latitude,
+longitude (for example derived from the Statistics Canada FSA boundary
+file); the build step is skipped with a warning when it is absent.
+
+Points are stored as unit vectors on the sphere, so the tree's Euclidean
+(chord) distance orders sites exactly like great-circle distance and no
+map projection distorts results across Ontario's latitude range.
+"""
+
+from __future__ import annotations
+
+import csv
+import heapq
+import logging
+import math
+import re
+from pathlib import Path
+from typing import Any
+
+import json_codec
+import prescription_converter as converter
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+INDEX_VERSION = 1
+
+EARTH_RADIUS_KM = 6371.0
+
+# Coordinates are rounded in the artifact; 1e-6 on the unit sphere is ~6 m.
+COORD_PRECISION = 6
+
+_POSTAL_CODE_RE = re.compile(r"\b([A-Z]\d[A-Z])\s?\d[A-Z]\d\s*$", re.IGNORECASE)
+_FSA_RE = re.compile(r"^[A-Z]\d[A-Z]$")
+
+
+# ---------------------------------------------------------------------------
+# Parsing
+# ---------------------------------------------------------------------------
+
+
+def parse_fsa(address: str) -> str | None:
+    """Return the uppercase FSA of the postal code ending address."""
+    match = _POSTAL_CODE_RE.search(address or "")
+    return match.group(1).upper() if match else None
+
+
+def load_centroids(path: Path) -> dict[str, tuple[float, float]]:
+    """Load an fsa,latitude,longitude CSV into {FSA: (lat, lon)}.
+
+    Raises ValueError on rows with a malformed FSA or coordinates.
+    """
+    centroids: dict[str, tuple[float, float]] = {}
+    with open(path, newline="", encoding="utf-8") as f:
+        for line, row in enumerate(csv.DictReader(f), start=2):
+            fsa = (row.get("fsa") or "").strip().upper()
+            if not _FSA_RE.match(fsa):
+                raise ValueError(f"{path.name}:{line}: invalid FSA {fsa!r}")
+            try:
+                lat = float(row["latitude"])
+                lon = float(row["longitude"])
+            except (KeyError, TypeError, ValueError):
+                raise ValueError(f"{path.name}:{line}: invalid coordinates for {fsa}")
+            if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+                raise ValueError(f"{path.name}:{line}: coordinates out of range for {fsa}")
+            centroids[fsa] = (lat, lon)
+    return centroids
+
+
+# ---------------------------------------------------------------------------
+# k-d Tree
+# ---------------------------------------------------------------------------
+
+
+def unit_vector(lat: float, lon: float) -> tuple[float, float, float]:
+    """Return the 3D unit vector for a latitude/longitude in degrees."""
+    phi = math.radians(lat)
+    lam = math.radians(lon)
+    return (
+        round(math.cos(phi) * math.cos(lam), COORD_PRECISION),
+        round(math.cos(phi) * math.sin(lam), COORD_PRECISION),
+        round(math.sin(phi), COORD_PRECISION),
+    )
+
+
+def chord_to_km(chord: float) -> float:
+    """Convert a unit-sphere chord length to great-circle kilometres."""
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, chord / 2))
+
+
+def build_kdtree(points: list[tuple[float, float, float]]) -> list[int]:
+    """Return point indices in implicit k-d tree order.
+
+    The node for a range [lo, hi) sits at mid = (lo + hi) // 2 and splits
+    on axis depth % 3; its subtrees occupy [lo, mid) and [mid + 1, hi).
+    Ties sort by index so the layout is deterministic.
+    """
+    order = list(range(len(points)))
+
+    def place(lo: int, hi: int, depth: int) -> None:
+        if hi - lo <= 1:
+            return
+        axis = depth % 3
+        order[lo:hi] = sorted(order[lo:hi], key=lambda i: (points[i][axis], i))
+        mid = (lo + hi) // 2
+        place(lo, mid, depth + 1)
+        place(mid + 1, hi, depth + 1)
+
+    place(0, len(order), 0)
+    return order
+
+
+def nearest(
+    index: dict[str, Any], lat: float, lon: float, k: int = 5,
+    max_km: float | None = None,
+) -> list[tuple[str, float]]:
+    """Return up to k (location name, km) pairs nearest to lat/lon.
+
+    Reference implementation of js/location-index.js.
+    """
+    coords = index["coords"]
+    names = [loc["name"] for loc in index["locations"]]
+    target = unit_vector(lat, lon)
+    limit = math.inf if max_km is None else 2 * math.sin(max_km / (2 * EARTH_RADIUS_KM))
+    best: list[tuple[float, int]] = []  # max-heap of (-dist2, position)
+
+    def bound() -> float:
+        if len(best) < k:
+            return limit * limit
+        return -best[0][0]
+
+    def visit(lo: int, hi: int, depth: int) -> None:
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        point = coords[3 * mid:3 * mid + 3]
+        dist2 = sum((a - b) ** 2 for a, b in zip(point, target))
+        if dist2 <= bound():
+            heapq.heappush(best, (-dist2, mid))
+            if len(best) > k:
+                heapq.heappop(best)
+        axis = depth % 3
+        diff = target[axis] - point[axis]
+        near, far = ((lo, mid), (mid + 1, hi)) if diff < 0 else ((mid + 1, hi), (lo, mid))
+        visit(*near, depth + 1)
+        if diff * diff <= bound():
+            visit(*far, depth + 1)
+
+    if k > 0:
+        visit(0, len(names), 0)
+    ranked = sorted((-d, pos) for d, pos in best)
+    return [(names[pos], chord_to_km(math.sqrt(d))) for d, pos in ranked]
+
+
+def build_index(
+    locations: list[dict[str, Any]], centroids: dict[str, tuple[float, float]],
+) -> tuple[dict[str, Any], list[str]]:
+    """Build the index artifact; also return names that could not be placed."""
+    located: list[dict[str, Any]] = []
+    points: list[tuple[float, float, float]] = []
+    unplaced: list[str] = []
+    for loc in locations:
+        fsa = parse_fsa(loc.get("address", ""))
+        if fsa is None or fsa not in centroids:
+            unplaced.append(loc.get("name", ""))
+            continue
+        located.append({"name": loc["name"], "fsa": fsa})
+        points.append(unit_vector(*centroids[fsa]))
+
+    order = build_kdtree(points)
+    coords = [c for i in order for c in points[i]]
+    artifact = {
+        "version": INDEX_VERSION,
+        "locations": [located[i] for i in order],
+        "coords": coords,
+        "fsas": {fsa: [round(lat, 4), round(lon, 4)] for fsa, (lat, lon) in sorted(centroids.items())},
+    }
+    return artifact, unplaced
+
+
+# ---------------------------------------------------------------------------
+# Build Step
+# ---------------------------------------------------------------------------
+
+
+def write_location_index(
+    output_path: Path, locations: list[dict[str, Any]], centroids_path: Path,
+) -> bool:
+    """Build the nearest-hospital index and write it as JSON.
+
+    A missing centroid table is not an error: the step is skipped with a
+    warning. Returns True on success or skip, False on failure.
+    """
+    if not centroids_path.exists():
+        logger.warning(
+            "  %s not found - skipping %s (see tools/location_index.py)",
+            centroids_path.name, output_path.name,
+        )
+        return True
+
+    try:
+        centroids = load_centroids(centroids_path)
+        index, unplaced = build_index(locations, centroids)
+        content = json_codec.dumps(index, compact=True, ensure_ascii=False)
+        converter.write_file_atomically(output_path, content, suffix=".json")
+    except Exception as e:
+        logger.error("  Error writing %s: %s", output_path.name, e)
+        return False
+
+    for name in unplaced:
+        logger.warning("  No FSA centroid for location: %s", name)
+    logger.info(
+        "  Wrote %s (%d/%d locations, %d FSAs, %d bytes)",
+        output_path, len(index["locations"]), len(locations), len(index["fsas"]),
+        len(content.encode("utf-8")),
+    )
+    return True
@@ -0,0 +1,220 @@
+"""
+Precache manifest and service worker generation.
+
+Lists every static asset the app loads (HTML, CSS, JS and the JSON
+data files) with its content hash and size, then renders a service worker
+that serves those assets cache-first. Cache entries are keyed by content
+revision, so when the service worker changes only assets whose hash
+changed are re-fetched; everything else stays on local disk.
+
+Run as part of build.py (always the last step, after the data files
+have been regenerated).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+import change_report
+import prescription_converter as converter
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+MANIFEST_FILENAME = "precache-manifest.json"
+SERVICE_WORKER_FILENAME = "sw.js"
+
+# Glob patterns (relative to the project root) of assets to precache.
+PRECACHE_PATTERNS: tuple[str, ...] = (
+    "index.html",
+    "manifest.json",
+    "css/**/*.css",
+    "js/**/*.js",
+    "js/prescriptions/chunks/*.json",
+    "js/prescriptions/sites/*.json",
+    "data/billing/*.json",
+    "data/billing/search-index.bin",
+    "data/fuzzy-index.json",
+    "data/location-index.json",
+)
+
+# Never requested by the browser: Node-only test files, and the
+# gitignored change reports written next to the converted data.
+_EXCLUDED_SUFFIXES: tuple[str, ...] = (".test.js", change_report.REPORT_SUFFIX)
+
+# Hex digits of the SHA-256 digest kept as an asset's revision.
+_REVISION_LENGTH = 16
+
+_SERVICE_WORKER_TEMPLATE = """\
+// Auto-generated by build.py - do not edit
+/**
+ * EM Hub — Offline-first service worker
+ *
+ * Serves every precached asset cache-first. Cache keys carry the asset's
+ * content revision, so a new build only downloads assets whose revision
+ * changed; unchanged entries are reused and stale ones are dropped once
+ * the new worker activates.
+ */
+"use strict";
+
+var PRECACHE_VERSION = "__VERSION__";
+var PRECACHE_ASSETS = __ASSETS__; // [url, revision] pairs
+var CACHE_NAME = "emhub-precache";
+
+var SCOPE = self.registration.scope;
+
+function assetUrl(url) {
+  return new URL(url, SCOPE).href;
+}
+
+function cacheKey(url, revision) {
+  return assetUrl(url) + "?__rev=" + revision;
+}
+
+// Request URL (without query/hash) -> revisioned cache key
+var KEY_BY_URL = {};
+PRECACHE_ASSETS.forEach(function (asset) {
+  KEY_BY_URL[assetUrl(asset[0])] = cacheKey(asset[0], asset[1]);
+});
+KEY_BY_URL[SCOPE] = KEY_BY_URL[assetUrl("index.html")];
+
+self.addEventListener("install", function (event) {
+  event.waitUntil(
+    caches.open(CACHE_NAME).then(function (cache) {
+      return Promise.all(PRECACHE_ASSETS.map(function (asset) {
+        var key = cacheKey(asset[0], asset[1]);
+        return cache.match(key).then(function (hit) {
+          if (hit) return; // unchanged since a previous install
+          return fetch(assetUrl(asset[0]), { cache: "no-cache" }).then(function (res) {
+            if (!res.ok) throw new Error("Precache failed for " + asset[0] + ": " + res.status);
+            return cache.put(key, res);
+          });
+        });
+      }));
+    })
+  );
+});
+
+self.addEventListener("activate", function (event) {
+  var wanted = new Set(Object.keys(KEY_BY_URL).map(function (url) {
+    return KEY_BY_URL[url];
+  }));
+  event.waitUntil(
+    caches.open(CACHE_NAME).then(function (cache) {
+      return cache.keys().then(function (requests) {
+        return Promise.all(requests.map(function (req) {
+          return wanted.has(req.url) ? null : cache.delete(req);
+        }));
+      });
+    }).then(function () {
+      return self.clients.claim();
+    })
+  );
+});
+
+self.addEventListener("fetch", function (event) {
+  if (event.request.method !== "GET") return;
+  var url = new URL(event.request.url);
+  var key = KEY_BY_URL[url.origin + url.pathname];
+  if (!key) return; // not precached: default network handling
+
+  event.respondWith(
+    caches.open(CACHE_NAME).then(function (cache) {
+      return cache.match(key).then(function (hit) {
+        return hit || fetch(event.request);
+      });
+    })
+  );
+});
+"""
+
+
+# ---------------------------------------------------------------------------
+# Manifest
+# ---------------------------------------------------------------------------
+
+
+def collect_assets(root: Path) -> list[Path]:
+    """Return all precacheable asset paths under root, sorted by URL."""
+    found: set[Path] = set()
+    for pattern in PRECACHE_PATTERNS:
+        for path in root.glob(pattern):
+            if path.is_file() and not path.name.endswith(_EXCLUDED_SUFFIXES):
+                found.add(path)
+    return sorted(found, key=lambda p: p.relative_to(root).as_posix())
+
+
+def build_manifest(root: Path, assets: list[Path]) -> dict[str, Any]:
+    """Hash each asset and return the precache manifest.
+
+    The manifest version is derived from all (url, revision) pairs, so it
+    only changes when an asset is added, removed or edited.
+    """
+    entries: list[dict[str, Any]] = []
+    version_hash = hashlib.sha256()
+    for path in assets:
+        content = path.read_bytes()
+        url = path.relative_to(root).as_posix()
+        revision = hashlib.sha256(content).hexdigest()[:_REVISION_LENGTH]
+        entries.append({"url": url, "revision": revision, "size": len(content)})
+        version_hash.update(f"{url}\0{revision}\n".encode("utf-8"))
+
+    return {
+        "version": version_hash.hexdigest()[:_REVISION_LENGTH],
+        "total_size": sum(e["size"] for e in entries),
+        "assets": entries,
+    }
+
+
+def render_service_worker(manifest: dict[str, Any]) -> str:
+    """Render the service worker source with the manifest embedded."""
+    assets = json.dumps(
+        [[e["url"], e["revision"]] for e in manifest["assets"]],
+        separators=(",", ":"),
+    )
+    return (
+        _SERVICE_WORKER_TEMPLATE
+        .replace("__VERSION__", manifest["version"])
+        .replace("__ASSETS__", assets)
+    )
+
+
+# ---------------------------------------------------------------------------
+# Build Step
+# ---------------------------------------------------------------------------
+
+
+def write_precache(root: Path) -> bool:
+    """Write the precache manifest and service worker into root.
+
+    Returns True on success, False on failure.
+    """
+    try:
+        manifest = build_manifest(root, collect_assets(root))
+        converter.write_file_atomically(
+            root / MANIFEST_FILENAME,
+            json.dumps(manifest, indent=2) + "\n",
+            suffix=".json",
+        )
+        converter.write_file_atomically(
+            root / SERVICE_WORKER_FILENAME,
+            render_service_worker(manifest),
+            suffix=".js",
+        )
+    except Exception as e:
+        logger.error("  Error writing precache files: %s", e)
+        return False
+
+    logger.info(
+        "  Wrote %s and %s (%d assets, %d bytes, version %s)",
+        MANIFEST_FILENAME, SERVICE_WORKER_FILENAME, len(manifest["assets"]),
+        manifest["total_size"], manifest["version"],
+    )
+    return True
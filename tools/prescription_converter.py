@@ -9,21 +9,37 @@ Usage:
     python prescription_converter.py
     python prescription_converter.py --non-interactive
     python prescription_converter.py --input custom.xlsx --output custom.json
+    python prescription_converter.py --no-cache
+
+Library use (no files; e.g. an upload service):
+    meds = list(iter_meds(workbook_bytes))
+    meds = await read_meds_async(workbook_bytes, executor)
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextlib
+import io
 import json
 import logging
+import re
 import sys
 import tempfile
 from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import pandas as pd
 
+import build_cache
+import change_report
+import json_codec
+import sheet_cache
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -35,6 +51,22 @@ _FALSY_STRINGS: frozenset[str] = frozenset({"false", "no", "n", "0", "off", ""})
 DEFAULT_EXCEL_FILENAME: str = "Prescriptions.xlsx"
 DEFAULT_OUTPUT_FILENAME: str = "Prescriptions.json"
 
+# Modules whose code shapes a cached conversion (see convert_excel).
+_CACHE_SOURCES: list[Path] = [
+    Path(__file__), Path(json_codec.__file__), Path(sheet_cache.__file__),
+]
+
+# Cached sheet results are invalidated when this module or pandas changes.
+_SHEET_CACHE_SALT: str = (
+    sheet_cache.source_hash(Path(__file__)) + "|pandas " + pd.__version__
+)
+
+# Fields forming a medication's stable key across conversions (repeats of a
+# key are numbered " #2", " #3", ... in workbook order).
+MED_KEY_FIELDS: tuple[str, ...] = (
+    "specialty", "population", "subcategory", "med", "indication",
+)
+
 # Maps Excel column names to output JSON keys for simple text fields.
 _TEXT_FIELD_MAP: dict[str, str] = {
     "Indication": "indication",
@@ -50,6 +82,35 @@ _TEXT_FIELD_MAP: dict[str, str] = {
     "Subcategory": "subcategory",
 }
 
+# Scheduled doses per day for fixed frequency abbreviations. Interval forms
+# ("q6h", "q4-6h") are derived from the hours; anything else (e.g. "q5mins",
+# "PRN" text) is left unparsed.
+_DOSES_PER_DAY: dict[str, float] = {
+    "od": 1, "daily": 1, "once": 1, "qhs": 1, "qam": 1, "qpm": 1,
+    "bid": 2, "tid": 3, "qid": 4,
+    "qmwf": 3 / 7,
+}
+
+_NUMBER = r"(\d+(?:\.\d+)?)"
+_RANGE = rf"{_NUMBER}(?:\s*(?:-|to)\s*{_NUMBER})?"
+_DOSE_RE = re.compile(rf"^{_RANGE}\s*([a-z][a-z ]*?)\s*(/kg)?(?:/(dose|day))?$")
+_INTERVAL_RE = re.compile(rf"^q{_RANGE}\s*h$")
+_DURATION_RE = re.compile(rf"^{_RANGE}\s*(days?|d|weeks?|wks?)$")
+_DISPENSE_RE = re.compile(rf"^{_NUMBER}\s*([a-z][a-z ]*)$")
+
+# Dispense units that count whole doses, for the build-time quantity check.
+_COUNTABLE_UNITS: frozenset[str] = frozenset({"tab", "cap", "supp", "dose", "puff"})
+
+# Function words dropped from search_text (see compact_search_text).
+SEARCH_STOPWORDS: frozenset[str] = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "if",
+    "in", "into", "is", "it", "of", "on", "or", "than", "that", "the",
+    "then", "this", "to", "with",
+})
+
+# Delimiter between search_text components.
+SEARCH_TEXT_DELIMITER = " | "
+
 # ---------------------------------------------------------------------------
 # Logging Setup
 # ---------------------------------------------------------------------------
@@ -151,11 +212,145 @@ def build_search_text(components: list[str | None]) -> str:
     avoid collisions with the delimiter. Empty strings and None are
     filtered out.
     """
-    return " | ".join(
+    return SEARCH_TEXT_DELIMITER.join(
         c.replace("|", " ") for c in components if isinstance(c, str) and c
     ).lower()
 
 
+def compact_search_text(
+    search_text: str, stopwords: frozenset[str] = SEARCH_STOPWORDS,
+) -> str:
+    """Drop stopwords and repeated tokens from a build_search_text string.
+
+    Tokens are whitespace-separated and compared exactly; the first
+    occurrence is kept, so "anaphylaxis" in both indication and comments
+    appears once. Components left empty are dropped with their delimiter.
+    """
+    seen: set[str] = set()
+    components = []
+    for component in search_text.split(SEARCH_TEXT_DELIMITER):
+        tokens = []
+        for token in component.split():
+            if token not in stopwords and token not in seen:
+                seen.add(token)
+                tokens.append(token)
+        if tokens:
+            components.append(" ".join(tokens))
+    return SEARCH_TEXT_DELIMITER.join(components)
+
+
+# ---------------------------------------------------------------------------
+# Structured Field Parsing
+# ---------------------------------------------------------------------------
+#
+# Dose, Frequency, Duration and Dispense stay in the output as written; the
+# parsers below add machine-readable companions, or None when the text does
+# not follow a recognized pattern.
+
+
+def _number(text: str) -> int | float:
+    """Parse a numeric string, keeping whole numbers as int."""
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+
+def _unit_key(unit: str) -> str:
+    """Normalize a unit for comparison: first word, singular."""
+    word = unit.split()[0] if unit else ""
+    return word[:-1] if word.endswith("s") and len(word) > 3 else word
+
+
+def parse_dose(text: str) -> dict[str, Any] | None:
+    """Parse "500mg", "1-2 tab" or "15mg/kg/dose" into a dose range.
+
+    Returns {"min", "max", "unit", "per_kg", "per"} where per is "dose",
+    "day" or None.
+    """
+    match = _DOSE_RE.match(text.strip().lower())
+    if not match:
+        return None
+    low, high, unit, per_kg, per = match.groups()
+    return {
+        "min": _number(low),
+        "max": _number(high or low),
+        "unit": unit,
+        "per_kg": per_kg is not None,
+        "per": per,
+    }
+
+
+def parse_frequency(text: str) -> dict[str, Any] | None:
+    """Parse "BID", "q6h" or "q4-6h" into scheduled doses per day.
+
+    Returns {"min", "max"}; an interval range gives the fewest doses (longest
+    interval) as min. Fractions are rounded to 4 places.
+    """
+    key = text.strip().lower().replace(" ", "")
+    if key in _DOSES_PER_DAY:
+        count = round(_DOSES_PER_DAY[key], 4)
+        return {"min": count, "max": count}
+    match = _INTERVAL_RE.match(key)
+    if not match:
+        return None
+    short = float(match.group(1))
+    long = float(match.group(2) or match.group(1))
+    if short <= 0 or long <= 0:
+        return None
+    return {
+        "min": _number(str(round(24 / max(short, long), 4))),
+        "max": _number(str(round(24 / min(short, long), 4))),
+    }
+
+
+def parse_duration(text: str) -> dict[str, Any] | None:
+    """Parse "7 day", "2 week" or "7-14 day" into {"min", "max"} days."""
+    match = _DURATION_RE.match(text.strip().lower())
+    if not match:
+        return None
+    low, high, unit = match.groups()
+    days = 7 if unit.startswith("w") else 1
+    return {"min": _number(low) * days, "max": _number(high or low) * days}
+
+
+def parse_dispense(text: str) -> dict[str, Any] | None:
+    """Parse "28 tab" or "100ml" into {"amount", "unit"}."""
+    match = _DISPENSE_RE.match(text.strip().lower())
+    if not match:
+        return None
+    return {"amount": _number(match.group(1)), "unit": match.group(2).strip()}
+
+
+def check_dispense_quantity(med_obj: dict[str, Any]) -> str | None:
+    """Compare the dispensed count with dose x frequency x duration.
+
+    Only applies when dose and dispense are in the same countable unit
+    (tabs, caps, ...) and all three parsed fields are present. Over-dispensing
+    is always reported; under-dispensing only for scheduled (non-PRN) meds.
+    Returns a warning message, or None when consistent or not checkable.
+    """
+    dose = med_obj.get("dose_range")
+    per_day = med_obj.get("doses_per_day")
+    days = med_obj.get("duration_days")
+    dispense = med_obj.get("dispense_qty")
+    if not (dose and per_day and days and dispense) or dose["per_kg"]:
+        return None
+    unit = _unit_key(dispense["unit"])
+    if unit not in _COUNTABLE_UNITS or _unit_key(dose["unit"]) != unit:
+        return None
+
+    lowest = dose["min"] * per_day["min"] * days["min"]
+    highest = dose["max"] * per_day["max"] * days["max"]
+    amount = dispense["amount"]
+    if amount > highest or (amount < lowest and not med_obj.get("prn")):
+        return (
+            f"Dispense {med_obj.get('dispense')} does not match "
+            f"{med_obj.get('dose_text')} {med_obj.get('frequency')} x "
+            f"{med_obj.get('duration')} (expected {lowest:g}-{highest:g} {unit}) "
+            f"for: {med_obj.get('med', 'Unknown')}"
+        )
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Validation Functions
 # ---------------------------------------------------------------------------
@@ -184,6 +379,10 @@ def validate_medication(med_obj: dict[str, Any]) -> list[str]:
     if dose_per_kg is not None and dose_per_kg < 0:
         warnings.append(f"Negative dose_per_kg ({dose_per_kg}) for: {med_name}")
 
+    dispense_warning = check_dispense_quantity(med_obj)
+    if dispense_warning:
+        warnings.append(dispense_warning)
+
     return warnings
 
 
@@ -230,17 +429,21 @@ def process_row(row: dict[str, Any], sheet_name: str) -> dict[str, Any] | None:
     max_dose = parse_numeric(row.get("MaxDose"), "MaxDose", med_name)
     weight_based = _resolve_weight_based(med_name, dose_per_kg, row.get("WeightBased"))
 
-    search_text = build_search_text([
+    search_text = compact_search_text(build_search_text([
         sheet_name, fields["population"], fields["subcategory"],
         fields["indication"], med_name, " ".join(brands),
         fields["dose_text"], fields["prn"], fields["comments"],
-    ])
+    ]))
 
     return {
         "specialty": sheet_name,
         "med": med_name,
         "brands": brands,
         **fields,
+        "dose_range": parse_dose(fields["dose_text"]),
+        "doses_per_day": parse_frequency(fields["frequency"]),
+        "duration_days": parse_duration(fields["duration"]),
+        "dispense_qty": parse_dispense(fields["dispense"]),
         "refill": refill,
         "weight_based": weight_based,
         "dose_per_kg_mg": dose_per_kg,
@@ -299,19 +502,24 @@ def load_excel(excel_path: Path) -> pd.ExcelFile | None:
 
 
 def write_file_atomically(
-    output_path: Path, content: str, *, suffix: str = ".tmp",
+    output_path: Path, content: str | bytes, *, suffix: str = ".tmp",
 ) -> None:
     """Write content to a file atomically via temp-file-then-rename.
 
-    Creates parent directories if needed. On failure, cleans up the
-    temp file and re-raises so callers can handle the error.
+    Text is written as UTF-8; bytes are written as-is. Creates parent
+    directories if needed. On failure, cleans up the temp file and
+    re-raises so callers can handle the error.
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp_name = tempfile.mkstemp(suffix=suffix, dir=output_path.parent)
     tmp_path = Path(tmp_name)
     try:
-        with open(fd, "w", encoding="utf-8") as f:
-            f.write(content)
+        if isinstance(content, bytes):
+            with open(fd, "wb") as f:
+                f.write(content)
+        else:
+            with open(fd, "w", encoding="utf-8") as f:
+                f.write(content)
         tmp_path.replace(output_path)
     except BaseException:
         if tmp_path.exists():
@@ -319,11 +527,15 @@ def write_file_atomically(
         raise
 
 
-def write_json(output_path: Path, data: dict[str, Any]) -> bool:
-    """Serialize data as JSON and write atomically."""
+def write_json(output_path: Path, data: dict[str, Any], compact: bool = False) -> bool:
+    """Serialize data as JSON and write atomically.
+
+    Indented by default; compact=True drops all whitespace for
+    machine-only output.
+    """
     try:
         write_file_atomically(
-            output_path, json.dumps(data, indent=2), suffix=".json",
+            output_path, json_codec.dumps(data, compact=compact), suffix=".json",
         )
         return True
     except Exception as e:
@@ -339,33 +551,110 @@ def _log_summary(meds: list[dict[str, Any]]) -> None:
         logger.info("  %s: %d medications", spec, count)
 
 
+# ---------------------------------------------------------------------------
+# Change Reports
+# ---------------------------------------------------------------------------
+
+
+def _load_previous_meds(output_path: Path) -> list[dict[str, Any]] | None:
+    """Return the meds of an existing output file, or None if unavailable."""
+    try:
+        with open(output_path, "r", encoding="utf-8") as f:
+            return json.load(f)["meds"]
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        logger.warning("Previous %s unreadable (%s) - reporting all as added", output_path.name, e)
+        return None
+
+
 # ---------------------------------------------------------------------------
 # Main Conversion Function
 # ---------------------------------------------------------------------------
 
 
-def convert_excel(excel_path: Path) -> dict[str, Any] | None:
+def _revalidate(meds: list[dict[str, Any]]) -> int:
+    """Re-log validation warnings for cached medications; return the count."""
+    count = 0
+    for med_obj in meds:
+        for warning in validate_medication(med_obj):
+            logger.warning(warning)
+            count += 1
+    return count
+
+
+def convert_excel(excel_path: Path, use_cache: bool = True) -> dict[str, Any] | None:
     """Convert Excel prescription data to a dict.
 
+    With use_cache, an identical earlier conversion (same workbook bytes,
+    converter source and pandas version) is returned from the shared build
+    cache (see build_cache); a change to json_codec or sheet_cache also
+    misses. Otherwise sheets whose content is unchanged
+    since the last run (see sheet_cache) reuse their cached medications
+    instead of being re-parsed.
+
     Returns the data dict on success, None on failure.
     """
-    xls = load_excel(excel_path)
-    if xls is None:
-        return None
-
-    with xls:
-        logger.info("Found %d sheets", len(xls.sheet_names))
-        for sheet in xls.sheet_names:
+    artifacts = build_cache.open_cache() if use_cache else None
+    key = None
+    if artifacts is not None and excel_path.exists():
+        key = artifacts.key(
+            "prescriptions", [excel_path], _CACHE_SOURCES,
+            {"file": excel_path.name, "pandas": pd.__version__},
+        )
+        cached = artifacts.get(key)
+        if cached is not None:
+            data = json.loads(cached)
+            logger.info("Reusing cached conversion of %s (build cache)", excel_path.name)
+            _log_summary(data["meds"])
+            logger.info("Converted %d prescriptions", len(data["meds"]))
+            return data
+
+    data = _convert_sheets(excel_path, use_cache)
+    if data is not None and key is not None:
+        artifacts.put(key, json_codec.dumps(data, compact=True, ensure_ascii=False).encode("utf-8"))
+    return data
+
+
+def _convert_sheets(excel_path: Path, use_cache: bool) -> dict[str, Any] | None:
+    """Parse the workbook sheet by sheet (reusing unchanged sheets)."""
+    cache = sheet_cache.SheetCache.open(excel_path, _SHEET_CACHE_SALT) if use_cache else None
+    cached = {name: cache.get(name) for name in cache.digests} if cache else {}
+
+    xls = None
+    if not cached or None in cached.values():
+        xls = load_excel(excel_path)
+        if xls is None:
+            return None
+
+    with xls if xls is not None else contextlib.nullcontext():
+        sheet_names = [str(s) for s in xls.sheet_names] if xls is not None else list(cached)
+        logger.info("Found %d sheets", len(sheet_names))
+        for sheet in sheet_names:
             logger.debug("  %s", sheet)
 
         all_meds: list[dict[str, Any]] = []
         total_warnings = 0
 
-        for sheet_name in xls.sheet_names:
-            meds, warnings = process_sheet(xls, str(sheet_name))
+        for sheet_name in sheet_names:
+            meds = cached.get(sheet_name)
+            if meds is None:
+                meds, warnings = process_sheet(xls, sheet_name)
+                # Empty and skipped sheets are cached too, so an unchanged
+                # workbook never has to be loaded.
+                if cache is not None:
+                    cache.put(sheet_name, meds)
+            else:
+                logger.info("Reusing cached sheet: %s (%d medications)", sheet_name, len(meds))
+                warnings = _revalidate(meds)
             all_meds.extend(meds)
             total_warnings += warnings
 
+    if cache is not None:
+        cache.save()
+        reused = sum(meds is not None for meds in cached.values())
+        logger.info("Sheet cache: %d reused, %d parsed", reused, len(sheet_names) - reused)
+
     if total_warnings > 0:
         logger.warning("Total validation warnings: %d", total_warnings)
 
@@ -383,16 +672,27 @@ def convert_excel(excel_path: Path) -> dict[str, Any] | None:
     return final_output
 
 
-def convert_excel_to_json(excel_path: Path, output_path: Path) -> bool:
+def convert_excel_to_json(
+    excel_path: Path, output_path: Path, use_cache: bool = True, compact: bool = False,
+) -> bool:
     """Convert Excel prescription data to JSON format.
 
+    compact=True writes the JSON without indentation. Also writes a change
+    report against the previous output (see change_report.build_report)
+    next to output_path.
+
     Returns True on success, False on failure.
     """
-    data = convert_excel(excel_path)
+    data = convert_excel(excel_path, use_cache)
     if data is None:
         return False
 
-    if not write_json(output_path, data):
+    previous = _load_previous_meds(output_path)
+    if not write_json(output_path, data, compact):
+        return False
+
+    report = change_report.build_report(previous, data["meds"], MED_KEY_FIELDS)
+    if not change_report.write_report(change_report.report_path(output_path), report):
         return False
 
     logger.info(
@@ -402,6 +702,63 @@ def convert_excel_to_json(excel_path: Path, output_path: Path) -> bool:
     return True
 
 
+# ---------------------------------------------------------------------------
+# In-Memory Conversion
+# ---------------------------------------------------------------------------
+
+# A workbook held in memory: its bytes, or a binary file-like object.
+WorkbookSource = bytes | bytearray | memoryview | BinaryIO
+
+
+def as_workbook_stream(source: WorkbookSource) -> BinaryIO:
+    """Return a seekable binary stream over source (readers need to seek)."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    if not source.seekable():
+        return io.BytesIO(source.read())
+    return source
+
+
+def iter_meds(source: WorkbookSource) -> Iterator[dict[str, Any]]:
+    """Convert an in-memory workbook, yielding medications sheet by sheet.
+
+    Same records as convert_excel's "meds" list, without touching the
+    filesystem or the caches. Raises ValueError if source is not a readable
+    workbook (checked before the first record is requested).
+    """
+    try:
+        xls = pd.ExcelFile(as_workbook_stream(source))
+    except Exception as e:
+        raise ValueError(f"Unreadable workbook: {e}") from e
+
+    def generate() -> Iterator[dict[str, Any]]:
+        with xls:
+            for sheet_name in xls.sheet_names:
+                meds, _ = process_sheet(xls, str(sheet_name))
+                yield from meds
+
+    return generate()
+
+
+async def read_meds_async(
+    source: WorkbookSource, executor: Executor | None = None,
+) -> list[dict[str, Any]]:
+    """Convert an in-memory workbook in an executor; return all medications.
+
+    Parsing is CPU-bound and mostly holds the GIL, so pass a
+    ProcessPoolExecutor (with bytes, which pickle) to convert several
+    workbooks in parallel; the default thread pool only keeps the event
+    loop responsive.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, _read_meds, source)
+
+
+def _read_meds(source: WorkbookSource) -> list[dict[str, Any]]:
+    """Module-level (picklable) target for read_meds_async."""
+    return list(iter_meds(source))
+
+
 # ---------------------------------------------------------------------------
 # CLI Interface
 # ---------------------------------------------------------------------------
@@ -432,6 +789,17 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Run without pausing for user input (for automation)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse every sheet instead of reusing unchanged sheets "
+             "from data/.cache",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write the JSON without indentation (smaller, machine-only)",
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -455,6 +823,8 @@ def main() -> int:
         success = convert_excel_to_json(
             excel_path=args.input,
             output_path=args.output,
+            use_cache=not args.no_cache,
+            compact=args.compact,
         )
         return 0 if success else 1
 
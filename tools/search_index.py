@@ -0,0 +1,179 @@
+"""
+Prebuilt billing search index.
+
+js/billing/search.js scores every billing and diagnostic code against
+lowercased copies of its code, full name and search terms. This stage
+precomputes those strings and packs them into one binary file,
+data/billing/search-index.bin, that the search worker
+(js/billing/search-worker.js) receives as a transferable ArrayBuffer:
+the page hands it over without a copy, and the worker decodes it with
+one TextDecoder call instead of parsing both JSON files again.
+
+Layout (little-endian):
+    magic      4 bytes  b"EMSI"
+    version    u16
+    lists      u16      number of code lists (billing, diagnostic)
+    digest     u32      source_digest of the code lists
+    counts     u32 x lists
+    offsets    u32 x (FIELD_COUNT x total records + 1)
+    pool       UTF-8 text of every field, concatenated
+
+Records keep the order of billing_codes.json then diagnostic_codes.json,
+so result ids are array indices into those files. Each record has the
+FIELDS strings in order; field i of record r spans
+pool[offsets[r * FIELD_COUNT + i]:offsets[r * FIELD_COUNT + i + 1]].
+Offsets count UTF-16 code units, so they index the decoded JS string
+directly.
+
+Ids are only meaningful against the JSON the index was built from, so
+the page recomputes the digest over the code lists it loaded
+(searchIndexDigest in search.js) and searches on the main thread when
+it differs from the header's.
+"""
+
+from __future__ import annotations
+
+import logging
+import struct
+from pathlib import Path
+from typing import Any
+
+import prescription_converter as converter
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+SEARCH_INDEX_MAGIC = b"EMSI"
+SEARCH_INDEX_VERSION = 2
+
+# Per-record strings, as search.js names them on each code.
+FIELDS: tuple[str, ...] = ("lower_code", "lower_name", "lower_terms", "name")
+FIELD_COUNT = len(FIELDS)
+
+# Joins a code's search terms into its "lower_terms" field.
+TERM_SEPARATOR = "\n"
+
+# 32-bit FNV-1a, over UTF-16 code units like JS charCodeAt.
+_FNV_OFFSET = 0x811C9DC5
+_FNV_PRIME = 0x01000193
+
+_HEADER = struct.Struct("<4sHHI")
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+
+def record_fields(code: dict[str, Any]) -> tuple[str, ...]:
+    """Return a code's FIELDS, computed as loadSearchData does in search.js."""
+    name = code.get("name") or ""
+    subcategory = code.get("subcategory") or ""
+    full_name = f"{subcategory} {name}" if subcategory else name
+    terms = (str(t).lower().replace(TERM_SEPARATOR, " ") for t in code.get("search_terms") or [])
+    return (
+        str(code.get("code") or "").lower(),
+        full_name.lower(),
+        TERM_SEPARATOR.join(terms),
+        name,
+    )
+
+
+def _utf16_length(text: str) -> int:
+    """Length of text in UTF-16 code units, as JS String.length counts it."""
+    return len(text.encode("utf-16-le")) // 2
+
+
+def source_digest(code_lists: list[list[dict[str, Any]]]) -> int:
+    """Hash every code's FIELDS, each followed by a zero code unit."""
+    digest = _FNV_OFFSET
+    for codes in code_lists:
+        for code in codes:
+            for text in record_fields(code):
+                units = struct.unpack(f"<{_utf16_length(text)}H", text.encode("utf-16-le"))
+                for unit in (*units, 0):
+                    digest = ((digest ^ unit) * _FNV_PRIME) & 0xFFFFFFFF
+    return digest
+
+
+def encode_index(code_lists: list[list[dict[str, Any]]]) -> bytes:
+    """Pack code lists into the binary index layout."""
+    strings = [field for codes in code_lists for code in codes for field in record_fields(code)]
+    offsets = [0]
+    for text in strings:
+        offsets.append(offsets[-1] + _utf16_length(text))
+
+    header = _HEADER.pack(
+        SEARCH_INDEX_MAGIC, SEARCH_INDEX_VERSION, len(code_lists), source_digest(code_lists),
+    )
+    counts = struct.pack(f"<{len(code_lists)}I", *(len(codes) for codes in code_lists))
+    return b"".join([
+        header,
+        counts,
+        struct.pack(f"<{len(offsets)}I", *offsets),
+        "".join(strings).encode("utf-8"),
+    ])
+
+
+def decode_index(data: bytes) -> list[list[tuple[str, ...]]]:
+    """Unpack an encoded index into per-list records of FIELDS strings.
+
+    Raises ValueError if data is not a search index of this version.
+    """
+    magic, version, list_count, _ = _HEADER.unpack_from(data)
+    if magic != SEARCH_INDEX_MAGIC or version != SEARCH_INDEX_VERSION:
+        raise ValueError(f"not a version {SEARCH_INDEX_VERSION} search index")
+    position = _HEADER.size
+    counts = struct.unpack_from(f"<{list_count}I", data, position)
+    position += 4 * list_count
+    string_count = FIELD_COUNT * sum(counts) + 1
+    offsets = struct.unpack_from(f"<{string_count}I", data, position)
+    position += 4 * string_count
+
+    # Offsets are UTF-16 code units; slice a UTF-16 copy of the pool
+    pool = data[position:].decode("utf-8").encode("utf-16-le")
+    strings = [
+        pool[2 * start:2 * end].decode("utf-16-le")
+        for start, end in zip(offsets, offsets[1:])
+    ]
+
+    lists: list[list[tuple[str, ...]]] = []
+    record = 0
+    for count in counts:
+        lists.append([
+            tuple(strings[FIELD_COUNT * r:FIELD_COUNT * (r + 1)])
+            for r in range(record, record + count)
+        ])
+        record += count
+    return lists
+
+
+# ---------------------------------------------------------------------------
+# Build Step
+# ---------------------------------------------------------------------------
+
+
+def write_search_index(
+    output_path: Path,
+    billing_codes: list[dict[str, Any]],
+    diagnostic_codes: list[dict[str, Any]],
+) -> bool:
+    """Encode the billing and diagnostic codes and write the index.
+
+    Returns True on success, False on failure.
+    """
+    try:
+        content = encode_index([billing_codes, diagnostic_codes])
+        converter.write_file_atomically(output_path, content, suffix=".bin")
+    except Exception as e:
+        logger.error("  Error writing %s: %s", output_path.name, e)
+        return False
+
+    logger.info(
+        "  Wrote %s (%d billing + %d diagnostic codes, %d bytes)",
+        output_path, len(billing_codes), len(diagnostic_codes), len(content),
+    )
+    return True
@@ -0,0 +1,238 @@
+#!/opt/homebrew/bin/python3
+"""
+Local static server for ED Prescriptions.
+
+A small replacement for `python -m http.server` that behaves like a
+production static host:
+
+- Content negotiation: serves the .br or .gz sibling written by build.py
+  when the client's Accept-Encoding allows it (Vary: Accept-Encoding).
+  A sibling older than its source (edited since the last build) is
+  ignored and the raw file is served instead.
+- Validators: strong ETag per representation plus Last-Modified.
+- Conditional requests: If-None-Match / If-Modified-Since answer 304.
+- Cache-Control: revisioned URLs (?v=...) are immutable for a year;
+  everything else must be revalidated on each use.
+
+Usage:
+    python serve.py               # http://localhost:8000, project root
+    python serve.py 8080 --bind 127.0.0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import email.utils
+import http.server
+import os
+import sys
+from functools import partial
+from pathlib import Path
+from typing import BinaryIO
+from urllib.parse import parse_qs, urlsplit
+
+PROJECT_ROOT = (Path(__file__).parent / "..").resolve()
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+# Preference order when several encodings are acceptable.
+ENCODINGS: tuple[tuple[str, str], ...] = (("br", ".br"), ("gzip", ".gz"))
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# Query parameter that marks a URL as content-revisioned.
+_REVISION_PARAM = "v"
+
+
+# ---------------------------------------------------------------------------
+# Header Helpers
+# ---------------------------------------------------------------------------
+
+
+def parse_accept_encoding(header: str | None) -> dict[str, float]:
+    """Parse an Accept-Encoding header into {coding: q-value}."""
+    accepted: dict[str, float] = {}
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def choose_encoding(header: str | None, available: set[str]) -> str | None:
+    """Return the preferred acceptable encoding among available, if any."""
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    for coding, _ in ENCODINGS:
+        if coding in available and accepted.get(coding, wildcard) > 0:
+            return coding
+    return None
+
+
+def fresh_encodings(path: Path) -> set[str]:
+    """Return the encodings with a sibling at least as new as path."""
+    source_mtime = path.stat().st_mtime_ns
+    available: set[str] = set()
+    for coding, ext in ENCODINGS:
+        try:
+            if path.with_name(path.name + ext).stat().st_mtime_ns >= source_mtime:
+                available.add(coding)
+        except OSError:
+            continue
+    return available
+
+
+def make_etag(stat: os.stat_result, encoding: str | None) -> str:
+    """Build a strong ETag from the served file's size and mtime."""
+    tag = f"{stat.st_size:x}-{stat.st_mtime_ns:x}"
+    return f'"{tag}-{encoding}"' if encoding else f'"{tag}"'
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    """Return True if an If-None-Match header matches etag (weak comparison)."""
+    if header.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == bare
+        for candidate in header.split(",")
+    )
+
+
+def cache_control_for(path: str) -> str:
+    """Return the Cache-Control value for a request path (with query)."""
+    query = parse_qs(urlsplit(path).query)
+    if _REVISION_PARAM in query:
+        return IMMUTABLE_CACHE_CONTROL
+    return REVALIDATE_CACHE_CONTROL
+
+
+# ---------------------------------------------------------------------------
+# Request Handler
+# ---------------------------------------------------------------------------
+
+
+class StaticHandler(http.server.SimpleHTTPRequestHandler):
+    """SimpleHTTPRequestHandler with pre-compressed variants and validators."""
+
+    # Keep-alive: every response path sets Content-Length (or is a 304).
+    protocol_version = "HTTP/1.1"
+
+    def send_head(self) -> BinaryIO | None:
+        path = Path(self.translate_path(self.path))
+        if path.is_dir():
+            index = path / "index.html"
+            if not self.path.split("?", 1)[0].endswith("/") or not index.is_file():
+                # Redirects and directory listings keep the default behaviour.
+                return super().send_head()
+            path = index
+        if not path.is_file():
+            return super().send_head()
+
+        available = fresh_encodings(path)
+        encoding = choose_encoding(self.headers.get("Accept-Encoding"), available)
+        served = path
+        if encoding is not None:
+            served = path.with_name(path.name + dict(ENCODINGS)[encoding])
+
+        try:
+            f = open(served, "rb")
+        except OSError:
+            self.send_error(404, "File not found")
+            return None
+
+        try:
+            stat = os.fstat(f.fileno())
+            etag = make_etag(stat, encoding)
+            last_modified = email.utils.formatdate(
+                path.stat().st_mtime, usegmt=True,
+            )
+            if self._not_modified(etag, path.stat().st_mtime):
+                f.close()
+                self.send_response(304)
+                self._send_validators(etag, last_modified, bool(available))
+                self.end_headers()
+                return None
+
+            self.send_response(200)
+            self.send_header("Content-Type", self.guess_type(str(path)))
+            if encoding is not None:
+                self.send_header("Content-Encoding", encoding)
+            self.send_header("Content-Length", str(stat.st_size))
+            self._send_validators(etag, last_modified, bool(available))
+            self.end_headers()
+            return f
+        except Exception:
+            f.close()
+            raise
+
+    def _not_modified(self, etag: str, mtime: float) -> bool:
+        """Evaluate conditional request headers (If-None-Match wins)."""
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            return etag_matches(if_none_match, etag)
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since is not None:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            return int(mtime) <= since.timestamp()
+        return False
+
+    def _send_validators(self, etag: str, last_modified: str, varies: bool) -> None:
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", last_modified)
+        self.send_header("Cache-Control", cache_control_for(self.path))
+        if varies:
+            self.send_header("Vary", "Accept-Encoding")
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Serve ED Prescriptions with compression and caching headers.",
+    )
+    parser.add_argument("port", type=int, nargs="?", default=8000,
+                        help="Port to listen on (default: 8000)")
+    parser.add_argument("--bind", default="", metavar="ADDRESS",
+                        help="Address to bind (default: all interfaces)")
+    parser.add_argument("--directory", type=Path, default=PROJECT_ROOT,
+                        help="Directory to serve (default: project root)")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Serve until interrupted. Returns 0 on clean shutdown."""
+    args = parse_args()
+    handler = partial(StaticHandler, directory=str(args.directory))
+    with http.server.ThreadingHTTPServer((args.bind, args.port), handler) as httpd:
+        host, port = httpd.server_address[:2]
+        print(f"Serving {args.directory} on http://{host or 'localhost'}:{port}/")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+"""
+Per-sheet change detection and result cache for .xlsx workbooks.
+
+An edit to one sheet changes the workbook's file hash, but not the other
+sheets' XML parts. sheet_digests() reads the zip directly and hashes, for
+each worksheet:
+  - its <sheetData> element (cell values; view state such as the selected
+    cell is ignored),
+  - the shared strings it references, by index,
+  - xl/styles.xml (number formats decide how some values read),
+  - a caller-supplied salt (e.g. a hash of the converter source).
+SheetCache keeps one JSON file of {sheet name: digest + parsed result} per
+workbook, so converters re-parse only sheets whose digest changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import tempfile
+import xml.etree.ElementTree as ET
+import zipfile
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+CACHE_VERSION = 1
+
+# Cache files live in this directory next to the workbook.
+CACHE_DIRNAME = ".cache"
+
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_SHARED_STRING_RE = re.compile(rb"<(?:\w+:)?si\b[^>]*?(?:/>|>.*?</(?:\w+:)?si>)", re.DOTALL)
+_SHARED_REF_RE = re.compile(
+    rb"<(?:\w+:)?c\b[^>]*\bt=\"s\"[^>]*>\s*<(?:\w+:)?v>(\d+)</", re.DOTALL,
+)
+_SHEET_DATA_RE = re.compile(
+    rb"<(?:\w+:)?sheetData\b.*?(?:</(?:\w+:)?sheetData>|/>)", re.DOTALL,
+)
+
+
+# ---------------------------------------------------------------------------
+# Hashing
+# ---------------------------------------------------------------------------
+
+
+def source_hash(*paths: Path) -> str:
+    """Return a SHA-256 over the given source files (a cache salt)."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()
+
+
+def _sheet_parts(archive: zipfile.ZipFile) -> dict[str, str]:
+    """Map each sheet name to its worksheet part path, in workbook order."""
+    workbook = ET.fromstring(archive.read("xl/workbook.xml"))
+    rels = ET.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    targets = {rel.get("Id"): rel.get("Target", "") for rel in rels.iter(f"{_PKG_REL_NS}Relationship")}
+    parts: dict[str, str] = {}
+    for sheet in workbook.iter(f"{_MAIN_NS}sheet"):
+        target = targets.get(sheet.get(f"{_REL_NS}id"), "")
+        parts[sheet.get("name", "")] = target.lstrip("/") if target.startswith("/") else f"xl/{target}"
+    return parts
+
+
+def sheet_digests(workbook_path: Path, salt: str = "") -> dict[str, str]:
+    """Return {sheet name: digest} for every worksheet in an .xlsx file.
+
+    Raises OSError, KeyError, zipfile.BadZipFile or ET.ParseError for
+    unreadable workbooks.
+    """
+    with zipfile.ZipFile(workbook_path) as archive:
+        names = set(archive.namelist())
+        shared = (
+            _SHARED_STRING_RE.findall(archive.read("xl/sharedStrings.xml"))
+            if "xl/sharedStrings.xml" in names else []
+        )
+        styles = archive.read("xl/styles.xml") if "xl/styles.xml" in names else b""
+        common = hashlib.sha256(salt.encode("utf-8") + b"\0" + styles).digest()
+
+        digests: dict[str, str] = {}
+        for name, part in _sheet_parts(archive).items():
+            xml = archive.read(part)
+            match = _SHEET_DATA_RE.search(xml)
+            data = match.group(0) if match else xml
+            digest = hashlib.sha256(common)
+            digest.update(data)
+            for index in sorted({int(i) for i in _SHARED_REF_RE.findall(data)}):
+                digest.update(b"\0%d\0" % index)
+                if index < len(shared):
+                    digest.update(shared[index])
+            digests[name] = digest.hexdigest()
+    return digests
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+
+class SheetCache:
+    """Parsed per-sheet results for one workbook, reused while digests match.
+
+    Usage:
+        cache = SheetCache.open(workbook_path, salt)
+        result = cache.get(sheet)          # None on miss
+        cache.put(sheet, result)           # result must be JSON-serializable
+        cache.save()
+    If the workbook cannot be hashed, every lookup misses and save() is a no-op.
+    """
+
+    def __init__(self, cache_path: Path, digests: dict[str, str], entries: dict[str, Any]):
+        self.cache_path = cache_path
+        self.digests = digests
+        self.entries = entries
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def open(cls, workbook_path: Path, salt: str = "", enabled: bool = True) -> SheetCache:
+        """Hash the workbook's sheets and load any existing cache file.
+
+        With enabled=False the returned cache always misses.
+        """
+        cache_path = workbook_path.parent / CACHE_DIRNAME / f"{workbook_path.name}.sheets.json"
+        if not enabled:
+            return cls(cache_path, {}, {})
+        try:
+            digests = sheet_digests(workbook_path, salt)
+        except (OSError, KeyError, zipfile.BadZipFile, ET.ParseError) as e:
+            logger.debug("Sheet cache disabled for %s: %s", workbook_path.name, e)
+            return cls(cache_path, {}, {})
+        entries: dict[str, Any] = {}
+        try:
+            stored = json.loads(cache_path.read_text(encoding="utf-8"))
+            if stored.get("version") == CACHE_VERSION:
+                entries = stored.get("sheets", {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning("Ignoring unreadable sheet cache %s: %s", cache_path.name, e)
+        return cls(cache_path, digests, entries)
+
+    def get(self, sheet: str) -> Any | None:
+        """Return the cached result for sheet if its digest is unchanged."""
+        digest = self.digests.get(sheet)
+        entry = self.entries.get(sheet)
+        if digest is not None and entry is not None and entry.get("digest") == digest:
+            self.hits += 1
+            return entry["result"]
+        self.misses += 1
+        return None
+
+    def put(self, sheet: str, result: Any) -> None:
+        """Record the parsed result for sheet under its current digest."""
+        digest = self.digests.get(sheet)
+        if digest is not None:
+            self.entries[sheet] = {"digest": digest, "result": result}
+
+    def save(self) -> None:
+        """Write entries for the workbook's current sheets (best effort)."""
+        if not self.digests:
+            return
+        sheets = {name: entry for name, entry in self.entries.items() if name in self.digests}
+        content = json.dumps({"version": CACHE_VERSION, "sheets": sheets}, ensure_ascii=False)
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self.cache_path.parent, suffix=".json", delete=False,
+            ) as f:
+                f.write(content)
+            Path(f.name).replace(self.cache_path)
+        except OSError as e:
+            logger.warning("Could not write sheet cache %s: %s", self.cache_path.name, e)
@@ -0,0 +1,217 @@
+"""
+Per-site formulary overlays on the shared prescription base.
+
+Sites differ from the shared Prescriptions.xlsx by a few dozen rows, so
+instead of a full workbook per site, each site keeps an overlay workbook
+in data/sites/<Site name>.xlsx. It has the base workbook's sheets and
+columns plus an Action column:
+  - add:      a new row (a key already in the base becomes a repeat, " #2")
+  - override: replaces the base row with the same stable key
+  - remove:   drops the base row with that key (only key columns needed)
+
+Stable keys are prescription_converter.MED_KEY_FIELDS, numbered as in
+keyed_records: the nth override/remove row for a key targets that key's
+nth row in the base.
+
+The base converts once; each overlay converts on its own (through the
+build cache) into a list of ops. build.py then writes one small artifact
+per site - the ops plus the site's merged folder counts - and the browser
+applies it to the base chunks (js/site-overlay.js), so conversion and
+download costs grow with each site's differences, not the site count.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+import build_cache
+import change_report
+import json_codec
+import prescription_converter as converter
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+ACTION_COLUMN = "Action"
+
+OVERLAY_ACTIONS: tuple[str, ...] = ("add", "override", "remove")
+
+
+# ---------------------------------------------------------------------------
+# Overlay Conversion
+# ---------------------------------------------------------------------------
+
+
+def med_key(med: dict[str, Any]) -> str:
+    """Return a medication's stable key, before repeat numbering."""
+    return " / ".join(str(med.get(f) or "") for f in converter.MED_KEY_FIELDS)
+
+
+def process_overlay_sheet(
+    xls: pd.ExcelFile, sheet_name: str,
+) -> tuple[list[dict[str, Any]], int]:
+    """Process one overlay sheet into ops, returning (ops, problem count).
+
+    Each op is {"action": ..., "med": ...}; remove ops carry only the key
+    fields of "med".
+    """
+    logger.info("Processing overlay sheet: %s", sheet_name)
+
+    df = pd.read_excel(xls, sheet_name=sheet_name)
+    df.columns = [str(c).strip() for c in df.columns]
+
+    missing = sorted((converter.REQUIRED_COLUMNS | {ACTION_COLUMN}) - set(df.columns))
+    if missing:
+        logger.error(
+            "Overlay sheet '%s' is missing required columns: %s - skipping",
+            sheet_name, missing,
+        )
+        return [], 1
+
+    ops: list[dict[str, Any]] = []
+    problems = 0
+
+    for row in df.to_dict("records"):
+        med_obj = converter.process_row(row, sheet_name)
+        if med_obj is None:
+            continue
+
+        action = converter.clean_text(row.get(ACTION_COLUMN)).lower()
+        if action not in OVERLAY_ACTIONS:
+            logger.error(
+                "Overlay sheet '%s': unknown action '%s' for %s - skipping",
+                sheet_name, action, med_obj["med"],
+            )
+            problems += 1
+            continue
+
+        if action == "remove":
+            med_obj = {f: med_obj[f] for f in converter.MED_KEY_FIELDS}
+        else:
+            for warning in converter.validate_medication(med_obj):
+                logger.warning(warning)
+                problems += 1
+
+        ops.append({"action": action, "med": med_obj})
+
+    logger.info("  -> %d overlay rows from %s", len(ops), sheet_name)
+    return ops, problems
+
+
+def convert_overlay(overlay_path: Path, use_cache: bool = True) -> dict[str, Any] | None:
+    """Convert a site overlay workbook to {"site", "source", "ops"}.
+
+    The site name is the workbook's file stem. With use_cache, an identical
+    earlier conversion is returned from the shared build cache.
+
+    Returns the overlay dict on success, None on failure.
+    """
+    artifacts = build_cache.open_cache() if use_cache else None
+    key = None
+    if artifacts is not None and overlay_path.exists():
+        key = artifacts.key(
+            "site_overlay", [overlay_path], [Path(__file__), Path(converter.__file__)],
+            {"file": overlay_path.name, "pandas": pd.__version__},
+        )
+        cached = artifacts.get(key)
+        if cached is not None:
+            logger.info("Reusing cached conversion of %s (build cache)", overlay_path.name)
+            return json.loads(cached)
+
+    xls = converter.load_excel(overlay_path)
+    if xls is None:
+        return None
+
+    ops: list[dict[str, Any]] = []
+    problems = 0
+    with xls:
+        for sheet_name in (str(s) for s in xls.sheet_names):
+            sheet_ops, sheet_problems = process_overlay_sheet(xls, sheet_name)
+            ops.extend(sheet_ops)
+            problems += sheet_problems
+
+    if problems > 0:
+        logger.warning("Total overlay warnings for %s: %d", overlay_path.name, problems)
+
+    overlay = {
+        "site": overlay_path.stem,
+        "source": {"file": overlay_path.name, "op_count": len(ops)},
+        "ops": ops,
+    }
+    if key is not None:
+        artifacts.put(key, json_codec.dumps(overlay, compact=True, ensure_ascii=False).encode("utf-8"))
+    return overlay
+
+
+def find_overlays(sites_dir: Path) -> list[Path]:
+    """Return the overlay workbooks in sites_dir, sorted (none if it is missing)."""
+    if not sites_dir.is_dir():
+        return []
+    return sorted(p for p in sites_dir.glob("*.xlsx") if not p.name.startswith("~$"))
+
+
+# ---------------------------------------------------------------------------
+# Merging
+# ---------------------------------------------------------------------------
+
+
+def apply_overlay(
+    meds: list[dict[str, Any]], ops: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], int]:
+    """Apply overlay ops to base medications, returning (merged, unmatched).
+
+    Overrides keep the base row's position, removes drop it, and adds go
+    after the last row of their specialty (new specialties go last). Ops
+    whose key matches no base row are logged and counted as unmatched.
+    The base list is not modified.
+    """
+    keyed = change_report.keyed_records(meds, converter.MED_KEY_FIELDS)
+    replacements: dict[int, dict[str, Any] | None] = {}
+    additions: list[dict[str, Any]] = []
+    seen: Counter[str] = Counter()
+    unmatched = 0
+
+    for op in ops:
+        if op["action"] == "add":
+            additions.append(op["med"])
+            continue
+        key = med_key(op["med"])
+        seen[key] += 1
+        target = keyed.get(key if seen[key] == 1 else f"{key} #{seen[key]}")
+        if target is None:
+            logger.error("Overlay %s of '%s' matches no base row", op["action"], key)
+            unmatched += 1
+            continue
+        replacements[id(target)] = op["med"] if op["action"] == "override" else None
+
+    by_specialty: dict[str, list[dict[str, Any]]] = {}
+    for med in meds:
+        merged = replacements.get(id(med), med)
+        by_specialty.setdefault(med["specialty"], [])
+        if merged is not None:
+            by_specialty[med["specialty"]].append(merged)
+    for med in additions:
+        by_specialty.setdefault(med["specialty"], []).append(med)
+
+    return [med for group in by_specialty.values() for med in group], unmatched
+
+
+def ops_by_specialty(ops: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    """Group ops by specialty, keeping their order within each specialty.
+
+    Keys include the specialty, so applying each group to that specialty's
+    chunk gives the same result as apply_overlay on the whole list.
+    """
+    grouped: dict[str, list[dict[str, Any]]] = {}
+    for op in ops:
+        grouped.setdefault(op["med"]["specialty"], []).append(op)
+    return grouped
@@ -0,0 +1,397 @@
+#!/opt/homebrew/bin/python3
+"""
+Versioned snapshot store for the source datasets.
+
+Every build appends a snapshot of the converted prescriptions plus
+billing_codes.json and diagnostic_codes.json to data/snapshots.sqlite, so
+"what did the formulary say on date X" and "what changed between two
+builds" are answered from the store without re-parsing old workbooks or
+digging through git.
+
+Storage is content-addressed at two levels:
+  - records:   each record's canonical JSON, keyed by its SHA-256
+  - manifests: one dataset version, the (record key -> record hash) list,
+               keyed by the SHA-256 of that list
+A snapshot maps each dataset to a manifest, so an unchanged dataset adds
+no rows and an edited record adds one. Diffs compare manifests first and
+only join record keys for datasets whose manifest changed.
+
+Record keys (stable across versions so edits show as "changed"):
+  prescriptions     specialty / population / subcategory / med / indication
+  billing_codes     code
+  diagnostic_codes  code
+Repeated keys get " #2", " #3", ... in source order.
+
+Usage:
+    python snapshot_store.py list
+    python snapshot_store.py show 12 --dataset billing_codes
+    python snapshot_store.py show 2026-03-01
+    python snapshot_store.py diff 11 12
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import change_report
+import prescription_converter as converter
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+DEFAULT_STORE_PATH = Path(__file__).parent.parent / "data" / "snapshots.sqlite"
+
+KEY_FIELDS: dict[str, tuple[str, ...]] = {
+    "prescriptions": converter.MED_KEY_FIELDS,
+    "billing_codes": ("code",),
+    "diagnostic_codes": ("code",),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    hash TEXT PRIMARY KEY,
+    body TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS manifests (
+    id      INTEGER PRIMARY KEY,
+    dataset TEXT NOT NULL,
+    digest  TEXT NOT NULL UNIQUE,
+    count   INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS manifest_records (
+    manifest_id INTEGER NOT NULL REFERENCES manifests (id),
+    record_key  TEXT NOT NULL,
+    position    INTEGER NOT NULL,
+    hash        TEXT NOT NULL REFERENCES records (hash),
+    PRIMARY KEY (manifest_id, record_key)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS snapshots (
+    id         INTEGER PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    label      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_created_at ON snapshots (created_at);
+
+CREATE TABLE IF NOT EXISTS snapshot_manifests (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id),
+    dataset     TEXT NOT NULL,
+    manifest_id INTEGER NOT NULL REFERENCES manifests (id),
+    PRIMARY KEY (snapshot_id, dataset)
+) WITHOUT ROWID;
+"""
+
+
+# ---------------------------------------------------------------------------
+# Hashing
+# ---------------------------------------------------------------------------
+
+
+def _sha256(text: str) -> str:
+    """Return the SHA-256 hex digest of a string."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def record_keys(dataset: str, records: list[dict[str, Any]]) -> list[str]:
+    """Return the stable key of each record, suffixing repeats with " #n"."""
+    return list(change_report.keyed_records(records, KEY_FIELDS.get(dataset, ("id",))))
+
+
+# ---------------------------------------------------------------------------
+# Store API
+# ---------------------------------------------------------------------------
+
+
+def open_store(path: Path) -> sqlite3.Connection:
+    """Open (creating if needed) a snapshot store."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _store_manifest(
+    conn: sqlite3.Connection, dataset: str, records: list[dict[str, Any]],
+) -> int:
+    """Store one dataset version and return its manifest id (deduplicated)."""
+    bodies = [change_report.canonical_json(r) for r in records]
+    hashes = [_sha256(b) for b in bodies]
+    keys = record_keys(dataset, records)
+    digest = _sha256(dataset + "\n" + "\n".join(f"{k}\t{h}" for k, h in zip(keys, hashes)))
+
+    row = conn.execute("SELECT id FROM manifests WHERE digest = ?", (digest,)).fetchone()
+    if row is not None:
+        return row[0]
+
+    conn.executemany(
+        "INSERT OR IGNORE INTO records (hash, body) VALUES (?, ?)", zip(hashes, bodies),
+    )
+    manifest_id = conn.execute(
+        "INSERT INTO manifests (dataset, digest, count) VALUES (?, ?, ?)",
+        (dataset, digest, len(records)),
+    ).lastrowid
+    conn.executemany(
+        "INSERT INTO manifest_records VALUES (?, ?, ?, ?)",
+        [(manifest_id, k, pos, h) for pos, (k, h) in enumerate(zip(keys, hashes))],
+    )
+    return manifest_id
+
+
+def record_snapshot(
+    conn: sqlite3.Connection,
+    datasets: dict[str, list[dict[str, Any]]],
+    label: str = "",
+    created_at: str | None = None,
+) -> int:
+    """Append a snapshot of the given datasets and return its id.
+
+    created_at is an ISO-8601 timestamp (default: now, local time, seconds).
+    """
+    created_at = created_at or datetime.now().isoformat(timespec="seconds")
+    with conn:
+        snapshot_id = conn.execute(
+            "INSERT INTO snapshots (created_at, label) VALUES (?, ?)", (created_at, label),
+        ).lastrowid
+        conn.executemany(
+            "INSERT INTO snapshot_manifests VALUES (?, ?, ?)",
+            [
+                (snapshot_id, dataset, _store_manifest(conn, dataset, records))
+                for dataset, records in datasets.items()
+            ],
+        )
+    return snapshot_id
+
+
+def list_snapshots(conn: sqlite3.Connection) -> list[dict[str, Any]]:
+    """Return every snapshot with its per-dataset record counts, oldest first."""
+    snapshots: dict[int, dict[str, Any]] = {}
+    for sid, created_at, label in conn.execute(
+        "SELECT id, created_at, label FROM snapshots ORDER BY id"
+    ):
+        snapshots[sid] = {"id": sid, "created_at": created_at, "label": label, "counts": {}}
+    for sid, dataset, count in conn.execute(
+        "SELECT sm.snapshot_id, sm.dataset, m.count"
+        " FROM snapshot_manifests sm JOIN manifests m ON m.id = sm.manifest_id"
+    ):
+        snapshots[sid]["counts"][dataset] = count
+    return list(snapshots.values())
+
+
+def resolve_snapshot(conn: sqlite3.Connection, ref: str | int) -> int | None:
+    """Resolve a snapshot id, "latest", or a date/timestamp to a snapshot id.
+
+    A date or timestamp resolves to the last snapshot taken at or before
+    it (a bare date covers the whole day).
+    """
+    text = str(ref).strip()
+    if text == "latest":
+        row = conn.execute("SELECT MAX(id) FROM snapshots").fetchone()
+    elif text.isdigit():
+        row = conn.execute("SELECT id FROM snapshots WHERE id = ?", (int(text),)).fetchone()
+    else:
+        try:
+            when = datetime.fromisoformat(text)
+        except ValueError:
+            return None
+        bound = when.isoformat(timespec="seconds")
+        if len(text) == 10:
+            bound = f"{text}T23:59:59"
+        row = conn.execute(
+            "SELECT id FROM snapshots WHERE created_at <= ?"
+            " ORDER BY created_at DESC, id DESC LIMIT 1",
+            (bound,),
+        ).fetchone()
+    return row[0] if row and row[0] is not None else None
+
+
+def _manifests(conn: sqlite3.Connection, snapshot_id: int) -> dict[str, int]:
+    return dict(conn.execute(
+        "SELECT dataset, manifest_id FROM snapshot_manifests WHERE snapshot_id = ?",
+        (snapshot_id,),
+    ))
+
+
+def get_snapshot(
+    conn: sqlite3.Connection, snapshot_id: int, dataset: str | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return {dataset: records} for a snapshot, records in source order."""
+    result: dict[str, list[dict[str, Any]]] = {}
+    for name, manifest_id in sorted(_manifests(conn, snapshot_id).items()):
+        if dataset is not None and name != dataset:
+            continue
+        result[name] = [
+            json.loads(body) for (body,) in conn.execute(
+                "SELECT r.body FROM manifest_records mr JOIN records r ON r.hash = mr.hash"
+                " WHERE mr.manifest_id = ? ORDER BY mr.position",
+                (manifest_id,),
+            )
+        ]
+    return result
+
+
+def _changed_fields(old_body: str, new_body: str) -> list[str]:
+    old, new = json.loads(old_body), json.loads(new_body)
+    return sorted(k for k in old.keys() | new.keys() if old.get(k) != new.get(k))
+
+
+def diff_snapshots(
+    conn: sqlite3.Connection, old_id: int, new_id: int,
+) -> dict[str, dict[str, Any]]:
+    """Record-level diff between two snapshots.
+
+    Returns {dataset: {"added": [keys], "removed": [keys],
+    "changed": {key: [changed field names]}}} for every dataset present in
+    either snapshot. Datasets sharing a manifest are reported empty without
+    touching their records.
+    """
+    old_manifests = _manifests(conn, old_id)
+    new_manifests = _manifests(conn, new_id)
+    diff: dict[str, dict[str, Any]] = {}
+    for dataset in sorted(old_manifests.keys() | new_manifests.keys()):
+        entry: dict[str, Any] = {"added": [], "removed": [], "changed": {}}
+        diff[dataset] = entry
+        old_m, new_m = old_manifests.get(dataset), new_manifests.get(dataset)
+        if old_m == new_m:
+            continue
+        old_rows = dict(conn.execute(
+            "SELECT record_key, hash FROM manifest_records WHERE manifest_id = ?", (old_m,),
+        ))
+        new_rows = dict(conn.execute(
+            "SELECT record_key, hash FROM manifest_records WHERE manifest_id = ?", (new_m,),
+        ))
+        entry["added"] = sorted(new_rows.keys() - old_rows.keys())
+        entry["removed"] = sorted(old_rows.keys() - new_rows.keys())
+        for key in sorted(old_rows.keys() & new_rows.keys()):
+            if old_rows[key] != new_rows[key]:
+                (old_body,), (new_body,) = (
+                    conn.execute("SELECT body FROM records WHERE hash = ?", (h,)).fetchone()
+                    for h in (old_rows[key], new_rows[key])
+                )
+                entry["changed"][key] = _changed_fields(old_body, new_body)
+    return diff
+
+
+# ---------------------------------------------------------------------------
+# Build Step
+# ---------------------------------------------------------------------------
+
+
+def write_snapshot(
+    store_path: Path, datasets: dict[str, list[dict[str, Any]]], label: str = "",
+) -> bool:
+    """Append a snapshot of datasets to the store at store_path.
+
+    Returns True on success, False on failure.
+    """
+    try:
+        conn = open_store(store_path)
+        try:
+            snapshot_id = record_snapshot(conn, datasets, label)
+            previous = conn.execute(
+                "SELECT MAX(id) FROM snapshots WHERE id < ?", (snapshot_id,),
+            ).fetchone()[0]
+            diff = diff_snapshots(conn, previous, snapshot_id) if previous else None
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError) as e:
+        logger.error("  Error writing %s: %s", store_path.name, e)
+        return False
+
+    if diff is None:
+        logger.info("  Wrote snapshot %d to %s (first snapshot)", snapshot_id, store_path)
+    else:
+        changes = sum(len(d["added"]) + len(d["removed"]) + len(d["changed"]) for d in diff.values())
+        logger.info(
+            "  Wrote snapshot %d to %s (%d record changes since %d)",
+            snapshot_id, store_path, changes, previous,
+        )
+    return True
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def format_diff(diff: dict[str, dict[str, Any]]) -> str:
+    """Format a diff as "+ added", "- removed", "~ changed (fields)" lines."""
+    lines = []
+    for dataset, entry in diff.items():
+        total = len(entry["added"]) + len(entry["removed"]) + len(entry["changed"])
+        lines.append(f"{dataset}: {total} change(s)")
+        lines += [f"  + {key}" for key in entry["added"]]
+        lines += [f"  - {key}" for key in entry["removed"]]
+        lines += [
+            f"  ~ {key} ({', '.join(fields)})" for key, fields in entry["changed"].items()
+        ]
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--store", type=Path, default=DEFAULT_STORE_PATH,
+        help="Snapshot store path (default: data/snapshots.sqlite)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="List snapshots")
+    show = commands.add_parser("show", help="Print a snapshot as JSON")
+    show.add_argument("snapshot", help="Snapshot id, 'latest', or date/timestamp")
+    show.add_argument("--dataset", choices=sorted(KEY_FIELDS), default=None)
+    diff = commands.add_parser("diff", help="Record-level diff between two snapshots")
+    diff.add_argument("old", help="Snapshot id, 'latest', or date/timestamp")
+    diff.add_argument("new", nargs="?", default="latest",
+                      help="Snapshot to compare against (default: latest)")
+    diff.add_argument("--json", action="store_true", help="Print the diff as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the CLI. Returns 0 on success, 1 on failure."""
+    args = parse_args(argv)
+    converter.setup_logging(verbose=False)
+    if not args.store.exists():
+        logger.error("Snapshot store not found: %s", args.store)
+        return 1
+
+    conn = open_store(args.store)
+    try:
+        if args.command == "list":
+            for snap in list_snapshots(conn):
+                counts = ", ".join(f"{k}={v}" for k, v in sorted(snap["counts"].items()))
+                print(f"{snap['id']:>5}  {snap['created_at']}  {counts}  {snap['label']}".rstrip())
+            return 0
+
+        refs = [args.snapshot] if args.command == "show" else [args.old, args.new]
+        ids = [resolve_snapshot(conn, ref) for ref in refs]
+        for ref, snapshot_id in zip(refs, ids):
+            if snapshot_id is None:
+                logger.error("No snapshot matches %r", ref)
+                return 1
+
+        if args.command == "show":
+            print(json.dumps(get_snapshot(conn, ids[0], args.dataset), indent=2, ensure_ascii=False))
+        else:
+            diff = diff_snapshots(conn, ids[0], ids[1])
+            print(json.dumps(diff, indent=2) if args.json else format_diff(diff))
+        return 0
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
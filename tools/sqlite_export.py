@@ -0,0 +1,416 @@
+"""
+SQLite export of all ED reference data.
+
+Writes prescriptions, billing codes, diagnostic codes, anatomy sections,
+on-call tables and locations into a single SQLite database so services
+can query them without loading the browser data blobs. Each searchable
+dataset gets an FTS5 table over the same fields the app searches:
+``build_search_text`` components for prescriptions, and code / name /
+search_terms (the ``search.js`` tiers) for billing and diagnostic codes.
+
+Usage (via build.py):
+    python build.py --sqlite
+    python build.py --sqlite /path/to/reference.sqlite
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+from pathlib import Path
+from typing import Any, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Schema
+# ---------------------------------------------------------------------------
+
+# Prefix indexes let FTS5 answer the short prefix queries that search.js
+# handles with its CODE_PREFIX tier without scanning the term list.
+_FTS_OPTIONS = "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'"
+
+SCHEMA = f"""
+CREATE TABLE meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE meds (
+    id             INTEGER PRIMARY KEY,
+    specialty      TEXT NOT NULL,
+    population     TEXT NOT NULL,
+    subcategory    TEXT NOT NULL,
+    med            TEXT NOT NULL,
+    brands         TEXT NOT NULL,  -- JSON array
+    indication     TEXT NOT NULL,
+    dose_text      TEXT NOT NULL,
+    route          TEXT NOT NULL,
+    frequency      TEXT NOT NULL,
+    duration       TEXT NOT NULL,
+    dispense       TEXT NOT NULL,
+    refill         TEXT NOT NULL,
+    prn            TEXT NOT NULL,
+    form           TEXT NOT NULL,
+    comments       TEXT NOT NULL,
+    weight_based   INTEGER NOT NULL,
+    dose_per_kg_mg REAL,
+    max_dose_mg    REAL,
+    search_text    TEXT NOT NULL
+);
+CREATE INDEX meds_nav ON meds (population, specialty, subcategory);
+CREATE INDEX meds_name ON meds (med COLLATE NOCASE);
+
+-- DINs from the DPD cross-reference (empty without a local extract)
+CREATE TABLE med_dins (
+    med_id INTEGER NOT NULL REFERENCES meds (id),
+    din    TEXT NOT NULL,
+    PRIMARY KEY (med_id, din)
+);
+CREATE INDEX med_dins_din ON med_dins (din);
+
+CREATE VIRTUAL TABLE meds_fts USING fts5 (
+    specialty, population, subcategory, indication, med, brands,
+    dose_text, prn, comments,
+    content = 'meds', content_rowid = 'id', {_FTS_OPTIONS}
+);
+
+CREATE TABLE billing_codes (
+    id                  INTEGER PRIMARY KEY,
+    code                TEXT NOT NULL,
+    name                TEXT NOT NULL,
+    fee                 REAL NOT NULL,
+    group_name          TEXT NOT NULL,
+    modifier_percentage INTEGER,
+    is_ortho_code       INTEGER NOT NULL,
+    sedation_affiliated INTEGER NOT NULL,
+    sedation_base_units INTEGER,
+    has_c_code          INTEGER NOT NULL,
+    notes               TEXT NOT NULL,
+    hidden_notes        TEXT NOT NULL,
+    search_terms        TEXT NOT NULL  -- JSON array
+);
+CREATE INDEX billing_codes_code ON billing_codes (code);
+CREATE INDEX billing_codes_group ON billing_codes (group_name);
+
+-- Billing codes are not unique across rows (e.g. two Z208 casts), so
+-- child tables reference the row id rather than the code string.
+CREATE TABLE billing_subgroups (
+    billing_id INTEGER NOT NULL REFERENCES billing_codes (id),
+    subgroup   TEXT NOT NULL,
+    PRIMARY KEY (billing_id, subgroup)
+);
+CREATE INDEX billing_subgroups_subgroup ON billing_subgroups (subgroup);
+
+-- kind: related_modifiers | commonly_billed_with | conflicts_with
+CREATE TABLE billing_relations (
+    billing_id   INTEGER NOT NULL REFERENCES billing_codes (id),
+    kind         TEXT NOT NULL,
+    related_code TEXT NOT NULL,
+    position     INTEGER NOT NULL,
+    PRIMARY KEY (billing_id, kind, related_code)
+);
+CREATE INDEX billing_relations_reverse ON billing_relations (related_code, kind);
+
+CREATE VIRTUAL TABLE billing_fts USING fts5 (
+    code, name, search_terms,
+    content = '', {_FTS_OPTIONS}
+);
+
+CREATE TABLE diagnostic_codes (
+    id           INTEGER PRIMARY KEY,
+    code         TEXT NOT NULL,
+    name         TEXT NOT NULL,
+    category     TEXT NOT NULL,
+    subcategory  TEXT NOT NULL,
+    search_terms TEXT NOT NULL  -- JSON array
+);
+CREATE INDEX diagnostic_codes_code ON diagnostic_codes (code);
+CREATE INDEX diagnostic_codes_tree ON diagnostic_codes (category, subcategory);
+
+CREATE TABLE diagnostic_suggestions (
+    diagnostic_id INTEGER NOT NULL REFERENCES diagnostic_codes (id),
+    billing_code  TEXT NOT NULL,
+    position      INTEGER NOT NULL,
+    PRIMARY KEY (diagnostic_id, billing_code)
+);
+CREATE INDEX diagnostic_suggestions_reverse ON diagnostic_suggestions (billing_code);
+
+CREATE VIRTUAL TABLE diagnostic_fts USING fts5 (
+    code, name, search_terms,
+    content = '', {_FTS_OPTIONS}
+);
+
+-- kind: divider | header
+CREATE TABLE anatomy_sections (
+    id       INTEGER PRIMARY KEY,
+    subgroup TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    kind     TEXT NOT NULL,
+    label    TEXT NOT NULL,
+    UNIQUE (subgroup, position)
+);
+
+CREATE TABLE anatomy_section_codes (
+    section_id INTEGER NOT NULL REFERENCES anatomy_sections (id),
+    position   INTEGER NOT NULL,
+    code       TEXT NOT NULL,
+    PRIMARY KEY (section_id, position)
+);
+CREATE INDEX anatomy_section_codes_code ON anatomy_section_codes (code);
+
+CREATE TABLE oncall_tables (
+    table_key TEXT PRIMARY KEY,
+    title     TEXT NOT NULL
+);
+
+CREATE TABLE oncall_premiums (
+    table_key TEXT NOT NULL REFERENCES oncall_tables (table_key),
+    scenario  TEXT NOT NULL,
+    role      TEXT NOT NULL,
+    code      TEXT,
+    name      TEXT NOT NULL,
+    fee       REAL,
+    PRIMARY KEY (table_key, scenario, role)
+);
+
+CREATE TABLE locations (
+    id      INTEGER PRIMARY KEY,
+    name    TEXT NOT NULL,
+    address TEXT NOT NULL
+);
+CREATE INDEX locations_name ON locations (name COLLATE NOCASE);
+"""
+
+_MED_COLUMNS: tuple[str, ...] = (
+    "specialty", "population", "subcategory", "med", "brands", "indication",
+    "dose_text", "route", "frequency", "duration", "dispense", "refill",
+    "prn", "form", "comments", "weight_based", "dose_per_kg_mg",
+    "max_dose_mg", "search_text",
+)
+
+_BILLING_RELATION_KINDS: tuple[str, ...] = (
+    "related_modifiers", "commonly_billed_with", "conflicts_with",
+)
+
+
+class ReferenceData(NamedTuple):
+    """All datasets written to the reference database."""
+
+    meds: list[dict[str, Any]]
+    billing_codes: list[dict[str, Any]]
+    diagnostic_codes: list[dict[str, Any]]
+    anatomy_sections: dict[str, list[dict[str, Any]]]
+    oncall_tables: dict[str, Any]
+    locations: list[dict[str, Any]]
+
+
+# ---------------------------------------------------------------------------
+# Table Writers
+# ---------------------------------------------------------------------------
+
+
+def _insert_meds(conn: sqlite3.Connection, meds: list[dict[str, Any]]) -> None:
+    """Insert medication rows and their FTS entries."""
+    placeholders = ", ".join("?" for _ in _MED_COLUMNS)
+    rows = []
+    for med_id, med in enumerate(meds, start=1):
+        values: list[Any] = [med_id]
+        for col in _MED_COLUMNS:
+            value = med.get(col)
+            if col == "brands":
+                value = json.dumps(value or [])
+            elif col == "weight_based":
+                value = int(bool(value))
+            elif value is None and col not in ("dose_per_kg_mg", "max_dose_mg"):
+                value = ""
+            values.append(value)
+        rows.append(values)
+    conn.executemany(
+        f"INSERT INTO meds (id, {', '.join(_MED_COLUMNS)}) VALUES (?, {placeholders})",
+        rows,
+    )
+    conn.executemany(
+        "INSERT INTO med_dins VALUES (?, ?)",
+        [(med_id, din) for med_id, med in enumerate(meds, start=1) for din in med.get("dins", ())],
+    )
+    # External-content FTS: index every meds row in one pass. Brands are
+    # stored as a JSON array; the tokenizer splits on its punctuation.
+    conn.execute("INSERT INTO meds_fts (meds_fts) VALUES ('rebuild')")
+
+
+def _insert_billing(conn: sqlite3.Connection, codes: list[dict[str, Any]]) -> None:
+    """Insert billing codes, subgroups, code relations and FTS entries."""
+    for code_id, c in enumerate(codes, start=1):
+        code = c["code"]
+        conn.execute(
+            "INSERT INTO billing_codes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                code_id, code, c.get("name", ""), c.get("fee", 0.0),
+                c.get("group", ""), c.get("modifier_percentage"),
+                int(bool(c.get("is_ortho_code"))),
+                int(bool(c.get("sedation_affiliated"))),
+                c.get("sedation_base_units"),
+                int(bool(c.get("has_c_code"))),
+                c.get("notes", ""), c.get("hidden_notes", ""),
+                json.dumps(c.get("search_terms", [])),
+            ),
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO billing_subgroups VALUES (?, ?)",
+            [(code_id, sub) for sub in c.get("subgroups", [])],
+        )
+        for kind in _BILLING_RELATION_KINDS:
+            conn.executemany(
+                "INSERT OR IGNORE INTO billing_relations VALUES (?, ?, ?, ?)",
+                [(code_id, kind, rel, pos) for pos, rel in enumerate(c.get(kind, []))],
+            )
+        conn.execute(
+            "INSERT INTO billing_fts (rowid, code, name, search_terms) VALUES (?, ?, ?, ?)",
+            (code_id, code, c.get("name", ""), " ; ".join(c.get("search_terms", []))),
+        )
+
+
+def _insert_diagnostic(conn: sqlite3.Connection, codes: list[dict[str, Any]]) -> None:
+    """Insert diagnostic codes, suggested billing codes and FTS entries."""
+    for code_id, c in enumerate(codes, start=1):
+        code = c["code"]
+        subcategory = c.get("subcategory", "")
+        conn.execute(
+            "INSERT INTO diagnostic_codes VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                code_id, code, c.get("name", ""), c.get("category", ""),
+                subcategory, json.dumps(c.get("search_terms", [])),
+            ),
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO diagnostic_suggestions VALUES (?, ?, ?)",
+            [
+                (code_id, billing, pos)
+                for pos, billing in enumerate(c.get("suggested_billing_codes", []))
+            ],
+        )
+        # search.js matches diagnostic names with the subcategory prefixed.
+        full_name = f"{subcategory} {c.get('name', '')}".strip()
+        conn.execute(
+            "INSERT INTO diagnostic_fts (rowid, code, name, search_terms) VALUES (?, ?, ?, ?)",
+            (code_id, code, full_name, " ; ".join(c.get("search_terms", []))),
+        )
+
+
+def _insert_anatomy(
+    conn: sqlite3.Connection, sections: dict[str, list[dict[str, Any]]],
+) -> None:
+    """Insert anatomy section headers/dividers and their ordered codes."""
+    for subgroup, items in sections.items():
+        for position, item in enumerate(items):
+            if "divider" in item:
+                kind, label = "divider", item["divider"]
+            else:
+                kind, label = "header", item.get("header", "")
+            cur = conn.execute(
+                "INSERT INTO anatomy_sections (subgroup, position, kind, label)"
+                " VALUES (?, ?, ?, ?)",
+                (subgroup, position, kind, label),
+            )
+            conn.executemany(
+                "INSERT INTO anatomy_section_codes VALUES (?, ?, ?)",
+                [(cur.lastrowid, pos, code) for pos, code in enumerate(item.get("codes", []))],
+            )
+
+
+def _insert_oncall(conn: sqlite3.Connection, tables: dict[str, Any]) -> None:
+    """Flatten on-call table -> scenario -> role objects into rows."""
+    for table_key, table in tables.items():
+        # Tables may be a bare title string until their scenarios are filled in.
+        if isinstance(table, str):
+            conn.execute("INSERT INTO oncall_tables VALUES (?, ?)", (table_key, table))
+            continue
+        conn.execute(
+            "INSERT INTO oncall_tables VALUES (?, ?)",
+            (table_key, table.get("title", table_key)),
+        )
+        for scenario, roles in table.get("scenarios", {}).items():
+            conn.executemany(
+                "INSERT INTO oncall_premiums VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (table_key, scenario, role, p.get("code"), p.get("name", ""), p.get("fee"))
+                    for role, p in roles.items()
+                ],
+            )
+
+
+def _insert_locations(conn: sqlite3.Connection, locations: list[dict[str, Any]]) -> None:
+    """Insert hospital locations."""
+    conn.executemany(
+        "INSERT INTO locations (name, address) VALUES (?, ?)",
+        [(loc.get("name", ""), loc.get("address", "")) for loc in locations],
+    )
+
+
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+
+
+def populate(conn: sqlite3.Connection, data: ReferenceData) -> None:
+    """Create the schema and load every dataset into an open connection."""
+    conn.executescript(SCHEMA)
+    with conn:
+        _insert_meds(conn, data.meds)
+        _insert_billing(conn, data.billing_codes)
+        _insert_diagnostic(conn, data.diagnostic_codes)
+        _insert_anatomy(conn, data.anatomy_sections)
+        _insert_oncall(conn, data.oncall_tables)
+        _insert_locations(conn, data.locations)
+        conn.executemany(
+            "INSERT INTO meta VALUES (?, ?)",
+            [
+                ("meds_count", str(len(data.meds))),
+                ("billing_codes_count", str(len(data.billing_codes))),
+                ("diagnostic_codes_count", str(len(data.diagnostic_codes))),
+                ("locations_count", str(len(data.locations))),
+            ],
+        )
+    for fts in ("meds_fts", "billing_fts", "diagnostic_fts"):
+        conn.execute(f"INSERT INTO {fts} ({fts}) VALUES ('optimize')")
+    conn.execute("ANALYZE")
+    conn.commit()
+
+
+def export_sqlite(db_path: Path, data: ReferenceData) -> bool:
+    """Write all reference data to a fresh SQLite database, atomically.
+
+    The database is built in a temp file next to ``db_path`` and renamed
+    into place, so readers never see a half-written file.
+    Returns True on success, False on failure.
+    """
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(suffix=".sqlite", dir=db_path.parent)
+    tmp_path = Path(tmp_name)
+    try:
+        with open(fd, "wb"):
+            pass
+        conn = sqlite3.connect(tmp_path)
+        try:
+            populate(conn, data)
+        finally:
+            conn.close()
+        # mkstemp creates 0600 files; the database is meant to be shared.
+        os.chmod(tmp_path, 0o644)
+        tmp_path.replace(db_path)
+    except Exception as e:
+        logger.error("  Error writing %s: %s", db_path.name, e)
+        if tmp_path.exists():
+            tmp_path.unlink()
+        return False
+
+    logger.info(
+        "  Wrote %s (%d meds, %d billing, %d diagnostic, %d locations)",
+        db_path, len(data.meds), len(data.billing_codes),
+        len(data.diagnostic_codes), len(data.locations),
+    )
+    return True
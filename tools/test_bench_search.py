@@ -0,0 +1,104 @@
+#!/opt/homebrew/bin/python3
+"""
+Unit tests for the search benchmark's corpus, scaling and metrics.
+
+Run with: pytest test_bench_search.py -v
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import bench_search
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestScaleRecords:
+    """Tests for scale_records."""
+
+    RECORDS = [
+        {"code": "F027", "name": "Distal Radius Fracture"},
+        {"code": "G211", "name": "Intubation"},
+    ]
+
+    def test_originals_first_then_clones(self) -> None:
+        """Test the real records keep their positions and ids."""
+        scaled = bench_search.scale_records(self.RECORDS, 3, "code", "name")
+        assert len(scaled) == 6
+        assert scaled[:2] == self.RECORDS
+        assert [r["code"] for r in scaled[2:]] == ["F027~1", "G211~1", "F027~2", "G211~2"]
+
+    def test_clones_swap_one_word(self) -> None:
+        """Test clone names differ from the original by at most one word."""
+        scaled = bench_search.scale_records(self.RECORDS, 5, "code", "name", seed=4)
+        for clone in scaled[2:]:
+            original = self.RECORDS[scaled.index(clone) % 2]["name"].split(" ")
+            changed = sum(a != b for a, b in zip(original, clone["name"].split(" ")))
+            assert changed <= 1
+
+    def test_is_deterministic(self) -> None:
+        """Test the same seed gives the same dataset."""
+        first = bench_search.scale_records(self.RECORDS, 4, "code", "name", seed=9)
+        assert bench_search.scale_records(self.RECORDS, 4, "code", "name", seed=9) == first
+
+
+class TestMetrics:
+    """Tests for percentile and recall_at_k."""
+
+    def test_percentile_interpolates(self) -> None:
+        """Test percentiles interpolate between ordered samples."""
+        samples = [4.0, 1.0, 3.0, 2.0]
+        assert bench_search.percentile(samples, 50) == 2.5
+        assert bench_search.percentile(samples, 100) == 4.0
+        assert bench_search.percentile([], 95) == 0.0
+
+    def test_recall_cuts_each_list_separately(self) -> None:
+        """Test billing and diagnostic columns each get their own top k."""
+        ranked = ["billing:A", "billing:B", "billing:C", "diagnostic:1"]
+        assert bench_search.recall_at_k(ranked, ["billing:B", "diagnostic:1"], 2) == 1.0
+        assert bench_search.recall_at_k(ranked, ["billing:C", "diagnostic:1"], 2) == 0.5
+
+    def test_recall_for_unprefixed_labels(self) -> None:
+        """Test prescription labels (medication names) rank as one list."""
+        assert bench_search.recall_at_k(["Amoxicillin", "Cephalexin"], ["Cephalexin"], 1) == 0.0
+
+
+class TestLoadCorpus:
+    """Tests for load_corpus."""
+
+    def test_parses_jsonl_with_comments(self, tmp_path: Path) -> None:
+        """Test blank and comment lines are skipped and labels default to []."""
+        corpus = tmp_path / "queries.jsonl"
+        corpus.write_text(
+            '# replayed log\n\n{"engine": "billing", "query": "colles"}\n',
+            encoding="utf-8",
+        )
+        assert bench_search.load_corpus(corpus) == [
+            {"engine": "billing", "query": "colles", "expected": []},
+        ]
+
+    def test_rejects_unknown_engine(self, tmp_path: Path) -> None:
+        """Test a corpus line for an unknown engine is an error."""
+        corpus = tmp_path / "queries.jsonl"
+        corpus.write_text('{"engine": "dx", "query": "x"}\n', encoding="utf-8")
+        with pytest.raises(ValueError):
+            bench_search.load_corpus(corpus)
+
+    def test_bundled_corpus_is_valid(self) -> None:
+        """Test the shipped seed corpus parses and every query is labelled."""
+        queries = bench_search.load_corpus(bench_search.DEFAULT_CORPUS)
+        assert queries and all(q["expected"] for q in queries)
+
+
+# ---------------------------------------------------------------------------
+# Run Tests
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
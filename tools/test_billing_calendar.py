@@ -0,0 +1,192 @@
+#!/opt/homebrew/bin/python3
+"""
+Unit tests for the billing holiday/time-period calendar.
+
+Run with: pytest test_billing_calendar.py -v
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import billing_calendar
+
+
+# ---------------------------------------------------------------------------
+# Test Helpers
+# ---------------------------------------------------------------------------
+
+TIME_HIGHLIGHT_JS = Path(__file__).parent.parent / "js" / "billing" / "time-highlight.js"
+
+# Evaluates time-highlight.js with a window stub and prints, for each
+# "YYYY-MM-DDTHH:MM" moment on stdin, the assessment period and on-call
+# scenario computed by the rules and then by the loaded calendar.
+_NODE_PROBE = r"""
+const fs = require("fs");
+const vm = require("vm");
+const [script, calendarPath] = process.argv.slice(1);
+const context = { window: {}, setInterval: () => 0, console };
+context.App = context.window.App = {};
+vm.createContext(context);
+vm.runInContext(fs.readFileSync(script, "utf8"), context);
+const App = context.App;
+const moments = fs.readFileSync(0, "utf8").trim().split("\n");
+function probe() {
+  return moments.map((m) => {
+    const [d, t] = m.split("T");
+    const [y, mo, day] = d.split("-").map(Number);
+    const [h, mi] = t.split(":").map(Number);
+    const when = new Date(y, mo - 1, day, h, mi);
+    App.detectTimePeriod(when);
+    return [App.timePeriod.id, App.detectOnCallScenario(when)];
+  });
+}
+const rules = probe();
+App.setBillingCalendar(JSON.parse(fs.readFileSync(calendarPath, "utf8")));
+process.stdout.write(JSON.stringify({ rules, calendar: probe() }));
+"""
+
+
+@pytest.fixture(scope="module")
+def calendar() -> dict[str, Any]:
+    """Calendar artifact for 2024-2027."""
+    return billing_calendar.build_calendar(2024, 2027)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestHolidays:
+    """Tests for holidays."""
+
+    def test_moveable_holidays(self) -> None:
+        """Test Easter- and weekday-based holidays land on the right dates."""
+        names = {name: day for day, name in billing_calendar.holidays(2025).items()}
+        assert names["Family Day"] == date(2025, 2, 17)
+        assert names["Good Friday"] == date(2025, 4, 18)
+        assert names["Victoria Day"] == date(2025, 5, 19)
+        assert names["Civic Holiday"] == date(2025, 8, 4)
+        assert names["Labour Day"] == date(2025, 9, 1)
+        assert names["Thanksgiving"] == date(2025, 10, 13)
+
+    def test_victoria_day_on_may_24(self) -> None:
+        """Test a Monday May 24 is itself Victoria Day."""
+        assert billing_calendar.holidays(2027)[date(2027, 5, 24)] == "Victoria Day"
+
+    def test_weekend_canada_day_adds_friday_and_monday(self) -> None:
+        """Test Canada Day on a Saturday adds Jun 30 and Jul 3."""
+        days = billing_calendar.holidays(2028)
+        assert date(2028, 6, 30) in days
+        assert date(2028, 7, 3) in days
+
+    def test_weekend_christmas_and_new_year(self) -> None:
+        """Test a Saturday Christmas adds Dec 24 and a Saturday New Year adds Jan 3."""
+        days = billing_calendar.holidays(2021)
+        assert date(2021, 12, 24) in days
+        assert all(date(2021, 12, d) in days for d in range(25, 32))
+        assert date(2022, 1, 3) in billing_calendar.holidays(2022)
+
+
+class TestPeriodAt:
+    """Tests for build_calendar and period_at."""
+
+    def test_assessment_boundaries(self, calendar: dict[str, Any]) -> None:
+        """Test the 08:00 and 17:00 boundaries on a plain weekday."""
+        day = datetime(2025, 3, 12)
+        assert billing_calendar.period_at(calendar, "assessment", day.replace(hour=7, minute=59)) == "night"
+        assert billing_calendar.period_at(calendar, "assessment", day.replace(hour=8)) == "weekday_day"
+        assert billing_calendar.period_at(calendar, "assessment", day.replace(hour=16, minute=59)) == "weekday_day"
+        assert billing_calendar.period_at(calendar, "assessment", day.replace(hour=17)) == "weekday_evening"
+        assert billing_calendar.period_at(calendar, "assessment", day.replace(hour=23, minute=59)) == "weekday_evening"
+
+    def test_oncall_holiday_starts_at_seven(self, calendar: dict[str, Any]) -> None:
+        """Test on-call night ends at 07:00 and holidays use weekend rates."""
+        good_friday = datetime(2025, 4, 18)
+        assert billing_calendar.period_at(calendar, "oncall", good_friday.replace(hour=6, minute=59)) == "night"
+        assert billing_calendar.period_at(calendar, "oncall", good_friday.replace(hour=7)) == "weekend_holiday"
+        assert billing_calendar.period_at(calendar, "oncall", good_friday.replace(hour=18)) == "weekend_holiday"
+
+    def test_outside_coverage(self, calendar: dict[str, Any]) -> None:
+        """Test moments outside the covered years return None."""
+        assert billing_calendar.period_at(calendar, "assessment", datetime(2023, 12, 31, 12)) is None
+        assert billing_calendar.period_at(calendar, "assessment", datetime(2028, 1, 1)) is None
+        assert billing_calendar.period_at(calendar, "assessment", datetime(2027, 12, 31, 23, 59)) == "weekend_holiday"
+
+    def test_dst_change_does_not_shift_boundaries(self, calendar: dict[str, Any]) -> None:
+        """Test wall-clock boundaries hold on the spring-forward weekday after."""
+        monday = datetime(2025, 3, 10)
+        assert billing_calendar.period_at(calendar, "assessment", monday.replace(hour=8)) == "weekday_day"
+        assert billing_calendar.period_at(calendar, "assessment", monday.replace(hour=7, minute=59)) == "night"
+
+    def test_adjacent_intervals_are_merged(self, calendar: dict[str, Any]) -> None:
+        """Test no two consecutive intervals carry the same period."""
+        for scheme in calendar["schemes"].values():
+            ids = scheme["period_ids"]
+            assert all(a != b for a, b in zip(ids, ids[1:]))
+            assert all(d > 0 for d in scheme["deltas"][1:])
+
+
+class TestJsParity:
+    """Tests that time-highlight.js agrees with the Python calendar."""
+
+    @pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+    def test_rules_and_calendar_lookup_match(
+        self, tmp_path: Path, calendar: dict[str, Any],
+    ) -> None:
+        """Test JS rules, JS binary search and Python agree around each boundary."""
+        calendar_path = tmp_path / "billing_calendar.json"
+        calendar_path.write_text(json.dumps(calendar))
+
+        moments = []
+        day = datetime(2024, 1, 1)
+        while day.year <= 2027:
+            for hour, minute in ((0, 0), (6, 59), (7, 0), (7, 59), (8, 0), (16, 59), (17, 0), (23, 59)):
+                moments.append(day.replace(hour=hour, minute=minute))
+            day += timedelta(days=1)
+
+        result = subprocess.run(
+            ["node", "-e", _NODE_PROBE, str(TIME_HIGHLIGHT_JS), str(calendar_path)],
+            input="\n".join(m.strftime("%Y-%m-%dT%H:%M") for m in moments),
+            capture_output=True, text=True, check=True,
+        )
+        output = json.loads(result.stdout)
+
+        expected = [
+            [
+                billing_calendar.period_at(calendar, "assessment", m),
+                billing_calendar.period_at(calendar, "oncall", m),
+            ]
+            for m in moments
+        ]
+        assert output["rules"] == expected
+        assert output["calendar"] == expected
+
+
+class TestWriteCalendar:
+    """Tests for write_calendar."""
+
+    def test_writes_holidays_and_schemes(self, tmp_path: Path) -> None:
+        """Test the artifact lists holidays and both period schemes."""
+        output = tmp_path / "billing_calendar.json"
+        assert billing_calendar.write_calendar(output, 2025, 2025) is True
+        artifact = json.loads(output.read_text())
+        assert artifact["first_year"] == artifact["last_year"] == 2025
+        assert artifact["holidays"]["2025-07-01"] == "Canada Day"
+        assert set(artifact["schemes"]) == {"assessment", "oncall"}
+
+
+# ---------------------------------------------------------------------------
+# Run Tests
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
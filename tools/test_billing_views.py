@@ -0,0 +1,118 @@
+#!/opt/homebrew/bin/python3
+"""
+Unit tests for the pre-joined billing views.
+
+Run with: pytest test_billing_views.py -v
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import billing_views
+
+
+# ---------------------------------------------------------------------------
+# Test Helpers
+# ---------------------------------------------------------------------------
+
+BILLING_CODES: list[dict[str, Any]] = [
+    {"code": "A001", "name": "Assessment", "fee": 10.0},
+    {"code": "F047", "name": "Humerus – Tuberosity – Closed", "fee": 50.0},
+    {"code": "F048", "name": "Humerus – Tuberosity – Reduction", "fee": 90.0},
+    {"code": "F048", "name": "Humerus – Tuberosity – Reduction (repeat)", "fee": 70.0},
+    {"code": "K990", "name": "Travel Premium", "fee": 36.0},
+]
+
+ANATOMY: dict[str, list[dict[str, Any]]] = {
+    "Thorax, Shoulder, Arm": [
+        {"divider": "Fractures"},
+        {"header": "Tuberosity", "codes": ["F047", "F048", "F999"]},
+    ],
+}
+
+ONCALL: dict[str, Any] = {
+    "table1": {
+        "title": "Called In",
+        "scenarios": {
+            "night": {
+                "travel": {"code": "K990", "name": "", "fee": None},
+                "patient1": {"code": None, "name": "First Patient Premium", "fee": None},
+                "patient2plus": {"code": "K999", "name": "Subsequent", "fee": 20.0},
+            },
+        },
+    },
+    "table2": {"title": "Out-patient", "scenarios": {}},
+}
+
+
+@pytest.fixture
+def views() -> tuple[dict[str, Any], list[str]]:
+    """Views built from the sample data."""
+    return billing_views.build_views(BILLING_CODES, ANATOMY, ONCALL)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestBuildViews:
+    """Tests for build_views."""
+
+    def test_anatomy_rows_are_indexed_and_inlined(
+        self, views: tuple[dict[str, Any], list[str]],
+    ) -> None:
+        """Test sections carry billing indices, names and fees; dividers pass through."""
+        anatomy = views[0]["anatomy"]["Thorax, Shoulder, Arm"]
+        assert anatomy[0] == {"divider": "Fractures"}
+        assert anatomy[1]["header"] == "Tuberosity"
+        assert [(r["i"], r["code"], r["fee"]) for r in anatomy[1]["rows"]] == [
+            (1, "F047", 50.0), (3, "F048", 70.0),
+        ]
+
+    def test_duplicate_codes_resolve_to_last_entry(self) -> None:
+        """Test duplicate codes resolve like the client's code maps."""
+        assert billing_views.index_codes(BILLING_CODES)["F048"] == 3
+
+    def test_oncall_rows_fill_from_billing(
+        self, views: tuple[dict[str, Any], list[str]],
+    ) -> None:
+        """Test known codes fill blank names and fees; placeholders stay as-is."""
+        rows = views[0]["oncall"]["table1"]["scenarios"]["night"]
+        assert [r["role"] for r in rows] == ["travel", "patient1", "patient2plus"]
+        assert rows[0] == {"role": "travel", "i": 4, "code": "K990", "name": "Travel Premium", "fee": 36.0}
+        assert rows[1]["i"] is None and rows[1]["name"] == "First Patient Premium"
+        assert rows[2]["i"] is None and rows[2]["fee"] == 20.0
+        assert views[0]["oncall"]["table2"] == {"title": "Out-patient", "scenarios": {}}
+
+    def test_reports_missing_codes(self, views: tuple[dict[str, Any], list[str]]) -> None:
+        """Test unknown anatomy and on-call codes are reported with their location."""
+        assert views[1] == [
+            "Thorax, Shoulder, Arm / Tuberosity: F999",
+            "table1 / night / patient2plus: K999",
+        ]
+
+
+class TestWriteBillingViews:
+    """Tests for write_billing_views."""
+
+    def test_writes_views(self, tmp_path: Path) -> None:
+        """Test the artifact records the billing count it was joined against."""
+        output = tmp_path / "billing_views.json"
+        assert billing_views.write_billing_views(output, BILLING_CODES, ANATOMY, ONCALL) is True
+        artifact = json.loads(output.read_text())
+        assert artifact["billing_count"] == len(BILLING_CODES)
+        assert set(artifact) == {"version", "billing_count", "anatomy", "oncall"}
+
+
+# ---------------------------------------------------------------------------
+# Run Tests
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
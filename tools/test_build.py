@@ -0,0 +1,437 @@
+#!/opt/homebrew/bin/python3
+"""
+Unit tests for the build script's data-file generation.
+
+Run with: pytest test_build.py -v
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+import bench_search
+import build
+import build_cache
+
+
+# ---------------------------------------------------------------------------
+# Test Helpers
+# ---------------------------------------------------------------------------
+
+
+def _med(
+    specialty: str, population: str, subcategory: str = "", name: str = "Med",
+) -> dict[str, Any]:
+    """Create a minimal converted medication record."""
+    return {
+        "specialty": specialty, "population": population,
+        "subcategory": subcategory, "med": name,
+    }
+
+
+@pytest.fixture
+def converted() -> dict[str, Any]:
+    """Converter output spanning two specialties and a Non-Med row."""
+    meds = [
+        _med("ENT", "Adult", "Ear", "Ciprodex"),
+        _med("Allergy", "Pediatric", name="Cetirizine"),
+        _med("ENT", "Adult", "Nose", "Mometasone"),
+        _med("ENT", "Pediatric", "Ear", "Ciprodex"),
+        _med("Non-Med", "", name="Crutches"),
+        _med("Cardiac & Heme", " Adult ", name="ASA"),
+    ]
+    return {"source": {"file": "Prescriptions.xlsx", "record_count": len(meds)}, "meds": meds}
+
+
+# ---------------------------------------------------------------------------
+# JS File Generation
+# ---------------------------------------------------------------------------
+
+
+class TestRenderJsData:
+    """Tests for render_js_data."""
+
+    AWKWARD = {"quote": "Doctor's note", "slash": "C:\\path\\n", "sep": "a\u2028b",
+               "unicode": "café"}
+
+    @pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+    @pytest.mark.parametrize("data_format", build.DATA_FORMATS)
+    def test_round_trips_through_js(self, data_format: str) -> None:
+        """Test the generated JS evaluates back to the original data."""
+        content = build.render_js_data("DATA", self.AWKWARD, data_format)
+        proc = subprocess.run(
+            ["node", "-e", content + "process.stdout.write(JSON.stringify(DATA));"],
+            capture_output=True, text=True, check=True,
+        )
+        assert json.loads(proc.stdout) == self.AWKWARD
+
+    def test_literal_is_not_base64(self) -> None:
+        """Test the default format embeds readable JSON text."""
+        content = build.render_js_data("DATA", {"med": "Ibuprofen"})
+        assert "JSON.parse('{\"med\":\"Ibuprofen\"}')" in content
+        assert "atob" not in content
+
+    def test_unknown_format_raises(self) -> None:
+        """Test an unsupported format is rejected."""
+        with pytest.raises(ValueError):
+            build.render_js_data("DATA", {}, "yaml")
+
+
+class TestBuildJsonFile:
+    """Tests for build_json_file."""
+
+    def test_extra_keys_are_added(self, tmp_path: Path) -> None:
+        """Test extra keys (e.g. the location index URL) join the source object."""
+        source = tmp_path / "Locations.json"
+        source.write_text(json.dumps({"locations": [{"name": "MGH", "address": "Coxwell"}]}))
+        entry = build.DataFileEntry(source, tmp_path / "location-data.js", "LOCATION_DATA")
+
+        assert build.build_json_file(entry, extra={"index_url": None}) is True
+        expected = build.render_js_data(
+            "LOCATION_DATA", {"locations": [{"name": "MGH", "address": "Coxwell"}], "index_url": None},
+        )
+        assert entry.output.read_text(encoding="utf-8") == expected
+
+
+class TestLoadSources:
+    """Tests for _load_sources."""
+
+    def test_loads_in_order(self, tmp_path: Path) -> None:
+        """Test every source is loaded, in the order given."""
+        (tmp_path / "a.json").write_text('{"a": 1}')
+        (tmp_path / "b.json").write_text("[2]")
+        assert build._load_sources("out.bin", tmp_path / "a.json", tmp_path / "b.json") == [{"a": 1}, [2]]
+
+    def test_missing_or_invalid_source(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test a missing or invalid source is logged and returns None."""
+        (tmp_path / "bad.json").write_text("{")
+        assert build._load_sources("out.bin", tmp_path / "missing.json") is None
+        assert build._load_sources("out.bin", tmp_path / "bad.json") is None
+        assert "Source file not found" in caplog.text
+        assert "Invalid JSON source for out.bin" in caplog.text
+
+
+# ---------------------------------------------------------------------------
+# Prescription Catalog & Chunks
+# ---------------------------------------------------------------------------
+
+
+class TestSplitPrescriptions:
+    """Tests for split_prescriptions."""
+
+    def test_chunks_reassemble_in_order(self, converted: dict[str, Any]) -> None:
+        """Test concatenating chunks in catalog order restores the meds list."""
+        catalog, chunks = build.split_prescriptions(converted)
+        by_url = {f"js/prescriptions/chunks/{name}": json.loads(payload)
+                  for name, payload in chunks.items()}
+        # Chunks group by specialty, so compare per-specialty order.
+        for entry in catalog["chunks"]:
+            chunk = by_url[entry["url"]]
+            assert chunk["specialty"] == entry["specialty"]
+            assert len(chunk["meds"]) == entry["count"]
+            expected = [m for m in converted["meds"] if m["specialty"] == entry["specialty"]]
+            assert chunk["meds"] == expected
+
+    def test_chunks_omit_client_unused_fields(self, converted: dict[str, Any]) -> None:
+        """Test search_text stays in converter output but is not shipped."""
+        for med in converted["meds"]:
+            med["search_text"] = f"{med['specialty']} | {med['med']}".lower()
+        _, chunks = build.split_prescriptions(converted)
+        for payload in chunks.values():
+            assert all("search_text" not in med for med in json.loads(payload)["meds"])
+        assert all("search_text" in med for med in converted["meds"])
+
+    def test_chunk_file_names_are_slugs(self, converted: dict[str, Any]) -> None:
+        """Test specialty names become URL-safe file names."""
+        _, chunks = build.split_prescriptions(converted)
+        assert sorted(chunks) == [
+            "allergy.json", "cardiac-heme.json", "ent.json", "non-med.json",
+        ]
+
+    def test_counts_match_navigation_semantics(self, converted: dict[str, Any]) -> None:
+        """Test counts trim populations and group the rest as Non-Med."""
+        catalog, _ = build.split_prescriptions(converted)
+        counts = catalog["counts"]
+
+        assert counts["Adult"]["total"] == 3
+        assert counts["Adult"]["specialties"]["ENT"] == {
+            "total": 2, "subcategories": {"Ear": 1, "Nose": 1},
+        }
+        assert counts["Adult"]["specialties"]["Cardiac & Heme"]["total"] == 1
+        assert counts["Pediatric"]["total"] == 2
+        assert counts["Non-Med"]["total"] == 1
+
+    def test_slug_collisions_get_suffix(self) -> None:
+        """Test distinct specialties that slugify alike get unique names."""
+        taken: set[str] = set()
+        assert build._chunk_slug("GI", taken) == "gi"
+        assert build._chunk_slug("G.I.", taken) == "g-i"
+        assert build._chunk_slug("gi", taken) == "gi-2"
+
+
+
+class TestBuildPrescriptions:
+    """Tests for build_prescriptions' change report."""
+
+    def test_reports_changes_against_previous_chunks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, converted: dict[str, Any],
+    ) -> None:
+        """Test the report diffs the new meds against the chunks being replaced."""
+        chunk_dir = tmp_path / "chunks"
+        chunk_dir.mkdir()
+        monkeypatch.setattr(build, "PROJECT_ROOT", tmp_path)
+        monkeypatch.setattr(build, "CHUNK_DIR", chunk_dir)
+        monkeypatch.setattr(build, "SITES_DIR", tmp_path / "sites")
+        monkeypatch.setattr(build, "SITE_OVERLAY_DIR", tmp_path / "site-overlays")
+        entry = build.DataFileEntry(
+            tmp_path / "Prescriptions.xlsx", tmp_path / "catalog.js", "PRESCRIPTION_CATALOG",
+        )
+        _, previous = build.split_prescriptions(converted)
+        assert build.write_chunks(chunk_dir, previous)
+
+        converted["meds"][0]["dose_text"] = "4 drops"
+        converted["meds"].pop()
+        for med in converted["meds"]:
+            med["search_text"] = med["med"].lower()
+        monkeypatch.setattr(build.converter, "convert_excel", lambda _: converted)
+        assert build.build_prescriptions(entry) is converted
+
+        report = json.loads((tmp_path / "Prescriptions.changes.json").read_text())
+        assert report["removed"] == ["Cardiac & Heme /  Adult  /  / ASA / "]
+        assert report["added"] == []
+        assert report["modified"] == [{
+            "key": "ENT / Adult / Ear / Ciprodex / ",
+            "fields": {"dose_text": {"old": None, "new": "4 drops"}},
+        }]
+
+    def test_first_build_reports_all_added(self, tmp_path: Path) -> None:
+        """Test missing or unreadable chunks give no previous meds."""
+        assert build.load_chunk_meds(tmp_path / "missing") is None
+        (tmp_path / "ent.json").write_text("{", encoding="utf-8")
+        assert build.load_chunk_meds(tmp_path) is None
+
+
+CORE_JS = Path(__file__).parent.parent / "js" / "prescriptions" / "01-core.js"
+
+# Runs DataLoader.loadMedications from js/prescriptions/01-core.js over the
+# catalog on stdin; "failures" maps a chunk URL to how many fetches fail.
+_LOADER_PROBE = r"""
+const fs = require("fs");
+const vm = require("vm");
+const { catalog, chunks, failures } = JSON.parse(fs.readFileSync(0, "utf8"));
+const fetches = {};
+const context = vm.createContext({
+  console: { error() {}, warn() {}, log() {} }, setTimeout, clearTimeout, window: {}, navigator: {},
+  document: { addEventListener() {}, getElementById() { return null; } },
+  localStorage: { getItem() { return null; }, setItem() {} },
+  PRESCRIPTION_CATALOG: catalog,
+  fetch: async (url) => {
+    const path = url.split("?")[0];
+    fetches[path] = (fetches[path] || 0) + 1;
+    if (fetches[path] <= (failures[path] || 0)) return { ok: false, status: 404 };
+    return { ok: true, json: async () => ({ meds: chunks[path] }) };
+  },
+});
+vm.runInContext(fs.readFileSync(process.argv[1], "utf8") + "\nthis.DataLoader = DataLoader;", context);
+const loader = new context.DataLoader();
+loader.loadMedications().then((meds) => process.stdout.write(JSON.stringify({
+  meds: meds.map((m) => m.med), failed: loader.failedSpecialties, fetches,
+})));
+"""
+
+
+class TestLoadMedications:
+    """Tests for DataLoader.loadMedications in js/prescriptions/01-core.js."""
+
+    @pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+    def test_failed_chunks_are_retried_once_and_skipped(self) -> None:
+        """Test one bad chunk no longer empties the formulary."""
+        specialties = ["Allergy", "ENT", "Psych"]
+        catalog = {
+            "counts": {}, "sites": [],
+            "chunks": [{"specialty": s, "url": f"{s}.json", "revision": "1"} for s in specialties],
+        }
+        chunks = {f"{s}.json": [{"med": f"{s} med"}] for s in specialties}
+        failures = {"ENT.json": 1, "Psych.json": 5}
+        result = subprocess.run(
+            ["node", "-e", _LOADER_PROBE, str(CORE_JS)],
+            input=json.dumps({"catalog": catalog, "chunks": chunks, "failures": failures}),
+            capture_output=True, text=True, check=True,
+        )
+        output = json.loads(result.stdout)
+        assert output["meds"] == ["Allergy med", "ENT med"]
+        assert output["failed"] == ["Psych"]
+        assert output["fetches"] == {"Allergy.json": 1, "ENT.json": 2, "Psych.json": 2}
+
+
+SEARCH_WORKER_JS = CORE_JS.with_name("search-worker.js")
+
+# Loads 01-core.js and search-worker.js as the worker does. Runs each query
+# on stdin through SearchManager and through PrescriptionSearchWorker, then
+# a burst of queries, then SearchWorkerClient over an in-process worker that
+# fails while a query is outstanding.
+_SEARCH_WORKER_PROBE = r"""
+const fs = require("fs");
+const vm = require("vm");
+const [coreScript, workerScript] = process.argv.slice(1);
+const { meds, queries } = JSON.parse(fs.readFileSync(0, "utf8"));
+const context = vm.createContext({ console, setTimeout, structuredClone, location: { href: "http://x/" } });
+context.self = context.window = context;
+vm.runInContext(fs.readFileSync(coreScript, "utf8") + fs.readFileSync(workerScript, "utf8")
+  + "\nObject.assign(this, { SearchManager, PrescriptionSearchWorker, SearchWorkerClient });", context);
+const settle = () => new Promise((resolve) => setTimeout(resolve, 20));
+const names = (groups) => [...groups.adult, ...groups.pediatric, ...groups.other].map((m) => m.med);
+
+(async () => {
+  const main = new context.SearchManager(meds);
+  main.searchIndications = true;
+  const replies = [];
+  const worker = new context.PrescriptionSearchWorker(
+    new context.SearchManager([]), (message) => replies.push(message), null);
+  worker.onMessage({ type: "meds", revision: 1, meds });
+
+  const parity = [];
+  for (const [i, query] of queries.entries()) {
+    worker.onMessage({ type: "search", seq: i + 1, query, searchIndications: true });
+    await settle();
+    const reply = replies.pop();
+    const ids = [...reply.adult, ...reply.pediatric, ...reply.other];
+    parity.push([names(main.search(query)), ids.map((id) => meds[id].med)]);
+  }
+
+  queries.slice(0, 3).forEach((query, i) =>
+    worker.onMessage({ type: "search", seq: 100 + i, query, searchIndications: true }));
+  await settle();
+  const burst = replies.splice(0).map((r) => r.seq);
+
+  // Client over a worker that answers in-process, copying messages as postMessage does
+  let stub = null;
+  stub = {
+    handler: new context.PrescriptionSearchWorker(new context.SearchManager([]),
+      (message) => setTimeout(() => stub.onmessage({ data: message })), null),
+    postMessage(message) { stub.handler.onMessage(structuredClone(message)); },
+    terminate() { stub.terminated = true; },
+  };
+  const failures = [];
+  const client = new context.SearchWorkerClient(stub, (error) => failures.push(error.message));
+  client.setMedications(meds);
+  const groups = await client.query(queries[0], true);
+  const sameRecords = [...groups.adult, ...groups.pediatric, ...groups.other]
+    .every((med) => meds.includes(med));
+  const superseded = client.query(queries[1], true);
+  const pending = client.query(queries[2], true).catch((error) => "rejected: " + error.message);
+  stub.onerror({ message: "boom" });
+
+  process.stdout.write(JSON.stringify({
+    parity, burst, clientNames: names(groups), sameRecords, superseded: await superseded,
+    pending: await pending, failures, terminated: stub.terminated,
+    later: await client.query(queries[0], true).catch((error) => "rejected: " + error.message),
+  }));
+})().catch((e) => { console.error(e); process.exit(1); });
+"""
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+class TestPrescriptionSearchWorker:
+    """Tests for js/prescriptions/search-worker.js and SearchWorkerClient."""
+
+    def test_matches_main_thread_search(self) -> None:
+        """Test worker results, bursts and worker failure over the real chunks."""
+        meds = build.load_chunk_meds(build.CHUNK_DIR)
+        assert meds
+        queries = [
+            q["query"] for q in bench_search.load_corpus(bench_search.DEFAULT_CORPUS)
+            if q["engine"] == "prescriptions"
+        ]
+        result = subprocess.run(
+            ["node", "-e", _SEARCH_WORKER_PROBE, str(CORE_JS), str(SEARCH_WORKER_JS)],
+            input=json.dumps({"meds": meds, "queries": queries}),
+            capture_output=True, text=True, check=True,
+        )
+        output = json.loads(result.stdout)
+
+        for main, worker in output["parity"]:
+            assert worker == main
+        assert any(main for main, _ in output["parity"])
+        assert output["burst"] == [102]
+        assert output["clientNames"] == output["parity"][0][0]
+        assert output["sameRecords"] is True
+        assert output["superseded"] is None
+        assert output["pending"] == "rejected: boom"
+        assert output["failures"] == ["boom"]
+        assert output["terminated"] is True
+        assert output["later"] == "rejected: boom"
+
+
+# ---------------------------------------------------------------------------
+# Site Overlays
+# ---------------------------------------------------------------------------
+
+
+class TestBuildSiteOverlays:
+    """Tests for build_site_overlays."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_build_cache(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Keep overlay conversions out of the repo's build cache."""
+        monkeypatch.setenv(build_cache.CACHE_DIR_ENV, str(tmp_path / "build-cache"))
+
+    @staticmethod
+    def _write_overlay(path: Path, rows: list[dict[str, Any]]) -> None:
+        """Write a one-sheet (ENT) overlay workbook."""
+        path.parent.mkdir(exist_ok=True)
+        with pd.ExcelWriter(path) as writer:
+            pd.DataFrame(rows).to_excel(writer, sheet_name="ENT", index=False)
+
+    def test_writes_artifacts_and_index(self, tmp_path: Path, converted: dict[str, Any]) -> None:
+        """Test each site gets a small artifact with its ops and merged counts."""
+        self._write_overlay(tmp_path / "sites" / "North York.xlsx", [
+            {"Action": "remove", "Med": "Mometasone", "Population": "Adult", "Subcategory": "Nose"},
+            {"Action": "add", "Med": "Fluticasone", "Population": "Adult", "Subcategory": "Nose"},
+            {"Action": "add", "Med": "Otrivin", "Population": "Adult", "Subcategory": "Nose"},
+        ])
+        output_dir = tmp_path / "out"
+        output_dir.mkdir()
+        (output_dir / "closed-site.json").write_text("{}")
+
+        index = build.build_site_overlays(tmp_path / "sites", output_dir, converted["meds"])
+        assert index is not None
+        assert [(s["site"], s["id"], s["ops"]) for s in index] == [("North York", "north-york", 3)]
+        assert index[0]["url"] == "js/prescriptions/sites/north-york.json"
+        assert sorted(p.name for p in output_dir.iterdir()) == ["north-york.json"]
+
+        artifact = json.loads((output_dir / "north-york.json").read_text())
+        assert list(artifact["ops"]) == ["ENT"]
+        assert all("search_text" not in op["med"] for op in artifact["ops"]["ENT"])
+        assert artifact["counts"]["Adult"]["specialties"]["ENT"] == {
+            "total": 3, "subcategories": {"Ear": 1, "Nose": 2},
+        }
+
+    def test_unmatched_rows_fail(self, tmp_path: Path, converted: dict[str, Any]) -> None:
+        """Test an overlay row that matches no base row fails the step."""
+        self._write_overlay(tmp_path / "sites" / "site.xlsx", [
+            {"Action": "override", "Med": "Mometasone", "Population": "Pediatric"},
+        ])
+        assert build.build_site_overlays(tmp_path / "sites", tmp_path / "out", converted["meds"]) is None
+
+    def test_no_sites(self, tmp_path: Path, converted: dict[str, Any]) -> None:
+        """Test a tree without overlays builds an empty index and writes nothing."""
+        assert build.build_site_overlays(tmp_path / "sites", tmp_path / "out", converted["meds"]) == []
+        assert not (tmp_path / "out").exists()
+
+
+# ---------------------------------------------------------------------------
+# Run Tests
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,123 @@
+#!/opt/homebrew/bin/python3
+"""
+Unit tests for the shared build artifact cache.
+
+Run with: pytest test_build_cache.py -v
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+import build_cache
+
+
+# ---------------------------------------------------------------------------
+# Test Helpers
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def files(tmp_path: Path) -> tuple[Path, Path]:
+    """An input workbook stand-in and a converter source stand-in."""
+    workbook = tmp_path / "book.xlsx"
+    workbook.write_bytes(b"workbook v1")
+    source = tmp_path / "converter.py"
+    source.write_text("VERSION = 1\n")
+    return workbook, source
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestKey:
+    """Tests for BuildCache.key."""
+
+    def test_key_covers_inputs_sources_and_options(
+        self, tmp_path: Path, files: tuple[Path, Path],
+    ) -> None:
+        """Test any change to input bytes, source bytes or options changes the key."""
+        workbook, source = files
+        cache = build_cache.BuildCache(tmp_path / "cache", 1 << 20)
+        base = cache.key("billing_codes", [workbook], [source], {"fee": "15.00"})
+        assert cache.key("billing_codes", [workbook], [source], {"fee": "15.00"}) == base
+        assert cache.key("diagnostic_codes", [workbook], [source], {"fee": "15.00"}) != base
+        assert cache.key("billing_codes", [workbook], [source], {"fee": "16.00"}) != base
+
+        workbook.write_bytes(b"workbook v2")
+        assert cache.key("billing_codes", [workbook], [source], {"fee": "15.00"}) != base
+        workbook.write_bytes(b"workbook v1")
+        source.write_text("VERSION = 2\n")
+        assert cache.key("billing_codes", [workbook], [source], {"fee": "15.00"}) != base
+
+    def test_key_is_location_independent(self, tmp_path: Path, files: tuple[Path, Path]) -> None:
+        """Test copies of the same files elsewhere (another checkout) share a key."""
+        workbook, source = files
+        other = tmp_path / "elsewhere"
+        other.mkdir()
+        (other / "book.xlsx").write_bytes(workbook.read_bytes())
+        (other / "converter.py").write_bytes(source.read_bytes())
+        cache = build_cache.BuildCache(tmp_path / "cache", 1 << 20)
+        assert cache.key("x", [workbook], [source]) == cache.key(
+            "x", [other / "book.xlsx"], [other / "converter.py"],
+        )
+
+
+class TestStore:
+    """Tests for get, put and evict."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test stored bytes come back unchanged; unknown keys miss."""
+        cache = build_cache.BuildCache(tmp_path / "cache", 1 << 20)
+        cache.put("ab" * 32, b'[{"code": "A001"}]\n')
+        assert cache.get("ab" * 32) == b'[{"code": "A001"}]\n'
+        assert cache.get("cd" * 32) is None
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """Test the oldest-used artifacts go first once over the size bound."""
+        cache = build_cache.BuildCache(tmp_path / "cache", 250)
+        keys = ["a1" * 32, "b2" * 32, "c3" * 32]
+        for i, key in enumerate(keys[:2]):
+            cache.put(key, b"x" * 100)
+            os.utime(cache._path(key), (1000 + i, 1000 + i))
+        cache.get(keys[0])  # refreshes a1, leaving b2 least recently used
+
+        cache.put(keys[2], b"x" * 100)
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[2]) is not None
+
+
+class TestOpenCache:
+    """Tests for open_cache."""
+
+    def test_environment_configuration(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test the directory and size bound come from the environment."""
+        monkeypatch.setenv(build_cache.CACHE_DIR_ENV, str(tmp_path / "shared"))
+        monkeypatch.setenv(build_cache.MAX_MB_ENV, "0.5")
+        cache = build_cache.open_cache()
+        assert cache.directory == tmp_path / "shared"
+        assert cache.max_bytes == 512 * 1024
+
+    def test_defaults(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the repo-local default directory and an invalid size fallback."""
+        monkeypatch.delenv(build_cache.CACHE_DIR_ENV, raising=False)
+        monkeypatch.setenv(build_cache.MAX_MB_ENV, "lots")
+        cache = build_cache.open_cache()
+        assert cache.directory == build_cache.DEFAULT_CACHE_DIR
+        assert cache.max_bytes == build_cache.DEFAULT_MAX_MB * 1024 * 1024
+
+
+# ---------------------------------------------------------------------------
+# Run Tests
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,94 @@
+#!/opt/homebrew/bin/python3
+"""
+Unit tests for change-impact reports.
+
+Run with: pytest test_change_report.py -v
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+import change_report
+
+
+# ---------------------------------------------------------------------------
+# Unit Tests
+# ---------------------------------------------------------------------------
+
+
+class TestBuildReport:
+    """Tests for build_report function."""
+
+    KEY = ("specialty", "med")
+
+    def test_added_removed_modified(self) -> None:
+        """Test records are matched by key and diffed field by field."""
+        old = [
+            {"specialty": "ENT", "med": "Amoxicillin", "dose_text": "500mg"},
+            {"specialty": "ENT", "med": "Cefuroxime", "dose_text": "500mg"},
+        ]
+        new = [
+            {"specialty": "ENT", "med": "Amoxicillin", "dose_text": "1g"},
+            {"specialty": "ENT", "med": "Ciprodex", "dose_text": "4 drops"},
+        ]
+        report = change_report.build_report(old, new, self.KEY)
+        assert report["added"] == ["ENT / Ciprodex"]
+        assert report["removed"] == ["ENT / Cefuroxime"]
+        assert report["modified"] == [{
+            "key": "ENT / Amoxicillin",
+            "fields": {"dose_text": {"old": "500mg", "new": "1g"}},
+        }]
+        assert report["summary"]["unchanged"] == 0
+        assert set(report["index"]) == {"ENT / Amoxicillin", "ENT / Ciprodex"}
+        assert "fee_changes" not in report
+
+    def test_repeated_keys_and_fee_flag(self) -> None:
+        """Test repeats are numbered and fee changes are listed when requested."""
+        old = [{"code": "Z208", "fee": 121.6}, {"code": "Z208", "fee": 97.35}]
+        new = [{"code": "Z208", "fee": 121.6}, {"code": "Z208", "fee": 99.0}]
+        report = change_report.build_report(old, new, ("code",), fee_field="fee")
+        assert report["fee_changes"] == [{"key": "Z208 #2", "old": 97.35, "new": 99.0}]
+        assert report["summary"]["unchanged"] == 1
+
+    def test_no_previous_output(self) -> None:
+        """Test a first conversion reports everything as added."""
+        report = change_report.build_report(None, [{"specialty": "ENT", "med": "A"}], self.KEY)
+        assert report["previous_count"] is None
+        assert report["added"] == ["ENT / A"]
+
+
+class TestWriteReport:
+    """Tests for report_path and write_report functions."""
+
+    def test_report_path_sits_next_to_output(self) -> None:
+        """Test the report is named after the output file."""
+        path = change_report.report_path(Path("data/Prescriptions.json"))
+        assert path == Path("data/Prescriptions.changes.json")
+
+    def test_writes_report(self, tmp_path: Path) -> None:
+        """Test the report is written as JSON and no temp file is left."""
+        report = change_report.build_report(None, [{"code": "A007"}], ("code",))
+        path = tmp_path / "codes.changes.json"
+        assert change_report.write_report(path, report) is True
+        assert json.loads(path.read_text())["added"] == ["A007"]
+        assert [p.name for p in tmp_path.iterdir()] == ["codes.changes.json"]
+
+    def test_unwritable_path_fails(self, tmp_path: Path) -> None:
+        """Test a write failure returns False and cleans up its temp file."""
+        report = change_report.build_report(None, [], ("code",))
+        path = tmp_path / "codes.changes.json"
+        path.mkdir()
+        assert change_report.write_report(path, report) is False
+        assert [p.name for p in tmp_path.iterdir()] == ["codes.changes.json"]
+
+
+# ---------------------------------------------------------------------------
+# Run Tests
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,94 @@
+#!/opt/homebrew/bin/python3
+"""
+Unit tests for pre-compressed asset generation.
+
+Run with: pytest test_compress.py -v
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+from pathlib import Path
+
+import pytest
+
+import compress
+import precache
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestWriteCompressed:
+    """Tests for write_compressed."""
+
+    @pytest.fixture
+    def root(self, tmp_path: Path) -> Path:
+        """A project tree with one large and one tiny script."""
+        js = tmp_path / "js"
+        js.mkdir()
+        (js / "big.js").write_text("var x = 1;\n" * 200)
+        (js / "tiny.js").write_text("var y;\n")
+        return tmp_path
+
+    def test_writes_gzip_sibling(self, root: Path) -> None:
+        """Test large assets get a .gz sibling that decompresses to the source."""
+        assert compress.write_compressed(root) is True
+        source = root / "js" / "big.js"
+        sibling = root / "js" / "big.js.gz"
+        assert gzip.decompress(sibling.read_bytes()) == source.read_bytes()
+
+    def test_skips_small_assets(self, root: Path) -> None:
+        """Test assets under MIN_SIZE are left uncompressed."""
+        compress.write_compressed(root)
+        assert not (root / "js" / "tiny.js.gz").exists()
+
+    def test_output_is_deterministic(self, root: Path) -> None:
+        """Test rebuilding produces byte-identical siblings."""
+        compress.write_compressed(root)
+        first = (root / "js" / "big.js.gz").read_bytes()
+        compress.write_compressed(root)
+        assert (root / "js" / "big.js.gz").read_bytes() == first
+
+    def test_unchanged_sibling_is_kept_current(self, root: Path) -> None:
+        """Test a rewritten but unchanged source leaves its sibling no older."""
+        compress.write_compressed(root)
+        source = root / "js" / "big.js"
+        sibling = root / "js" / "big.js.gz"
+        old = source.stat().st_mtime_ns - 1_000_000_000
+        os.utime(sibling, ns=(old, old))
+        compress.write_compressed(root)
+        assert sibling.stat().st_mtime_ns >= source.stat().st_mtime_ns
+
+    def test_skips_change_reports(self, root: Path) -> None:
+        """Test gitignored change reports are neither precached nor compressed."""
+        billing = root / "data" / "billing"
+        billing.mkdir(parents=True)
+        (billing / "billing_codes.json").write_text("[]" + " " * 1000)
+        (billing / "billing_codes.changes.json").write_text("{}" + " " * 1000)
+        compress.write_compressed(root)
+        assert precache.collect_assets(root) == [
+            root / "data" / "billing" / "billing_codes.json",
+            root / "js" / "big.js",
+            root / "js" / "tiny.js",
+        ]
+        assert (billing / "billing_codes.json.gz").exists()
+        assert not (billing / "billing_codes.changes.json.gz").exists()
+
+    def test_removes_stale_siblings(self, root: Path) -> None:
+        """Test siblings of deleted assets are cleaned up."""
+        compress.write_compressed(root)
+        (root / "js" / "big.js").unlink()
+        compress.write_compressed(root)
+        assert not (root / "js" / "big.js.gz").exists()
+
+
+# ---------------------------------------------------------------------------
+# Run Tests
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
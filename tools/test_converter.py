@@ -7,13 +7,20 @@ Run with: pytest test_converter.py -v
 
 from __future__ import annotations
 
+import asyncio
+import io
 import json
+import shutil
 from pathlib import Path
 from typing import Any
 import pandas as pd
 import pytest
 
+import build_cache
+import change_report
+import json_codec
 import prescription_converter as converter
+import sheet_cache
 
 
 # ---------------------------------------------------------------------------
@@ -21,6 +28,14 @@ import prescription_converter as converter
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def isolated_build_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the shared build cache at a per-test directory."""
+    cache_dir = tmp_path / "build-cache"
+    monkeypatch.setenv(build_cache.CACHE_DIR_ENV, str(cache_dir))
+    return cache_dir
+
+
 def _make_row(**overrides: Any) -> dict[str, Any]:
     """Create a minimal medication row with sensible defaults.
 
@@ -201,6 +216,142 @@ class TestBuildSearchText:
         assert result.count("|") == 2  # only the delimiters
 
 
+class TestCompactSearchText:
+    """Tests for compact_search_text function."""
+
+    def test_dedupes_tokens_across_components(self) -> None:
+        """Test a token repeated in a later component is kept only once."""
+        text = "allergy | anaphylaxis | epinephrine | anaphylaxis | present to ed for anaphylaxis"
+        assert converter.compact_search_text(text) == (
+            "allergy | anaphylaxis | epinephrine | present ed"
+        )
+
+    def test_drops_emptied_components(self) -> None:
+        """Test a component made only of stopwords and repeats disappears."""
+        assert converter.compact_search_text("pain | the | pain and") == "pain"
+
+    def test_custom_stopwords(self) -> None:
+        """Test the stopword set is configurable."""
+        assert converter.compact_search_text("take with food", frozenset({"take"})) == "with food"
+
+    def test_keeps_every_distinct_token(self) -> None:
+        """Test compaction loses no non-stopword token (substring search is unaffected)."""
+        text = converter.build_search_text(["Allergy", "Adult", "Urticaria", "Cetirizine", "Take with food, or without"])
+        compact = converter.compact_search_text(text)
+        kept = set(compact.split())
+        assert {t for t in text.split() if t not in converter.SEARCH_STOPWORDS} == kept
+
+
+# ---------------------------------------------------------------------------
+# Unit Tests: Structured Field Parsing
+# ---------------------------------------------------------------------------
+
+
+class TestParseDose:
+    """Tests for parse_dose function."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("500mg", (500, 500, "mg", False, None)),
+        ("1-2 tab", (1, 2, "tab", False, None)),
+        ("0.1-0.2mg", (0.1, 0.2, "mg", False, None)),
+        ("15mg/kg/dose", (15, 15, "mg", True, "dose")),
+        ("1 infant suppository", (1, 1, "infant suppository", False, None)),
+    ])
+    def test_parses_ranges_and_units(self, text: str, expected: tuple) -> None:
+        """Test dose text parses into min, max, unit and basis."""
+        dose = converter.parse_dose(text)
+        assert (dose["min"], dose["max"], dose["unit"], dose["per_kg"], dose["per"]) == expected
+
+    def test_unparsed_text(self) -> None:
+        """Test empty or free-form dose text gives None."""
+        assert converter.parse_dose("") is None
+        assert converter.parse_dose("as directed") is None
+
+
+class TestParseFrequency:
+    """Tests for parse_frequency function."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("OD", {"min": 1, "max": 1}),
+        ("BID", {"min": 2, "max": 2}),
+        ("qHS", {"min": 1, "max": 1}),
+        ("q6h", {"min": 4, "max": 4}),
+        ("q4-6h", {"min": 4, "max": 6}),
+        ("qMWF", {"min": 0.4286, "max": 0.4286}),
+    ])
+    def test_doses_per_day(self, text: str, expected: dict) -> None:
+        """Test frequencies convert to scheduled doses per day."""
+        assert converter.parse_frequency(text) == expected
+
+    def test_unparsed_text(self) -> None:
+        """Test sub-hourly and empty frequencies give None."""
+        assert converter.parse_frequency("q5mins") is None
+        assert converter.parse_frequency("") is None
+
+
+class TestParseDuration:
+    """Tests for parse_duration function."""
+
+    def test_days_and_weeks(self) -> None:
+        """Test durations convert to days."""
+        assert converter.parse_duration("7 day") == {"min": 7, "max": 7}
+        assert converter.parse_duration("2 weeks") == {"min": 14, "max": 14}
+        assert converter.parse_duration("7-14 day") == {"min": 7, "max": 14}
+
+    def test_unparsed_text(self) -> None:
+        """Test months and empty durations give None."""
+        assert converter.parse_duration("1 month") is None
+        assert converter.parse_duration("") is None
+
+
+class TestParseDispense:
+    """Tests for parse_dispense function."""
+
+    def test_amount_and_unit(self) -> None:
+        """Test dispense text splits into amount and unit."""
+        assert converter.parse_dispense("28 tab") == {"amount": 28, "unit": "tab"}
+        assert converter.parse_dispense("100ml") == {"amount": 100, "unit": "ml"}
+        assert converter.parse_dispense("1 bottle") == {"amount": 1, "unit": "bottle"}
+        assert converter.parse_dispense("") is None
+
+
+class TestCheckDispenseQuantity:
+    """Tests for check_dispense_quantity function."""
+
+    @staticmethod
+    def _med(dose: str, freq: str, duration: str, dispense: str, prn: str = "") -> dict[str, Any]:
+        return {
+            "med": "TestMed", "dose_text": dose, "frequency": freq,
+            "duration": duration, "dispense": dispense, "prn": prn,
+            "dose_range": converter.parse_dose(dose),
+            "doses_per_day": converter.parse_frequency(freq),
+            "duration_days": converter.parse_duration(duration),
+            "dispense_qty": converter.parse_dispense(dispense),
+        }
+
+    def test_consistent_quantity(self) -> None:
+        """Test a matching count passes."""
+        assert converter.check_dispense_quantity(self._med("1 tab", "BID", "7 day", "14 tab")) is None
+        assert converter.check_dispense_quantity(self._med("1-2 tab", "BID", "7 day", "20 tabs")) is None
+
+    def test_mismatched_quantity(self) -> None:
+        """Test over- and under-dispensing are reported."""
+        warning = converter.check_dispense_quantity(self._med("1 tab", "BID", "7 day", "28 tab"))
+        assert warning is not None and "expected 14-14 tab" in warning
+        assert converter.check_dispense_quantity(self._med("1 tab", "BID", "7 day", "10 tab")) is not None
+
+    def test_prn_allows_fewer(self) -> None:
+        """Test PRN meds may dispense less than the scheduled maximum."""
+        assert converter.check_dispense_quantity(self._med("1 tab", "q6h", "5 day", "10 tab", "pain")) is None
+        assert converter.check_dispense_quantity(self._med("1 tab", "q6h", "5 day", "30 tab", "pain")) is not None
+
+    def test_skips_uncomparable_units(self) -> None:
+        """Test different or non-countable units are not checked."""
+        assert converter.check_dispense_quantity(self._med("500mg", "BID", "7 day", "28 tab")) is None
+        assert converter.check_dispense_quantity(self._med("5ml", "BID", "7 day", "100ml")) is None
+        assert converter.check_dispense_quantity(self._med("1 tab", "BID", "", "28 tab")) is None
+
+
 # ---------------------------------------------------------------------------
 # Unit Tests: Validation Functions
 # ---------------------------------------------------------------------------
@@ -335,6 +486,17 @@ class TestProcessRow:
         assert result["weight_based"] is False
         assert "ibuprofen" in result["search_text"]
 
+    def test_structured_fields(self) -> None:
+        """Test parsed dose, frequency, duration and dispense sit beside the raw text."""
+        row = _make_row(Dose="1-2 tab", Frequency="q4-6h", Duration="2 week", Dispense="30 tab")
+        result = converter.process_row(row, "Test")
+
+        assert result["dose_text"] == "1-2 tab"
+        assert result["dose_range"] == {"min": 1, "max": 2, "unit": "tab", "per_kg": False, "per": None}
+        assert result["doses_per_day"] == {"min": 4, "max": 6}
+        assert result["duration_days"] == {"min": 14, "max": 14}
+        assert result["dispense_qty"] == {"amount": 30, "unit": "tab"}
+
     def test_empty_med_skipped(self) -> None:
         """Test rows with empty Med are skipped."""
         row = {"Med": "", "Dose": "400mg"}
@@ -504,6 +666,137 @@ class TestFullConversion:
             data = json.load(f)
         assert data["source"]["record_count"] == 0
 
+    def test_sheet_cache_reparses_only_edited_sheet(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test a one-sheet edit reuses the other sheets' cached results."""
+        excel_path = tmp_path / "multi.xlsx"
+
+        def write(ent_dose: str) -> None:
+            with pd.ExcelWriter(excel_path, engine="openpyxl") as writer:
+                pd.DataFrame({"Med": ["Cetirizine"], "Dose": ["10mg"]}).to_excel(
+                    writer, sheet_name="Allergy", index=False)
+                pd.DataFrame({"Med": ["Amoxicillin"], "Dose": [ent_dose]}).to_excel(
+                    writer, sheet_name="ENT", index=False)
+
+        write("500mg")
+        converter.convert_excel(excel_path)
+        write("1g")
+        caplog.clear()
+        with caplog.at_level("INFO"):
+            data = converter.convert_excel(excel_path)
+
+        assert "Reusing cached sheet: Allergy" in caplog.text
+        assert "Processing sheet: ENT" in caplog.text
+        assert "Processing sheet: Allergy" not in caplog.text
+        assert [m["dose_text"] for m in data["meds"]] == ["10mg", "1g"]
+        assert data == converter.convert_excel(excel_path, use_cache=False)
+
+    def test_sheet_cache_keeps_empty_sheets(
+        self, tmp_path: Path, isolated_build_cache: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test an unchanged workbook with a skipped sheet is not reloaded."""
+        excel_path = tmp_path / "notes.xlsx"
+        with pd.ExcelWriter(excel_path, engine="openpyxl") as writer:
+            pd.DataFrame({"Med": ["Cetirizine"], "Dose": ["10mg"]}).to_excel(
+                writer, sheet_name="Allergy", index=False)
+            pd.DataFrame({"Note": ["Read me"]}).to_excel(
+                writer, sheet_name="Notes", index=False)
+
+        first = converter.convert_excel(excel_path)
+        shutil.rmtree(isolated_build_cache)
+
+        def fail_load(path: Path) -> None:
+            raise AssertionError("workbook reloaded")
+
+        monkeypatch.setattr(converter, "load_excel", fail_load)
+        assert converter.convert_excel(excel_path) == first
+
+    def test_build_cache_reuses_identical_conversion(
+        self, sample_excel: Path, caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test a second conversion of identical bytes comes from the build cache."""
+        first = converter.convert_excel(sample_excel)
+        with caplog.at_level("INFO"):
+            second = converter.convert_excel(sample_excel)
+        assert "build cache" in caplog.text
+        assert "Processing sheet" not in caplog.text
+        assert second == first
+
+    def test_build_cache_misses_after_shared_module_change(
+        self, sample_excel: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test editing the serializer or sheet cache invalidates cached conversions."""
+        assert Path(json_codec.__file__) in converter._CACHE_SOURCES
+        assert Path(sheet_cache.__file__) in converter._CACHE_SOURCES
+        codec_copy = tmp_path / "json_codec.py"
+        codec_copy.write_text(Path(json_codec.__file__).read_text())
+        monkeypatch.setattr(converter, "_CACHE_SOURCES", [
+            codec_copy if p == Path(json_codec.__file__) else p for p in converter._CACHE_SOURCES
+        ])
+
+        converter.convert_excel(sample_excel)
+        codec_copy.write_text(codec_copy.read_text() + "# edited\n")
+        with caplog.at_level("INFO"):
+            converter.convert_excel(sample_excel)
+        assert "build cache" not in caplog.text
+
+    def test_change_report_against_previous_output(
+        self, sample_excel: Path, tmp_path: Path,
+    ) -> None:
+        """Test reconverting reports changes against the output it replaces."""
+        output_path = tmp_path / "output.json"
+        assert converter.convert_excel_to_json(sample_excel, output_path) is True
+        first = json.loads(change_report.report_path(output_path).read_text())
+        assert first["previous_count"] is None
+        assert first["summary"]["added"] == 2
+
+        data = json.loads(output_path.read_text())
+        data["meds"][0]["dose_text"] = "200mg"
+        output_path.write_text(json.dumps(data))
+        assert converter.convert_excel_to_json(sample_excel, output_path) is True
+        second = json.loads(change_report.report_path(output_path).read_text())
+        assert second["summary"] == {"added": 0, "removed": 0, "modified": 1, "unchanged": 1}
+        assert second["modified"][0]["fields"]["dose_text"] == {"old": "200mg", "new": "400mg"}
+
+
+    def test_in_memory_conversion_matches_file_conversion(self, sample_excel: Path) -> None:
+        """Test bytes and non-seekable streams yield the same meds as convert_excel."""
+        expected = converter.convert_excel(sample_excel, use_cache=False)["meds"]
+        raw = sample_excel.read_bytes()
+
+        class Upload(io.RawIOBase):
+            """A stream that can only be read forward (like a request body)."""
+
+            def __init__(self) -> None:
+                self._data = io.BytesIO(raw)
+
+            def readable(self) -> bool:
+                return True
+
+            def readinto(self, buffer: Any) -> int:
+                return self._data.readinto(buffer)
+
+        assert list(converter.iter_meds(raw)) == expected
+        assert list(converter.iter_meds(Upload())) == expected
+
+    def test_async_conversion_runs_concurrently(self, sample_excel: Path) -> None:
+        """Test several uploads convert concurrently off the event loop."""
+        raw = sample_excel.read_bytes()
+
+        async def convert_all() -> list[list[dict[str, Any]]]:
+            return await asyncio.gather(*(converter.read_meds_async(raw) for _ in range(3)))
+
+        results = asyncio.run(convert_all())
+        assert [len(meds) for meds in results] == [2, 2, 2]
+        assert results[0] == results[2]
+
+    def test_in_memory_conversion_rejects_invalid_bytes(self) -> None:
+        """Test unreadable uploads raise ValueError before iteration starts."""
+        with pytest.raises(ValueError, match="Unreadable workbook"):
+            converter.iter_meds(b"not a workbook")
+
 
 # ---------------------------------------------------------------------------
 # Edge Case Tests
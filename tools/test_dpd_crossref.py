@@ -0,0 +1,199 @@
+#!/opt/homebrew/bin/python3
+"""
+Unit tests for the Drug Product Database cross-reference.
+
+Run with: pytest test_dpd_crossref.py -v
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import dpd_crossref
+
+
+# ---------------------------------------------------------------------------
+# Test Helpers
+# ---------------------------------------------------------------------------
+
+# (drug code, class, DIN, brand, ingredients, form, status); ingredients
+# use the DPD "BASE (SALT)" spelling.
+PRODUCTS: list[tuple[str, str, str, str, list[str], str, str]] = [
+    ("1", "Human", "02242345", "ADVIL", ["IBUPROFEN"], "TABLET", "MARKETED"),
+    ("2", "Human", "02242346", "ADVIL LIQUI-GELS", ["IBUPROFEN"], "CAPSULE", "MARKETED"),
+    ("3", "Human", "02100001", "APO-IBUPROFEN", ["IBUPROFEN"], "TABLET", "CANCELLED POST MARKET"),
+    ("4", "Human", "02238829", "CLAVULIN-875", ["AMOXICILLIN (AMOXICILLIN TRIHYDRATE)",
+     "CLAVULANIC ACID (POTASSIUM CLAVULANATE)"], "TABLET", "MARKETED"),
+    ("5", "Human", "02284235", "NORVASC", ["AMLODIPINE (AMLODIPINE BESYLATE)"], "TABLET", "MARKETED"),
+    ("6", "Human", "00555555", "OLDCILLIN", ["PHENETHICILLIN"], "TABLET", "DORMANT"),
+    ("7", "Veterinary", "00777777", "VET-PROFEN", ["IBUPROFEN"], "TABLET", "MARKETED"),
+    ("8", "Human", "02245555", "SPIRIVA", ["TIOTROPIUM (TIOTROPIUM BROMIDE MONOHYDRATE)"],
+     "CAPSULE", "MARKETED"),
+]
+
+
+def _write_extract(dpd_dir: Path) -> Path:
+    """Write PRODUCTS as a headerless DPD extract; the dormant one goes in _ia files."""
+    dpd_dir.mkdir()
+    tables: dict[str, list[list[str]]] = {}
+    for code, cls, din, brand, ingredients, form, status in PRODUCTS:
+        suffix = "_ia" if status != "MARKETED" else ""
+        tables.setdefault(f"drug{suffix}", []).append(
+            [code, "", cls, din, brand, "", "N", "", str(len(ingredients)), "01-JAN-2020"])
+        for i, ingredient in enumerate(ingredients):
+            tables.setdefault(f"ingred{suffix}", []).append([code, str(i), ingredient, "", "1", "MG"])
+        tables.setdefault(f"form{suffix}", []).append([code, "1", form])
+        tables.setdefault(f"status{suffix}", []).extend([
+            [code, "N", "APPROVED", "01-JAN-2000"],
+            [code, "Y", status, "01-JAN-2020"],
+        ])
+    for table, rows in tables.items():
+        with open(dpd_dir / f"{table}.txt", "w", newline="", encoding="utf-8") as f:
+            csv.writer(f, quoting=csv.QUOTE_ALL).writerows(rows)
+    return dpd_dir
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> dpd_crossref.DpdIndex:
+    """The PRODUCTS extract, loaded."""
+    return dpd_crossref.load_dpd(_write_extract(tmp_path / "dpd"))
+
+
+def _med(name: str, form: str = "tab", brands: list[str] | None = None, **extra: Any) -> dict[str, Any]:
+    """Create a converted medication record."""
+    return {"specialty": "Analgesia", "med": name, "form": form, "brands": brands or [], **extra}
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestNormalization:
+    """Tests for med_components and split_ingredient."""
+
+    @pytest.mark.parametrize("name,components", [
+        ("Ibuprofen (100mg/5ml suspension)", ["ibuprofen"]),
+        ("Amox-Clav (875/125mg)", ["amoxicillin", "clavulanic acid"]),
+        ("TMP/SMX DS (800/160mg)", ["trimethoprim", "sulfamethoxazole"]),
+        ("Tylenol with Codeine No. 3", ["acetaminophen", "codeine"]),
+        ("Clobetasol cream (0.05%)", ["clobetasol"]),
+        ("Potassium Chloride ER", ["potassium chloride"]),
+    ])
+    def test_med_components(self, name: str, components: list[str]) -> None:
+        """Test strengths, product words and known abbreviations are normalized."""
+        assert dpd_crossref.med_components(name) == components
+
+    def test_split_ingredient(self) -> None:
+        """Test DPD salts are split from the base and hydrates dropped."""
+        assert dpd_crossref.split_ingredient("TIOTROPIUM (TIOTROPIUM BROMIDE MONOHYDRATE)") == (
+            "tiotropium", "tiotropium bromide",
+        )
+        assert dpd_crossref.split_ingredient("IBUPROFEN") == ("ibuprofen", "")
+
+
+class TestMatching:
+    """Tests for load_dpd, match_name and match_brand."""
+
+    def test_loads_human_products_from_all_variants(self, index: dpd_crossref.DpdIndex) -> None:
+        """Test active and inactive files are merged and veterinary products dropped."""
+        assert sorted(index.products) == ["1", "2", "3", "4", "5", "6", "8"]
+        assert index.products["3"]["status"] == "CANCELLED POST MARKET"
+
+    def test_match_name(self, index: dpd_crossref.DpdIndex) -> None:
+        """Test combinations, salts and unknown ingredients."""
+        assert dpd_crossref.match_name(index, "Ibuprofen") == {"1", "2", "3"}
+        assert dpd_crossref.match_name(index, "Amox-Clav (875/125mg)") == {"4"}
+        assert dpd_crossref.match_name(index, "Tiotropium Bromide (18mcg)") == {"8"}
+        assert dpd_crossref.match_name(index, "Amoxicillin") == set()
+        assert dpd_crossref.match_name(index, "Crutches") is None
+
+    def test_match_brand_by_leading_words(self, index: dpd_crossref.DpdIndex) -> None:
+        """Test a brand matches every product whose name starts with it."""
+        assert dpd_crossref.match_brand(index, "Advil") == {"1", "2"}
+        assert dpd_crossref.match_brand(index, "Advil Liqui-Gels") == {"2"}
+        assert dpd_crossref.match_brand(index, "Motrin") == set()
+
+
+class TestCrossReference:
+    """Tests for cross_reference and write_crossref."""
+
+    def test_attaches_marketed_dins_in_form(self, index: dpd_crossref.DpdIndex) -> None:
+        """Test DINs are marketed products of the med's form, shared across repeats."""
+        meds = [_med("Ibuprofen"), _med("Ibuprofen"), _med("Ibuprofen", form="capsule")]
+        report = dpd_crossref.cross_reference(index, meds)
+        assert [m["dins"] for m in meds] == [["02242345"], ["02242345"], ["02242346"]]
+        assert report["unmatched_meds"] == report["discontinued"] == []
+
+    def test_reports_problems(self, index: dpd_crossref.DpdIndex) -> None:
+        """Test unmatched, discontinued, form and brand problems are reported once each."""
+        meds = [
+            _med("Phenethicillin"),
+            _med("Cefalotin"),
+            _med("Amlodipine", form="suspension"),
+            _med("Ibuprofen", brands=["Advil", "Norvasc", "Motrin"]),
+            _med("Ibuprofen", brands=["Advil", "Norvasc", "Motrin"], indication="Fever"),
+            _med("Crutches", specialty="Non-Med", form=""),
+        ]
+        report = dpd_crossref.cross_reference(index, meds)
+        assert report["source"]["checked_meds"] == 5
+        assert report["discontinued"] == [
+            {"med": "Phenethicillin", "form": "tab", "statuses": ["DORMANT"]},
+        ]
+        assert report["unmatched_meds"] == [{"med": "Cefalotin", "form": "tab"}]
+        assert report["form_mismatches"] == [
+            {"med": "Amlodipine", "form": "suspension", "dpd_forms": ["tablet"]},
+        ]
+        assert report["unmatched_brands"] == [{"brand": "Motrin", "med": "Ibuprofen"}]
+        assert report["brand_mismatches"] == [
+            {"brand": "Norvasc", "med": "Ibuprofen", "dpd_ingredients": ["amlodipine"]},
+        ]
+        assert "dins" not in meds[-1]
+
+    def test_falls_back_to_brands(self, index: dpd_crossref.DpdIndex) -> None:
+        """Test a name the DPD does not know is matched through its brands."""
+        meds = [_med("Advil Extra", brands=["Advil"])]
+        dpd_crossref.cross_reference(index, meds)
+        assert meds[0]["dins"] == ["02242345"]
+
+    def test_scales_linearly(self, tmp_path: Path) -> None:
+        """Test a DPD-sized extract and formulary cross-reference in well under a second each."""
+        dpd_dir = tmp_path / "dpd"
+        dpd_dir.mkdir()
+        with open(dpd_dir / "drug.txt", "w", newline="") as drug, \
+                open(dpd_dir / "ingred.txt", "w", newline="") as ingred:
+            drugs, ingreds = csv.writer(drug), csv.writer(ingred)
+            for i in range(50_000):
+                drugs.writerow([str(i), "", "Human", f"{i:08d}", f"BRAND {i % 5000} {i}"])
+                ingreds.writerow([str(i), "1", f"DRUG{i % 5000} (DRUG{i % 5000} HYDROCHLORIDE)"])
+        started = time.perf_counter()
+        index = dpd_crossref.load_dpd(dpd_dir)
+        meds = [_med(f"Drug{i % 5000} hydrochloride", brands=[f"Brand {i}"]) for i in range(5000)]
+        dpd_crossref.cross_reference(index, meds)
+        assert time.perf_counter() - started < 5
+        assert len(index.products) == 50_000
+
+    def test_write_crossref(self, tmp_path: Path) -> None:
+        """Test the report is written and a missing extract skips the step."""
+        report_path = tmp_path / "dpd-report.json"
+        meds = [_med("Ibuprofen")]
+        assert dpd_crossref.write_crossref(tmp_path / "missing", meds, report_path) is True
+        assert not report_path.exists() and "dins" not in meds[0]
+
+        assert dpd_crossref.write_crossref(_write_extract(tmp_path / "dpd"), meds, report_path) is True
+        assert json.loads(report_path.read_text())["source"]["checked_meds"] == 1
+        assert meds[0]["dins"] == ["02242345"]
+
+
+# ---------------------------------------------------------------------------
+# Run Tests
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,133 @@
+#!/opt/homebrew/bin/python3
+"""
+Unit tests for the fuzzy term index.
+
+Run with: pytest test_fuzzy_index.py -v
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import fuzzy_index
+
+
+# ---------------------------------------------------------------------------
+# Test Helpers
+# ---------------------------------------------------------------------------
+
+VOCABULARY = [
+    "amoxicillin", "cephalexin", "clavulanate", "fracture", "fractures",
+    "laceration", "lacerations", "pneumonia", "sprain", "strain", "otitis",
+    "ibuprofen", "acetaminophen", "salbutamol", "dislocation",
+]
+
+
+@pytest.fixture
+def index() -> dict[str, Any]:
+    """Trigram index over a small clinical vocabulary."""
+    return fuzzy_index.build_index(VOCABULARY)
+
+
+def _exhaustive(terms: list[str], word: str) -> list[tuple[str, int]]:
+    """Reference answer: Levenshtein against every term."""
+    budget = fuzzy_index.allowed_distance(word)
+    if budget == 0:
+        return []
+    matches = [(t, fuzzy_index.levenshtein(word, t)) for t in terms]
+    return sorted((m for m in matches if m[1] <= budget), key=lambda m: (m[1], m[0]))
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestExtractTerms:
+    """Tests for extract_terms."""
+
+    def test_splits_lowercases_and_strips_punctuation(self) -> None:
+        """Test words are normalized the way the JS engines see them."""
+        terms = fuzzy_index.extract_terms(["Cast – Hip Spica (Bilateral)", "Otitis media,"])
+        assert terms == {"spica", "bilateral", "otitis", "media"}
+
+    def test_skips_short_and_numeric_words(self) -> None:
+        """Test doses, strengths and words under MIN_TERM_LENGTH are dropped."""
+        terms = fuzzy_index.extract_terms(["Ibuprofen 400mg tab", "PEG 3350", "Day-of"])
+        assert terms == {"ibuprofen", "day-of"}
+
+
+class TestLookup:
+    """Tests for lookup."""
+
+    def test_corrects_common_misspellings(self, index: dict[str, Any]) -> None:
+        """Test single-edit typos resolve to the intended term first."""
+        assert fuzzy_index.lookup(index, "amoxicilin")[0] == ("amoxicillin", 1)
+        assert fuzzy_index.lookup(index, "cephalexn")[0] == ("cephalexin", 1)
+        assert fuzzy_index.lookup(index, "Pnemonia")[0] == ("pneumonia", 1)
+
+    def test_budget_follows_word_length(self, index: dict[str, Any]) -> None:
+        """Test short words get no tolerance and 5-6 char words get one edit."""
+        assert fuzzy_index.lookup(index, "otit") == []
+        assert fuzzy_index.lookup(index, "sprian") == []  # transposition = 2 edits
+        assert fuzzy_index.lookup(index, "sprein") == [("sprain", 1)]
+
+    def test_orders_by_distance_then_term(self, index: dict[str, Any]) -> None:
+        """Test closer terms come first, ties broken alphabetically."""
+        assert fuzzy_index.lookup(index, "fractre") == [("fracture", 1), ("fractures", 2)]
+
+    def test_matches_exhaustive_scan(self) -> None:
+        """Test the trigram filter never drops a term within budget."""
+        rng = random.Random(7)
+        alphabet = "abcdefghijklmnopqrstuvwxyz"
+        terms = sorted({
+            "".join(rng.choice("aeioulnrst") for _ in range(rng.randint(5, 10)))
+            for _ in range(300)
+        })
+        index = fuzzy_index.build_index(terms)
+        for _ in range(200):
+            word = list(rng.choice(terms))
+            for _ in range(rng.randint(0, 3)):
+                pos = rng.randrange(len(word))
+                op = rng.choice(("sub", "ins", "del"))
+                if op == "sub":
+                    word[pos] = rng.choice(alphabet)
+                elif op == "ins":
+                    word.insert(pos, rng.choice(alphabet))
+                elif len(word) > 1:
+                    del word[pos]
+            query = "".join(word)
+            assert fuzzy_index.lookup(index, query) == _exhaustive(terms, query), query
+
+
+class TestWriteFuzzyIndex:
+    """Tests for write_fuzzy_index."""
+
+    def test_writes_vocabulary_from_all_sources(self, tmp_path: Path) -> None:
+        """Test meds, billing and diagnostic fields all feed the vocabulary."""
+        output = tmp_path / "fuzzy-index.json"
+        assert fuzzy_index.write_fuzzy_index(
+            output,
+            meds=[{"med": "Amoxicillin", "brands": ["Clavulin"], "indication": "Otitis media"}],
+            billing_codes=[{"name": "Laceration repair", "search_terms": ["stitches"]}],
+            diagnostic_codes=[{"subcategory": "Respiratory", "name": "Pneumonia"}],
+        ) is True
+        artifact = json.loads(output.read_text())
+        assert artifact["terms"] == [
+            "amoxicillin", "clavulin", "laceration", "media", "otitis",
+            "pneumonia", "repair", "respiratory", "stitches",
+        ]
+        assert artifact["trigrams"]["  a"] == [0]
+
+
+# ---------------------------------------------------------------------------
+# Run Tests
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
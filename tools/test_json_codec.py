@@ -0,0 +1,107 @@
+#!/opt/homebrew/bin/python3
+"""
+Unit tests for the JSON serializer backends.
+
+Run with: pytest test_json_codec.py -v
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import json_codec
+
+
+# ---------------------------------------------------------------------------
+# Test Helpers
+# ---------------------------------------------------------------------------
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+# Values where a naive fast encoder would diverge from stdlib json.
+EDGE_CASES: dict[str, Any] = {
+    "accents": "Érythème, naïve",
+    "astral": "\U0001F600 pill",
+    "controls": "tab\tnewline\nnul\x00del\x7f ",
+    "quotes": 'say "hi" \\ back',
+    "floats": [0.1, 2.5, -0.0, 1e16, 1.5e-7, 0.00001, 0.0001, 123456789.123],
+    "big_int": 2 ** 70,
+    "empty": [{}, [], ""],
+    "nested": {"b": {"z": 1, "a": None}, "a": [True, False]},
+}
+
+
+def _reference(obj: Any, compact: bool, ensure_ascii: bool, sort_keys: bool) -> str:
+    """The stdlib encoding dumps() promises to reproduce."""
+    if compact:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=ensure_ascii, sort_keys=sort_keys)
+    return json.dumps(obj, indent=2, ensure_ascii=ensure_ascii, sort_keys=sort_keys)
+
+
+def _documents() -> list[Any]:
+    """Edge cases plus the repo's own data files."""
+    documents: list[Any] = [EDGE_CASES]
+    for path in sorted(DATA_DIR.glob("*.json")) + sorted((DATA_DIR / "billing").glob("*.json")):
+        documents.append(json.loads(path.read_text(encoding="utf-8")))
+    return documents
+
+
+OPTIONS = list(itertools.product([False, True], repeat=3))
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestParity:
+    """Every backend writes byte-identical output."""
+
+    @pytest.mark.parametrize("backend", json_codec.available_backends())
+    @pytest.mark.parametrize("compact,ensure_ascii,sort_keys", OPTIONS)
+    def test_matches_stdlib(
+        self, backend: str, compact: bool, ensure_ascii: bool, sort_keys: bool,
+    ) -> None:
+        """Test output equals stdlib json.dumps for data files and edge cases."""
+        for document in _documents():
+            assert json_codec.dumps(
+                document, compact=compact, ensure_ascii=ensure_ascii,
+                sort_keys=sort_keys, backend=backend,
+            ) == _reference(document, compact, ensure_ascii, sort_keys)
+
+    def test_orjson_is_preferred_when_installed(self) -> None:
+        """Test the fast backend is the default when it is importable."""
+        pytest.importorskip("orjson")
+        assert json_codec.available_backends() == ["orjson", "stdlib"]
+
+
+class TestBackendSelection:
+    """Tests for default_backend and backend names."""
+
+    def test_environment_forces_stdlib(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test EMHUB_JSON_BACKEND selects the backend."""
+        monkeypatch.setenv(json_codec.BACKEND_ENV, "stdlib")
+        assert json_codec.default_backend() == "stdlib"
+
+    def test_unknown_environment_value_falls_back(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test an unavailable backend name is ignored."""
+        monkeypatch.setenv(json_codec.BACKEND_ENV, "simplejson")
+        assert json_codec.default_backend() == json_codec.available_backends()[0]
+
+    def test_unknown_backend_argument_raises(self) -> None:
+        """Test a misspelled backend argument is an error."""
+        with pytest.raises(ValueError):
+            json_codec.dumps({}, backend="fastjson")
+
+
+# ---------------------------------------------------------------------------
+# Run Tests
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,196 @@
+#!/opt/homebrew/bin/python3
+"""
+Unit tests for the nearest-hospital location index.
+
+Run with: pytest test_location_index.py -v
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import location_index
+
+
+# ---------------------------------------------------------------------------
+# Test Helpers
+# ---------------------------------------------------------------------------
+
+LOCATION_INDEX_JS = Path(__file__).parent.parent / "js" / "location-index.js"
+
+# Loads js/location-index.js and prints nearest() for each query on stdin.
+_NODE_PROBE = r"""
+const fs = require("fs");
+const [script, artifactPath] = process.argv.slice(1);
+const LocationIndex = require(script);
+const index = LocationIndex.create(JSON.parse(fs.readFileSync(artifactPath, "utf8")));
+const queries = JSON.parse(fs.readFileSync(0, "utf8"));
+process.stdout.write(JSON.stringify(queries.map(([lat, lon, k, maxKm]) =>
+  index.nearest(lat, lon, k, maxKm).map((hit) => hit.name))));
+"""
+
+
+def _random_sites(count: int, seed: int) -> tuple[list[dict[str, Any]], dict[str, tuple[float, float]]]:
+    """Synthetic locations spread over Ontario's bounding box, one per FSA."""
+    rng = random.Random(seed)
+    locations = []
+    centroids = {}
+    for i in range(count):
+        fsa = f"K{i // 26 % 10}{chr(65 + i % 26)}"
+        centroids[fsa] = (rng.uniform(42.0, 56.5), rng.uniform(-95.0, -74.5))
+        locations.append({"name": f"Site {i:03d}", "address": f"{i} Main St, Town, {fsa} 1A1"})
+    return locations, centroids
+
+
+def _brute_force(
+    locations: list[dict[str, Any]], centroids: dict[str, tuple[float, float]],
+    lat: float, lon: float, k: int,
+) -> list[str]:
+    """Reference answer: sort every site by chord distance."""
+    target = location_index.unit_vector(lat, lon)
+    scored = []
+    for loc in locations:
+        point = location_index.unit_vector(*centroids[location_index.parse_fsa(loc["address"])])
+        scored.append((math.dist(point, target), loc["name"]))
+    return [name for _, name in sorted(scored)[:k]]
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestParseFsa:
+    """Tests for parse_fsa."""
+
+    def test_reads_trailing_postal_code(self) -> None:
+        """Test the FSA comes from the postal code at the end of the address."""
+        assert location_index.parse_fsa("501 Smyth Rd, Ottawa, K1H 8L6") == "K1H"
+        assert location_index.parse_fsa("1 Main St, Town, m4c3e7 ") == "M4C"
+
+    def test_rejects_missing_postal_code(self) -> None:
+        """Test addresses without a trailing postal code give None."""
+        assert location_index.parse_fsa("20260 County Rd 43, Alexandria") is None
+        assert location_index.parse_fsa("") is None
+
+
+class TestLoadCentroids:
+    """Tests for load_centroids."""
+
+    def test_loads_and_normalizes(self, tmp_path: Path) -> None:
+        """Test rows load as uppercase FSA to (lat, lon)."""
+        path = tmp_path / "fsa_centroids.csv"
+        path.write_text("fsa,latitude,longitude\nk1h,45.40,-75.65\n")
+        assert location_index.load_centroids(path) == {"K1H": (45.40, -75.65)}
+
+    def test_rejects_bad_rows(self, tmp_path: Path) -> None:
+        """Test malformed FSAs and coordinates raise ValueError with the line."""
+        path = tmp_path / "fsa_centroids.csv"
+        path.write_text("fsa,latitude,longitude\nK1H,45.4,-75.6\nK1,45,-75\n")
+        with pytest.raises(ValueError, match=":3:"):
+            location_index.load_centroids(path)
+        path.write_text("fsa,latitude,longitude\nK1H,north,-75.6\n")
+        with pytest.raises(ValueError, match="invalid coordinates"):
+            location_index.load_centroids(path)
+
+
+class TestNearest:
+    """Tests for build_index and nearest."""
+
+    def test_matches_brute_force(self) -> None:
+        """Test k-d tree search returns exactly the k closest sites."""
+        locations, centroids = _random_sites(200, seed=3)
+        index, unplaced = location_index.build_index(locations, centroids)
+        assert unplaced == []
+        rng = random.Random(11)
+        for _ in range(100):
+            lat, lon = rng.uniform(41.5, 57.0), rng.uniform(-96.0, -74.0)
+            k = rng.choice((1, 5, 10))
+            names = [name for name, _ in location_index.nearest(index, lat, lon, k)]
+            assert names == _brute_force(locations, centroids, lat, lon, k)
+
+    def test_distance_and_radius(self) -> None:
+        """Test distances are great-circle km and max_km filters results."""
+        locations = [
+            {"name": "Ottawa", "address": "x, K1H 8L6"},
+            {"name": "Toronto", "address": "x, M5G 1X8"},
+        ]
+        centroids = {"K1H": (45.40, -75.65), "M5G": (43.66, -79.39)}
+        index, _ = location_index.build_index(locations, centroids)
+        hits = location_index.nearest(index, 45.40, -75.65, k=2)
+        assert [name for name, _ in hits] == ["Ottawa", "Toronto"]
+        assert hits[0][1] == pytest.approx(0.0, abs=0.01)
+        assert hits[1][1] == pytest.approx(353, abs=5)
+        assert [n for n, _ in location_index.nearest(index, 45.40, -75.65, 2, max_km=100)] == ["Ottawa"]
+
+    def test_reports_unplaced_locations(self) -> None:
+        """Test locations whose FSA has no centroid are left out and reported."""
+        locations = [{"name": "Known", "address": "x, K1H 8L6"}, {"name": "Unknown", "address": "x, P0L 1A0"}]
+        index, unplaced = location_index.build_index(locations, {"K1H": (45.4, -75.65)})
+        assert [loc["name"] for loc in index["locations"]] == ["Known"]
+        assert unplaced == ["Unknown"]
+
+
+class TestJsParity:
+    """Tests that js/location-index.js agrees with the Python reference."""
+
+    @pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+    def test_nearest_matches(self, tmp_path: Path) -> None:
+        """Test the JS and Python searches rank the same sites."""
+        locations, centroids = _random_sites(150, seed=5)
+        index, _ = location_index.build_index(locations, centroids)
+        artifact_path = tmp_path / "location-index.json"
+        artifact_path.write_text(json.dumps(index))
+
+        rng = random.Random(13)
+        queries = [
+            [rng.uniform(42.0, 56.5), rng.uniform(-95.0, -74.5), rng.choice((1, 5, 10)), rng.choice((None, 300))]
+            for _ in range(50)
+        ]
+        result = subprocess.run(
+            ["node", "-e", _NODE_PROBE, str(LOCATION_INDEX_JS), str(artifact_path)],
+            input=json.dumps(queries), capture_output=True, text=True, check=True,
+        )
+        expected = [
+            [name for name, _ in location_index.nearest(index, lat, lon, k, max_km)]
+            for lat, lon, k, max_km in queries
+        ]
+        assert json.loads(result.stdout) == expected
+
+
+class TestWriteLocationIndex:
+    """Tests for write_location_index."""
+
+    def test_skips_without_centroid_table(self, tmp_path: Path) -> None:
+        """Test a missing centroid table skips the step without failing."""
+        output = tmp_path / "location-index.json"
+        assert location_index.write_location_index(output, [], tmp_path / "missing.csv") is True
+        assert not output.exists()
+
+    def test_writes_index(self, tmp_path: Path) -> None:
+        """Test the artifact lists located sites and FSA centroids."""
+        centroids_path = tmp_path / "fsa_centroids.csv"
+        centroids_path.write_text("fsa,latitude,longitude\nK1H,45.4,-75.65\n")
+        output = tmp_path / "location-index.json"
+        locations = [{"name": "Ottawa", "address": "x, K1H 8L6"}]
+        assert location_index.write_location_index(output, locations, centroids_path) is True
+        artifact = json.loads(output.read_text())
+        assert artifact["locations"] == [{"name": "Ottawa", "fsa": "K1H"}]
+        assert artifact["fsas"] == {"K1H": [45.4, -75.65]}
+        assert len(artifact["coords"]) == 3
+
+
+# ---------------------------------------------------------------------------
+# Run Tests
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,317 @@
+#!/opt/homebrew/bin/python3
+"""
+Unit tests for the prebuilt billing search index.
+
+Run with: pytest test_search_index.py -v
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import bench_search
+import build
+import search_index
+
+
+# ---------------------------------------------------------------------------
+# Test Helpers
+# ---------------------------------------------------------------------------
+
+JS_DIR = Path(__file__).parent.parent / "js"
+SEARCH_JS = JS_DIR / "billing" / "search.js"
+SEARCH_WORKER_JS = JS_DIR / "billing" / "search-worker.js"
+SEARCH_CLIENT_JS = JS_DIR / "billing" / "search-client.js"
+
+# Loads js/billing/search.js twice, once from the JSON files and once from
+# the index, and prints decoded fields plus ranked ids per query on stdin.
+_NODE_PROBE = r"""
+const fs = require("fs");
+const path = require("path");
+const [script, indexPath, jsonDir] = process.argv.slice(1);
+const load = () => { delete require.cache[require.resolve(script)]; return require(script); };
+global.fetch = async (p) => ({
+  ok: true, json: async () => JSON.parse(fs.readFileSync(path.join(jsonDir, path.basename(p)), "utf8")),
+});
+const file = fs.readFileSync(indexPath);
+const buffer = file.buffer.slice(file.byteOffset, file.byteOffset + file.byteLength);
+const queries = JSON.parse(fs.readFileSync(0, "utf8"));
+const ranked = (engine) => queries.map((q) => {
+  const r = engine.search(q);
+  return [r.billing.map((e) => e._dataIndex), r.diagnostic.map((e) => e._dataIndex),
+          r.billingTotal, r.diagnosticTotal];
+});
+(async () => {
+  const fromJson = load();
+  await fromJson.loadSearchData("");
+  const jsonDigest = fromJson.searchIndexDigest(["billing_codes.json", "diagnostic_codes.json"].map(
+    (name) => JSON.parse(fs.readFileSync(path.join(jsonDir, name), "utf8"))));
+  const fromIndex = load();
+  const counts = fromIndex.setSearchIndex(buffer);
+  const fields = fromIndex.decodeSearchIndex(buffer).map((records) => records.map((r) =>
+    [r._lowerCode, r._lowerName, r._lowerSearchTerms.join("\n"), r.name]));
+  process.stdout.write(JSON.stringify({
+    counts, jsonDigest, fields, json: ranked(fromJson), index: ranked(fromIndex),
+  }));
+})().catch((e) => { console.error(e); process.exit(1); });
+"""
+
+# Drives js/billing/search-worker.js's message handler with bursts of
+# queries and prints every reply it posts.
+_WORKER_PROBE = r"""
+const fs = require("fs");
+const [engineScript, workerScript, indexPath] = process.argv.slice(1);
+const engine = require(engineScript);
+const SearchWorker = require(workerScript);
+const file = fs.readFileSync(indexPath);
+const buffer = file.buffer.slice(file.byteOffset, file.byteOffset + file.byteLength);
+const replies = [];
+const onMessage = SearchWorker.create(engine, (message) => replies.push(message), null);
+const settle = () => new Promise((resolve) => setTimeout(resolve, 100));
+const steps = JSON.parse(fs.readFileSync(0, "utf8"));
+(async () => {
+  onMessage({ type: "index", buffer });
+  for (const burst of steps) {
+    for (const message of burst) {
+      onMessage(message);
+      await null; // let a running query reach its next slice
+    }
+    await settle();
+  }
+  const plain = (value) => (ArrayBuffer.isView(value) ? Array.from(value) : value);
+  process.stdout.write(JSON.stringify(replies.map((r) => ({
+    ...r, billing: plain(r.billing), diagnostic: plain(r.diagnostic),
+  }))));
+})().catch((e) => { console.error(e); process.exit(1); });
+"""
+
+# Starts js/billing/search-client.js on a stub Worker, has the worker fail
+# while a query is outstanding and prints what the client did.
+_CLIENT_PROBE = r"""
+const SearchClient = require(process.argv[1]);
+let worker = null;
+global.Worker = class {
+  constructor() { worker = this; this.terminated = false; }
+  postMessage(message) {
+    if (message.type !== "index") return;
+    setTimeout(() => this.onmessage({ data: { type: "ready", billing: 1, diagnostic: 1, digest: 7 } }));
+  }
+  terminate() { this.terminated = true; }
+};
+global.fetch = async () => ({ ok: true, arrayBuffer: async () => new ArrayBuffer(16) });
+const outcome = (promise) => promise.then(() => "resolved", (err) => "rejected: " + err.message);
+const failures = [];
+(async () => {
+  const client = await SearchClient.start("search-worker.js", "search-index.bin", null,
+    (err) => failures.push(err.message));
+  const pending = outcome(client.query("fracture"));
+  worker.onerror({ message: "boom" });
+  worker.onerror({ message: "again" });
+  const later = await outcome(client.query("lac"));
+  client.cancel();
+  process.stdout.write(JSON.stringify({
+    digest: client.digest, failures, pending: await pending, later, terminated: worker.terminated,
+  }));
+})().catch((e) => { console.error(e); process.exit(1); });
+"""
+
+
+def _code(code: str, name: str, subcategory: str = "", terms: list[str] | None = None) -> dict[str, Any]:
+    """Create a billing or diagnostic code entry."""
+    entry: dict[str, Any] = {"code": code, "name": name, "search_terms": terms or []}
+    if subcategory:
+        entry["subcategory"] = subcategory
+    return entry
+
+
+@pytest.fixture
+def code_lists() -> list[list[dict[str, Any]]]:
+    """Billing and diagnostic codes with subcategories, terms and non-ASCII names."""
+    return [
+        [
+            _code("F027", "Colles Fracture – Closed Reduction", terms=["Distal Radius", "FOOSH"]),
+            _code("Z154", "Laceration Repair – Face", terms=["sutures"]),
+            _code("A001", "Minor Assessment"),
+        ],
+        [
+            _code("813", "Fracture of radius and ulna", subcategory="Fractures"),
+            _code("V99", "Café-au-lait \U0001F9EA check"),
+        ],
+    ]
+
+
+def _run_node(probe: str, args: list[Path], stdin: Any) -> Any:
+    result = subprocess.run(
+        ["node", "-e", probe, *map(str, args)],
+        input=json.dumps(stdin), capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestEncoding:
+    """Tests for record_fields, encode_index and decode_index."""
+
+    def test_record_fields(self, code_lists: list[list[dict[str, Any]]]) -> None:
+        """Test fields are lowercased, names prefixed by subcategory and terms joined."""
+        billing, diagnostic = code_lists
+        assert search_index.record_fields(billing[0]) == (
+            "f027", "colles fracture – closed reduction", "distal radius\nfoosh",
+            "Colles Fracture – Closed Reduction",
+        )
+        assert search_index.record_fields(diagnostic[0])[1] == "fractures fracture of radius and ulna"
+
+    def test_round_trip(self, code_lists: list[list[dict[str, Any]]]) -> None:
+        """Test decoding returns every record's fields, including astral characters."""
+        decoded = search_index.decode_index(search_index.encode_index(code_lists))
+        assert decoded == [
+            [search_index.record_fields(code) for code in codes] for codes in code_lists
+        ]
+
+    def test_rejects_other_files(self) -> None:
+        """Test a buffer without the magic number and version is refused."""
+        with pytest.raises(ValueError):
+            search_index.decode_index(b"{}\n" + bytes(16))
+
+    def test_digest_tracks_code_lists(self, code_lists: list[list[dict[str, Any]]]) -> None:
+        """Test the header digest changes when codes change but counts do not."""
+        digest = search_index.source_digest(code_lists)
+        assert search_index._HEADER.unpack_from(search_index.encode_index(code_lists))[3] == digest
+
+        code_lists[0][0], code_lists[0][1] = code_lists[0][1], code_lists[0][0]
+        assert search_index.source_digest(code_lists) != digest
+        code_lists[0][0], code_lists[0][1] = code_lists[0][1], code_lists[0][0]
+        code_lists[1][0]["search_terms"] = ["broken arm"]
+        assert search_index.source_digest(code_lists) != digest
+
+    def test_write_search_index(self, tmp_path: Path, code_lists: list[list[dict[str, Any]]]) -> None:
+        """Test the build step writes the index and reports failures."""
+        output = tmp_path / "search-index.bin"
+        assert search_index.write_search_index(output, *code_lists) is True
+        assert search_index.decode_index(output.read_bytes())[1][0][0] == "813"
+        assert search_index.write_search_index(tmp_path, *code_lists) is False
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+class TestJsParity:
+    """Tests that search.js ranks the same over the index as over the JSON files."""
+
+    def test_decodes_and_ranks_real_data(self, tmp_path: Path) -> None:
+        """Test the decoded fields and every benchmark query's ranking match."""
+        billing_codes = build._load_json(build.BILLING_DIR / "billing_codes.json")
+        diagnostic_codes = build._load_json(build.BILLING_DIR / "diagnostic_codes.json")
+        index_path = tmp_path / "search-index.bin"
+        assert search_index.write_search_index(index_path, billing_codes, diagnostic_codes)
+
+        queries = [
+            q["query"] for q in bench_search.load_corpus(bench_search.DEFAULT_CORPUS)
+            if q["engine"] == "billing"
+        ]
+        output = _run_node(_NODE_PROBE, [SEARCH_JS, index_path, build.BILLING_DIR], queries)
+
+        digest = search_index.source_digest([billing_codes, diagnostic_codes])
+        assert output["counts"] == {
+            "billing": len(billing_codes), "diagnostic": len(diagnostic_codes), "digest": digest,
+        }
+        assert output["jsonDigest"] == digest
+        assert output["fields"] == [
+            [list(search_index.record_fields(code)) for code in codes]
+            for codes in (billing_codes, diagnostic_codes)
+        ]
+        assert output["index"] == output["json"]
+        assert any(billing or diagnostic for billing, diagnostic, _, _ in output["index"])
+
+    def test_stale_index_with_equal_counts(self, tmp_path: Path) -> None:
+        """Test an index built from reordered codes is told apart from the JSON."""
+        billing_codes = build._load_json(build.BILLING_DIR / "billing_codes.json")
+        diagnostic_codes = build._load_json(build.BILLING_DIR / "diagnostic_codes.json")
+        stale = [billing_codes[1], billing_codes[0], *billing_codes[2:]]
+        index_path = tmp_path / "search-index.bin"
+        assert search_index.write_search_index(index_path, stale, diagnostic_codes)
+
+        output = _run_node(_NODE_PROBE, [SEARCH_JS, index_path, build.BILLING_DIR], [])
+        assert output["counts"]["billing"] == len(billing_codes)
+        assert output["counts"]["digest"] != output["jsonDigest"]
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+class TestSearchWorker:
+    """Tests for the search worker's message handling."""
+
+    @pytest.fixture
+    def index_path(self, tmp_path: Path, code_lists: list[list[dict[str, Any]]]) -> Path:
+        """The code_lists index, written to disk."""
+        path = tmp_path / "search-index.bin"
+        path.write_bytes(search_index.encode_index(code_lists))
+        return path
+
+    def _replies(self, index_path: Path, bursts: list[list[dict[str, Any]]]) -> list[dict[str, Any]]:
+        return _run_node(_WORKER_PROBE, [SEARCH_JS, SEARCH_WORKER_JS, index_path], bursts)
+
+    def test_answers_only_the_newest_query(
+        self, index_path: Path, code_lists: list[list[dict[str, Any]]],
+    ) -> None:
+        """Test queries superseded mid-burst get no reply and ids are ranked."""
+        replies = self._replies(index_path, [[
+            {"type": "search", "seq": 1, "query": "lac"},
+            {"type": "search", "seq": 2, "query": "fract"},
+            {"type": "search", "seq": 3, "query": "fracture"},
+        ]])
+        assert replies[0] == {
+            "type": "ready", "billing": 3, "diagnostic": 2,
+            "digest": search_index.source_digest(code_lists),
+        }
+        assert replies[1:] == [{
+            "type": "results", "seq": 3, "billing": [0], "diagnostic": [0],
+            "billingTotal": 1, "diagnosticTotal": 1, "corrected": None,
+        }]
+
+    def test_cancel_drops_running_query(self, index_path: Path) -> None:
+        """Test a cancel after a query suppresses its reply; later queries still run."""
+        replies = self._replies(index_path, [
+            [{"type": "search", "seq": 1, "query": "fracture"}, {"type": "cancel", "seq": 2}],
+            [{"type": "search", "seq": 3, "query": "café"}],
+        ])
+        assert [(r["type"], r.get("seq")) for r in replies] == [("ready", None), ("results", 3)]
+        assert replies[1]["diagnostic"] == [1]
+
+    def test_reports_bad_index(self, tmp_path: Path) -> None:
+        """Test an unreadable index is answered with an error, not "ready"."""
+        path = tmp_path / "bad.bin"
+        path.write_bytes(b"not an index at all")
+        replies = self._replies(path, [])
+        assert [r["type"] for r in replies] == ["error"]
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+class TestSearchClient:
+    """Tests for the search worker client."""
+
+    def test_failed_worker_rejects_queries(self) -> None:
+        """Test a worker error fails the client once and rejects its queries."""
+        output = _run_node(_CLIENT_PROBE, [SEARCH_CLIENT_JS], None)
+        assert output == {
+            "digest": 7,
+            "failures": ["boom"],
+            "pending": "rejected: boom",
+            "later": "rejected: boom",
+            "terminated": True,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Run Tests
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,170 @@
+#!/opt/homebrew/bin/python3
+"""
+Unit tests for the local static server.
+
+Run with: pytest test_serve.py -v
+"""
+
+from __future__ import annotations
+
+import gzip
+import http.client
+import http.server
+import os
+import threading
+from collections.abc import Iterator
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+import serve
+
+
+# ---------------------------------------------------------------------------
+# Test Helpers
+# ---------------------------------------------------------------------------
+
+SCRIPT = b"const DATA = " + b"[1,2,3]," * 200 + b";\n"
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> Iterator[tuple[str, int]]:
+    """Serve a directory with one pre-compressed script in a background thread."""
+    (tmp_path / "index.html").write_text("<!doctype html>")
+    (tmp_path / "app.js").write_bytes(SCRIPT)
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(SCRIPT))
+    handler = partial(serve.StaticHandler, directory=str(tmp_path))
+    handler.log_message = lambda *args: None  # type: ignore[attr-defined]
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd.server_address[:2]
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _get(
+    address: tuple[str, int], path: str, **headers: str,
+) -> tuple[http.client.HTTPResponse, bytes]:
+    """Issue a GET and return the response and its body."""
+    conn = http.client.HTTPConnection(*address, timeout=5)
+    conn.request("GET", path, headers={k.replace("_", "-"): v for k, v in headers.items()})
+    response = conn.getresponse()
+    body = response.read()
+    conn.close()
+    return response, body
+
+
+# ---------------------------------------------------------------------------
+# Header Helpers
+# ---------------------------------------------------------------------------
+
+
+class TestChooseEncoding:
+    """Tests for choose_encoding."""
+
+    def test_prefers_brotli(self) -> None:
+        """Test br wins over gzip when both are acceptable and available."""
+        assert serve.choose_encoding("gzip, deflate, br", {"br", "gzip"}) == "br"
+
+    def test_respects_zero_quality(self) -> None:
+        """Test q=0 excludes an encoding."""
+        assert serve.choose_encoding("br;q=0, gzip", {"br", "gzip"}) == "gzip"
+
+    def test_wildcard_and_missing_header(self) -> None:
+        """Test * accepts anything and a missing header accepts nothing."""
+        assert serve.choose_encoding("*", {"gzip"}) == "gzip"
+        assert serve.choose_encoding(None, {"gzip"}) is None
+
+    def test_unavailable_encoding(self) -> None:
+        """Test no encoding is chosen without a sibling file."""
+        assert serve.choose_encoding("br", {"gzip"}) is None
+
+
+class TestEtagMatches:
+    """Tests for etag_matches."""
+
+    def test_list_and_weak_comparison(self) -> None:
+        """Test any listed tag matches, ignoring the weak prefix."""
+        assert serve.etag_matches('"a", W/"b"', '"b"')
+        assert serve.etag_matches("*", '"b"')
+        assert not serve.etag_matches('"a"', '"b"')
+
+
+# ---------------------------------------------------------------------------
+# Request Handler
+# ---------------------------------------------------------------------------
+
+
+class TestStaticHandler:
+    """Tests for StaticHandler against a live server."""
+
+    def test_serves_gzip_variant(self, server: tuple[str, int]) -> None:
+        """Test gzip-accepting clients get the .gz sibling with the right type."""
+        response, body = _get(server, "/app.js", Accept_Encoding="gzip")
+        assert response.status == 200
+        assert response.getheader("Content-Encoding") == "gzip"
+        assert response.getheader("Content-Type") == "text/javascript"
+        assert response.getheader("Vary") == "Accept-Encoding"
+        assert gzip.decompress(body) == SCRIPT
+
+    def test_serves_identity_without_accept_encoding(self, server: tuple[str, int]) -> None:
+        """Test clients without Accept-Encoding get the raw file."""
+        response, body = _get(server, "/app.js")
+        assert response.getheader("Content-Encoding") is None
+        assert body == SCRIPT
+
+    def test_etag_differs_per_representation(self, server: tuple[str, int]) -> None:
+        """Test the gzip and identity responses have distinct ETags."""
+        gz, _ = _get(server, "/app.js", Accept_Encoding="gzip")
+        raw, _ = _get(server, "/app.js")
+        assert gz.getheader("ETag") != raw.getheader("ETag")
+
+    def test_if_none_match_returns_304(self, server: tuple[str, int]) -> None:
+        """Test a matching ETag yields 304 with no body."""
+        first, _ = _get(server, "/app.js", Accept_Encoding="gzip")
+        etag = first.getheader("ETag")
+        response, body = _get(server, "/app.js", Accept_Encoding="gzip", If_None_Match=etag)
+        assert response.status == 304
+        assert body == b""
+        assert response.getheader("ETag") == etag
+
+    def test_if_modified_since_returns_304(self, server: tuple[str, int]) -> None:
+        """Test a current Last-Modified date yields 304."""
+        first, _ = _get(server, "/app.js")
+        response, _ = _get(server, "/app.js", If_Modified_Since=first.getheader("Last-Modified"))
+        assert response.status == 304
+
+    def test_ignores_sibling_older_than_source(self, server: tuple[str, int], tmp_path: Path) -> None:
+        """Test an edited file is served raw until its .gz sibling is rebuilt."""
+        edited = SCRIPT + b"// edited\n"
+        (tmp_path / "app.js").write_bytes(edited)
+        stale = (tmp_path / "app.js").stat().st_mtime_ns - 1_000_000_000
+        os.utime(tmp_path / "app.js.gz", ns=(stale, stale))
+
+        response, body = _get(server, "/app.js", Accept_Encoding="gzip")
+        assert response.getheader("Content-Encoding") is None
+        assert body == edited
+
+    def test_cache_control(self, server: tuple[str, int]) -> None:
+        """Test revisioned URLs are immutable and others revalidate."""
+        plain, _ = _get(server, "/app.js")
+        revisioned, _ = _get(server, "/app.js?v=abc123")
+        assert plain.getheader("Cache-Control") == serve.REVALIDATE_CACHE_CONTROL
+        assert revisioned.getheader("Cache-Control") == serve.IMMUTABLE_CACHE_CONTROL
+
+    def test_directory_serves_index(self, server: tuple[str, int]) -> None:
+        """Test the root URL serves index.html with validators."""
+        response, body = _get(server, "/")
+        assert response.status == 200
+        assert body == b"<!doctype html>"
+        assert response.getheader("ETag")
+
+
+# ---------------------------------------------------------------------------
+# Run Tests
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,141 @@
+#!/opt/homebrew/bin/python3
+"""
+Unit tests for per-sheet workbook hashing and caching.
+
+Run with: pytest test_sheet_cache.py -v
+"""
+
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path
+
+import pytest
+
+import sheet_cache
+
+
+# ---------------------------------------------------------------------------
+# Test Helpers
+# ---------------------------------------------------------------------------
+
+_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+
+def _write_xlsx(
+    path: Path,
+    sheets: dict[str, list[int]],
+    shared: list[str],
+    active_cell: str = "A1",
+) -> Path:
+    """Write a minimal .xlsx whose sheets hold shared-string references."""
+    sheet_entries = "".join(
+        f'<sheet name="{name}" sheetId="{i}" r:id="rId{i}"/>'
+        for i, name in enumerate(sheets, start=1)
+    )
+    rels = "".join(
+        f'<Relationship Id="rId{i}" Type="{_REL}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+        for i in range(1, len(sheets) + 1)
+    )
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(
+            "xl/workbook.xml",
+            f'<workbook xmlns="{_MAIN}" xmlns:r="{_REL}"><sheets>{sheet_entries}</sheets></workbook>',
+        )
+        archive.writestr(
+            "xl/_rels/workbook.xml.rels",
+            f'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">{rels}</Relationships>',
+        )
+        archive.writestr(
+            "xl/sharedStrings.xml",
+            f'<sst xmlns="{_MAIN}">' + "".join(f"<si><t>{s}</t></si>" for s in shared) + "</sst>",
+        )
+        for i, refs in enumerate(sheets.values(), start=1):
+            cells = "".join(f'<c r="A{r}" t="s"><v>{ref}</v></c>' for r, ref in enumerate(refs, start=1))
+            archive.writestr(
+                f"xl/worksheets/sheet{i}.xml",
+                f'<worksheet xmlns="{_MAIN}"><sheetViews><sheetView><selection activeCell="{active_cell}"/>'
+                f"</sheetView></sheetViews><sheetData><row r=\"1\">{cells}</row></sheetData></worksheet>",
+            )
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestSheetDigests:
+    """Tests for sheet_digests."""
+
+    def test_one_sheet_edit_changes_one_digest(self, tmp_path: Path) -> None:
+        """Test editing a shared string used by one sheet leaves the other's digest."""
+        before = sheet_cache.sheet_digests(
+            _write_xlsx(tmp_path / "a.xlsx", {"Allergy": [0], "ENT": [1]}, ["Cetirizine", "Amoxicillin"]),
+        )
+        after = sheet_cache.sheet_digests(
+            _write_xlsx(tmp_path / "b.xlsx", {"Allergy": [0], "ENT": [1]}, ["Cetirizine", "Cefuroxime"]),
+        )
+        assert list(before) == ["Allergy", "ENT"]
+        assert before["Allergy"] == after["Allergy"]
+        assert before["ENT"] != after["ENT"]
+
+    def test_ignores_view_state(self, tmp_path: Path) -> None:
+        """Test moving the selected cell does not change digests."""
+        sheets = {"Allergy": [0]}
+        a = sheet_cache.sheet_digests(_write_xlsx(tmp_path / "a.xlsx", sheets, ["x"], "A1"))
+        b = sheet_cache.sheet_digests(_write_xlsx(tmp_path / "b.xlsx", sheets, ["x"], "C7"))
+        assert a == b
+
+    def test_salt_changes_every_digest(self, tmp_path: Path) -> None:
+        """Test a different salt (e.g. converter source) invalidates all sheets."""
+        path = _write_xlsx(tmp_path / "a.xlsx", {"Allergy": [0], "ENT": [0]}, ["x"])
+        plain = sheet_cache.sheet_digests(path)
+        salted = sheet_cache.sheet_digests(path, salt="v2")
+        assert all(plain[name] != salted[name] for name in plain)
+
+
+class TestSheetCache:
+    """Tests for SheetCache."""
+
+    def test_reuses_unchanged_sheets(self, tmp_path: Path) -> None:
+        """Test saved results are returned only while a sheet's digest matches."""
+        path = _write_xlsx(tmp_path / "book.xlsx", {"Allergy": [0], "ENT": [1]}, ["a", "b"])
+        cache = sheet_cache.SheetCache.open(path)
+        assert cache.get("Allergy") is None
+        cache.put("Allergy", [{"med": "Cetirizine"}])
+        cache.put("ENT", [{"med": "Amoxicillin"}])
+        cache.save()
+
+        _write_xlsx(path, {"Allergy": [0], "ENT": [1]}, ["a", "c"])
+        reopened = sheet_cache.SheetCache.open(path)
+        assert reopened.get("Allergy") == [{"med": "Cetirizine"}]
+        assert reopened.get("ENT") is None
+        assert (reopened.hits, reopened.misses) == (1, 1)
+
+    def test_unreadable_workbook_disables_cache(self, tmp_path: Path) -> None:
+        """Test a missing or corrupt workbook always misses and writes nothing."""
+        path = tmp_path / "broken.xlsx"
+        path.write_bytes(b"not a zip")
+        cache = sheet_cache.SheetCache.open(path)
+        cache.put("Allergy", [])
+        cache.save()
+        assert cache.get("Allergy") is None
+        assert not (tmp_path / sheet_cache.CACHE_DIRNAME).exists()
+
+    def test_corrupt_cache_file_is_ignored(self, tmp_path: Path) -> None:
+        """Test an unreadable cache file is treated as empty."""
+        path = _write_xlsx(tmp_path / "book.xlsx", {"Allergy": [0]}, ["a"])
+        cache_dir = tmp_path / sheet_cache.CACHE_DIRNAME
+        cache_dir.mkdir()
+        (cache_dir / "book.xlsx.sheets.json").write_text("{oops")
+        assert sheet_cache.SheetCache.open(path).get("Allergy") is None
+
+
+# ---------------------------------------------------------------------------
+# Run Tests
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
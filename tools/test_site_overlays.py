@@ -0,0 +1,227 @@
+#!/opt/homebrew/bin/python3
+"""
+Unit tests for per-site formulary overlays.
+
+Run with: pytest test_site_overlays.py -v
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+import build_cache
+import site_overlays
+
+
+# ---------------------------------------------------------------------------
+# Test Helpers
+# ---------------------------------------------------------------------------
+
+SITE_OVERLAY_JS = Path(__file__).parent.parent / "js" / "site-overlay.js"
+
+# Loads js/site-overlay.js and prints apply() per specialty for the input on stdin.
+_NODE_PROBE = r"""
+const fs = require("fs");
+const SiteOverlay = require(process.argv[1]);
+const { chunks, ops } = JSON.parse(fs.readFileSync(0, "utf8"));
+const specialties = Object.keys(chunks);
+for (const specialty of Object.keys(ops)) {
+  if (!specialties.includes(specialty)) specialties.push(specialty);
+}
+process.stdout.write(JSON.stringify(
+  specialties.flatMap((s) => SiteOverlay.apply(chunks[s] || [], ops[s]))));
+"""
+
+
+@pytest.fixture(autouse=True)
+def isolated_build_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep overlay conversions out of the repo's build cache."""
+    cache_dir = tmp_path / "build-cache"
+    monkeypatch.setenv(build_cache.CACHE_DIR_ENV, str(cache_dir))
+    return cache_dir
+
+
+def _med(
+    specialty: str, name: str, indication: str = "", population: str = "Adult", **extra: Any,
+) -> dict[str, Any]:
+    """Create a converted medication record."""
+    return {
+        "specialty": specialty, "population": population, "subcategory": "",
+        "med": name, "indication": indication, **extra,
+    }
+
+
+def _op(action: str, med: dict[str, Any]) -> dict[str, Any]:
+    return {"action": action, "med": med}
+
+
+@pytest.fixture
+def base() -> list[dict[str, Any]]:
+    """Base formulary with a repeated key in Analgesia."""
+    return [
+        _med("Analgesia", "Ibuprofen", "Pain", dose_text="400mg"),
+        _med("Analgesia", "Ibuprofen", "Pain", dose_text="600mg"),
+        _med("Analgesia", "Naproxen", "Pain"),
+        _med("ENT", "Ciprodex", "Otitis externa"),
+        _med("ENT", "Mometasone", "Rhinitis"),
+    ]
+
+
+def _write_overlay(path: Path, sheets: dict[str, list[dict[str, Any]]]) -> Path:
+    """Write an overlay workbook with one sheet per specialty."""
+    with pd.ExcelWriter(path) as writer:
+        for sheet, rows in sheets.items():
+            pd.DataFrame(rows).to_excel(writer, sheet_name=sheet, index=False)
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestApplyOverlay:
+    """Tests for apply_overlay."""
+
+    def test_override_remove_and_add(self, base: list[dict[str, Any]]) -> None:
+        """Test overrides stay in place, removes drop and adds join their specialty."""
+        ops = [
+            _op("override", _med("Analgesia", "Naproxen", "Pain", dose_text="250mg")),
+            _op("remove", _med("ENT", "Ciprodex", "Otitis externa")),
+            _op("add", _med("Analgesia", "Ketorolac", "Pain")),
+            _op("add", _med("Toxicology", "Naloxone", "Overdose")),
+        ]
+        merged, unmatched = site_overlays.apply_overlay(base, ops)
+        assert unmatched == 0
+        assert [(m["specialty"], m["med"]) for m in merged] == [
+            ("Analgesia", "Ibuprofen"), ("Analgesia", "Ibuprofen"),
+            ("Analgesia", "Naproxen"), ("Analgesia", "Ketorolac"),
+            ("ENT", "Mometasone"), ("Toxicology", "Naloxone"),
+        ]
+        assert merged[2]["dose_text"] == "250mg"
+        assert "dose_text" not in base[2]
+
+    def test_repeated_keys_target_rows_in_order(self, base: list[dict[str, Any]]) -> None:
+        """Test the second op for a key targets the key's second base row."""
+        ops = [
+            _op("override", _med("Analgesia", "Ibuprofen", "Pain", dose_text="400mg")),
+            _op("remove", _med("Analgesia", "Ibuprofen", "Pain")),
+        ]
+        merged, _ = site_overlays.apply_overlay(base, ops)
+        ibuprofen = [m["dose_text"] for m in merged if m["med"] == "Ibuprofen"]
+        assert ibuprofen == ["400mg"]
+
+    def test_unmatched_ops_are_counted(self, base: list[dict[str, Any]]) -> None:
+        """Test ops whose key is not in the base are skipped and counted."""
+        ops = [
+            _op("remove", _med("ENT", "Ciprodex", "Otitis media")),
+            _op("override", _med("ENT", "Mometasone", "Rhinitis", population="Pediatric")),
+        ]
+        merged, unmatched = site_overlays.apply_overlay(base, ops)
+        assert unmatched == 2
+        assert merged == base
+
+    def test_groups_apply_per_specialty(self, base: list[dict[str, Any]]) -> None:
+        """Test applying each specialty's ops to its rows matches the whole-list merge."""
+        ops = [
+            _op("add", _med("ENT", "Fluticasone", "Rhinitis")),
+            _op("remove", _med("Analgesia", "Ibuprofen", "Pain")),
+            _op("remove", _med("Analgesia", "Ibuprofen", "Pain")),
+        ]
+        merged, _ = site_overlays.apply_overlay(base, ops)
+        grouped = site_overlays.ops_by_specialty(ops)
+        piecewise = []
+        for specialty in dict.fromkeys(m["specialty"] for m in base):
+            rows = [m for m in base if m["specialty"] == specialty]
+            piecewise += site_overlays.apply_overlay(rows, grouped.get(specialty, []))[0]
+        assert piecewise == merged
+
+
+class TestConvertOverlay:
+    """Tests for convert_overlay and find_overlays."""
+
+    def test_reads_actions(self, tmp_path: Path) -> None:
+        """Test rows become ops named after the workbook, remove ops keep only the key."""
+        path = _write_overlay(tmp_path / "North Site.xlsx", {
+            "Analgesia": [
+                {"Action": "Override", "Med": "Naproxen", "Indication": "Pain",
+                 "Population": "Adult", "Dose": "250mg"},
+                {"Action": "remove", "Med": "Ibuprofen", "Indication": "Pain",
+                 "Population": "Adult", "Dose": "400mg"},
+                {"Action": "", "Med": "Codeine", "Population": "Adult"},
+            ],
+        })
+        overlay = site_overlays.convert_overlay(path)
+        assert overlay is not None
+        assert overlay["site"] == "North Site"
+        assert [op["action"] for op in overlay["ops"]] == ["override", "remove"]
+        assert overlay["ops"][0]["med"]["dose_text"] == "250mg"
+        assert overlay["ops"][1]["med"] == _med("Analgesia", "Ibuprofen", "Pain")
+
+    def test_missing_action_column_skips_sheet(self, tmp_path: Path) -> None:
+        """Test a sheet without the Action column contributes no ops."""
+        path = _write_overlay(tmp_path / "site.xlsx", {"ENT": [{"Med": "Ciprodex"}]})
+        overlay = site_overlays.convert_overlay(path, use_cache=False)
+        assert overlay is not None and overlay["ops"] == []
+
+    def test_reuses_cached_conversion(self, tmp_path: Path, isolated_build_cache: Path) -> None:
+        """Test an unchanged overlay is served from the build cache."""
+        path = _write_overlay(tmp_path / "site.xlsx", {
+            "ENT": [{"Action": "add", "Med": "Fluticasone", "Population": "Adult"}],
+        })
+        first = site_overlays.convert_overlay(path)
+        assert len(list(isolated_build_cache.glob("*/*"))) == 1
+        assert site_overlays.convert_overlay(path) == first
+
+    def test_unreadable_workbook(self, tmp_path: Path) -> None:
+        """Test a missing or corrupt workbook returns None."""
+        (tmp_path / "bad.xlsx").write_bytes(b"not a workbook")
+        assert site_overlays.convert_overlay(tmp_path / "bad.xlsx") is None
+        assert site_overlays.convert_overlay(tmp_path / "missing.xlsx") is None
+
+    def test_find_overlays(self, tmp_path: Path) -> None:
+        """Test overlays are listed in name order, skipping Excel lock files."""
+        for name in ("b.xlsx", "a.xlsx", "~$a.xlsx", "notes.txt"):
+            (tmp_path / name).write_bytes(b"")
+        assert [p.name for p in site_overlays.find_overlays(tmp_path)] == ["a.xlsx", "b.xlsx"]
+        assert site_overlays.find_overlays(tmp_path / "missing") == []
+
+
+class TestJsParity:
+    """Tests that js/site-overlay.js merges like the Python reference."""
+
+    @pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+    def test_apply_matches(self, base: list[dict[str, Any]]) -> None:
+        """Test per-chunk JS merging reproduces apply_overlay."""
+        ops = [
+            _op("remove", _med("Analgesia", "Ibuprofen", "Pain")),
+            _op("override", _med("Analgesia", "Ibuprofen", "Pain", dose_text="800mg")),
+            _op("add", _med("Toxicology", "Naloxone", "Overdose")),
+            _op("add", _med("ENT", "Ciprodex", "Otitis externa", dose_text="4 drops")),
+            _op("remove", _med("ENT", "Ciprodex", "Otitis externa")),
+            _op("remove", _med("ENT", "Unknown", "")),
+        ]
+        chunks: dict[str, list[dict[str, Any]]] = {}
+        for med in base:
+            chunks.setdefault(med["specialty"], []).append(med)
+        result = subprocess.run(
+            ["node", "-e", _NODE_PROBE, str(SITE_OVERLAY_JS)],
+            input=json.dumps({"chunks": chunks, "ops": site_overlays.ops_by_specialty(ops)}),
+            capture_output=True, text=True, check=True,
+        )
+        assert json.loads(result.stdout) == site_overlays.apply_overlay(base, ops)[0]
+
+
+# ---------------------------------------------------------------------------
+# Run Tests
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
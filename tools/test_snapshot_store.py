@@ -0,0 +1,150 @@
+#!/opt/homebrew/bin/python3
+"""
+Unit tests for the versioned snapshot store.
+
+Run with: pytest test_snapshot_store.py -v
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import snapshot_store
+
+
+# ---------------------------------------------------------------------------
+# Test Helpers
+# ---------------------------------------------------------------------------
+
+
+def _datasets(fee: float = 10.0, extra: bool = False) -> dict[str, list[dict[str, Any]]]:
+    """Small billing/diagnostic datasets with a tweakable fee and extra code."""
+    billing = [
+        {"code": "A001", "name": "Assessment", "fee": fee},
+        {"code": "Z208", "name": "Repair", "fee": 121.6},
+        {"code": "Z208", "name": "Repair (layered)", "fee": 97.35},
+    ]
+    if extra:
+        billing.append({"code": "K990", "name": "Travel Premium", "fee": 36.0})
+    return {
+        "billing_codes": billing,
+        "diagnostic_codes": [{"code": "460", "name": "Common cold"}],
+    }
+
+
+@pytest.fixture
+def conn(tmp_path: Path) -> sqlite3.Connection:
+    """An empty store in a temp directory."""
+    connection = snapshot_store.open_store(tmp_path / "snapshots.sqlite")
+    yield connection
+    connection.close()
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestRecordKeys:
+    """Tests for record_keys."""
+
+    def test_repeated_keys_are_numbered(self) -> None:
+        """Test duplicate codes get ordinal suffixes in source order."""
+        keys = snapshot_store.record_keys("billing_codes", _datasets()["billing_codes"])
+        assert keys == ["A001", "Z208", "Z208 #2"]
+
+    def test_prescription_key_fields(self) -> None:
+        """Test prescriptions key on specialty, population, subcategory, med, indication."""
+        med = {"specialty": "ENT", "population": "Adult", "subcategory": "",
+               "med": "Amoxicillin", "indication": "AOM", "dose_text": "500mg"}
+        assert snapshot_store.record_keys("prescriptions", [med]) == ["ENT / Adult /  / Amoxicillin / AOM"]
+
+
+class TestSnapshots:
+    """Tests for record_snapshot, get_snapshot and resolve_snapshot."""
+
+    def test_round_trip(self, conn: sqlite3.Connection) -> None:
+        """Test a snapshot returns its records in source order."""
+        snapshot_id = snapshot_store.record_snapshot(conn, _datasets())
+        assert snapshot_store.get_snapshot(conn, snapshot_id) == _datasets()
+        assert list(snapshot_store.get_snapshot(conn, snapshot_id, "diagnostic_codes")) == ["diagnostic_codes"]
+
+    def test_deduplicates_records_and_manifests(self, conn: sqlite3.Connection) -> None:
+        """Test unchanged datasets share manifests and edits add one record."""
+        snapshot_store.record_snapshot(conn, _datasets())
+        snapshot_store.record_snapshot(conn, _datasets())
+        assert conn.execute("SELECT COUNT(*) FROM manifests").fetchone()[0] == 2
+        assert conn.execute("SELECT COUNT(*) FROM records").fetchone()[0] == 4
+
+        snapshot_store.record_snapshot(conn, _datasets(fee=12.5))
+        assert conn.execute("SELECT COUNT(*) FROM manifests").fetchone()[0] == 3
+        assert conn.execute("SELECT COUNT(*) FROM records").fetchone()[0] == 5
+
+    def test_resolves_point_in_time(self, conn: sqlite3.Connection) -> None:
+        """Test ids, 'latest', dates and timestamps resolve to snapshots."""
+        first = snapshot_store.record_snapshot(conn, _datasets(), created_at="2026-01-05T09:00:00")
+        second = snapshot_store.record_snapshot(conn, _datasets(12.5), created_at="2026-02-10T17:30:00")
+        assert snapshot_store.resolve_snapshot(conn, str(first)) == first
+        assert snapshot_store.resolve_snapshot(conn, "latest") == second
+        assert snapshot_store.resolve_snapshot(conn, "2026-02-09") == first
+        assert snapshot_store.resolve_snapshot(conn, "2026-02-10") == second
+        assert snapshot_store.resolve_snapshot(conn, "2026-02-10T12:00") == first
+        assert snapshot_store.resolve_snapshot(conn, "2025-12-31") is None
+        assert snapshot_store.resolve_snapshot(conn, "99") is None
+        assert snapshot_store.resolve_snapshot(conn, "yesterday") is None
+
+
+class TestDiffSnapshots:
+    """Tests for diff_snapshots."""
+
+    def test_record_level_changes(self, conn: sqlite3.Connection) -> None:
+        """Test added, removed and changed records with their changed fields."""
+        old = snapshot_store.record_snapshot(conn, _datasets())
+        new_data = _datasets(fee=12.5, extra=True)
+        del new_data["billing_codes"][2]
+        new = snapshot_store.record_snapshot(conn, new_data)
+
+        diff = snapshot_store.diff_snapshots(conn, old, new)
+        assert diff["billing_codes"] == {
+            "added": ["K990"], "removed": ["Z208 #2"], "changed": {"A001": ["fee"]},
+        }
+        assert diff["diagnostic_codes"] == {"added": [], "removed": [], "changed": {}}
+        assert "~ A001 (fee)" in snapshot_store.format_diff(diff)
+
+    def test_missing_dataset(self, conn: sqlite3.Connection) -> None:
+        """Test a dataset absent from one side diffs as all added/removed."""
+        old = snapshot_store.record_snapshot(conn, {"diagnostic_codes": [{"code": "460"}]})
+        new = snapshot_store.record_snapshot(conn, {})
+        assert snapshot_store.diff_snapshots(conn, old, new)["diagnostic_codes"]["removed"] == ["460"]
+
+
+class TestWriteSnapshotAndCli:
+    """Tests for write_snapshot and the CLI."""
+
+    def test_write_and_diff_via_cli(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test build snapshots accumulate and the CLI lists and diffs them."""
+        store = tmp_path / "snapshots.sqlite"
+        assert snapshot_store.write_snapshot(store, _datasets()) is True
+        assert snapshot_store.write_snapshot(store, _datasets(extra=True)) is True
+
+        assert snapshot_store.main(["--store", str(store), "list"]) == 0
+        assert len(capsys.readouterr().out.splitlines()) == 2
+        assert snapshot_store.main(["--store", str(store), "diff", "1"]) == 0
+        assert "  + K990" in capsys.readouterr().out
+        assert snapshot_store.main(["--store", str(store), "show", "99"]) == 1
+
+    def test_missing_store(self, tmp_path: Path) -> None:
+        """Test the CLI fails cleanly without a store."""
+        assert snapshot_store.main(["--store", str(tmp_path / "none.sqlite"), "list"]) == 1
+
+
+# ---------------------------------------------------------------------------
+# Run Tests
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,191 @@
+#!/opt/homebrew/bin/python3
+"""
+Unit tests for the SQLite reference-data export.
+
+Run with: pytest test_sqlite_export.py -v
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import sqlite_export
+
+
+# ---------------------------------------------------------------------------
+# Test Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_med(**overrides: Any) -> dict[str, Any]:
+    """Create a converted medication record with sensible defaults."""
+    med: dict[str, Any] = {
+        "specialty": "Analgesia", "med": "Ibuprofen", "brands": ["Advil"],
+        "indication": "Pain", "dose_text": "400mg", "route": "PO",
+        "frequency": "TID", "duration": "5 day", "dispense": "15 tab",
+        "prn": "pain", "form": "tab", "comments": "", "population": "Adult",
+        "subcategory": "", "refill": "0", "weight_based": False,
+        "dose_per_kg_mg": None, "max_dose_mg": None,
+        "search_text": "analgesia | adult | pain | ibuprofen | advil",
+    }
+    med.update(overrides)
+    return med
+
+
+def _make_billing(code: str, name: str, **overrides: Any) -> dict[str, Any]:
+    """Create a billing code record with sensible defaults."""
+    entry: dict[str, Any] = {
+        "code": code, "name": name, "fee": 10.0, "search_terms": [],
+        "group": "Procedures", "subgroups": [], "related_modifiers": [],
+        "commonly_billed_with": [], "conflicts_with": [], "notes": "",
+        "hidden_notes": "", "is_ortho_code": False,
+        "sedation_affiliated": False, "sedation_base_units": None,
+        "has_c_code": False,
+    }
+    entry.update(overrides)
+    return entry
+
+
+@pytest.fixture
+def reference_data() -> sqlite_export.ReferenceData:
+    """A small dataset covering every table."""
+    return sqlite_export.ReferenceData(
+        meds=[
+            _make_med(dins=["02242345", "02242346"]),
+            _make_med(med="Amoxicillin", brands=["Amoxil"], specialty="Anti-infective",
+                      indication="Otitis media", population="Pediatric"),
+        ],
+        billing_codes=[
+            _make_billing("F047", "Humerus Fracture – Tuberosity",
+                          search_terms=["shoulder"], subgroups=["Fractures"],
+                          related_modifiers=["E001"]),
+            # Duplicate codes occur in the real workbook.
+            _make_billing("Z208", "Cast – Hip Spica (Bilateral)"),
+            _make_billing("Z208", "Cast – Shoulder Spica"),
+        ],
+        diagnostic_codes=[
+            {"code": "285", "name": "Anemia", "subcategory": "Blood",
+             "category": "Heme", "search_terms": ["anaemia"],
+             "suggested_billing_codes": ["A001"]},
+        ],
+        anatomy_sections={
+            "Thorax": [
+                {"divider": "Fractures"},
+                {"header": "Tuberosity", "codes": ["F047", "F048"]},
+            ],
+        },
+        oncall_tables={
+            "table1": {"title": "Virtual ED", "scenarios": {
+                "night": {"travel": {"code": "B960", "name": "Travel", "fee": 50.0}},
+            }},
+            "table2": "Out-patient Department",
+        },
+        locations=[{"name": "General Hospital", "address": "1 Main St, Town, A1A 1A1"}],
+    )
+
+
+@pytest.fixture
+def db(
+    tmp_path: Path, reference_data: sqlite_export.ReferenceData,
+) -> Iterator[sqlite3.Connection]:
+    """Export the reference data and open the resulting database."""
+    db_path = tmp_path / "reference.sqlite"
+    assert sqlite_export.export_sqlite(db_path, reference_data) is True
+    conn = sqlite3.connect(db_path)
+    yield conn
+    conn.close()
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestExportSqlite:
+    """Tests for export_sqlite."""
+
+    def test_row_counts(self, db: sqlite3.Connection) -> None:
+        """Test every dataset is written."""
+        def count(table: str) -> int:
+            return db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+        assert count("meds") == 2
+        assert count("billing_codes") == 3
+        assert count("diagnostic_codes") == 1
+        assert count("anatomy_sections") == 2
+        assert count("anatomy_section_codes") == 2
+        assert count("oncall_tables") == 2
+        assert count("oncall_premiums") == 1
+        assert count("locations") == 1
+
+    def test_med_dins_lookup(self, db: sqlite3.Connection) -> None:
+        """Test DPD DINs attached to meds can be looked up in both directions."""
+        rows = db.execute(
+            "SELECT m.med FROM med_dins d JOIN meds m ON m.id = d.med_id WHERE d.din = ?",
+            ("02242346",),
+        ).fetchall()
+        assert rows == [("Ibuprofen",)]
+        assert db.execute("SELECT COUNT(*) FROM med_dins").fetchone()[0] == 2
+
+    def test_meds_fts_matches_brand(self, db: sqlite3.Connection) -> None:
+        """Test prescription FTS covers brand names."""
+        rows = db.execute(
+            "SELECT m.med FROM meds_fts JOIN meds m ON m.id = meds_fts.rowid"
+            " WHERE meds_fts MATCH 'amoxil'"
+        ).fetchall()
+        assert rows == [("Amoxicillin",)]
+
+    def test_billing_fts_prefix(self, db: sqlite3.Connection) -> None:
+        """Test billing FTS supports code prefix and search-term queries."""
+        def codes(query: str) -> list[str]:
+            return [r[0] for r in db.execute(
+                "SELECT b.code FROM billing_fts JOIN billing_codes b"
+                " ON b.id = billing_fts.rowid WHERE billing_fts MATCH ?", (query,),
+            )]
+
+        assert codes("F04*") == ["F047"]
+        assert codes("shoulder") == ["F047", "Z208"]
+
+    def test_diagnostic_fts_includes_subcategory(self, db: sqlite3.Connection) -> None:
+        """Test diagnostic names are indexed with their subcategory prefix."""
+        rows = db.execute(
+            "SELECT rowid FROM diagnostic_fts WHERE diagnostic_fts MATCH 'blood anemia'"
+        ).fetchall()
+        assert len(rows) == 1
+
+    def test_reverse_relation_lookup(self, db: sqlite3.Connection) -> None:
+        """Test codes can be found by the modifiers that relate to them."""
+        rows = db.execute(
+            "SELECT b.code FROM billing_relations r JOIN billing_codes b"
+            " ON b.id = r.billing_id WHERE r.related_code = 'E001'"
+        ).fetchall()
+        assert rows == [("F047",)]
+
+    def test_string_oncall_table(self, db: sqlite3.Connection) -> None:
+        """Test title-only on-call tables are kept without premiums."""
+        row = db.execute(
+            "SELECT title FROM oncall_tables WHERE table_key = 'table2'"
+        ).fetchone()
+        assert row == ("Out-patient Department",)
+
+    def test_replaces_existing_file(
+        self, tmp_path: Path, reference_data: sqlite_export.ReferenceData,
+    ) -> None:
+        """Test re-exporting over an existing database succeeds."""
+        db_path = tmp_path / "reference.sqlite"
+        assert sqlite_export.export_sqlite(db_path, reference_data) is True
+        assert sqlite_export.export_sqlite(db_path, reference_data) is True
+        assert [p.name for p in tmp_path.iterdir()] == ["reference.sqlite"]
+
+
+# ---------------------------------------------------------------------------
+# Run Tests
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,311 @@
+#!/opt/homebrew/bin/python3
+"""
+Unit tests for the billing xlsx converter (data/billing/xlsx_to_json.py).
+
+Run with: pytest test_xlsx_to_json.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import shutil
+import subprocess
+import sys
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+import pytest
+from openpyxl import Workbook
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "data" / "billing"))
+
+import xlsx_to_json  # noqa: E402
+
+NAVIGATION_JS = Path(__file__).parent.parent / "js" / "billing" / "navigation.js"
+
+# Builds the diagnostic tree from stdin's {codes, prebuilt} and prints
+# whether the prebuilt categories were used.
+_TREE_PROBE = r"""
+global.window = global;
+require(process.argv[1]);
+const { codes, prebuilt } = JSON.parse(require("fs").readFileSync(0, "utf8"));
+App.data = { diagnosticCodes: codes };
+prebuilt.categories.forEach(c => { c.name = "prebuilt " + c.name; });
+App.buildDiagnosticTree(prebuilt);
+console.log(JSON.stringify(Object.keys(App.data.diagnosticTree)[0].startsWith("prebuilt ")));
+"""
+
+
+# ---------------------------------------------------------------------------
+# Test Helpers
+# ---------------------------------------------------------------------------
+
+
+def _code(code: str, fee: float = 0.0, **fields: Any) -> dict[str, Any]:
+    """Minimal parsed billing entry."""
+    entry: dict[str, Any] = {
+        "code": code,
+        "fee": fee,
+        "is_ortho_code": False,
+        "related_modifiers": [],
+        "sedation_base_units": None,
+    }
+    entry.update(fields)
+    return entry
+
+
+def _billing_workbook_bytes() -> bytes:
+    """An in-memory billing_codes.xlsx with two group sheets."""
+    wb = Workbook()
+    rows = {
+        "Consults": [("", "A135", "Consult", "", 90.0, None, "Y", "", "", None, "E410", "", "", "", "")],
+        "Modifiers": [("", "E410", "After hours", "", 0, 20, "", "", "", None, "", "", "", "", "")],
+    }
+    wb.remove(wb.active)
+    for title, data in rows.items():
+        ws = wb.create_sheet(title)
+        ws.append(["Subgroups", "Code", "Name"])  # header row
+        for row in data:
+            ws.append(row)
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestFeeTables:
+    """Tests for build_fee_table and add_fee_tables."""
+
+    def test_ortho_breakdown_rounds_half_up_to_the_cent(self) -> None:
+        """Test ortho rows are exact Decimal products rounded half-up."""
+        entry = _code("F046", 149.35, is_ortho_code=True)
+        table = xlsx_to_json.build_fee_table(entry, {})
+        # 149.35 * 0.75 = 112.0125; 149.35 * 0.6375 = 95.210625
+        assert table["ortho_cents"] == [14935, 11201, 11201, 9521, 9521, 11201]
+
+    def test_half_cent_is_not_lost_to_float_error(self) -> None:
+        """Test a product landing exactly on half a cent rounds up."""
+        entry = _code("D023", 231.1, is_ortho_code=True)
+        # 231.1 * 0.75 = 173.325 -> 173.33 (float math gives 173.32)
+        assert xlsx_to_json.build_fee_table(entry, {})["ortho_cents"][1] == 17333
+
+    def test_modifiers_resolve_percentage_and_flat_fees(self) -> None:
+        """Test percentage modifiers scale the parent fee and flat ones keep theirs."""
+        index = {
+            "E412": _code("E412", modifier_percentage=20),
+            "E446": _code("E446", 30.0),
+            "E999": _code("E999"),
+        }
+        entry = _code("A920", 161.15, related_modifiers=["E412", "E446", "E999", "NOPE"])
+        assert xlsx_to_json.build_fee_table(entry, index)["modifiers"] == {
+            "E412": {"percentage": 20, "amount_cents": 3223},
+            "E446": {"percentage": None, "amount_cents": 3000},
+        }
+
+    def test_sedation_amount_needs_unit_fee(self) -> None:
+        """Test base units are always emitted and amounts only with a unit fee."""
+        entry = _code("D001", 57.5, sedation_base_units=6)
+        assert xlsx_to_json.build_fee_table(entry, {})["sedation"] == {"base_units": 6}
+        table = xlsx_to_json.build_fee_table(entry, {}, Decimal("15.29"))
+        assert table["sedation"] == {
+            "base_units": 6, "unit_fee_cents": 1529, "base_amount_cents": 9174,
+        }
+
+    def test_add_fee_tables_covers_every_code(self) -> None:
+        """Test each entry gets a fee_table, empty when nothing applies."""
+        codes = [_code("A001", 10.0), _code("E412", modifier_percentage=20)]
+        codes[0]["related_modifiers"] = ["E412"]
+        xlsx_to_json.add_fee_tables(codes)
+        assert codes[0]["fee_table"] == {
+            "modifiers": {"E412": {"percentage": 20, "amount_cents": 200}},
+        }
+        assert codes[1]["fee_table"] == {}
+
+
+class TestSuggestionIndex:
+    """Tests for build_suggestion_index."""
+
+    DIAGNOSTICS = [
+        {"code": "002", "suggested_billing_codes": ["A001", "Z101"]},
+        {"code": "003", "suggested_billing_codes": []},
+        {"code": "005", "suggested_billing_codes": ["Z101", "A001", "A001", "X999"]},
+        {"code": "008", "suggested_billing_codes": ["G123", "Z101"]},
+    ]
+    BILLING = [_code("A001"), _code("G123"), _code("Z101")]
+
+    def test_ranks_billing_by_popularity(self) -> None:
+        """Test billing ids are ordered by how many diagnoses suggest them."""
+        index, _ = xlsx_to_json.build_suggestion_index(self.DIAGNOSTICS, self.BILLING)
+        assert index["billing"] == ["Z101", "A001", "G123"]
+        assert index["counts"] == [3, 2, 1]
+        assert index["diagnostic_to_billing"] == [[0, 1], [], [0, 1], [0, 2]]
+
+    def test_reverse_lookup_prefers_earliest_listing(self) -> None:
+        """Test diagnoses listing a code first come first, then by index."""
+        index, _ = xlsx_to_json.build_suggestion_index(self.DIAGNOSTICS, self.BILLING)
+        assert index["billing_to_diagnostic"] == [[2, 0, 3], [0, 2], [3]]
+
+    def test_reports_dangling_codes(self) -> None:
+        """Test unknown suggested codes are dropped and reported."""
+        index, dangling = xlsx_to_json.build_suggestion_index(self.DIAGNOSTICS, self.BILLING)
+        assert dangling == ["005: X999"]
+        assert "X999" not in index["billing"]
+        assert index["diagnostic_count"] == 4
+
+
+class TestChangeReport:
+    """Tests for build_change_report."""
+
+    def test_flags_fee_changes(self) -> None:
+        """Test modified codes carry field diffs and billing fee changes are flagged."""
+        old = [_code("A001", 10.0), _code("Z208", 121.6), _code("Z208", 97.35)]
+        new = [_code("Z208", 121.6), _code("Z208", 99.0, notes="layered"), _code("K990", 36.0)]
+        report = xlsx_to_json.build_change_report(old, new, flag_fees=True)
+        assert report["added"] == ["K990"]
+        assert report["removed"] == ["A001"]
+        assert report["modified"] == [{
+            "key": "Z208 #2",
+            "fields": {"fee": {"old": 97.35, "new": 99.0}, "notes": {"old": None, "new": "layered"}},
+        }]
+        assert report["fee_changes"] == [{"key": "Z208 #2", "old": 97.35, "new": 99.0}]
+        assert list(report["index"]) == ["K990", "Z208", "Z208 #2"]
+
+    def test_diagnostic_report_has_no_fee_section(self) -> None:
+        """Test unchanged codes are counted and fee flags are opt-in."""
+        codes = [{"code": "460", "name": "Common cold"}]
+        report = xlsx_to_json.build_change_report(codes, codes)
+        assert report["summary"] == {"added": 0, "removed": 0, "modified": 0, "unchanged": 1}
+        assert "fee_changes" not in report
+
+    def test_failed_report_fails_conversion(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test an unwritable change report is reported as a failed conversion."""
+        content = '[{"code": "A001", "group": "Assessments", "search_terms": []}]\n'
+        monkeypatch.setattr(xlsx_to_json, "SCRIPT_DIR", tmp_path)
+        monkeypatch.setattr(xlsx_to_json, "_convert_cached", lambda *args: content)
+        assert xlsx_to_json.convert_billing() is True
+        (tmp_path / "billing_codes.changes.json").unlink()
+        (tmp_path / "billing_codes.changes.json").mkdir()
+        assert xlsx_to_json.convert_billing() is False
+
+
+class TestInMemoryConversion:
+    """Tests for the bytes / file-like conversion API."""
+
+    def test_billing_codes_from_bytes(self) -> None:
+        """Test codes come back in sheet order with fee tables resolved across sheets."""
+        codes = list(xlsx_to_json.iter_billing_codes(_billing_workbook_bytes()))
+        assert [(c["code"], c["group"]) for c in codes] == [("A135", "Consults"), ("E410", "Modifiers")]
+        assert codes[0]["fee_table"]["modifiers"] == {"E410": {"percentage": 20, "amount_cents": 1800}}
+
+    def test_async_wrapper(self) -> None:
+        """Test the async wrapper returns the same codes from a file-like object."""
+        raw = _billing_workbook_bytes()
+        codes = asyncio.run(xlsx_to_json.read_billing_codes_async(io.BytesIO(raw), Decimal("10")))
+        assert [c["code"] for c in codes] == ["A135", "E410"]
+        assert codes == list(xlsx_to_json.iter_billing_codes(raw, Decimal("10")))
+
+    def test_rejects_invalid_bytes(self) -> None:
+        """Test unreadable uploads raise ValueError."""
+        with pytest.raises(ValueError, match="Unreadable workbook"):
+            xlsx_to_json.iter_diagnostic_codes(b"not a workbook")
+
+
+class TestDiagnosticTree:
+    """Tests for build_diagnostic_tree."""
+
+    @pytest.fixture
+    def codes(self) -> list[dict[str, Any]]:
+        """Code-sorted diagnostic codes with a category split by another."""
+        rows = [
+            ("250", "Endocrine", "Diabetes"),
+            ("346", "Nervous System", "Headache"),
+            ("487", "Respiratory", ""),
+            ("780", "Nervous System", "Seizure"),
+            ("784", "Nervous System", "Headache"),
+            ("786", "Respiratory", "Symptoms"),
+            ("7866", "Respiratory", ""),
+        ]
+        return [{"code": c, "category": cat, "subcategory": sub} for c, cat, sub in rows]
+
+    def _group(self, groups: list[dict[str, Any]], name: str) -> dict[str, Any]:
+        return next(g for g in groups if g["name"] == name)
+
+    def test_categories_in_code_order_with_ranges(self, codes: list[dict[str, Any]]) -> None:
+        """Test non-contiguous categories span several ranges with a total count."""
+        tree = xlsx_to_json.build_diagnostic_tree(codes)
+        assert tree["count"] == 7
+        assert [c["name"] for c in tree["categories"]] == ["Endocrine", "Nervous System", "Respiratory"]
+        nervous = self._group(tree["categories"], "Nervous System")
+        assert nervous["count"] == 3
+        assert nervous["ranges"] == [[1, 2], [3, 5]]
+        assert self._group(nervous["subcategories"], "Headache")["ranges"] == [[1, 2], [4, 5]]
+
+    def test_blank_subcategory_group(self, codes: list[dict[str, Any]]) -> None:
+        """Test codes without a subcategory are grouped under the name ""."""
+        tree = xlsx_to_json.build_diagnostic_tree(codes)
+        respiratory = self._group(tree["categories"], "Respiratory")
+        flat = self._group(respiratory["subcategories"], "")
+        assert [codes[i]["code"] for start, end in flat["ranges"] for i in range(start, end)] == ["487", "7866"]
+        assert sum(s["count"] for s in respiratory["subcategories"]) == respiratory["count"]
+
+    def test_prefix_ranges_slice_codes(self, codes: list[dict[str, Any]]) -> None:
+        """Test every prefix, whole codes included, maps to the codes starting with it."""
+        prefixes = xlsx_to_json.build_diagnostic_tree(codes)["prefixes"]
+        for prefix, (start, end) in prefixes.items():
+            assert [c["code"] for c in codes[start:end]] == [
+                c["code"] for c in codes if c["code"].startswith(prefix)
+            ]
+        assert prefixes["78"] == [3, 7]
+        assert prefixes["786"] == [5, 7]
+        assert prefixes["7866"] == [6, 7]
+
+    def test_digest_tracks_grouped_fields(self, codes: list[dict[str, Any]]) -> None:
+        """Test the digest changes when codes move between groups but counts do not."""
+        digest = xlsx_to_json.build_diagnostic_tree(codes)["digest"]
+        assert digest == xlsx_to_json.diagnostic_tree_digest(codes)
+        codes[0]["subcategory"] = "Thyroid"
+        assert xlsx_to_json.diagnostic_tree_digest(codes) != digest
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+class TestDiagnosticTreeJs:
+    """Tests that navigation.js only trusts a diagnostic tree built from its codes."""
+
+    def _uses_prebuilt(self, codes: list[dict[str, Any]], tree: dict[str, Any]) -> bool:
+        result = subprocess.run(
+            ["node", "-e", _TREE_PROBE, str(NAVIGATION_JS)],
+            input=json.dumps({"codes": codes, "prebuilt": tree}),
+            capture_output=True, text=True, check=True,
+        )
+        return json.loads(result.stdout)
+
+    def test_uses_matching_tree(self) -> None:
+        """Test a tree of the loaded codes (real data) is used as is."""
+        codes = json.loads((xlsx_to_json.SCRIPT_DIR / "diagnostic_codes.json").read_text())
+        assert self._uses_prebuilt(codes, xlsx_to_json.build_diagnostic_tree(codes)) is True
+
+    def test_rejects_stale_tree_with_equal_count(self) -> None:
+        """Test a tree of other codes is rebuilt even when the counts agree."""
+        codes = [
+            {"code": "250", "category": "Endocrine", "subcategory": "Diabetes"},
+            {"code": "346", "category": "Nervous System", "subcategory": "Headache"},
+        ]
+        stale = [{**codes[0], "subcategory": "Thyroid"}, codes[1]]
+        assert self._uses_prebuilt(codes, xlsx_to_json.build_diagnostic_tree(stale)) is False
+
+
+# ---------------------------------------------------------------------------
+# Run Tests
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])